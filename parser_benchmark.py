@@ -0,0 +1,66 @@
+"""
+@project: parser
+@file: parser_benchmark.py
+@author: Guillaume Sottas
+@date: 18.10.2026
+"""
+
+import argparse
+import timeit
+
+from pya2l.parser.grammar.parser import A2lParser as Parser
+
+CHARACTERISTIC = """
+                /begin CHARACTERISTIC
+                    characteristic_{0} "characteristic long identifier" VALUE 0x{0:X} DAMOS_SST 0 conversion 0 255
+                /end CHARACTERISTIC"""
+
+
+def module_string(children):
+    return """
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE module_name "module long identifier"{0}
+            /end MODULE
+        /end PROJECT""".format(''.join(CHARACTERISTIC.format(i) for i in range(children)))
+
+
+def compu_tab_string(pairs):
+    return """
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE module_name "module long identifier"
+                /begin COMPU_TAB compu_tab_name "compu tab long identifier" TAB_INTP {0}
+                    {1}
+                /end COMPU_TAB
+            /end MODULE
+        /end PROJECT""".format(pairs, ' '.join('{0} {0}'.format(i) for i in range(pairs)))
+
+
+def benchmark(generator, sizes, repeat, lexer='ply', workers=1):
+    """
+    returns a list of (size, seconds, seconds per element) tuples, the time being the best of repeat parses.
+    """
+    Parser.warmup()
+    result = list()
+    for size in sizes:
+        string = generator(size)
+        seconds = min(timeit.repeat(lambda: Parser(string, lexer=lexer, workers=workers), number=1, repeat=repeat))
+        result.append((size, seconds, seconds / size))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='measures the parse time against the length of a2l lists.')
+    parser.add_argument('-s', '--sizes', nargs='+', type=int, default=[1000, 2000, 4000, 8000, 16000])
+    parser.add_argument('-r', '--repeat', type=int, default=3)
+    parser.add_argument('-l', '--lexer', choices=('ply', 'fast'), default='ply')
+    parser.add_argument('-w', '--workers', type=int, default=1)
+    args = parser.parse_args()
+
+    for name, generator in (('MODULE children', module_string), ('COMPU_TAB pairs', compu_tab_string)):
+        print(name)
+        for size, seconds, per_element in benchmark(generator, args.sizes, args.repeat, args.lexer, args.workers):
+            print('    {0:>8} {1:>10.3f} s {2:>10.2f} us/element'.format(size, seconds, per_element * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,9 @@
 @date: 06.04.2018
 """
 
+import io
+import os
+
 import pytest
 
 from pya2l.parser.grammar.parser import A2lFormatException
@@ -2250,8 +2253,8 @@ def test_axis_pts_deposit_node():
             /end MODULE
         /end PROJECT"""
     a2l = Parser(a2l_string)
-    assert hasattr(a2l.tree.project.module[0].axis_pts[0], 'deposit')
-    assert a2l.tree.project.module[0].axis_pts[0].deposit == 'ABSOLUTE'
+    assert a2l.tree.project.module[0].axis_pts[0].deposit == 'deposit'
+    assert a2l.tree.project.module[0].axis_pts[0].deposit_mode == 'ABSOLUTE'
 
 
 def test_axis_pts_byte_order_node():
@@ -5736,3 +5739,1162 @@ def test_custom_class():
         /end PROJECT"""
     a2l = Parser(a2l_string, PROJECT=CustomProject)
     assert isinstance(a2l.tree.project, CustomProject)
+
+
+def test_parser_engine_cache():
+    assert Parser.warmup() is Parser.warmup()
+    first = Parser('A2ML_VERSION 2 3')
+    second = Parser('ASAP2_VERSION 4 5')
+    assert first.tree.a2ml_version.version_no == 2
+    assert first.tree.asap2_version is None
+    assert second.tree.asap2_version.version_no == 4
+    assert second.tree.a2ml_version is None
+
+
+def test_long_list_order():
+    from parser_benchmark import module_string, compu_tab_string
+    a2l = Parser(module_string(2000))
+    assert [c.address for c in a2l.tree.project.module[0].characteristic] == list(range(2000))
+    a2l = Parser(compu_tab_string(2000))
+    assert a2l.tree.project.module[0].compu_tab[0].in_val_out_val == [i for i in range(2000) for _ in range(2)]
+
+
+@pytest.mark.parametrize('chunk_size', (1, 7, 4096))
+def test_parser_from_stream(chunk_size):
+    with open(os.path.join(os.path.dirname(__file__), 'pya2l', 'parser', 'example', 'a2l.a2l'), 'r') as fp:
+        a2l_string = fp.read()
+    expected = Parser(a2l_string).tree.json
+    assert Parser.from_stream(io.StringIO(a2l_string), chunk_size=chunk_size).tree.json == expected
+    assert Parser.from_stream(io.BytesIO(a2l_string.encode('utf-8')), chunk_size=chunk_size).tree.json == expected
+
+    a2l_string = a2l_string.replace('/end CHARACTERISTIC', '/end MEASUREMENT', 1)
+    with pytest.raises(A2lFormatException) as expected:
+        Parser(a2l_string)
+    with pytest.raises(A2lFormatException) as e:
+        Parser.from_stream(io.StringIO(a2l_string), chunk_size=chunk_size)
+    assert str(e.value) == str(expected.value)
+
+
+
+@pytest.mark.parametrize('chunk_size', (1, 2, 3, 5, 64))
+def test_stream_lexer_split(chunk_size):
+    from pya2l.parser.grammar.lexer import lexer
+    from pya2l.parser.grammar.stream import A2lStreamLexer
+    a2l_string = """/begin PROJECT p "a \\" / b /* c */ // d" /**/ /***/ /* e * / f **/ // g "h
+        /begin MODULE m "i\\\\" {0} /end MODULE /end PROJECT""".format(' '.join('"j k"' for _ in range(50)))
+    chunks = [a2l_string[i:i + chunk_size] for i in range(0, len(a2l_string), chunk_size)]
+    stream_lexer = A2lStreamLexer(chunks)
+    expected = lexer.clone()
+    expected.input(a2l_string)
+    assert [(t.type, t.value, t.lexpos) for t in iter(stream_lexer.token, None)] == \
+        [(t.type, t.value, t.lexpos) for t in iter(expected.token, None)]
+
+def test_parser_from_file(tmpdir):
+    a2l_string = """
+        /begin PROJECT project_name "project / long // identifier"
+            /* block comment with "quotes" */
+            /begin MODULE module_name "module long identifier" // line comment
+            /end MODULE
+        /end PROJECT"""
+    a2l_file = tmpdir.join('test.a2l')
+    a2l_file.write(a2l_string)
+    a2l = Parser.from_file(str(a2l_file), chunk_size=3)
+    assert a2l.tree.json == Parser(a2l_string).tree.json
+    assert a2l.tree.project.long_identifier == 'project / long // identifier'
+    assert Parser.from_file(str(tmpdir.join('empty.a2l').ensure())).tree.json == Parser('').tree.json
+
+
+def test_parser_iter_nodes():
+    from parser_benchmark import module_string
+    a2l_file = os.path.join(os.path.dirname(__file__), 'pya2l', 'parser', 'example', 'a2l.a2l')
+    module = Parser.from_file(a2l_file).tree.project.module[0]
+    measurements = list(Parser.iter_nodes(a2l_file, kinds={'MEASUREMENT'}))
+    assert [m.json for m in measurements] == [m.json for m in module.measurement]
+    with open(a2l_file, 'r') as fp:
+        nodes = list(Parser.iter_nodes(fp, kinds={'A2ML', 'COMPU_METHOD'}, chunk_size=100))
+    assert nodes[0] == module.a2ml
+    assert [n.json for n in nodes[1:]] == [c.json for c in module.compu_method]
+
+    nodes = Parser.iter_nodes(io.StringIO(module_string(1000)), kinds={'CHARACTERISTIC'})
+    assert next(nodes).name == 'characteristic_0'
+    nodes.close()
+
+    with pytest.raises(A2lFormatException):
+        list(Parser.iter_nodes(io.StringIO(module_string(10).replace('/end MODULE', '/end PROJECT'))))
+
+
+def test_fast_lexer():
+    import ast
+    from pya2l.parser.grammar.lexer import lexer as ply_lexer
+    from pya2l.parser.grammar.fast_lexer import lexer as fast_lexer
+
+    def tokens(lexer, string):
+        lexer = lexer.clone()
+        lexer.input(string)
+        return [(t.type, t.value, type(t.value), t.lineno, t.lexpos) for t in iter(lexer.token, None)]
+
+    with open(__file__, 'r') as fp:
+        corpus = [n.value for n in ast.walk(ast.parse(fp.read())) if isinstance(n, ast.Constant) and
+                  isinstance(n.value, str)]
+    with open(os.path.join(os.path.dirname(__file__), 'pya2l', 'parser', 'example', 'a2l.a2l'), 'r') as fp:
+        corpus.append(fp.read())
+    corpus.append('1e5 1E5 1e+5 1.e5 .5 0x 0x1G -0x1F +5 1.5e3 1e 12.5.3 a.b[3] ARRAY_SIZE[2] /beginx / //\n //x\n')
+    corpus.append('/* "comment" */ "string \\" with escape" $ "unterminated 1')
+    for string in corpus:
+        assert tokens(fast_lexer, string) == tokens(ply_lexer, string)
+
+    assert Parser(corpus[-3], lexer='fast').tree.json == Parser(corpus[-3]).tree.json
+    with pytest.raises(A2lFormatException) as expected:
+        Parser(corpus[-3].replace('/end MEASUREMENT', '/end CHARACTERISTIC', 1))
+    with pytest.raises(A2lFormatException) as e:
+        Parser(corpus[-3].replace('/end MEASUREMENT', '/end CHARACTERISTIC', 1), lexer='fast')
+    assert str(e.value) == str(expected.value)
+    with pytest.raises(ValueError):
+        Parser('', lexer='unknown')
+
+
+def test_parser_from_file_cache(tmpdir):
+    from parser_benchmark import module_string
+    from pya2l.parser.grammar.node import Project
+    cache_dir = str(tmpdir.join('cache'))
+    a2l_file = tmpdir.join('test.a2l')
+    a2l_file.write(module_string(10))
+    expected = Parser.from_file(str(a2l_file)).tree.json
+    assert Parser.from_file(str(a2l_file), cache_dir=cache_dir, PROJECT=Project).tree.json == expected
+    entries = tmpdir.join('cache').listdir()
+    assert len(entries) == 1
+    a2l = Parser.from_file(str(a2l_file), cache_dir=cache_dir, PROJECT=Project)
+    assert not hasattr(a2l, '_yacc')
+    assert a2l.tree.json == expected
+    assert a2l.tree.project.module[0].characteristic[3]._parent is a2l.tree.project.module[0]
+
+    entries[0].write('corrupted')
+    assert Parser.from_file(str(a2l_file), cache_dir=cache_dir, PROJECT=Project).tree.json == expected
+    assert Parser.from_file(str(a2l_file), cache_dir=cache_dir, PROJECT=Project).tree.json == expected
+
+    stale = tmpdir.join('cache', '0123456789abcdef-stale.a2lcache')
+    stale.write('stale')
+    a2l_file.write(module_string(11))
+    a2l = Parser.from_file(str(a2l_file), cache_dir=cache_dir, PROJECT=Project)
+    assert len(a2l.tree.project.module[0].characteristic) == 11
+    assert not stale.exists()
+    assert len(tmpdir.join('cache').listdir()) == 2
+
+    a2l_file.write(module_string(12))
+    Parser.from_file(str(a2l_file), cache_dir=cache_dir, cache_size=1, PROJECT=Project)
+    assert len(tmpdir.join('cache').listdir()) == 1
+
+
+def test_module_index():
+    a2l_string = """
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE module_name "module long identifier"
+                /begin CHARACTERISTIC characteristic_name "first" VALUE 0 record_layout_name 0 compu_method_name 0 1
+                    /begin FUNCTION_LIST function_name unknown_function /end FUNCTION_LIST
+                /end CHARACTERISTIC
+                /begin CHARACTERISTIC characteristic_name "second" VALUE 0 record_layout_name 0 NO_COMPU_METHOD 0 1
+                /end CHARACTERISTIC
+                /begin COMPU_METHOD compu_method_name "" TAB_VERB "%6.2" "unit"
+                    COMPU_TAB_REF compu_vtab_name
+                /end COMPU_METHOD
+                /begin COMPU_VTAB compu_vtab_name "" TAB_VERB 0 /end COMPU_VTAB
+                /begin FUNCTION function_name "" /end FUNCTION
+                /begin GROUP group_name "" /end GROUP
+                /begin RECORD_LAYOUT record_layout_name /end RECORD_LAYOUT
+            /end MODULE
+        /end PROJECT"""
+    module = Parser(a2l_string).tree.project.module[0]
+    characteristic = module.index.characteristic['characteristic_name']
+    assert characteristic is module.characteristic[0]
+    assert module.index is module.index
+    assert module.index.group['group_name'] is module.group[0]
+    assert module.resolve(characteristic, 'conversion') is module.compu_method[0]
+    assert module.resolve(characteristic, 'deposit') is module.record_layout[0]
+    assert module.resolve(characteristic.function_list, 'name') == [module.function[0], None]
+    assert module.resolve(module.characteristic[1], 'conversion') is None
+    assert module.resolve(module.compu_method[0], 'compu_tab_ref') is module.compu_vtab[0]
+    with pytest.raises(ValueError):
+        module.resolve(characteristic, 'long_identifier')
+
+    module.characteristic.insert(0, module.characteristic.pop())
+    assert module.index.characteristic['characteristic_name'].long_identifier == 'first'
+    del module.index
+    assert module.index.characteristic['characteristic_name'].long_identifier == 'second'
+
+
+def test_node_iter_nodes():
+    from pya2l.parser.grammar.node import Version
+    with open(os.path.join(os.path.dirname(__file__), 'pya2l', 'parser', 'example', 'a2l.a2l'), 'r') as fp:
+        a2l_string = fp.read()
+    a2l = Parser(a2l_string)
+    assert a2l.tree.get_node_index() is a2l.tree.node_index
+    for node_name in set(node.node() for node in a2l.tree.iter_nodes()):
+        expected = A2lNode.get_node(a2l.tree, node_name)
+        assert a2l.get_node(node_name) == expected
+        assert list(a2l.tree.iter_nodes(node_name)) == expected
+    characteristic = next(a2l.tree.iter_nodes('CHARACTERISTIC'))
+    assert characteristic is a2l.tree.project.module[0].characteristic[0]
+    assert a2l.get_node('UNKNOWN') == []
+
+    a2l = Parser(a2l_string, node_index=False)
+    assert a2l.tree._node_index is None
+    assert len(a2l.get_node('CHARACTERISTIC')) == len(a2l.tree.project.module[0].characteristic)
+    module = a2l.tree.project.module[0]
+    module._children.remove(module.characteristic.pop())
+    del a2l.tree.node_index
+    assert len(a2l.get_node('CHARACTERISTIC')) == len(a2l.tree.project.module[0].characteristic)
+
+    root = node = Version(0, 0)
+    for i in range(10000):
+        node.add_children(Version(i, 0))
+        node = node._children[0]
+    assert len(root.get_node('VERSION')) == 10000
+
+
+@pytest.mark.parametrize('options', (dict(), dict(indent=4, sort_keys=True, ensure_ascii=False), dict(indent='\t')))
+def test_json_encoder(options):
+    import json
+    from pya2l.parser.grammar.encoder import dump
+    with open(os.path.join(os.path.dirname(__file__), 'pya2l', 'parser', 'example', 'a2l.a2l'), 'r') as fp:
+        a2l = Parser(fp.read())
+    output = io.StringIO()
+    dump(a2l.tree, output, chunk_size=64, **options)
+    assert output.getvalue() == json.dumps(a2l.tree.json, **options)
+
+
+def test_cli_to_json(tmpdir, monkeypatch):
+    import sys
+    from pya2l import main
+    a2l_file = tmpdir.join('test.a2l')
+    a2l_file.write(u"""
+        /begin PROJECT project_name "project long identifier é"
+            /begin MODULE module_name "module long identifier"
+            /end MODULE
+        /end PROJECT""".encode('utf-8'), mode='wb')
+    monkeypatch.setattr(sys, 'argv', ['pya2l', 'to_json', str(a2l_file)])
+    main()
+    monkeypatch.setattr(sys, 'argv', ['pya2l', 'to_json', str(a2l_file), '--stream', '-o', str(tmpdir.join('s.json'))])
+    main()
+    expected = tmpdir.join('test.a2l.json').read_text('utf-8')
+    assert u'é' in expected
+    assert tmpdir.join('s.json').read_text('utf-8') == expected
+
+
+def test_parse_many(tmpdir):
+    from pya2l import parse_many
+    from parser_benchmark import module_string
+    paths = list()
+    for i in range(4):
+        paths.append(str(tmpdir.join('{0}.a2l'.format(i))))
+        tmpdir.join('{0}.a2l'.format(i)).write(module_string(i))
+    tmpdir.join('invalid.a2l').write('/begin PROJECT project_name "project long identifier"')
+    results = dict((r.path, r) for r in parse_many(paths + [str(tmpdir.join('invalid.a2l'))], workers=2))
+    assert len(results) == 5
+    for path in paths:
+        assert results[path].ok
+        assert results[path].seconds >= 0
+        assert results[path].value.json == Parser.from_file(path).tree.json
+    assert not results[str(tmpdir.join('invalid.a2l'))].ok
+    assert results[str(tmpdir.join('invalid.a2l'))].error.startswith('A2lFormatException')
+
+
+def test_cli_batch(tmpdir, monkeypatch):
+    import sys
+    from pya2l import main
+    from parser_benchmark import module_string
+    tmpdir.join('input', 'a.a2l').write(module_string(1), ensure=True)
+    tmpdir.join('input', 'sub', 'b.A2L').write(module_string(2), ensure=True)
+    tmpdir.join('input', 'c.txt').write('')
+    monkeypatch.setattr(sys, 'argv', ['pya2l', 'batch', str(tmpdir.join('input')), '-o', str(tmpdir.join('output'))])
+    main()
+    assert sorted(p.basename for p in tmpdir.join('output').listdir()) == ['a.a2l.json', 'b.A2L.json']
+
+
+def test_parallel_parser(tmpdir, monkeypatch):
+    from parser_benchmark import CHARACTERISTIC
+    from pya2l.parser.grammar.node import Characteristic
+    with open(os.path.join(os.path.dirname(__file__), 'pya2l', 'parser', 'example', 'a2l.a2l'), 'r') as fp:
+        a2l_string = fp.read()
+    expected = Parser(a2l_string)
+    a2l = Parser(a2l_string, workers=2)
+    assert a2l.tree.json == expected.tree.json
+    module = a2l.tree.project.module[0]
+    assert [n.node() for n in module._children] == [n.node() for n in expected.tree.project.module[0]._children]
+    assert all(n._parent is module for n in module._children)
+    assert a2l.get_node('CHARACTERISTIC') == module.characteristic
+
+    a2l_string = """
+        /begin PROJECT project_name "project long identifier"
+            /begin HEADER "header comment" /end HEADER
+            /begin MODULE first "/begin MODULE in a string" {0}
+            /end MODULE
+            /begin MODULE empty ""
+            /end MODULE
+            /* /begin MODULE in a comment */
+            /begin MODULE second "" {1}
+            /end MODULE
+        /end PROJECT""".format(''.join(CHARACTERISTIC.format(i) for i in range(10)),
+                               ''.join(CHARACTERISTIC.format(i) for i in range(10, 15)))
+    a2l_file = tmpdir.join('test.a2l')
+    a2l_file.write(a2l_string)
+    a2l = Parser.from_file(str(a2l_file), workers=3)
+    assert a2l.tree.json == Parser(a2l_string).tree.json
+    assert [len(m.characteristic) for m in a2l.tree.project.module] == [10, 0, 5]
+
+    a2l_string = a2l_string.replace('/end CHARACTERISTIC', '/end MEASUREMENT', 12)
+    with pytest.raises(A2lFormatException) as expected:
+        Parser(a2l_string)
+    with pytest.raises(A2lFormatException) as e:
+        Parser(a2l_string, workers=3)
+    assert str(e.value) == str(expected.value)
+    parse = Parser._parse
+    calls = list()
+    monkeypatch.setattr(Parser, '_parse', lambda self, *args, **kw: calls.append(args) or parse(self, *args, **kw))
+    with pytest.raises(A2lFormatException):
+        Parser(a2l_string, workers=3)
+    assert calls == []
+    monkeypatch.undo()
+    a2l_string = a2l_string.replace('/end MEASUREMENT', '/end CHARACTERISTIC').replace('/end HEADER', '/end MODULE')
+    with pytest.raises(A2lFormatException) as expected:
+        Parser(a2l_string)
+    with pytest.raises(A2lFormatException) as e:
+        Parser(a2l_string, workers=3)
+    assert str(e.value) == str(expected.value) and e.value.position == expected.value.position
+
+    class LocalCharacteristic(Characteristic):
+        pass
+
+    a2l = Parser(a2l_string.replace('/end MODULE', '/end HEADER', 1), workers=3, CHARACTERISTIC=LocalCharacteristic)
+    assert all(isinstance(c, LocalCharacteristic) for m in a2l.tree.project.module for c in m.characteristic)
+
+
+def test_a2l_index(tmpdir):
+    from pya2l.parser.grammar.index import A2lIndex, INDEX_SUFFIX
+    from parser_benchmark import CHARACTERISTIC
+    a2l_string = """
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE first "/begin CHARACTERISTIC in a string"
+                /begin MOD_PAR "comment" /end MOD_PAR
+                /* /begin CHARACTERISTIC in_comment */
+                {0}
+                /begin COMPU_METHOD cm "é" RAT_FUNC "%4.2" "unit" COEFFS 0 1 0 0 0 1 /end COMPU_METHOD
+            /end MODULE
+        /end PROJECT""".format(''.join(CHARACTERISTIC.format(i) for i in range(5)))
+    a2l_file = tmpdir.join('test.a2l')
+    a2l_file.write_text(a2l_string, encoding='utf-8')
+    path = str(a2l_file)
+    expected = Parser(a2l_string).tree.project.module[0]
+
+    index = A2lIndex.load(path)
+    assert os.path.isfile(path + INDEX_SUFFIX)
+    assert [e[:2] for e in index] == [('MOD_PAR', None)] + [('CHARACTERISTIC', 'characteristic_{0}'.format(i))
+                                                            for i in range(5)] + [('COMPU_METHOD', 'cm')]
+    assert index.names('characteristic') == ['characteristic_{0}'.format(i) for i in range(5)]
+    node = index.get('CHARACTERISTIC', 'characteristic_3')
+    assert node.json == expected.characteristic[3].json
+    assert node._parent is None
+    assert index.get('COMPU_METHOD', 'cm').json == expected.compu_method[0].json
+    assert index.get('CHARACTERISTIC', 'in_comment') is None
+    assert index.get('MEASUREMENT', 'characteristic_3', 0) == 0
+
+    entries = index.entries
+    assert A2lIndex.load(path, lexer='fast').entries == entries
+    with open(path + INDEX_SUFFIX, 'w') as fp:
+        fp.write('invalid')
+    assert A2lIndex.load(path).entries == entries
+    a2l_file.write_text(a2l_string.replace('characteristic_0 ', 'renamed_0 '), encoding='utf-8')
+    os.utime(path, (0, 0))
+    assert A2lIndex.load(path).names('CHARACTERISTIC')[0] == 'renamed_0'
+    assert A2lIndex.load(path).get('CHARACTERISTIC', 'renamed_0').name == 'renamed_0'
+
+
+@pytest.mark.parametrize('lexer', ('ply', 'fast'))
+def test_lazy_parser(tmpdir, lexer):
+    import pickle
+    with open(os.path.join(os.path.dirname(__file__), 'pya2l', 'parser', 'example', 'a2l.a2l'), 'r') as fp:
+        a2l_string = fp.read()
+    expected = Parser(a2l_string, lexer=lexer)
+    a2l = Parser(a2l_string, lexer=lexer, lazy=True)
+    module = a2l.tree.project.module[0]
+    characteristic = module.characteristic[0]
+    assert characteristic.is_lazy()
+    assert characteristic.name == expected.tree.project.module[0].characteristic[0].name
+    assert characteristic.conversion == expected.tree.project.module[0].characteristic[0].conversion
+    assert characteristic.is_lazy()
+    assert module.index.characteristic[characteristic.name] is characteristic
+    assert characteristic.is_lazy()
+    assert characteristic.json == expected.tree.project.module[0].characteristic[0].json
+    assert not characteristic.is_lazy()
+    assert characteristic._parent is module
+    assert all(n._parent is characteristic for n in characteristic._children)
+    with pytest.raises(AttributeError):
+        characteristic.unknown_attribute
+    assert not module.compu_method[0].is_lazy()
+    assert any(n.is_lazy() for n in module.measurement)
+    assert pickle.loads(pickle.dumps(a2l.tree)).json == expected.tree.json
+    a2l = Parser(a2l_string, lexer=lexer, lazy=True)
+    assert len(a2l.get_node('AXIS_DESCR')) == len(expected.get_node('AXIS_DESCR'))
+    assert a2l.tree.json == expected.tree.json
+
+    a2l_string = """
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE module_name ""
+                /begin CHARACTERISTIC first "" VALUE 0 DAMOS_SST 0 conversion 0 255
+                    FORMAT "%4.2" /begin FUNCTION_LIST f_1 /* /end CHARACTERISTIC */ f_2 /end FUNCTION_LIST
+                /end CHARACTERISTIC
+                /begin CHARACTERISTIC second "" VALUE 0 DAMOS_SST 0 conversion 0 255
+                    FORMAT 0
+                /end CHARACTERISTIC
+            /end MODULE
+        /end PROJECT"""
+    a2l_file = tmpdir.join('test.a2l')
+    a2l_file.write(a2l_string)
+    first, second = Parser.from_file(str(a2l_file), lexer=lexer, lazy=True).tree.project.module[0].characteristic
+    assert first.format == '%4.2'
+    assert first.function_list.name == ['f_1', 'f_2']
+    assert second.name == 'second'
+    with pytest.raises(A2lFormatException):
+        second.format
+    with pytest.raises(A2lFormatException):
+        Parser(a2l_string.replace('/end CHARACTERISTIC\n', '/end MEASUREMENT\n', 1), lexer=lexer, lazy=True)
+
+
+def test_node_factory():
+    from concurrent.futures import ThreadPoolExecutor
+    from pya2l.parser.grammar.node import node_to_class, A2lNodeFactory, Characteristic, Project
+    from parser_benchmark import module_string
+
+    class FirstCharacteristic(Characteristic):
+        pass
+
+    class SecondCharacteristic(Characteristic):
+        pass
+
+    registry = dict(node_to_class)
+    factory = A2lNodeFactory(dict(PROJECT=Project, CHARACTERISTIC=FirstCharacteristic))
+    assert factory.get_class('CHARACTERISTIC') is FirstCharacteristic
+    assert factory.get_class('MEASUREMENT') is node_to_class['MEASUREMENT']
+    with pytest.raises(NotImplementedError):
+        factory('UNKNOWN')
+
+    a2l_string = module_string(200)
+
+    def parse(i):
+        cls = (FirstCharacteristic, SecondCharacteristic, None)[i % 3]
+        a2l = Parser(a2l_string, lazy=i % 2 == 0, **(dict(CHARACTERISTIC=cls) if cls else dict()))
+        return cls, a2l.tree.project.module[0].characteristic
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for cls, characteristics in executor.map(parse, range(12)):
+            assert len(characteristics) == 200
+            assert all(type(c) is (cls or Characteristic) for c in characteristics)
+    assert node_to_class == registry
+
+
+def test_parse_async():
+    import asyncio
+    import pickle
+    from concurrent.futures import ThreadPoolExecutor
+    from pya2l.parser.grammar import aio
+    from pya2l.parser.grammar.node import Characteristic
+    from parser_benchmark import module_string
+
+    class CustomCharacteristic(Characteristic):
+        pass
+
+    loop = asyncio.new_event_loop()
+    try:
+        a2l_string = module_string(100)
+        expected = Parser(a2l_string).tree.json
+        a2l = loop.run_until_complete(Parser.parse_async(a2l_string))
+        assert isinstance(a2l, Parser)
+        assert a2l.tree.json == expected
+        tree = pickle.loads(loop.run_until_complete(Parser.parse_async(a2l_string.encode('utf-8'), pickled=True)))
+        assert tree.json == expected
+        assert loop in aio._semaphores
+
+        semaphore = asyncio.Semaphore(2)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            tasks = [loop.create_task(Parser.parse_async(a2l_string, executor, semaphore, lexer='fast',
+                                                         CHARACTERISTIC=CustomCharacteristic)) for _ in range(6)]
+            results = loop.run_until_complete(asyncio.gather(*tasks))
+            assert all(r.tree.json == expected for r in results)
+            assert all(isinstance(c, CustomCharacteristic) for r in results for c in r.get_node('CHARACTERISTIC'))
+
+            task = loop.create_task(Parser.parse_async(a2l_string, executor, semaphore))
+            loop.call_soon(task.cancel)
+            with pytest.raises(asyncio.CancelledError):
+                loop.run_until_complete(task)
+            assert not semaphore.locked()
+
+            with pytest.raises(A2lFormatException):
+                loop.run_until_complete(Parser.parse_async('/begin PROJECT', executor))
+    finally:
+        loop.close()
+
+
+def test_number_arrays():
+    import array
+    import copy
+    import json
+    import pickle
+    from pya2l.parser.grammar.node import a2l_number_array, A2lNumberArray
+    from pya2l.parser.grammar.encoder import dump
+    from parser_benchmark import compu_tab_string
+
+    assert a2l_number_array([1, -2]).typecode == 'q'
+    assert a2l_number_array([1, 0xFFFFFFFFFFFFFFFF]).typecode == 'Q'
+    assert a2l_number_array([1, 2.5]).typecode == 'd'
+    assert a2l_number_array([-1, 0xFFFFFFFFFFFFFFFF]) == [-1, 0xFFFFFFFFFFFFFFFF]
+    assert a2l_number_array([1, 2]) == [1, 2]
+    assert a2l_number_array([1, 2]) != [1, 3]
+    assert a2l_number_array([1, 2]) == a2l_number_array([1.0, 2.0])
+
+    a2l = Parser(compu_tab_string(1000))
+    in_val_out_val = a2l.tree.project.module[0].compu_tab[0].in_val_out_val
+    assert isinstance(in_val_out_val, A2lNumberArray)
+    assert in_val_out_val.typecode == 'q'
+    assert in_val_out_val == [i for i in range(1000) for _ in range(2)]
+    assert a2l.tree.project.module[0].compu_tab[0].json['in_val_out_val'] == in_val_out_val.tolist()
+    assert pickle.loads(pickle.dumps(a2l.tree, pickle.HIGHEST_PROTOCOL)).json == a2l.tree.json
+
+    a2l_string = """
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE module_name ""
+                /begin MOD_PAR ""
+                    /begin MEMORY_LAYOUT PRG_DATA 0x4000 0x100 -1 -1 -1 -1 -1 /end MEMORY_LAYOUT
+                /end MOD_PAR
+                /begin COMPU_TAB compu_tab_name "" TAB_INTP 2 0 0.5 1 1.5 /end COMPU_TAB
+                /begin VARIANT_CODING
+                    /begin VAR_CHARACTERISTIC name criterion /begin VAR_ADDRESS 0x10 0x20 /end VAR_ADDRESS
+                    /end VAR_CHARACTERISTIC
+                /end VARIANT_CODING
+            /end MODULE
+        /end PROJECT"""
+    module = Parser(a2l_string).tree.project.module[0]
+    assert module.mod_par.memory_layout[0].offset == [-1] * 5
+    assert module.compu_tab[0].in_val_out_val.typecode == 'd'
+    assert module.variant_coding.var_characteristic[0].var_address.address == [0x10, 0x20]
+    assert isinstance(module.variant_coding.var_characteristic[0].var_address.address, array.array)
+    fp = io.StringIO()
+    dump(module, fp, indent=2)
+    assert fp.getvalue() == json.dumps(module.json, indent=2)
+    assert json.loads(fp.getvalue())['compu_tab'][0]['in_val_out_val'] == [0.0, 0.5, 1.0, 1.5]
+    in_val_out_val = module.compu_tab[0].in_val_out_val
+    assert json.dumps(module.compu_tab[0].json['in_val_out_val']) == '[0, 0.5, 1, 1.5]'
+    assert json.dumps(list(in_val_out_val)) == '[0, 0.5, 1, 1.5]'
+    assert pickle.loads(pickle.dumps(in_val_out_val)).tolist() == [0, 0.5, 1, 1.5]
+    assert copy.deepcopy(in_val_out_val).tolist() == [0, 0.5, 1, 1.5]
+    assert json.dumps(a2l_number_array([1.0, 2.5]).tolist()) == '[1.0, 2.5]'
+
+
+@pytest.mark.parametrize('use_numpy', (True, False))
+def test_conversion(monkeypatch, use_numpy):
+    import math
+    from pya2l.parser.grammar import conversion
+    if use_numpy:
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(conversion, 'numpy', None)
+
+    def values(v):
+        return list(v) if use_numpy else v
+
+    a2l_string = """
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE module_name ""
+                /begin COMPU_METHOD linear "" LINEAR "%6.2" "km/h" COEFFS_LINEAR 2 -3 /end COMPU_METHOD
+                /begin COMPU_METHOD rat_func "" RAT_FUNC "%6.2" "km/h" COEFFS 0 4 8 0 0 2 /end COMPU_METHOD
+                /begin COMPU_METHOD quadratic "" RAT_FUNC "%6.2" "km/h" COEFFS 1 0 0 0 0 1 /end COMPU_METHOD
+                /begin COMPU_METHOD intp "" TAB_INTP "%6.2" "km/h" COMPU_TAB_REF tab /end COMPU_METHOD
+                /begin COMPU_METHOD nointp "" TAB_NOINTP "%6.2" "km/h" COMPU_TAB_REF tab /end COMPU_METHOD
+                /begin COMPU_METHOD verbal "" TAB_VERB "%6.2" "" COMPU_TAB_REF vtab /end COMPU_METHOD
+                /begin COMPU_METHOD range "" TAB_VERB "%6.2" "" COMPU_TAB_REF vtab_range /end COMPU_METHOD
+                /begin COMPU_METHOD identical "" IDENTICAL "%6.2" "" /end COMPU_METHOD
+                /begin COMPU_METHOD missing "" TAB_INTP "%6.2" "" COMPU_TAB_REF missing_tab /end COMPU_METHOD
+                /begin COMPU_TAB tab "" TAB_INTP 3 20 150.0 0 0.0 10 100.0 DEFAULT_VALUE_NUMERIC -1.0 /end COMPU_TAB
+                /begin COMPU_VTAB vtab "" TAB_VERB 2 0 "off" 1 "on" DEFAULT_VALUE "unknown" /end COMPU_VTAB
+                /begin COMPU_VTAB_RANGE vtab_range "" 2 10 20 "high" 0 9 "low" DEFAULT_VALUE "invalid"
+                /end COMPU_VTAB_RANGE
+            /end MODULE
+        /end PROJECT"""
+    module = Parser(a2l_string).tree.project.module[0]
+    assert module.compu_method[0].coeffs_linear.a == 2 and module.compu_method[0].coeffs_linear.b == -3
+
+    linear = module.converter('linear')
+    assert module.converter('linear') is linear
+    assert values(linear.to_physical([0, 1, 2])) == [-3, -1, 1]
+    assert linear.to_raw(7) == 5
+    assert values(module.converter('rat_func').to_raw([1, 2])) == [6, 8]
+    assert module.converter('rat_func').to_physical(3) == -0.5
+    assert values(module.converter('quadratic').to_raw([2, 3])) == [4, 9]
+    with pytest.raises(NotImplementedError):
+        module.converter('quadratic').to_physical(4)
+
+    intp = module.converter('intp')
+    assert values(intp.to_physical([-5, 5, 15, 30])) == [0, 50, 125, 150]
+    assert values(intp.to_raw([50, 125])) == [5, 15]
+    nointp = module.converter('nointp')
+    assert values(nointp.to_physical([0, 5, 10])) == [0, -1, 100]
+    assert nointp.to_raw(150) == 20
+    assert math.isnan(nointp.to_raw(50))
+
+    verbal = module.converter('verbal')
+    assert values(verbal.to_physical([0, 1, 2])) == ['off', 'on', 'unknown']
+    assert verbal.to_physical(1) == 'on'
+    assert verbal.to_raw('on') == 1
+    assert math.isnan(verbal.to_raw('other'))
+    assert values(module.converter('range').to_physical([-1, 5, 9.5, 20, 21])) == \
+        ['invalid', 'low', 'invalid', 'high', 'invalid']
+    assert values(module.converter('range').to_raw(['high', 'low'])) == [10, 0]
+
+    assert module.converter('identical').to_physical(3) == 3
+    assert values(module.converter('NO_COMPU_METHOD').to_raw([1, 2])) == [1, 2]
+    with pytest.raises(ValueError):
+        module.converter('missing')
+    with pytest.raises(ValueError):
+        module.converter('unknown')
+
+    module.compu_tab[0].in_val_out_val = [0, 0.0, 10, 50.0, 20, 150.0]
+    assert intp.to_physical(5) == 50
+    module.reset_converters()
+    assert module.converter('intp').to_physical(5) == 25
+
+
+@pytest.mark.parametrize('use_numpy', (True, False))
+def test_formula(monkeypatch, use_numpy):
+    from pya2l.parser.grammar import conversion
+    from pya2l.parser.grammar.formula import A2lFormula, A2lFormulaException
+    if use_numpy:
+        numpy = pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(conversion, 'numpy', None)
+
+    formula = A2lFormula('X1 * 0.1 + sysc(offset)', dict(offset='5'))
+    assert formula.variables == ('X1',)
+    assert formula(10) == 6
+    for text, value in (('-X * 2', -8), ('pow(X1, 2) + sqrt(4)', 18), ('(X1 & 0xF) << 1', 8), ('X1 >> 1 | 1', 3),
+                        ('X1 ^ 1', 5), ('~0', -1), ('1 - 2 - 3', -4), ('8 / 2 / 2', 2), ('2 + 3 * X1', 14),
+                        ('X1 > 2 && X1 < 5', 1), ('X1 == 3 || !X1', 0), ('abs(-X1) + log10(100) + exp(0)', 7),
+                        ('sysc("other constant")', 16)):
+        formula = A2lFormula(text, {'other constant': '0x10'})
+        assert formula(*(4,)[:len(formula.variables)]) == value
+        if use_numpy:
+            assert formula.evaluate(*(numpy.array([4.0, 4.0]),)[:len(formula.variables)]).tolist() in \
+                (value, [value] * 2)
+    assert A2lFormula('X1 + X3').variables == ('X1', 'X2', 'X3')
+    for text in ('X1 +', '__import__("os")', 'X1.real', 'foo(1)', 'sysc(unknown)', 'sysc(text)', 'pow(1)', '1 2',
+                 'X1; 2', 'X0', '(X1'):
+        with pytest.raises(A2lFormulaException):
+            A2lFormula(text, dict(text='abc'))
+
+    a2l_string = """
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE module_name ""
+                /begin MOD_PAR ""
+                    SYSTEM_CONSTANT "offset" "-40"
+                /end MOD_PAR
+                /begin COMPU_METHOD temperature "" FORM "%6.2" "degC"
+                    /begin FORMULA "X1 * 0.5 + sysc(offset)" FORMULA_INV "(X1 - sysc(offset)) * 2" /end FORMULA
+                /end COMPU_METHOD
+                /begin COMPU_METHOD no_inverse "" FORM "%6.2" "" /begin FORMULA "X1 / 4" /end FORMULA /end COMPU_METHOD
+                /begin COMPU_METHOD constant "" FORM "%6.2" "" /begin FORMULA "sysc(offset)" /end FORMULA
+                /end COMPU_METHOD
+                /begin COMPU_METHOD invalid "" FORM "%6.2" "" /begin FORMULA "X1 *" /end FORMULA /end COMPU_METHOD
+            /end MODULE
+        /end PROJECT"""
+    module = Parser(a2l_string).tree.project.module[0]
+    converter = module.converter('temperature')
+    assert module.converter('temperature') is converter
+    assert list(converter.to_physical([0, 80, 160])) == [-40, 0, 40]
+    assert converter.to_raw(0) == 80
+    assert module.converter('no_inverse').to_physical(2) == 0.5
+    with pytest.raises(NotImplementedError):
+        module.converter('no_inverse').to_raw(2)
+    assert list(module.converter('constant').to_physical([1, 2])) == [-40, -40]
+    with pytest.raises(A2lFormulaException):
+        module.converter('invalid')
+
+
+def _image_module_string():
+    return """
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE module_name ""
+                /begin MOD_COMMON "" BYTE_ORDER MSB_LAST /end MOD_COMMON
+                /begin COMPU_METHOD half "" LINEAR "%6.2" "" COEFFS_LINEAR 0.5 0 /end COMPU_METHOD
+                /begin RECORD_LAYOUT uword_layout FNC_VALUES 1 UWORD COLUMN_DIR DIRECT /end RECORD_LAYOUT
+                /begin RECORD_LAYOUT ubyte_layout FNC_VALUES 1 UBYTE ROW_DIR DIRECT /end RECORD_LAYOUT
+                /begin RECORD_LAYOUT slong_layout FNC_VALUES 1 SLONG COLUMN_DIR DIRECT /end RECORD_LAYOUT
+                /begin RECORD_LAYOUT curve_layout
+                    NO_AXIS_PTS_X 1 UBYTE
+                    AXIS_PTS_X 2 SWORD INDEX_INCR DIRECT
+                    RESERVED 3 WORD
+                    FNC_VALUES 4 FLOAT32_IEEE COLUMN_DIR DIRECT
+                /end RECORD_LAYOUT
+                /begin RECORD_LAYOUT axis_layout NO_AXIS_PTS_X 1 UWORD AXIS_PTS_X 2 UWORD INDEX_DECR DIRECT
+                /end RECORD_LAYOUT
+                /begin CHARACTERISTIC value "" VALUE 0x1000 uword_layout 0 half 0 100 /end CHARACTERISTIC
+                /begin CHARACTERISTIC curve "" CURVE 0x1010 curve_layout 0 NO_COMPU_METHOD 0 100
+                    /begin AXIS_DESCR STD_AXIS NO_INPUT_QUANTITY half 5 -10 10 /end AXIS_DESCR
+                /end CHARACTERISTIC
+                /begin CHARACTERISTIC map "" MAP 0x1040 ubyte_layout 0 NO_COMPU_METHOD 0 100
+                    /begin AXIS_DESCR COM_AXIS NO_INPUT_QUANTITY NO_COMPU_METHOD 4 0 1000
+                        AXIS_PTS_REF axis
+                    /end AXIS_DESCR
+                    /begin AXIS_DESCR FIX_AXIS NO_INPUT_QUANTITY NO_COMPU_METHOD 3 0 100
+                        FIX_AXIS_PAR_DIST 0 10 3
+                    /end AXIS_DESCR
+                /end CHARACTERISTIC
+                /begin CHARACTERISTIC blk "" VAL_BLK 0x1200 slong_layout 0 NO_COMPU_METHOD 0 100 NUMBER 3
+                /end CHARACTERISTIC
+                /begin CHARACTERISTIC matrix "" VAL_BLK 0x1300 ubyte_layout 0 NO_COMPU_METHOD 0 100
+                    MATRIX_DIM 2 3 1
+                /end CHARACTERISTIC
+                /begin CHARACTERISTIC text "" ASCII 0x1400 ubyte_layout 0 NO_COMPU_METHOD 0 100 NUMBER 8
+                /end CHARACTERISTIC
+                /begin CHARACTERISTIC flag "" VALUE 0x1500 ubyte_layout 0 NO_COMPU_METHOD 0 100 BIT_MASK 0x30
+                /end CHARACTERISTIC
+                /begin CHARACTERISTIC big "" VALUE 0x1502 uword_layout 0 NO_COMPU_METHOD 0 100 BYTE_ORDER MSB_FIRST
+                /end CHARACTERISTIC
+                /begin CHARACTERISTIC missing "" VALUE 0x9000 uword_layout 0 NO_COMPU_METHOD 0 100
+                /end CHARACTERISTIC
+                /begin AXIS_PTS axis "" 0x1100 NO_INPUT_QUANTITY axis_layout 0 NO_COMPU_METHOD 4 0 1000
+                    BYTE_ORDER MSB_FIRST
+                /end AXIS_PTS
+            /end MODULE
+        /end PROJECT"""
+
+
+def _image_data():
+    import struct
+    data = bytearray(0x600)
+    struct.pack_into('<H', data, 0x000, 1234)
+    struct.pack_into('<B', data, 0x010, 3)
+    struct.pack_into('<3h', data, 0x012, -10, 0, 10)
+    struct.pack_into('<3f', data, 0x01C, 1.5, 2.5, 3.5)
+    struct.pack_into('6B', data, 0x040, 1, 2, 3, 4, 5, 6)
+    struct.pack_into('>H2H', data, 0x100, 2, 200, 100)
+    struct.pack_into('<3l', data, 0x200, -1, 2, -3)
+    struct.pack_into('6B', data, 0x300, 1, 2, 3, 4, 5, 6)
+    data[0x400:0x408] = b'hello\0\0\0'
+    struct.pack_into('B', data, 0x500, 0xB0)
+    struct.pack_into('>H', data, 0x502, 0x1234)
+    return data
+
+
+def _intel_hex(address, data):
+    import binascii
+    lines = list()
+    for i in range(0, len(data), 16):
+        for record in (bytearray([2, 0, 0, 4, (address + i) >> 24 & 0xFF, (address + i) >> 16 & 0xFF]),
+                       bytearray([len(data[i:i + 16]), (address + i) >> 8 & 0xFF, (address + i) & 0xFF, 0]) +
+                       data[i:i + 16]):
+            record.append(-sum(record) & 0xFF)
+            lines.append(':' + binascii.hexlify(record).decode('ascii').upper())
+    return '\n'.join(lines + [':00000001FF', ''])
+
+
+def _s_records(address, data):
+    import binascii
+    import struct
+    lines = ['S0030000FC']
+    for i in range(0, len(data), 32):
+        record = bytearray([len(data[i:i + 32]) + 5]) + bytearray(struct.pack('>I', address + i)) + data[i:i + 32]
+        record.append(~sum(record) & 0xFF)
+        lines.append('S3' + binascii.hexlify(record).decode('ascii').upper())
+    return '\n'.join(lines + ['S70500000000FA', ''])
+
+
+@pytest.mark.parametrize('use_numpy', (True, False))
+@pytest.mark.parametrize('extension', ('hex', 's19', 'bin'))
+def test_image_reader(monkeypatch, tmpdir, use_numpy, extension):
+    from pya2l.parser.grammar import conversion, image, layout
+    from pya2l.parser.grammar.image import A2lImage, A2lImageReader, A2lImageException
+    if use_numpy:
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(conversion, 'numpy', None)
+        monkeypatch.setattr(image, 'numpy', None)
+        monkeypatch.setattr(layout, 'numpy', None)
+
+    def values(v):
+        return v.tolist() if use_numpy else v
+
+    data = _image_data()
+    path = str(tmpdir.join('image.' + extension))
+    if extension == 'bin':
+        with open(path, 'wb') as fp:
+            fp.write(data)
+    else:
+        with open(path, 'w') as fp:
+            fp.write(_intel_hex(0x1000, data) if extension == 'hex' else _s_records(0x1000, data))
+    module = Parser(_image_module_string()).tree.project.module[0]
+    with A2lImage.from_file(path, base_address=0x1000) as image_file:
+        assert image_file.read(0x1000, 2) == b'\xd2\x04'
+        reader = A2lImageReader(module, image_file)
+        assert reader.read('value').values == 1234
+        assert reader.read('value', physical=True).values == 617
+        curve = reader.read('curve')
+        assert values(curve.values) == [1.5, 2.5, 3.5]
+        assert values(curve.axes[0]) == [-10, 0, 10]
+        assert curve.fields == dict(no_axis_pts_x=3)
+        assert values(reader.read('curve', physical=True).axes[0]) == [-5, 0, 5]
+        assert values(reader.read('axis').values) == [100, 200]
+        map_value = reader.read(module.characteristic[2])
+        assert values(map_value.values) == [[1, 3, 5], [2, 4, 6]]
+        assert [values(axis) for axis in map_value.axes] == [[100, 200], [0, 10, 20]]
+        assert values(reader.read('blk').values) == [-1, 2, -3]
+        assert values(reader.read('matrix').values) == [[1, 3, 5], [2, 4, 6]]
+        assert reader.read('text').values == 'hello'
+        assert reader.read('flag').values == 3
+        assert reader.read('big').values == 0x1234
+        with pytest.raises(A2lImageException):
+            reader.read('missing')
+        with pytest.raises(ValueError):
+            reader.read('unknown')
+        with pytest.raises(A2lImageException):
+            reader.read_all()
+        assert sorted(reader.read_all(errors='ignore')) == ['big', 'blk', 'curve', 'flag', 'map', 'matrix', 'text',
+                                                            'value']
+
+
+@pytest.mark.parametrize('deposit', ('ABSOLUTE', 'DIFFERENCE'))
+def test_image_axis_pts_deposit(deposit):
+    from pya2l.parser.grammar.image import A2lImage, A2lImageReader
+    from pya2l.parser.grammar.writer import dumps
+    a2l_string = _image_module_string().replace('BYTE_ORDER MSB_FIRST\n                /end AXIS_PTS',
+                                                'BYTE_ORDER MSB_FIRST DEPOSIT ' + deposit + ' /end AXIS_PTS')
+    tree = Parser(a2l_string).tree
+    module = tree.project.module[0]
+    axis = module.axis_pts[0]
+    assert (axis.deposit, axis.deposit_mode) == ('axis_layout', deposit)
+    assert module.resolve(axis, 'deposit') is module.get_index().record_layout['axis_layout']
+    assert 'axis_layout 0 NO_COMPU_METHOD' in dumps(axis) and 'DEPOSIT ' + deposit in dumps(axis)
+    assert Parser(dumps(tree)).tree.project.module[0].axis_pts[0].json == axis.json
+    values = A2lImageReader(module, A2lImage([(0x1000, _image_data())])).read('axis').values
+    assert list(values) == ([100, 200] if deposit == 'ABSOLUTE' else [100, 300])
+
+
+def test_image_files(tmpdir):
+    from pya2l.parser.grammar.image import A2lImage, A2lImageException
+    path = str(tmpdir.join('image.hex'))
+    with open(path, 'w') as fp:
+        fp.write(_intel_hex(0x80000000, bytearray(b'high')).replace(':00000001FF\n', '') +
+                 _intel_hex(0x1000, bytearray(b'abcd')).replace(':00000001FF\n', '') +
+                 _intel_hex(0x1002, bytearray(b'XYZ')))
+    image = A2lImage.from_file(path)
+    assert [(a, bytes(d)) for a, d in image.segments] == [(0x1000, b'abXYZ'), (0x80000000, b'high')]
+    with pytest.raises(A2lImageException):
+        image.read(0x1004, 2)
+    with open(path, 'w') as fp:
+        fp.write(':0400000061626364FF\n')
+    with pytest.raises(A2lImageException):
+        A2lImage.from_file(path)
+    path = str(tmpdir.join('image.s19'))
+    with open(path, 'w') as fp:
+        fp.write('S1070000616263640F\n')
+    with pytest.raises(A2lImageException):
+        A2lImage.from_file(path)
+
+
+@pytest.mark.parametrize('use_numpy', (True, False))
+def test_layout_plan(monkeypatch, use_numpy):
+    import struct
+    from pya2l.parser.grammar import conversion, image, layout
+    from pya2l.parser.grammar.image import A2lImage, A2lImageReader
+    from pya2l.parser.grammar.layout import A2lLayoutPlan
+    if use_numpy:
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(conversion, 'numpy', None)
+        monkeypatch.setattr(image, 'numpy', None)
+        monkeypatch.setattr(layout, 'numpy', None)
+
+    def values(v):
+        return v.tolist() if use_numpy else v
+
+    module = Parser(_image_module_string()).tree.project.module[0]
+    data = _image_data()
+    reader = A2lImageReader(module, A2lImage([(0x1000, data)]))
+    reader.read('map')
+    plan = reader._plans['ubyte_layout', False]
+    reader.read('matrix')
+    reader.read('text')
+    assert reader._plans['ubyte_layout', False] is plan
+    assert sorted(reader._plans) == [('axis_layout', False), ('ubyte_layout', False)]
+    plan = A2lLayoutPlan(module.get_index().record_layout.get('curve_layout'), module.mod_common)
+    assert [f.attribute for f in plan.fields] == ['no_axis_pts_x', 'axis_pts_x', 'reserved', 'fnc_values']
+    assert [f.kind for f in plan.fields] == ['count', 'array', 'reserved', 'array']
+    assert plan.static and plan.alignment == 4
+    assert plan.field('axis_pts_x').data_type == 'SWORD' and plan.field('axis_pts_y') is None
+    counts = dict(x=5)
+    fields = plan.decode(reader.image, 0x1010, '<', counts, lambda c: c['x'])
+    assert counts == dict(x=3)
+    assert fields['no_axis_pts_x'] == 3
+    assert values(fields['axis_pts_x']) == [-10, 0, 10]
+    assert values(fields['fnc_values']) == [1.5, 2.5, 3.5]
+    assert plan.encode(fields, '<', dict(x=5), lambda c: c['x']) == bytes(data[0x10:0x28])
+    assert plan._walk(reader.image, 0x1010, '<', dict(x=5), lambda c: c['x']).keys() == fields.keys()
+    shifted = bytearray(0x18)
+    struct.pack_into('<B3h4x3f', shifted, 0x01, 3, -10, 0, 10, 1.5, 2.5, 3.5)
+    unaligned = plan.decode(A2lImage([(0x1000, shifted)]), 0x1001, '<', dict(x=5), lambda c: c['x'])
+    assert values(unaligned['axis_pts_x']) == values(fields['axis_pts_x'])
+    assert values(unaligned['fnc_values']) == values(fields['fnc_values'])
+    plan = A2lLayoutPlan(module.get_index().record_layout.get('axis_layout'))
+    fields = plan.decode(reader.image, 0x1100, '>', dict(x=4))
+    assert values(fields['axis_pts_x']) == [100, 200]
+    assert plan.encode(fields, '>', dict()) == bytes(data[0x100:0x106])
+    with pytest.raises(ValueError):
+        plan.encode(dict(no_axis_pts_x=3, axis_pts_x=[1, 2]), '>', dict())
+
+
+def test_writer():
+    from pya2l.parser.grammar.writer import dump, dumps
+    with open(os.path.join(os.path.dirname(__file__), 'pya2l', 'parser', 'example', 'a2l.a2l'), 'r') as fp:
+        tree = Parser(fp.read()).tree
+    text = dumps(tree)
+    assert Parser(text).tree.json == tree.json
+    assert Parser(text).tree.project.module[0].a2ml == tree.project.module[0].a2ml
+    fp = io.StringIO()
+    dump(tree, fp, chunk_size=16)
+    assert fp.getvalue() == text
+    assert dumps(tree, indent='\t').replace('\t', '    ') == text
+    a2l_string = """
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE first_module_name "first module long identifier"
+                /begin IF_DATA if_data_module_name
+                    /begin CHECKSUM "checksum.dll"
+                    /end CHECKSUM
+                /end IF_DATA
+                /begin AXIS_PTS axis_pts_name "axis_pts long identifier" 0 input_quantity deposit 0 conversion 0 0 0
+                    DEPOSIT ABSOLUTE
+                    FORMAT "%4.2"
+                /end AXIS_PTS
+                /begin COMPU_METHOD compu_method_name "compu method long identifier" RAT_FUNC "%4.2" "unit"
+                    COEFFS 0 1.5 -2 0x10 0 1
+                /end COMPU_METHOD
+            /end MODULE
+        /end PROJECT
+        """
+    tree = Parser(a2l_string).tree
+    text = dumps(tree)
+    assert Parser(text).tree.json == tree.json
+    assert '/begin COMPU_METHOD compu_method_name "compu method long identifier" RAT_FUNC "%4.2" "unit"\n' in text
+    assert '            COEFFS 0 1.5 -2 16 0 1\n' in text
+    module = tree.project.module[0]
+    assert dumps(module.compu_method[0]).splitlines()[1] == '    COEFFS 0 1.5 -2 16 0 1'
+    a2ml = '/begin A2ML long; struct s { uint[2]; enum { "A" = 0, "B" }; }; taggedstruct { ("T" uint)*; }; /end A2ML'
+    assert dumps(Parser(a2l_string.replace('/begin IF_DATA', a2ml + ' /begin IF_DATA')).tree).count(a2ml) == 1
+    measurement = '/begin MEASUREMENT m "" UWORD NO_COMPU_METHOD 0 0 0 1 /begin VIRTUAL a b /end VIRTUAL /end MEASUREMENT'
+    tree = Parser('/begin PROJECT p "" /begin MODULE m "" {0} /end MODULE /end PROJECT'.format(measurement)).tree
+    assert tree.project.module[0].measurement[0].virtual == ['a', 'b']
+    assert '/begin VIRTUAL a b /end VIRTUAL' in dumps(tree)
+    with pytest.raises(ValueError):
+        dumps(Parser('/begin PROJECT p "" /begin MODULE m "" /begin IF_DATA module TP_BLOB 1 2 /end IF_DATA /end MODULE '
+                     '/end PROJECT').tree)
+
+
+@pytest.mark.parametrize('lexer', ('ply', 'fast'))
+def test_patch(tmpdir, lexer):
+    from pya2l.parser import A2lPatch
+    a2l_string = u"""
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE module_name "module long identifier" // comment é
+                /begin CHARACTERISTIC characteristic_name "characteristic long identifier" VALUE 0x8000abcd
+                    record_layout 0 compu_method 0.0 100.5 /* comment */ FORMAT "%4.2"
+                /end CHARACTERISTIC
+                /begin MEASUREMENT measurement_name "" UWORD compu_method 0 0 0 1
+                    ECU_ADDRESS 0X00001234
+                    /begin ANNOTATION /end ANNOTATION
+                /end MEASUREMENT
+            /end MODULE
+        /end PROJECT"""
+    tree = Parser(a2l_string, lexer=lexer, spans=True).tree
+    module = tree.project.module[0]
+    characteristic, measurement = module.characteristic[0], module.measurement[0]
+    start, end = characteristic.get_span('address')
+    assert a2l_string[start:end] == '0x8000abcd'
+    start, end = measurement.get_span('ecu_address')
+    assert a2l_string[start:end] == 'ECU_ADDRESS 0X00001234'
+    assert measurement.get_span('annotation') is None and measurement.get_span('format') is None
+    assert Parser(a2l_string).tree.project.get_span('name') is None
+    patch = A2lPatch()
+    patch[characteristic].address = 0x80001234
+    patch[characteristic].format = '%8.3'
+    patch[measurement].ecu_address = 0xABC
+    patch.set(module, 'long_identifier', 'new long identifier')
+    assert characteristic.address == 0x80001234 and measurement.ecu_address == 0xABC and len(patch) == 4
+    with pytest.raises(ValueError):
+        patch[measurement].format = '%4.2'
+    patched = patch.apply(a2l_string)
+    assert patched == a2l_string.replace('0x8000abcd', '0x80001234').replace('%4.2', '%8.3') \
+        .replace('0X00001234', '0X00000ABC').replace('module long identifier', 'new long identifier')
+    assert Parser(patched).tree.json == tree.json
+    a2l_file = tmpdir.join('test.a2l')
+    a2l_file.write_binary(a2l_string.encode('utf-8'))
+    tree = Parser.from_file(str(a2l_file), chunk_size=7, lexer=lexer, spans=True).tree
+    patch = A2lPatch()
+    for m in tree.project.module:
+        patch[m.characteristic[0]].address = 0x80001234
+        patch[m.measurement[0]].ecu_address = 0xABC
+        patch[m].long_identifier = 'new long identifier'
+        patch[m.characteristic[0]].format = '%8.3'
+    patch.apply_file(str(a2l_file), str(tmpdir.join('copy.a2l')), chunk_size=3)
+    assert tmpdir.join('copy.a2l').read_binary() == patched.encode('utf-8')
+    patch.apply_file(str(a2l_file))
+    assert a2l_file.read_binary() == patched.encode('utf-8')
+    patch.set(tree, 'project', tree.project)
+    with pytest.raises(ValueError):
+        patch.get_edits()
+    with pytest.raises(ValueError):
+        Parser(a2l_string, spans=True, lazy=True)
+
+
+def test_diff(tmpdir, monkeypatch, capsys):
+    import json
+    import sys
+    from pya2l import diff, main
+    a2l_string = """
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE module_name "module long identifier"
+                /begin CHARACTERISTIC unchanged "" VALUE 0x1000 record_layout 0 compu_method 0 100 /end CHARACTERISTIC
+                /begin CHARACTERISTIC changed "" VALUE 0x2000 record_layout 0 compu_method 0 100
+                    FORMAT "%4.2"
+                /end CHARACTERISTIC
+                /begin CHARACTERISTIC removed "" VALUE 0x3000 record_layout 0 compu_method 0 100 /end CHARACTERISTIC
+                /begin MEASUREMENT measurement "" UWORD compu_method 0 0 0 1
+                    /begin ANNOTATION ANNOTATION_LABEL "label" /end ANNOTATION
+                /end MEASUREMENT
+                /begin COMPU_METHOD compu_method "" IDENTICAL "%4.2" "" /end COMPU_METHOD
+                /begin MOD_COMMON "" BYTE_ORDER MSB_LAST /end MOD_COMMON
+            /end MODULE
+        /end PROJECT"""
+    new_string = a2l_string.replace('0x2000', '0x2004').replace('%4.2"\n', '%8.3"\n') \
+        .replace('"label"', '"new label"').replace('MSB_LAST', 'MSB_FIRST').replace('"module long', '"new long') \
+        .replace('/begin CHARACTERISTIC removed', '/begin CHARACTERISTIC added')
+    tree_a, tree_b = Parser(a2l_string).tree, Parser(new_string).tree
+    assert diff(tree_a, tree_a) == [] and diff(tree_a, Parser(a2l_string).tree) == []
+    changes = diff(tree_a, tree_b)
+    assert [(c.change, c.node, c.name) for c in changes] == [('changed', 'MOD_COMMON', None),
+                                                             ('changed', 'CHARACTERISTIC', 'changed'),
+                                                             ('removed', 'CHARACTERISTIC', 'removed'),
+                                                             ('changed', 'MEASUREMENT', 'measurement'),
+                                                             ('added', 'CHARACTERISTIC', 'added'),
+                                                             ('changed', 'MODULE', 'module_name')]
+    assert changes[1].module == 'module_name' and changes[-1].module is None
+    assert [(f, old, new) for f, old, new in changes[1].fields] == [('address', 0x2000, 0x2004),
+                                                                     ('format', '%4.2', '%8.3')]
+    assert changes[3].json['fields'][0]['new'][0]['annotation_label'] == 'new label'
+    assert [f[0] for f in changes[-1].fields] == ['long_identifier']
+    assert [c.name for c in diff(tree_a, tree_b, kinds={'MEASUREMENT', 'COMPU_METHOD'})] == ['measurement',
+                                                                                             'module_name']
+    tree_c = Parser(a2l_string).tree
+    assert diff(tree_a, tree_c) == []
+    tree_c.project.module[0].compu_method[0].format = '%8.3'
+    assert [(c.change, c.name) for c in diff(tree_a, tree_c)] == [('changed', 'compu_method')]
+    tmpdir.join('a.a2l').write(a2l_string)
+    tmpdir.join('b.a2l').write(new_string)
+    monkeypatch.setattr(sys, 'argv', ['pya2l', 'diff', str(tmpdir.join('a.a2l')), str(tmpdir.join('b.a2l')),
+                                      '--kinds', 'characteristic'])
+    main()
+    assert json.loads(capsys.readouterr().out) == [c.json for c in diff(tree_a, tree_b, kinds={'CHARACTERISTIC'})]
+    monkeypatch.setattr(sys, 'argv', ['pya2l', 'diff', str(tmpdir.join('a.a2l')), str(tmpdir.join('b.a2l')),
+                                      '-o', str(tmpdir.join('diff.json'))])
+    main()
+    assert json.loads(tmpdir.join('diff.json').read()) == [c.json for c in changes]
+
+
+def test_digest():
+    import pickle
+    a2l_string = """
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE module_name "module long identifier"
+                /begin COMPU_METHOD first "" RAT_FUNC "%4.2" "unit" COEFFS 0 1 0 0 0 1 /end COMPU_METHOD
+                /begin COMPU_METHOD identical "" IDENTICAL "%4.2" "" /end COMPU_METHOD
+                /begin COMPU_METHOD second "" RAT_FUNC "%4.2" "unit" COEFFS 0 1 0 0 0 1 /end COMPU_METHOD
+                /begin COMPU_METHOD third "" RAT_FUNC "%4.2" "unit" COEFFS 0 1 0 0 0 1 /end COMPU_METHOD
+                /begin RECORD_LAYOUT a FNC_VALUES 1 UWORD ROW_DIR DIRECT /end RECORD_LAYOUT
+                /begin RECORD_LAYOUT b FNC_VALUES 1 UWORD ROW_DIR DIRECT /end RECORD_LAYOUT
+                /begin RECORD_LAYOUT c FNC_VALUES 1 SWORD ROW_DIR DIRECT /end RECORD_LAYOUT
+            /end MODULE
+        /end PROJECT"""
+    tree = Parser(a2l_string).tree
+    module = tree.project.module[0]
+    digest = tree.digest()
+    assert len(digest) == 20 and tree.digest() is digest
+    assert Parser(a2l_string).tree.digest() == digest
+    assert pickle.loads(pickle.dumps(tree)).digest() == digest
+    assert Parser(a2l_string.replace('SWORD', 'SLONG')).tree.digest() != digest
+    first, identical, second, third = module.compu_method
+    assert first.digest() != second.digest()
+    assert first.digest(ignored=('name',)) == second.digest(ignored=('name',)) != identical.digest(ignored=('name',))
+    assert [[n.name for n in g] for g in module.duplicates('COMPU_METHOD')] == [['first', 'second', 'third']]
+    assert [[n.name for n in g] for g in module.duplicates('RECORD_LAYOUT')] == [['a', 'b']]
+    module.record_layout[1].fnc_values.data_type = 'SWORD'
+    assert [[n.name for n in g] for g in module.duplicates('RECORD_LAYOUT')] == [['b', 'c']]
+    module.record_layout[1].fnc_values.data_type = 'UWORD'
+    assert module.duplicates('CHARACTERISTIC') == []
+    assert module.duplicates('COMPU_METHOD', ignored=('name', 'coeffs')) == [[first, second, third]]
+    third.coeffs.f = 2
+    assert first.digest(ignored=('name',)) != third.digest(ignored=('name',))
+    assert [[n.name for n in g] for g in module.duplicates('COMPU_METHOD')] == [['first', 'second']]
+    assert tree.digest() != digest
+    third.coeffs.f = 1
+    assert tree.digest() == digest
+    removed = module.compu_method.pop()
+    assert tree.digest() == digest
+    module.reset_digest()
+    assert tree.digest() != digest
+    module.compu_method.append(removed)
+    module.reset_digest()
+    assert tree.digest() == digest
+
+
+def test_merge():
+    from pya2l import merge
+    from pya2l.parser.grammar.writer import dumps
+    supplier_a = """
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE module_a "module a"
+                /begin CHARACTERISTIC a "" VALUE 0x1000 rl 0 cm 0 100 /end CHARACTERISTIC
+                /begin COMPU_METHOD cm "" TAB_VERB "%4.2" "" COMPU_TAB_REF tab REF_UNIT unit /end COMPU_METHOD
+                /begin COMPU_VTAB tab "" TAB_VERB 1 0 "off" /end COMPU_VTAB
+                /begin RECORD_LAYOUT rl FNC_VALUES 1 UWORD ROW_DIR DIRECT /end RECORD_LAYOUT
+                /begin UNIT unit "" "m" DERIVED /end UNIT
+                /begin MOD_COMMON "" BYTE_ORDER MSB_LAST /end MOD_COMMON
+            /end MODULE
+        /end PROJECT"""
+    supplier_b = supplier_a.replace('module_a "module a"', 'module_b "module b"') \
+        .replace('CHARACTERISTIC a ', 'CHARACTERISTIC b ').replace('"off"', '"on"').replace('MSB_LAST', 'MSB_FIRST')
+    module, conflicts = merge([Parser(supplier_a).tree, Parser(supplier_b).tree])
+    assert (module.name, module.long_identifier) == ('module_a', 'module a')
+    assert [c.name for c in module.characteristic] == ['a', 'b']
+    assert all(len(getattr(module, kind)) == 1 for kind in ('compu_method', 'compu_vtab', 'record_layout', 'unit'))
+    assert module.characteristic[1]._parent is module and module.resolve(module.characteristic[1], 'deposit')
+    assert [(c.node, c.name, c.sources) for c in conflicts] == [('COMPU_VTAB', 'tab', (0, 1)),
+                                                               ('MOD_COMMON', None, (0, 1))]
+    assert [f[0] for f in conflicts[0].fields] == ['compu_vtab_in_val_out_val']
+    assert conflicts[1].json['fields'][0]['kept'] == 'MSB_LAST'
+    module, conflicts = merge([Parser(supplier_a).tree, Parser(supplier_b).tree.project.module[0]], name='merged',
+                              prefixes=[None, 'B_'], prefixed={'COMPU_METHOD', 'COMPU_VTAB'},
+                              renames=[None, {('UNIT', 'unit'): 'unit_b'}])
+    assert module.name == 'merged' and [c.node for c in conflicts] == ['MOD_COMMON']
+    assert [c.name for c in module.compu_method] == ['cm', 'B_cm']
+    assert [u.name for u in module.unit] == ['unit', 'unit_b']
+    assert len(module.record_layout) == 1 and [c.conversion for c in module.characteristic] == ['cm', 'B_cm']
+    assert (module.compu_method[1].compu_tab_ref, module.compu_method[1].ref_unit) == ('B_tab', 'unit_b')
+    assert module.resolve(module.compu_method[1], 'compu_tab_ref').compu_vtab_in_val_out_val[0][1] == 'on'
+    assert 'COMPU_TAB_REF B_tab' in dumps(module)
+    with_a2ml = [supplier_a.replace('"module a"', '"module a" /begin A2ML {0}; /end A2ML'.format(t))
+                 for t in ('long', 'long', 'uint')]
+    module, conflicts = merge([Parser(supplier_a).tree] + [Parser(a2l_string).tree for a2l_string in with_a2ml])
+    assert module.a2ml == ['long'] and [(c.node, c.name, c.sources) for c in conflicts] == [('A2ML', None, (1, 3))]
+    assert conflicts[0].json['fields'] == [dict(field='a2ml', kept=['long'], dropped=['uint'])]
+    tree_a, tree_b = Parser(supplier_a).tree, Parser(supplier_a).tree
+    assert tree_a.digest() == tree_b.digest()
+    tree_b.project.module[0].unit[0].display = 'km'
+    assert [(c.node, c.name) for c in merge([tree_a, tree_b])[1]] == [('UNIT', 'unit')]
+    with pytest.raises(ValueError):
+        merge([Parser(supplier_a).tree], prefixes=['A_', 'B_'])
+    with pytest.raises(ValueError):
+        merge([])
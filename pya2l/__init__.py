@@ -5,5 +5,8 @@
 @date: 13.04.2018
 """
 
-from .parser import A2lParser, A2lFormatException
+from .parser import A2lParser, A2lFormatException, A2lIndex, A2lPatch
 from .cli import main
+from .batch import parse_many
+from .changes import diff
+from .merge import merge
@@ -0,0 +1,89 @@
+"""
+@project: parser
+@file: batch.py
+@author: Guillaume Sottas
+@date: 18.10.2026
+"""
+
+import os
+import time
+
+from pya2l.parser import A2lParser
+from pya2l.parser.grammar.parallel import new_process_pool
+
+
+class A2lParseResult(object):
+    """
+    outcome of the parsing of a file by parse_many. value is the tree (or the value returned by the handler) if the
+    file has been parsed successfully, error is the description of the failure otherwise. seconds is the time spent
+    parsing (and handling) the file in the worker process.
+    """
+    __slots__ = 'path', 'value', 'error', 'seconds'
+
+    def __init__(self, path, value=None, error=None, seconds=0.0):
+        self.path = path
+        self.value = value
+        self.error = error
+        self.seconds = seconds
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def _describe(error):
+    return '{0}: {1}'.format(type(error).__name__, error)
+
+
+def _parse(path, handler, options):
+    start = time.time()
+    try:
+        parser = A2lParser.from_file(path, **options)
+        value = parser.tree if handler is None else handler(path, parser)
+    except Exception as e:
+        return A2lParseResult(path, error=_describe(e), seconds=time.time() - start)
+    return A2lParseResult(path, value, seconds=time.time() - start)
+
+
+def parse_many(paths, workers=None, handler=None, **options):
+    """
+    parses the files located at paths in a pool of worker processes (os.cpu_count() if workers is None), whose parser
+    tables are built when they start. an A2lParseResult is yielded for each file, as soon as it is parsed, so that the
+    results are not in the order of paths.
+
+    the trees are sent back to the calling process, unless a handler is specified: handler(path, parser) is then
+    called in the worker process and its return value is sent back instead, which avoids transferring large trees. it
+    must be picklable (e.g. a module-level function or a functools.partial of it). the options are passed to
+    A2lParser.from_file. the failure of a file is reported in its result and does not stop the processing of the other
+    ones. with python 2, the futures backport of concurrent.futures is required.
+    """
+    from concurrent.futures import as_completed
+    executor = new_process_pool(workers, A2lParser.warmup)
+    futures = dict()
+    try:
+        for path in paths:
+            futures[executor.submit(_parse, path, handler, options)] = path
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                yield A2lParseResult(futures[future], error=_describe(e))
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def find_files(paths, extension='.a2l'):
+    """
+    returns the files of paths, the directories being replaced by the files they contain (recursively) whose name ends
+    with extension (case insensitive).
+    """
+    files = list()
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, _, names in sorted(os.walk(path)):
+                files += [os.path.join(directory, n) for n in sorted(names) if n.lower().endswith(extension)]
+        else:
+            files.append(path)
+    return files
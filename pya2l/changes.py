@@ -0,0 +1,124 @@
+"""
+@project: parser
+@file: changes.py
+@author: Guillaume Sottas
+@date: 18.10.2026
+"""
+
+import collections
+
+from pya2l.objects import holds_nodes, json_value, object_fields, object_name
+from pya2l.parser.grammar.node import A2lNode
+
+ADDED = 'added'
+REMOVED = 'removed'
+CHANGED = 'changed'
+
+
+class A2lChange(object):
+    """
+    difference between two trees, as returned by diff: an object (a child of a MODULE node, a MODULE or the PROJECT)
+    added, removed or changed. module is the name of the MODULE of the object (None for the MODULE, ROOT and PROJECT
+    nodes), and fields the (attribute, old value, new value) tuples of the attributes of a changed object.
+    """
+    __slots__ = 'change', 'node', 'name', 'module', 'fields'
+
+    def __init__(self, change, node, name, module=None, fields=()):
+        self.change = change
+        self.node = node
+        self.name = name
+        self.module = module
+        self.fields = list(fields)
+
+    def __repr__(self):
+        return 'A2lChange({0}, {1}, {2!r})'.format(self.change, self.node, self.name)
+
+    def get_json(self):
+        tmp = dict(change=self.change, node=self.node, name=self.name, module=self.module)
+        if self.change == CHANGED:
+            tmp['fields'] = [dict(field=f, old=json_value(old), new=json_value(new)) for f, old, new in self.fields]
+        return tmp
+
+    json = property(fget=get_json)
+
+
+def _objects(module):
+    """
+    returns the (node type, name) to node dictionary of the children of module, in order. the children of the same
+    type without name attribute are identified by their first attribute, and the homonyms by their occurrence.
+    """
+    objects = collections.OrderedDict()
+    for attribute in module.properties:
+        value = getattr(module, attribute)
+        for node in (value if isinstance(value, list) else (value,)):
+            if not isinstance(node, A2lNode):
+                continue
+            name = object_name(node) if isinstance(value, list) else None
+            key = node.node(), name
+            occurrence = 1
+            while key in objects:
+                occurrence += 1
+                key = node.node(), name, occurrence
+            objects[key] = node
+    return objects
+
+
+def _module_children(module_a, module_b):
+    """
+    returns the attributes of two MODULE nodes holding their children, compared by _objects.
+    """
+    return frozenset(p for p in module_a.properties
+                     if holds_nodes(getattr(module_a, p)) or holds_nodes(getattr(module_b, p)))
+
+
+def diff(tree_a, tree_b, kinds=None):
+    """
+    returns the list of the A2lChange objects describing the differences from tree_a to tree_b (two A2lFile trees):
+    the children of their MODULE nodes added, removed or changed, then the changes of the attributes of the MODULE,
+    ROOT and PROJECT nodes themselves. kinds is a set of node types (e.g. {'CHARACTERISTIC'}) restricting the compared
+    children, all of them being compared if None.
+
+    the MODULE nodes are matched by name, and their children by (node type, name) through dictionaries. the children
+    are compared by digest (see A2lNode.digest, cached by the nodes for the next diffs), so that the attributes of the
+    unchanged ones are not compared. the changes follow the order of tree_a, the added objects the order of tree_b.
+    """
+    changes = list()
+    project_a, project_b = tree_a.project, tree_b.project
+    modules_a = collections.OrderedDict((m.name, m) for m in (project_a.module if project_a is not None else ()))
+    modules_b = collections.OrderedDict((m.name, m) for m in (project_b.module if project_b is not None else ()))
+    for name, module_a in modules_a.items():
+        module_b = modules_b.get(name)
+        if module_b is None:
+            changes.append(A2lChange(REMOVED, 'MODULE', name))
+            continue
+        objects_a = _objects(module_a)
+        objects_b = _objects(module_b)
+        for key, node_a in objects_a.items():
+            if kinds is not None and key[0] not in kinds:
+                continue
+            node_b = objects_b.get(key)
+            if node_b is None:
+                changes.append(A2lChange(REMOVED, key[0], key[1], name))
+            elif node_a.digest() != node_b.digest():
+                changes.append(A2lChange(CHANGED, key[0], key[1], name, object_fields(node_a, node_b)))
+        for key, node_b in objects_b.items():
+            if (kinds is None or key[0] in kinds) and key not in objects_a:
+                changes.append(A2lChange(ADDED, key[0], key[1], name))
+        fields = object_fields(module_a, module_b, _module_children(module_a, module_b))
+        if fields:
+            changes.append(A2lChange(CHANGED, 'MODULE', name, fields=fields))
+    for name in modules_b:
+        if name not in modules_a:
+            changes.append(A2lChange(ADDED, 'MODULE', name))
+    fields = object_fields(tree_a, tree_b, ('project',))
+    if fields:
+        changes.append(A2lChange(CHANGED, 'ROOT', None, fields=fields))
+    if project_a is None or project_b is None:
+        if project_a is not project_b:
+            project = project_a or project_b
+            changes.append(A2lChange(REMOVED if project_b is None else ADDED, 'PROJECT', project.name))
+    else:
+        fields = object_fields(project_a, project_b, ('module',))
+        if fields:
+            changes.append(A2lChange(CHANGED, 'PROJECT', project_b.name, fields=fields))
+    return changes
@@ -1,9 +1,45 @@
 import argparse
+import functools
+import io
+import os
+import sys
 from json import dump
 
+from pya2l.batch import find_files, parse_many
+from pya2l.changes import diff
 from pya2l.parser import A2lParser
+from pya2l.parser.grammar.encoder import dump as stream_dump
 
 JSON_CMD = 'to_json'
+BATCH_CMD = 'batch'
+DIFF_CMD = 'diff'
+
+
+def write_json(a2l, output_file, stream=False):
+    with io.open(output_file, 'w', encoding='utf-8') as fp:
+        if stream:
+            stream_dump(a2l.tree, fp, indent=4, sort_keys=True, ensure_ascii=False)
+        else:
+            dump(a2l.tree.json, fp, indent=4, sort_keys=True, ensure_ascii=False)
+
+
+def batch_to_json(input_file, a2l, output_dir=None, stream=False):
+    if output_dir is None:
+        output_file = input_file + '.json'
+    else:
+        output_file = os.path.join(output_dir, os.path.basename(input_file) + '.json')
+    write_json(a2l, output_file, stream)
+    return output_file
+
+
+def write_diff(changes, output_file=None):
+    changes = [c.json for c in changes]
+    if output_file is None:
+        dump(changes, sys.stdout, indent=4, sort_keys=True)
+        sys.stdout.write('\n')
+    else:
+        with io.open(output_file, 'w', encoding='utf-8') as fp:
+            dump(changes, fp, indent=4, sort_keys=True, ensure_ascii=False)
 
 
 def main():
@@ -14,17 +50,46 @@ def main():
     json = subparsers.add_parser(JSON_CMD, help='converts an a2l file to json')
     json.add_argument('input_file', nargs=1, help='full path to a2l input file')
     json.add_argument('-o', nargs=1, help='full path to json output file')
+    json.add_argument('--stream', action='store_true',
+                      help='writes the json output while walking the tree instead of building it in memory first')
 
-    args = parser.parse_args()
+    batch = subparsers.add_parser(BATCH_CMD, help='converts a2l files to json in parallel')
+    batch.add_argument('input_files', nargs='+', help='full paths to a2l input files or directories containing them')
+    batch.add_argument('-o', nargs=1, help='full path to json output directory (default: next to the input files)')
+    batch.add_argument('-j', '--workers', type=int, default=None,
+                       help='number of worker processes (default: number of processors)')
+    batch.add_argument('--stream', action='store_true',
+                       help='writes the json output while walking the tree instead of building it in memory first')
 
-    with open(args.input_file[0], 'r') as fp:
-        data = fp.read()
+    changes = subparsers.add_parser(DIFF_CMD, help='lists the objects added, removed or changed between two a2l files')
+    changes.add_argument('input_files', nargs=2, help='full paths to the old and new a2l files')
+    changes.add_argument('-o', nargs=1, help='full path to json output file (default: standard output)')
+    changes.add_argument('-k', '--kinds', nargs='+', default=None,
+                         help='node types of the compared objects (e.g. CHARACTERISTIC MEASUREMENT, default: all)')
 
-    a2l = A2lParser(data)
+    args = parser.parse_args()
 
     if args.sub_command == JSON_CMD:
-        with open(args.o[0] if args.o is not None else args.input_file[0] + '.json', 'wb') as fp:
-            dump(a2l.tree.json, fp, indent=4, sort_keys=True, ensure_ascii=False)
+        a2l = A2lParser.from_file(args.input_file[0])
+        write_json(a2l, args.o[0] if args.o is not None else args.input_file[0] + '.json', args.stream)
+    elif args.sub_command == BATCH_CMD:
+        output_dir = args.o[0] if args.o is not None else None
+        if output_dir is not None and not os.path.isdir(output_dir):
+            os.makedirs(output_dir)
+        handler = functools.partial(batch_to_json, output_dir=output_dir, stream=args.stream)
+        errors = 0
+        for result in parse_many(find_files(args.input_files), workers=args.workers, handler=handler):
+            if result.ok:
+                print('{0:>9.3f} s  {1} -> {2}'.format(result.seconds, result.path, result.value))
+            else:
+                errors += 1
+                print('{0:>9.3f} s  {1} failed: {2}'.format(result.seconds, result.path, result.error))
+        if errors:
+            sys.exit(1)
+    elif args.sub_command == DIFF_CMD:
+        trees = [A2lParser.from_file(f).tree for f in args.input_files]
+        kinds = None if args.kinds is None else frozenset(k.upper() for k in args.kinds)
+        write_diff(diff(trees[0], trees[1], kinds), args.o[0] if args.o is not None else None)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,178 @@
+"""
+@project: parser
+@file: merge.py
+@author: Guillaume Sottas
+@date: 18.10.2026
+"""
+
+import collections
+
+from pya2l.objects import holds_nodes, json_value, object_fields, object_name
+from pya2l.parser.grammar.node import A2lNode, Module, _index_name_attributes, _references
+
+# parameters of the MODULE nodes, which are set by merge.
+_module_parameters = frozenset(('name', 'long_identifier'))
+
+# reference attributes of each node type (see node._references).
+_reference_attributes = collections.defaultdict(list)
+for _node_type, _attribute in sorted(_references):
+    _reference_attributes[_node_type].append(_attribute)
+
+
+class A2lConflict(object):
+    """
+    definition of an object dropped by merge, another definition of different content having been merged first: an
+    object is a child of a MODULE node identified by its node type and name (e.g. a COMPU_METHOD), or a child which
+    is not repeated (e.g. MOD_COMMON, whose name is None), or the A2ML declarations of a MODULE node (node A2ML and
+    name None). sources are the indexes of the sources of the kept and of the dropped definitions, and fields the
+    (attribute, kept value, dropped value) tuples of their differing attributes.
+    """
+    __slots__ = 'node', 'name', 'sources', 'fields'
+
+    def __init__(self, node, name, sources, fields=()):
+        self.node = node
+        self.name = name
+        self.sources = sources
+        self.fields = list(fields)
+
+    def __repr__(self):
+        return 'A2lConflict({0}, {1!r}, {2})'.format(self.node, self.name, self.sources)
+
+    def get_json(self):
+        fields = [dict(field=f, kept=json_value(kept), dropped=json_value(dropped)) for f, kept, dropped in self.fields]
+        return dict(node=self.node, name=self.name, sources=list(self.sources), fields=fields)
+
+    json = property(fget=get_json)
+
+
+def _modules(sources):
+    """
+    yields the (source index, MODULE node) tuples of sources, A2lFile trees or MODULE nodes.
+    """
+    for i, source in enumerate(sources):
+        if source.node() == 'MODULE':
+            yield i, source
+        elif source.project is not None:
+            for module in source.project.module:
+                yield i, module
+
+
+def _renamed(names, kinds, value):
+    for kind in kinds:
+        name = names[kind].get(value)
+        if name is not None:
+            return name
+    return value
+
+
+def _rename(module, prefix, renames, prefixed):
+    """
+    renames the named children of module: prefix is added to the name of the nodes whose type is in prefixed (all of
+    them if None), then the (node type, name) keys of renames are renamed to their value. the references to the
+    renamed nodes (see node._references) are rewritten in all the nodes of module.
+    """
+    names = dict()
+    renamed = False
+    for kind, attribute in _index_name_attributes.items():
+        names[kind] = kind_names = dict()
+        for node in getattr(module, kind):
+            old = getattr(node, attribute)
+            new = prefix + old if prefix and (prefixed is None or node._node in prefixed) else old
+            if renames:
+                new = renames.get((node._node, old), new)
+            kind_names.setdefault(old, new)
+            if new != old:
+                setattr(node, attribute, new)
+                renamed = True
+    if not renamed:
+        return
+    for node in module.iter_nodes():
+        for attribute in _reference_attributes.get(node._node, ()):
+            value = getattr(node, attribute)
+            kinds = _references[node._node, attribute]
+            if isinstance(value, list):
+                new = [_renamed(names, kinds, v) for v in value]
+            else:
+                new = _renamed(names, kinds, value)
+            if new != value:
+                setattr(node, attribute, new)
+
+
+def _merge_value(attribute, value, source, merged, args, conflicts):
+    """
+    merges the value of an attribute of a module which is not a node (e.g. the A2ML declarations), the first value
+    being kept and the other ones being reported as conflicts if they differ from it.
+    """
+    key = attribute.upper(), None
+    kept = merged.get(key)
+    if kept is None:
+        merged[key] = source, value
+        args.append((attribute, value))
+    elif kept[1] != value:
+        conflicts.append(A2lConflict(key[0], None, (kept[0], source), [(attribute, kept[1], value)]))
+
+
+def merge(sources, name=None, long_identifier=None, prefixes=None, renames=None, prefixed=None):
+    """
+    merges the MODULE nodes of sources (a list of A2lFile trees or MODULE nodes) into a new MODULE node named name
+    (the name and long identifier of the first module by default). returns the merged module and the list of the
+    A2lConflict objects describing the dropped definitions.
+
+    the children of the modules are merged in order, identified by (node type, name) as by diff. an object defined more
+    than once is kept once if its definitions are identical (compared by digest, see A2lNode.digest), and its first
+    definition is kept otherwise, the others being reported as conflicts. the attributes of the modules which are not
+    nodes (the A2ML declarations) are merged the same way, compared by value.
+
+    prefixes and renames hold an item per source (None for no change): the prefix added to the name of the children
+    of its modules whose node type is in prefixed (all the named children if None), and the dictionary renaming its
+    children, whose keys are (node type, name) tuples (e.g. ('COMPU_METHOD', 'CM_1'): 'CM_1_A'). the references to the
+    renamed children (conversion, deposit, ref_unit, compu_tab_ref...) are rewritten in their module, before it is
+    merged.
+
+    the children of the modules are moved to the merged module, renamed in place: the sources are not usable
+    afterwards, and must be copied first (copy.deepcopy) to be kept. the cost of the merge is linear in the number of
+    nodes of the sources, the children being looked up by dictionary and compared by digest.
+    """
+    sources = list(sources)
+    for items in (prefixes, renames):
+        if items is not None and len(items) != len(sources):
+            raise ValueError('an item must be specified for each of the {0} sources'.format(len(sources)))
+    first = None
+    args = list()
+    merged = dict()
+    conflicts = list()
+    for i, module in _modules(sources):
+        if first is None:
+            first = module
+        prefix = prefixes[i] if prefixes is not None else None
+        source_renames = renames[i] if renames is not None else None
+        if prefix or source_renames:
+            _rename(module, prefix, source_renames, prefixed)
+        attributes = dict()
+        for attribute in module.properties:
+            value = getattr(module, attribute)
+            if attribute in _module_parameters or value is None or value == []:
+                continue
+            if not holds_nodes(value):
+                _merge_value(attribute, value, i, merged, args, conflicts)
+                continue
+            for node in (value if isinstance(value, list) else (value,)):
+                if isinstance(node, A2lNode):
+                    attributes[id(node)] = attribute, isinstance(value, list)
+        for node in module._children:
+            try:
+                attribute, repeated = attributes[id(node)]
+            except KeyError:
+                continue
+            key = node._node, object_name(node) if repeated else None
+            kept = merged.get(key)
+            if kept is None:
+                merged[key] = i, node
+                args.append((attribute, node))
+            elif kept[1].digest() != node.digest():
+                conflicts.append(A2lConflict(key[0], key[1], (kept[0], i), object_fields(kept[1], node)))
+    if first is None:
+        raise ValueError('no MODULE to merge')
+    module = Module(first.name if name is None else name,
+                    first.long_identifier if long_identifier is None else long_identifier, args)
+    return module, conflicts
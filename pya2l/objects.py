@@ -0,0 +1,50 @@
+"""
+@project: parser
+@file: objects.py
+@author: Guillaume Sottas
+@date: 18.10.2026
+"""
+
+import array
+
+from pya2l.parser.grammar.node import A2lNode, _digest_content
+
+
+def json_value(value):
+    """
+    returns the value of an attribute as it is exported to json (see A2lNode.json).
+    """
+    if isinstance(value, A2lNode):
+        return value.json
+    if isinstance(value, array.array):
+        return value.tolist()
+    if isinstance(value, list):
+        return [json_value(v) for v in value]
+    return value
+
+
+def object_name(node):
+    """
+    returns the name identifying node among the children of the same type of its MODULE: its name attribute, or its
+    first attribute if it has none.
+    """
+    if 'name' in node.__slots__:
+        return node.name
+    attribute = next(node.properties, None)
+    return None if attribute is None else getattr(node, attribute)
+
+
+def object_fields(a, b, skipped=()):
+    """
+    returns the (attribute, value of a, value of b) tuples of the attributes of the nodes a and b whose content differ
+    (their nodes being compared by digest), but the skipped ones.
+    """
+    return [(p, getattr(a, p), getattr(b, p)) for p in a.properties
+            if p not in skipped and repr(_digest_content(getattr(a, p))) != repr(_digest_content(getattr(b, p)))]
+
+
+def holds_nodes(value):
+    """
+    returns True if value (the value of an attribute) is a node or a list holding nodes.
+    """
+    return isinstance(value, A2lNode) or isinstance(value, list) and any(isinstance(v, A2lNode) for v in value)
@@ -6,3 +6,5 @@
 """
 
 from .parser import A2lParser, A2lFormatException
+from .index import A2lIndex
+from .patch import A2lPatch
@@ -0,0 +1,75 @@
+"""
+@project: parser
+@file: aio.py
+@author: Guillaume Sottas
+@date: 18.10.2026
+"""
+
+import asyncio
+import functools
+import multiprocessing
+import pickle
+import threading
+import weakref
+
+from .parallel import new_process_pool
+
+# maximum number of parses submitted at once by the coroutines of an event loop, when no semaphore is specified.
+DEFAULT_CONCURRENCY = multiprocessing.cpu_count()
+
+_default_executor = None
+_default_executor_lock = threading.Lock()
+
+_semaphores = weakref.WeakKeyDictionary()
+
+
+def _get_default_executor(cls):
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = new_process_pool(initializer=cls.warmup)
+        return _default_executor
+
+
+def _get_running_loop():
+    # asyncio.get_running_loop is not available before python 3.7, where get_event_loop returns the running loop.
+    try:
+        return asyncio.get_running_loop()
+    except AttributeError:
+        return asyncio.get_event_loop()
+
+
+def _get_semaphore(loop):
+    try:
+        return _semaphores[loop]
+    except KeyError:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(DEFAULT_CONCURRENCY)
+        return semaphore
+
+
+def _parse(cls, data, encoding, pickled, options):
+    """
+    parses data in an executor, returning the tree (pickled if pickled is True).
+    """
+    if isinstance(data, bytes):
+        data = data.decode(encoding)
+    tree = cls(data, **options).tree
+    return pickle.dumps(tree, pickle.HIGHEST_PROTOCOL) if pickled else tree
+
+
+async def parse_async(cls, data, executor=None, semaphore=None, encoding='utf-8', pickled=False, **options):
+    """
+    see A2lParser.parse_async.
+    """
+    loop = _get_running_loop()
+    if executor is None:
+        executor = _get_default_executor(cls)
+    if semaphore is None:
+        semaphore = _get_semaphore(loop)
+    async with semaphore:
+        result = await loop.run_in_executor(executor, functools.partial(_parse, cls, data, encoding, pickled, options))
+    if pickled:
+        return result
+    parser = cls.__new__(cls)
+    parser.tree = result
+    return parser
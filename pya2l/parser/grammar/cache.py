@@ -0,0 +1,137 @@
+"""
+@project: parser
+@file: cache.py
+@author: Guillaume Sottas
+@date: 18.10.2026
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+
+from . import parsetab
+
+DEFAULT_CACHE_SIZE = 1 << 30
+
+_cache_format = 4
+_cache_suffix = '.a2lcache'
+_hash_block_size = 1 << 20
+
+
+def tree_signature(node_classes):
+    """
+    returns a digest identifying the layout of the cached trees for the specified node type to class mapping. it
+    changes whenever the grammar (the signature of the parse tables) or the node classes change, so that the snapshots
+    written by another version of the parser are not loaded.
+    """
+    digest = hashlib.sha1()
+    digest.update('{0} {1}\n'.format(_cache_format, pickle.HIGHEST_PROTOCOL).encode('utf-8'))
+    digest.update(parsetab._lr_signature.encode('utf-8'))
+    for node, cls in sorted(node_classes.items()):
+        slots = ' '.join(cls.__slots__)
+        digest.update('\n{0} {1}.{2} {3}'.format(node, cls.__module__, cls.__name__, slots).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class A2lTreeCache(object):
+    """
+    on-disk cache of parsed trees, keyed by the content of the parsed file.
+
+    each entry is a pickled tree preceded by the signature of the parser which built it. the entries written with
+    another signature are never loaded and are removed when a new entry is stored. the least recently used entries are
+    removed as well whenever the total size of the cache exceeds max_size bytes.
+    """
+
+    def __init__(self, directory, signature, max_size=DEFAULT_CACHE_SIZE):
+        self.directory = directory
+        self.signature = signature
+        self.max_size = max_size
+
+    def key(self, path, *args):
+        """
+        returns the key of the file located at path, computed from its content, the signature of the cache and args.
+        """
+        digest = hashlib.sha1(self.signature.encode('utf-8'))
+        for arg in args:
+            digest.update('\n{0}'.format(arg).encode('utf-8'))
+        digest.update(b'\n')
+        with open(path, 'rb') as fp:
+            for block in iter(lambda: fp.read(_hash_block_size), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def load(self, key):
+        """
+        returns the tree stored under key, or None if there is no valid entry for it.
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as fp:
+                if fp.readline().decode('ascii').strip() != self.signature:
+                    return None
+                tree = pickle.load(fp)
+        except (IOError, OSError):
+            return None
+        except Exception:
+            self._remove(path)
+            return None
+        os.utime(path, None)
+        return tree
+
+    def store(self, key, tree):
+        """
+        stores tree under key, then evicts the stale and least recently used entries. trees which cannot be pickled
+        (e.g. built with locally defined custom classes) are not stored.
+        """
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+        fd, temporary = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                fp.write((self.signature + '\n').encode('ascii'))
+                pickle.dump(tree, fp, pickle.HIGHEST_PROTOCOL)
+            getattr(os, 'replace', os.rename)(temporary, self._path(key))
+        except (pickle.PicklingError, AttributeError, TypeError):
+            self._remove(temporary)
+            return
+        except:
+            self._remove(temporary)
+            raise
+        self.evict()
+
+    def evict(self):
+        """
+        removes the entries written with another signature, then the least recently used ones until the size of the
+        cache is lower than max_size. the most recent entry is always kept.
+        """
+        prefix = self.signature[:16] + '-'
+        entries = list()
+        for name in os.listdir(self.directory):
+            if not name.endswith(_cache_suffix):
+                continue
+            path = os.path.join(self.directory, name)
+            if not name.startswith(prefix):
+                self._remove(path)
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort(reverse=True)
+        size = 0
+        for i, (_, entry_size, path) in enumerate(entries):
+            size += entry_size
+            if i and size > self.max_size:
+                self._remove(path)
+
+    def _path(self, key):
+        return os.path.join(self.directory, self.signature[:16] + '-' + key + _cache_suffix)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
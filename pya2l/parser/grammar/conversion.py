@@ -0,0 +1,382 @@
+"""
+@project: parser
+@file: conversion.py
+@author: Guillaume Sottas
+@date: 18.10.2026
+"""
+
+import bisect
+
+from .formula import A2lFormula
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_nan = float('nan')
+
+
+def _apply(function, values):
+    if isinstance(values, str) or not hasattr(values, '__iter__'):
+        return function(values)
+    return [function(v) for v in values]
+
+
+def _scalar(result):
+    """
+    returns the value of result if it is a 0-d array (the conversion of a single value).
+    """
+    if isinstance(result, numpy.ndarray) and result.ndim == 0:
+        return result[()]
+    return result
+
+
+def _sort_pairs(keys, values):
+    """
+    returns keys and values sorted by key (the first of the equal keys first).
+    """
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    return [keys[i] for i in order], [values[i] for i in order]
+
+
+class A2lConverter(object):
+    """
+    conversion of the values of a COMPU_METHOD, from raw (ECU internal) to physical values and back.
+
+    to_physical and to_raw accept a single value or a sequence of values. if NumPy is installed, they are computed on
+    arrays at once and returned as a NumPy array (or scalar), the numeric values being converted to float64. otherwise,
+    they are computed one by one and returned as a list (or single value).
+    """
+    _raw_type = float
+    _physical_type = float
+
+    def to_physical(self, values):
+        if numpy is None:
+            return _apply(self.value_to_physical, values)
+        return _scalar(self.array_to_physical(numpy.asarray(values, dtype=self._raw_type)))
+
+    def to_raw(self, values):
+        if numpy is None:
+            return _apply(self.value_to_raw, values)
+        return _scalar(self.array_to_raw(numpy.asarray(values, dtype=self._physical_type)))
+
+    def value_to_physical(self, value):
+        raise NotImplementedError()
+
+    def value_to_raw(self, value):
+        raise NotImplementedError()
+
+    def array_to_physical(self, values):
+        raise NotImplementedError()
+
+    def array_to_raw(self, values):
+        raise NotImplementedError()
+
+
+class A2lIdenticalConverter(A2lConverter):
+    """
+    IDENTICAL conversion (and NO_COMPU_METHOD).
+    """
+
+    def value_to_physical(self, value):
+        return value
+
+    value_to_raw = value_to_physical
+
+    def array_to_physical(self, values):
+        return values.copy()
+
+    array_to_raw = array_to_physical
+
+
+class _A2lFraction(object):
+    """
+    function x -> (n1 * x + n0) / (d1 * x + d0), evaluated as x * scale + offset when d1 is 0.
+    """
+    __slots__ = 'n1', 'n0', 'd1', 'd0', 'scale', 'offset'
+
+    def __init__(self, n1, n0, d1, d0):
+        if d1 == 0 and d0 == 0:
+            raise ValueError('the denominator of the conversion is 0')
+        self.n1, self.n0, self.d1, self.d0 = n1, n0, d1, d0
+        self.scale = None if d1 else float(n1) / d0
+        self.offset = None if d1 else float(n0) / d0
+
+    def __call__(self, x):
+        if self.scale is not None:
+            return x * self.scale + self.offset
+        return (self.n1 * x + self.n0) / (self.d1 * x + self.d0)
+
+
+class A2lRationalConverter(A2lConverter):
+    """
+    RAT_FUNC conversion: raw = (a * phys^2 + b * phys + c) / (d * phys^2 + e * phys + f). only the functions for which a
+    and d are 0 can be inverted, to_physical raises a NotImplementedError otherwise.
+    """
+
+    def __init__(self, a, b, c, d, e, f):
+        self.coeffs = a, b, c, d, e, f
+        linear = a == 0 and d == 0
+        self._to_raw = _A2lFraction(b, c, e, f) if linear else None
+        self._to_physical = _A2lFraction(-f, c, e, -b) if linear and (e or b) else None
+
+    def _quadratic_to_raw(self, value):
+        a, b, c, d, e, f = self.coeffs
+        return ((a * value + b) * value + c) / ((d * value + e) * value + f)
+
+    def value_to_physical(self, value):
+        if self._to_physical is None:
+            raise NotImplementedError('the inverse of a quadratic or constant rational function is not supported')
+        return self._to_physical(value)
+
+    def value_to_raw(self, value):
+        if self._to_raw is None:
+            return self._quadratic_to_raw(value)
+        return self._to_raw(value)
+
+    array_to_physical = value_to_physical
+    array_to_raw = value_to_raw
+
+
+def _linear_converter(a, b):
+    """
+    LINEAR conversion: phys = a * raw + b, which is the rational function raw = (phys - b) / a.
+    """
+    return A2lRationalConverter(0, 1, -b, 0, 0, a)
+
+
+class A2lTableConverter(A2lConverter):
+    """
+    TAB_INTP and TAB_NOINTP conversions, defined by the (raw, physical) pairs of a COMPU_TAB.
+
+    with interpolation, the values are interpolated linearly between the pairs surrounding them, the values outside of
+    the table being clipped to its first or last pair. to_raw requires the physical values to be strictly monotonic.
+
+    without interpolation, the raw values which are not in the table are converted to default (nan if None) and the
+    physical ones to nan. the raw value of a physical value used several times is the smallest one.
+    """
+
+    def __init__(self, raw, physical, interpolate, default=None):
+        if not len(raw):
+            raise ValueError('the table of the conversion is empty')
+        self.raw, self.physical = _sort_pairs(list(raw), list(physical))
+        self.interpolate = interpolate
+        self.default = _nan if default is None else default
+        self._inverse = None
+        if interpolate:
+            steps = [b - a for a, b in zip(self.physical, self.physical[1:])]
+            if all(s > 0 for s in steps):
+                self._inverse = self.physical, self.raw
+            elif all(s < 0 for s in steps):
+                self._inverse = self.physical[::-1], self.raw[::-1]
+        else:
+            self._inverse = _sort_pairs(self.physical, self.raw)
+        if numpy is not None:
+            self._arrays = numpy.asarray(self.raw, dtype=float), numpy.asarray(self.physical, dtype=float)
+            if self._inverse is not None:
+                self._inverse_arrays = tuple(numpy.asarray(v, dtype=float) for v in self._inverse)
+
+    def _check_inverse(self):
+        if self._inverse is None:
+            raise ValueError('the physical values of the table are not monotonic, the conversion is not invertible')
+
+    def _interpolate(self, keys, values, value):
+        i = bisect.bisect_right(keys, value)
+        if i == 0:
+            return values[0]
+        if i == len(keys):
+            return values[-1]
+        k0, k1 = keys[i - 1], keys[i]
+        return values[i - 1] + (values[i] - values[i - 1]) * float(value - k0) / (k1 - k0)
+
+    @staticmethod
+    def _lookup(keys, values, value, default):
+        i = bisect.bisect_left(keys, value)
+        if i < len(keys) and keys[i] == value:
+            return values[i]
+        return default
+
+    @staticmethod
+    def _array_lookup(keys, values, x, default):
+        i = numpy.minimum(numpy.searchsorted(keys, x), len(keys) - 1)
+        return numpy.where(keys[i] == x, values[i], default)
+
+    def value_to_physical(self, value):
+        if self.interpolate:
+            return self._interpolate(self.raw, self.physical, value)
+        return self._lookup(self.raw, self.physical, value, self.default)
+
+    def value_to_raw(self, value):
+        self._check_inverse()
+        if self.interpolate:
+            return self._interpolate(self._inverse[0], self._inverse[1], value)
+        return self._lookup(self._inverse[0], self._inverse[1], value, _nan)
+
+    def array_to_physical(self, values):
+        if self.interpolate:
+            return numpy.interp(values, *self._arrays)
+        return self._array_lookup(self._arrays[0], self._arrays[1], values, self.default)
+
+    def array_to_raw(self, values):
+        self._check_inverse()
+        if self.interpolate:
+            return numpy.interp(values, *self._inverse_arrays)
+        return self._array_lookup(self._inverse_arrays[0], self._inverse_arrays[1], values, _nan)
+
+
+class A2lVerbalConverter(A2lConverter):
+    """
+    TAB_VERB conversion defined by a COMPU_VTAB (a value for each text) or a COMPU_VTAB_RANGE (a range of values for
+    each text, the bounds being included). the physical values are the texts, the raw values which are not in the table
+    are converted to default. to_raw returns the (first) value (or lower bound) of each text, nan if it is unknown.
+    """
+    _physical_type = object
+
+    def __init__(self, minimums, maximums, texts, default=None):
+        order = sorted(range(len(minimums)), key=minimums.__getitem__)
+        self.minimums = [minimums[i] for i in order]
+        self.maximums = [maximums[i] for i in order]
+        self.texts = [texts[i] for i in order]
+        self.default = default
+        self._raw_values = dict((texts[i], minimums[i]) for i in reversed(range(len(texts))))
+        if numpy is not None:
+            self._arrays = numpy.asarray(self.minimums, dtype=float), numpy.asarray(self.maximums, dtype=float)
+            self._texts = numpy.asarray(self.texts + [default], dtype=object)
+            self._text_keys = numpy.asarray(sorted(self._raw_values), dtype=object)
+            self._text_values = numpy.asarray([self._raw_values[k] for k in self._text_keys], dtype=float)
+
+    def value_to_physical(self, value):
+        i = bisect.bisect_right(self.minimums, value) - 1
+        if i >= 0 and value <= self.maximums[i]:
+            return self.texts[i]
+        return self.default
+
+    def value_to_raw(self, value):
+        return self._raw_values.get(value, _nan)
+
+    def array_to_physical(self, values):
+        minimums, maximums = self._arrays
+        if not len(minimums):
+            return numpy.full(values.shape, self.default, dtype=object)
+        i = numpy.searchsorted(minimums, values, side='right') - 1
+        found = (i >= 0) & (values <= maximums[numpy.maximum(i, 0)])
+        return self._texts[numpy.where(found, i, len(self.texts))]
+
+    def array_to_raw(self, values):
+        keys = self._text_keys
+        if not len(keys):
+            return numpy.full(values.shape, _nan)
+        i = numpy.minimum(numpy.searchsorted(keys, values), len(keys) - 1)
+        return numpy.where(keys[i] == values, self._text_values[i], _nan)
+
+
+class A2lFormulaConverter(A2lConverter):
+    """
+    FORM conversion, defined by the formula computing the physical value of X1 (the raw value) and optionally the
+    inverse formula (see formula.A2lFormula). to_raw raises a NotImplementedError if there is no inverse formula.
+    """
+
+    def __init__(self, formula, inverse=None):
+        for f in (formula, inverse):
+            if f is not None and len(f.variables) > 1:
+                raise ValueError('the formula "{0}" of a conversion has more than one variable'.format(f.text))
+        self.formula = formula
+        self.inverse = inverse
+
+    @staticmethod
+    def _evaluate(formula, value):
+        return formula(*(value,)[:len(formula.variables)])
+
+    @staticmethod
+    def _evaluate_array(formula, values):
+        result = formula.evaluate(*(values,)[:len(formula.variables)])
+        return result if result.shape == values.shape else numpy.broadcast_to(result, values.shape).copy()
+
+    def _check_inverse(self):
+        if self.inverse is None:
+            raise NotImplementedError('the conversion has no inverse formula')
+
+    def value_to_physical(self, value):
+        return self._evaluate(self.formula, value)
+
+    def value_to_raw(self, value):
+        self._check_inverse()
+        return self._evaluate(self.inverse, value)
+
+    def array_to_physical(self, values):
+        return self._evaluate_array(self.formula, values)
+
+    def array_to_raw(self, values):
+        self._check_inverse()
+        return self._evaluate_array(self.inverse, values)
+
+
+def _compu_tab_converter(compu_method, module):
+    compu_tab = module.resolve(compu_method, 'compu_tab_ref')
+    if compu_tab is None or compu_tab.node() != 'COMPU_TAB':
+        raise ValueError('COMPU_TAB {0} of {1} not found'.format(compu_method.compu_tab_ref, compu_method.name))
+    values = compu_tab.in_val_out_val or []
+    return A2lTableConverter(values[0::2], values[1::2], compu_method.conversion_type == 'TAB_INTP',
+                             compu_tab.default_value_numeric)
+
+
+def _compu_vtab_converter(compu_method, module):
+    compu_vtab = module.resolve(compu_method, 'compu_tab_ref')
+    if compu_vtab is None or compu_vtab.node() not in ('COMPU_VTAB', 'COMPU_VTAB_RANGE'):
+        raise ValueError('COMPU_VTAB {0} of {1} not found'.format(compu_method.compu_tab_ref, compu_method.name))
+    if compu_vtab.node() == 'COMPU_VTAB':
+        pairs = compu_vtab.compu_vtab_in_val_out_val or []
+        return A2lVerbalConverter([p[0] for p in pairs], [p[0] for p in pairs], [p[1] for p in pairs],
+                                  compu_vtab.default_value)
+    triples = compu_vtab.compu_vtab_range_in_val_out_val or []
+    return A2lVerbalConverter([t[0] for t in triples], [t[1] for t in triples], [t[2] for t in triples],
+                              compu_vtab.default_value)
+
+
+def _coeffs_converter(compu_method, module):
+    if compu_method.coeffs is None:
+        raise ValueError('COEFFS of {0} not found'.format(compu_method.name))
+    c = compu_method.coeffs
+    return A2lRationalConverter(c.a, c.b, c.c, c.d, c.e, c.f)
+
+
+def _coeffs_linear_converter(compu_method, module):
+    if compu_method.coeffs_linear is None:
+        raise ValueError('COEFFS_LINEAR of {0} not found'.format(compu_method.name))
+    return _linear_converter(compu_method.coeffs_linear.a, compu_method.coeffs_linear.b)
+
+
+def _form_converter(compu_method, module):
+    if compu_method.formula is None:
+        raise ValueError('FORMULA of {0} not found'.format(compu_method.name))
+    system_constants = dict()
+    if module.mod_par is not None:
+        for system_constant in reversed(module.mod_par.system_constant):
+            system_constants[system_constant.name] = system_constant.value
+    formula = compu_method.formula
+    inverse = None if formula.formula_inv is None else A2lFormula(formula.formula_inv, system_constants)
+    return A2lFormulaConverter(A2lFormula(formula.f, system_constants), inverse)
+
+
+# functions returning the converter of a COMPU_METHOD of the module, for each conversion type.
+converter_factories = {'IDENTICAL': lambda compu_method, module: A2lIdenticalConverter(),
+                       'FORM': _form_converter,
+                       'LINEAR': _coeffs_linear_converter,
+                       'RAT_FUNC': _coeffs_converter,
+                       'TAB_INTP': _compu_tab_converter,
+                       'TAB_NOINTP': _compu_tab_converter,
+                       'TAB_VERB': _compu_vtab_converter}
+
+
+def a2l_converter(compu_method, module):
+    """
+    returns the converter of compu_method (a COMPU_METHOD of module, or None for NO_COMPU_METHOD).
+    """
+    if compu_method is None:
+        return A2lIdenticalConverter()
+    try:
+        factory = converter_factories[compu_method.conversion_type]
+    except KeyError:
+        raise ValueError('unknown conversion type {0}'.format(compu_method.conversion_type))
+    return factory(compu_method, module)
@@ -0,0 +1,130 @@
+"""
+@project: parser
+@file: encoder.py
+@author: Guillaume Sottas
+@date: 18.10.2026
+"""
+
+import array
+import json
+
+from .node import A2lNode
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_constants = {None: 'null', True: 'true', False: 'false'}
+
+
+class A2lJsonEncoder(object):
+    """
+    writes the JSON representation of an A2lNode tree (as returned by A2lNode.get_json) to a file object, walking the
+    tree instead of building the whole dictionary first. the output is the same as the one of json.dump called with the
+    same indent, sort_keys and ensure_ascii arguments. the text is written by chunks of about chunk_size characters.
+    """
+
+    def __init__(self, fp, indent=None, sort_keys=False, ensure_ascii=True, chunk_size=DEFAULT_CHUNK_SIZE):
+        self._fp = fp
+        self._indent = ' ' * indent if isinstance(indent, int) else indent
+        self._sort_keys = sort_keys
+        self._encode_string = json.encoder.encode_basestring_ascii if ensure_ascii else json.encoder.encode_basestring
+        self._float_encoder = json.JSONEncoder(ensure_ascii=ensure_ascii)
+        self._chunk_size = chunk_size
+        self._buffer = list()
+        self._buffer_size = 0
+        self._levels = list()
+        self._items_cache = dict()
+
+    def encode(self, value):
+        self._value(value, 0)
+        self._flush()
+
+    def _write(self, string):
+        self._buffer.append(string)
+        self._buffer_size += len(string)
+        if self._buffer_size >= self._chunk_size:
+            self._flush()
+
+    def _flush(self):
+        if self._buffer:
+            self._fp.write(''.join(self._buffer))
+            self._buffer = list()
+            self._buffer_size = 0
+
+    def _node_properties(self, node):
+        """
+        returns the keys of the dictionary returned by node.get_json, in the order they are written.
+        """
+        properties = list()
+        for p in ['node'] + list(node.properties):
+            if p not in properties:
+                properties.append(p)
+        return sorted(properties) if self._sort_keys else properties
+
+    def _separators(self, level):
+        while len(self._levels) <= level:
+            n = len(self._levels)
+            if self._indent is None:
+                self._levels.append(('', ', ', ''))
+            else:
+                self._levels.append(('\n' + self._indent * (n + 1), ',\n' + self._indent * (n + 1),
+                                     '\n' + self._indent * n))
+        return self._levels[level]
+
+    def _node_items(self, node, level):
+        """
+        returns the (attribute, text preceding its value) pairs of node at level, and the text closing the node.
+        """
+        key = type(node), level
+        try:
+            return self._items_cache[key]
+        except KeyError:
+            first, separator, last = self._separators(level)
+            items = list()
+            for i, p in enumerate(self._node_properties(node)):
+                items.append((p, ('{' + first if i == 0 else separator) + self._encode_string(p) + ': '))
+            self._items_cache[key] = items, last + '}'
+            return self._items_cache[key]
+
+    def _value(self, value, level):
+        if isinstance(value, A2lNode):
+            items, end = self._node_items(value, level)
+            for p, prefix in items:
+                self._write(prefix)
+                self._value(value.node() if p == 'node' else getattr(value, p), level + 1)
+            self._write(end)
+        elif isinstance(value, str):
+            self._write(self._encode_string(value))
+        elif value is None or value is True or value is False:
+            self._write(_constants[value])
+        elif isinstance(value, int):
+            self._write(int.__repr__(value))
+        elif isinstance(value, (list, tuple, array.array)):
+            if not value:
+                return self._write('[]')
+            first, separator, last = self._separators(level)
+            self._write('[' + first)
+            for i, element in enumerate(value):
+                if i:
+                    self._write(separator)
+                self._value(element, level + 1)
+            self._write(last + ']')
+        elif isinstance(value, dict):
+            if not value:
+                return self._write('{}')
+            first, separator, last = self._separators(level)
+            self._write('{' + first)
+            for i, (k, v) in enumerate(sorted(value.items()) if self._sort_keys else value.items()):
+                if i:
+                    self._write(separator)
+                self._write(self._encode_string(k) + ': ')
+                self._value(v, level + 1)
+            self._write(last + '}')
+        else:
+            self._write(self._float_encoder.encode(value))
+
+
+def dump(node, fp, indent=None, sort_keys=False, ensure_ascii=True, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    writes the JSON representation of node to the file object fp, see A2lJsonEncoder.
+    """
+    A2lJsonEncoder(fp, indent, sort_keys, ensure_ascii, chunk_size).encode(node)
@@ -0,0 +1,119 @@
+"""
+@project: parser
+@file: fast_lexer.py
+@author: Guillaume Sottas
+@date: 18.10.2026
+"""
+
+import functools
+import re
+
+from .lexer import keywords
+
+# same rules as the master pattern built by PLY from lexer.py, producing the same matches:
+# - the white spaces preceding a token are consumed with it instead of being skipped character by character,
+# - the most frequent rules come first, which does not change the result as they start with distinct characters,
+# - the numeric rule is split in groups reproducing the result of the int(..., 10), int(..., 16), float(...)
+#   conversion chain of t_NUMERIC (e.g. 1e5 is an hexadecimal number),
+# - any other character is reported as an error.
+_scanner_re = re.compile(r'''[ \t\r\n]*(?:
+    (?P<IDENT>[A-Za-z_][A-Za-z0-9_.\[\]]*)
+    |(?P<PUNCTUATION>[(){}\[\]*=,;])
+    |"(?P<STRING>[^"\\]*(?:\\.[^"\\]*)*)"
+    |(?P<INT>[+-]?\d+(?![.eExX\d]))
+    |(?P<begin>/begin)
+    |(?P<end>/end)
+    |(?P<ignore>/\*[\s\S]*?\*/|//.+\n|\Z)
+    |(?P<HEX>[+-]?0[Xx][A-Fa-f0-9]+|[+-]?\d+[eE]\d+)
+    |(?P<FLOAT>[+-]?\d+(?:\.\d*(?:[eE][+-]?\d+)?|[eE][+-]?\d+))
+    |(?P<DEC>[+-]?\d+)
+    |(?P<error>[^ \t\r\n]))''', re.VERBOSE)
+
+_punctuation = {'(': 'PARENTHESE_OPEN',
+                ')': 'PARENTHESE_CLOSE',
+                '{': 'CURLY_OPEN',
+                '}': 'CURLY_CLOSE',
+                '[': 'BRACE_OPEN',
+                ']': 'BRACE_CLOSE',
+                '*': 'ASTERISK',
+                '=': 'EQUAL',
+                ',': 'COMMA',
+                ';': 'SEMICOLON'}
+
+
+class A2lToken(object):
+    """
+    lightweight equivalent of ply.lex.LexToken.
+    """
+    __slots__ = 'type', 'value', 'lineno', 'lexpos', 'lexer'
+
+    def __init__(self, token_type, value, lexpos):
+        self.type = token_type
+        self.value = value
+        self.lineno = 1
+        self.lexpos = lexpos
+
+    def __str__(self):
+        return 'LexToken(%s,%r,%d,%d)' % (self.type, self.value, self.lineno, self.lexpos)
+
+    def __repr__(self):
+        return str(self)
+
+
+class A2lFastLexer(object):
+    """
+    tokenizer producing the same token stream as the PLY lexer defined in lexer.py, using a single scanner pattern whose
+    groups classify the tokens, without exception handling on the hot path.
+
+    it implements the subset of the ply.lex.Lexer interface used by the parser (input, token, clone and lexdata).
+    """
+
+    def __init__(self):
+        self.lexdata = ''
+        self.lineno = 1
+        self.token = lambda: None
+
+    def clone(self):
+        return A2lFastLexer()
+
+    def input(self, string):
+        self.lexdata = string
+        self.seek(0)
+
+    def seek(self, position):
+        """
+        resumes the tokenizing at position.
+        """
+        self.token = functools.partial(next, self._tokens(self.lexdata, position), None)
+
+    @staticmethod
+    def _tokens(string, position=0):
+        get_keyword = keywords.get
+        for match in _scanner_re.finditer(string, position):
+            kind = match.lastgroup
+            if kind == 'IDENT':
+                value = match.group(kind)
+                if '[' in value:
+                    yield A2lToken(get_keyword(value.split('[')[0], kind), value, match.start(kind))
+                else:
+                    yield A2lToken(get_keyword(value, kind), value, match.start(kind))
+            elif kind == 'PUNCTUATION':
+                value = match.group(kind)
+                yield A2lToken(_punctuation[value], value, match.start(kind))
+            elif kind == 'STRING':
+                yield A2lToken(kind, match.group(kind), match.start(kind) - 1)
+            elif kind == 'INT' or kind == 'DEC':
+                yield A2lToken('NUMERIC', int(match.group(kind), 10), match.start(kind))
+            elif kind == 'ignore':
+                continue
+            elif kind == 'HEX':
+                yield A2lToken('NUMERIC', int(match.group(kind), 16), match.start(kind))
+            elif kind == 'FLOAT':
+                yield A2lToken('NUMERIC', float(match.group(kind)), match.start(kind))
+            elif kind == 'error':
+                print('invalid character at line 1, position ' + str(match.start(kind)))
+            else:
+                yield A2lToken(kind, match.group(kind), match.start(kind))
+
+
+lexer = A2lFastLexer()
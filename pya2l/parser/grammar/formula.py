@@ -0,0 +1,245 @@
+"""
+@project: parser
+@file: formula.py
+@author: Guillaume Sottas
+@date: 18.10.2026
+"""
+
+import __future__
+import math
+import re
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_token_re = re.compile(r'\s*(?:(?P<number>0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)'
+                       r'|(?P<name>[A-Za-z_][A-Za-z0-9_.\[\]]*)|(?P<string>"[^"]*")'
+                       r'|(?P<operator>&&|\|\||<<|>>|<=|>=|==|!=|[-+*/&|^~!<>(),]))')
+
+_variable_re = re.compile(r'[xX]([1-9][0-9]*)?$')
+
+# precedence and python expression template of the binary operators (C precedence, from the lowest).
+_binary_operators = {'||': (1, '_logical_or({0}, {1})'),
+                     '&&': (2, '_logical_and({0}, {1})'),
+                     '|': (3, '_bitwise_or({0}, {1})'),
+                     '^': (4, '_bitwise_xor({0}, {1})'),
+                     '&': (5, '_bitwise_and({0}, {1})'),
+                     '==': (6, '(({0} == {1}) * 1.0)'),
+                     '!=': (6, '(({0} != {1}) * 1.0)'),
+                     '<': (7, '(({0} < {1}) * 1.0)'),
+                     '<=': (7, '(({0} <= {1}) * 1.0)'),
+                     '>': (7, '(({0} > {1}) * 1.0)'),
+                     '>=': (7, '(({0} >= {1}) * 1.0)'),
+                     '<<': (8, '_left_shift({0}, {1})'),
+                     '>>': (8, '_right_shift({0}, {1})'),
+                     '+': (9, '({0} + {1})'),
+                     '-': (9, '({0} - {1})'),
+                     '*': (10, '({0} * {1})'),
+                     '/': (10, '({0} / {1})')}
+
+_unary_operators = {'-': '(-{0})',
+                    '+': '(+{0})',
+                    '!': '_logical_not({0})',
+                    '~': '_bitwise_not({0})'}
+
+# number of arguments of the functions of the formulas.
+_functions = {'abs': 1, 'acos': 1, 'asin': 1, 'atan': 1, 'cos': 1, 'cosh': 1, 'exp': 1, 'log': 1, 'log10': 1,
+              'pow': 2, 'sin': 1, 'sinh': 1, 'sqrt': 1, 'tan': 1, 'tanh': 1}
+
+_scalar_namespace = {'__builtins__': {},
+                     '_logical_or': lambda a, b: float(bool(a) or bool(b)),
+                     '_logical_and': lambda a, b: float(bool(a) and bool(b)),
+                     '_logical_not': lambda a: float(not a),
+                     '_bitwise_or': lambda a, b: float(int(a) | int(b)),
+                     '_bitwise_xor': lambda a, b: float(int(a) ^ int(b)),
+                     '_bitwise_and': lambda a, b: float(int(a) & int(b)),
+                     '_bitwise_not': lambda a: float(~int(a)),
+                     '_left_shift': lambda a, b: float(int(a) << int(b)),
+                     '_right_shift': lambda a, b: float(int(a) >> int(b)),
+                     'abs': abs,
+                     'pow': math.pow}
+_scalar_namespace.update((f, getattr(math, f)) for f in _functions if f not in _scalar_namespace)
+
+if numpy is not None:
+    def _integers(x):
+        return numpy.asarray(x).astype(numpy.int64)
+
+    _array_namespace = {'__builtins__': {},
+                        '_logical_or': lambda a, b: numpy.logical_or(a, b) * 1.0,
+                        '_logical_and': lambda a, b: numpy.logical_and(a, b) * 1.0,
+                        '_logical_not': lambda a: numpy.logical_not(a) * 1.0,
+                        '_bitwise_or': lambda a, b: (_integers(a) | _integers(b)) * 1.0,
+                        '_bitwise_xor': lambda a, b: (_integers(a) ^ _integers(b)) * 1.0,
+                        '_bitwise_and': lambda a, b: (_integers(a) & _integers(b)) * 1.0,
+                        '_bitwise_not': lambda a: ~_integers(a) * 1.0,
+                        '_left_shift': lambda a, b: (_integers(a) << _integers(b)) * 1.0,
+                        '_right_shift': lambda a, b: (_integers(a) >> _integers(b)) * 1.0,
+                        'abs': numpy.abs,
+                        'acos': numpy.arccos,
+                        'asin': numpy.arcsin,
+                        'atan': numpy.arctan,
+                        'pow': numpy.power}
+    _array_namespace.update((f, getattr(numpy, f)) for f in _functions if f not in _array_namespace)
+else:
+    _array_namespace = None
+
+
+class A2lFormulaException(ValueError):
+    pass
+
+
+def system_constant_value(value):
+    """
+    returns the number of value (the value of a SYSTEM_CONSTANT), or raises a ValueError if it is not a number.
+    """
+    try:
+        return float(value)
+    except ValueError:
+        return float(int(value.strip(), 0))
+
+
+class _A2lFormulaParser(object):
+    """
+    recursive descent parser translating a formula into a python expression built from numbers, variables (X1 to Xn),
+    the known functions and the operators of _binary_operators and _unary_operators only.
+    """
+
+    def __init__(self, text, system_constants):
+        self.text = text
+        self.system_constants = system_constants
+        self.tokens = list()
+        self.position = 0
+        self.variables = set()
+        end = len(text.rstrip())
+        position = 0
+        while position < end:
+            match = _token_re.match(text, position)
+            if match is None or match.end() == position:
+                raise A2lFormulaException('invalid character at {0} in formula "{1}"'.format(position, text))
+            self.tokens.append((match.lastgroup, match.group(match.lastgroup)))
+            position = match.end()
+
+    def error(self, message):
+        raise A2lFormulaException('{0} in formula "{1}"'.format(message, self.text))
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def next(self):
+        token = self.peek()
+        if token[0] is None:
+            self.error('unexpected end')
+        self.position += 1
+        return token
+
+    def expect(self, operator):
+        if self.next() != ('operator', operator):
+            self.error('"{0}" expected'.format(operator))
+
+    def parse(self):
+        source = self.expression(1)
+        if self.peek()[0] is not None:
+            self.error('unexpected "{0}"'.format(self.peek()[1]))
+        return source
+
+    def expression(self, precedence):
+        source = self.unary()
+        while True:
+            kind, value = self.peek()
+            if kind != 'operator' or value not in _binary_operators:
+                return source
+            operator_precedence, template = _binary_operators[value]
+            if operator_precedence < precedence:
+                return source
+            self.position += 1
+            source = template.format(source, self.expression(operator_precedence + 1))
+
+    def unary(self):
+        kind, value = self.peek()
+        if kind == 'operator' and value in _unary_operators:
+            self.position += 1
+            return _unary_operators[value].format(self.unary())
+        return self.primary()
+
+    def primary(self):
+        kind, value = self.next()
+        if kind == 'number':
+            return repr(float(int(value, 16) if value[:2] in ('0x', '0X') else float(value)))
+        if kind == 'operator' and value == '(':
+            source = self.expression(1)
+            self.expect(')')
+            return source
+        if kind != 'name':
+            self.error('unexpected "{0}"'.format(value))
+        match = _variable_re.match(value)
+        if match is not None:
+            index = int(match.group(1) or 1)
+            self.variables.add(index)
+            return 'X{0}'.format(index)
+        function = value.lower()
+        if function == 'sysc':
+            return self.system_constant()
+        if function not in _functions:
+            self.error('unknown identifier "{0}"'.format(value))
+        self.expect('(')
+        arguments = [self.expression(1)]
+        while self.peek() == ('operator', ','):
+            self.position += 1
+            arguments.append(self.expression(1))
+        self.expect(')')
+        if len(arguments) != _functions[function]:
+            self.error('{0} takes {1} argument(s)'.format(function, _functions[function]))
+        return '{0}({1})'.format(function, ', '.join(arguments))
+
+    def system_constant(self):
+        self.expect('(')
+        kind, name = self.next()
+        if kind == 'string':
+            name = name[1:-1]
+        elif kind != 'name':
+            self.error('system constant name expected')
+        self.expect(')')
+        try:
+            value = self.system_constants[name]
+        except KeyError:
+            self.error('unknown system constant "{0}"'.format(name))
+        try:
+            return repr(system_constant_value(value))
+        except (ValueError, TypeError, AttributeError):
+            self.error('system constant "{0}" is not a number'.format(name))
+
+
+class A2lFormula(object):
+    """
+    formula of the ASAM MCD-2 MC syntax (e.g. "X1 * 0.1 + sysc(offset)"), parsed once and compiled to a python function
+    of its variables X1 to Xn (X being X1). system_constants is the name to value dictionary of the SYSTEM_CONSTANT
+    nodes, the sysc references being replaced by their value at compilation. an A2lFormulaException is raised if the
+    formula is invalid.
+
+    calling the formula evaluates it for numbers. if NumPy is installed, evaluate evaluates it for arrays of values at
+    once, following the NumPy semantics (e.g. a division by 0 returns inf or nan instead of raising an exception).
+    """
+    __slots__ = 'text', 'source', 'variables', '_function', '_array_function'
+
+    def __init__(self, text, system_constants=None):
+        parser = _A2lFormulaParser(text, system_constants or dict())
+        self.text = text
+        self.source = parser.parse()
+        self.variables = tuple('X{0}'.format(i) for i in range(1, max(parser.variables or [0]) + 1))
+        code = compile('lambda {0}: {1}'.format(', '.join(self.variables), self.source), '<formula>', 'eval',
+                       __future__.division.compiler_flag, True)
+        self._function = eval(code, _scalar_namespace)
+        self._array_function = None if _array_namespace is None else eval(code, _array_namespace)
+
+    def __call__(self, *values):
+        return self._function(*values)
+
+    def evaluate(self, *arrays):
+        """
+        returns the array of the values of the formula for the arrays of values of its variables (a 0-d array if the
+        formula has no variable).
+        """
+        with numpy.errstate(all='ignore'):
+            return numpy.asarray(self._array_function(*arrays), dtype=float)
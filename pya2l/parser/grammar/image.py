@@ -0,0 +1,413 @@
+"""
+@project: parser
+@file: image.py
+@author: Guillaume Sottas
+@date: 18.10.2026
+"""
+
+import binascii
+import bisect
+import mmap
+import os
+
+from .layout import A2lLayoutPlan
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_byte_orders = {'MSB_FIRST': '>', 'MSB_LAST': '<'}
+
+# number of axes of the characteristic types.
+_dimensions = {'CURVE': 1, 'MAP': 2, 'CUBOID': 3}
+
+_hex_extensions = ('.hex', '.ihex', '.ihx')
+_srec_extensions = ('.s19', '.s28', '.s37', '.srec', '.mot')
+_srec_address_lengths = {b'1': 2, b'2': 3, b'3': 4}
+
+
+class A2lImageException(ValueError):
+    pass
+
+
+def _hex_records(lines, path):
+    """
+    yields the (address, data) records of the lines of an Intel HEX file.
+    """
+    base = 0
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            if line[:1] != b':':
+                raise ValueError()
+            record = bytearray(binascii.unhexlify(line[1:]))
+        except (ValueError, TypeError):
+            record = None
+        if record is None or len(record) < 5 or len(record) != record[0] + 5 or sum(record) & 0xFF or \
+                (record[3] in (2, 4) and record[0] != 2):
+            raise A2lImageException('{0}:{1}: invalid Intel HEX record'.format(path, number))
+        kind = record[3]
+        if kind == 0:
+            yield base + (record[1] << 8 | record[2]), record[4:-1]
+        elif kind == 1:
+            return
+        elif kind == 2:
+            base = (record[4] << 8 | record[5]) << 4
+        elif kind == 4:
+            base = (record[4] << 8 | record[5]) << 16
+
+
+def _srec_records(lines, path):
+    """
+    yields the (address, data) records of the lines of a Motorola S-record file.
+    """
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        kind = line[1:2]
+        try:
+            if line[:1] not in (b'S', b's'):
+                raise ValueError()
+            record = bytearray(binascii.unhexlify(line[2:]))
+        except (ValueError, TypeError):
+            record = None
+        if not record or len(record) != record[0] + 1 or sum(record) & 0xFF != 0xFF:
+            raise A2lImageException('{0}:{1}: invalid S-record'.format(path, number))
+        length = _srec_address_lengths.get(kind)
+        if length is not None:
+            address = 0
+            for byte in record[1:1 + length]:
+                address = address << 8 | byte
+            yield address, record[1 + length:-1]
+        elif kind in (b'7', b'8', b'9'):
+            return
+
+
+def _merge_segments(records):
+    """
+    returns the (address, bytearray) segments of the (address, data) records, the contiguous records being merged.
+    where records overlap, the data of the one starting at the highest address is kept.
+    """
+    segments = list()
+    start, data = None, None
+    for address, record in records:
+        if data is not None and address == start + len(data):
+            data.extend(record)
+            continue
+        if data is not None:
+            segments.append((start, data))
+        start, data = address, bytearray(record)
+    if data is not None:
+        segments.append((start, data))
+    segments.sort(key=lambda s: s[0])
+    merged = list()
+    for start, data in segments:
+        if merged and start <= merged[-1][0] + len(merged[-1][1]):
+            offset = start - merged[-1][0]
+            merged[-1][1][offset:offset + len(data)] = data
+        else:
+            merged.append((start, data))
+    return merged
+
+
+class A2lImage(object):
+    """
+    memory image of an ECU, made of (address, buffer) segments which do not overlap. the buffers are the bytearrays
+    decoded from an Intel HEX or S-record file, or the memory map of a binary file.
+    """
+
+    def __init__(self, segments, closing=()):
+        self.segments = sorted(segments, key=lambda s: s[0])
+        self._starts = [s[0] for s in self.segments]
+        self._closing = list(closing)
+
+    @classmethod
+    def from_file(cls, path, base_address=0):
+        """
+        returns the image of the file located at path: an Intel HEX (.hex), S-record (.s19, .s28, .s37, .srec or .mot)
+        or binary file (any other extension), mapped at base_address.
+        """
+        extension = os.path.splitext(path)[1].lower()
+        if extension in _hex_extensions:
+            return cls.from_hex(path)
+        if extension in _srec_extensions:
+            return cls.from_srec(path)
+        return cls.from_binary(path, base_address)
+
+    @classmethod
+    def from_hex(cls, path):
+        with open(path, 'rb') as fp:
+            return cls(_merge_segments(_hex_records(fp, path)))
+
+    @classmethod
+    def from_srec(cls, path):
+        with open(path, 'rb') as fp:
+            return cls(_merge_segments(_srec_records(fp, path)))
+
+    @classmethod
+    def from_binary(cls, path, base_address=0):
+        with open(path, 'rb') as fp:
+            if os.fstat(fp.fileno()).st_size == 0:
+                return cls(list())
+            data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls([(base_address, data)], closing=[data])
+
+    def close(self):
+        for closing in self._closing:
+            closing.close()
+        self._closing = list()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def locate(self, address, size):
+        """
+        returns the (buffer, offset) of the size bytes at address, or raises an A2lImageException if they are not all in
+        the image.
+        """
+        i = bisect.bisect_right(self._starts, address) - 1
+        if i >= 0:
+            start, data = self.segments[i]
+            offset = address - start
+            if offset + size <= len(data):
+                return data, offset
+        raise A2lImageException('0x{0:X}-0x{1:X} is not in the image'.format(address, address + size))
+
+    def read(self, address, size):
+        """
+        returns the size bytes at address.
+        """
+        data, offset = self.locate(address, size)
+        return bytes(data[offset:offset + size])
+
+
+class A2lCharacteristicValue(object):
+    """
+    value of a CHARACTERISTIC or an AXIS_PTS read from an image.
+
+    values is a number for a VALUE, a string for an ASCII and an array otherwise (a NumPy array if NumPy is installed,
+    nested lists if not), of shape (x,), (x, y) or (x, y, z) for a CURVE, a MAP or a CUBOID (the axis points for an
+    AXIS_PTS, the dimensions of MATRIX_DIM for a VAL_BLK). axes are the arrays of the points of the axes of the
+    characteristic, fields the dictionary of the other fields of its record layout (e.g. no_axis_pts_x).
+    """
+    __slots__ = 'name', 'values', 'axes', 'fields'
+
+    def __init__(self, name, values, axes, fields):
+        self.name = name
+        self.values = values
+        self.axes = axes
+        self.fields = fields
+
+
+def _product(numbers):
+    result = 1
+    for number in numbers:
+        result *= number
+    return result
+
+
+def _block_dimensions(characteristic):
+    """
+    returns the dimensions of the values of a VAL_BLK or an ASCII characteristic.
+    """
+    if characteristic.matrix_dim is not None:
+        dimensions = [d for d in characteristic.matrix_dim if d > 1]
+        return dimensions or [1]
+    return [characteristic.number or 1]
+
+
+def _shape(values, dimensions, row_dir):
+    """
+    returns the flat values stored in column (or row if row_dir is True) direction as an array of shape dimensions.
+    """
+    if numpy is not None:
+        return values.reshape(dimensions[::-1]).transpose() if row_dir else values.reshape(dimensions)
+    strides = [_product(dimensions[:i]) if row_dir else _product(dimensions[i + 1:]) for i in range(len(dimensions))]
+
+    def build(level, base):
+        if level == len(dimensions):
+            return values[base]
+        return [build(level + 1, base + i * strides[level]) for i in range(dimensions[level])]
+    return build(0, 0)
+
+
+def _array(values):
+    values = list(values)
+    return numpy.asarray(values, dtype=float) if numpy is not None else values
+
+
+def _fix_axis(axis_descr):
+    """
+    returns the points of a FIX_AXIS.
+    """
+    if axis_descr.fix_axis_par is not None:
+        p = axis_descr.fix_axis_par
+        return _array(p.offset + i * 2 ** p.shift for i in range(p.numberapo))
+    if axis_descr.fix_axis_par_dist is not None:
+        p = axis_descr.fix_axis_par_dist
+        return _array(p.offset + i * p.distance for i in range(p.numberapo))
+    if axis_descr.fix_axis_par_list is not None:
+        return _array(axis_descr.fix_axis_par_list)
+    raise ValueError('the FIX_AXIS of {0} has no parameters'.format(axis_descr.input_quantity))
+
+
+def _accumulate(values):
+    if numpy is not None:
+        return numpy.cumsum(values)
+    result, total = list(), 0
+    for value in values:
+        total += value
+        result.append(total)
+    return result
+
+
+class A2lImageReader(object):
+    """
+    decodes the values of the CHARACTERISTIC and AXIS_PTS nodes of module from image (an A2lImage), following their
+    RECORD_LAYOUT. the values are read in the byte order of the node, of the MOD_COMMON of module if not specified, or
+    byte_order otherwise. the fields are aligned as specified by the RECORD_LAYOUT, the MOD_COMMON, or to their size.
+
+    the record layouts are compiled to decode plans (see layout.A2lLayoutPlan) on first use, which are reused for all
+    the nodes using them. a new reader must be created if the record layouts are modified (the image can be replaced).
+
+    the RES_AXIS and CURVE_AXIS axes and the ALTERNATE index modes are not supported (a NotImplementedError is raised).
+    """
+
+    def __init__(self, module, image, byte_order='MSB_LAST'):
+        self.module = module
+        self.image = image
+        self.byte_order = getattr(module.mod_common, 'byte_order', None) or byte_order
+        self._plans = dict()
+
+    def _find(self, name):
+        node = self.module.get_index().find(('characteristic', 'axis_pts'), name)
+        if node is None:
+            raise ValueError('CHARACTERISTIC or AXIS_PTS {0} not found'.format(name))
+        return node
+
+    def _record_layout(self, node):
+        record_layout = self.module.resolve(node, 'deposit')
+        if record_layout is None:
+            raise ValueError('RECORD_LAYOUT {0} of {1} not found'.format(node.deposit, node.name))
+        return record_layout
+
+    def _plan(self, record_layout, single):
+        """
+        returns the A2lLayoutPlan of record_layout, compiled on first use.
+        """
+        try:
+            return self._plans[record_layout.name, single]
+        except KeyError:
+            plan = self._plans[record_layout.name, single] = A2lLayoutPlan(record_layout, self.module.mod_common,
+                                                                           single)
+            return plan
+
+    def read(self, node, physical=False):
+        """
+        returns the A2lCharacteristicValue of node (a CHARACTERISTIC or an AXIS_PTS, or its name). if physical is True,
+        the values and the points of the axes are converted to physical values (see Module.converter).
+        """
+        if not hasattr(node, 'node'):
+            node = self._find(node)
+        if node.node() == 'AXIS_PTS':
+            return self._read_axis_pts(node, physical)
+        return self._read_characteristic(node, physical)
+
+    def read_all(self, physical=False, errors='raise'):
+        """
+        returns the name to A2lCharacteristicValue dictionary of the characteristics of the module. if errors is
+        'ignore', the characteristics which cannot be read (e.g. not in the image) are skipped.
+        """
+        values = dict()
+        for characteristic in self.module.characteristic:
+            try:
+                values[characteristic.name] = self._read_characteristic(characteristic, physical)
+            except (ValueError, NotImplementedError):
+                if errors != 'ignore':
+                    raise
+        return values
+
+    def _read_axis_pts(self, axis_pts, physical):
+        record_layout = self._record_layout(axis_pts)
+        byte_order = _byte_orders[axis_pts.byte_order or self.byte_order]
+        fixed = record_layout.fix_no_axis_pts_x
+        counts = dict(x=fixed.number_of_axis_points if fixed is not None else axis_pts.max_axis_points)
+        fields = self._plan(record_layout, False).decode(self.image, axis_pts.address, byte_order, counts)
+        if 'axis_pts_x' not in fields:
+            raise ValueError('RECORD_LAYOUT {0} of {1} has no AXIS_PTS_X'.format(record_layout.name, axis_pts.name))
+        values = fields.pop('axis_pts_x')[:counts['x']]
+        if axis_pts.deposit_mode == 'DIFFERENCE':
+            values = _accumulate(values)
+        if physical:
+            values = self.module.converter(axis_pts.conversion).to_physical(values)
+        return A2lCharacteristicValue(axis_pts.name, values, list(), fields)
+
+    def _read_characteristic(self, characteristic, physical):
+        record_layout = self._record_layout(characteristic)
+        byte_order = _byte_orders[characteristic.byte_order or self.byte_order]
+        kind = characteristic.type
+        axes_descr = characteristic.axis_descr[:_dimensions.get(kind, 0)]
+        axes = [None] * len(axes_descr)
+        counts = dict()
+        for i, (axis, axis_descr) in enumerate(zip('xyz', axes_descr)):
+            if axis_descr.attribute == 'STD_AXIS':
+                fixed = getattr(record_layout, 'fix_no_axis_pts_' + axis)
+                counts[axis] = fixed.number_of_axis_points if fixed is not None else axis_descr.max_axis_points
+            elif axis_descr.attribute == 'COM_AXIS':
+                axis_pts = self.module.resolve(axis_descr, 'axis_pts_ref')
+                if axis_pts is None:
+                    raise ValueError('AXIS_PTS {0} of {1} not found'.format(axis_descr.axis_pts_ref,
+                                                                            characteristic.name))
+                axes[i] = self._read_axis_pts(axis_pts, False).values
+                counts[axis] = len(axes[i])
+            elif axis_descr.attribute == 'FIX_AXIS':
+                axes[i] = _fix_axis(axis_descr)
+                counts[axis] = len(axes[i])
+            else:
+                raise NotImplementedError('{0} axes are not supported'.format(axis_descr.attribute))
+        if kind == 'VALUE':
+            value_count = None
+        elif kind in ('VAL_BLK', 'ASCII'):
+            value_count = lambda c: _product(_block_dimensions(characteristic))
+        else:
+            value_count = lambda c: _product(c[axis] for axis in 'xyz'[:len(axes_descr)])
+        plan = self._plan(record_layout, kind == 'VALUE')
+        fields = plan.decode(self.image, characteristic.address, byte_order, counts, value_count)
+        if 'fnc_values' not in fields:
+            raise ValueError('RECORD_LAYOUT {0} of {1} has no FNC_VALUES'.format(record_layout.name,
+                                                                                 characteristic.name))
+        values = fields.pop('fnc_values')
+        for i, (axis, axis_descr) in enumerate(zip('xyz', axes_descr)):
+            if axes[i] is None:
+                if 'axis_pts_' + axis not in fields:
+                    raise ValueError('RECORD_LAYOUT {0} of {1} has no AXIS_PTS_{2}'.format(record_layout.name,
+                                                                                           characteristic.name,
+                                                                                           axis.upper()))
+                axes[i] = fields.pop('axis_pts_' + axis)[:counts[axis]]
+                if axis_descr.deposit == 'DIFFERENCE':
+                    axes[i] = _accumulate(axes[i])
+            if physical:
+                axes[i] = self.module.converter(axis_descr.conversion).to_physical(axes[i])
+        if kind == 'ASCII':
+            text = bytearray(int(v) for v in values)
+            return A2lCharacteristicValue(characteristic.name, text.split(b'\0')[0].decode('latin-1'), axes, fields)
+        if kind == 'VALUE' and characteristic.bit_mask:
+            mask = characteristic.bit_mask
+            values = (int(values) & mask) >> ((mask & -mask).bit_length() - 1)
+        if physical:
+            values = self.module.converter(characteristic.conversion).to_physical(values)
+        if kind != 'VALUE':
+            if kind == 'VAL_BLK':
+                dimensions = _block_dimensions(characteristic)
+            else:
+                dimensions = [counts[axis] for axis in 'xyz'[:len(axes_descr)]]
+            row_dir = record_layout.fnc_values.index_mode == 'ROW_DIR'
+            values = _shape(values if numpy is None else numpy.asarray(values), dimensions, row_dir)
+        return A2lCharacteristicValue(characteristic.name, values, axes, fields)
@@ -0,0 +1,163 @@
+"""
+@project: parser
+@file: index.py
+@author: Guillaume Sottas
+@date: 18.10.2026
+"""
+
+import io
+import json
+import mmap
+import os
+import re
+
+from .parser import A2lParser, _parse_module_blocks
+
+INDEX_SUFFIX = '.a2lidx'
+
+_index_format = 1
+
+# same as parallel._block_re on the raw bytes of the file, so that the offsets can be used to seek in it. the
+# identifier following the type of a block, if any, is its name.
+_block_re = re.compile(br'"(?:[^"\\]|\\.)*"|/\*[\s\S]*?\*/|//.+\n'
+                       br'|/(begin|end)[ \t\r\n]+([A-Za-z_][A-Za-z0-9_]*)(?:[ \t\r\n]+([A-Za-z_][A-Za-z0-9_.\[\]]*))?')
+
+
+def scan_module_blocks(data):
+    """
+    returns the (type, name, start, end) entries of the children blocks of the MODULE nodes of data (the bytes of an A2L
+    file), in order. name is None for the blocks which are not named (e.g. MOD_PAR).
+    """
+    entries = list()
+    in_module = False
+    entry = None
+    depth = 0
+    for match in _block_re.finditer(data):
+        keyword = match.group(1)
+        if keyword == b'begin':
+            depth += 1
+            if depth == 2:
+                in_module = match.group(2) == b'MODULE'
+            elif depth == 3 and in_module:
+                name = match.group(3)
+                entry = [match.group(2).decode('ascii'), None if name is None else name.decode('ascii'),
+                         match.start()]
+        elif keyword == b'end':
+            if depth == 3 and in_module:
+                entries.append(tuple(entry + [match.end(2)]))
+            depth -= 1
+    return entries
+
+
+class A2lIndex(object):
+    """
+    offset table of the children blocks of the MODULE nodes of an A2L file (e.g. CHARACTERISTIC or COMPU_METHOD),
+    giving a random access to them: get parses a single block, read from its offsets, instead of the whole file.
+
+    the table is built by a scan of the /begin and /end keywords of the file (without tokenizing it) and can be stored
+    next to it, so that it is built once. the offsets are byte offsets, hence the encoding of the file must be a
+    superset of ASCII (e.g. utf-8 or latin-1).
+    """
+
+    def __init__(self, path, entries, encoding='utf-8', lexer='ply', **custom_classes):
+        self.path = path
+        self.entries = entries
+        self.encoding = encoding
+        self.lexer = lexer
+        self.custom_classes = custom_classes
+        self._names = None
+
+    @classmethod
+    def build(cls, path, encoding='utf-8', lexer='ply', **custom_classes):
+        """
+        returns the index of the file located at path, scanning it.
+        """
+        with open(path, 'rb') as fp:
+            if os.fstat(fp.fileno()).st_size == 0:
+                entries = list()
+            else:
+                data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    entries = scan_module_blocks(data)
+                finally:
+                    data.close()
+        return cls(path, entries, encoding, lexer, **custom_classes)
+
+    @classmethod
+    def load(cls, path, encoding='utf-8', lexer='ply', index_path=None, **custom_classes):
+        """
+        returns the index of the file located at path, read from the sidecar file index_path (path followed by
+        INDEX_SUFFIX by default). if the sidecar file is missing or outdated (the size or the modification time of the
+        file have changed), the file is scanned and the sidecar file is written, if possible.
+        """
+        index_path = index_path or path + INDEX_SUFFIX
+        stat = os.stat(path)
+        try:
+            with io.open(index_path, 'r', encoding='utf-8') as fp:
+                content = json.load(fp)
+            if content['format'] == _index_format and content['size'] == stat.st_size and \
+                    content['mtime'] == stat.st_mtime:
+                return cls(path, [tuple(e) for e in content['entries']], encoding, lexer, **custom_classes)
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            pass
+        index = cls.build(path, encoding, lexer, **custom_classes)
+        try:
+            index.save(index_path, stat)
+        except (IOError, OSError):
+            pass
+        return index
+
+    def save(self, index_path=None, stat=None):
+        """
+        writes the index to index_path (path followed by INDEX_SUFFIX by default). stat is the os.stat result of the
+        indexed file when it has been scanned, the current one is used if None.
+        """
+        index_path = index_path or self.path + INDEX_SUFFIX
+        stat = stat or os.stat(self.path)
+        content = dict(format=_index_format, size=stat.st_size, mtime=stat.st_mtime, entries=self.entries)
+        temporary = index_path + '.tmp'
+        with io.open(temporary, 'w', encoding='utf-8') as fp:
+            fp.write(json.dumps(content, separators=(',', ':')))
+        getattr(os, 'replace', os.rename)(temporary, index_path)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def find(self, kind, name):
+        """
+        returns the (type, name, start, end) entry of the block of type kind (e.g. 'CHARACTERISTIC') named name, or None
+        if there is none. when a name is used more than once, the first block is returned.
+        """
+        if self._names is None:
+            self._names = dict()
+            for entry in self.entries:
+                self._names.setdefault(entry[:2], entry)
+        return self._names.get((kind.upper(), name))
+
+    def names(self, kind):
+        """
+        returns the names of the blocks of type kind, in order.
+        """
+        kind = kind.upper()
+        return [e[1] for e in self.entries if e[0] == kind]
+
+    def read(self, entry):
+        """
+        returns the text of the block of entry.
+        """
+        with open(self.path, 'rb') as fp:
+            fp.seek(entry[2])
+            return fp.read(entry[3] - entry[2]).decode(self.encoding)
+
+    def get(self, kind, name, default=None):
+        """
+        returns the node of type kind named name, parsed from its block only, or default if there is none. the node has
+        no parent.
+        """
+        entry = self.find(kind, name)
+        if entry is None:
+            return default
+        return _parse_module_blocks(A2lParser, self.read(entry), self.lexer, self.custom_classes)[0][1]
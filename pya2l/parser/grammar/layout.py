@@ -0,0 +1,324 @@
+"""
+@project: parser
+@file: layout.py
+@author: Guillaume Sottas
+@date: 18.10.2026
+"""
+
+import struct
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# struct format characters of the data types (with the standard sizes, i.e. preceded by a byte order character).
+_data_types = {'UBYTE': 'B',
+               'SBYTE': 'b',
+               'UWORD': 'H',
+               'SWORD': 'h',
+               'ULONG': 'L',
+               'SLONG': 'l',
+               'A_UINT64': 'Q',
+               'A_INT64': 'q',
+               'FLOAT32_IEEE': 'f',
+               'FLOAT64_IEEE': 'd'}
+
+# NumPy type codes of the data types (the size of the struct long being fixed, not the one of the NumPy long).
+_numpy_types = {'UBYTE': 'u1',
+                'SBYTE': 'i1',
+                'UWORD': 'u2',
+                'SWORD': 'i2',
+                'ULONG': 'u4',
+                'SLONG': 'i4',
+                'A_UINT64': 'u8',
+                'A_INT64': 'i8',
+                'FLOAT32_IEEE': 'f4',
+                'FLOAT64_IEEE': 'f8'}
+
+_data_type_sizes = dict((k, struct.calcsize('<' + v)) for k, v in _data_types.items())
+
+# alignment attributes (of RECORD_LAYOUT and MOD_COMMON) of the data types, the other ones being aligned to their size.
+_alignment_attributes = {'UBYTE': 'alignment_byte',
+                         'SBYTE': 'alignment_byte',
+                         'UWORD': 'alignment_word',
+                         'SWORD': 'alignment_word',
+                         'ULONG': 'alignment_long',
+                         'SLONG': 'alignment_long',
+                         'FLOAT32_IEEE': 'alignment_float32_ieee',
+                         'FLOAT64_IEEE': 'alignment_float64_ieee'}
+
+_data_sizes = {'BYTE': 1, 'WORD': 2, 'LONG': 4}
+
+# attributes of RECORD_LAYOUT holding a positional field (besides the RESERVED ones).
+_layout_attributes = ('fnc_values', 'identification', 'axis_pts_x', 'axis_pts_y', 'axis_pts_z', 'axis_rescale_x',
+                      'axis_rescale_y', 'axis_rescale_z', 'no_axis_pts_x', 'no_axis_pts_y', 'no_axis_pts_z',
+                      'no_rescale_x', 'no_rescale_y', 'no_rescale_z', 'src_addr_x', 'src_addr_y', 'src_addr_z',
+                      'rip_addr_x', 'rip_addr_y', 'rip_addr_z', 'rip_addr_w', 'shift_op_x', 'shift_op_y', 'shift_op_z',
+                      'offset_x', 'offset_y', 'offset_z', 'dist_op_x', 'dist_op_y', 'dist_op_z')
+
+_alternate_index_modes = ('ALTERNATE_CURVES', 'ALTERNATE_WITH_X', 'ALTERNATE_WITH_Y')
+
+
+def _align(offset, alignment):
+    return (offset + alignment - 1) // alignment * alignment
+
+
+class A2lLayoutField(object):
+    """
+    positional field of a RECORD_LAYOUT. kind is 'value' (a single value), 'count' (the number of points of an axis or
+    of rescale pairs), 'array' (the points of an axis, the rescale pairs or the FNC_VALUES) or 'reserved'. key is the
+    key of the number of elements of the field in the counts dictionary ('x', 'y', 'z', 'rescale_x', ... or None for
+    the FNC_VALUES).
+    """
+    __slots__ = 'attribute', 'kind', 'key', 'data_type', 'size', 'alignment', 'factor', 'default_count', 'reverse'
+
+    def __init__(self, attribute, kind, key, data_type, size, alignment, factor=1, default_count=None, reverse=False):
+        self.attribute = attribute
+        self.kind = kind
+        self.key = key
+        self.data_type = data_type
+        self.size = size
+        self.alignment = alignment
+        self.factor = factor
+        self.default_count = default_count
+        self.reverse = reverse
+
+    def count(self, counts, fnc_count):
+        if self.key is None:
+            return fnc_count
+        return self.factor * counts.get(self.key, self.default_count)
+
+
+def _compile_field(attribute, field, alignment, single):
+    data_type = field.data_type
+    size = _data_type_sizes[data_type]
+    if attribute == 'fnc_values':
+        if field.index_mode in _alternate_index_modes:
+            raise NotImplementedError('the {0} index mode is not supported'.format(field.index_mode))
+        if single:
+            return A2lLayoutField(attribute, 'value', None, data_type, size, alignment)
+        return A2lLayoutField(attribute, 'array', None, data_type, size, alignment)
+    if attribute.startswith('no_axis_pts_'):
+        return A2lLayoutField(attribute, 'count', attribute[-1], data_type, size, alignment)
+    if attribute.startswith('no_rescale_'):
+        return A2lLayoutField(attribute, 'count', 'rescale_' + attribute[-1], data_type, size, alignment)
+    if attribute.startswith('axis_pts_'):
+        return A2lLayoutField(attribute, 'array', attribute[-1], data_type, size, alignment,
+                              reverse=field.index_incr == 'INDEX_DECR')
+    if attribute.startswith('axis_rescale_'):
+        return A2lLayoutField(attribute, 'array', 'rescale_' + attribute[-1], data_type, size, alignment, factor=2,
+                              default_count=field.max_number_of_rescale_pairs)
+    return A2lLayoutField(attribute, 'value', None, data_type, size, alignment)
+
+
+def _struct_format(fields, counts=None, fnc_count=None, offset=0):
+    """
+    returns the struct format (without byte order) of fields starting at offset (relative to an address aligned for all
+    of them), the (field, count) of its items and the offset of their end.
+    """
+    items = list()
+    codes = list()
+    for field in fields:
+        if field.kind == 'reserved':
+            codes.append('{0}x'.format(field.size))
+            offset += field.size
+            continue
+        aligned = _align(offset, field.alignment)
+        if aligned != offset:
+            codes.append('{0}x'.format(aligned - offset))
+        count = field.count(counts, fnc_count) if field.kind == 'array' else None
+        codes.append(_data_types[field.data_type] if count is None else '{0}{1}'.format(count,
+                                                                                        _data_types[field.data_type]))
+        items.append((field, count))
+        offset = aligned + field.size * (1 if count is None else count)
+    return ''.join(codes), items, offset
+
+
+class A2lLayoutPlan(object):
+    """
+    decode and encode plan of a RECORD_LAYOUT (for the single value of a VALUE if single is True), compiled once and
+    shared by all the nodes using the record layout.
+
+    the positional fields are sorted by position and their alignment resolved once (from the record layout, the
+    mod_common, or the size of their type). the fields preceding the first array are read with a precompiled struct
+    format. the offsets of the following ones depend on the number of points of the axes, the layout of these fields
+    is compiled (to a NumPy structured dtype, or a struct format) for each combination of numbers of points and cached.
+    the fields are read one by one if the address of the node is not aligned as the fields require, or if a number of
+    points is stored after an array. encode packs the fields of a record with a struct format cached the same way.
+    """
+    __slots__ = ('name', 'single', 'fields', 'alignment', 'header', 'tail', 'static', '_header_structs', '_tails',
+                 '_records')
+
+    def __init__(self, record_layout, mod_common=None, single=False):
+        self.name = record_layout.name
+        self.single = single
+        fields = list()
+        for attribute in _layout_attributes:
+            field = getattr(record_layout, attribute)
+            if field is not None:
+                alignment_attribute = _alignment_attributes.get(field.data_type)
+                alignment = None
+                if alignment_attribute is not None:
+                    alignment = getattr(record_layout, alignment_attribute) or \
+                        getattr(mod_common, alignment_attribute, None)
+                alignment = alignment or _data_type_sizes[field.data_type]
+                fields.append((field.position, _compile_field(attribute, field, alignment, single)))
+        for field in record_layout.reserved:
+            fields.append((field.position, A2lLayoutField('reserved', 'reserved', None, None,
+                                                          _data_sizes[field.data_size], 1)))
+        fields.sort(key=lambda f: f[0])
+        self.fields = tuple(f for _, f in fields)
+        self.alignment = max([f.alignment for f in self.fields] or [1])
+        arrays = [i for i, f in enumerate(self.fields) if f.kind == 'array']
+        split = arrays[0] if arrays else len(self.fields)
+        self.header = self.fields[:split]
+        self.tail = self.fields[split:]
+        self.static = all(f.kind != 'count' for f in self.tail)
+        header_format, items, _ = _struct_format(self.header)
+        self._header_structs = dict((byte_order, (struct.Struct(byte_order + header_format), [f for f, _ in items]))
+                                    for byte_order in '<>')
+        self._tails = dict()
+        self._records = dict()
+
+    def field(self, attribute):
+        """
+        returns the A2lLayoutField of attribute, or None if the record layout has no such field.
+        """
+        for field in self.fields:
+            if field.attribute == attribute:
+                return field
+        return None
+
+    def _tail_layout(self, byte_order, start, counts, fnc_count):
+        """
+        returns the (size, reader) of the fields of the tail following a header of size start, for counts. reader is a
+        NumPy structured dtype (or a struct.Struct and the (field, count) of its items, if NumPy is not installed).
+        """
+        key = (byte_order, fnc_count) + tuple(sorted(counts.items()))
+        try:
+            return self._tails[key]
+        except KeyError:
+            pass
+        tail_format, items, end = _struct_format(self.tail, counts, fnc_count, start)
+        size = end - start
+        if numpy is not None and size:
+            names, formats, offsets = list(), list(), list()
+            position = start
+            for field in self.tail:
+                if field.kind == 'reserved':
+                    position += field.size
+                    continue
+                position = _align(position, field.alignment)
+                count = field.count(counts, fnc_count) if field.kind == 'array' else None
+                code = byte_order + _numpy_types[field.data_type]
+                names.append(field.attribute)
+                formats.append(code if count is None else (code, (count,)))
+                offsets.append(position - start)
+                position += field.size * (1 if count is None else count)
+            reader = numpy.dtype(dict(names=names, formats=formats, offsets=offsets, itemsize=size))
+        else:
+            reader = struct.Struct(byte_order + tail_format), items
+        layout = self._tails[key] = size, reader
+        return layout
+
+    def decode(self, image, address, byte_order, counts, fnc_count=None):
+        """
+        returns the dictionary of the values of the fields read at address in image (an A2lImage), in byte_order ('<'
+        or '>'). counts is the dictionary of the numbers of points of the axes, updated by the values of the fields
+        holding them, fnc_count the function returning the number of FNC_VALUES from counts.
+        """
+        if address % self.alignment or not self.static:
+            return self._walk(image, address, byte_order, counts, fnc_count)
+        fields = dict()
+        header_struct, header_fields = self._header_structs[byte_order]
+        if header_fields:
+            data, position = image.locate(address, header_struct.size)
+            for field, value in zip(header_fields, header_struct.unpack_from(data, position)):
+                fields[field.attribute] = value
+                if field.kind == 'count':
+                    counts[field.key] = int(value)
+        if not self.tail:
+            return fields
+        size, reader = self._tail_layout(byte_order, header_struct.size, counts,
+                                         None if fnc_count is None else fnc_count(counts))
+        data, position = image.locate(address + header_struct.size, size)
+        if not isinstance(reader, tuple):
+            record = numpy.frombuffer(data, reader, 1, position)[0]
+            for field in self.tail:
+                if field.kind == 'reserved':
+                    continue
+                value = record[field.attribute]
+                if field.kind == 'array':
+                    value = value.astype(value.dtype.newbyteorder('='))
+                    fields[field.attribute] = value[::-1] if field.reverse else value
+                else:
+                    fields[field.attribute] = value.item()
+            return fields
+        tail_struct, items = reader
+        values = tail_struct.unpack_from(data, position)
+        i = 0
+        for field, count in items:
+            if count is None:
+                fields[field.attribute] = values[i]
+                i += 1
+            else:
+                value = list(values[i:i + count])
+                fields[field.attribute] = value[::-1] if field.reverse else value
+                i += count
+        return fields
+
+    def encode(self, fields, byte_order, counts, fnc_count=None):
+        """
+        returns the bytes of the record of the values of fields (as returned by decode) in byte_order, starting at an
+        address aligned for all the fields. the numbers of points are taken from the values of the fields holding them,
+        or from counts otherwise. the missing values are written as 0, as well as the reserved fields.
+        """
+        counts = dict(counts)
+        for field in self.fields:
+            if field.kind == 'count' and field.attribute in fields:
+                counts[field.key] = int(fields[field.attribute])
+        count = None if fnc_count is None else fnc_count(counts)
+        key = (byte_order, count) + tuple(sorted(counts.items()))
+        try:
+            record_struct, items = self._records[key]
+        except KeyError:
+            record_format, items, _ = _struct_format(self.fields, counts, count)
+            record_struct, items = self._records[key] = struct.Struct(byte_order + record_format), items
+        values = list()
+        for field, count in items:
+            value = fields.get(field.attribute, 0)
+            if count is None:
+                values.append(value)
+                continue
+            value = list(value) if field.attribute in fields else [0] * count
+            if len(value) != count:
+                raise ValueError('{0} has {1} values instead of {2}'.format(field.attribute, len(value), count))
+            values.extend(value[::-1] if field.reverse else value)
+        return record_struct.pack(*values)
+
+    def _walk(self, image, address, byte_order, counts, fnc_count):
+        fields = dict()
+        for field in self.fields:
+            if field.kind == 'reserved':
+                address += field.size
+                continue
+            address = _align(address, field.alignment)
+            code = _data_types[field.data_type]
+            if field.kind == 'array':
+                count = field.count(counts, None if fnc_count is None else fnc_count(counts))
+                data, position = image.locate(address, count * field.size)
+                if numpy is not None:
+                    dtype = numpy.dtype(byte_order + _numpy_types[field.data_type])
+                    value = numpy.frombuffer(data, dtype, count, position).astype(dtype.newbyteorder('='))
+                else:
+                    value = list(struct.unpack_from('{0}{1}{2}'.format(byte_order, count, code), data, position))
+                fields[field.attribute] = value[::-1] if field.reverse else value
+                address += count * field.size
+            else:
+                data, position = image.locate(address, field.size)
+                value = fields[field.attribute] = struct.unpack_from(byte_order + code, data, position)[0]
+                if field.kind == 'count':
+                    counts[field.key] = int(value)
+                address += field.size
+        return fields
@@ -0,0 +1,173 @@
+"""
+@project: parser
+@file: lazy.py
+@author: Guillaume Sottas
+@date: 18.10.2026
+"""
+
+import collections
+import functools
+
+from .node import _unset_slots
+from .parallel import _block_re
+
+# number of tokens following the /begin keyword and the type of the nodes parsed lazily, up to their optional section.
+LAZY_HEADER_LENGTHS = {'AXIS_PTS': 10,
+                       'CHARACTERISTIC': 9,
+                       'MEASUREMENT': 8}
+
+# depth of the children blocks of the MODULE nodes (PROJECT being at depth 1).
+_module_child_depth = 3
+
+# (header attributes, lazy slots) of each node class. the header attributes are the parameters of the constructor
+# preceding the optional arguments, the lazy slots are the ones which are not set on a lazy node, so that accessing them
+# loads the node.
+_lazy_layouts = dict()
+
+# slots which are not copied from the node loaded from the block of a lazy node.
+_excluded_slots = frozenset(('_node', '_parent')) | _unset_slots
+
+
+def _get_lazy_layout(cls):
+    try:
+        return _lazy_layouts[cls]
+    except KeyError:
+        slots = [p for c in reversed(cls.__mro__) for p in c.__dict__.get('__slots__', ())]
+        code = cls.__init__.__code__
+        header = code.co_varnames[1:code.co_argcount - 1]
+        if not set(header).issubset(slots):
+            header = None
+        lazy_slots = list()
+        for p in slots:
+            if p not in lazy_slots and p not in (header or ()) and p not in _excluded_slots:
+                lazy_slots.append(p)
+        _lazy_layouts[cls] = header, tuple(lazy_slots)
+        return _lazy_layouts[cls]
+
+
+class A2lLazySource(object):
+    """
+    text from which the lazy nodes of a tree are loaded. parse is a function returning the node parsed from the text of
+    its block.
+    """
+    __slots__ = 'string', 'parse'
+
+    def __init__(self, string, parse):
+        self.string = string
+        self.parse = parse
+
+    def new_node(self, cls, header, start, end):
+        """
+        returns a lazy node of class cls, built from the values of its header attributes. the other attributes (and the
+        children) are loaded from string[start:end] when first accessed.
+        """
+        header_attributes, lazy_slots = _get_lazy_layout(cls)
+        if header_attributes is None:
+            node = cls(*(tuple(header) + (list(),)))
+            for p in lazy_slots:
+                delattr(node, p)
+        else:
+            node = cls.__new__(cls)
+            for p, value in zip(header_attributes, header):
+                setattr(node, p, value)
+            node._parent = None
+        node._lazy = self, start, end
+        return node
+
+    def load(self, node, start, end):
+        """
+        sets the attributes of node to the ones of the node parsed from string[start:end].
+        """
+        loaded = self.parse(self.string[start:end])
+        for p in _get_lazy_layout(type(node))[1]:
+            setattr(node, p, getattr(loaded, p))
+        for child in node._children:
+            child.set_parent(node)
+
+
+class A2lLazyLexer(object):
+    """
+    wraps a lexer, skipping the optional section of the children blocks of the MODULE nodes listed in
+    LAZY_HEADER_LENGTHS. the parser therefore reduces these blocks from their header only. for each of them, the
+    (start, end) span of the block is appended to spans, or None if it could not be skipped, in the order of the blocks.
+
+    the wrapped lexer must tokenize a string and be able to resume at another position (its lexpos attribute is set,
+    or its seek method is called if it has one).
+    """
+
+    def __init__(self, lexer):
+        self._lexer = lexer
+        self.spans = collections.deque()
+        self.token = lambda: None
+
+    @property
+    def lexdata(self):
+        return self._lexer.lexdata
+
+    @property
+    def lineno(self):
+        return self._lexer.lineno
+
+    def input(self, string):
+        self._lexer.input(string)
+        self.token = functools.partial(next, self._tokens(), None)
+
+    def clone(self):
+        return A2lLazyLexer(self._lexer.clone())
+
+    def _tokens(self):
+        lexer = self._lexer
+        depth = 0
+        while True:
+            token = lexer.token()
+            if token is None:
+                return
+            yield token
+            if token.type == 'begin':
+                depth += 1
+                begin = token.lexpos
+                token = lexer.token()
+                if token is None:
+                    return
+                yield token
+                if depth != _module_child_depth or token.type not in LAZY_HEADER_LENGTHS:
+                    continue
+                kind = token.type
+                for _ in range(LAZY_HEADER_LENGTHS[kind]):
+                    token = lexer.token()
+                    if token is None:
+                        return
+                    yield token
+                    if token.type == 'begin' or token.type == 'end':
+                        depth += 1 if token.type == 'begin' else -1
+                        break
+                else:
+                    self._skip(kind, begin, token.lexpos)
+            elif token.type == 'end':
+                depth -= 1
+
+    def _skip(self, kind, begin, position):
+        """
+        resumes the wrapped lexer at the /end keyword closing the block of type kind starting at begin, searched from
+        position (the last token of its header).
+        """
+        lexer = self._lexer
+        depth = 0
+        for match in _block_re.finditer(lexer.lexdata, position):
+            keyword = match.group(1)
+            if keyword == 'begin':
+                depth += 1
+            elif keyword == 'end':
+                if depth:
+                    depth -= 1
+                    continue
+                if match.group(2) == kind:
+                    self.spans.append((begin, match.end()))
+                    seek = getattr(lexer, 'seek', None)
+                    if seek is None:
+                        lexer.lexpos = match.start()
+                    else:
+                        seek(match.start())
+                    return
+                break
+        self.spans.append(None)
@@ -5,8 +5,80 @@
 @date: 05.04.2018
 """
 
+import array
+import collections
+import hashlib
+
+try:
+    import copyreg
+except ImportError:
+    import copy_reg as copyreg
+
 node_to_class = dict()
 
+# slots saved when pickling the instances of each node class. the _node slot is not saved, as it is shadowed by the
+# class attribute set by a2l_node_type.
+_pickled_slots = dict()
+
+
+# private slots of A2lNode which may not be set (their value being None then).
+_unset_slots = frozenset(('_lazy', '_spans', '_digest'))
+
+# attributes holding the optional items whose rule is named after a positional attribute of their node, by (node type,
+# rule name).
+_optional_attributes = {('AXIS_PTS', 'deposit'): 'deposit_mode'}
+
+
+# True once the methods of A2lNode resetting the cached digests have been installed (see _install_digest_reset).
+_digest_reset_installed = False
+
+_new_object = object.__new__
+_set_object_attribute = object.__setattr__
+
+
+def _digest_content(value):
+    """
+    returns the value of an attribute in which the nodes are replaced by their digest (see A2lNode.digest).
+    """
+    if isinstance(value, A2lNode):
+        return value.digest()
+    if isinstance(value, (list, tuple)):
+        return [_digest_content(v) for v in value]
+    return value
+
+
+def _new_node(cls, *args, **kwargs):
+    node = _new_object(cls)
+    _set_object_attribute(node, '_digest', None)
+    return node
+
+
+def _set_node_attribute(node, name, value):
+    """
+    sets the attribute of node, resetting the cached digest of node and of its ancestors if an attribute is set.
+    """
+    _set_object_attribute(node, name, value)
+    if name[0] != '_':
+        try:
+            digest = node._digest
+        except AttributeError:
+            return
+        if digest is not None:
+            node.reset_digest()
+
+
+def _install_digest_reset():
+    """
+    installs the __setattr__ of A2lNode resetting the cached digests when an attribute of a node is set, and the
+    __new__ initializing the digest of the new nodes, so that it is checked without raising an exception. they are
+    installed when a digest is cached for the first time, hence the nodes built by the parses which precede are built
+    without calling them.
+    """
+    global _digest_reset_installed
+    A2lNode.__new__ = staticmethod(_new_node)
+    A2lNode.__setattr__ = _set_node_attribute
+    _digest_reset_installed = True
+
 
 def a2l_node_type(node_type):
     def wrapper(cls):
@@ -17,8 +89,77 @@ def a2l_node_type(node_type):
     return wrapper
 
 
+class A2lNumberArray(array.array):
+    """
+    compact storage of the lists of numbers of the tree (see a2l_number_array). it compares equal to the list of the
+    same numbers.
+    """
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            return self.tolist() == other
+        return array.array.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+
+class A2lMixedNumberArray(A2lNumberArray):
+    """
+    array of doubles storing a list of numbers which mixes integers and floats. integers holds a byte per number, set
+    for the integers, which are returned as integers by tolist and by the iteration, so that the json representation of
+    the list is unchanged (the items being doubles otherwise).
+    """
+    __slots__ = 'integers',
+
+    def tolist(self):
+        return [int(v) if i else v for v, i in zip(array.array.tolist(self), self.integers)]
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(type(self).__name__, self.tolist())
+
+    def __reduce_ex__(self, protocol):
+        return a2l_number_array, (self.tolist(),)
+
+    def __copy__(self):
+        return a2l_number_array(self.tolist())
+
+    def __deepcopy__(self, memo):
+        return a2l_number_array(self.tolist())
+
+
+def a2l_number_array(numbers):
+    """
+    returns the list of numbers as an A2lNumberArray of 64 bits integers (signed, or unsigned if a value is too large),
+    or of doubles if a value is a float (an A2lMixedNumberArray if some of them are integers). the list is returned as
+    is if the values cannot be stored in any of them.
+    """
+    try:
+        for typecode in ('q', 'Q'):
+            try:
+                return A2lNumberArray(typecode, numbers)
+            except OverflowError:
+                pass
+            except TypeError:
+                integers = bytearray(not isinstance(n, float) for n in numbers)
+                if not any(integers):
+                    return A2lNumberArray('d', numbers)
+                mixed = A2lMixedNumberArray('d', numbers)
+                mixed.integers = integers
+                return mixed
+    except (OverflowError, TypeError, ValueError):
+        pass
+    return numbers
+
+
 class A2lNode(object):
-    __slots__ = '_node', '_parent', '_children'
+    __slots__ = '_node', '_parent', '_children', '_lazy', '_spans', '_digest'
 
     def __init__(self, *args, **kwargs):
         if not isinstance(self.__slots__, tuple):
@@ -37,6 +178,31 @@ class A2lNode(object):
                 value.set_parent(self)
                 self.add_children(value)
 
+    def __getattr__(self, name):
+        """
+        loads the optional attributes of a lazy node (see lazy.A2lLazySource) when one of them is first accessed.
+        """
+        lazy = None if name in _unset_slots else getattr(self, '_lazy', None)
+        if lazy is None:
+            raise AttributeError('\'{0}\' object has no attribute \'{1}\''.format(type(self).__name__, name))
+        lazy[0].load(self, lazy[1], lazy[2])
+        self._lazy = None
+        return getattr(self, name)
+
+    def is_lazy(self):
+        """
+        returns True if the optional attributes of this node have not been loaded yet.
+        """
+        return getattr(self, '_lazy', None) is not None
+
+    def __reduce_ex__(self, protocol):
+        cls = type(self)
+        try:
+            slots = _pickled_slots[cls]
+        except KeyError:
+            slots = _pickled_slots[cls] = ('_parent', '_children') + tuple(self.properties)
+        return copyreg.__newobj__, (cls,), (None, dict((p, getattr(self, p)) for p in slots))
+
     def set_parent(self, a2l_node):
         self._parent = a2l_node
 
@@ -50,12 +216,71 @@ class A2lNode(object):
         return self._node
 
     def get_node(self, node_name):
-        nodes = list()
-        for node in self._children:
-            if node.node() == node_name:
-                nodes.append(node)
-            nodes += node.get_node(node_name)
-        return nodes
+        return list(self.iter_nodes(node_name))
+
+    def iter_nodes(self, node_name=None):
+        """
+        yields the descendants of this node whose type is node_name (all of them if None), in depth-first order,
+        without recursion.
+        """
+        stack = [iter(self._children)]
+        while stack:
+            for node in stack[-1]:
+                if node_name is None or node._node == node_name:
+                    yield node
+                stack.append(iter(node._children))
+                break
+            else:
+                stack.pop()
+
+    def get_spans(self):
+        """
+        returns the attribute name to span dictionary of this node if it has been parsed with spans=True, None
+        otherwise (see get_span).
+        """
+        return getattr(self, '_spans', None)
+
+    def get_span(self, attribute):
+        """
+        returns the (start, end) positions of the text of attribute in the parsed text if this node has been parsed
+        with spans=True, None otherwise. the span of an optional attribute includes its keyword (e.g. ECU_ADDRESS
+        0x1234), and the repeated optional attributes have no span.
+        """
+        spans = getattr(self, '_spans', None)
+        return None if spans is None else spans.get(attribute)
+
+    def digest(self, ignored=None):
+        """
+        returns the SHA-1 digest of the content of this node: its type and the values of its attributes, its children
+        being hashed through their own digest (a Merkle hash). the nodes of identical content have the same digest, so
+        that two subtrees are compared in constant time once their digests are known.
+
+        the digest is computed on first call and cached by each node of the subtree. it is reset when an attribute of
+        the node or of one of its descendants is set, but reset_digest must be called after a list or an array held by
+        an attribute is modified in place. if ignored is specified, the digest of the node without these attributes
+        (e.g. ('name',)) is returned, which is not cached.
+        """
+        digest = None if ignored else getattr(self, '_digest', None)
+        if digest is None:
+            content = [self._node]
+            for p in self.properties:
+                if not ignored or p not in ignored:
+                    content.append(_digest_content(getattr(self, p)))
+            digest = hashlib.sha1(repr(content).encode('utf-8')).digest()
+            if not ignored:
+                if not _digest_reset_installed:
+                    _install_digest_reset()
+                self._digest = digest
+        return digest
+
+    def reset_digest(self):
+        """
+        resets the cached digest of this node and of its ancestors, whose digests depend on it.
+        """
+        node = self
+        while node is not None:
+            node._digest = None
+            node = node._parent
 
     def get_json(self):
         tmp = dict(node=self.node())
@@ -70,6 +295,8 @@ class A2lNode(object):
                         tmp[p].append(e.json)
                     else:
                         tmp[p].append(e)
+            elif isinstance(v, array.array):
+                tmp[p] = v.tolist()
             else:
                 tmp[p] = v
         return tmp
@@ -80,14 +307,37 @@ class A2lNode(object):
 
 @a2l_node_type('ROOT')
 class A2lFile(A2lNode):
-    __slots__ = 'asap2_version', 'a2ml_version', 'project'
+    __slots__ = 'asap2_version', 'a2ml_version', 'project', '_node_index'
 
     def __init__(self, args):
         self.asap2_version = None
         self.a2ml_version = None
         self.project = None
+        self._node_index = None
         super(A2lFile, self).__init__(*args)
 
+    def get_node_index(self):
+        """
+        returns the node type to nodes dictionary of the tree, building it on first call.
+        """
+        node_index = getattr(self, '_node_index', None)
+        if node_index is None:
+            node_index = self._node_index = dict()
+            for node in self.iter_nodes():
+                try:
+                    node_index[node._node].append(node)
+                except KeyError:
+                    node_index[node._node] = [node]
+        return node_index
+
+    def reset_node_index(self):
+        self._node_index = None
+
+    def get_node(self, node_name):
+        return list(self.get_node_index().get(node_name, ()))
+
+    node_index = property(fget=get_node_index, fdel=reset_node_index)
+
 
 @a2l_node_type('VERSION')
 class Version(A2lNode):
@@ -182,7 +432,7 @@ class AxisDescr(A2lNode):
 class AxisPts(A2lNode):
     __slots__ = 'name', 'long_identifier', 'address', 'input_quantity', 'deposit', 'max_diff', 'conversion', \
                 'max_axis_points', 'lower_limit', 'upper_limit', 'display_identifier', 'read_only', 'format', \
-                'deposit', 'byte_order', 'function_list', 'ref_memory_segment', 'guard_rails', 'extended_limits', \
+                'deposit_mode', 'byte_order', 'function_list', 'ref_memory_segment', 'guard_rails', 'extended_limits', \
                 'annotation', 'if_data_axis_pts', 'calibration_access', 'ecu_address_extension'
 
     def __init__(self, name, long_identifier, address, input_quantity, deposit, max_diff, conversion,
@@ -200,7 +450,7 @@ class AxisPts(A2lNode):
         self.display_identifier = None
         self.read_only = None
         self.format = None
-        self.deposit = None
+        self.deposit_mode = None
         self.byte_order = None
         self.function_list = None
         self.ref_memory_segment = None
@@ -210,7 +460,8 @@ class AxisPts(A2lNode):
         self.if_data_axis_pts = list()
         self.calibration_access = None
         self.ecu_address_extension = None
-        super(AxisPts, self).__init__(*args)
+        # the optional DEPOSIT mode is stored apart from the deposit parameter (the RECORD_LAYOUT reference).
+        super(AxisPts, self).__init__(*((_optional_attributes.get(('AXIS_PTS', a), a), v) for a, v in args))
 
 
 class AxisPtsXYZ(A2lNode):
@@ -355,6 +606,16 @@ class Coeffs(A2lNode):
         super(Coeffs, self).__init__()
 
 
+@a2l_node_type('COEFFS_LINEAR')
+class CoeffsLinear(A2lNode):
+    __slots__ = 'a', 'b'
+
+    def __init__(self, a, b):
+        self.a = a
+        self.b = b
+        super(CoeffsLinear, self).__init__()
+
+
 @a2l_node_type('COMPU_METHOD')
 class CompuMethod(A2lNode):
     __slots__ = 'name', 'long_identifier', 'conversion_type', 'format', 'unit', 'formula', 'coeffs', 'coeffs_linear', \
@@ -885,12 +1146,80 @@ class MemorySegment(A2lNode):
         super(MemorySegment, self).__init__(*args)
 
 
+# attribute holding the name of the nodes of each index of A2lModuleIndex.
+_index_name_attributes = {'characteristic': 'name',
+                          'axis_pts': 'name',
+                          'measurement': 'name',
+                          'compu_method': 'name',
+                          'compu_tab': 'name',
+                          'compu_vtab': 'name',
+                          'compu_vtab_range': 'name',
+                          'function': 'name',
+                          'group': 'group_name',
+                          'record_layout': 'name',
+                          'unit': 'name'}
+
+# indexes in which the nodes referenced by an attribute of a node type are looked up, in order.
+_references = {('AXIS_DESCR', 'axis_pts_ref'): ('axis_pts',),
+               ('AXIS_DESCR', 'conversion'): ('compu_method',),
+               ('AXIS_DESCR', 'curve_axis_ref'): ('characteristic',),
+               ('AXIS_DESCR', 'input_quantity'): ('measurement',),
+               ('AXIS_PTS', 'conversion'): ('compu_method',),
+               ('AXIS_PTS', 'deposit'): ('record_layout',),
+               ('AXIS_PTS', 'input_quantity'): ('measurement',),
+               ('CHARACTERISTIC', 'comparison_quantity'): ('measurement',),
+               ('CHARACTERISTIC', 'conversion'): ('compu_method',),
+               ('CHARACTERISTIC', 'deposit'): ('record_layout',),
+               ('CHARACTERISTIC', 'map_list'): ('characteristic',),
+               ('COMPU_METHOD', 'compu_tab_ref'): ('compu_tab', 'compu_vtab', 'compu_vtab_range'),
+               ('COMPU_METHOD', 'ref_unit'): ('unit',),
+               ('DEF_CHARACTERISTIC', 'identifier'): ('characteristic', 'axis_pts'),
+               ('DEPENDENT_CHARACTERISTIC', 'characteristic'): ('characteristic', 'axis_pts'),
+               ('FRAME_MEASUREMENT', 'identifier'): ('measurement',),
+               ('FUNCTION_LIST', 'name'): ('function',),
+               ('IN_MEASUREMENT', 'identifier'): ('measurement',),
+               ('LOC_MEASUREMENT', 'identifier'): ('measurement',),
+               ('MEASUREMENT', 'conversion'): ('compu_method',),
+               ('OUT_MEASUREMENT', 'identifier'): ('measurement',),
+               ('REF_CHARACTERISTIC', 'identifier'): ('characteristic', 'axis_pts'),
+               ('REF_GROUP', 'identifier'): ('group',),
+               ('REF_MEASUREMENT', 'identifier'): ('measurement',),
+               ('SUB_FUNCTION', 'identifier'): ('function',),
+               ('SUB_GROUP', 'identifier'): ('group',),
+               ('UNIT', 'ref_unit'): ('unit',),
+               ('VAR_CHARACTERISTIC', 'name'): ('characteristic',),
+               ('VIRTUAL_CHARACTERISTIC', 'characteristic'): ('characteristic', 'axis_pts')}
+
+
+class A2lModuleIndex(object):
+    """
+    name to node dictionaries of the named children of a module (e.g. index.characteristic['name']). when a name is
+    used more than once, the first node is indexed.
+    """
+    __slots__ = tuple(sorted(_index_name_attributes))
+
+    def __init__(self, module):
+        for kind, attribute in _index_name_attributes.items():
+            nodes = getattr(module, kind)
+            setattr(self, kind, dict((getattr(node, attribute), node) for node in reversed(nodes)))
+
+    def find(self, kinds, name):
+        """
+        returns the node named name in the first of the indexes kinds containing it, or None if there is none.
+        """
+        for kind in kinds:
+            node = getattr(self, kind).get(name)
+            if node is not None:
+                return node
+        return None
+
+
 @a2l_node_type('MODULE')
 class Module(A2lNode):
     __slots__ = 'name', 'long_identifier', 'a2ml', 'mod_par', 'mod_common', 'if_data_xcp', 'if_data_module', \
                 'characteristic', 'axis_pts', 'measurement', 'compu_method', 'compu_tab', 'compu_vtab', \
                 'compu_vtab_range', 'function', 'group', 'record_layout', 'variant_coding', 'frame', 'user_rights', \
-                'unit'
+                'unit', '_index', '_converters'
 
     def __init__(self, name, long_identifier, args):
         self.name = name
@@ -914,8 +1243,74 @@ class Module(A2lNode):
         self.frame = None
         self.user_rights = list()
         self.unit = list()
+        self._index = None
+        self._converters = None
         super(Module, self).__init__(*args)
 
+    def get_index(self):
+        index = getattr(self, '_index', None)
+        if index is None:
+            index = self._index = A2lModuleIndex(self)
+        return index
+
+    def reset_index(self):
+        self._index = None
+
+    def duplicates(self, kind, ignored=('name',)):
+        """
+        returns the groups of children of this module of type kind (e.g. 'COMPU_METHOD') which are identical but their
+        ignored attributes (their name by default), compared by digest. the groups hold two nodes at least and follow
+        the order of the children, as the nodes in each group.
+        """
+        groups = collections.OrderedDict()
+        for node in self._children:
+            if node._node == kind:
+                groups.setdefault(node.digest(ignored), list()).append(node)
+        return [group for group in groups.values() if len(group) > 1]
+
+    def resolve(self, node, attribute):
+        """
+        returns the node referenced by the attribute of node (e.g. the COMPU_METHOD referenced by the conversion of a
+        CHARACTERISTIC), looked up in the index of this module, or None if it is not found (e.g. NO_COMPU_METHOD). a
+        list of nodes is returned for the attributes holding a list of names.
+        """
+        try:
+            kinds = _references[node.node(), attribute]
+        except KeyError:
+            raise ValueError('{0}.{1} is not a reference'.format(node.node(), attribute))
+        index = self.get_index()
+        value = getattr(node, attribute)
+        if isinstance(value, list):
+            return [index.find(kinds, v) for v in value]
+        return index.find(kinds, value)
+
+    def converter(self, name):
+        """
+        returns the converter (see conversion.A2lConverter) of the COMPU_METHOD named name, or an identical converter
+        for NO_COMPU_METHOD. the converters are built on first use and cached, reset_converters must be called after a
+        COMPU_METHOD or one of its tables is modified.
+        """
+        from .conversion import a2l_converter
+        converters = getattr(self, '_converters', None)
+        if converters is None:
+            converters = self._converters = dict()
+        try:
+            return converters[name]
+        except KeyError:
+            pass
+        compu_method = None
+        if name != 'NO_COMPU_METHOD':
+            compu_method = self.get_index().compu_method.get(name)
+            if compu_method is None:
+                raise ValueError('COMPU_METHOD {0} not found'.format(name))
+        converter = converters[name] = a2l_converter(compu_method, self)
+        return converter
+
+    def reset_converters(self):
+        self._converters = None
+
+    index = property(fget=get_index, fdel=reset_index)
+
 
 @a2l_node_type('MOD_COMMON')
 class ModCommon(A2lNode):
@@ -1445,7 +1840,7 @@ class VarAddress(A2lNode):
     __slots__ = 'address',
 
     def __init__(self, args):
-        self.address = list()
+        self.address = None
         super(VarAddress, self).__init__(*args)
 
 
@@ -1520,3 +1915,30 @@ def a2l_node_factory(node_type, *args, **kwargs):
         raise NotImplementedError(str(node_type))
     except:
         raise
+
+
+class A2lNodeFactory(object):
+    """
+    builds the nodes of a tree from the classes registered with a2l_node_type, overridden by custom_classes (a node
+    type to class dictionary). the mapping is copied when the factory is created, so that each parse has its own one
+    and the registry is never modified.
+    """
+    __slots__ = 'classes',
+
+    def __init__(self, custom_classes=None):
+        self.classes = dict(node_to_class)
+        if custom_classes:
+            self.classes.update(custom_classes)
+
+    def get_class(self, node_type):
+        try:
+            return self.classes[node_type]
+        except KeyError:
+            raise NotImplementedError(str(node_type))
+
+    def __call__(self, node_type, *args, **kwargs):
+        try:
+            cls = self.classes[node_type]
+        except KeyError:
+            raise NotImplementedError(str(node_type))
+        return cls(*args, **kwargs)
@@ -0,0 +1,73 @@
+"""
+@project: parser
+@file: parallel.py
+@author: Guillaume Sottas
+@date: 18.10.2026
+"""
+
+import re
+
+# matches the /begin and /end keywords (followed by the block name), skipping the strings and comments which may contain
+# them. the rest of the text is not tokenized.
+_block_re = re.compile(r'"(?:[^"\\]|\\.)*"|/\*[\s\S]*?\*/|//.+\n|/(begin|end)[ \t\r\n]+([A-Za-z_][A-Za-z0-9_]*)')
+
+# text wrapped around a part of a MODULE body, so that it can be parsed on its own.
+CHUNK_PREFIX = '/begin PROJECT _ "" /begin MODULE _ "" '
+CHUNK_SUFFIX = ' /end MODULE /end PROJECT'
+
+
+def new_process_pool(max_workers=None, initializer=None):
+    """
+    returns a concurrent.futures.ProcessPoolExecutor of max_workers processes, which call initializer when they start
+    if the executor supports it (python 3.7 and later). concurrent.futures is imported on first call, so that the
+    package can be imported with python 2 without the futures backport, an ImportError being raised here then.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    try:
+        return ProcessPoolExecutor(max_workers=max_workers, initializer=initializer)
+    except TypeError:
+        return ProcessPoolExecutor(max_workers=max_workers)
+
+
+def find_module_blocks(string):
+    """
+    returns, for each MODULE of string, the list of (start, end) positions of its children blocks (/begin ... /end
+    keyword), in order.
+    """
+    modules = list()
+    blocks = None
+    start = 0
+    depth = 0
+    for match in _block_re.finditer(string):
+        keyword = match.group(1)
+        if keyword == 'begin':
+            depth += 1
+            if depth == 2 and match.group(2) == 'MODULE':
+                blocks = list()
+                modules.append(blocks)
+            elif depth == 3:
+                start = match.start()
+        elif keyword == 'end':
+            if depth == 3 and blocks is not None:
+                blocks.append((start, match.end()))
+            elif depth == 2:
+                blocks = None
+            depth -= 1
+    return modules
+
+
+def split_module_blocks(modules, chunks):
+    """
+    groups the consecutive blocks of each module of modules (as returned by find_module_blocks) in about chunks parts of
+    similar sizes. returns the list of (module number, start, end) parts, in order.
+    """
+    size = sum(end - start for blocks in modules for start, end in blocks)
+    chunk_size = max(size // max(chunks, 1), 1)
+    parts = list()
+    for i, blocks in enumerate(modules):
+        first = 0
+        for j, (start, end) in enumerate(blocks):
+            if end - blocks[first][0] >= chunk_size or j == len(blocks) - 1:
+                parts.append((i, blocks[first][0], end))
+                first = j + 1
+    return parts
@@ -5,15 +5,55 @@
 @date: 20.03.2018
 """
 
+import collections
+import copy
+import functools
+import itertools
+import multiprocessing
 import os
+import pickle
+import threading
 import ply.yacc as yacc
 
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+try:
+    from concurrent.futures.process import BrokenProcessPool
+except ImportError:
+    BrokenProcessPool = RuntimeError
+
+from .cache import A2lTreeCache, tree_signature, DEFAULT_CACHE_SIZE
+from .fast_lexer import lexer as a2l_fast_lexer
+from .lexer import lexer as a2l_lexer
+from .lazy import A2lLazyLexer, A2lLazySource
 from .lexer import tokens as lex_tokens
 from .node import *
+from .parallel import CHUNK_PREFIX, CHUNK_SUFFIX, find_module_blocks, new_process_pool, split_module_blocks
+from .span import A2lSpanLexer, spanned_productions
+from .stream import A2lStreamLexer, iter_file_chunks, iter_stream_chunks, DEFAULT_CHUNK_SIZE
+
+_parser_engines = dict()
+_parser_engines_lock = threading.Lock()
+
+# productions of the parser engines recording the span of the attributes of the nodes (see span.spanned_productions).
+_span_productions = dict()
+
+_lexers = dict(ply=a2l_lexer, fast=a2l_fast_lexer)
+
+# maximum number of nodes parsed ahead of the consumer of A2lParser.iter_nodes.
+_node_queue_size = 64
+
+# number of parts of the MODULE bodies per worker process in parallel mode, so that the load is balanced.
+_parts_per_worker = 4
 
 
 class A2lFormatException(Exception):
     def __init__(self, message, position, string=None):
+        self.message = str(message)
+        self.position = position
         self.value = str(message) + str(position)
         if string:
             delta = 120
@@ -25,17 +65,361 @@ class A2lFormatException(Exception):
 
         super(A2lFormatException, self).__init__(self.value)
 
+    def __reduce__(self):
+        # the context of the error is not pickled (see A2lParser._parse_parallel).
+        return type(self), (self.message, self.position)
+
+
+class _StopParsing(Exception):
+    pass
+
+
+# A2ML tokens written without a white space before them, and the ones written without a white space after them.
+_a2ml_closing = frozenset((';', ',', ')', ']', '*'))
+_a2ml_opening = frozenset(('(', '['))
+
+
+def _a2ml_text(p):
+    """
+    returns the text of an A2ML rule, joining the values of its symbols: the text of its A2ML rules, and its tokens as
+    they are written in the source (the strings being quoted).
+    """
+    text = ''
+    for i in range(1, len(p)):
+        value = p[i]
+        if value is None:
+            continue
+        value = '"' + value + '"' if p.slice[i].type == 'STRING' else str(value)
+        if text and value not in _a2ml_closing and text[-1] not in _a2ml_opening:
+            text += ' '
+        text += value
+    return text
+
+
+def _new_lexer(name, spans=False):
+    try:
+        lexer = _lexers[name].clone()
+    except KeyError:
+        raise ValueError('unknown lexer \'{0}\' (expected one of {1})'.format(name, ', '.join(sorted(_lexers))))
+    return A2lSpanLexer(lexer) if spans else lexer
+
+
+def _check_spans(spans, workers, lazy):
+    if spans and (lazy or workers != 1):
+        raise ValueError('the spans can only be recorded by a sequential and complete parse (workers=1, lazy=False)')
+
+
+def _parse_module_blocks(cls, string, lexer, custom_classes):
+    """
+    parses a part of a MODULE body in a worker process, returning its (type, node) items in order.
+    """
+    items = list()
+
+    def node_sink(kind, node):
+        if isinstance(node, A2lNode):
+            node.set_parent(None)
+        items.append((kind.lower(), node))
+
+    cls.__new__(cls)._parse(CHUNK_PREFIX + string + CHUNK_SUFFIX, _new_lexer(lexer), custom_classes,
+                            node_sink=node_sink, node_index=False)
+    return items
+
+
+def _parse_lazy_block(cls, lexer, custom_classes, string):
+    """
+    parses the block of a lazy node, returning the node.
+    """
+    return _parse_module_blocks(cls, string, lexer, custom_classes)[0][1]
+
+
+def _lazy_node_factory(p, node_type, *args):
+    """
+    same as the node factory of the parser for the nodes which may be parsed lazily. in lazy mode, a lazy node is returned if the
+    optional section of the node has been skipped.
+    """
+    spans = p.parser.lazy_spans
+    if spans is not None:
+        span = spans.popleft()
+        if span is not None:
+            return p.parser.lazy_source.new_node(p.parser.node_factory.get_class(node_type), args[:-1], *span)
+    return p.parser.node_factory(node_type, *args)
+
 
 class A2lParser(object):
     tokens = lex_tokens
 
-    def __init__(self, string, **custom_classes):
+    def __init__(self, string, lexer='ply', node_index=True, workers=1, lazy=False, spans=False, **custom_classes):
+        """
+        parses string. lexer selects the tokenizer, either 'ply' (the PLY lexer) or 'fast' (a faster hand-written
+        tokenizer producing the same tokens). if node_index is True, the node type index used by get_node is built
+        along with the tree rather than on first call. if workers is not 1, the MODULE bodies are parsed in parallel
+        by this number of processes (the number of processors if None), see _parse_parallel. if lazy is True, the tree
+        is built in lazy mode (see _parse_lazy), workers being ignored. if spans is True, the span of the attributes of
+        the nodes in string is recorded (see A2lNode.get_span), which requires a sequential and complete parse.
+        """
+        _check_spans(spans, workers, lazy)
+        if lazy:
+            self._parse_lazy(string, lexer, custom_classes)
+        elif workers == 1:
+            self._parse(string, _new_lexer(lexer, spans), custom_classes, node_index=node_index, spans=spans)
+        else:
+            self._parse_parallel(string, lexer, custom_classes, node_index, workers)
+
+    def _parse(self, string, lexer, custom_classes, node_sink=None, node_index=True, module_bodies=None,
+               lazy_source=None, spans=False):
         self.tree = None
-        for node, cls in custom_classes.items():
-            node_to_class[node] = cls
-        self._yacc = yacc.yacc(debug=True, module=self, optimize=True,
-                               outputdir=os.path.dirname(os.path.realpath(__file__)))
-        self._yacc.parse(string)
+        self._yacc = copy.copy(self.warmup())
+        self._yacc.node_factory = A2lNodeFactory(custom_classes)
+        self._yacc.node_sink = node_sink
+        self._yacc.node_index = node_index
+        self._yacc.module_bodies = module_bodies
+        self._yacc.lazy_source = lazy_source
+        self._yacc.lazy_spans = None
+        if lazy_source is not None:
+            lexer = A2lLazyLexer(lexer)
+            self._yacc.lazy_spans = lexer.spans
+        if spans:
+            self._yacc.productions = self.span_productions()
+        self.tree = self._yacc.parse(string, lexer=lexer)
+
+    def _parse_lazy(self, string, lexer, custom_classes):
+        """
+        parses string in lazy mode: the CHARACTERISTIC, MEASUREMENT and AXIS_PTS nodes are built from their header only
+        (their mandatory attributes), the tokenizer skipping their optional section. the other attributes (and the
+        children) of such a node are parsed from its block the first time one of them is accessed, so that the errors
+        in these sections are only raised then. the text is kept by the tree until all of its lazy nodes are loaded.
+
+        the node type index is built on first call of get_node, which loads all the nodes.
+        """
+        parse = functools.partial(_parse_lazy_block, type(self), lexer, custom_classes)
+        self._parse(string, _new_lexer(lexer), custom_classes, node_index=False,
+                    lazy_source=A2lLazySource(string, parse))
+
+    def _parse_parallel(self, string, lexer, custom_classes, node_index, workers):
+        """
+        parses string, the children blocks of its MODULE nodes being split in parts of similar sizes which are parsed
+        by a pool of worker processes. the rest of the text is then parsed with the MODULE bodies replaced by the
+        parsed parts, in order, so that the tree is the same as the one of a sequential parse. the position of the
+        syntax errors is the one in string, as for a sequential parse.
+
+        string is parsed sequentially if the custom classes cannot be sent to the worker processes, or if the pool
+        cannot be started (concurrent.futures being missing with python 2 without the futures backport).
+        """
+        workers = workers or multiprocessing.cpu_count()
+        modules = find_module_blocks(string)
+        parts = split_module_blocks(modules, workers * _parts_per_worker)
+        if len(parts) < 2:
+            return self._parse(string, _new_lexer(lexer), custom_classes, node_index=node_index)
+        try:
+            pickle.dumps(custom_classes)
+        except Exception:
+            return self._parse(string, _new_lexer(lexer), custom_classes, node_index=node_index)
+        bodies = [list() for _ in modules]
+        try:
+            with new_process_pool(workers, type(self).warmup) as executor:
+                results = executor.map(_parse_module_blocks, itertools.repeat(type(self)),
+                                       (string[start:end] for _, start, end in parts), itertools.repeat(lexer),
+                                       itertools.repeat(custom_classes))
+                part = None
+                try:
+                    for part, items in zip(parts, results):
+                        bodies[part[0]].extend(items)
+                except A2lFormatException as e:
+                    # the error is located in the part following the last one received.
+                    part = parts[parts.index(part) + 1 if part is not None else 0]
+                    position = min(max(e.position - len(CHUNK_PREFIX), 0), part[2] - part[1])
+                    raise A2lFormatException(e.message, part[1] + position, string=string)
+        except (ImportError, OSError, NotImplementedError, BrokenProcessPool):
+            return self._parse(string, _new_lexer(lexer), custom_classes, node_index=node_index)
+        skeleton = list()
+        offsets = list()
+        position = 0
+        length = 0
+        for blocks in modules:
+            if blocks:
+                offsets.append((length, position))
+                skeleton.append(string[position:blocks[0][0]])
+                length += len(skeleton[-1])
+                position = blocks[-1][1]
+        offsets.append((length, position))
+        skeleton.append(string[position:])
+        module_bodies = collections.deque(bodies)
+        try:
+            self._parse(''.join(skeleton), _new_lexer(lexer), custom_classes, node_index=node_index,
+                        module_bodies=module_bodies)
+        except A2lFormatException as e:
+            start, position = next((s, p) for s, p in reversed(offsets) if s <= e.position)
+            raise A2lFormatException(e.message, position + e.position - start, string=string)
+        if module_bodies:
+            raise ValueError('unexpected number of MODULE nodes')
+
+    @classmethod
+    def from_stream(cls, fp, chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8', lexer='ply', node_index=True,
+                    spans=False, **custom_classes):
+        """
+        parses the content of the file object fp, which is read by chunks of chunk_size. binary file objects are
+        decoded using the specified encoding. the spans are recorded as done by A2lParser() if spans is True, as
+        positions in the decoded text.
+        """
+        parser = cls.__new__(cls)
+        chunks = iter_stream_chunks(fp, chunk_size, encoding)
+        parser._parse(None, A2lStreamLexer(chunks, lexer=_new_lexer(lexer, spans)), custom_classes,
+                      node_index=node_index, spans=spans)
+        return parser
+
+    @classmethod
+    def from_file(cls, path, chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8', lexer='ply', node_index=True,
+                  cache_dir=None, cache_size=DEFAULT_CACHE_SIZE, workers=1, lazy=False, spans=False, **custom_classes):
+        """
+        parses the file located at path, which is memory-mapped and decoded by chunks of chunk_size bytes using the
+        specified encoding. if workers is not 1, the decoded file is parsed in parallel, if lazy is True, in lazy mode,
+        and the spans are recorded if spans is True (as positions in the decoded text), as done by A2lParser(). the
+        snapshot cache is not used in lazy mode or if spans is True, the spans not being stored in the snapshots.
+
+        if cache_dir is specified, the tree is loaded from a snapshot stored in this directory when the file has
+        already been parsed, and a snapshot is stored otherwise. the cache is limited to cache_size bytes, the least
+        recently used snapshots being removed first.
+        """
+        _check_spans(spans, workers, lazy)
+        cache = None
+        if cache_dir is not None and not lazy and not spans:
+            cache = A2lTreeCache(cache_dir, tree_signature(A2lNodeFactory(custom_classes).classes), cache_size)
+            key = cache.key(path, encoding)
+            tree = cache.load(key)
+            if tree is not None:
+                parser = cls.__new__(cls)
+                parser.tree = tree
+                return parser
+        chunks = iter_file_chunks(path, chunk_size, encoding)
+        try:
+            parser = cls.__new__(cls)
+            if lazy:
+                parser._parse_lazy(''.join(chunks), lexer, custom_classes)
+            elif workers == 1:
+                parser._parse(None, A2lStreamLexer(chunks, lexer=_new_lexer(lexer, spans)), custom_classes,
+                              node_index=node_index, spans=spans)
+            else:
+                parser._parse_parallel(''.join(chunks), lexer, custom_classes, node_index, workers)
+        finally:
+            chunks.close()
+        if cache is not None:
+            cache.store(key, parser.tree)
+        return parser
+
+    @classmethod
+    def iter_nodes(cls, source, kinds=None, chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8', lexer='ply',
+                   **custom_classes):
+        """
+        yields the children of the MODULE nodes of source (a path or a file object) as soon as their /end keyword is
+        parsed, without building the tree. kinds is a set of MODULE attribute names in upper case (e.g.
+        {'MEASUREMENT'}) restricting the yielded nodes, all of them being yielded if None.
+
+        the nodes are dropped by the parser once yielded, so that the memory usage is bounded by the largest block
+        rather than by the size of the file. the parsing runs in a background thread, a few nodes ahead of the
+        consumer.
+        """
+        kinds = None if kinds is None else frozenset(kinds)
+        stream_lexer = _new_lexer(lexer)
+        nodes = queue.Queue(maxsize=_node_queue_size)
+        stop = threading.Event()
+
+        def put(item):
+            while True:
+                try:
+                    return nodes.put(item, timeout=0.1)
+                except queue.Full:
+                    if stop.is_set():
+                        raise _StopParsing()
+
+        def node_sink(kind, node):
+            if stop.is_set():
+                raise _StopParsing()
+            if kinds is None or kind in kinds:
+                put((node, None))
+
+        def run():
+            if hasattr(source, 'read'):
+                chunks = iter_stream_chunks(source, chunk_size, encoding)
+            else:
+                chunks = iter_file_chunks(source, chunk_size, encoding)
+            try:
+                cls.__new__(cls)._parse(None, A2lStreamLexer(chunks, lexer=stream_lexer), custom_classes,
+                                        node_sink=node_sink, node_index=False)
+                put((None, None))
+            except _StopParsing:
+                pass
+            except Exception as e:
+                put((None, e))
+            finally:
+                chunks.close()
+
+        thread = threading.Thread(target=run)
+        thread.daemon = True
+        thread.start()
+        try:
+            while True:
+                node, error = nodes.get()
+                if error is not None:
+                    raise error
+                if node is None:
+                    break
+                yield node
+        finally:
+            stop.set()
+            thread.join()
+
+    @classmethod
+    def parse_async(cls, data, executor=None, semaphore=None, encoding='utf-8', pickled=False, **options):
+        """
+        returns a coroutine parsing data (a string, or bytes decoded using the specified encoding) in executor, so that
+        the event loop is not blocked. the result is an instance of this class, as returned by A2lParser(data,
+        **options), or the pickled tree if pickled is True (which avoids loading it in the calling process when it is
+        only stored or forwarded).
+
+        the parses run in a process pool shared by the calling process if executor is None (whose workers build the
+        parser tables when they start), the tree being transferred in its pickled form. a thread pool can be used as
+        well, but the parses then hold the GIL. the coroutine waits for semaphore (an asyncio.Semaphore) before
+        submitting the parse, so that a burst of requests does not fill the executor queue. by default, each event
+        loop allows DEFAULT_CONCURRENCY parses at once.
+
+        cancelling the coroutine before the parse has started removes it from the executor queue. a parse which is
+        already running cannot be interrupted: it completes in the background and its result is dropped.
+        """
+        from .aio import parse_async
+        return parse_async(cls, data, executor, semaphore, encoding, pickled, **options)
+
+    @classmethod
+    def warmup(cls):
+        """
+        returns the LALR parser engine of this grammar, building it on first call only.
+
+        the parse tables and the p_* rules reflection are shared by all instances of the class, so that the cost of
+        building them is paid once per process. each instance parses with a shallow copy of the engine, as the parsing
+        stacks are stored on it.
+        """
+        try:
+            return _parser_engines[cls]
+        except KeyError:
+            with _parser_engines_lock:
+                if cls not in _parser_engines:
+                    _parser_engines[cls] = yacc.yacc(debug=False, module=cls, optimize=True,
+                                                     outputdir=os.path.dirname(os.path.realpath(__file__)))
+            return _parser_engines[cls]
+
+    @classmethod
+    def span_productions(cls):
+        """
+        returns the productions of the parser engine of this grammar recording the span of the attributes of the nodes,
+        building them on first call only.
+        """
+        try:
+            return _span_productions[cls]
+        except KeyError:
+            productions = cls.warmup().productions
+            with _parser_engines_lock:
+                if cls not in _span_productions:
+                    _span_productions[cls] = spanned_productions(productions)
+            return _span_productions[cls]
 
     def get_node(self, node_name):
         if self.tree:
@@ -50,10 +434,12 @@ class A2lParser(object):
         else:
             raise A2lFormatException('unvalid sequence in root node ', 0, string='')
 
-    def p_a2l(self, p):
+    @staticmethod
+    def p_a2l(p):
         """a2l : a2l_optional_list_optional"""
-        p[0] = a2l_node_factory('ROOT', p[1])
-        self.tree = p[0]
+        p[0] = p.parser.node_factory('ROOT', p[1])
+        if p.parser.node_index and isinstance(p[0], A2lFile):
+            p[0].get_node_index()
 
     @staticmethod
     def p_a2l_optional(p):
@@ -65,11 +451,12 @@ class A2lParser(object):
     @staticmethod
     def p_a2l_optional_list(p):
         """a2l_optional_list : a2l_optional
-                             | a2l_optional a2l_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                             | a2l_optional_list a2l_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_a2l_optional_list_optional(p):
@@ -86,11 +473,12 @@ class A2lParser(object):
     @staticmethod
     def p_a2ml_declaration_list(p):
         """a2ml_declaration_list : a2ml_declaration
-                                 | a2ml_declaration a2ml_declaration_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                 | a2ml_declaration_list a2ml_declaration"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_a2ml_type_definition(p):
@@ -121,36 +509,31 @@ class A2lParser(object):
     @staticmethod
     def p_a2ml_block_definition(p):
         """a2ml_block_definition : block a2ml_tag a2ml_type_name"""
+        p[0] = _a2ml_text(p)
 
     @staticmethod
     def p_a2ml_enum_type_name(p):
         """a2ml_enum_type_name : enum a2ml_identifier_optional CURLY_OPEN a2ml_enumerator_list CURLY_CLOSE
                                | enum a2ml_identifier"""
-        try:
-            p[0] = [p[2]] + p[4]
-        except IndexError:
-            p[0] = [p[2]]
+        p[0] = _a2ml_text(p)
 
     @staticmethod
     def p_a2ml_enumerator_list(p):
         """a2ml_enumerator_list : a2ml_enumerator
-                                | a2ml_enumerator COMMA a2ml_enumerator_list"""
-        try:
-            p[0] = [p[1]] + p[3]
-        except IndexError:
-            p[0] = [p[1]]
+                                | a2ml_enumerator_list COMMA a2ml_enumerator"""
+        p[0] = _a2ml_text(p)
 
     @staticmethod
     def p_a2ml_enumerator(p):
         """a2ml_enumerator : a2ml_keyword EQUAL a2ml_constant
                            | a2ml_keyword"""
-        p[0] = p[1]
+        p[0] = _a2ml_text(p)
 
     @staticmethod
     def p_a2ml_struct_type_name(p):
         """a2ml_struct_type_name : struct a2ml_identifier_optional CURLY_OPEN a2ml_struct_member_list_optional CURLY_CLOSE
                                  | struct a2ml_identifier"""
-        p[0] = p[1]
+        p[0] = _a2ml_text(p)
 
     @staticmethod
     def p_a2ml_struct_member_list_optional(p):
@@ -161,21 +544,18 @@ class A2lParser(object):
     @staticmethod
     def p_a2ml_struct_member_list(p):
         """a2ml_struct_member_list : a2ml_struct_member
-                                   | a2ml_struct_member a2ml_struct_member_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
-            p[0] = [p[1]]
+                                   | a2ml_struct_member_list a2ml_struct_member"""
+        p[0] = _a2ml_text(p)
 
     @staticmethod
     def p_a2ml_struct_member(p):
         """a2ml_struct_member : a2ml_member SEMICOLON"""
-        p[0] = p[1]
+        p[0] = _a2ml_text(p)
 
     @staticmethod
     def p_a2ml_member(p):
         """a2ml_member : a2ml_type_name a2ml_array_specifier_optional"""
-        p[0] = p[1]
+        p[0] = _a2ml_text(p)
 
     @staticmethod
     def p_a2ml_member_optional(p):
@@ -193,13 +573,13 @@ class A2lParser(object):
     def p_a2ml_array_specifier(p):
         """a2ml_array_specifier : BRACE_OPEN a2ml_constant BRACE_CLOSE
                                 | BRACE_OPEN a2ml_constant BRACE_CLOSE a2ml_array_specifier"""
-        p[0] = p[1]
+        p[0] = _a2ml_text(p)
 
     @staticmethod
     def p_a2ml_taggedstruct_type_name(p):
         """a2ml_taggedstruct_type_name : taggedstruct a2ml_identifier_optional CURLY_OPEN a2ml_taggedstruct_member_list_optional CURLY_CLOSE
                                        | taggedstruct a2ml_identifier"""
-        p[0] = p[1]
+        p[0] = _a2ml_text(p)
 
     @staticmethod
     def p_a2ml_taggedstruct_member_list_optional(p):
@@ -210,11 +590,8 @@ class A2lParser(object):
     @staticmethod
     def p_a2ml_taggedstruct_member_list(p):
         """a2ml_taggedstruct_member_list : a2ml_taggedstruct_member
-                                         | a2ml_taggedstruct_member a2ml_taggedstruct_member_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
-            p[0] = [p[1]]
+                                         | a2ml_taggedstruct_member_list a2ml_taggedstruct_member"""
+        p[0] = _a2ml_text(p)
 
     @staticmethod
     def p_a2ml_taggedstruct_member(p):
@@ -222,59 +599,65 @@ class A2lParser(object):
                                     | PARENTHESE_OPEN a2ml_taggedstruct_definition PARENTHESE_CLOSE ASTERISK SEMICOLON
                                     | a2ml_block_definition SEMICOLON
                                     | PARENTHESE_OPEN a2ml_block_definition PARENTHESE_CLOSE ASTERISK SEMICOLON"""
+        p[0] = _a2ml_text(p)
 
     @staticmethod
     def p_a2ml_taggedstruct_definition(
             p):  # TODO: check if the optional member is really optional (seems to be optional in example).
         """a2ml_taggedstruct_definition : a2ml_tag a2ml_member_optional
                                         | a2ml_tag PARENTHESE_OPEN a2ml_member PARENTHESE_CLOSE ASTERISK"""
+        p[0] = _a2ml_text(p)
 
     @staticmethod
     def p_a2ml_taggedunion_type_name(p):
         """a2ml_taggedunion_type_name : taggedunion a2ml_identifier_optional CURLY_OPEN a2ml_taggedunion_member_list_optional CURLY_CLOSE
                                       | taggedunion a2ml_identifier"""
+        p[0] = _a2ml_text(p)
 
     @staticmethod
     def p_a2ml_taggedunion_member_list(p):
         """a2ml_taggedunion_member_list : a2ml_taggedunion_member
-                                        | a2ml_taggedunion_member a2ml_taggedunion_member_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
-            p[0] = [p[1]]
+                                        | a2ml_taggedunion_member_list a2ml_taggedunion_member"""
+        p[0] = _a2ml_text(p)
 
     @staticmethod
     def p_a2ml_taggedunion_member_list_optional(p):
         """a2ml_taggedunion_member_list_optional : empty
                                                  | a2ml_taggedunion_member_list"""
-        p[0] = tuple() if p[1] is None else p[1]
+        p[0] = p[1]
 
     @staticmethod
     def p_a2ml_taggedunion_member(p):
         """a2ml_taggedunion_member : a2ml_tag SEMICOLON
                                    | a2ml_tag a2ml_member SEMICOLON
                                    | a2ml_block_definition SEMICOLON"""
+        p[0] = _a2ml_text(p)
 
     @staticmethod
     def p_a2ml_tag(p):
         """a2ml_tag : STRING"""
+        p[0] = _a2ml_text(p)
 
     @staticmethod
     def p_a2ml_identifier(p):
         """a2ml_identifier : IDENT"""
+        p[0] = _a2ml_text(p)
 
     @staticmethod
     def p_a2ml_identifier_optional(p):
         """a2ml_identifier_optional : empty
                                     | a2ml_identifier"""
+        p[0] = p[1]
 
     @staticmethod
     def p_a2ml_keyword(p):
         """a2ml_keyword : STRING"""
+        p[0] = _a2ml_text(p)
 
     @staticmethod
     def p_a2ml_constant(p):
         """a2ml_constant : NUMERIC"""
+        p[0] = _a2ml_text(p)
 
     @staticmethod
     def p_datatype(p):
@@ -314,12 +697,12 @@ class A2lParser(object):
     @staticmethod
     def p_asap2_version(p):
         """asap2_version : ASAP2_VERSION NUMERIC NUMERIC"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_a2ml_version(p):
         """a2ml_version : A2ML_VERSION NUMERIC NUMERIC"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_generic_parameter(p):
@@ -331,11 +714,12 @@ class A2lParser(object):
     @staticmethod
     def p_generic_parameter_list(p):
         """generic_parameter_list : generic_parameter
-                                  | generic_parameter generic_parameter_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                  | generic_parameter_list generic_parameter"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_generic_parameter_list_optional(p):
@@ -345,34 +729,37 @@ class A2lParser(object):
     @staticmethod
     def p_number_list(p):
         """number_list : NUMERIC
-                       | NUMERIC number_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                       | number_list NUMERIC"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_ident_list(p):
         """ident_list : IDENT
-                      | IDENT ident_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                      | ident_list IDENT"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_string_list(p):
         """string_list : STRING
-                       | STRING string_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                       | string_list STRING"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_project(p):
         """project : begin PROJECT IDENT STRING project_optional_list_optional end PROJECT"""
-        p[0] = a2l_node_factory(*p[2:6])
+        p[0] = p.parser.node_factory(*p[2:6])
 
     @staticmethod
     def p_project_optional(p):
@@ -383,11 +770,12 @@ class A2lParser(object):
     @staticmethod
     def p_project_optional_list(p):
         """project_optional_list : project_optional
-                                 | project_optional project_optional_list """
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                 | project_optional_list project_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_project_optional_list_optional(p):
@@ -398,7 +786,7 @@ class A2lParser(object):
     @staticmethod
     def p_header(p):
         """header : begin HEADER STRING header_optional_list_optional end HEADER"""
-        p[0] = a2l_node_factory(*p[2:5])
+        p[0] = p.parser.node_factory(*p[2:5])
 
     @staticmethod
     def p_header_optional(p):
@@ -409,11 +797,12 @@ class A2lParser(object):
     @staticmethod
     def p_header_optional_list(p):
         """header_optional_list : header_optional
-                                | header_optional header_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                | header_optional_list header_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_header_optional_list_optional(p):
@@ -434,7 +823,10 @@ class A2lParser(object):
     @staticmethod
     def p_module(p):
         """module : begin MODULE IDENT STRING module_optional_list_optional end MODULE"""
-        p[0] = a2l_node_factory(*p[2:6])
+        if p.parser.module_bodies:
+            p[0] = p.parser.node_factory(p[2], p[3], p[4], list(p[5]) + p.parser.module_bodies.popleft())
+        else:
+            p[0] = p.parser.node_factory(*p[2:6])
 
     @staticmethod
     def p_module_optional(p):
@@ -457,16 +849,21 @@ class A2lParser(object):
                            | frame
                            | user_rights
                            | unit"""
-        p[0] = p.slice[1].type, p[1]
+        if p.parser.node_sink is None:
+            p[0] = p.slice[1].type, p[1]
+        else:
+            p.parser.node_sink(p.slice[1].type.upper(), p[1])
 
     @staticmethod
     def p_module_optional_list(p):
         """module_optional_list : module_optional
-                                | module_optional module_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
-            p[0] = [p[1]]
+                                | module_optional_list module_optional"""
+        if len(p) == 2:
+            p[0] = [] if p[1] is None else [p[1]]
+        else:
+            p[0] = p[1]
+            if p[2] is not None:
+                p[0].append(p[2])
 
     @staticmethod
     def p_module_optional_list_optional(p):
@@ -482,7 +879,7 @@ class A2lParser(object):
     @staticmethod
     def p_if_data_xcp(p):
         """if_data_xcp : begin IF_DATA XCP if_data_xcp_optional_list_optional end IF_DATA"""
-        p[0] = a2l_node_factory('if_data_xcp', p[4])
+        p[0] = p.parser.node_factory('if_data_xcp', p[4])
 
     @staticmethod
     def p_if_data_xcp_optional(p):
@@ -499,7 +896,7 @@ class A2lParser(object):
     @staticmethod
     def p_xcp_on_can(p):
         """xcp_on_can : begin XCP_ON_CAN NUMERIC xcp_on_can_optional_list_optional end XCP_ON_CAN"""
-        p[0] = a2l_node_factory(*p[2:5])
+        p[0] = p.parser.node_factory(*p[2:5])
 
     @staticmethod
     def p_xcp_on_can_optional(p):
@@ -518,11 +915,12 @@ class A2lParser(object):
     @staticmethod
     def p_xcp_on_can_optional_list(p):
         """xcp_on_can_optional_list : xcp_on_can_optional
-                                    | xcp_on_can_optional xcp_on_can_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                    | xcp_on_can_optional_list xcp_on_can_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_xcp_on_can_optional_list_optional(p):
@@ -580,7 +978,7 @@ class A2lParser(object):
     @staticmethod
     def p_daq_list_can_id(p):
         """daq_list_can_id : begin DAQ_LIST_CAN_ID NUMERIC daq_list_can_id_optional_optional end DAQ_LIST_CAN_ID"""
-        p[0] = a2l_node_factory(*p[2:5])
+        p[0] = p.parser.node_factory(*p[2:5])
 
     @staticmethod
     def p_daq_list_can_id_optional(p):
@@ -608,7 +1006,7 @@ class A2lParser(object):
     def p_daq_event(p):
         """daq_event : begin DAQ_EVENT FIXED_EVENT_LIST daq_event_optional_list_optional end DAQ_EVENT
                      | begin DAQ_EVENT VARIABLE daq_event_optional_list_optional end DAQ_EVENT"""
-        p[0] = a2l_node_factory(*p[2:5])
+        p[0] = p.parser.node_factory(*p[2:5])
 
     @staticmethod
     def p_daq_event_optional(p):
@@ -619,11 +1017,12 @@ class A2lParser(object):
     @staticmethod
     def p_daq_event_optional_list(p):
         """daq_event_optional_list : daq_event_optional
-                                   | daq_event_optional daq_event_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                   | daq_event_optional_list daq_event_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_daq_event_optional_list_optional(p):
@@ -634,12 +1033,12 @@ class A2lParser(object):
     @staticmethod
     def p_default_event_list(p):
         """default_event_list : begin DEFAULT_EVENT_LIST available_event_list_optional_list_optional end DEFAULT_EVENT_LIST"""
-        p[0] = a2l_node_factory(*p[2:4])
+        p[0] = p.parser.node_factory(*p[2:4])
 
     @staticmethod
     def p_available_event_list(p):
         """available_event_list : begin AVAILABLE_EVENT_LIST available_event_list_optional_list_optional end AVAILABLE_EVENT_LIST"""
-        p[0] = a2l_node_factory(*p[2:4])
+        p[0] = p.parser.node_factory(*p[2:4])
 
     @staticmethod
     def p_available_event_list_optional(p):
@@ -649,11 +1048,12 @@ class A2lParser(object):
     @staticmethod
     def p_available_event_list_optional_list(p):
         """available_event_list_optional_list : available_event_list_optional
-                                              | available_event_list_optional available_event_list_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                              | available_event_list_optional_list available_event_list_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_available_event_list_optional_list_optional(p):
@@ -664,11 +1064,12 @@ class A2lParser(object):
     @staticmethod
     def p_if_data_xcp_optional_list(p):
         """if_data_xcp_optional_list : if_data_xcp_optional
-                                     | if_data_xcp_optional if_data_xcp_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                     | if_data_xcp_optional_list if_data_xcp_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_if_data_xcp_optional_list_optional(p):
@@ -679,12 +1080,12 @@ class A2lParser(object):
     @staticmethod
     def p_pag(p):
         """pag : begin PAG NUMERIC pag_optional_list_optional end PAG"""
-        p[0] = a2l_node_factory(*p[2:5])
+        p[0] = p.parser.node_factory(*p[2:5])
 
     @staticmethod
     def p_pgm(p):
         """pgm : begin PGM IDENT NUMERIC NUMERIC pgm_optional_list_optional end PGM"""
-        p[0] = a2l_node_factory(*p[2:7])
+        p[0] = p.parser.node_factory(*p[2:7])
 
     @staticmethod
     def p_pgm_optional(p):
@@ -695,11 +1096,12 @@ class A2lParser(object):
     @staticmethod
     def p_pgm_optional_list(p):
         """pgm_optional_list : pgm_optional
-                             | pgm_optional pgm_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                             | pgm_optional_list pgm_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_pgm_optional_list_optional(p):
@@ -710,7 +1112,7 @@ class A2lParser(object):
     @staticmethod
     def p_sector(p):
         """sector : begin SECTOR STRING NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC end SECTOR"""
-        p[0] = a2l_node_factory(*p[2:10])
+        p[0] = p.parser.node_factory(*p[2:10])
 
     @staticmethod
     def p_pag_optional(p):
@@ -721,11 +1123,12 @@ class A2lParser(object):
     @staticmethod
     def p_pag_optional_list(p):
         """pag_optional_list : pag_optional
-                             | pag_optional pag_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                             | pag_optional_list pag_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_pag_optional_list_optional(p):
@@ -741,7 +1144,7 @@ class A2lParser(object):
     @staticmethod
     def p_daq(p):
         """daq : begin DAQ daq_config_type NUMERIC NUMERIC NUMERIC optimisation_type address_extension identification_field_type granularity_odt_entry NUMERIC overload_indication daq_optional_list_optional end DAQ"""
-        p[0] = a2l_node_factory(*p[2:14])
+        p[0] = p.parser.node_factory(*p[2:14])
 
     @staticmethod
     def p_daq_config_type(p):
@@ -817,11 +1220,12 @@ class A2lParser(object):
     @staticmethod
     def p_daq_optional_list(p):
         """daq_optional_list : daq_optional
-                             | daq_optional daq_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                             | daq_optional_list daq_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_daq_optional_list_optional(p):
@@ -832,12 +1236,12 @@ class A2lParser(object):
     @staticmethod
     def p_event(p):
         """event : begin EVENT STRING STRING NUMERIC daq_list_type_enum NUMERIC NUMERIC NUMERIC NUMERIC end EVENT"""
-        p[0] = a2l_node_factory(*p[2:11])
+        p[0] = p.parser.node_factory(*p[2:11])
 
     @staticmethod
     def p_daq_list(p):
         """daq_list : begin DAQ_LIST NUMERIC daq_list_optional_list_optional end DAQ_LIST"""
-        p[0] = a2l_node_factory(*p[2:5])
+        p[0] = p.parser.node_factory(*p[2:5])
 
     @staticmethod
     def p_daq_list_optional(p):
@@ -889,11 +1293,12 @@ class A2lParser(object):
     @staticmethod
     def p_daq_list_optional_list(p):
         """daq_list_optional_list : daq_list_optional
-                                  | daq_list_optional daq_list_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                  | daq_list_optional_list daq_list_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_daq_list_optional_list_optional(p):
@@ -904,7 +1309,7 @@ class A2lParser(object):
     @staticmethod
     def p_timestamp_supported(p):
         """timestamp_supported : begin TIMESTAMP_SUPPORTED NUMERIC IDENT IDENT timestamp_fixed end TIMESTAMP_SUPPORTED"""
-        p[0] = a2l_node_factory(*p[2:7])
+        p[0] = p.parser.node_factory(*p[2:7])
 
     @staticmethod
     def p_timestamp_fixed(p):
@@ -915,7 +1320,7 @@ class A2lParser(object):
     @staticmethod
     def p_protocol_layer(p):
         """protocol_layer : begin PROTOCOL_LAYER NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC protocol_layer_optional_list_optional end PROTOCOL_LAYER"""
-        p[0] = a2l_node_factory(*p[2:13])
+        p[0] = p.parser.node_factory(*p[2:13])
 
     @staticmethod
     def p_protocol_layer_optional(p):
@@ -924,11 +1329,12 @@ class A2lParser(object):
     @staticmethod
     def p_protocol_layer_optional_list(p):
         """protocol_layer_optional_list : protocol_layer_optional
-                                        | protocol_layer_optional protocol_layer_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                        | protocol_layer_optional_list protocol_layer_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_protocol_layer_optional_list_optional(p):
@@ -939,7 +1345,7 @@ class A2lParser(object):
     @staticmethod
     def p_if_data_module(p):
         """if_data_module : begin IF_DATA IDENT if_data_module_optional_list_optional end IF_DATA"""
-        p[0] = a2l_node_factory('if_data_module', *p[3:5])
+        p[0] = p.parser.node_factory('if_data_module', *p[3:5])
 
     @staticmethod  # TODO: protocol_layer, daq and xcp_on_can are not available in rev.1.51...
     def p_if_data_module_optional(p):
@@ -955,11 +1361,12 @@ class A2lParser(object):
     @staticmethod
     def p_if_data_module_optional_list(p):
         """if_data_module_optional_list : if_data_module_optional
-                                        | if_data_module_optional if_data_module_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                        | if_data_module_optional_list if_data_module_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_if_data_module_optional_list_optional(p):
@@ -974,31 +1381,31 @@ class A2lParser(object):
     @staticmethod
     def p_source(p):
         """source : begin SOURCE IDENT NUMERIC NUMERIC source_optional_list_optional end SOURCE"""
-        p[0] = a2l_node_factory(*p[2:7])
+        p[0] = p.parser.node_factory(*p[2:7])
 
     @staticmethod
     def p_raster(p):
         """raster : begin RASTER STRING STRING NUMERIC NUMERIC NUMERIC end RASTER"""
-        p[0] = a2l_node_factory(*p[2:8])
+        p[0] = p.parser.node_factory(*p[2:8])
 
     @staticmethod
     def p_event_group(p):
         """event_group : begin EVENT_GROUP STRING STRING number_list end EVENT_GROUP"""
-        p[0] = a2l_node_factory(*p[2:6])
+        p[0] = p.parser.node_factory(p[2], p[3], p[4], a2l_number_array(p[5]))
 
     @staticmethod
     def p_seed_key(p):
         """seed_key : begin SEED_KEY STRING STRING STRING end SEED_KEY"""
-        p[0] = a2l_node_factory(*p[2:6])
+        p[0] = p.parser.node_factory(*p[2:6])
 
     @staticmethod  # TODO: ident ident numeric pattern is not part of the specification, check...
     def p_checksum(p):
         """checksum : begin CHECKSUM STRING end CHECKSUM
                     | begin CHECKSUM IDENT max_block_size end CHECKSUM"""
         try:
-            p[0] = a2l_node_factory(*p[2:3])  # TODO: add support for both descriptions.
+            p[0] = p.parser.node_factory(*p[2:3])  # TODO: add support for both descriptions.
         except TypeError:
-            p[0] = a2l_node_factory(*p[2:5])
+            p[0] = p.parser.node_factory(*p[2:5])
 
     @staticmethod
     def p_max_block_size(p):
@@ -1024,11 +1431,12 @@ class A2lParser(object):
     @staticmethod
     def p_source_optional_list(p):
         """source_optional_list : source_optional
-                                | source_optional source_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                | source_optional_list source_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_source_optional_list_optional(p):
@@ -1043,7 +1451,7 @@ class A2lParser(object):
     @staticmethod
     def p_mod_par(p):
         """mod_par : begin MOD_PAR STRING mod_par_optional_list_optional end MOD_PAR"""
-        p[0] = a2l_node_factory(*p[2:5])
+        p[0] = p.parser.node_factory(*p[2:5])
 
     @staticmethod
     def p_mod_par_optional(p):
@@ -1068,11 +1476,12 @@ class A2lParser(object):
     @staticmethod
     def p_mod_par_optional_list(p):
         """mod_par_optional_list : mod_par_optional
-                                 | mod_par_optional mod_par_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                 | mod_par_optional_list mod_par_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_mod_par_optional_list_optional(p):
@@ -1118,7 +1527,7 @@ class A2lParser(object):
     @staticmethod
     def p_mod_common(p):
         """mod_common : begin MOD_COMMON STRING mod_common_optional_list_optional end MOD_COMMON"""
-        p[0] = a2l_node_factory(*p[2:5])
+        p[0] = p.parser.node_factory(*p[2:5])
 
     @staticmethod
     def p_mod_common_optional(p):
@@ -1136,11 +1545,12 @@ class A2lParser(object):
     @staticmethod
     def p_mod_common_optional_parameter_list(p):
         """mod_common_optional_list : mod_common_optional
-                                    | mod_common_optional mod_common_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                    | mod_common_optional_list mod_common_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_mod_common_optional_parameter_list_optional(p):
@@ -1181,7 +1591,7 @@ class A2lParser(object):
     @staticmethod
     def p_calibration_method(p):
         """calibration_method : begin CALIBRATION_METHOD STRING NUMERIC calibration_method_optional_list_optional end CALIBRATION_METHOD"""
-        p[0] = a2l_node_factory(*p[2:6])
+        p[0] = p.parser.node_factory(*p[2:6])
 
     @staticmethod
     def p_calibration_method_optional(p):
@@ -1191,11 +1601,12 @@ class A2lParser(object):
     @staticmethod
     def p_calibration_method_optional_list(p):
         """calibration_method_optional_list : calibration_method_optional
-                                            | calibration_method_optional calibration_method_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                            | calibration_method_optional_list calibration_method_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_calibration_method_optional_list_optional(p):
@@ -1216,11 +1627,12 @@ class A2lParser(object):
     @staticmethod
     def p_calibration_handle_optional_list(p):
         """calibration_handle_optional_list : calibration_handle_optional
-                                            | calibration_handle_optional calibration_handle_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                            | calibration_handle_optional_list calibration_handle_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_calibration_handle_optional_list_optional(p):
@@ -1231,7 +1643,7 @@ class A2lParser(object):
     @staticmethod
     def p_memory_layout(p):
         """memory_layout : begin MEMORY_LAYOUT memory_layout_prg_type NUMERIC NUMERIC number_list memory_layout_optional_list_optional end MEMORY_LAYOUT"""
-        p[0] = a2l_node_factory(*p[2:8])
+        p[0] = p.parser.node_factory(p[2], p[3], p[4], p[5], a2l_number_array(p[6]), p[7])
 
     @staticmethod
     def p_memory_layout_prg_type(p):
@@ -1248,11 +1660,12 @@ class A2lParser(object):
     @staticmethod
     def p_memory_layout_optional_list(p):
         """memory_layout_optional_list : memory_layout_optional
-                                       | memory_layout_optional memory_layout_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                       | memory_layout_optional_list memory_layout_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_memory_layout_optional_list_optional(p):
@@ -1272,11 +1685,12 @@ class A2lParser(object):
     @staticmethod
     def p_if_data_memory_layout_optional_list(p):
         """if_data_memory_layout_optional_list : if_data_memory_layout_optional
-                                               | if_data_memory_layout_optional if_data_memory_layout_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                               | if_data_memory_layout_optional_list if_data_memory_layout_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_if_data_memory_layout_optional_list_optional(p):
@@ -1306,7 +1720,7 @@ class A2lParser(object):
     @staticmethod
     def p_memory_segment(p):
         """memory_segment : begin MEMORY_SEGMENT IDENT STRING memory_segment_prg_type memory_segment_memory_type memory_segment_attributes NUMERIC NUMERIC number_list memory_segment_optional_list_optional end MEMORY_SEGMENT"""
-        p[0] = a2l_node_factory(*p[2:12])
+        p[0] = p.parser.node_factory(*(p[2:10] + [a2l_number_array(p[10]), p[11]]))
 
     @staticmethod
     def p_memory_segment_optional(p):
@@ -1317,11 +1731,12 @@ class A2lParser(object):
     @staticmethod
     def p_memory_segment_optional_parameter_list(p):
         """memory_segment_optional_parameter_list : memory_segment_optional
-                                                  | memory_segment_optional memory_segment_optional_parameter_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                                  | memory_segment_optional_parameter_list memory_segment_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_memory_segment_optional_list_optional(p):
@@ -1360,12 +1775,12 @@ class A2lParser(object):
     @staticmethod
     def p_system_constant(p):
         """system_constant : SYSTEM_CONSTANT STRING STRING"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_if_data_memory_segment(p):
         """if_data_memory_segment : begin IF_DATA IDENT if_data_memory_segment_optional_list_optional end IF_DATA"""
-        p[0] = a2l_node_factory('if_data_memory_segment', *p[3:5])
+        p[0] = p.parser.node_factory('if_data_memory_segment', *p[3:5])
 
     @staticmethod
     def p_if_data_memory_segment_optional(p):
@@ -1377,12 +1792,13 @@ class A2lParser(object):
     @staticmethod
     def p_if_data_memory_segment_optional_list(p):
         """if_data_memory_segment_optional_list : if_data_memory_segment_optional
-                                                | if_data_memory_segment_optional if_data_memory_segment_optional_list"""
+                                                | if_data_memory_segment_optional_list if_data_memory_segment_optional"""
 
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_if_data_memory_segment_optional_list_optional(p):
@@ -1393,7 +1809,7 @@ class A2lParser(object):
     @staticmethod  # TODO: segment is not defined in the specification, check...
     def p_segment(p):
         """segment : begin SEGMENT NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC segment_optional_parameter_list_optional end SEGMENT"""
-        p[0] = a2l_node_factory(*p[2:9])
+        p[0] = p.parser.node_factory(*p[2:9])
 
     @staticmethod
     def p_segment_optional_parameter(p):
@@ -1404,11 +1820,12 @@ class A2lParser(object):
     @staticmethod
     def p_segment_optional_parameter_list(p):
         """segment_optional_parameter_list : segment_optional_parameter
-                                           | segment_optional_parameter segment_optional_parameter_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                           | segment_optional_parameter_list segment_optional_parameter"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_segment_optional_parameter_list_optional(p):
@@ -1427,11 +1844,12 @@ class A2lParser(object):
     @staticmethod
     def p_page_optional_parameter_list(p):
         """page_optional_parameter_list : page_optional_parameter
-                                        | page_optional_parameter page_optional_parameter_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                        | page_optional_parameter_list page_optional_parameter"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_page_optional_parameter_list_optional(p):
@@ -1445,12 +1863,12 @@ class A2lParser(object):
     @staticmethod
     def p_address_mapping(p):
         """address_mapping : ADDRESS_MAPPING NUMERIC NUMERIC NUMERIC"""
-        p[0] = a2l_node_factory(*p[1:5])
+        p[0] = p.parser.node_factory(*p[1:5])
 
     @staticmethod
     def p_characteristic(p):
         """characteristic : begin CHARACTERISTIC IDENT STRING characteristic_type NUMERIC IDENT NUMERIC IDENT NUMERIC NUMERIC characteristic_optional_list_optional end CHARACTERISTIC"""
-        p[0] = a2l_node_factory(*p[2:13])
+        p[0] = _lazy_node_factory(p, *p[2:13])
 
     @staticmethod
     def p_characteristic_type(p):
@@ -1491,7 +1909,7 @@ class A2lParser(object):
     @staticmethod
     def p_function_list(p):
         """function_list : begin FUNCTION_LIST function_list_optional_list_optional end FUNCTION_LIST"""
-        p[0] = a2l_node_factory(p[2], [('name', c[1]) for c in p[3]])
+        p[0] = p.parser.node_factory(p[2], [('name', c[1]) for c in p[3]])
 
     @staticmethod
     def p_function_list_optional(p):
@@ -1501,11 +1919,12 @@ class A2lParser(object):
     @staticmethod
     def p_function_list_optional_list(p):
         """function_list_optional_list : function_list_optional
-                                       | function_list_optional function_list_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                       | function_list_optional_list function_list_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_function_list_optional_list_optional(p):
@@ -1531,17 +1950,17 @@ class A2lParser(object):
     @staticmethod
     def p_max_refresh(p):
         """max_refresh : MAX_REFRESH NUMERIC NUMERIC"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_dependent_characteristic(p):
         """dependent_characteristic : begin DEPENDENT_CHARACTERISTIC STRING ident_list end DEPENDENT_CHARACTERISTIC"""
-        p[0] = a2l_node_factory(p[2], p[3], (('characteristic', c) for c in p[4]))
+        p[0] = p.parser.node_factory(p[2], p[3], (('characteristic', c) for c in p[4]))
 
     @staticmethod
     def p_virtual_characteristic(p):
         """virtual_characteristic : begin VIRTUAL_CHARACTERISTIC STRING virtual_characteristic_optional end VIRTUAL_CHARACTERISTIC"""
-        p[0] = a2l_node_factory(p[2], p[3], (('characteristic', c) for c in p[4]))
+        p[0] = p.parser.node_factory(p[2], p[3], (('characteristic', c) for c in p[4]))
 
     @staticmethod
     def p_virtual_characteristic_optional(p):
@@ -1557,7 +1976,7 @@ class A2lParser(object):
     @staticmethod
     def p_annotation(p):
         """annotation : begin ANNOTATION annotation_optional_list_optional end ANNOTATION"""
-        p[0] = a2l_node_factory(*p[2:4])
+        p[0] = p.parser.node_factory(*p[2:4])
 
     @staticmethod
     def p_annotation_optional(p):
@@ -1569,11 +1988,12 @@ class A2lParser(object):
     @staticmethod
     def p_annotation_optional_list(p):
         """annotation_optional_list : annotation_optional
-                                    | annotation_optional annotation_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                    | annotation_optional_list annotation_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_annotation_optional_list_optional(p):
@@ -1594,7 +2014,7 @@ class A2lParser(object):
     @staticmethod
     def p_annotation_text(p):
         """annotation_text : begin ANNOTATION_TEXT string_list end ANNOTATION_TEXT"""
-        p[0] = a2l_node_factory(p[2], (('annotation_text', s) for s in p[3]))
+        p[0] = p.parser.node_factory(p[2], (('annotation_text', s) for s in p[3]))
 
     @staticmethod
     def p_comparison_quantity(p):
@@ -1604,7 +2024,7 @@ class A2lParser(object):
     @staticmethod
     def p_axis_descr(p):
         """axis_descr : begin AXIS_DESCR axis_descr_attribute IDENT IDENT NUMERIC NUMERIC NUMERIC axis_descr_optional_list_optional end AXIS_DESCR"""
-        p[0] = a2l_node_factory(*p[2:10])
+        p[0] = p.parser.node_factory(*p[2:10])
 
     @staticmethod
     def p_axis_descr_optional(p):
@@ -1626,11 +2046,12 @@ class A2lParser(object):
     @staticmethod
     def p_axis_descr_optional_list(p):
         """axis_descr_optional_list : axis_descr_optional
-                                    | axis_descr_optional axis_descr_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                    | axis_descr_optional_list axis_descr_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_axis_descr_optional_list_optional(p):
@@ -1664,17 +2085,17 @@ class A2lParser(object):
     @staticmethod
     def p_fix_axis_par(p):
         """fix_axis_par : FIX_AXIS_PAR NUMERIC NUMERIC NUMERIC"""
-        p[0] = a2l_node_factory(*p[1:5])
+        p[0] = p.parser.node_factory(*p[1:5])
 
     @staticmethod
     def p_fix_axis_par_dist(p):
         """fix_axis_par_dist : FIX_AXIS_PAR_DIST NUMERIC NUMERIC NUMERIC"""
-        p[0] = a2l_node_factory(*p[1:5])
+        p[0] = p.parser.node_factory(*p[1:5])
 
     @staticmethod
     def p_fix_axis_par_list(p):
         """fix_axis_par_list : begin FIX_AXIS_PAR_LIST number_list end FIX_AXIS_PAR_LIST"""
-        p[0] = p[3]
+        p[0] = a2l_number_array(p[3])
 
     @staticmethod
     def p_curve_axis_ref(p):
@@ -1741,11 +2162,12 @@ class A2lParser(object):
     @staticmethod
     def p_characteristic_optional_list(p):
         """characteristic_optional_list : characteristic_optional
-                                        | characteristic_optional characteristic_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                        | characteristic_optional_list characteristic_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_characteristic_optional_list_optional(p):
@@ -1760,7 +2182,7 @@ class A2lParser(object):
     @staticmethod
     def p_axis_pts(p):
         """axis_pts : begin AXIS_PTS IDENT STRING NUMERIC IDENT IDENT NUMERIC IDENT NUMERIC NUMERIC NUMERIC axis_pts_optional_list_optional end AXIS_PTS"""
-        p[0] = a2l_node_factory(*p[2:14])
+        p[0] = _lazy_node_factory(p, *p[2:14])
 
     @staticmethod
     def p_axis_pts_optional(p):
@@ -1782,11 +2204,12 @@ class A2lParser(object):
     @staticmethod
     def p_axis_pts_optional_list(p):
         """axis_pts_optional_list : axis_pts_optional
-                                  | axis_pts_optional axis_pts_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                  | axis_pts_optional_list axis_pts_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_axis_pts_optional_list_optional(p):
@@ -1813,7 +2236,7 @@ class A2lParser(object):
     @staticmethod
     def p_measurement(p):
         """measurement : begin MEASUREMENT IDENT STRING datatype IDENT NUMERIC NUMERIC NUMERIC NUMERIC measurement_optional_list_optional end MEASUREMENT"""
-        p[0] = a2l_node_factory(*p[2:12])
+        p[0] = _lazy_node_factory(p, *p[2:12])
 
     @staticmethod
     def p_measurement_optional(p):
@@ -1840,11 +2263,12 @@ class A2lParser(object):
     @staticmethod
     def p_measurement_optional_list(p):
         """measurement_optional_list : measurement_optional
-                                     | measurement_optional measurement_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                     | measurement_optional_list measurement_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_measurement_optional_list_optional(p):
@@ -1878,12 +2302,13 @@ class A2lParser(object):
     @staticmethod
     def p_if_data_measurement_optional_parameter_list(p):
         """if_data_measurement_optional_parameter_list : if_data_measurement_optional_parameter
-                                                       | if_data_measurement_optional_parameter if_data_measurement_optional_parameter_list"""
+                                                       | if_data_measurement_optional_parameter_list if_data_measurement_optional_parameter"""
 
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_if_data_measurement_optional_parameter_list_optional(p):
@@ -1916,12 +2341,12 @@ class A2lParser(object):
     @staticmethod
     def p_kp_data_parameter_optional_list(p):
         """kp_data_parameter_optional_list : kp_data_parameter_optional
-                                           | kp_data_parameter_optional kp_data_parameter_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                           | kp_data_parameter_optional_list kp_data_parameter_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
-        p[0] = p[1]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_array_size(p):
@@ -1931,7 +2356,7 @@ class A2lParser(object):
     @staticmethod
     def p_bit_operation(p):
         """bit_operation : begin BIT_OPERATION bit_operation_optional_list_optional end BIT_OPERATION"""
-        p[0] = a2l_node_factory(*p[2:4])
+        p[0] = p.parser.node_factory(*p[2:4])
 
     @staticmethod
     def p_bit_operation_optional(p):
@@ -1943,11 +2368,12 @@ class A2lParser(object):
     @staticmethod
     def p_bit_operation_optional_list(p):
         """bit_operation_optional_list : bit_operation_optional
-                                       | bit_operation_optional bit_operation_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                       | bit_operation_optional_list bit_operation_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_bit_operation_optional_list_optional(p):
@@ -1973,7 +2399,7 @@ class A2lParser(object):
     @staticmethod
     def p_compu_method(p):
         """compu_method : begin COMPU_METHOD IDENT STRING compu_method_conversion_type STRING STRING compu_method_optional_list_optional end COMPU_METHOD"""
-        p[0] = a2l_node_factory(*p[2:9])
+        p[0] = p.parser.node_factory(*p[2:9])
 
     @staticmethod
     def p_compu_method_optional(p):
@@ -1987,11 +2413,12 @@ class A2lParser(object):
     @staticmethod
     def p_compu_method_optional_list(p):
         """compu_method_optional_list : compu_method_optional
-                                      | compu_method_optional compu_method_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                      | compu_method_optional_list compu_method_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_compu_method_optional_list_optional(p):
@@ -2013,7 +2440,7 @@ class A2lParser(object):
     @staticmethod
     def p_formula(p):
         """formula : begin FORMULA STRING formula_optional_list_optional end FORMULA"""
-        p[0] = a2l_node_factory(*p[2:5])
+        p[0] = p.parser.node_factory(*p[2:5])
 
     @staticmethod
     def p_formula_optional(p):
@@ -2023,11 +2450,12 @@ class A2lParser(object):
     @staticmethod
     def p_formula_optional_list(p):
         """formula_optional_list : formula_optional
-                                 | formula_optional formula_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                 | formula_optional_list formula_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_formula_optional_list_optional(p):
@@ -2043,12 +2471,12 @@ class A2lParser(object):
     @staticmethod
     def p_coeffs(p):
         """coeffs : COEFFS NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC"""
-        p[0] = a2l_node_factory(*p[1:8])
+        p[0] = p.parser.node_factory(*p[1:8])
 
     @staticmethod
     def p_coeffs_linear(p):
         """coeffs_linear : COEFFS_LINEAR NUMERIC NUMERIC"""
-        p[0] = p[1]
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_compu_tab_ref(p):
@@ -2063,7 +2491,7 @@ class A2lParser(object):
     @staticmethod
     def p_virtual(p):
         """virtual : begin VIRTUAL ident_list end VIRTUAL"""
-        p[0] = p[4]
+        p[0] = p[3]
 
     @staticmethod
     def p_ecu_address(p):
@@ -2078,7 +2506,7 @@ class A2lParser(object):
     @staticmethod
     def p_compu_tab(p):
         """compu_tab : begin COMPU_TAB IDENT STRING compu_tab_conversion_type NUMERIC compu_tab_optional_list_optional end COMPU_TAB"""
-        p[0] = a2l_node_factory(*p[2:8])
+        p[0] = p.parser.node_factory(*p[2:8])
 
     @staticmethod
     def p_compu_tab_optional(p):
@@ -2090,11 +2518,12 @@ class A2lParser(object):
     @staticmethod
     def p_compu_tabl_optional_list(p):
         """compu_tab_optional_list : compu_tab_optional
-                                   | compu_tab_optional compu_tab_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                   | compu_tab_optional_list compu_tab_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_compu_tab_optional_list_optional(p):
@@ -2105,7 +2534,7 @@ class A2lParser(object):
     @staticmethod
     def p_in_val_out_val(p):
         """in_val_out_val : number_list"""
-        p[0] = p[1]
+        p[0] = a2l_number_array(p[1])
 
     @staticmethod
     def p_compu_tab_conversion_type(p):
@@ -2126,7 +2555,7 @@ class A2lParser(object):
     @staticmethod
     def p_compu_vtab(p):
         """compu_vtab : begin COMPU_VTAB IDENT STRING compu_vtab_conversion_type NUMERIC compu_vtab_optional_list_optional end COMPU_VTAB"""
-        p[0] = a2l_node_factory(*p[2:8])
+        p[0] = p.parser.node_factory(*p[2:8])
 
     @staticmethod
     def p_compu_vtab_optional(p):
@@ -2137,11 +2566,12 @@ class A2lParser(object):
     @staticmethod
     def p_compu_vtab_optional_list(p):
         """compu_vtab_optional_list : compu_vtab_optional
-                                    | compu_vtab_optional compu_vtab_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                    | compu_vtab_optional_list compu_vtab_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_compu_vtab_optional_list_optional(p):
@@ -2162,11 +2592,12 @@ class A2lParser(object):
     @staticmethod
     def p_number_string_value_list(p):
         """number_string_value_list : number_string_value
-                                    | number_string_value number_string_value_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                    | number_string_value_list number_string_value"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_number_string_value(p):
@@ -2176,7 +2607,7 @@ class A2lParser(object):
     @staticmethod
     def p_compu_vtab_range(p):
         """compu_vtab_range : begin COMPU_VTAB_RANGE IDENT STRING NUMERIC compu_vtab_range_optional_list_optional end COMPU_VTAB_RANGE"""
-        p[0] = a2l_node_factory(*p[2:7])
+        p[0] = p.parser.node_factory(*p[2:7])
 
     @staticmethod
     def p_compu_vtab_range_optional(p):
@@ -2187,11 +2618,12 @@ class A2lParser(object):
     @staticmethod
     def p_compu_vtab_range_optional_list(p):
         """compu_vtab_range_optional_list : compu_vtab_range_optional
-                                          | compu_vtab_range_optional compu_vtab_range_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                          | compu_vtab_range_optional_list compu_vtab_range_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_compu_vtab_range_optional_list_optional(p):
@@ -2207,11 +2639,12 @@ class A2lParser(object):
     @staticmethod
     def p_number_number_string_value_list(p):
         """number_number_string_value_list : number_number_string_value
-                                           | number_number_string_value number_number_string_value_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                           | number_number_string_value_list number_number_string_value"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_number_number_string_value(p):
@@ -2221,7 +2654,7 @@ class A2lParser(object):
     @staticmethod
     def p_function(p):
         """function : begin FUNCTION IDENT STRING function_optional_list_optional end FUNCTION"""
-        p[0] = a2l_node_factory(*p[2:6])
+        p[0] = p.parser.node_factory(*p[2:6])
 
     @staticmethod
     def p_function_optional(p):
@@ -2238,11 +2671,12 @@ class A2lParser(object):
     @staticmethod
     def p_function_optional_list(p):
         """function_optional_list : function_optional
-                                  | function_optional function_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                  | function_optional_list function_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_function_optional_list_optional(p):
@@ -2253,7 +2687,7 @@ class A2lParser(object):
     @staticmethod
     def p_def_characteristic(p):
         """def_characteristic : begin DEF_CHARACTERISTIC def_characteristic_optional_list_optional end DEF_CHARACTERISTIC"""
-        p[0] = a2l_node_factory(*p[2:4])
+        p[0] = p.parser.node_factory(*p[2:4])
 
     @staticmethod
     def p_def_characteristic_optional(p):
@@ -2263,11 +2697,12 @@ class A2lParser(object):
     @staticmethod
     def p_def_characteristic_optional_list(p):
         """def_characteristic_optional_list : def_characteristic_optional
-                                            | def_characteristic_optional def_characteristic_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                            | def_characteristic_optional_list def_characteristic_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_def_characteristic_optional_list_optional(p):
@@ -2283,7 +2718,7 @@ class A2lParser(object):
     @staticmethod
     def p_ref_characteristic(p):
         """ref_characteristic : begin REF_CHARACTERISTIC ref_characteristic_optional_list_optional end REF_CHARACTERISTIC"""
-        p[0] = a2l_node_factory(*p[2:4])
+        p[0] = p.parser.node_factory(*p[2:4])
 
     @staticmethod
     def p_ref_characteristic_optional(p):
@@ -2293,11 +2728,12 @@ class A2lParser(object):
     @staticmethod
     def p_ref_characteristic_optional_list(p):
         """ref_characteristic_optional_list : ref_characteristic_optional
-                                            | ref_characteristic_optional ref_characteristic_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                            | ref_characteristic_optional_list ref_characteristic_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_ref_characteristic_optional_list_optional(p):
@@ -2308,7 +2744,7 @@ class A2lParser(object):
     @staticmethod
     def p_in_measurement(p):
         """in_measurement : begin IN_MEASUREMENT in_measurement_optional_list_optional end IN_MEASUREMENT"""
-        p[0] = a2l_node_factory(*p[2:4])
+        p[0] = p.parser.node_factory(*p[2:4])
 
     @staticmethod
     def p_in_measurement_optional(p):
@@ -2318,11 +2754,12 @@ class A2lParser(object):
     @staticmethod
     def p_in_measurement_optional_list(p):
         """in_measurement_optional_list : in_measurement_optional
-                                        | in_measurement_optional in_measurement_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                        | in_measurement_optional_list in_measurement_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_in_measurment_optional_list_optional(p):
@@ -2333,7 +2770,7 @@ class A2lParser(object):
     @staticmethod
     def p_out_measurement(p):
         """out_measurement : begin OUT_MEASUREMENT out_measurement_optional_list_optional end OUT_MEASUREMENT"""
-        p[0] = a2l_node_factory(*p[2:4])
+        p[0] = p.parser.node_factory(*p[2:4])
 
     @staticmethod
     def p_out_measurement_optional(p):
@@ -2343,11 +2780,12 @@ class A2lParser(object):
     @staticmethod
     def p_out_measurement_optional_list(p):
         """out_measurement_optional_list : out_measurement_optional
-                                         | out_measurement_optional out_measurement_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                         | out_measurement_optional_list out_measurement_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_out_measurment_optional_list_optional(p):
@@ -2358,7 +2796,7 @@ class A2lParser(object):
     @staticmethod
     def p_loc_measurement(p):
         """loc_measurement : begin LOC_MEASUREMENT loc_measurement_optional_list_optional end LOC_MEASUREMENT"""
-        p[0] = a2l_node_factory(*p[2:4])
+        p[0] = p.parser.node_factory(*p[2:4])
 
     @staticmethod
     def p_loc_measurement_optional(p):
@@ -2368,11 +2806,12 @@ class A2lParser(object):
     @staticmethod
     def p_loc_measurement_optional_list(p):
         """loc_measurement_optional_list : loc_measurement_optional
-                                         | loc_measurement_optional loc_measurement_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                         | loc_measurement_optional_list loc_measurement_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_loc_measurment_optional_list_optional(p):
@@ -2383,7 +2822,7 @@ class A2lParser(object):
     @staticmethod
     def p_sub_function(p):
         """sub_function : begin SUB_FUNCTION sub_function_optional_list_optional end SUB_FUNCTION"""
-        p[0] = a2l_node_factory(*p[2:4])
+        p[0] = p.parser.node_factory(*p[2:4])
 
     @staticmethod
     def p_sub_function_optional(p):
@@ -2393,11 +2832,12 @@ class A2lParser(object):
     @staticmethod
     def p_sub_function_optional_list(p):
         """sub_function_optional_list : sub_function_optional
-                                      | sub_function_optional sub_function_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                      | sub_function_optional_list sub_function_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_sub_function_optional_list_optional(p):
@@ -2413,7 +2853,7 @@ class A2lParser(object):
     @staticmethod
     def p_group(p):
         """group : begin GROUP IDENT STRING group_optional_list_optional end GROUP"""
-        p[0] = a2l_node_factory(*p[2:6])
+        p[0] = p.parser.node_factory(*p[2:6])
 
     @staticmethod
     def p_group_optional(p):
@@ -2428,11 +2868,12 @@ class A2lParser(object):
     @staticmethod
     def p_group_optional_list(p):
         """group_optional_list : group_optional
-                               | group_optional group_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                               | group_optional_list group_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_group_optional_list_optional(p):
@@ -2448,7 +2889,7 @@ class A2lParser(object):
     @staticmethod
     def p_ref_measurement(p):
         """ref_measurement : begin REF_MEASUREMENT ref_measurement_optional_list_optional end REF_MEASUREMENT"""
-        p[0] = a2l_node_factory(*p[2:4])
+        p[0] = p.parser.node_factory(*p[2:4])
 
     @staticmethod
     def p_ref_measurement_optional(p):
@@ -2458,11 +2899,12 @@ class A2lParser(object):
     @staticmethod
     def p_ref_measurement_optional_list(p):
         """ref_measurement_optional_list : ref_measurement_optional
-                                         | ref_measurement_optional ref_measurement_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                         | ref_measurement_optional_list ref_measurement_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_ref_measurement_optional_list_optional(p):
@@ -2473,7 +2915,7 @@ class A2lParser(object):
     @staticmethod
     def p_sub_group(p):
         """sub_group : begin SUB_GROUP sub_group_optional_list_optional end SUB_GROUP"""
-        p[0] = a2l_node_factory(*p[2:4])
+        p[0] = p.parser.node_factory(*p[2:4])
 
     @staticmethod
     def p_sub_group_optional(p):
@@ -2483,11 +2925,12 @@ class A2lParser(object):
     @staticmethod
     def p_sub_group_optional_list(p):
         """sub_group_optional_list : sub_group_optional
-                                   | sub_group_optional sub_group_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                   | sub_group_optional_list sub_group_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_sub_group_optional_list_optional(p):
@@ -2498,7 +2941,7 @@ class A2lParser(object):
     @staticmethod
     def p_record_layout(p):
         """record_layout : begin RECORD_LAYOUT IDENT record_layout_optional_list_optional end RECORD_LAYOUT"""
-        p[0] = a2l_node_factory(*p[2:5])
+        p[0] = p.parser.node_factory(*p[2:5])
 
     @staticmethod
     def p_record_layout_optional(p):
@@ -2546,11 +2989,12 @@ class A2lParser(object):
     @staticmethod
     def p_record_layout_optional_list(p):
         """record_layout_optional_list : record_layout_optional
-                                       | record_layout_optional record_layout_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                       | record_layout_optional_list record_layout_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_record_layout_optional_list_optional(p):
@@ -2561,7 +3005,7 @@ class A2lParser(object):
     @staticmethod
     def p_fnc_values(p):
         """fnc_values : FNC_VALUES NUMERIC datatype fnc_values_index_mode addrtype"""
-        p[0] = a2l_node_factory(*p[1:6])
+        p[0] = p.parser.node_factory(*p[1:6])
 
     @staticmethod
     def p_fnc_values_index_mode(p):
@@ -2575,162 +3019,162 @@ class A2lParser(object):
     @staticmethod
     def p_identification(p):
         """identification : IDENTIFICATION NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_axis_pts_x(p):
         """axis_pts_x : AXIS_PTS_X NUMERIC datatype indexorder addrtype"""
-        p[0] = a2l_node_factory(*p[1:6])
+        p[0] = p.parser.node_factory(*p[1:6])
 
     @staticmethod
     def p_axis_pts_y(p):
         """axis_pts_y : AXIS_PTS_Y NUMERIC datatype indexorder addrtype"""
-        p[0] = a2l_node_factory(*p[1:6])
+        p[0] = p.parser.node_factory(*p[1:6])
 
     @staticmethod
     def p_axis_pts_z(p):
         """axis_pts_z : AXIS_PTS_Z NUMERIC datatype indexorder addrtype"""
-        p[0] = a2l_node_factory(*p[1:6])
+        p[0] = p.parser.node_factory(*p[1:6])
 
     @staticmethod
     def p_axis_rescale_x(p):
         """axis_rescale_x : AXIS_RESCALE_X NUMERIC datatype NUMERIC indexorder addrtype"""
-        p[0] = a2l_node_factory(*p[1:7])
+        p[0] = p.parser.node_factory(*p[1:7])
 
     @staticmethod
     def p_axis_rescale_y(p):
         """axis_rescale_y : AXIS_RESCALE_Y NUMERIC datatype NUMERIC indexorder addrtype"""
-        p[0] = a2l_node_factory(*p[1:7])
+        p[0] = p.parser.node_factory(*p[1:7])
 
     @staticmethod
     def p_axis_rescale_z(p):
         """axis_rescale_z : AXIS_RESCALE_Z NUMERIC datatype NUMERIC indexorder addrtype"""
-        p[0] = a2l_node_factory(*p[1:7])
+        p[0] = p.parser.node_factory(*p[1:7])
 
     @staticmethod
     def p_no_axis_pts_x(p):
         """no_axis_pts_x : NO_AXIS_PTS_X NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_no_axis_pts_y(p):
         """no_axis_pts_y : NO_AXIS_PTS_Y NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_no_axis_pts_z(p):
         """no_axis_pts_z : NO_AXIS_PTS_Z NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_no_rescale_x(p):
         """no_rescale_x : NO_RESCALE_X NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_no_rescale_y(p):
         """no_rescale_y : NO_RESCALE_Y NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_no_rescale_z(p):
         """no_rescale_z : NO_RESCALE_Z NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_fix_no_axis_pts_x(p):
         """fix_no_axis_pts_x : FIX_NO_AXIS_PTS_X NUMERIC"""
-        p[0] = a2l_node_factory(*p[1:3])
+        p[0] = p.parser.node_factory(*p[1:3])
 
     @staticmethod
     def p_fix_no_axis_pts_y(p):
         """fix_no_axis_pts_y : FIX_NO_AXIS_PTS_Y NUMERIC"""
-        p[0] = a2l_node_factory(*p[1:3])
+        p[0] = p.parser.node_factory(*p[1:3])
 
     @staticmethod
     def p_fix_no_axis_pts_z(p):
         """fix_no_axis_pts_z : FIX_NO_AXIS_PTS_Z NUMERIC"""
-        p[0] = a2l_node_factory(*p[1:3])
+        p[0] = p.parser.node_factory(*p[1:3])
 
     @staticmethod
     def p_src_addr_x(p):
         """src_addr_x : SRC_ADDR_X NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_src_addr_y(p):
         """src_addr_y : SRC_ADDR_Y NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_src_addr_z(p):
         """src_addr_z : SRC_ADDR_Z NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_rip_addr_x(p):
         """rip_addr_x : RIP_ADDR_X NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_rip_addr_y(p):
         """rip_addr_y : RIP_ADDR_Y NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_rip_addr_z(p):
         """rip_addr_z : RIP_ADDR_Z NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_rip_addr_w(p):
         """rip_addr_w : RIP_ADDR_W NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_shift_op_x(p):
         """shift_op_x : SHIFT_OP_X NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_shift_op_y(p):
         """shift_op_y : SHIFT_OP_Y NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_shift_op_z(p):
         """shift_op_z : SHIFT_OP_Z NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_offset_x(p):
         """offset_x : OFFSET_X NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_offset_y(p):
         """offset_y : OFFSET_Y NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_offset_z(p):
         """offset_z : OFFSET_Z NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_dist_op_x(p):
         """dist_op_x : DIST_OP_X NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_dist_op_y(p):
         """dist_op_y : DIST_OP_Y NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_dist_op_z(p):
         """dist_op_z : DIST_OP_Z NUMERIC datatype"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_alignment_byte(p):
@@ -2760,7 +3204,7 @@ class A2lParser(object):
     @staticmethod
     def p_variant_coding(p):
         """variant_coding : begin VARIANT_CODING variant_coding_optional_list_optional end VARIANT_CODING"""
-        p[0] = a2l_node_factory(*p[2:4])
+        p[0] = p.parser.node_factory(*p[2:4])
 
     @staticmethod
     def p_variant_coding_optional(p):
@@ -2774,11 +3218,12 @@ class A2lParser(object):
     @staticmethod
     def p_variant_coding_optional_list(p):
         """variant_coding_optional_list : variant_coding_optional
-                                        | variant_coding_optional variant_coding_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                        | variant_coding_optional_list variant_coding_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_variant_coding_optional_list_optional(p):
@@ -2799,12 +3244,12 @@ class A2lParser(object):
     @staticmethod
     def p_var_criterion(p):
         """var_criterion : begin VAR_CRITERION IDENT STRING ident_list var_criterion_optional_list_optional end VAR_CRITERION"""
-        p[0] = a2l_node_factory(*p[2:7])
+        p[0] = p.parser.node_factory(*p[2:7])
 
     @staticmethod
     def p_var_characteristic(p):
         """var_characteristic : begin VAR_CHARACTERISTIC IDENT ident_list var_characteristic_optional_optional end VAR_CHARACTERISTIC"""
-        p[0] = a2l_node_factory(*p[2:6])
+        p[0] = p.parser.node_factory(*p[2:6])
 
     @staticmethod
     def p_var_characteristic_optional(p):
@@ -2820,21 +3265,20 @@ class A2lParser(object):
     @staticmethod
     def p_var_address(p):
         """var_address : begin VAR_ADDRESS number_list end VAR_ADDRESS"""
-        p[0] = a2l_node_factory(p[2], [('address', a) for a in p[3]])
+        p[0] = p.parser.node_factory(p[2], [('address', a2l_number_array(p[3]))])
 
     @staticmethod
     def p_var_forbidden_comb(p):
         """var_forbidden_comb : begin VAR_FORBIDDEN_COMB var_forbidden_comb_criterion_list end VAR_FORBIDDEN_COMB"""
-        p[0] = a2l_node_factory(p[2], *p[3])
+        p[0] = p.parser.node_factory(p[2], *p[3])
 
     @staticmethod
     def p_var_forbidden_comb_criterion_list(p):
         """var_forbidden_comb_criterion_list : var_forbidden_comb_criterion_optional
                                              | var_forbidden_comb_criterion_optional var_forbidden_comb_criterion_optional_list"""
-        try:
-            p[0] = p[1] + p[2]
-        except IndexError:
-            p[0] = p[1]
+        p[0] = p[1]
+        if len(p) == 3:
+            p[0].extend(p[2])
 
     @staticmethod
     def p_var_forbidden_comb_criterion_optional(p):
@@ -2844,11 +3288,10 @@ class A2lParser(object):
     @staticmethod
     def p_var_forbidden_comb_criterion_optional_list(p):
         """var_forbidden_comb_criterion_optional_list : var_forbidden_comb_criterion_optional
-                                                      | var_forbidden_comb_criterion_optional var_forbidden_comb_criterion_optional_list"""
-        try:
-            p[0] = p[1] + p[2]
-        except IndexError:
-            p[0] = p[1]
+                                                      | var_forbidden_comb_criterion_optional_list var_forbidden_comb_criterion_optional"""
+        p[0] = p[1]
+        if len(p) == 3:
+            p[0].extend(p[2])
 
     @staticmethod
     def p_var_criterion_optional(p):
@@ -2859,11 +3302,12 @@ class A2lParser(object):
     @staticmethod
     def p_var_criterion_optional_list(p):
         """var_criterion_optional_list : var_criterion_optional
-                                       | var_criterion_optional var_criterion_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                       | var_criterion_optional_list var_criterion_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_var_criterion_optional_list_optional(p):
@@ -2884,12 +3328,12 @@ class A2lParser(object):
     @staticmethod
     def p_reserved(p):
         """reserved : RESERVED NUMERIC datasize"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_frame(p):
         """frame : begin FRAME IDENT STRING NUMERIC NUMERIC frame_optional_list_optional end FRAME"""
-        p[0] = a2l_node_factory(*p[2:8])
+        p[0] = p.parser.node_factory(*p[2:8])
 
     @staticmethod
     def p_frame_optional(p):
@@ -2900,11 +3344,12 @@ class A2lParser(object):
     @staticmethod
     def p_frame_optional_list(p):
         """frame_optional_list : frame_optional
-                               | frame_optional frame_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                               | frame_optional_list frame_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_frame_optional_list_optional(p):
@@ -2915,7 +3360,7 @@ class A2lParser(object):
     @staticmethod
     def p_if_data_frame(p):
         """if_data_frame : begin IF_DATA IDENT if_data_frame_optional_list_optional end IF_DATA"""
-        p[0] = a2l_node_factory('if_data_frame', *p[3:5])
+        p[0] = p.parser.node_factory('if_data_frame', *p[3:5])
 
     @staticmethod
     def p_if_data_frame_optional(p):
@@ -2925,12 +3370,13 @@ class A2lParser(object):
     @staticmethod
     def p_if_data_frame_parameter_optional_list(p):
         """if_data_frame_optional_list : if_data_frame_optional
-                                       | if_data_frame_optional if_data_frame_optional_list"""
+                                       | if_data_frame_optional_list if_data_frame_optional"""
 
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_if_data_frame_optional_list_optional(p):
@@ -2946,12 +3392,12 @@ class A2lParser(object):
     @staticmethod
     def p_frame_measurement(p):
         """frame_measurement : FRAME_MEASUREMENT ident_list"""
-        p[0] = a2l_node_factory(p[1], [('identifier', i) for i in p[2]])
+        p[0] = p.parser.node_factory(p[1], [('identifier', i) for i in p[2]])
 
     @staticmethod
     def p_user_rights(p):
         """user_rights : begin USER_RIGHTS IDENT user_rights_optional_list_optional end USER_RIGHTS"""
-        p[0] = a2l_node_factory(*p[2:5])
+        p[0] = p.parser.node_factory(*p[2:5])
 
     @staticmethod
     def p_user_rights_optional(p):
@@ -2962,11 +3408,12 @@ class A2lParser(object):
     @staticmethod
     def p_user_rights_optional_list(p):
         """user_rights_optional_list : user_rights_optional
-                                     | user_rights_optional user_rights_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                     | user_rights_optional_list user_rights_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_user_rights_optional_list_optional(p):
@@ -2977,7 +3424,7 @@ class A2lParser(object):
     @staticmethod
     def p_ref_group(p):
         """ref_group : begin REF_GROUP ref_group_optional_list_optional end REF_GROUP"""
-        p[0] = a2l_node_factory(*p[2:4])
+        p[0] = p.parser.node_factory(*p[2:4])
 
     @staticmethod
     def p_ref_group_optional(p):
@@ -2987,11 +3434,12 @@ class A2lParser(object):
     @staticmethod
     def p_ref_group_optional_list(p):
         """ref_group_optional_list : ref_group_optional
-                                   | ref_group_optional ref_group_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                   | ref_group_optional_list ref_group_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_ref_group_optional_list_optional(p):
@@ -3012,7 +3460,7 @@ class A2lParser(object):
     @staticmethod
     def p_unit(p):
         """unit : begin UNIT IDENT STRING STRING unit_type unit_optional_list_optional end UNIT"""
-        p[0] = a2l_node_factory(*p[2:8])
+        p[0] = p.parser.node_factory(*p[2:8])
 
     @staticmethod
     def p_unit_optional(p):
@@ -3024,11 +3472,12 @@ class A2lParser(object):
     @staticmethod
     def p_unit_optional_list(p):
         """unit_optional_list : unit_optional
-                              | unit_optional unit_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                              | unit_optional_list unit_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[2])
 
     @staticmethod
     def p_unit_optional_list_optional(p):
@@ -3045,12 +3494,12 @@ class A2lParser(object):
     @staticmethod
     def p_si_exponents(p):
         """si_exponents : SI_EXPONENTS NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC"""
-        p[0] = a2l_node_factory(*p[1:9])
+        p[0] = p.parser.node_factory(*p[1:9])
 
     @staticmethod
     def p_unit_conversion(p):
         """unit_conversion : UNIT_CONVERSION NUMERIC NUMERIC"""
-        p[0] = a2l_node_factory(*p[1:4])
+        p[0] = p.parser.node_factory(*p[1:4])
 
     @staticmethod
     def p_empty(p):
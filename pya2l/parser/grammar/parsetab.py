@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'A2ML A2ML_VERSION ABSOLUTE ADDRESS_EXTENSION_DAQ ADDRESS_EXTENSION_FREE ADDRESS_EXTENSION_ODT ADDRESS_MAPPING ADDR_EPK ALIGNMENT_BYTE ALIGNMENT_FLOAT32_IEEE ALIGNMENT_FLOAT64_IEEE ALIGNMENT_LONG ALIGNMENT_WORD ALTERNATE_CURVES ALTERNATE_WITH_X ALTERNATE_WITH_Y ANNOTATION ANNOTATION_LABEL ANNOTATION_ORIGIN ANNOTATION_TEXT ARRAY_SIZE ASAP2_VERSION ASCII ASTERISK AVAILABLE_EVENT_LIST AXIS_DESCR AXIS_PTS AXIS_PTS_REF AXIS_PTS_X AXIS_PTS_Y AXIS_PTS_Z AXIS_RESCALE_X AXIS_RESCALE_Y AXIS_RESCALE_Z A_INT64 A_UINT64 BAUDRATE BA_BLOB BIT_MASK BIT_OPERATION BRACE_CLOSE BRACE_OPEN BTL_CYCLES BYTE BYTE_ORDER CALIBRATION CALIBRATION_ACCESS CALIBRATION_HANDLE CALIBRATION_METHOD CALIBRATION_VARIABLES CAN_ID_BROADCAST CAN_ID_MASTER CAN_ID_SLAVE CHARACTERISTIC CHECKSUM CODE COEFFS COEFFS_LINEAR COLUMN_DIR COMMA COMPARISON_QUANTITY COMPU_METHOD COMPU_TAB COMPU_TAB_REF COMPU_VTAB COMPU_VTAB_RANGE COM_AXIS CPU_TYPE CUBOID CURLY_CLOSE CURLY_OPEN CURVE CURVE_AXIS CURVE_AXIS_REF CUSTOMER CUSTOMER_NO DAQ DAQ_EVENT DAQ_LIST DAQ_LIST_CAN_ID DAQ_LIST_TYPE DAQ_STIM DATA DATA_SIZE DEFAULT_EVENT_LIST DEFAULT_VALUE DEFAULT_VALUE_NUMERIC DEF_CHARACTERISTIC DEPENDENT_CHARACTERISTIC DEPOSIT DERIVED DIFFERENCE DIRECT DISPLAY_IDENTIFIER DIST_OP_X DIST_OP_Y DIST_OP_Z DP_BLOB DUAL DYNAMIC ECU ECU_ADDRESS ECU_ADDRESS_EXTENSION ECU_CALIBRATION_OFFSET EEPROM EPK EPROM EQUAL ERROR_MASK EVENT EVENT_FIXED EVENT_GROUP EXCLUDE_FROM_FLASH EXTENDED_LIMITS EXTENDED_SI EXTERN FIRST_PID FIXED FIXED_EVENT_LIST FIX_AXIS FIX_AXIS_PAR FIX_AXIS_PAR_DIST FIX_AXIS_PAR_LIST FIX_NO_AXIS_PTS_X FIX_NO_AXIS_PTS_Y FIX_NO_AXIS_PTS_Z FLASH FLOAT32_IEEE FLOAT64_IEEE FNC_VALUES FORM FORMAT FORMULA FORMULA_INV FRAME FRAME_MEASUREMENT FREEZE_SUPPORTED FUNCTION FUNCTION_LIST FUNCTION_VERSION GRANULARITY_ODT_ENTRY_SIZE_DAQ_BYTE GRANULARITY_ODT_ENTRY_SIZE_DAQ_DLONG GRANULARITY_ODT_ENTRY_SIZE_DAQ_DWORD GRANULARITY_ODT_ENTRY_SIZE_DAQ_WORD GROUP GUARD_RAILS HEADER IDENT IDENTICAL IDENTIFICATION IDENTIFICATION_FIELD_TYPE_ABSOLUTE IDENTIFICATION_FIELD_TYPE_RELATIVE_BYTE IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD_ALIGNED IF_DATA INDEX_DECR INDEX_INCR INIT_SEGMENT INTERN IN_MEASUREMENT KP_BLOB LEFT_SHIFT LINEAR LOC_MEASUREMENT LONG MAP MAP_LIST MATRIX_DIM MAX_BLOCK_SIZE MAX_GRAD MAX_ODT MAX_ODT_ENTRIES MAX_REFRESH MEASUREMENT MEMORY_LAYOUT MEMORY_SEGMENT MODULE MOD_COMMON MOD_PAR MONOTONY MON_DECREASE MON_INCREASE MSB_FIRST MSB_LAST NOT_IN_MCD_SYSTEM NO_AXIS_PTS_X NO_AXIS_PTS_Y NO_AXIS_PTS_Z NO_CALIBRATION NO_OF_INTERFACES NO_OVERLOAD_INDICATION NO_RESCALE_X NO_RESCALE_Y NO_RESCALE_Z NUMBER NUMERIC OFFLINE_CALIBRATION OFFLINE_DATA OFFSET_X OFFSET_Y OFFSET_Z OPTIMISATION_TYPE_DEFAULT OPTIMISATION_TYPE_MAX_ENTRY_SIZE OPTIMISATION_TYPE_ODT_TYPE_16 OPTIMISATION_TYPE_ODT_TYPE_32 OPTIMISATION_TYPE_ODT_TYPE_64 OPTIMISATION_TYPE_ODT_TYPE_ALIGNMENT OUT_MEASUREMENT OVERLOAD_INDICATION_EVENT OVERLOAD_INDICATION_PID PAG PAGE PARENTHESE_CLOSE PARENTHESE_OPEN PA_BLOB PBYTE PGM PHONE_NO PLONG PRESCALER_SUPPORTED PRG_CODE PRG_DATA PRG_RESERVED PROJECT PROJECT_NO PROTOCOL_LAYER PWORD QP_BLOB RAM RASTER RAT_FUNC READ_ONLY READ_WRITE RECORD_LAYOUT REF_CHARACTERISTIC REF_GROUP REF_MEASUREMENT REF_MEMORY_SEGMENT REF_UNIT REGISTER RESERVED RESUME_SUPPORTED RES_AXIS RIGHT_SHIFT RIP_ADDR_W RIP_ADDR_X RIP_ADDR_Y RIP_ADDR_Z ROM ROOT ROW_DIR SAMPLE_POINT SAMPLE_RATE SBYTE SECTOR SEED_KEY SEGMENT SEMICOLON SERAM SHIFT_OP_X SHIFT_OP_Y SHIFT_OP_Z SIGN_EXTEND SINGLE SI_EXPONENTS SJW SLONG SOURCE SRC_ADDR_X SRC_ADDR_Y SRC_ADDR_Z STATIC STD_AXIS STIM STRICT_DECREASE STRICT_INCREASE STRING SUB_FUNCTION SUB_GROUP SUPPLIER SWORD SYNC_EDGE SYSTEM_CONSTANT S_REC_LAYOUT TAB_INTP TAB_NOINTP TAB_VERB TIMESTAMP_FIXED TIMESTAMP_SUPPORTED TP_BLOB TRIPLE UBYTE ULONG UNIT UNIT_CONVERSION USER USER_RIGHTS UWORD VALUE VAL_BLK VARIABLE VARIABLES VARIANT_CODING VAR_ADDRESS VAR_CHARACTERISTIC VAR_CRITERION VAR_FORBIDDEN_COMB VAR_MEASUREMENT VAR_NAMING VAR_SELECTION_CHARACTERISTIC VAR_SEPARATOR VERSION VIRTUAL VIRTUAL_CHARACTERISTIC WORD XCP XCP_ON_CAN begin block char double end enum float int long struct taggedstruct taggedunion uchar uint ulonga2l : a2l_optional_list_optionala2l_optional : asap2_version\n                        | a2ml_version\n                        | projecta2l_optional_list : a2l_optional\n                             | a2l_optional a2l_optional_lista2l_optional_list_optional : empty\n                                      | a2l_optional_lista2ml_declaration : a2ml_type_definition SEMICOLON\n                            | a2ml_block_definition SEMICOLONa2ml_declaration_list : a2ml_declaration\n                                 | a2ml_declaration a2ml_declaration_lista2ml_type_definition : a2ml_type_namea2ml_type_name : a2ml_predefined_type_name\n                          | a2ml_struct_type_name\n                          | a2ml_enum_type_name\n                          | a2ml_taggedstruct_type_name\n                          | a2ml_taggedunion_type_namea2ml_predefined_type_name : char\n                                     | int\n                                     | long\n                                     | uchar\n                                     | uint\n                                     | ulong\n                                     | double\n                                     | floata2ml_block_definition : block a2ml_tag a2ml_type_namea2ml_enum_type_name : enum a2ml_identifier_optional CURLY_OPEN a2ml_enumerator_list CURLY_CLOSE\n                               | enum a2ml_identifiera2ml_enumerator_list : a2ml_enumerator\n                                | a2ml_enumerator COMMA a2ml_enumerator_lista2ml_enumerator : a2ml_keyword EQUAL a2ml_constant\n                           | a2ml_keyworda2ml_struct_type_name : struct a2ml_identifier_optional CURLY_OPEN a2ml_struct_member_list_optional CURLY_CLOSE\n                                 | struct a2ml_identifiera2ml_struct_member_list_optional : empty\n                                            | a2ml_struct_member_lista2ml_struct_member_list : a2ml_struct_member\n                                   | a2ml_struct_member a2ml_struct_member_lista2ml_struct_member : a2ml_member SEMICOLONa2ml_member : a2ml_type_name a2ml_array_specifier_optionala2ml_member_optional : empty\n                                | a2ml_membera2ml_array_specifier_optional : empty\n                                         | a2ml_array_specifiera2ml_array_specifier : BRACE_OPEN a2ml_constant BRACE_CLOSE\n                                | BRACE_OPEN a2ml_constant BRACE_CLOSE a2ml_array_specifiera2ml_taggedstruct_type_name : taggedstruct a2ml_identifier_optional CURLY_OPEN a2ml_taggedstruct_member_list_optional CURLY_CLOSE\n                                       | taggedstruct a2ml_identifiera2ml_taggedstruct_member_list_optional : empty\n                                                  | a2ml_taggedstruct_member_lista2ml_taggedstruct_member_list : a2ml_taggedstruct_member\n                                         | a2ml_taggedstruct_member a2ml_taggedstruct_member_lista2ml_taggedstruct_member : a2ml_taggedstruct_definition SEMICOLON\n                                    | PARENTHESE_OPEN a2ml_taggedstruct_definition PARENTHESE_CLOSE ASTERISK SEMICOLON\n                                    | a2ml_block_definition SEMICOLON\n                                    | PARENTHESE_OPEN a2ml_block_definition PARENTHESE_CLOSE ASTERISK SEMICOLONa2ml_taggedstruct_definition : a2ml_tag a2ml_member_optional\n                                        | a2ml_tag PARENTHESE_OPEN a2ml_member PARENTHESE_CLOSE ASTERISKa2ml_taggedunion_type_name : taggedunion a2ml_identifier_optional CURLY_OPEN a2ml_taggedunion_member_list_optional CURLY_CLOSE\n                                      | taggedunion a2ml_identifiera2ml_taggedunion_member_list : a2ml_taggedunion_member\n                                        | a2ml_taggedunion_member a2ml_taggedunion_member_lista2ml_taggedunion_member_list_optional : empty\n                                                 | a2ml_taggedunion_member_lista2ml_taggedunion_member : a2ml_tag SEMICOLON\n                                   | a2ml_tag a2ml_member SEMICOLON\n                                   | a2ml_block_definition SEMICOLONa2ml_tag : STRINGa2ml_identifier : IDENTa2ml_identifier_optional : empty\n                                    | a2ml_identifiera2ml_keyword : STRINGa2ml_constant : NUMERICdatatype : UBYTE\n                    | SBYTE\n                    | UWORD\n                    | SWORD\n                    | ULONG\n                    | SLONG\n                    | A_UINT64\n                    | A_INT64\n                    | FLOAT32_IEEE\n                    | FLOAT64_IEEEdatasize : BYTE\n                    | WORD\n                    | LONGaddrtype : PBYTE\n                    | PWORD\n                    | PLONG\n                    | DIRECTindexorder : INDEX_INCR\n                      | INDEX_DECRasap2_version : ASAP2_VERSION NUMERIC NUMERICa2ml_version : A2ML_VERSION NUMERIC NUMERICgeneric_parameter : IDENT\n                             | STRING\n                             | NUMERIC\n                             | begin IDENT generic_parameter_list_optional end IDENTgeneric_parameter_list : generic_parameter\n                                  | generic_parameter generic_parameter_listgeneric_parameter_list_optional : empty\n                                           | generic_parameter_listnumber_list : NUMERIC\n                       | NUMERIC number_listident_list : IDENT\n                      | IDENT ident_liststring_list : STRING\n                       | STRING string_listproject : begin PROJECT IDENT STRING project_optional_list_optional end PROJECTproject_optional : header\n                            | moduleproject_optional_list : project_optional\n                                 | project_optional project_optional_list project_optional_list_optional : empty\n                                          | project_optional_listheader : begin HEADER STRING header_optional_list_optional end HEADERheader_optional : version\n                           | project_noheader_optional_list : header_optional\n                                | header_optional header_optional_listheader_optional_list_optional : empty\n                                         | header_optional_listversion : VERSION STRINGproject_no : PROJECT_NO IDENTmodule : begin MODULE IDENT STRING module_optional_list_optional end MODULEmodule_optional : a2ml\n                           | mod_par\n                           | mod_common\n                           | if_data_xcp\n                           | if_data_module\n                           | characteristic\n                           | axis_pts\n                           | measurement\n                           | compu_method\n                           | compu_tab\n                           | compu_vtab\n                           | compu_vtab_range\n                           | function\n                           | group\n                           | record_layout\n                           | variant_coding\n                           | frame\n                           | user_rights\n                           | unitmodule_optional_list : module_optional\n                                | module_optional module_optional_listmodule_optional_list_optional : empty\n                                         | module_optional_lista2ml : begin A2ML a2ml_declaration_list end A2MLif_data_xcp : begin IF_DATA XCP if_data_xcp_optional_list_optional end IF_DATAif_data_xcp_optional : protocol_layer\n                                | daq\n                                | pag\n                                | pgm\n                                | segment\n                                | daq_event\n                                | xcp_on_can\n                                | generic_parameter_listxcp_on_can : begin XCP_ON_CAN NUMERIC xcp_on_can_optional_list_optional end XCP_ON_CANxcp_on_can_optional : can_id_broadcast\n                               | can_id_master\n                               | can_id_slave\n                               | baudrate\n                               | sample_point\n                               | sample_rate\n                               | btl_cycles\n                               | sjw\n                               | sync_edge\n                               | daq_list_can_idxcp_on_can_optional_list : xcp_on_can_optional\n                                    | xcp_on_can_optional xcp_on_can_optional_listxcp_on_can_optional_list_optional : empty\n                                             | xcp_on_can_optional_listcan_id_broadcast : CAN_ID_BROADCAST NUMERICcan_id_master : CAN_ID_MASTER NUMERICcan_id_slave : CAN_ID_SLAVE NUMERICbaudrate : BAUDRATE NUMERICsample_point : SAMPLE_POINT NUMERICsample_rate : SAMPLE_RATE SINGLE\n                       | SAMPLE_RATE TRIPLEbtl_cycles : BTL_CYCLES NUMERICsjw : SJW NUMERICsync_edge : SYNC_EDGE SINGLE\n                     | SYNC_EDGE DUALdaq_list_can_id : begin DAQ_LIST_CAN_ID NUMERIC daq_list_can_id_optional_optional end DAQ_LIST_CAN_IDdaq_list_can_id_optional : daq_list_can_id_type_variable\n                                    | daq_list_can_id_type_fixeddaq_list_can_id_optional_optional : empty\n                                             | daq_list_can_id_optionaldaq_list_can_id_type_variable : VARIABLEdaq_list_can_id_type_fixed : FIXED NUMERICdaq_event : begin DAQ_EVENT FIXED_EVENT_LIST daq_event_optional_list_optional end DAQ_EVENT\n                     | begin DAQ_EVENT VARIABLE daq_event_optional_list_optional end DAQ_EVENTdaq_event_optional : available_event_list\n                              | default_event_listdaq_event_optional_list : daq_event_optional\n                                   | daq_event_optional daq_event_optional_listdaq_event_optional_list_optional : empty\n                                            | daq_event_optional_listdefault_event_list : begin DEFAULT_EVENT_LIST available_event_list_optional_list_optional end DEFAULT_EVENT_LISTavailable_event_list : begin AVAILABLE_EVENT_LIST available_event_list_optional_list_optional end AVAILABLE_EVENT_LISTavailable_event_list_optional : EVENT NUMERICavailable_event_list_optional_list : available_event_list_optional\n                                              | available_event_list_optional available_event_list_optional_listavailable_event_list_optional_list_optional : empty\n                                                       | available_event_list_optional_listif_data_xcp_optional_list : if_data_xcp_optional\n                                     | if_data_xcp_optional if_data_xcp_optional_listif_data_xcp_optional_list_optional : empty\n                                                     | if_data_xcp_optional_listpag : begin PAG NUMERIC pag_optional_list_optional end PAGpgm : begin PGM IDENT NUMERIC NUMERIC pgm_optional_list_optional end PGMpgm_optional : sector\n                        | generic_parameter_listpgm_optional_list : pgm_optional\n                             | pgm_optional pgm_optional_listpgm_optional_list_optional : empty\n                                      | pgm_optional_listsector : begin SECTOR STRING NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC end SECTORpag_optional : freeze_supported\n                        | generic_parameter_listpag_optional_list : pag_optional\n                             | pag_optional pag_optional_listpag_optional_list_optional : empty\n                                      | pag_optional_listfreeze_supported : FREEZE_SUPPORTEDdaq : begin DAQ daq_config_type NUMERIC NUMERIC NUMERIC optimisation_type address_extension identification_field_type granularity_odt_entry NUMERIC overload_indication daq_optional_list_optional end DAQdaq_config_type : STATIC\n                           | DYNAMICdaq_optional : daq_list\n                        | event\n                        | timestamp_supported\n                        | optimisation_type\n                        | address_extension\n                        | identification_field_type\n                        | granularity_odt_entry\n                        | prescaler_supported\n                        | resume_supported\n                        | IDENT\n                        | NUMERICprescaler_supported : PRESCALER_SUPPORTEDresume_supported : RESUME_SUPPORTEDoptimisation_type : OPTIMISATION_TYPE_DEFAULT\n                             | OPTIMISATION_TYPE_ODT_TYPE_16\n                             | OPTIMISATION_TYPE_ODT_TYPE_32\n                             | OPTIMISATION_TYPE_ODT_TYPE_64\n                             | OPTIMISATION_TYPE_ODT_TYPE_ALIGNMENT\n                             | OPTIMISATION_TYPE_MAX_ENTRY_SIZEaddress_extension : ADDRESS_EXTENSION_FREE\n                             | ADDRESS_EXTENSION_ODT\n                             | ADDRESS_EXTENSION_DAQidentification_field_type : IDENTIFICATION_FIELD_TYPE_ABSOLUTE\n                                     | IDENTIFICATION_FIELD_TYPE_RELATIVE_BYTE\n                                     | IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD\n                                     | IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD_ALIGNEDgranularity_odt_entry : GRANULARITY_ODT_ENTRY_SIZE_DAQ_BYTE\n                                 | GRANULARITY_ODT_ENTRY_SIZE_DAQ_WORD\n                                 | GRANULARITY_ODT_ENTRY_SIZE_DAQ_DWORD\n                                 | GRANULARITY_ODT_ENTRY_SIZE_DAQ_DLONGoverload_indication : NO_OVERLOAD_INDICATION\n                               | OVERLOAD_INDICATION_PID\n                               | OVERLOAD_INDICATION_EVENTdaq_optional_list : daq_optional\n                             | daq_optional daq_optional_listdaq_optional_list_optional : empty\n                                      | daq_optional_listevent : begin EVENT STRING STRING NUMERIC daq_list_type_enum NUMERIC NUMERIC NUMERIC NUMERIC end EVENTdaq_list : begin DAQ_LIST NUMERIC daq_list_optional_list_optional end DAQ_LISTdaq_list_optional : daq_list_type\n                             | max_odt\n                             | max_odt_entries\n                             | first_pid\n                             | event_fixed\n                             | predefineddaq_list_type_enum : DAQ\n                              | STIM\n                              | DAQ_STIMdaq_list_type : DAQ_LIST_TYPE daq_list_type_enummax_odt : MAX_ODT NUMERICmax_odt_entries : MAX_ODT_ENTRIES NUMERICfirst_pid : FIRST_PID NUMERICevent_fixed : EVENT_FIXED NUMERICpredefined : generic_parameter_listdaq_list_optional_list : daq_list_optional\n                                  | daq_list_optional daq_list_optional_listdaq_list_optional_list_optional : empty\n                                           | daq_list_optional_listtimestamp_supported : begin TIMESTAMP_SUPPORTED NUMERIC IDENT IDENT timestamp_fixed end TIMESTAMP_SUPPORTEDtimestamp_fixed : empty\n                           | TIMESTAMP_FIXEDprotocol_layer : begin PROTOCOL_LAYER NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC protocol_layer_optional_list_optional end PROTOCOL_LAYERprotocol_layer_optional : generic_parameter_listprotocol_layer_optional_list : protocol_layer_optional\n                                        | protocol_layer_optional protocol_layer_optional_listprotocol_layer_optional_list_optional : empty\n                                                 | protocol_layer_optional_listif_data_module : begin IF_DATA IDENT if_data_module_optional_list_optional end IF_DATAif_data_module_optional : source\n                                   | raster\n                                   | event_group\n                                   | seed_key\n                                   | checksum\n                                   | tp_blob tp_data\n                                   | if_data_module_unsupported_elementif_data_module_optional_list : if_data_module_optional\n                                        | if_data_module_optional if_data_module_optional_listif_data_module_optional_list_optional : empty\n                                                 | if_data_module_optional_listif_data_module_unsupported_element : generic_parameter_listsource : begin SOURCE IDENT NUMERIC NUMERIC source_optional_list_optional end SOURCEraster : begin RASTER STRING STRING NUMERIC NUMERIC NUMERIC end RASTERevent_group : begin EVENT_GROUP STRING STRING number_list end EVENT_GROUPseed_key : begin SEED_KEY STRING STRING STRING end SEED_KEYchecksum : begin CHECKSUM STRING end CHECKSUM\n                    | begin CHECKSUM IDENT max_block_size end CHECKSUMmax_block_size : MAX_BLOCK_SIZE NUMERICtp_blob : TP_BLOBtp_data : generic_parameter_listsource_optional : display_identifier\n                           | qp_blobsource_optional_list : source_optional\n                                | source_optional source_optional_listsource_optional_list_optional : empty\n                                         | source_optional_listqp_blob : QP_BLOB IDENTmod_par : begin MOD_PAR STRING mod_par_optional_list_optional end MOD_PARmod_par_optional : version\n                            | addr_epk\n                            | epk\n                            | supplier\n                            | customer\n                            | customer_no\n                            | user\n                            | phone_no\n                            | ecu\n                            | cpu_type\n                            | no_of_interfaces\n                            | ecu_calibration_offset\n                            | calibration_method\n                            | memory_layout\n                            | memory_segment\n                            | system_constantmod_par_optional_list : mod_par_optional\n                                 | mod_par_optional mod_par_optional_listmod_par_optional_list_optional : empty\n                                          | mod_par_optional_listaddr_epk : ADDR_EPK NUMERICepk : EPK STRINGsupplier : SUPPLIER STRINGcustomer : CUSTOMER STRINGcustomer_no : CUSTOMER_NO STRINGuser : USER STRINGphone_no : PHONE_NO STRINGmod_common : begin MOD_COMMON STRING mod_common_optional_list_optional end MOD_COMMONmod_common_optional : s_rec_layout\n                               | deposit\n                               | byte_order\n                               | data_size\n                               | alignment_byte\n                               | alignment_word\n                               | alignment_long\n                               | alignment_float32_ieee\n                               | alignment_float64_ieeemod_common_optional_list : mod_common_optional\n                                    | mod_common_optional mod_common_optional_listmod_common_optional_list_optional : empty\n                                             | mod_common_optional_lists_rec_layout : S_REC_LAYOUT IDENTdata_size : DATA_SIZE NUMERICecu : ECU STRINGcpu_type : CPU_TYPE STRINGno_of_interfaces : NO_OF_INTERFACES NUMERICecu_calibration_offset : ECU_CALIBRATION_OFFSET NUMERICcalibration_method : begin CALIBRATION_METHOD STRING NUMERIC calibration_method_optional_list_optional end CALIBRATION_METHODcalibration_method_optional : calibration_handlecalibration_method_optional_list : calibration_method_optional\n                                            | calibration_method_optional calibration_method_optional_listcalibration_method_optional_list_optional : empty\n                                                     | calibration_method_optional_listcalibration_handle : begin CALIBRATION_HANDLE calibration_handle_optional_list_optional end CALIBRATION_HANDLEcalibration_handle_optional : NUMERICcalibration_handle_optional_list : calibration_handle_optional\n                                            | calibration_handle_optional calibration_handle_optional_listcalibration_handle_optional_list_optional : empty\n                                                     | calibration_handle_optional_listmemory_layout : begin MEMORY_LAYOUT memory_layout_prg_type NUMERIC NUMERIC number_list memory_layout_optional_list_optional end MEMORY_LAYOUTmemory_layout_prg_type : PRG_CODE\n                                  | PRG_DATA\n                                  | PRG_RESERVEDmemory_layout_optional : if_data_memory_layoutmemory_layout_optional_list : memory_layout_optional\n                                       | memory_layout_optional memory_layout_optional_listmemory_layout_optional_list_optional : empty\n                                                | memory_layout_optional_listif_data_memory_layout : begin IF_DATA IDENT if_data_memory_layout_optional_list_optional end IF_DATAif_data_memory_layout_optional : dp_blob dp_data\n                                          | ba_blob pa_dataif_data_memory_layout_optional_list : if_data_memory_layout_optional\n                                               | if_data_memory_layout_optional if_data_memory_layout_optional_listif_data_memory_layout_optional_list_optional : empty\n                                                        | if_data_memory_layout_optional_listdp_blob : DP_BLOBba_blob : BA_BLOBdp_data : generic_parameter_listpa_data : generic_parameter_listmemory_segment : begin MEMORY_SEGMENT IDENT STRING memory_segment_prg_type memory_segment_memory_type memory_segment_attributes NUMERIC NUMERIC number_list memory_segment_optional_list_optional end MEMORY_SEGMENTmemory_segment_optional : if_data_memory_segment\n                                   | if_data_xcpmemory_segment_optional_parameter_list : memory_segment_optional\n                                                  | memory_segment_optional memory_segment_optional_parameter_listmemory_segment_optional_list_optional : empty\n                                                 | memory_segment_optional_parameter_listmemory_segment_prg_type : CODE\n                                   | DATA\n                                   | OFFLINE_DATA\n                                   | VARIABLES\n                                   | SERAM\n                                   | RESERVED\n                                   | CALIBRATION_VARIABLES\n                                   | EXCLUDE_FROM_FLASHmemory_segment_memory_type : RAM\n                                      | EEPROM\n                                      | EPROM\n                                      | ROM\n                                      | REGISTER\n                                      | FLASHmemory_segment_attributes : INTERN\n                                     | EXTERNsystem_constant : SYSTEM_CONSTANT STRING STRINGif_data_memory_segment : begin IF_DATA IDENT if_data_memory_segment_optional_list_optional end IF_DATAif_data_memory_segment_optional : address_mapping\n                                           | segment\n                                           | generic_parameterif_data_memory_segment_optional_list : if_data_memory_segment_optional\n                                                | if_data_memory_segment_optional if_data_memory_segment_optional_listif_data_memory_segment_optional_list_optional : empty\n                                                         | if_data_memory_segment_optional_listsegment : begin SEGMENT NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC segment_optional_parameter_list_optional end SEGMENTsegment_optional_parameter : page\n                                      | checksumsegment_optional_parameter_list : segment_optional_parameter\n                                           | segment_optional_parameter segment_optional_parameter_listsegment_optional_parameter_list_optional : empty\n                                                    | segment_optional_parameter_listpage : begin PAGE NUMERIC IDENT IDENT IDENT page_optional_parameter_list_optional end PAGEpage_optional_parameter : init_segmentpage_optional_parameter_list : page_optional_parameter\n                                        | page_optional_parameter page_optional_parameter_listpage_optional_parameter_list_optional : empty\n                                                 | page_optional_parameter_listinit_segment : INIT_SEGMENT NUMERICaddress_mapping : ADDRESS_MAPPING NUMERIC NUMERIC NUMERICcharacteristic : begin CHARACTERISTIC IDENT STRING characteristic_type NUMERIC IDENT NUMERIC IDENT NUMERIC NUMERIC characteristic_optional_list_optional end CHARACTERISTICcharacteristic_type : VALUE\n                               | CURVE\n                               | MAP\n                               | CUBOID\n                               | VAL_BLK\n                               | ASCIIdisplay_identifier : DISPLAY_IDENTIFIER IDENTformat : FORMAT STRINGbyte_order : BYTE_ORDER byte_order_typebyte_order_type : MSB_FIRST\n                           | MSB_LASTbit_mask : BIT_MASK NUMERICfunction_list : begin FUNCTION_LIST function_list_optional_list_optional end FUNCTION_LISTfunction_list_optional : IDENTfunction_list_optional_list : function_list_optional\n                                       | function_list_optional function_list_optional_listfunction_list_optional_list_optional : empty\n                                                | function_list_optional_listnumber : NUMBER NUMERICextended_limits : EXTENDED_LIMITS NUMERIC NUMERICmap_list : begin MAP_LIST ident_list end MAP_LISTmax_refresh : MAX_REFRESH NUMERIC NUMERICdependent_characteristic : begin DEPENDENT_CHARACTERISTIC STRING ident_list end DEPENDENT_CHARACTERISTICvirtual_characteristic : begin VIRTUAL_CHARACTERISTIC STRING virtual_characteristic_optional end VIRTUAL_CHARACTERISTICvirtual_characteristic_optional : empty\n                                           | ident_listref_memory_segment : REF_MEMORY_SEGMENT IDENTannotation : begin ANNOTATION annotation_optional_list_optional end ANNOTATIONannotation_optional : annotation_label\n                               | annotation_origin\n                               | annotation_textannotation_optional_list : annotation_optional\n                                    | annotation_optional annotation_optional_listannotation_optional_list_optional : empty\n                                             | annotation_optional_listannotation_label : ANNOTATION_LABEL STRINGannotation_origin : ANNOTATION_ORIGIN STRINGannotation_text : begin ANNOTATION_TEXT string_list end ANNOTATION_TEXTcomparison_quantity : COMPARISON_QUANTITY IDENTaxis_descr : begin AXIS_DESCR axis_descr_attribute IDENT IDENT NUMERIC NUMERIC NUMERIC axis_descr_optional_list_optional end AXIS_DESCRaxis_descr_optional : read_only\n                               | format\n                               | annotation\n                               | axis_pts_ref\n                               | max_grad\n                               | monotony\n                               | byte_order\n                               | extended_limits\n                               | fix_axis_par\n                               | fix_axis_par_dist\n                               | fix_axis_par_list\n                               | deposit\n                               | curve_axis_refaxis_descr_optional_list : axis_descr_optional\n                                    | axis_descr_optional axis_descr_optional_listaxis_descr_optional_list_optional : empty\n                                             | axis_descr_optional_listaxis_pts_ref : AXIS_PTS_REF IDENTmax_grad : MAX_GRAD NUMERICmonotony : MONOTONY monotony_typemonotony_type : MON_INCREASE\n                         | MON_DECREASE\n                         | STRICT_INCREASE\n                         | STRICT_DECREASEfix_axis_par : FIX_AXIS_PAR NUMERIC NUMERIC NUMERICfix_axis_par_dist : FIX_AXIS_PAR_DIST NUMERIC NUMERIC NUMERICfix_axis_par_list : begin FIX_AXIS_PAR_LIST number_list end FIX_AXIS_PAR_LISTcurve_axis_ref : CURVE_AXIS_REF IDENTaxis_descr_attribute : STD_AXIS\n                                | FIX_AXIS\n                                | COM_AXIS\n                                | RES_AXIS\n                                | CURVE_AXIScalibration_access : CALIBRATION_ACCESS calibration_access_typecalibration_access_type : CALIBRATION\n                                   | NO_CALIBRATION\n                                   | NOT_IN_MCD_SYSTEM\n                                   | OFFLINE_CALIBRATIONmatrix_dim : MATRIX_DIM NUMERIC NUMERIC NUMERICecu_address_extension : ECU_ADDRESS_EXTENSION NUMERICcharacteristic_optional : display_identifier\n                                   | format\n                                   | byte_order\n                                   | bit_mask\n                                   | function_list\n                                   | number\n                                   | extended_limits\n                                   | read_only\n                                   | guard_rails\n                                   | map_list\n                                   | max_refresh\n                                   | dependent_characteristic\n                                   | virtual_characteristic\n                                   | ref_memory_segment\n                                   | annotation\n                                   | comparison_quantity\n                                   | if_data_characteristic\n                                   | axis_descr\n                                   | calibration_access\n                                   | matrix_dim\n                                   | ecu_address_extensioncharacteristic_optional_list : characteristic_optional\n                                        | characteristic_optional characteristic_optional_listcharacteristic_optional_list_optional : empty\n                                                 | characteristic_optional_listif_data_characteristic : if_data_memory_layoutaxis_pts : begin AXIS_PTS IDENT STRING NUMERIC IDENT IDENT NUMERIC IDENT NUMERIC NUMERIC NUMERIC axis_pts_optional_list_optional end AXIS_PTSaxis_pts_optional : display_identifier\n                             | read_only\n                             | format\n                             | deposit\n                             | byte_order\n                             | function_list\n                             | ref_memory_segment\n                             | guard_rails\n                             | extended_limits\n                             | annotation\n                             | if_data_axis_pts\n                             | calibration_access\n                             | ecu_address_extensionaxis_pts_optional_list : axis_pts_optional\n                                  | axis_pts_optional axis_pts_optional_listaxis_pts_optional_list_optional : empty\n                                           | axis_pts_optional_listif_data_axis_pts : if_data_memory_layoutdeposit : DEPOSIT deposit_modedeposit_mode : ABSOLUTE\n                        | DIFFERENCEmeasurement : begin MEASUREMENT IDENT STRING datatype IDENT NUMERIC NUMERIC NUMERIC NUMERIC measurement_optional_list_optional end MEASUREMENTmeasurement_optional : display_identifier\n                                | read_write\n                                | format\n                                | array_size\n                                | bit_mask\n                                | bit_operation\n                                | byte_order\n                                | max_refresh\n                                | virtual\n                                | function_list\n                                | ecu_address\n                                | error_mask\n                                | ref_memory_segment\n                                | annotation\n                                | if_data_xcp\n                                | if_data_measurement\n                                | matrix_dim\n                                | ecu_address_extensionmeasurement_optional_list : measurement_optional\n                                     | measurement_optional measurement_optional_listmeasurement_optional_list_optional : empty\n                                              | measurement_optional_listread_write : READ_WRITEif_data_measurement : begin IF_DATA IDENT if_data_measurement_optional_parameter_list_optional end IF_DATAif_data_measurement_optional_parameter : kp_blob kp_data\n                                                  | dp_blob dp_data\n                                                  | pa_blob pa_data\n                                                  | if_data_measurement_unsupported_elementif_data_measurement_unsupported_element : begin IDENT generic_parameter_list end IDENTif_data_measurement_optional_parameter_list : if_data_measurement_optional_parameter\n                                                       | if_data_measurement_optional_parameter if_data_measurement_optional_parameter_listif_data_measurement_optional_parameter_list_optional : empty\n                                                                | if_data_measurement_optional_parameter_listkp_blob : KP_BLOBpa_blob : PA_BLOBkp_data : kp_data_parameter_optional_listkp_data_parameter_optional : NUMERIC\n                                      | STRING\n                                      | IDENTkp_data_parameter_optional_list : kp_data_parameter_optional\n                                           | kp_data_parameter_optional kp_data_parameter_optional_listarray_size : ARRAY_SIZE NUMERICbit_operation : begin BIT_OPERATION bit_operation_optional_list_optional end BIT_OPERATIONbit_operation_optional : left_shift\n                                  | right_shift\n                                  | sign_extendbit_operation_optional_list : bit_operation_optional\n                                       | bit_operation_optional bit_operation_optional_listbit_operation_optional_list_optional : empty\n                                                | bit_operation_optional_listleft_shift : LEFT_SHIFT NUMERICright_shift : RIGHT_SHIFT NUMERICsign_extend : SIGN_EXTENDcompu_method : begin COMPU_METHOD IDENT STRING compu_method_conversion_type STRING STRING compu_method_optional_list_optional end COMPU_METHODcompu_method_optional : formula\n                                 | coeffs\n                                 | coeffs_linear\n                                 | compu_tab_ref\n                                 | ref_unitcompu_method_optional_list : compu_method_optional\n                                      | compu_method_optional compu_method_optional_listcompu_method_optional_list_optional : empty\n                                               | compu_method_optional_listcompu_method_conversion_type : TAB_INTP\n                             | TAB_NOINTP\n                             | TAB_VERB\n                             | RAT_FUNC\n                             | FORM\n                             | IDENTICAL\n                             | LINEARformula : begin FORMULA STRING formula_optional_list_optional end FORMULAformula_optional : formula_invformula_optional_list : formula_optional\n                                 | formula_optional formula_optional_listformula_optional_list_optional : empty\n                                          | formula_optional_listformula_inv : FORMULA_INV STRINGcoeffs : COEFFS NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERICcoeffs_linear : COEFFS_LINEAR NUMERIC NUMERICcompu_tab_ref : COMPU_TAB_REF IDENTref_unit : REF_UNIT IDENTvirtual : begin VIRTUAL ident_list end VIRTUALecu_address : ECU_ADDRESS NUMERICerror_mask : ERROR_MASK NUMERICcompu_tab : begin COMPU_TAB IDENT STRING compu_tab_conversion_type NUMERIC compu_tab_optional_list_optional end COMPU_TABcompu_tab_optional : in_val_out_val\n                              | default_value\n                              | default_value_numericcompu_tab_optional_list : compu_tab_optional\n                                   | compu_tab_optional compu_tab_optional_listcompu_tab_optional_list_optional : empty\n                                            | compu_tab_optional_listin_val_out_val : number_listcompu_tab_conversion_type : TAB_INTP\n                                     | TAB_NOINTPdefault_value : DEFAULT_VALUE STRINGdefault_value_numeric : DEFAULT_VALUE_NUMERIC NUMERICcompu_vtab : begin COMPU_VTAB IDENT STRING compu_vtab_conversion_type NUMERIC compu_vtab_optional_list_optional end COMPU_VTABcompu_vtab_optional : default_value\n                               | compu_vtab_in_val_out_valcompu_vtab_optional_list : compu_vtab_optional\n                                    | compu_vtab_optional compu_vtab_optional_listcompu_vtab_optional_list_optional : empty\n                                             | compu_vtab_optional_listcompu_vtab_in_val_out_val : number_string_value_listcompu_vtab_conversion_type : TAB_VERBnumber_string_value_list : number_string_value\n                                    | number_string_value number_string_value_listnumber_string_value : NUMERIC STRINGcompu_vtab_range : begin COMPU_VTAB_RANGE IDENT STRING NUMERIC compu_vtab_range_optional_list_optional end COMPU_VTAB_RANGEcompu_vtab_range_optional : default_value\n                                     | compu_vtab_range_in_val_out_valcompu_vtab_range_optional_list : compu_vtab_range_optional\n                                          | compu_vtab_range_optional compu_vtab_range_optional_listcompu_vtab_range_optional_list_optional : empty\n                                                   | compu_vtab_range_optional_listcompu_vtab_range_in_val_out_val : number_number_string_value_listnumber_number_string_value_list : number_number_string_value\n                                           | number_number_string_value number_number_string_value_listnumber_number_string_value : NUMERIC NUMERIC STRINGfunction : begin FUNCTION IDENT STRING function_optional_list_optional end FUNCTIONfunction_optional : annotation\n                             | def_characteristic\n                             | ref_characteristic\n                             | in_measurement\n                             | out_measurement\n                             | loc_measurement\n                             | sub_function\n                             | function_versionfunction_optional_list : function_optional\n                                  | function_optional function_optional_listfunction_optional_list_optional : empty\n                                           | function_optional_listdef_characteristic : begin DEF_CHARACTERISTIC def_characteristic_optional_list_optional end DEF_CHARACTERISTICdef_characteristic_optional : identifierdef_characteristic_optional_list : def_characteristic_optional\n                                            | def_characteristic_optional def_characteristic_optional_listdef_characteristic_optional_list_optional : empty\n                                                     | def_characteristic_optional_listidentifier : IDENTref_characteristic : begin REF_CHARACTERISTIC ref_characteristic_optional_list_optional end REF_CHARACTERISTICref_characteristic_optional : identifierref_characteristic_optional_list : ref_characteristic_optional\n                                            | ref_characteristic_optional ref_characteristic_optional_listref_characteristic_optional_list_optional : empty\n                                                     | ref_characteristic_optional_listin_measurement : begin IN_MEASUREMENT in_measurement_optional_list_optional end IN_MEASUREMENTin_measurement_optional : identifierin_measurement_optional_list : in_measurement_optional\n                                        | in_measurement_optional in_measurement_optional_listin_measurement_optional_list_optional : empty\n                                                 | in_measurement_optional_listout_measurement : begin OUT_MEASUREMENT out_measurement_optional_list_optional end OUT_MEASUREMENTout_measurement_optional : identifierout_measurement_optional_list : out_measurement_optional\n                                         | out_measurement_optional out_measurement_optional_listout_measurement_optional_list_optional : empty\n                                                  | out_measurement_optional_listloc_measurement : begin LOC_MEASUREMENT loc_measurement_optional_list_optional end LOC_MEASUREMENTloc_measurement_optional : identifierloc_measurement_optional_list : loc_measurement_optional\n                                         | loc_measurement_optional loc_measurement_optional_listloc_measurement_optional_list_optional : empty\n                                                  | loc_measurement_optional_listsub_function : begin SUB_FUNCTION sub_function_optional_list_optional end SUB_FUNCTIONsub_function_optional : identifiersub_function_optional_list : sub_function_optional\n                                      | sub_function_optional sub_function_optional_listsub_function_optional_list_optional : empty\n                                               | sub_function_optional_listfunction_version : FUNCTION_VERSION STRINGgroup : begin GROUP IDENT STRING group_optional_list_optional end GROUPgroup_optional : annotation\n                          | root\n                          | ref_characteristic\n                          | ref_measurement\n                          | function_list\n                          | sub_groupgroup_optional_list : group_optional\n                               | group_optional group_optional_listgroup_optional_list_optional : empty\n                                        | group_optional_listroot : ROOTref_measurement : begin REF_MEASUREMENT ref_measurement_optional_list_optional end REF_MEASUREMENTref_measurement_optional : identifierref_measurement_optional_list : ref_measurement_optional\n                                         | ref_measurement_optional ref_measurement_optional_listref_measurement_optional_list_optional : empty\n                                                  | ref_measurement_optional_listsub_group : begin SUB_GROUP sub_group_optional_list_optional end SUB_GROUPsub_group_optional : identifiersub_group_optional_list : sub_group_optional\n                                   | sub_group_optional sub_group_optional_listsub_group_optional_list_optional : empty\n                                            | sub_group_optional_listrecord_layout : begin RECORD_LAYOUT IDENT record_layout_optional_list_optional end RECORD_LAYOUTrecord_layout_optional : fnc_values\n                                  | identification\n                                  | axis_pts_x\n                                  | axis_pts_y\n                                  | axis_pts_z\n                                  | axis_rescale_x\n                                  | axis_rescale_y\n                                  | axis_rescale_z\n                                  | no_axis_pts_x\n                                  | no_axis_pts_y\n                                  | no_axis_pts_z\n                                  | no_rescale_x\n                                  | no_rescale_y\n                                  | no_rescale_z\n                                  | fix_no_axis_pts_x\n                                  | fix_no_axis_pts_y\n                                  | fix_no_axis_pts_z\n                                  | src_addr_x\n                                  | src_addr_y\n                                  | src_addr_z\n                                  | rip_addr_x\n                                  | rip_addr_y\n                                  | rip_addr_z\n                                  | rip_addr_w\n                                  | shift_op_x\n                                  | shift_op_y\n                                  | shift_op_z\n                                  | offset_x\n                                  | offset_y\n                                  | offset_z\n                                  | dist_op_x\n                                  | dist_op_y\n                                  | dist_op_z\n                                  | alignment_byte\n                                  | alignment_word\n                                  | alignment_long\n                                  | alignment_float32_ieee\n                                  | alignment_float64_ieee\n                                  | reservedrecord_layout_optional_list : record_layout_optional\n                                       | record_layout_optional record_layout_optional_listrecord_layout_optional_list_optional : empty\n                                                | record_layout_optional_listfnc_values : FNC_VALUES NUMERIC datatype fnc_values_index_mode addrtypefnc_values_index_mode : COLUMN_DIR\n                                 | ROW_DIR\n                                 | ALTERNATE_WITH_X\n                                 | ALTERNATE_WITH_Y\n                                 | ALTERNATE_CURVESidentification : IDENTIFICATION NUMERIC datatypeaxis_pts_x : AXIS_PTS_X NUMERIC datatype indexorder addrtypeaxis_pts_y : AXIS_PTS_Y NUMERIC datatype indexorder addrtypeaxis_pts_z : AXIS_PTS_Z NUMERIC datatype indexorder addrtypeaxis_rescale_x : AXIS_RESCALE_X NUMERIC datatype NUMERIC indexorder addrtypeaxis_rescale_y : AXIS_RESCALE_Y NUMERIC datatype NUMERIC indexorder addrtypeaxis_rescale_z : AXIS_RESCALE_Z NUMERIC datatype NUMERIC indexorder addrtypeno_axis_pts_x : NO_AXIS_PTS_X NUMERIC datatypeno_axis_pts_y : NO_AXIS_PTS_Y NUMERIC datatypeno_axis_pts_z : NO_AXIS_PTS_Z NUMERIC datatypeno_rescale_x : NO_RESCALE_X NUMERIC datatypeno_rescale_y : NO_RESCALE_Y NUMERIC datatypeno_rescale_z : NO_RESCALE_Z NUMERIC datatypefix_no_axis_pts_x : FIX_NO_AXIS_PTS_X NUMERICfix_no_axis_pts_y : FIX_NO_AXIS_PTS_Y NUMERICfix_no_axis_pts_z : FIX_NO_AXIS_PTS_Z NUMERICsrc_addr_x : SRC_ADDR_X NUMERIC datatypesrc_addr_y : SRC_ADDR_Y NUMERIC datatypesrc_addr_z : SRC_ADDR_Z NUMERIC datatyperip_addr_x : RIP_ADDR_X NUMERIC datatyperip_addr_y : RIP_ADDR_Y NUMERIC datatyperip_addr_z : RIP_ADDR_Z NUMERIC datatyperip_addr_w : RIP_ADDR_W NUMERIC datatypeshift_op_x : SHIFT_OP_X NUMERIC datatypeshift_op_y : SHIFT_OP_Y NUMERIC datatypeshift_op_z : SHIFT_OP_Z NUMERIC datatypeoffset_x : OFFSET_X NUMERIC datatypeoffset_y : OFFSET_Y NUMERIC datatypeoffset_z : OFFSET_Z NUMERIC datatypedist_op_x : DIST_OP_X NUMERIC datatypedist_op_y : DIST_OP_Y NUMERIC datatypedist_op_z : DIST_OP_Z NUMERIC datatypealignment_byte : ALIGNMENT_BYTE NUMERICalignment_word : ALIGNMENT_WORD NUMERICalignment_long : ALIGNMENT_LONG NUMERICalignment_float32_ieee : ALIGNMENT_FLOAT32_IEEE NUMERICalignment_float64_ieee : ALIGNMENT_FLOAT64_IEEE NUMERICvariant_coding : begin VARIANT_CODING variant_coding_optional_list_optional end VARIANT_CODINGvariant_coding_optional : var_separator\n                                   | var_naming\n                                   | var_criterion\n                                   | var_forbidden_comb\n                                   | var_characteristicvariant_coding_optional_list : variant_coding_optional\n                                        | variant_coding_optional variant_coding_optional_listvariant_coding_optional_list_optional : empty\n                                                 | variant_coding_optional_listvar_separator : VAR_SEPARATOR STRINGvar_naming : VAR_NAMING IDENTvar_criterion : begin VAR_CRITERION IDENT STRING ident_list var_criterion_optional_list_optional end VAR_CRITERIONvar_characteristic : begin VAR_CHARACTERISTIC IDENT ident_list var_characteristic_optional_optional end VAR_CHARACTERISTICvar_characteristic_optional : var_addressvar_characteristic_optional_optional : empty\n                                                | var_characteristic_optionalvar_address : begin VAR_ADDRESS number_list end VAR_ADDRESSvar_forbidden_comb : begin VAR_FORBIDDEN_COMB var_forbidden_comb_criterion_list end VAR_FORBIDDEN_COMBvar_forbidden_comb_criterion_list : var_forbidden_comb_criterion_optional\n                                             | var_forbidden_comb_criterion_optional var_forbidden_comb_criterion_optional_listvar_forbidden_comb_criterion_optional : IDENT IDENTvar_forbidden_comb_criterion_optional_list : var_forbidden_comb_criterion_optional\n                                                      | var_forbidden_comb_criterion_optional var_forbidden_comb_criterion_optional_listvar_criterion_optional : var_measurement\n                                  | var_selection_characteristicvar_criterion_optional_list : var_criterion_optional\n                                       | var_criterion_optional var_criterion_optional_listvar_criterion_optional_list_optional : empty\n                                                | var_criterion_optional_listvar_measurement : VAR_MEASUREMENT IDENTvar_selection_characteristic : VAR_SELECTION_CHARACTERISTIC IDENTreserved : RESERVED NUMERIC datasizeframe : begin FRAME IDENT STRING NUMERIC NUMERIC frame_optional_list_optional end FRAMEframe_optional : frame_measurement\n                          | if_data_frameframe_optional_list : frame_optional\n                               | frame_optional frame_optional_listframe_optional_list_optional : empty\n                                        | frame_optional_listif_data_frame : begin IF_DATA IDENT if_data_frame_optional_list_optional end IF_DATAif_data_frame_optional : QP_BLOB qp_dataif_data_frame_optional_list : if_data_frame_optional\n                                       | if_data_frame_optional if_data_frame_optional_listif_data_frame_optional_list_optional : empty\n                                                | if_data_frame_optional_listqp_data : generic_parameterframe_measurement : FRAME_MEASUREMENT ident_listuser_rights : begin USER_RIGHTS IDENT user_rights_optional_list_optional end USER_RIGHTSuser_rights_optional : ref_group\n                                | read_onlyuser_rights_optional_list : user_rights_optional\n                                     | user_rights_optional user_rights_optional_listuser_rights_optional_list_optional : empty\n                                              | user_rights_optional_listref_group : begin REF_GROUP ref_group_optional_list_optional end REF_GROUPref_group_optional : identifierref_group_optional_list : ref_group_optional\n                                   | ref_group_optional ref_group_optional_listref_group_optional_list_optional : empty\n                                            | ref_group_optional_listread_only : READ_ONLYguard_rails : GUARD_RAILSunit : begin UNIT IDENT STRING STRING unit_type unit_optional_list_optional end UNITunit_optional : si_exponents\n                         | ref_unit\n                         | unit_conversionunit_optional_list : unit_optional\n                              | unit_optional unit_optional_listunit_optional_list_optional : empty\n                                       | unit_optional_listunit_type : EXTENDED_SI\n                     | DERIVEDsi_exponents : SI_EXPONENTS NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERICunit_conversion : UNIT_CONVERSION NUMERIC NUMERICempty :'
+_lr_signature = 'A2ML A2ML_VERSION ABSOLUTE ADDRESS_EXTENSION_DAQ ADDRESS_EXTENSION_FREE ADDRESS_EXTENSION_ODT ADDRESS_MAPPING ADDR_EPK ALIGNMENT_BYTE ALIGNMENT_FLOAT32_IEEE ALIGNMENT_FLOAT64_IEEE ALIGNMENT_LONG ALIGNMENT_WORD ALTERNATE_CURVES ALTERNATE_WITH_X ALTERNATE_WITH_Y ANNOTATION ANNOTATION_LABEL ANNOTATION_ORIGIN ANNOTATION_TEXT ARRAY_SIZE ASAP2_VERSION ASCII ASTERISK AVAILABLE_EVENT_LIST AXIS_DESCR AXIS_PTS AXIS_PTS_REF AXIS_PTS_X AXIS_PTS_Y AXIS_PTS_Z AXIS_RESCALE_X AXIS_RESCALE_Y AXIS_RESCALE_Z A_INT64 A_UINT64 BAUDRATE BA_BLOB BIT_MASK BIT_OPERATION BRACE_CLOSE BRACE_OPEN BTL_CYCLES BYTE BYTE_ORDER CALIBRATION CALIBRATION_ACCESS CALIBRATION_HANDLE CALIBRATION_METHOD CALIBRATION_VARIABLES CAN_ID_BROADCAST CAN_ID_MASTER CAN_ID_SLAVE CHARACTERISTIC CHECKSUM CODE COEFFS COEFFS_LINEAR COLUMN_DIR COMMA COMPARISON_QUANTITY COMPU_METHOD COMPU_TAB COMPU_TAB_REF COMPU_VTAB COMPU_VTAB_RANGE COM_AXIS CPU_TYPE CUBOID CURLY_CLOSE CURLY_OPEN CURVE CURVE_AXIS CURVE_AXIS_REF CUSTOMER CUSTOMER_NO DAQ DAQ_EVENT DAQ_LIST DAQ_LIST_CAN_ID DAQ_LIST_TYPE DAQ_STIM DATA DATA_SIZE DEFAULT_EVENT_LIST DEFAULT_VALUE DEFAULT_VALUE_NUMERIC DEF_CHARACTERISTIC DEPENDENT_CHARACTERISTIC DEPOSIT DERIVED DIFFERENCE DIRECT DISPLAY_IDENTIFIER DIST_OP_X DIST_OP_Y DIST_OP_Z DP_BLOB DUAL DYNAMIC ECU ECU_ADDRESS ECU_ADDRESS_EXTENSION ECU_CALIBRATION_OFFSET EEPROM EPK EPROM EQUAL ERROR_MASK EVENT EVENT_FIXED EVENT_GROUP EXCLUDE_FROM_FLASH EXTENDED_LIMITS EXTENDED_SI EXTERN FIRST_PID FIXED FIXED_EVENT_LIST FIX_AXIS FIX_AXIS_PAR FIX_AXIS_PAR_DIST FIX_AXIS_PAR_LIST FIX_NO_AXIS_PTS_X FIX_NO_AXIS_PTS_Y FIX_NO_AXIS_PTS_Z FLASH FLOAT32_IEEE FLOAT64_IEEE FNC_VALUES FORM FORMAT FORMULA FORMULA_INV FRAME FRAME_MEASUREMENT FREEZE_SUPPORTED FUNCTION FUNCTION_LIST FUNCTION_VERSION GRANULARITY_ODT_ENTRY_SIZE_DAQ_BYTE GRANULARITY_ODT_ENTRY_SIZE_DAQ_DLONG GRANULARITY_ODT_ENTRY_SIZE_DAQ_DWORD GRANULARITY_ODT_ENTRY_SIZE_DAQ_WORD GROUP GUARD_RAILS HEADER IDENT IDENTICAL IDENTIFICATION IDENTIFICATION_FIELD_TYPE_ABSOLUTE IDENTIFICATION_FIELD_TYPE_RELATIVE_BYTE IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD_ALIGNED IF_DATA INDEX_DECR INDEX_INCR INIT_SEGMENT INTERN IN_MEASUREMENT KP_BLOB LEFT_SHIFT LINEAR LOC_MEASUREMENT LONG MAP MAP_LIST MATRIX_DIM MAX_BLOCK_SIZE MAX_GRAD MAX_ODT MAX_ODT_ENTRIES MAX_REFRESH MEASUREMENT MEMORY_LAYOUT MEMORY_SEGMENT MODULE MOD_COMMON MOD_PAR MONOTONY MON_DECREASE MON_INCREASE MSB_FIRST MSB_LAST NOT_IN_MCD_SYSTEM NO_AXIS_PTS_X NO_AXIS_PTS_Y NO_AXIS_PTS_Z NO_CALIBRATION NO_OF_INTERFACES NO_OVERLOAD_INDICATION NO_RESCALE_X NO_RESCALE_Y NO_RESCALE_Z NUMBER NUMERIC OFFLINE_CALIBRATION OFFLINE_DATA OFFSET_X OFFSET_Y OFFSET_Z OPTIMISATION_TYPE_DEFAULT OPTIMISATION_TYPE_MAX_ENTRY_SIZE OPTIMISATION_TYPE_ODT_TYPE_16 OPTIMISATION_TYPE_ODT_TYPE_32 OPTIMISATION_TYPE_ODT_TYPE_64 OPTIMISATION_TYPE_ODT_TYPE_ALIGNMENT OUT_MEASUREMENT OVERLOAD_INDICATION_EVENT OVERLOAD_INDICATION_PID PAG PAGE PARENTHESE_CLOSE PARENTHESE_OPEN PA_BLOB PBYTE PGM PHONE_NO PLONG PRESCALER_SUPPORTED PRG_CODE PRG_DATA PRG_RESERVED PROJECT PROJECT_NO PROTOCOL_LAYER PWORD QP_BLOB RAM RASTER RAT_FUNC READ_ONLY READ_WRITE RECORD_LAYOUT REF_CHARACTERISTIC REF_GROUP REF_MEASUREMENT REF_MEMORY_SEGMENT REF_UNIT REGISTER RESERVED RESUME_SUPPORTED RES_AXIS RIGHT_SHIFT RIP_ADDR_W RIP_ADDR_X RIP_ADDR_Y RIP_ADDR_Z ROM ROOT ROW_DIR SAMPLE_POINT SAMPLE_RATE SBYTE SECTOR SEED_KEY SEGMENT SEMICOLON SERAM SHIFT_OP_X SHIFT_OP_Y SHIFT_OP_Z SIGN_EXTEND SINGLE SI_EXPONENTS SJW SLONG SOURCE SRC_ADDR_X SRC_ADDR_Y SRC_ADDR_Z STATIC STD_AXIS STIM STRICT_DECREASE STRICT_INCREASE STRING SUB_FUNCTION SUB_GROUP SUPPLIER SWORD SYNC_EDGE SYSTEM_CONSTANT S_REC_LAYOUT TAB_INTP TAB_NOINTP TAB_VERB TIMESTAMP_FIXED TIMESTAMP_SUPPORTED TP_BLOB TRIPLE UBYTE ULONG UNIT UNIT_CONVERSION USER USER_RIGHTS UWORD VALUE VAL_BLK VARIABLE VARIABLES VARIANT_CODING VAR_ADDRESS VAR_CHARACTERISTIC VAR_CRITERION VAR_FORBIDDEN_COMB VAR_MEASUREMENT VAR_NAMING VAR_SELECTION_CHARACTERISTIC VAR_SEPARATOR VERSION VIRTUAL VIRTUAL_CHARACTERISTIC WORD XCP XCP_ON_CAN begin block char double end enum float int long struct taggedstruct taggedunion uchar uint ulonga2l : a2l_optional_list_optionala2l_optional : asap2_version\n                        | a2ml_version\n                        | projecta2l_optional_list : a2l_optional\n                             | a2l_optional_list a2l_optionala2l_optional_list_optional : empty\n                                      | a2l_optional_lista2ml_declaration : a2ml_type_definition SEMICOLON\n                            | a2ml_block_definition SEMICOLONa2ml_declaration_list : a2ml_declaration\n                                 | a2ml_declaration_list a2ml_declarationa2ml_type_definition : a2ml_type_namea2ml_type_name : a2ml_predefined_type_name\n                          | a2ml_struct_type_name\n                          | a2ml_enum_type_name\n                          | a2ml_taggedstruct_type_name\n                          | a2ml_taggedunion_type_namea2ml_predefined_type_name : char\n                                     | int\n                                     | long\n                                     | uchar\n                                     | uint\n                                     | ulong\n                                     | double\n                                     | floata2ml_block_definition : block a2ml_tag a2ml_type_namea2ml_enum_type_name : enum a2ml_identifier_optional CURLY_OPEN a2ml_enumerator_list CURLY_CLOSE\n                               | enum a2ml_identifiera2ml_enumerator_list : a2ml_enumerator\n                                | a2ml_enumerator_list COMMA a2ml_enumeratora2ml_enumerator : a2ml_keyword EQUAL a2ml_constant\n                           | a2ml_keyworda2ml_struct_type_name : struct a2ml_identifier_optional CURLY_OPEN a2ml_struct_member_list_optional CURLY_CLOSE\n                                 | struct a2ml_identifiera2ml_struct_member_list_optional : empty\n                                            | a2ml_struct_member_lista2ml_struct_member_list : a2ml_struct_member\n                                   | a2ml_struct_member_list a2ml_struct_membera2ml_struct_member : a2ml_member SEMICOLONa2ml_member : a2ml_type_name a2ml_array_specifier_optionala2ml_member_optional : empty\n                                | a2ml_membera2ml_array_specifier_optional : empty\n                                         | a2ml_array_specifiera2ml_array_specifier : BRACE_OPEN a2ml_constant BRACE_CLOSE\n                                | BRACE_OPEN a2ml_constant BRACE_CLOSE a2ml_array_specifiera2ml_taggedstruct_type_name : taggedstruct a2ml_identifier_optional CURLY_OPEN a2ml_taggedstruct_member_list_optional CURLY_CLOSE\n                                       | taggedstruct a2ml_identifiera2ml_taggedstruct_member_list_optional : empty\n                                                  | a2ml_taggedstruct_member_lista2ml_taggedstruct_member_list : a2ml_taggedstruct_member\n                                         | a2ml_taggedstruct_member_list a2ml_taggedstruct_membera2ml_taggedstruct_member : a2ml_taggedstruct_definition SEMICOLON\n                                    | PARENTHESE_OPEN a2ml_taggedstruct_definition PARENTHESE_CLOSE ASTERISK SEMICOLON\n                                    | a2ml_block_definition SEMICOLON\n                                    | PARENTHESE_OPEN a2ml_block_definition PARENTHESE_CLOSE ASTERISK SEMICOLONa2ml_taggedstruct_definition : a2ml_tag a2ml_member_optional\n                                        | a2ml_tag PARENTHESE_OPEN a2ml_member PARENTHESE_CLOSE ASTERISKa2ml_taggedunion_type_name : taggedunion a2ml_identifier_optional CURLY_OPEN a2ml_taggedunion_member_list_optional CURLY_CLOSE\n                                      | taggedunion a2ml_identifiera2ml_taggedunion_member_list : a2ml_taggedunion_member\n                                        | a2ml_taggedunion_member_list a2ml_taggedunion_membera2ml_taggedunion_member_list_optional : empty\n                                                 | a2ml_taggedunion_member_lista2ml_taggedunion_member : a2ml_tag SEMICOLON\n                                   | a2ml_tag a2ml_member SEMICOLON\n                                   | a2ml_block_definition SEMICOLONa2ml_tag : STRINGa2ml_identifier : IDENTa2ml_identifier_optional : empty\n                                    | a2ml_identifiera2ml_keyword : STRINGa2ml_constant : NUMERICdatatype : UBYTE\n                    | SBYTE\n                    | UWORD\n                    | SWORD\n                    | ULONG\n                    | SLONG\n                    | A_UINT64\n                    | A_INT64\n                    | FLOAT32_IEEE\n                    | FLOAT64_IEEEdatasize : BYTE\n                    | WORD\n                    | LONGaddrtype : PBYTE\n                    | PWORD\n                    | PLONG\n                    | DIRECTindexorder : INDEX_INCR\n                      | INDEX_DECRasap2_version : ASAP2_VERSION NUMERIC NUMERICa2ml_version : A2ML_VERSION NUMERIC NUMERICgeneric_parameter : IDENT\n                             | STRING\n                             | NUMERIC\n                             | begin IDENT generic_parameter_list_optional end IDENTgeneric_parameter_list : generic_parameter\n                                  | generic_parameter_list generic_parametergeneric_parameter_list_optional : empty\n                                           | generic_parameter_listnumber_list : NUMERIC\n                       | number_list NUMERICident_list : IDENT\n                      | ident_list IDENTstring_list : STRING\n                       | string_list STRINGproject : begin PROJECT IDENT STRING project_optional_list_optional end PROJECTproject_optional : header\n                            | moduleproject_optional_list : project_optional\n                                 | project_optional_list project_optionalproject_optional_list_optional : empty\n                                          | project_optional_listheader : begin HEADER STRING header_optional_list_optional end HEADERheader_optional : version\n                           | project_noheader_optional_list : header_optional\n                                | header_optional_list header_optionalheader_optional_list_optional : empty\n                                         | header_optional_listversion : VERSION STRINGproject_no : PROJECT_NO IDENTmodule : begin MODULE IDENT STRING module_optional_list_optional end MODULEmodule_optional : a2ml\n                           | mod_par\n                           | mod_common\n                           | if_data_xcp\n                           | if_data_module\n                           | characteristic\n                           | axis_pts\n                           | measurement\n                           | compu_method\n                           | compu_tab\n                           | compu_vtab\n                           | compu_vtab_range\n                           | function\n                           | group\n                           | record_layout\n                           | variant_coding\n                           | frame\n                           | user_rights\n                           | unitmodule_optional_list : module_optional\n                                | module_optional_list module_optionalmodule_optional_list_optional : empty\n                                         | module_optional_lista2ml : begin A2ML a2ml_declaration_list end A2MLif_data_xcp : begin IF_DATA XCP if_data_xcp_optional_list_optional end IF_DATAif_data_xcp_optional : protocol_layer\n                                | daq\n                                | pag\n                                | pgm\n                                | segment\n                                | daq_event\n                                | xcp_on_can\n                                | generic_parameter_listxcp_on_can : begin XCP_ON_CAN NUMERIC xcp_on_can_optional_list_optional end XCP_ON_CANxcp_on_can_optional : can_id_broadcast\n                               | can_id_master\n                               | can_id_slave\n                               | baudrate\n                               | sample_point\n                               | sample_rate\n                               | btl_cycles\n                               | sjw\n                               | sync_edge\n                               | daq_list_can_idxcp_on_can_optional_list : xcp_on_can_optional\n                                    | xcp_on_can_optional_list xcp_on_can_optionalxcp_on_can_optional_list_optional : empty\n                                             | xcp_on_can_optional_listcan_id_broadcast : CAN_ID_BROADCAST NUMERICcan_id_master : CAN_ID_MASTER NUMERICcan_id_slave : CAN_ID_SLAVE NUMERICbaudrate : BAUDRATE NUMERICsample_point : SAMPLE_POINT NUMERICsample_rate : SAMPLE_RATE SINGLE\n                       | SAMPLE_RATE TRIPLEbtl_cycles : BTL_CYCLES NUMERICsjw : SJW NUMERICsync_edge : SYNC_EDGE SINGLE\n                     | SYNC_EDGE DUALdaq_list_can_id : begin DAQ_LIST_CAN_ID NUMERIC daq_list_can_id_optional_optional end DAQ_LIST_CAN_IDdaq_list_can_id_optional : daq_list_can_id_type_variable\n                                    | daq_list_can_id_type_fixeddaq_list_can_id_optional_optional : empty\n                                             | daq_list_can_id_optionaldaq_list_can_id_type_variable : VARIABLEdaq_list_can_id_type_fixed : FIXED NUMERICdaq_event : begin DAQ_EVENT FIXED_EVENT_LIST daq_event_optional_list_optional end DAQ_EVENT\n                     | begin DAQ_EVENT VARIABLE daq_event_optional_list_optional end DAQ_EVENTdaq_event_optional : available_event_list\n                              | default_event_listdaq_event_optional_list : daq_event_optional\n                                   | daq_event_optional_list daq_event_optionaldaq_event_optional_list_optional : empty\n                                            | daq_event_optional_listdefault_event_list : begin DEFAULT_EVENT_LIST available_event_list_optional_list_optional end DEFAULT_EVENT_LISTavailable_event_list : begin AVAILABLE_EVENT_LIST available_event_list_optional_list_optional end AVAILABLE_EVENT_LISTavailable_event_list_optional : EVENT NUMERICavailable_event_list_optional_list : available_event_list_optional\n                                              | available_event_list_optional_list available_event_list_optionalavailable_event_list_optional_list_optional : empty\n                                                       | available_event_list_optional_listif_data_xcp_optional_list : if_data_xcp_optional\n                                     | if_data_xcp_optional_list if_data_xcp_optionalif_data_xcp_optional_list_optional : empty\n                                                     | if_data_xcp_optional_listpag : begin PAG NUMERIC pag_optional_list_optional end PAGpgm : begin PGM IDENT NUMERIC NUMERIC pgm_optional_list_optional end PGMpgm_optional : sector\n                        | generic_parameter_listpgm_optional_list : pgm_optional\n                             | pgm_optional_list pgm_optionalpgm_optional_list_optional : empty\n                                      | pgm_optional_listsector : begin SECTOR STRING NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC end SECTORpag_optional : freeze_supported\n                        | generic_parameter_listpag_optional_list : pag_optional\n                             | pag_optional_list pag_optionalpag_optional_list_optional : empty\n                                      | pag_optional_listfreeze_supported : FREEZE_SUPPORTEDdaq : begin DAQ daq_config_type NUMERIC NUMERIC NUMERIC optimisation_type address_extension identification_field_type granularity_odt_entry NUMERIC overload_indication daq_optional_list_optional end DAQdaq_config_type : STATIC\n                           | DYNAMICdaq_optional : daq_list\n                        | event\n                        | timestamp_supported\n                        | optimisation_type\n                        | address_extension\n                        | identification_field_type\n                        | granularity_odt_entry\n                        | prescaler_supported\n                        | resume_supported\n                        | IDENT\n                        | NUMERICprescaler_supported : PRESCALER_SUPPORTEDresume_supported : RESUME_SUPPORTEDoptimisation_type : OPTIMISATION_TYPE_DEFAULT\n                             | OPTIMISATION_TYPE_ODT_TYPE_16\n                             | OPTIMISATION_TYPE_ODT_TYPE_32\n                             | OPTIMISATION_TYPE_ODT_TYPE_64\n                             | OPTIMISATION_TYPE_ODT_TYPE_ALIGNMENT\n                             | OPTIMISATION_TYPE_MAX_ENTRY_SIZEaddress_extension : ADDRESS_EXTENSION_FREE\n                             | ADDRESS_EXTENSION_ODT\n                             | ADDRESS_EXTENSION_DAQidentification_field_type : IDENTIFICATION_FIELD_TYPE_ABSOLUTE\n                                     | IDENTIFICATION_FIELD_TYPE_RELATIVE_BYTE\n                                     | IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD\n                                     | IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD_ALIGNEDgranularity_odt_entry : GRANULARITY_ODT_ENTRY_SIZE_DAQ_BYTE\n                                 | GRANULARITY_ODT_ENTRY_SIZE_DAQ_WORD\n                                 | GRANULARITY_ODT_ENTRY_SIZE_DAQ_DWORD\n                                 | GRANULARITY_ODT_ENTRY_SIZE_DAQ_DLONGoverload_indication : NO_OVERLOAD_INDICATION\n                               | OVERLOAD_INDICATION_PID\n                               | OVERLOAD_INDICATION_EVENTdaq_optional_list : daq_optional\n                             | daq_optional_list daq_optionaldaq_optional_list_optional : empty\n                                      | daq_optional_listevent : begin EVENT STRING STRING NUMERIC daq_list_type_enum NUMERIC NUMERIC NUMERIC NUMERIC end EVENTdaq_list : begin DAQ_LIST NUMERIC daq_list_optional_list_optional end DAQ_LISTdaq_list_optional : daq_list_type\n                             | max_odt\n                             | max_odt_entries\n                             | first_pid\n                             | event_fixed\n                             | predefineddaq_list_type_enum : DAQ\n                              | STIM\n                              | DAQ_STIMdaq_list_type : DAQ_LIST_TYPE daq_list_type_enummax_odt : MAX_ODT NUMERICmax_odt_entries : MAX_ODT_ENTRIES NUMERICfirst_pid : FIRST_PID NUMERICevent_fixed : EVENT_FIXED NUMERICpredefined : generic_parameter_listdaq_list_optional_list : daq_list_optional\n                                  | daq_list_optional_list daq_list_optionaldaq_list_optional_list_optional : empty\n                                           | daq_list_optional_listtimestamp_supported : begin TIMESTAMP_SUPPORTED NUMERIC IDENT IDENT timestamp_fixed end TIMESTAMP_SUPPORTEDtimestamp_fixed : empty\n                           | TIMESTAMP_FIXEDprotocol_layer : begin PROTOCOL_LAYER NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC protocol_layer_optional_list_optional end PROTOCOL_LAYERprotocol_layer_optional : generic_parameter_listprotocol_layer_optional_list : protocol_layer_optional\n                                        | protocol_layer_optional_list protocol_layer_optionalprotocol_layer_optional_list_optional : empty\n                                                 | protocol_layer_optional_listif_data_module : begin IF_DATA IDENT if_data_module_optional_list_optional end IF_DATAif_data_module_optional : source\n                                   | raster\n                                   | event_group\n                                   | seed_key\n                                   | checksum\n                                   | tp_blob tp_data\n                                   | if_data_module_unsupported_elementif_data_module_optional_list : if_data_module_optional\n                                        | if_data_module_optional_list if_data_module_optionalif_data_module_optional_list_optional : empty\n                                                 | if_data_module_optional_listif_data_module_unsupported_element : generic_parameter_listsource : begin SOURCE IDENT NUMERIC NUMERIC source_optional_list_optional end SOURCEraster : begin RASTER STRING STRING NUMERIC NUMERIC NUMERIC end RASTERevent_group : begin EVENT_GROUP STRING STRING number_list end EVENT_GROUPseed_key : begin SEED_KEY STRING STRING STRING end SEED_KEYchecksum : begin CHECKSUM STRING end CHECKSUM\n                    | begin CHECKSUM IDENT max_block_size end CHECKSUMmax_block_size : MAX_BLOCK_SIZE NUMERICtp_blob : TP_BLOBtp_data : generic_parameter_listsource_optional : display_identifier\n                           | qp_blobsource_optional_list : source_optional\n                                | source_optional_list source_optionalsource_optional_list_optional : empty\n                                         | source_optional_listqp_blob : QP_BLOB IDENTmod_par : begin MOD_PAR STRING mod_par_optional_list_optional end MOD_PARmod_par_optional : version\n                            | addr_epk\n                            | epk\n                            | supplier\n                            | customer\n                            | customer_no\n                            | user\n                            | phone_no\n                            | ecu\n                            | cpu_type\n                            | no_of_interfaces\n                            | ecu_calibration_offset\n                            | calibration_method\n                            | memory_layout\n                            | memory_segment\n                            | system_constantmod_par_optional_list : mod_par_optional\n                                 | mod_par_optional_list mod_par_optionalmod_par_optional_list_optional : empty\n                                          | mod_par_optional_listaddr_epk : ADDR_EPK NUMERICepk : EPK STRINGsupplier : SUPPLIER STRINGcustomer : CUSTOMER STRINGcustomer_no : CUSTOMER_NO STRINGuser : USER STRINGphone_no : PHONE_NO STRINGmod_common : begin MOD_COMMON STRING mod_common_optional_list_optional end MOD_COMMONmod_common_optional : s_rec_layout\n                               | deposit\n                               | byte_order\n                               | data_size\n                               | alignment_byte\n                               | alignment_word\n                               | alignment_long\n                               | alignment_float32_ieee\n                               | alignment_float64_ieeemod_common_optional_list : mod_common_optional\n                                    | mod_common_optional_list mod_common_optionalmod_common_optional_list_optional : empty\n                                             | mod_common_optional_lists_rec_layout : S_REC_LAYOUT IDENTdata_size : DATA_SIZE NUMERICecu : ECU STRINGcpu_type : CPU_TYPE STRINGno_of_interfaces : NO_OF_INTERFACES NUMERICecu_calibration_offset : ECU_CALIBRATION_OFFSET NUMERICcalibration_method : begin CALIBRATION_METHOD STRING NUMERIC calibration_method_optional_list_optional end CALIBRATION_METHODcalibration_method_optional : calibration_handlecalibration_method_optional_list : calibration_method_optional\n                                            | calibration_method_optional_list calibration_method_optionalcalibration_method_optional_list_optional : empty\n                                                     | calibration_method_optional_listcalibration_handle : begin CALIBRATION_HANDLE calibration_handle_optional_list_optional end CALIBRATION_HANDLEcalibration_handle_optional : NUMERICcalibration_handle_optional_list : calibration_handle_optional\n                                            | calibration_handle_optional_list calibration_handle_optionalcalibration_handle_optional_list_optional : empty\n                                                     | calibration_handle_optional_listmemory_layout : begin MEMORY_LAYOUT memory_layout_prg_type NUMERIC NUMERIC number_list memory_layout_optional_list_optional end MEMORY_LAYOUTmemory_layout_prg_type : PRG_CODE\n                                  | PRG_DATA\n                                  | PRG_RESERVEDmemory_layout_optional : if_data_memory_layoutmemory_layout_optional_list : memory_layout_optional\n                                       | memory_layout_optional_list memory_layout_optionalmemory_layout_optional_list_optional : empty\n                                                | memory_layout_optional_listif_data_memory_layout : begin IF_DATA IDENT if_data_memory_layout_optional_list_optional end IF_DATAif_data_memory_layout_optional : dp_blob dp_data\n                                          | ba_blob pa_dataif_data_memory_layout_optional_list : if_data_memory_layout_optional\n                                               | if_data_memory_layout_optional_list if_data_memory_layout_optionalif_data_memory_layout_optional_list_optional : empty\n                                                        | if_data_memory_layout_optional_listdp_blob : DP_BLOBba_blob : BA_BLOBdp_data : generic_parameter_listpa_data : generic_parameter_listmemory_segment : begin MEMORY_SEGMENT IDENT STRING memory_segment_prg_type memory_segment_memory_type memory_segment_attributes NUMERIC NUMERIC number_list memory_segment_optional_list_optional end MEMORY_SEGMENTmemory_segment_optional : if_data_memory_segment\n                                   | if_data_xcpmemory_segment_optional_parameter_list : memory_segment_optional\n                                                  | memory_segment_optional_parameter_list memory_segment_optionalmemory_segment_optional_list_optional : empty\n                                                 | memory_segment_optional_parameter_listmemory_segment_prg_type : CODE\n                                   | DATA\n                                   | OFFLINE_DATA\n                                   | VARIABLES\n                                   | SERAM\n                                   | RESERVED\n                                   | CALIBRATION_VARIABLES\n                                   | EXCLUDE_FROM_FLASHmemory_segment_memory_type : RAM\n                                      | EEPROM\n                                      | EPROM\n                                      | ROM\n                                      | REGISTER\n                                      | FLASHmemory_segment_attributes : INTERN\n                                     | EXTERNsystem_constant : SYSTEM_CONSTANT STRING STRINGif_data_memory_segment : begin IF_DATA IDENT if_data_memory_segment_optional_list_optional end IF_DATAif_data_memory_segment_optional : address_mapping\n                                           | segment\n                                           | generic_parameterif_data_memory_segment_optional_list : if_data_memory_segment_optional\n                                                | if_data_memory_segment_optional_list if_data_memory_segment_optionalif_data_memory_segment_optional_list_optional : empty\n                                                         | if_data_memory_segment_optional_listsegment : begin SEGMENT NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC segment_optional_parameter_list_optional end SEGMENTsegment_optional_parameter : page\n                                      | checksumsegment_optional_parameter_list : segment_optional_parameter\n                                           | segment_optional_parameter_list segment_optional_parametersegment_optional_parameter_list_optional : empty\n                                                    | segment_optional_parameter_listpage : begin PAGE NUMERIC IDENT IDENT IDENT page_optional_parameter_list_optional end PAGEpage_optional_parameter : init_segmentpage_optional_parameter_list : page_optional_parameter\n                                        | page_optional_parameter_list page_optional_parameterpage_optional_parameter_list_optional : empty\n                                                 | page_optional_parameter_listinit_segment : INIT_SEGMENT NUMERICaddress_mapping : ADDRESS_MAPPING NUMERIC NUMERIC NUMERICcharacteristic : begin CHARACTERISTIC IDENT STRING characteristic_type NUMERIC IDENT NUMERIC IDENT NUMERIC NUMERIC characteristic_optional_list_optional end CHARACTERISTICcharacteristic_type : VALUE\n                               | CURVE\n                               | MAP\n                               | CUBOID\n                               | VAL_BLK\n                               | ASCIIdisplay_identifier : DISPLAY_IDENTIFIER IDENTformat : FORMAT STRINGbyte_order : BYTE_ORDER byte_order_typebyte_order_type : MSB_FIRST\n                           | MSB_LASTbit_mask : BIT_MASK NUMERICfunction_list : begin FUNCTION_LIST function_list_optional_list_optional end FUNCTION_LISTfunction_list_optional : IDENTfunction_list_optional_list : function_list_optional\n                                       | function_list_optional_list function_list_optionalfunction_list_optional_list_optional : empty\n                                                | function_list_optional_listnumber : NUMBER NUMERICextended_limits : EXTENDED_LIMITS NUMERIC NUMERICmap_list : begin MAP_LIST ident_list end MAP_LISTmax_refresh : MAX_REFRESH NUMERIC NUMERICdependent_characteristic : begin DEPENDENT_CHARACTERISTIC STRING ident_list end DEPENDENT_CHARACTERISTICvirtual_characteristic : begin VIRTUAL_CHARACTERISTIC STRING virtual_characteristic_optional end VIRTUAL_CHARACTERISTICvirtual_characteristic_optional : empty\n                                           | ident_listref_memory_segment : REF_MEMORY_SEGMENT IDENTannotation : begin ANNOTATION annotation_optional_list_optional end ANNOTATIONannotation_optional : annotation_label\n                               | annotation_origin\n                               | annotation_textannotation_optional_list : annotation_optional\n                                    | annotation_optional_list annotation_optionalannotation_optional_list_optional : empty\n                                             | annotation_optional_listannotation_label : ANNOTATION_LABEL STRINGannotation_origin : ANNOTATION_ORIGIN STRINGannotation_text : begin ANNOTATION_TEXT string_list end ANNOTATION_TEXTcomparison_quantity : COMPARISON_QUANTITY IDENTaxis_descr : begin AXIS_DESCR axis_descr_attribute IDENT IDENT NUMERIC NUMERIC NUMERIC axis_descr_optional_list_optional end AXIS_DESCRaxis_descr_optional : read_only\n                               | format\n                               | annotation\n                               | axis_pts_ref\n                               | max_grad\n                               | monotony\n                               | byte_order\n                               | extended_limits\n                               | fix_axis_par\n                               | fix_axis_par_dist\n                               | fix_axis_par_list\n                               | deposit\n                               | curve_axis_refaxis_descr_optional_list : axis_descr_optional\n                                    | axis_descr_optional_list axis_descr_optionalaxis_descr_optional_list_optional : empty\n                                             | axis_descr_optional_listaxis_pts_ref : AXIS_PTS_REF IDENTmax_grad : MAX_GRAD NUMERICmonotony : MONOTONY monotony_typemonotony_type : MON_INCREASE\n                         | MON_DECREASE\n                         | STRICT_INCREASE\n                         | STRICT_DECREASEfix_axis_par : FIX_AXIS_PAR NUMERIC NUMERIC NUMERICfix_axis_par_dist : FIX_AXIS_PAR_DIST NUMERIC NUMERIC NUMERICfix_axis_par_list : begin FIX_AXIS_PAR_LIST number_list end FIX_AXIS_PAR_LISTcurve_axis_ref : CURVE_AXIS_REF IDENTaxis_descr_attribute : STD_AXIS\n                                | FIX_AXIS\n                                | COM_AXIS\n                                | RES_AXIS\n                                | CURVE_AXIScalibration_access : CALIBRATION_ACCESS calibration_access_typecalibration_access_type : CALIBRATION\n                                   | NO_CALIBRATION\n                                   | NOT_IN_MCD_SYSTEM\n                                   | OFFLINE_CALIBRATIONmatrix_dim : MATRIX_DIM NUMERIC NUMERIC NUMERICecu_address_extension : ECU_ADDRESS_EXTENSION NUMERICcharacteristic_optional : display_identifier\n                                   | format\n                                   | byte_order\n                                   | bit_mask\n                                   | function_list\n                                   | number\n                                   | extended_limits\n                                   | read_only\n                                   | guard_rails\n                                   | map_list\n                                   | max_refresh\n                                   | dependent_characteristic\n                                   | virtual_characteristic\n                                   | ref_memory_segment\n                                   | annotation\n                                   | comparison_quantity\n                                   | if_data_characteristic\n                                   | axis_descr\n                                   | calibration_access\n                                   | matrix_dim\n                                   | ecu_address_extensioncharacteristic_optional_list : characteristic_optional\n                                        | characteristic_optional_list characteristic_optionalcharacteristic_optional_list_optional : empty\n                                                 | characteristic_optional_listif_data_characteristic : if_data_memory_layoutaxis_pts : begin AXIS_PTS IDENT STRING NUMERIC IDENT IDENT NUMERIC IDENT NUMERIC NUMERIC NUMERIC axis_pts_optional_list_optional end AXIS_PTSaxis_pts_optional : display_identifier\n                             | read_only\n                             | format\n                             | deposit\n                             | byte_order\n                             | function_list\n                             | ref_memory_segment\n                             | guard_rails\n                             | extended_limits\n                             | annotation\n                             | if_data_axis_pts\n                             | calibration_access\n                             | ecu_address_extensionaxis_pts_optional_list : axis_pts_optional\n                                  | axis_pts_optional_list axis_pts_optionalaxis_pts_optional_list_optional : empty\n                                           | axis_pts_optional_listif_data_axis_pts : if_data_memory_layoutdeposit : DEPOSIT deposit_modedeposit_mode : ABSOLUTE\n                        | DIFFERENCEmeasurement : begin MEASUREMENT IDENT STRING datatype IDENT NUMERIC NUMERIC NUMERIC NUMERIC measurement_optional_list_optional end MEASUREMENTmeasurement_optional : display_identifier\n                                | read_write\n                                | format\n                                | array_size\n                                | bit_mask\n                                | bit_operation\n                                | byte_order\n                                | max_refresh\n                                | virtual\n                                | function_list\n                                | ecu_address\n                                | error_mask\n                                | ref_memory_segment\n                                | annotation\n                                | if_data_xcp\n                                | if_data_measurement\n                                | matrix_dim\n                                | ecu_address_extensionmeasurement_optional_list : measurement_optional\n                                     | measurement_optional_list measurement_optionalmeasurement_optional_list_optional : empty\n                                              | measurement_optional_listread_write : READ_WRITEif_data_measurement : begin IF_DATA IDENT if_data_measurement_optional_parameter_list_optional end IF_DATAif_data_measurement_optional_parameter : kp_blob kp_data\n                                                  | dp_blob dp_data\n                                                  | pa_blob pa_data\n                                                  | if_data_measurement_unsupported_elementif_data_measurement_unsupported_element : begin IDENT generic_parameter_list end IDENTif_data_measurement_optional_parameter_list : if_data_measurement_optional_parameter\n                                                       | if_data_measurement_optional_parameter_list if_data_measurement_optional_parameterif_data_measurement_optional_parameter_list_optional : empty\n                                                                | if_data_measurement_optional_parameter_listkp_blob : KP_BLOBpa_blob : PA_BLOBkp_data : kp_data_parameter_optional_listkp_data_parameter_optional : NUMERIC\n                                      | STRING\n                                      | IDENTkp_data_parameter_optional_list : kp_data_parameter_optional\n                                           | kp_data_parameter_optional_list kp_data_parameter_optionalarray_size : ARRAY_SIZE NUMERICbit_operation : begin BIT_OPERATION bit_operation_optional_list_optional end BIT_OPERATIONbit_operation_optional : left_shift\n                                  | right_shift\n                                  | sign_extendbit_operation_optional_list : bit_operation_optional\n                                       | bit_operation_optional_list bit_operation_optionalbit_operation_optional_list_optional : empty\n                                                | bit_operation_optional_listleft_shift : LEFT_SHIFT NUMERICright_shift : RIGHT_SHIFT NUMERICsign_extend : SIGN_EXTENDcompu_method : begin COMPU_METHOD IDENT STRING compu_method_conversion_type STRING STRING compu_method_optional_list_optional end COMPU_METHODcompu_method_optional : formula\n                                 | coeffs\n                                 | coeffs_linear\n                                 | compu_tab_ref\n                                 | ref_unitcompu_method_optional_list : compu_method_optional\n                                      | compu_method_optional_list compu_method_optionalcompu_method_optional_list_optional : empty\n                                               | compu_method_optional_listcompu_method_conversion_type : TAB_INTP\n                             | TAB_NOINTP\n                             | TAB_VERB\n                             | RAT_FUNC\n                             | FORM\n                             | IDENTICAL\n                             | LINEARformula : begin FORMULA STRING formula_optional_list_optional end FORMULAformula_optional : formula_invformula_optional_list : formula_optional\n                                 | formula_optional_list formula_optionalformula_optional_list_optional : empty\n                                          | formula_optional_listformula_inv : FORMULA_INV STRINGcoeffs : COEFFS NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERICcoeffs_linear : COEFFS_LINEAR NUMERIC NUMERICcompu_tab_ref : COMPU_TAB_REF IDENTref_unit : REF_UNIT IDENTvirtual : begin VIRTUAL ident_list end VIRTUALecu_address : ECU_ADDRESS NUMERICerror_mask : ERROR_MASK NUMERICcompu_tab : begin COMPU_TAB IDENT STRING compu_tab_conversion_type NUMERIC compu_tab_optional_list_optional end COMPU_TABcompu_tab_optional : in_val_out_val\n                              | default_value\n                              | default_value_numericcompu_tab_optional_list : compu_tab_optional\n                                   | compu_tab_optional_list compu_tab_optionalcompu_tab_optional_list_optional : empty\n                                            | compu_tab_optional_listin_val_out_val : number_listcompu_tab_conversion_type : TAB_INTP\n                                     | TAB_NOINTPdefault_value : DEFAULT_VALUE STRINGdefault_value_numeric : DEFAULT_VALUE_NUMERIC NUMERICcompu_vtab : begin COMPU_VTAB IDENT STRING compu_vtab_conversion_type NUMERIC compu_vtab_optional_list_optional end COMPU_VTABcompu_vtab_optional : default_value\n                               | compu_vtab_in_val_out_valcompu_vtab_optional_list : compu_vtab_optional\n                                    | compu_vtab_optional_list compu_vtab_optionalcompu_vtab_optional_list_optional : empty\n                                             | compu_vtab_optional_listcompu_vtab_in_val_out_val : number_string_value_listcompu_vtab_conversion_type : TAB_VERBnumber_string_value_list : number_string_value\n                                    | number_string_value_list number_string_valuenumber_string_value : NUMERIC STRINGcompu_vtab_range : begin COMPU_VTAB_RANGE IDENT STRING NUMERIC compu_vtab_range_optional_list_optional end COMPU_VTAB_RANGEcompu_vtab_range_optional : default_value\n                                     | compu_vtab_range_in_val_out_valcompu_vtab_range_optional_list : compu_vtab_range_optional\n                                          | compu_vtab_range_optional_list compu_vtab_range_optionalcompu_vtab_range_optional_list_optional : empty\n                                                   | compu_vtab_range_optional_listcompu_vtab_range_in_val_out_val : number_number_string_value_listnumber_number_string_value_list : number_number_string_value\n                                           | number_number_string_value_list number_number_string_valuenumber_number_string_value : NUMERIC NUMERIC STRINGfunction : begin FUNCTION IDENT STRING function_optional_list_optional end FUNCTIONfunction_optional : annotation\n                             | def_characteristic\n                             | ref_characteristic\n                             | in_measurement\n                             | out_measurement\n                             | loc_measurement\n                             | sub_function\n                             | function_versionfunction_optional_list : function_optional\n                                  | function_optional_list function_optionalfunction_optional_list_optional : empty\n                                           | function_optional_listdef_characteristic : begin DEF_CHARACTERISTIC def_characteristic_optional_list_optional end DEF_CHARACTERISTICdef_characteristic_optional : identifierdef_characteristic_optional_list : def_characteristic_optional\n                                            | def_characteristic_optional_list def_characteristic_optionaldef_characteristic_optional_list_optional : empty\n                                                     | def_characteristic_optional_listidentifier : IDENTref_characteristic : begin REF_CHARACTERISTIC ref_characteristic_optional_list_optional end REF_CHARACTERISTICref_characteristic_optional : identifierref_characteristic_optional_list : ref_characteristic_optional\n                                            | ref_characteristic_optional_list ref_characteristic_optionalref_characteristic_optional_list_optional : empty\n                                                     | ref_characteristic_optional_listin_measurement : begin IN_MEASUREMENT in_measurement_optional_list_optional end IN_MEASUREMENTin_measurement_optional : identifierin_measurement_optional_list : in_measurement_optional\n                                        | in_measurement_optional_list in_measurement_optionalin_measurement_optional_list_optional : empty\n                                                 | in_measurement_optional_listout_measurement : begin OUT_MEASUREMENT out_measurement_optional_list_optional end OUT_MEASUREMENTout_measurement_optional : identifierout_measurement_optional_list : out_measurement_optional\n                                         | out_measurement_optional_list out_measurement_optionalout_measurement_optional_list_optional : empty\n                                                  | out_measurement_optional_listloc_measurement : begin LOC_MEASUREMENT loc_measurement_optional_list_optional end LOC_MEASUREMENTloc_measurement_optional : identifierloc_measurement_optional_list : loc_measurement_optional\n                                         | loc_measurement_optional_list loc_measurement_optionalloc_measurement_optional_list_optional : empty\n                                                  | loc_measurement_optional_listsub_function : begin SUB_FUNCTION sub_function_optional_list_optional end SUB_FUNCTIONsub_function_optional : identifiersub_function_optional_list : sub_function_optional\n                                      | sub_function_optional_list sub_function_optionalsub_function_optional_list_optional : empty\n                                               | sub_function_optional_listfunction_version : FUNCTION_VERSION STRINGgroup : begin GROUP IDENT STRING group_optional_list_optional end GROUPgroup_optional : annotation\n                          | root\n                          | ref_characteristic\n                          | ref_measurement\n                          | function_list\n                          | sub_groupgroup_optional_list : group_optional\n                               | group_optional_list group_optionalgroup_optional_list_optional : empty\n                                        | group_optional_listroot : ROOTref_measurement : begin REF_MEASUREMENT ref_measurement_optional_list_optional end REF_MEASUREMENTref_measurement_optional : identifierref_measurement_optional_list : ref_measurement_optional\n                                         | ref_measurement_optional_list ref_measurement_optionalref_measurement_optional_list_optional : empty\n                                                  | ref_measurement_optional_listsub_group : begin SUB_GROUP sub_group_optional_list_optional end SUB_GROUPsub_group_optional : identifiersub_group_optional_list : sub_group_optional\n                                   | sub_group_optional_list sub_group_optionalsub_group_optional_list_optional : empty\n                                            | sub_group_optional_listrecord_layout : begin RECORD_LAYOUT IDENT record_layout_optional_list_optional end RECORD_LAYOUTrecord_layout_optional : fnc_values\n                                  | identification\n                                  | axis_pts_x\n                                  | axis_pts_y\n                                  | axis_pts_z\n                                  | axis_rescale_x\n                                  | axis_rescale_y\n                                  | axis_rescale_z\n                                  | no_axis_pts_x\n                                  | no_axis_pts_y\n                                  | no_axis_pts_z\n                                  | no_rescale_x\n                                  | no_rescale_y\n                                  | no_rescale_z\n                                  | fix_no_axis_pts_x\n                                  | fix_no_axis_pts_y\n                                  | fix_no_axis_pts_z\n                                  | src_addr_x\n                                  | src_addr_y\n                                  | src_addr_z\n                                  | rip_addr_x\n                                  | rip_addr_y\n                                  | rip_addr_z\n                                  | rip_addr_w\n                                  | shift_op_x\n                                  | shift_op_y\n                                  | shift_op_z\n                                  | offset_x\n                                  | offset_y\n                                  | offset_z\n                                  | dist_op_x\n                                  | dist_op_y\n                                  | dist_op_z\n                                  | alignment_byte\n                                  | alignment_word\n                                  | alignment_long\n                                  | alignment_float32_ieee\n                                  | alignment_float64_ieee\n                                  | reservedrecord_layout_optional_list : record_layout_optional\n                                       | record_layout_optional_list record_layout_optionalrecord_layout_optional_list_optional : empty\n                                                | record_layout_optional_listfnc_values : FNC_VALUES NUMERIC datatype fnc_values_index_mode addrtypefnc_values_index_mode : COLUMN_DIR\n                                 | ROW_DIR\n                                 | ALTERNATE_WITH_X\n                                 | ALTERNATE_WITH_Y\n                                 | ALTERNATE_CURVESidentification : IDENTIFICATION NUMERIC datatypeaxis_pts_x : AXIS_PTS_X NUMERIC datatype indexorder addrtypeaxis_pts_y : AXIS_PTS_Y NUMERIC datatype indexorder addrtypeaxis_pts_z : AXIS_PTS_Z NUMERIC datatype indexorder addrtypeaxis_rescale_x : AXIS_RESCALE_X NUMERIC datatype NUMERIC indexorder addrtypeaxis_rescale_y : AXIS_RESCALE_Y NUMERIC datatype NUMERIC indexorder addrtypeaxis_rescale_z : AXIS_RESCALE_Z NUMERIC datatype NUMERIC indexorder addrtypeno_axis_pts_x : NO_AXIS_PTS_X NUMERIC datatypeno_axis_pts_y : NO_AXIS_PTS_Y NUMERIC datatypeno_axis_pts_z : NO_AXIS_PTS_Z NUMERIC datatypeno_rescale_x : NO_RESCALE_X NUMERIC datatypeno_rescale_y : NO_RESCALE_Y NUMERIC datatypeno_rescale_z : NO_RESCALE_Z NUMERIC datatypefix_no_axis_pts_x : FIX_NO_AXIS_PTS_X NUMERICfix_no_axis_pts_y : FIX_NO_AXIS_PTS_Y NUMERICfix_no_axis_pts_z : FIX_NO_AXIS_PTS_Z NUMERICsrc_addr_x : SRC_ADDR_X NUMERIC datatypesrc_addr_y : SRC_ADDR_Y NUMERIC datatypesrc_addr_z : SRC_ADDR_Z NUMERIC datatyperip_addr_x : RIP_ADDR_X NUMERIC datatyperip_addr_y : RIP_ADDR_Y NUMERIC datatyperip_addr_z : RIP_ADDR_Z NUMERIC datatyperip_addr_w : RIP_ADDR_W NUMERIC datatypeshift_op_x : SHIFT_OP_X NUMERIC datatypeshift_op_y : SHIFT_OP_Y NUMERIC datatypeshift_op_z : SHIFT_OP_Z NUMERIC datatypeoffset_x : OFFSET_X NUMERIC datatypeoffset_y : OFFSET_Y NUMERIC datatypeoffset_z : OFFSET_Z NUMERIC datatypedist_op_x : DIST_OP_X NUMERIC datatypedist_op_y : DIST_OP_Y NUMERIC datatypedist_op_z : DIST_OP_Z NUMERIC datatypealignment_byte : ALIGNMENT_BYTE NUMERICalignment_word : ALIGNMENT_WORD NUMERICalignment_long : ALIGNMENT_LONG NUMERICalignment_float32_ieee : ALIGNMENT_FLOAT32_IEEE NUMERICalignment_float64_ieee : ALIGNMENT_FLOAT64_IEEE NUMERICvariant_coding : begin VARIANT_CODING variant_coding_optional_list_optional end VARIANT_CODINGvariant_coding_optional : var_separator\n                                   | var_naming\n                                   | var_criterion\n                                   | var_forbidden_comb\n                                   | var_characteristicvariant_coding_optional_list : variant_coding_optional\n                                        | variant_coding_optional_list variant_coding_optionalvariant_coding_optional_list_optional : empty\n                                                 | variant_coding_optional_listvar_separator : VAR_SEPARATOR STRINGvar_naming : VAR_NAMING IDENTvar_criterion : begin VAR_CRITERION IDENT STRING ident_list var_criterion_optional_list_optional end VAR_CRITERIONvar_characteristic : begin VAR_CHARACTERISTIC IDENT ident_list var_characteristic_optional_optional end VAR_CHARACTERISTICvar_characteristic_optional : var_addressvar_characteristic_optional_optional : empty\n                                                | var_characteristic_optionalvar_address : begin VAR_ADDRESS number_list end VAR_ADDRESSvar_forbidden_comb : begin VAR_FORBIDDEN_COMB var_forbidden_comb_criterion_list end VAR_FORBIDDEN_COMBvar_forbidden_comb_criterion_list : var_forbidden_comb_criterion_optional\n                                             | var_forbidden_comb_criterion_optional var_forbidden_comb_criterion_optional_listvar_forbidden_comb_criterion_optional : IDENT IDENTvar_forbidden_comb_criterion_optional_list : var_forbidden_comb_criterion_optional\n                                                      | var_forbidden_comb_criterion_optional_list var_forbidden_comb_criterion_optionalvar_criterion_optional : var_measurement\n                                  | var_selection_characteristicvar_criterion_optional_list : var_criterion_optional\n                                       | var_criterion_optional_list var_criterion_optionalvar_criterion_optional_list_optional : empty\n                                                | var_criterion_optional_listvar_measurement : VAR_MEASUREMENT IDENTvar_selection_characteristic : VAR_SELECTION_CHARACTERISTIC IDENTreserved : RESERVED NUMERIC datasizeframe : begin FRAME IDENT STRING NUMERIC NUMERIC frame_optional_list_optional end FRAMEframe_optional : frame_measurement\n                          | if_data_frameframe_optional_list : frame_optional\n                               | frame_optional_list frame_optionalframe_optional_list_optional : empty\n                                        | frame_optional_listif_data_frame : begin IF_DATA IDENT if_data_frame_optional_list_optional end IF_DATAif_data_frame_optional : QP_BLOB qp_dataif_data_frame_optional_list : if_data_frame_optional\n                                       | if_data_frame_optional_list if_data_frame_optionalif_data_frame_optional_list_optional : empty\n                                                | if_data_frame_optional_listqp_data : generic_parameterframe_measurement : FRAME_MEASUREMENT ident_listuser_rights : begin USER_RIGHTS IDENT user_rights_optional_list_optional end USER_RIGHTSuser_rights_optional : ref_group\n                                | read_onlyuser_rights_optional_list : user_rights_optional\n                                     | user_rights_optional_list user_rights_optionaluser_rights_optional_list_optional : empty\n                                              | user_rights_optional_listref_group : begin REF_GROUP ref_group_optional_list_optional end REF_GROUPref_group_optional : identifierref_group_optional_list : ref_group_optional\n                                   | ref_group_optional_list ref_group_optionalref_group_optional_list_optional : empty\n                                            | ref_group_optional_listread_only : READ_ONLYguard_rails : GUARD_RAILSunit : begin UNIT IDENT STRING STRING unit_type unit_optional_list_optional end UNITunit_optional : si_exponents\n                         | ref_unit\n                         | unit_conversionunit_optional_list : unit_optional\n                              | unit_optional_list unit_optionalunit_optional_list_optional : empty\n                                       | unit_optional_listunit_type : EXTENDED_SI\n                     | DERIVEDsi_exponents : SI_EXPONENTS NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERICunit_conversion : UNIT_CONVERSION NUMERIC NUMERICempty :'
     
-_lr_action_items = {'int':([79,131,268,269,270,273,425,582,593,594,724,726,],[110,110,-9,110,-69,-10,110,110,110,110,-40,110,]),'CPU_TYPE':([70,134,279,280,283,287,290,291,292,294,295,296,298,299,303,305,307,308,309,437,438,440,442,443,444,445,446,447,448,449,607,1103,1227,1441,],[-124,278,-334,-333,-338,-343,-342,-331,-329,-337,-332,-340,-335,-328,-330,-336,-341,-339,278,-372,-354,-350,-349,-351,-348,-373,-374,-353,-371,-352,-430,-375,-387,-407,]),'MAX_ODT_ENTRIES':([322,330,332,333,494,969,1513,1522,1523,1524,1525,1526,1532,1535,1537,1566,1567,1568,1570,1571,1572,1573,1574,],[-98,-96,-97,-100,-101,-99,1528,-284,-270,-272,-273,-274,1528,-271,-275,-281,-282,-280,-277,-279,-276,-278,-283,]),'EXTENDED_LIMITS':([252,358,359,360,362,363,364,1001,1004,1143,1202,1232,1234,1240,1242,1246,1249,1251,1252,1253,1254,1255,1258,1259,1260,1261,1263,1264,1265,1266,1267,1268,1269,1270,1272,1274,1275,1276,1277,1278,1303,1319,1320,1321,1323,1324,1325,1326,1327,1328,1331,1332,1333,1334,1335,1336,1338,1339,1340,1341,1342,1345,1346,1391,1395,1410,1447,1485,1487,1518,1540,1541,1542,1543,1546,1547,1550,1551,1554,1555,1557,1558,1559,1562,1576,1580,1581,1582,1583,1584,1585,1586,1595,1600,1601,1605,],[-927,-464,-463,-465,-582,-580,-581,-482,-467,-461,1250,-466,-534,-481,-462,1250,-541,-551,1250,-539,-550,-545,-542,-537,-535,-554,-549,-560,-538,-547,-928,-543,-552,-553,-546,-536,-540,-548,-544,-555,-476,-571,-570,-572,-565,1250,-567,-569,-579,-573,-563,-564,-562,-566,-568,-574,-529,-528,-530,-532,-531,-493,-473,-533,-474,-396,-475,-477,-478,1250,-497,-502,-500,-499,-506,-505,-504,-498,-495,-496,-507,-501,-503,1250,-522,-517,-516,-515,-514,-518,-513,-512,-494,-519,-520,-521,]),'PBYTE':([654,655,656,658,659,660,661,662,663,664,665,860,866,870,],[863,-92,-93,863,-826,-828,-827,-824,-825,863,863,863,863,863,]),'IDENTICAL':([277,],[431,]),'PRG_DATA':([451,],[609,]),'GRANULARITY_ODT_ENTRY_SIZE_DAQ_BYTE':([1133,1135,1136,1137,1138,1139,1217,1218,1219,1285,1286,1287,1288,1289,1356,1357,1358,1359,1436,1437,1438,1439,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1467,1468,1592,1603,1609,],[-246,-249,-248,-247,-244,-245,-250,-251,-252,1359,-256,-255,-254,-253,-260,-259,-258,-257,1359,-261,-263,-262,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1359,-233,-243,-269,-289,-268,]),'PAG':([334,961,],[496,1048,]),'SRC_ADDR_Z':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[187,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,187,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'MON_INCREASE':([1553,],[1582,]),'ALIGNMENT_FLOAT32_IEEE':([93,94,149,150,153,154,155,156,157,158,161,164,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,352,353,354,356,357,358,359,360,361,362,363,364,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[148,148,-364,-357,-363,148,-359,-361,-362,-356,-358,-360,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,148,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-370,-864,-865,-863,-861,-464,-463,-465,-369,-582,-580,-581,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'DIRECT':([654,655,656,658,659,660,661,662,663,664,665,860,866,870,],[865,-92,-93,865,-826,-828,-827,-824,-825,865,865,865,865,865,]),'COMPU_VTAB_RANGE':([66,668,],[75,871,]),'float':([79,131,268,269,270,273,425,582,593,594,724,726,],[113,113,-9,113,-69,-10,113,113,113,113,-40,113,]),'OVERLOAD_INDICATION_EVENT':([1408,],[1438,]),'GROUP':([66,562,],[76,672,]),'ALTERNATE_WITH_X':([454,455,456,457,458,459,460,461,462,464,539,],[-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,659,]),'NO_AXIS_PTS_Y':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[174,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,174,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'SERAM':([741,],[925,]),'OPTIMISATION_TYPE_ODT_TYPE_16':([1067,1133,1135,1136,1137,1138,1139,1217,1218,1219,1286,1287,1288,1289,1356,1357,1358,1359,1436,1437,1438,1439,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1467,1468,1592,1603,1609,],[1139,-246,-249,-248,-247,-244,-245,-250,-251,-252,-256,-255,-254,-253,-260,-259,-258,-257,1139,-261,-263,-262,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1139,-233,-243,-269,-289,-268,]),'FREEZE_SUPPORTED':([322,330,332,333,494,632,801,802,803,804,969,],[-98,-96,-97,-100,-101,804,-221,-222,804,-227,-99,]),'A2ML_VERSION':([0,2,3,7,10,16,17,31,],[9,9,-4,-2,-3,-94,-95,-110,]),'COMMA':([602,603,604,899,904,],[-73,736,-33,-74,-32,]),'SYSTEM_CONSTANT':([70,134,279,280,283,287,290,291,292,294,295,296,298,299,303,305,307,308,309,437,438,440,442,443,444,445,446,447,448,449,607,1103,1227,1441,],[-124,282,-334,-333,-338,-343,-342,-331,-329,-337,-332,-340,-335,-328,-330,-336,-341,-339,282,-372,-354,-350,-349,-351,-348,-373,-374,-353,-371,-352,-430,-375,-387,-407,]),'INDEX_DECR':([454,455,456,457,458,459,460,461,462,464,535,540,542,653,657,666,],[-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,656,656,656,656,656,656,]),'DIST_OP_X':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[202,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,202,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'taggedstruct':([79,131,268,269,270,273,425,582,593,594,724,726,],[123,123,-9,123,-69,-10,123,123,123,123,-40,123,]),'RIP_ADDR_W':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[237,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,237,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'SBYTE':([311,365,366,370,371,372,373,375,376,377,378,380,381,382,383,384,385,386,387,388,389,390,392,393,394,395,396,397,398,399,400,],[456,456,456,456,456,456,456,456,456,456,456,456,456,456,456,456,456,456,456,456,456,456,456,456,456,456,456,456,456,456,456,]),'RECORD_LAYOUT':([66,368,],[74,518,]),'A2ML':([66,261,],[79,423,]),'COMPU_METHOD':([66,1018,],[80,1091,]),'IDENT':([15,29,39,74,75,76,77,80,82,83,84,85,86,87,88,89,90,107,115,119,123,132,142,143,163,258,259,260,319,320,321,322,323,324,325,326,328,330,331,332,333,334,335,336,337,338,339,340,344,345,346,347,348,416,418,420,421,452,454,455,456,457,458,459,460,461,462,463,464,466,494,495,498,500,506,507,508,510,563,565,566,567,569,570,574,575,578,579,581,619,624,625,626,627,628,629,632,673,677,688,691,693,696,700,701,746,759,764,768,770,773,774,776,780,782,784,786,801,802,803,804,817,890,892,912,940,944,955,967,969,988,1048,1049,1056,1058,1059,1060,1063,1065,1069,1074,1077,1116,1133,1135,1136,1137,1138,1139,1141,1146,1159,1182,1205,1217,1218,1219,1221,1236,1237,1256,1286,1287,1288,1289,1291,1296,1297,1298,1300,1349,1353,1354,1356,1357,1358,1359,1382,1383,1384,1386,1388,1389,1397,1399,1400,1401,1402,1403,1404,1405,1407,1413,1418,1419,1420,1422,1425,1430,1435,1436,1437,1438,1439,1440,1442,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1467,1468,1471,1472,1475,1478,1479,1482,1483,1484,1511,1512,1513,1515,1519,1521,1522,1523,1524,1525,1526,1532,1535,1537,1539,1544,1560,1566,1567,1568,1570,1571,1572,1573,1574,1592,1603,1609,],[18,32,68,94,95,96,97,133,135,136,137,138,139,140,141,143,144,257,262,262,262,262,330,330,361,418,421,422,-156,-154,-152,-98,-159,330,-155,-157,-153,-96,-158,-97,330,500,-299,-305,-300,-301,-318,330,-310,-303,330,-302,500,569,575,418,579,613,-77,-80,-76,-79,-75,-78,-83,-82,-81,615,-84,619,-101,500,635,330,-304,-319,646,649,569,688,569,569,-723,-922,569,-887,418,579,579,754,569,569,569,569,569,789,330,-774,569,-468,688,569,-768,-725,569,936,579,-718,569,-737,569,-749,569,569,-731,-743,569,-221,-222,330,-227,969,1009,1011,1020,1038,1040,1046,330,-99,-315,-212,-193,-194,-214,330,-215,500,-160,-316,1143,1144,330,-246,-249,-248,-247,-244,-245,-313,-314,1228,1240,-213,-250,-251,-252,-311,1315,579,1345,-256,-255,-254,-253,-312,330,-403,330,-404,579,-439,1407,-260,-259,-258,-257,330,-618,1418,-617,330,1425,579,-523,1430,-524,-525,-527,-526,579,1435,1442,-622,-621,1418,-620,330,1448,1451,1460,-261,-263,-262,330,330,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1460,-233,-243,330,-293,-433,-434,-432,330,500,1505,-228,1521,330,-292,-220,1564,-284,-270,-272,-273,-274,330,-271,-275,-453,1576,1586,-281,-282,-280,-277,-279,-276,-278,-283,-269,-289,-268,]),'MAX_GRAD':([252,358,359,360,362,363,364,1001,1242,1395,1518,1540,1541,1542,1543,1546,1547,1550,1551,1554,1555,1557,1558,1559,1562,1576,1580,1581,1582,1583,1584,1585,1586,1600,1601,1605,],[-927,-464,-463,-465,-582,-580,-581,-482,-462,-474,1556,-497,-502,-500,-499,-506,-505,-504,-498,-495,-496,-507,-501,-503,1556,-522,-517,-516,-515,-514,-518,-513,-512,-519,-520,-521,]),'AXIS_RESCALE_Z':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[184,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,184,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'ADDR_EPK':([70,134,279,280,283,287,290,291,292,294,295,296,298,299,303,305,307,308,309,437,438,440,442,443,444,445,446,447,448,449,607,1103,1227,1441,],[-124,289,-334,-333,-338,-343,-342,-331,-329,-337,-332,-340,-335,-328,-330,-336,-341,-339,289,-372,-354,-350,-349,-351,-348,-373,-374,-353,-371,-352,-430,-375,-387,-407,]),'ALIGNMENT_WORD':([93,94,149,150,153,154,155,156,157,158,161,164,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,352,353,354,356,357,358,359,360,361,362,363,364,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[145,145,-364,-357,-363,145,-359,-361,-362,-356,-358,-360,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,145,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-370,-864,-865,-863,-861,-464,-463,-465,-369,-582,-580,-581,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'STRICT_DECREASE':([1553,],[1584,]),'UNIT':([66,937,],[83,1036,]),'READ_ONLY':([97,248,249,251,252,358,359,360,362,363,364,886,1001,1004,1143,1202,1232,1234,1240,1242,1246,1249,1251,1252,1253,1254,1255,1258,1259,1260,1261,1263,1264,1265,1266,1267,1268,1269,1270,1272,1274,1275,1276,1277,1278,1303,1319,1320,1321,1323,1324,1325,1326,1327,1328,1331,1332,1333,1334,1335,1336,1338,1339,1340,1341,1342,1345,1346,1391,1395,1410,1447,1485,1487,1518,1540,1541,1542,1543,1546,1547,1550,1551,1554,1555,1557,1558,1559,1562,1576,1580,1581,1582,1583,1584,1585,1586,1595,1600,1601,1605,],[252,-916,252,-915,-927,-464,-463,-465,-582,-580,-581,-921,-482,-467,-461,252,-466,-534,-481,-462,252,-541,-551,252,-539,-550,-545,-542,-537,-535,-554,-549,-560,-538,-547,-928,-543,-552,-553,-546,-536,-540,-548,-544,-555,-476,-571,-570,-572,-565,252,-567,-569,-579,-573,-563,-564,-562,-566,-568,-574,-529,-528,-530,-532,-531,-493,-473,-533,-474,-396,-475,-477,-478,252,-497,-502,-500,-499,-506,-505,-504,-498,-495,-496,-507,-501,-503,252,-522,-517,-516,-515,-514,-518,-513,-512,-494,-519,-520,-521,]),'MAP':([316,],[488,]),'BIT_MASK':([252,358,359,360,631,1001,1004,1109,1143,1163,1164,1166,1167,1168,1171,1172,1173,1177,1178,1179,1180,1186,1187,1188,1189,1190,1191,1193,1195,1202,1232,1234,1238,1240,1241,1242,1244,1249,1251,1252,1253,1254,1255,1258,1259,1260,1261,1263,1264,1265,1266,1267,1268,1269,1270,1272,1274,1275,1276,1277,1278,1303,1338,1339,1340,1341,1342,1345,1346,1391,1395,1410,1414,1426,1443,1447,1485,1487,1595,],[-927,-464,-463,-465,-151,-482,-467,1169,-461,-599,-589,-595,-593,-591,-590,-584,-600,-597,-588,-606,-598,-592,-587,-585,1169,-594,-586,-596,-601,1169,-466,-534,-667,-481,-625,-462,-666,-541,-551,1169,-539,-550,-545,-542,-537,-535,-554,-549,-560,-538,-547,-928,-543,-552,-553,-546,-536,-540,-548,-544,-555,-476,-529,-528,-530,-532,-531,-493,-473,-533,-474,-396,-626,-665,-607,-475,-477,-478,-494,]),'AXIS_PTS':([66,1394,],[84,1427,]),'FIXED_EVENT_LIST':([497,],[633,]),'FUNCTION':([66,622,],[86,763,]),'FIRST_PID':([322,330,332,333,494,969,1513,1522,1523,1524,1525,1526,1532,1535,1537,1566,1567,1568,1570,1571,1572,1573,1574,],[-98,-96,-97,-100,-101,-99,1529,-284,-270,-272,-273,-274,1529,-271,-275,-281,-282,-280,-277,-279,-276,-278,-283,]),'COEFFS_LINEAR':([739,905,908,913,914,915,916,936,1020,1090,1293,1361,],[907,-640,-639,907,-641,-642,-638,-664,-663,-662,-654,-661,]),'NO_RESCALE_Y':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[188,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,188,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'FRAME':([66,941,],[85,1039,]),'FIX_AXIS_PAR':([252,358,359,360,362,363,364,1001,1242,1395,1518,1540,1541,1542,1543,1546,1547,1550,1551,1554,1555,1557,1558,1559,1562,1576,1580,1581,1582,1583,1584,1585,1586,1600,1601,1605,],[-927,-464,-463,-465,-582,-580,-581,-482,-462,-474,1545,-497,-502,-500,-499,-506,-505,-504,-498,-495,-496,-507,-501,-503,1545,-522,-517,-516,-515,-514,-518,-513,-512,-519,-520,-521,]),'REF_GROUP':([253,703,],[416,886,]),'EXTENDED_SI':([465,],[617,]),'ADDRESS_EXTENSION_FREE':([1133,1134,1135,1136,1137,1138,1139,1217,1218,1219,1286,1287,1288,1289,1356,1357,1358,1359,1436,1437,1438,1439,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1467,1468,1592,1603,1609,],[-246,1217,-249,-248,-247,-244,-245,-250,-251,-252,-256,-255,-254,-253,-260,-259,-258,-257,1217,-261,-263,-262,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1217,-233,-243,-269,-289,-268,]),'CUBOID':([316,],[484,]),'DEFAULT_VALUE':([401,551,556,557,558,559,630,652,669,671,790,793,794,796,797,798,851,852,856,857,859,872,956,959,993,995,],[554,554,-700,-701,-695,-694,554,554,-679,-702,-676,-104,-669,554,-671,-670,-690,-688,-683,-682,554,-703,-105,-680,-691,-692,]),'BRACE_CLOSE':([898,899,],[1013,-74,]),'FIX_NO_AXIS_PTS_Y':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[226,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,226,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'BTL_CYCLES':([640,818,823,824,825,828,829,831,834,835,836,837,970,971,972,973,974,976,977,978,980,981,982,1284,],[827,-164,-162,-168,-166,-163,-161,-165,-167,-169,-170,827,-175,-178,-181,-180,-177,-182,-179,-183,-176,-184,-185,-186,]),'IDENTIFICATION':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[196,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,196,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'WORD':([379,],[527,]),'SHIFT_OP_X':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[197,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,197,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'DUAL':([839,],[982,]),'PRESCALER_SUPPORTED':([1133,1135,1136,1137,1138,1139,1217,1218,1219,1286,1287,1288,1289,1356,1357,1358,1359,1436,1437,1438,1439,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1467,1468,1592,1603,1609,],[-246,-249,-248,-247,-244,-245,-250,-251,-252,-256,-255,-254,-253,-260,-259,-258,-257,1461,-261,-263,-262,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1461,-233,-243,-269,-289,-268,]),'CHECKSUM':([348,846,986,1213,],[508,988,1069,508,]),'REF_MEMORY_SEGMENT':([252,358,359,360,362,363,364,631,1001,1004,1109,1143,1163,1164,1166,1167,1168,1171,1172,1173,1177,1178,1179,1180,1186,1187,1188,1189,1190,1191,1193,1195,1202,1232,1234,1238,1240,1241,1242,1244,1246,1249,1251,1252,1253,1254,1255,1258,1259,1260,1261,1263,1264,1265,1266,1267,1268,1269,1270,1272,1274,1275,1276,1277,1278,1303,1319,1320,1321,1323,1324,1325,1326,1327,1328,1331,1332,1333,1334,1335,1336,1338,1339,1340,1341,1342,1345,1346,1391,1395,1410,1414,1426,1443,1447,1485,1487,1595,],[-927,-464,-463,-465,-582,-580,-581,-151,-482,-467,1182,-461,-599,-589,-595,-593,-591,-590,-584,-600,-597,-588,-606,-598,-592,-587,-585,1182,-594,-586,-596,-601,1182,-466,-534,-667,-481,-625,-462,-666,1182,-541,-551,1182,-539,-550,-545,-542,-537,-535,-554,-549,-560,-538,-547,-928,-543,-552,-553,-546,-536,-540,-548,-544,-555,-476,-571,-570,-572,-565,1182,-567,-569,-579,-573,-563,-564,-562,-566,-568,-574,-529,-528,-530,-532,-531,-493,-473,-533,-474,-396,-626,-665,-607,-475,-477,-478,-494,]),'VERSION':([33,36,40,41,68,70,134,279,280,283,287,290,291,292,294,295,296,298,299,303,305,307,308,309,437,438,440,442,443,444,445,446,447,448,449,607,1103,1227,1441,],[42,-119,42,-118,-125,-124,42,-334,-333,-338,-343,-342,-331,-329,-337,-332,-340,-335,-328,-330,-336,-341,-339,42,-372,-354,-350,-349,-351,-348,-373,-374,-353,-371,-352,-430,-375,-387,-407,]),'COMPU_TAB':([66,957,],[88,1047,]),'LINEAR':([277,],[434,]),'char':([79,131,268,269,270,273,425,582,593,594,724,726,],[118,118,-9,118,-69,-10,118,118,118,118,-40,118,]),'FLASH':([919,920,921,922,923,924,925,926,927,],[-420,1025,-417,-414,-415,-421,-418,-419,-416,]),'USER':([70,134,279,280,283,287,290,291,292,294,295,296,298,299,303,305,307,308,309,437,438,440,442,443,444,445,446,447,448,449,607,1103,1227,1441,],[-124,302,-334,-333,-338,-343,-342,-331,-329,-337,-332,-340,-335,-328,-330,-336,-341,-339,302,-372,-354,-350,-349,-351,-348,-373,-374,-353,-371,-352,-430,-375,-387,-407,]),'MAX_REFRESH':([252,358,359,360,631,1001,1004,1109,1143,1163,1164,1166,1167,1168,1171,1172,1173,1177,1178,1179,1180,1186,1187,1188,1189,1190,1191,1193,1195,1202,1232,1234,1238,1240,1241,1242,1244,1249,1251,1252,1253,1254,1255,1258,1259,1260,1261,1263,1264,1265,1266,1267,1268,1269,1270,1272,1274,1275,1276,1277,1278,1303,1338,1339,1340,1341,1342,1345,1346,1391,1395,1410,1414,1426,1443,1447,1485,1487,1595,],[-927,-464,-463,-465,-151,-482,-467,1165,-461,-599,-589,-595,-593,-591,-590,-584,-600,-597,-588,-606,-598,-592,-587,-585,1165,-594,-586,-596,-601,1165,-466,-534,-667,-481,-625,-462,-666,-541,-551,1165,-539,-550,-545,-542,-537,-535,-554,-549,-560,-538,-547,-928,-543,-552,-553,-546,-536,-540,-548,-544,-555,-476,-529,-528,-530,-532,-531,-493,-473,-533,-474,-396,-626,-665,-607,-475,-477,-478,-494,]),'VAR_ADDRESS':([711,1084,],[887,1149,]),'AXIS_PTS_REF':([252,358,359,360,362,363,364,1001,1242,1395,1518,1540,1541,1542,1543,1546,1547,1550,1551,1554,1555,1557,1558,1559,1562,1576,1580,1581,1582,1583,1584,1585,1586,1600,1601,1605,],[-927,-464,-463,-465,-582,-580,-581,-482,-462,-474,1560,-497,-502,-500,-499,-506,-505,-504,-498,-495,-496,-507,-501,-503,1560,-522,-517,-516,-515,-514,-518,-513,-512,-519,-520,-521,]),'FORMULA':([917,1225,],[1022,1293,]),'PROJECT':([11,27,],[15,31,]),'MAX_BLOCK_SIZE':([646,],[845,]),'A_UINT64':([311,365,366,370,371,372,373,375,376,377,378,380,381,382,383,384,385,386,387,388,389,390,392,393,394,395,396,397,398,399,400,],[462,462,462,462,462,462,462,462,462,462,462,462,462,462,462,462,462,462,462,462,462,462,462,462,462,462,462,462,462,462,462,]),'VAR_CRITERION':([109,1012,],[260,1085,]),'VAR_FORBIDDEN_COMB':([109,576,],[258,705,]),'COM_AXIS':([1350,],[1402,]),'RESUME_SUPPORTED':([1133,1135,1136,1137,1138,1139,1217,1218,1219,1286,1287,1288,1289,1356,1357,1358,1359,1436,1437,1438,1439,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1467,1468,1592,1603,1609,],[-246,-249,-248,-247,-244,-245,-250,-251,-252,-256,-255,-254,-253,-260,-259,-258,-257,1468,-261,-263,-262,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1468,-233,-243,-269,-289,-268,]),'BA_BLOB':([322,330,332,333,494,969,1228,1294,1363,1364,1365,1366,],[-98,-96,-97,-100,-101,-99,1300,1300,-405,-397,-398,-406,]),'SHIFT_OP_Y':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[224,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,224,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'EXCLUDE_FROM_FLASH':([741,],[924,]),'SEED_KEY':([348,1079,],[511,1146,]),'enum':([79,131,268,269,270,273,425,582,593,594,724,726,],[132,132,-9,132,-69,-10,132,132,132,132,-40,132,]),'ALIGNMENT_LONG':([93,94,149,150,153,154,155,156,157,158,161,164,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,352,353,354,356,357,358,359,360,361,362,363,364,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[159,159,-364,-357,-363,159,-359,-361,-362,-356,-358,-360,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,159,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-370,-864,-865,-863,-861,-464,-463,-465,-369,-582,-580,-581,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'EPROM':([919,920,921,922,923,924,925,926,927,],[-420,1024,-417,-414,-415,-421,-418,-419,-416,]),'FNC_VALUES':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[221,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,221,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'CAN_ID_BROADCAST':([640,818,823,824,825,828,829,831,834,835,836,837,970,971,972,973,974,976,977,978,980,981,982,1284,],[819,-164,-162,-168,-166,-163,-161,-165,-167,-169,-170,819,-175,-178,-181,-180,-177,-182,-179,-183,-176,-184,-185,-186,]),'STRICT_INCREASE':([1553,],[1580,]),'REGISTER':([919,920,921,922,923,924,925,926,927,],[-420,1026,-417,-414,-415,-421,-418,-419,-416,]),'FIXED':([1066,],[1127,]),'OFFLINE_DATA':([741,],[927,]),'DP_BLOB':([322,330,332,333,494,969,1228,1294,1315,1363,1364,1365,1366,1379,1385,1416,1417,1418,1419,1420,1421,1422,1424,1444,1505,],[-98,-96,-97,-100,-101,-99,1297,1297,1297,-405,-397,-398,-406,-611,1297,-609,-619,-622,-621,-623,-608,-620,-610,-624,-612,]),'ASTERISK':([901,902,1014,],[1015,1016,1087,]),'CURVE_AXIS_REF':([252,358,359,360,362,363,364,1001,1242,1395,1518,1540,1541,1542,1543,1546,1547,1550,1551,1554,1555,1557,1558,1559,1562,1576,1580,1581,1582,1583,1584,1585,1586,1600,1601,1605,],[-927,-464,-463,-465,-582,-580,-581,-482,-462,-474,1544,-497,-502,-500,-499,-506,-505,-504,-498,-495,-496,-507,-501,-503,1544,-522,-517,-516,-515,-514,-518,-513,-512,-519,-520,-521,]),'GRANULARITY_ODT_ENTRY_SIZE_DAQ_DLONG':([1133,1135,1136,1137,1138,1139,1217,1218,1219,1285,1286,1287,1288,1289,1356,1357,1358,1359,1436,1437,1438,1439,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1467,1468,1592,1603,1609,],[-246,-249,-248,-247,-244,-245,-250,-251,-252,1356,-256,-255,-254,-253,-260,-259,-258,-257,1356,-261,-263,-262,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1356,-233,-243,-269,-289,-268,]),'DEF_CHARACTERISTIC':([481,945,],[624,1041,]),'OVERLOAD_INDICATION_PID':([1408,],[1439,]),'TP_BLOB':([143,322,330,332,333,335,336,337,338,340,344,345,347,494,506,507,969,988,1069,1141,1146,1221,1291,],[339,-98,-96,-97,-100,-299,-305,-300,-301,339,-310,-303,-302,-101,-304,-319,-99,-315,-316,-313,-314,-311,-312,]),'GRANULARITY_ODT_ENTRY_SIZE_DAQ_WORD':([1133,1135,1136,1137,1138,1139,1217,1218,1219,1285,1286,1287,1288,1289,1356,1357,1358,1359,1436,1437,1438,1439,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1467,1468,1592,1603,1609,],[-246,-249,-248,-247,-244,-245,-250,-251,-252,1358,-256,-255,-254,-253,-260,-259,-258,-257,1358,-261,-263,-262,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1358,-233,-243,-269,-289,-268,]),'PWORD':([654,655,656,658,659,660,661,662,663,664,665,860,866,870,],[862,-92,-93,862,-826,-828,-827,-824,-825,862,862,862,862,862,]),'SECTOR':([1063,1507,],[1124,1519,]),'BIT_OPERATION':([1175,1377,],[1235,1414,]),'DAQ_LIST':([1469,1565,],[1498,1592,]),'TIMESTAMP_SUPPORTED':([1469,1598,],[1497,1603,]),'long':([79,131,268,269,270,273,425,582,593,594,724,726,],[116,116,-9,116,-69,-10,116,116,116,116,-40,116,]),'SAMPLE_POINT':([640,818,823,824,825,828,829,831,834,835,836,837,970,971,972,973,974,976,977,978,980,981,982,1284,],[830,-164,-162,-168,-166,-163,-161,-165,-167,-169,-170,830,-175,-178,-181,-180,-177,-182,-179,-183,-176,-184,-185,-186,]),'CAN_ID_MASTER':([640,818,823,824,825,828,829,831,834,835,836,837,970,971,972,973,974,976,977,978,980,981,982,1284,],[838,-164,-162,-168,-166,-163,-161,-165,-167,-169,-170,838,-175,-178,-181,-180,-177,-182,-179,-183,-176,-184,-185,-186,]),'TAB_VERB':([277,349,],[430,513,]),'SJW':([640,818,823,824,825,828,829,831,834,835,836,837,970,971,972,973,974,976,977,978,980,981,982,1284,],[833,-164,-162,-168,-166,-163,-161,-165,-167,-169,-170,833,-175,-178,-181,-180,-177,-182,-179,-183,-176,-184,-185,-186,]),'XCP_ON_CAN':([334,975,],[501,1065,]),'DISPLAY_IDENTIFIER':([252,358,359,360,362,363,364,631,990,1001,1004,1075,1076,1078,1109,1143,1144,1163,1164,1166,1167,1168,1171,1172,1173,1177,1178,1179,1180,1186,1187,1188,1189,1190,1191,1193,1195,1202,1232,1234,1238,1240,1241,1242,1244,1246,1249,1251,1252,1253,1254,1255,1258,1259,1260,1261,1263,1264,1265,1266,1267,1268,1269,1270,1272,1274,1275,1276,1277,1278,1303,1319,1320,1321,1323,1324,1325,1326,1327,1328,1331,1332,1333,1334,1335,1336,1338,1339,1340,1341,1342,1345,1346,1391,1395,1410,1414,1426,1443,1447,1485,1487,1595,],[-927,-464,-463,-465,-582,-580,-581,-151,1074,-482,-467,-321,-320,1074,1074,-461,-326,-599,-589,-595,-593,-591,-590,-584,-600,-597,-588,-606,-598,-592,-587,-585,1074,-594,-586,-596,-601,1074,-466,-534,-667,-481,-625,-462,-666,1074,-541,-551,1074,-539,-550,-545,-542,-537,-535,-554,-549,-560,-538,-547,-928,-543,-552,-553,-546,-536,-540,-548,-544,-555,-476,-571,-570,-572,-565,1074,-567,-569,-579,-573,-563,-564,-562,-566,-568,-574,-529,-528,-530,-532,-531,-493,-473,-533,-474,-396,-626,-665,-607,-475,-477,-478,-494,]),'uint':([79,131,268,269,270,273,425,582,593,594,724,726,],[122,122,-9,122,-69,-10,122,122,122,122,-40,122,]),'CALIBRATION_METHOD':([310,1032,],[453,1103,]),'OPTIMISATION_TYPE_ODT_TYPE_64':([1067,1133,1135,1136,1137,1138,1139,1217,1218,1219,1286,1287,1288,1289,1356,1357,1358,1359,1436,1437,1438,1439,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1467,1468,1592,1603,1609,],[1137,-246,-249,-248,-247,-244,-245,-250,-251,-252,-256,-255,-254,-253,-260,-259,-258,-257,1137,-261,-263,-262,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1137,-233,-243,-269,-289,-268,]),'CUSTOMER':([70,134,279,280,283,287,290,291,292,294,295,296,298,299,303,305,307,308,309,437,438,440,442,443,444,445,446,447,448,449,607,1103,1227,1441,],[-124,288,-334,-333,-338,-343,-342,-331,-329,-337,-332,-340,-335,-328,-330,-336,-341,-339,288,-372,-354,-350,-349,-351,-348,-373,-374,-353,-371,-352,-430,-375,-387,-407,]),'IDENTIFICATION_FIELD_TYPE_RELATIVE_BYTE':([1133,1135,1136,1137,1138,1139,1216,1217,1218,1219,1286,1287,1288,1289,1356,1357,1358,1359,1436,1437,1438,1439,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1467,1468,1592,1603,1609,],[-246,-249,-248,-247,-244,-245,1288,-250,-251,-252,-256,-255,-254,-253,-260,-259,-258,-257,1288,-261,-263,-262,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1288,-233,-243,-269,-289,-268,]),'FIX_AXIS_PAR_LIST':([1563,1602,],[1588,1605,]),'SYNC_EDGE':([640,818,823,824,825,828,829,831,834,835,836,837,970,971,972,973,974,976,977,978,980,981,982,1284,],[839,-164,-162,-168,-166,-163,-161,-165,-167,-169,-170,839,-175,-178,-181,-180,-177,-182,-179,-183,-176,-184,-185,-186,]),'VARIABLE':([497,1066,],[634,1126,]),'ROW_DIR':([454,455,456,457,458,459,460,461,462,464,539,],[-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,663,]),'RIP_ADDR_Y':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[220,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,220,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'SEGMENT':([334,1281,1483,],[499,1353,499,]),'ERROR_MASK':([358,359,360,631,1001,1004,1109,1143,1163,1164,1166,1167,1168,1171,1172,1173,1177,1178,1179,1180,1186,1187,1188,1189,1190,1191,1193,1195,1232,1234,1238,1240,1241,1242,1244,1303,1391,1414,1426,1443,],[-464,-463,-465,-151,-482,-467,1176,-461,-599,-589,-595,-593,-591,-590,-584,-600,-597,-588,-606,-598,-592,-587,-585,1176,-594,-586,-596,-601,-466,-534,-667,-481,-625,-462,-666,-476,-533,-626,-665,-607,]),'DEPOSIT':([93,149,150,153,154,155,156,157,158,161,164,252,350,352,353,354,356,357,358,359,360,361,362,363,364,1001,1004,1143,1234,1240,1242,1246,1267,1319,1320,1321,1323,1324,1325,1326,1327,1328,1331,1332,1333,1334,1335,1336,1338,1339,1340,1341,1342,1395,1410,1518,1540,1541,1542,1543,1546,1547,1550,1551,1554,1555,1557,1558,1559,1562,1576,1580,1581,1582,1583,1584,1585,1586,1600,1601,1605,],[166,-364,-357,-363,166,-359,-361,-362,-356,-358,-360,-927,-862,-370,-864,-865,-863,-861,-464,-463,-465,-369,-582,-580,-581,-482,-467,-461,-534,-481,-462,166,-928,-571,-570,-572,-565,166,-567,-569,-579,-573,-563,-564,-562,-566,-568,-574,-529,-528,-530,-532,-531,-474,-396,166,-497,-502,-500,-499,-506,-505,-504,-498,-495,-496,-507,-501,-503,166,-522,-517,-516,-515,-514,-518,-513,-512,-519,-520,-521,]),'INIT_SEGMENT':([1451,1490,1494,1510,],[1493,1493,-447,-452,]),'NO_OF_INTERFACES':([70,134,279,280,283,287,290,291,292,294,295,296,298,299,303,305,307,308,309,437,438,440,442,443,444,445,446,447,448,449,607,1103,1227,1441,],[-124,293,-334,-333,-338,-343,-342,-331,-329,-337,-332,-340,-335,-328,-330,-336,-341,-339,293,-372,-354,-350,-349,-351,-348,-373,-374,-353,-371,-352,-430,-375,-387,-407,]),'STD_AXIS':([1350,],[1399,]),'AXIS_PTS_Y':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[223,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,223,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'CALIBRATION_HANDLE':([933,1161,],[1033,1230,]),'READ_WRITE':([358,359,360,631,1001,1004,1109,1143,1163,1164,1166,1167,1168,1171,1172,1173,1177,1178,1179,1180,1186,1187,1188,1189,1190,1191,1193,1195,1232,1234,1238,1240,1241,1242,1244,1303,1391,1414,1426,1443,],[-464,-463,-465,-151,-482,-467,1179,-461,-599,-589,-595,-593,-591,-590,-584,-600,-597,-588,-606,-598,-592,-587,-585,1179,-594,-586,-596,-601,-466,-534,-667,-481,-625,-462,-666,-476,-533,-626,-665,-607,]),'FIX_NO_AXIS_PTS_X':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[176,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,176,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'CUSTOMER_NO':([70,134,279,280,283,287,290,291,292,294,295,296,298,299,303,305,307,308,309,437,438,440,442,443,444,445,446,447,448,449,607,1103,1227,1441,],[-124,306,-334,-333,-338,-343,-342,-331,-329,-337,-332,-340,-335,-328,-330,-336,-341,-339,306,-372,-354,-350,-349,-351,-348,-373,-374,-353,-371,-352,-430,-375,-387,-407,]),'OUT_MEASUREMENT':([481,947,],[625,1042,]),'FLOAT64_IEEE':([311,365,366,370,371,372,373,375,376,377,378,380,381,382,383,384,385,386,387,388,389,390,392,393,394,395,396,397,398,399,400,],[464,464,464,464,464,464,464,464,464,464,464,464,464,464,464,464,464,464,464,464,464,464,464,464,464,464,464,464,464,464,464,]),'LONG':([379,],[530,]),'QP_BLOB':([322,330,332,969,990,1040,1075,1076,1078,1113,1143,1144,1200,1201,],[-98,-96,-97,-99,1077,1116,-321,-320,1077,1116,-461,-326,-912,-907,]),'IN_MEASUREMENT':([481,952,],[627,1044,]),'FLOAT32_IEEE':([311,365,366,370,371,372,373,375,376,377,378,380,381,382,383,384,385,386,387,388,389,390,392,393,394,395,396,397,398,399,400,],[460,460,460,460,460,460,460,460,460,460,460,460,460,460,460,460,460,460,460,460,460,460,460,460,460,460,460,460,460,460,460,]),'COMPU_VTAB':([66,994,],[90,1081,]),'KP_BLOB':([322,330,332,333,494,969,1315,1363,1366,1379,1385,1416,1417,1418,1419,1420,1421,1422,1424,1444,1505,],[-98,-96,-97,-100,-101,-99,1386,-405,-406,-611,1386,-609,-619,-622,-621,-623,-608,-620,-610,-624,-612,]),'MEMORY_SEGMENT':([310,1411,],[452,1441,]),'OPTIMISATION_TYPE_ODT_TYPE_ALIGNMENT':([1067,1133,1135,1136,1137,1138,1139,1217,1218,1219,1286,1287,1288,1289,1356,1357,1358,1359,1436,1437,1438,1439,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1467,1468,1592,1603,1609,],[1136,-246,-249,-248,-247,-244,-245,-250,-251,-252,-256,-255,-254,-253,-260,-259,-258,-257,1136,-261,-263,-262,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1136,-233,-243,-269,-289,-268,]),'REF_CHARACTERISTIC':([413,481,885,],[567,567,1006,]),'RASTER':([348,1222,],[512,1291,]),'EXTERN':([1024,1025,1026,1027,1028,1029,1030,],[-424,-427,-426,-422,1102,-423,-425,]),'MON_DECREASE':([1553,],[1581,]),'ALTERNATE_WITH_Y':([454,455,456,457,458,459,460,461,462,464,539,],[-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,661,]),'ANNOTATION_LABEL':([564,682,683,684,685,875,876,1148,],[680,-485,-483,-484,680,-491,-490,-492,]),'MATRIX_DIM':([252,358,359,360,631,1001,1004,1109,1143,1163,1164,1166,1167,1168,1171,1172,1173,1177,1178,1179,1180,1186,1187,1188,1189,1190,1191,1193,1195,1202,1232,1234,1238,1240,1241,1242,1244,1249,1251,1252,1253,1254,1255,1258,1259,1260,1261,1263,1264,1265,1266,1267,1268,1269,1270,1272,1274,1275,1276,1277,1278,1303,1338,1339,1340,1341,1342,1345,1346,1391,1395,1410,1414,1426,1443,1447,1485,1487,1595,],[-927,-464,-463,-465,-151,-482,-467,1181,-461,-599,-589,-595,-593,-591,-590,-584,-600,-597,-588,-606,-598,-592,-587,-585,1181,-594,-586,-596,-601,1181,-466,-534,-667,-481,-625,-462,-666,-541,-551,1181,-539,-550,-545,-542,-537,-535,-554,-549,-560,-538,-547,-928,-543,-552,-553,-546,-536,-540,-548,-544,-555,-476,-529,-528,-530,-532,-531,-493,-473,-533,-474,-396,-626,-665,-607,-475,-477,-478,-494,]),'OFFSET_X':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[234,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,234,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'DIST_OP_Y':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[235,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,235,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'VAR_NAMING':([78,100,101,103,104,106,108,255,257,705,1008,1085,],[107,-869,-868,107,-870,-871,-867,-876,-877,-884,-879,-878,]),'VAR_MEASUREMENT':([579,707,713,891,895,896,1009,1011,],[-106,-107,890,890,-891,-890,-896,-897,]),'ALIGNMENT_BYTE':([93,94,149,150,153,154,155,156,157,158,161,164,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,352,353,354,356,357,358,359,360,361,362,363,364,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[160,160,-364,-357,-363,160,-359,-361,-362,-356,-358,-360,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,160,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-370,-864,-865,-863,-861,-464,-463,-465,-369,-582,-580,-581,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'EVENT_GROUP':([348,1070,],[509,1141,]),'GRANULARITY_ODT_ENTRY_SIZE_DAQ_DWORD':([1133,1135,1136,1137,1138,1139,1217,1218,1219,1285,1286,1287,1288,1289,1356,1357,1358,1359,1436,1437,1438,1439,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1467,1468,1592,1603,1609,],[-246,-249,-248,-247,-244,-245,-250,-251,-252,1357,-256,-255,-254,-253,-260,-259,-258,-257,1357,-261,-263,-262,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1357,-233,-243,-269,-289,-268,]),'GUARD_RAILS':([252,358,359,360,362,363,364,1001,1004,1143,1202,1232,1234,1240,1242,1246,1249,1251,1252,1253,1254,1255,1258,1259,1260,1261,1263,1264,1265,1266,1267,1268,1269,1270,1272,1274,1275,1276,1277,1278,1303,1319,1320,1321,1323,1324,1325,1326,1327,1328,1331,1332,1333,1334,1335,1336,1338,1339,1340,1341,1342,1345,1346,1391,1395,1410,1447,1485,1487,1595,],[-927,-464,-463,-465,-582,-580,-581,-482,-467,-461,1267,-466,-534,-481,-462,1267,-541,-551,1267,-539,-550,-545,-542,-537,-535,-554,-549,-560,-538,-547,-928,-543,-552,-553,-546,-536,-540,-548,-544,-555,-476,-571,-570,-572,-565,1267,-567,-569,-579,-573,-563,-564,-562,-566,-568,-574,-529,-528,-530,-532,-531,-493,-473,-533,-474,-396,-475,-477,-478,-494,]),'IF_DATA':([66,492,505,762,1099,1175,1199,1279,1337,1367,1374,1415,1503,],[89,631,645,944,1159,1236,1247,1159,1159,1410,1413,1443,1517,]),'DAQ':([334,1495,1533,1575,],[502,1511,1572,1572,]),'DIFFERENCE':([166,],[362,]),'EVENT_FIXED':([322,330,332,333,494,969,1513,1522,1523,1524,1525,1526,1532,1535,1537,1566,1567,1568,1570,1571,1572,1573,1574,],[-98,-96,-97,-100,-101,-99,1536,-284,-270,-272,-273,-274,1536,-271,-275,-281,-282,-280,-277,-279,-276,-278,-283,]),'PROTOCOL_LAYER':([334,1501,],[503,1515,]),'AXIS_DESCR':([1279,1578,],[1350,1595,]),'IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD_ALIGNED':([1133,1135,1136,1137,1138,1139,1216,1217,1218,1219,1286,1287,1288,1289,1356,1357,1358,1359,1436,1437,1438,1439,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1467,1468,1592,1603,1609,],[-246,-249,-248,-247,-244,-245,1286,-250,-251,-252,-256,-255,-254,-253,-260,-259,-258,-257,1286,-261,-263,-262,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1286,-233,-243,-269,-289,-268,]),'STRING':([18,30,32,42,73,81,95,96,99,121,133,135,136,137,138,139,140,141,142,143,144,278,281,282,284,286,288,302,304,306,312,319,320,321,322,323,324,325,326,328,330,331,332,333,335,336,337,338,339,340,344,345,346,347,422,424,427,428,429,430,431,432,433,434,435,436,439,453,478,494,500,506,507,508,509,511,512,554,587,597,598,606,613,632,648,650,651,670,678,680,714,717,734,735,736,801,802,803,804,849,855,879,897,967,969,988,1002,1022,1048,1049,1056,1058,1059,1060,1065,1069,1088,1089,1116,1124,1141,1146,1152,1185,1205,1221,1291,1296,1297,1298,1300,1348,1351,1353,1382,1383,1384,1386,1388,1418,1419,1420,1422,1425,1440,1442,1471,1472,1475,1478,1479,1482,1499,1511,1513,1514,1515,1519,1522,1523,1524,1525,1526,1532,1535,1537,1539,1566,1567,1568,1570,1571,1572,1573,1574,],[19,33,34,70,93,134,244,245,255,270,277,311,312,313,314,315,316,317,332,332,349,437,438,439,440,442,443,447,448,449,465,-156,-154,-152,-98,-159,332,-155,-157,-153,-96,-158,-97,332,-299,-305,-300,-301,-318,332,-310,-303,332,-302,581,270,270,602,-648,-649,-652,-651,606,-653,-650,-647,607,614,623,-101,332,-304,-319,647,648,650,651,669,270,270,270,739,741,332,847,849,850,872,875,876,-66,-68,-56,-54,602,-221,-222,332,-227,991,995,1002,-67,332,-99,-315,1002,1093,-212,-193,-194,-214,332,-215,-160,-316,-57,-55,332,1206,-313,-314,1224,1242,-213,-311,-312,332,-403,332,-404,1397,1405,-439,332,-618,1419,-617,332,-622,-621,1419,-620,332,332,332,332,-293,-433,-434,-432,332,1514,-228,332,1538,-292,-220,-284,-270,-272,-273,-274,332,-271,-275,-453,-281,-282,-280,-277,-279,-276,-278,-283,]),'NO_RESCALE_Z':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[243,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,243,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'DEFAULT_VALUE_NUMERIC':([630,669,790,793,794,796,797,798,956,959,],[799,-679,-676,-104,-669,799,-671,-670,-105,-680,]),'begin':([0,2,3,7,10,16,17,19,21,24,25,31,34,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,61,62,64,65,70,78,91,92,97,100,101,103,104,106,108,134,142,143,245,248,249,251,252,255,257,279,280,283,287,290,291,292,294,295,296,298,299,303,305,307,308,309,315,319,320,321,322,323,324,325,326,328,330,331,332,333,335,336,337,338,339,340,344,345,346,347,358,359,360,362,363,364,402,403,404,405,406,407,411,412,417,423,437,438,440,442,443,444,445,446,447,448,449,468,469,470,471,472,474,475,479,480,494,500,506,507,515,518,564,568,579,580,607,608,620,623,631,632,633,634,640,645,672,682,683,684,685,705,707,739,742,757,758,761,763,793,801,802,803,804,810,812,813,818,823,824,825,828,829,831,834,835,836,837,871,875,876,886,905,908,913,914,915,916,930,932,936,942,956,967,969,970,971,972,973,974,976,977,978,980,981,982,988,1000,1001,1004,1005,1006,1008,1020,1023,1036,1039,1041,1042,1043,1044,1045,1047,1048,1049,1056,1058,1059,1060,1065,1069,1081,1085,1090,1091,1094,1098,1103,1109,1116,1125,1133,1135,1136,1137,1138,1139,1141,1143,1146,1148,1163,1164,1166,1167,1168,1171,1172,1173,1177,1178,1179,1180,1186,1187,1188,1189,1190,1191,1193,1195,1202,1203,1204,1205,1210,1211,1212,1217,1218,1219,1221,1227,1230,1232,1234,1238,1240,1241,1242,1244,1246,1247,1249,1251,1252,1253,1254,1255,1258,1259,1260,1261,1263,1264,1265,1266,1267,1268,1269,1270,1272,1274,1275,1276,1277,1278,1284,1286,1287,1288,1289,1291,1293,1296,1297,1298,1300,1302,1303,1304,1315,1319,1320,1321,1323,1324,1325,1326,1327,1328,1331,1332,1333,1334,1335,1336,1338,1339,1340,1341,1342,1345,1346,1353,1356,1357,1358,1359,1361,1363,1366,1370,1371,1372,1379,1382,1383,1385,1388,1391,1395,1396,1410,1414,1416,1417,1418,1419,1420,1421,1422,1424,1425,1426,1427,1436,1437,1438,1439,1440,1441,1442,1443,1444,1447,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1467,1468,1471,1472,1475,1478,1479,1482,1485,1487,1505,1511,1513,1515,1517,1518,1519,1520,1522,1523,1524,1525,1526,1532,1535,1537,1539,1540,1541,1542,1543,1546,1547,1550,1551,1554,1555,1557,1558,1559,1562,1566,1567,1568,1570,1571,1572,1573,1574,1576,1580,1581,1582,1583,1584,1585,1586,1592,1595,1600,1601,1603,1605,1609,],[11,11,-4,-2,-3,-94,-95,26,-111,26,-112,-110,66,-137,-138,-133,-128,-139,-129,66,-135,-142,-143,-132,-130,-145,-144,-136,-134,-127,-141,-131,-140,-124,109,-117,-126,253,-869,-868,109,-870,-871,-867,310,334,348,413,-916,253,-915,-927,-876,-877,-334,-333,-338,-343,-342,-331,-329,-337,-332,-340,-335,-328,-330,-336,-341,-339,310,481,-156,-154,-152,-98,-159,334,-155,-157,-153,-96,-158,-97,495,-299,-305,-300,-301,-318,348,-310,-303,495,-302,-464,-463,-465,-582,-580,-581,-756,413,-757,-759,-760,-766,-758,-761,-866,-150,-372,-354,-350,-349,-351,-348,-373,-374,-353,-371,-352,-705,-710,481,-706,-711,-712,-709,-707,-708,-101,495,-304,-319,-355,-779,687,-914,-106,711,-430,-327,762,-754,-151,495,811,811,841,-298,-755,-485,-483,-484,687,-884,-107,917,933,-900,-901,762,-704,-104,-221,-222,495,-227,-195,-196,811,-164,-162,-168,-166,-163,-161,-165,-167,-169,-170,841,-693,-491,-490,-921,-640,-639,917,-641,-642,-638,933,-376,-664,-913,-105,1063,-99,-175,-178,-181,-180,-177,-182,-179,-183,-176,-184,-185,-315,-773,-482,-467,-767,-724,-879,-663,1099,-929,-899,-717,-736,-748,-730,-742,-668,-212,-193,-194,-214,1063,-215,-160,-316,-681,-878,-662,-637,-391,1099,-375,1175,495,1213,-246,-249,-248,-247,-244,-245,-313,-461,-314,-492,-599,-589,-595,-593,-591,-590,-584,-600,-597,-588,-606,-598,-592,-587,-585,1175,-594,-586,-596,-601,1279,-201,-202,-213,1213,-441,-440,-250,-251,-252,-311,-387,-381,-466,-534,-667,-481,-625,-462,-666,1337,-906,-541,-551,1279,-539,-550,-545,-542,-537,-535,-554,-549,-560,-538,-547,-928,-543,-552,-553,-546,-536,-540,-548,-544,-555,-186,-256,-255,-254,-253,-312,-654,495,-403,495,-404,1374,-476,-583,1389,-571,-570,-572,-565,1337,-567,-569,-579,-573,-563,-564,-562,-566,-568,-574,-529,-528,-530,-532,-531,-493,-473,-439,-260,-259,-258,-257,-661,-405,-406,-409,-408,1374,-611,495,-618,1389,495,-533,-474,-454,-396,-626,-609,-619,-622,-621,-623,-608,-620,-610,495,-665,-561,1469,-261,-263,-262,495,-407,1483,-607,-624,-475,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1469,-233,-243,495,-293,-433,-434,-432,1483,-477,-478,-612,-228,495,-292,-431,1563,-220,-446,-284,-270,-272,-273,-274,495,-271,-275,-453,-497,-502,-500,-499,-506,-505,-504,-498,-495,-496,-507,-501,-503,1563,-281,-282,-280,-277,-279,-276,-278,-283,-522,-517,-516,-515,-514,-518,-513,-512,-269,-494,-519,-520,-289,-521,-268,]),'uchar':([79,131,268,269,270,273,425,582,593,594,724,726,],[114,114,-9,114,-69,-10,114,114,114,114,-40,114,]),'OPTIMISATION_TYPE_ODT_TYPE_32':([1067,1133,1135,1136,1137,1138,1139,1217,1218,1219,1286,1287,1288,1289,1356,1357,1358,1359,1436,1437,1438,1439,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1467,1468,1592,1603,1609,],[1133,-246,-249,-248,-247,-244,-245,-250,-251,-252,-256,-255,-254,-253,-260,-259,-258,-257,1133,-261,-263,-262,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1133,-233,-243,-269,-289,-268,]),'ADDRESS_EXTENSION_ODT':([1133,1134,1135,1136,1137,1138,1139,1217,1218,1219,1286,1287,1288,1289,1356,1357,1358,1359,1436,1437,1438,1439,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1467,1468,1592,1603,1609,],[-246,1218,-249,-248,-247,-244,-245,-250,-251,-252,-256,-255,-254,-253,-260,-259,-258,-257,1218,-261,-263,-262,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1218,-233,-243,-269,-289,-268,]),'MOD_COMMON':([66,351,],[73,515,]),'UNIT_CONVERSION':([616,617,618,747,748,750,753,936,1037,1392,],[752,-937,-938,-931,-932,752,-930,-664,-940,-939,]),'SAMPLE_RATE':([640,818,823,824,825,828,829,831,834,835,836,837,970,971,972,973,974,976,977,978,980,981,982,1284,],[821,-164,-162,-168,-166,-163,-161,-165,-167,-169,-170,821,-175,-178,-181,-180,-177,-182,-179,-183,-176,-184,-185,-186,]),'HEADER':([26,67,],[30,91,]),'OFFLINE_CALIBRATION':([1248,],[1341,]),'OPTIMISATION_TYPE_DEFAULT':([1067,1133,1135,1136,1137,1138,1139,1217,1218,1219,1286,1287,1288,1289,1356,1357,1358,1359,1436,1437,1438,1439,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1467,1468,1592,1603,1609,],[1138,-246,-249,-248,-247,-244,-245,-250,-251,-252,-256,-255,-254,-253,-260,-259,-258,-257,1138,-261,-263,-262,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1138,-233,-243,-269,-289,-268,]),'NO_RESCALE_X':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[185,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,185,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'AVAILABLE_EVENT_LIST':([811,1121,],[964,1204,]),'RESERVED':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,741,861,862,863,864,865,867,868,869,997,998,999,],[201,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,201,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,926,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'MAP_LIST':([1279,1429,],[1349,1447,]),'BRACE_OPEN':([110,113,114,116,117,118,122,124,125,127,128,129,130,262,263,266,271,275,588,716,723,730,738,1013,],[-20,-26,-22,-21,-17,-19,-23,-16,-15,-14,-24,-25,-18,-70,-61,-35,-49,-29,720,-60,-34,-48,-28,720,]),'DAQ_EVENT':([334,962,966,],[497,1049,1056,]),'ABSOLUTE':([166,],[364,]),'PHONE_NO':([70,134,279,280,283,287,290,291,292,294,295,296,298,299,303,305,307,308,309,437,438,440,442,443,444,445,446,447,448,449,607,1103,1227,1441,],[-124,281,-334,-333,-338,-343,-342,-331,-329,-337,-332,-340,-335,-328,-330,-336,-341,-339,281,-372,-354,-350,-349,-351,-348,-373,-374,-353,-371,-352,-430,-375,-387,-407,]),'TRIPLE':([821,],[972,]),'RIGHT_SHIFT':([1235,1307,1308,1309,1310,1312,1375,1378,],[1314,-627,1314,-628,-636,-629,-634,-635,]),'VAL_BLK':([316,],[485,]),'MSB_FIRST':([162,],[358,]),'RAT_FUNC':([277,],[435,]),'NO_AXIS_PTS_Z':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[229,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,229,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'REF_UNIT':([616,617,618,739,747,748,750,753,905,908,913,914,915,916,936,1020,1037,1090,1293,1361,1392,],[746,-937,-938,746,-931,-932,746,-930,-640,-639,746,-641,-642,-638,-664,-663,-940,-662,-654,-661,-939,]),'SUB_FUNCTION':([481,950,],[626,1043,]),'CURVE_AXIS':([1350,],[1403,]),'block':([79,131,268,273,424,427,587,597,598,714,717,734,735,897,1088,1089,],[121,121,-9,-10,121,121,121,121,121,-66,-68,-56,-54,-67,-57,-55,]),'COMPU_TAB_REF':([739,905,908,913,914,915,916,936,1020,1090,1293,1361,],[912,-640,-639,912,-641,-642,-638,-664,-663,-662,-654,-661,]),'end':([19,20,21,22,23,24,25,28,33,34,35,36,37,38,40,41,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,68,69,70,71,78,91,92,93,94,97,98,100,101,102,103,104,105,106,108,111,131,134,142,143,146,149,150,152,153,154,155,156,157,158,161,164,165,167,168,169,170,171,172,175,177,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,232,236,239,240,241,245,246,247,248,249,250,251,252,255,256,257,268,273,274,279,280,283,285,287,290,291,292,294,295,296,297,298,299,300,303,305,307,308,309,315,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,335,336,337,338,340,341,342,343,344,345,347,350,352,353,354,355,356,357,358,359,360,361,362,363,364,367,369,374,391,401,402,403,404,405,406,407,408,409,410,411,412,415,416,417,419,420,423,437,438,440,442,443,444,445,446,447,448,449,450,454,455,456,457,458,459,460,461,462,464,468,469,470,471,472,473,474,475,476,477,479,480,493,494,500,504,506,507,515,516,517,518,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,551,552,553,556,557,558,559,560,561,563,564,565,566,567,568,569,570,571,572,573,574,575,577,578,579,580,607,608,616,617,618,620,621,623,624,625,626,627,628,630,631,632,633,634,637,638,639,640,645,647,652,667,669,671,672,673,674,675,676,677,679,681,682,683,684,685,686,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,704,705,706,707,708,709,710,712,713,739,742,744,747,748,749,750,751,753,755,756,757,758,760,761,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,790,791,792,793,794,795,796,797,798,800,801,802,803,804,805,806,807,808,809,810,812,813,814,818,823,824,825,826,828,829,831,832,834,835,836,837,840,844,851,852,853,854,856,857,858,859,861,862,863,864,865,867,868,869,871,872,874,875,876,877,880,882,884,886,889,891,893,894,895,896,905,906,908,909,910,913,914,915,916,928,929,930,931,932,936,938,942,943,946,948,949,951,953,956,958,959,960,963,964,965,967,969,970,971,972,973,974,976,977,978,979,980,981,982,987,988,989,990,991,993,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1020,1021,1023,1031,1033,1036,1037,1039,1040,1041,1042,1043,1044,1045,1047,1048,1049,1050,1051,1052,1054,1055,1056,1057,1058,1059,1060,1061,1062,1065,1066,1069,1071,1072,1073,1075,1076,1078,1081,1082,1085,1090,1091,1093,1094,1095,1096,1097,1098,1103,1104,1105,1106,1107,1108,1109,1112,1113,1114,1115,1118,1119,1123,1125,1126,1128,1129,1130,1131,1132,1133,1135,1136,1137,1138,1139,1141,1143,1144,1145,1146,1147,1148,1149,1151,1153,1154,1155,1156,1158,1162,1163,1164,1166,1167,1168,1170,1171,1172,1173,1177,1178,1179,1180,1184,1186,1187,1188,1189,1190,1191,1192,1193,1195,1198,1200,1201,1202,1203,1204,1205,1207,1208,1209,1210,1211,1212,1214,1217,1218,1219,1221,1224,1226,1227,1228,1230,1232,1234,1235,1238,1240,1241,1242,1243,1244,1246,1247,1249,1251,1252,1253,1254,1255,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1278,1282,1284,1286,1287,1288,1289,1291,1293,1294,1295,1299,1301,1302,1303,1304,1306,1307,1308,1309,1310,1311,1312,1313,1315,1316,1319,1320,1321,1322,1323,1324,1325,1326,1327,1328,1329,1330,1331,1332,1333,1334,1335,1336,1338,1339,1340,1341,1342,1344,1345,1346,1353,1356,1357,1358,1359,1361,1362,1363,1364,1365,1366,1368,1369,1370,1371,1372,1373,1375,1376,1378,1379,1380,1381,1385,1387,1391,1392,1393,1395,1396,1398,1405,1410,1412,1414,1416,1417,1418,1419,1420,1421,1422,1423,1424,1426,1427,1428,1431,1432,1433,1436,1437,1438,1439,1440,1441,1442,1443,1444,1445,1447,1451,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1466,1467,1468,1470,1471,1472,1473,1474,1475,1477,1478,1479,1480,1481,1482,1485,1487,1488,1489,1490,1491,1492,1494,1496,1500,1504,1505,1508,1510,1511,1513,1515,1517,1518,1519,1520,1522,1523,1524,1525,1526,1527,1530,1532,1534,1535,1537,1539,1540,1541,1542,1543,1546,1547,1548,1550,1551,1552,1554,1555,1557,1558,1559,1561,1562,1564,1566,1567,1568,1569,1570,1571,1572,1573,1574,1576,1580,1581,1582,1583,1584,1585,1586,1587,1589,1590,1591,1592,1595,1597,1600,1601,1603,1605,1607,1609,],[-941,-115,-111,-116,27,-113,-112,-114,-941,-941,-122,-119,-123,67,-120,-118,-137,-138,-133,-128,-139,-129,-146,-135,-142,-143,-132,-130,-145,-144,-136,-134,-148,72,-127,-141,-149,-131,-140,-125,-121,-124,-147,-941,-117,-126,-941,-941,-941,254,-869,-868,-875,-872,-870,-874,-871,-867,261,-11,-941,-941,-941,351,-364,-357,-367,-363,-365,-359,-361,-362,-356,-358,-360,-368,-802,-800,-790,-788,-780,-798,-795,368,-816,-814,-804,-791,-806,-811,-785,-819,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-821,-784,-808,-787,-822,-941,414,-919,-916,-917,-920,-915,-927,-876,-873,-877,-9,-10,-12,-334,-333,-338,441,-343,-342,-331,-329,-337,-332,-340,-347,-335,-328,-346,-330,-336,-341,-339,-344,-941,492,-156,-154,-152,-98,-159,-208,-155,-157,-210,-153,-211,-96,-158,-97,-100,-299,-305,-300,-301,-306,-309,505,-308,-310,-303,-302,-862,-370,-864,-865,-366,-863,-861,-464,-463,-465,-369,-582,-580,-581,-842,-844,-820,-843,-941,-756,-762,-757,-759,-760,-766,562,-765,-764,-758,-761,-918,-941,-866,576,-885,-150,-372,-354,-350,-349,-351,-348,-373,-374,-353,-371,-352,-345,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-705,-710,-713,-706,-711,-715,-712,-709,622,-716,-707,-708,-209,-101,-941,-307,-304,-319,-355,-846,-837,-779,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-696,668,-698,-700,-701,-695,-694,-699,-763,-941,-941,-941,-941,-941,-914,-723,-922,-925,-926,703,-923,-887,-886,-888,-106,-941,-430,-327,-941,-937,-938,-941,-714,-754,-941,-941,-941,-941,-941,-941,-151,-941,-941,-941,817,-102,-103,-941,-298,846,-941,-697,-679,-702,-755,-774,-777,873,-778,-775,-488,-489,-485,-483,-484,-486,878,-468,-471,-472,-469,881,-769,-771,883,-768,-772,-729,-728,-725,-726,885,-924,-884,-889,-107,-880,-881,-882,888,-941,-941,-941,-935,-931,-932,937,-933,-936,-930,941,-904,-900,-901,-905,-902,-704,-718,-721,-722,945,-719,-741,-737,-740,947,-738,-749,-752,-750,-753,950,-735,-732,-734,-731,952,-743,-746,-744,-747,954,-676,-674,-675,-104,-669,957,-672,-671,-670,-225,-221,-222,-223,-227,-226,961,-199,962,-200,-195,-196,-197,966,-164,-162,-168,-166,975,-163,-161,-165,-173,-167,-169,-170,-171,-174,986,-690,-688,-686,994,-683,-682,-687,-684,-90,-89,-88,-832,-91,-823,-831,-830,-693,-703,-776,-491,-490,-487,-470,-770,-727,-921,-894,-892,1012,-895,-891,-890,-640,-646,-639,1018,-645,-643,-641,-642,-638,-379,-380,-377,1032,-376,-664,-934,-913,-903,-720,-739,-751,-733,-745,-105,-673,-680,-224,-941,-941,-198,-941,-99,-175,-178,-181,-180,-177,-182,-179,-183,-172,-176,-184,-185,-317,-315,1070,-941,1079,-691,-692,-685,-835,-833,-834,-773,-482,-108,1083,-467,-767,-724,1084,-879,-896,-893,-897,-663,-644,-941,-378,-941,-929,-940,-899,-941,-717,-736,-748,-730,-742,-668,-212,-193,-207,-204,-206,1120,1121,-194,1122,-214,-216,-215,-218,-219,-160,-941,-316,1142,-324,-325,-321,-320,-322,-681,-109,-878,-662,-637,-941,-391,-394,1157,-395,-392,-375,1161,-385,-382,-383,-386,-941,-911,-908,1199,-910,-205,-203,-217,-941,-191,1215,-189,-188,-190,-187,-246,-249,-248,-247,-244,-245,-313,-461,-326,-323,-314,1222,-492,-883,-659,-658,1225,-655,-656,-393,-384,-599,-589,-595,-593,-591,1233,-590,-584,-600,-597,-588,-606,-598,-604,-592,-587,-585,-602,-594,-586,-605,-596,-601,-909,-912,-907,-941,-201,-202,-213,-445,-444,1281,-442,-441,-440,-192,-250,-251,-252,-311,-660,-657,-387,-941,-381,-466,-534,-941,-667,-481,-625,-462,-603,-666,-941,-906,-541,-551,-556,-539,-550,-545,-542,-537,-535,-554,1347,-549,-560,-538,-547,-928,-543,-552,-553,-558,-546,-559,-536,-540,-548,-544,-555,-443,-186,-256,-255,-254,-253,-312,-654,-399,-401,1367,-402,-941,-476,-583,-632,-627,-630,-628,-636,1377,-629,-633,-941,1390,-571,-570,-572,-578,-565,-575,-567,-569,-579,-573,-577,1394,-563,-564,-562,-566,-568,-574,-529,-528,-530,-532,-531,-557,-493,-473,-439,-260,-259,-258,-257,-661,-400,-405,-397,-398,-406,1411,-412,-409,-408,-410,-413,-634,-631,-635,-611,1415,-615,-613,-616,-533,-939,-576,-474,-454,1429,-941,-396,-411,-626,-609,-619,-622,-621,-623,-608,-620,-614,-610,-665,-561,1446,-479,-480,1449,-941,-261,-263,-262,-941,-407,-941,-607,-624,1484,-475,-941,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1495,-264,-266,-267,-233,-243,-296,-294,-293,-297,1501,-433,1503,-434,-432,-437,-438,-435,-477,-478,1507,-451,-448,1509,-450,-447,-265,-295,-436,-612,-449,-452,-228,-941,-292,-431,-941,-220,-446,-284,-270,-272,-273,-274,1565,-288,-285,-287,-271,-275,-453,-497,-502,-500,-499,-506,-505,1578,-504,-498,-510,-495,-496,-507,-501,-503,-511,-508,-941,-281,-282,-280,-286,-277,-279,-276,-278,-283,-522,-517,-516,-515,-514,-518,-513,-512,-509,1598,-290,-291,-269,-494,1602,-519,-520,-289,-521,1608,-268,]),'CODE':([741,],[922,]),'PAGE':([1213,1509,],[1283,1520,]),'PLONG':([654,655,656,658,659,660,661,662,663,664,665,860,866,870,],[861,-92,-93,861,-826,-828,-827,-824,-825,861,861,861,861,861,]),'MOD_PAR':([66,441,],[81,608,]),'CALIBRATION':([1248,],[1338,]),'FIX_NO_AXIS_PTS_Z':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[183,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,183,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'IDENTIFICATION_FIELD_TYPE_ABSOLUTE':([1133,1135,1136,1137,1138,1139,1216,1217,1218,1219,1286,1287,1288,1289,1356,1357,1358,1359,1436,1437,1438,1439,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1467,1468,1592,1603,1609,],[-246,-249,-248,-247,-244,-245,1289,-250,-251,-252,-256,-255,-254,-253,-260,-259,-258,-257,1289,-261,-263,-262,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1289,-233,-243,-269,-289,-268,]),'S_REC_LAYOUT':([93,149,150,153,154,155,156,157,158,161,164,350,352,353,354,356,357,358,359,360,361,362,363,364,],[163,-364,-357,-363,163,-359,-361,-362,-356,-358,-360,-862,-370,-864,-865,-863,-861,-464,-463,-465,-369,-582,-580,-581,]),'NO_AXIS_PTS_X':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[198,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,198,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'CALIBRATION_VARIABLES':([741,],[919,]),'CAN_ID_SLAVE':([640,818,823,824,825,828,829,831,834,835,836,837,970,971,972,973,974,976,977,978,980,981,982,1284,],[822,-164,-162,-168,-166,-163,-161,-165,-167,-169,-170,822,-175,-178,-181,-180,-177,-182,-179,-183,-176,-184,-185,-186,]),'$end':([0,1,2,3,4,5,7,8,10,12,16,17,31,],[-941,-7,-5,-4,-8,-1,-2,0,-3,-6,-94,-95,-110,]),'FUNCTION_LIST':([413,881,1175,1279,1337,],[565,1004,565,565,565,]),'VAR_SEPARATOR':([78,100,101,103,104,106,108,255,257,705,1008,1085,],[99,-869,-868,99,-870,-871,-867,-876,-877,-884,-879,-878,]),'UBYTE':([311,365,366,370,371,372,373,375,376,377,378,380,381,382,383,384,385,386,387,388,389,390,392,393,394,395,396,397,398,399,400,],[458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,]),'DATA_SIZE':([93,149,150,153,154,155,156,157,158,161,164,350,352,353,354,356,357,358,359,360,361,362,363,364,],[147,-364,-357,-363,147,-359,-361,-362,-356,-358,-360,-862,-370,-864,-865,-863,-861,-464,-463,-465,-369,-582,-580,-581,]),'SLONG':([311,365,366,370,371,372,373,375,376,377,378,380,381,382,383,384,385,386,387,388,389,390,392,393,394,395,396,397,398,399,400,],[455,455,455,455,455,455,455,455,455,455,455,455,455,455,455,455,455,455,455,455,455,455,455,455,455,455,455,455,455,455,455,]),'PA_BLOB':([322,330,332,333,494,969,1315,1363,1366,1379,1385,1416,1417,1418,1419,1420,1421,1422,1424,1444,1505,],[-98,-96,-97,-100,-101,-99,1383,-405,-406,-611,1383,-609,-619,-622,-621,-623,-608,-620,-610,-624,-612,]),'ULONG':([311,365,366,370,371,372,373,375,376,377,378,380,381,382,383,384,385,386,387,388,389,390,392,393,394,395,396,397,398,399,400,],[457,457,457,457,457,457,457,457,457,457,457,457,457,457,457,457,457,457,457,457,457,457,457,457,457,457,457,457,457,457,457,]),'FORM':([277,],[432,]),'ANNOTATION_TEXT':([687,1083,],[879,1148,]),'FRAME_MEASUREMENT':([579,620,707,757,758,761,942,1247,],[-106,759,-107,-900,-901,759,-913,-906,]),'AXIS_RESCALE_X':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[213,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,213,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'SRC_ADDR_Y':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[173,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,173,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'VIRTUAL_CHARACTERISTIC':([1279,1449,],[1351,1487,]),'PGM':([334,1122,],[498,1205,]),'ASCII':([316,],[487,]),'INDEX_INCR':([454,455,456,457,458,459,460,461,462,464,535,540,542,653,657,666,],[-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,655,655,655,655,655,655,]),'CHARACTERISTIC':([66,1347,],[87,1396,]),'SWORD':([311,365,366,370,371,372,373,375,376,377,378,380,381,382,383,384,385,386,387,388,389,390,392,393,394,395,396,397,398,399,400,],[459,459,459,459,459,459,459,459,459,459,459,459,459,459,459,459,459,459,459,459,459,459,459,459,459,459,459,459,459,459,459,]),'ROOT':([245,402,403,404,405,406,407,411,412,1000,1001,1004,1005,1006,],[407,-756,407,-757,-759,-760,-766,-758,-761,-773,-482,-467,-767,-724,]),'ROM':([919,920,921,922,923,924,925,926,927,],[-420,1030,-417,-414,-415,-421,-418,-419,-416,]),'MAX_ODT':([322,330,332,333,494,969,1513,1522,1523,1524,1525,1526,1532,1535,1537,1566,1567,1568,1570,1571,1572,1573,1574,],[-98,-96,-97,-100,-101,-99,1531,-284,-270,-272,-273,-274,1531,-271,-275,-281,-282,-280,-277,-279,-276,-278,-283,]),'EEPROM':([919,920,921,922,923,924,925,926,927,],[-420,1029,-417,-414,-415,-421,-418,-419,-416,]),'FORMAT':([252,358,359,360,362,363,364,631,1001,1004,1109,1143,1163,1164,1166,1167,1168,1171,1172,1173,1177,1178,1179,1180,1186,1187,1188,1189,1190,1191,1193,1195,1202,1232,1234,1238,1240,1241,1242,1244,1246,1249,1251,1252,1253,1254,1255,1258,1259,1260,1261,1263,1264,1265,1266,1267,1268,1269,1270,1272,1274,1275,1276,1277,1278,1303,1319,1320,1321,1323,1324,1325,1326,1327,1328,1331,1332,1333,1334,1335,1336,1338,1339,1340,1341,1342,1345,1346,1391,1395,1410,1414,1426,1443,1447,1485,1487,1518,1540,1541,1542,1543,1546,1547,1550,1551,1554,1555,1557,1558,1559,1562,1576,1580,1581,1582,1583,1584,1585,1586,1595,1600,1601,1605,],[-927,-464,-463,-465,-582,-580,-581,-151,-482,-467,1185,-461,-599,-589,-595,-593,-591,-590,-584,-600,-597,-588,-606,-598,-592,-587,-585,1185,-594,-586,-596,-601,1185,-466,-534,-667,-481,-625,-462,-666,1185,-541,-551,1185,-539,-550,-545,-542,-537,-535,-554,-549,-560,-538,-547,-928,-543,-552,-553,-546,-536,-540,-548,-544,-555,-476,-571,-570,-572,-565,1185,-567,-569,-579,-573,-563,-564,-562,-566,-568,-574,-529,-528,-530,-532,-531,-493,-473,-533,-474,-396,-626,-665,-607,-475,-477,-478,1185,-497,-502,-500,-499,-506,-505,-504,-498,-495,-496,-507,-501,-503,1185,-522,-517,-516,-515,-514,-518,-513,-512,-494,-519,-520,-521,]),'EQUAL':([602,604,],[-73,737,]),'ECU':([70,134,279,280,283,287,290,291,292,294,295,296,298,299,303,305,307,308,309,437,438,440,442,443,444,445,446,447,448,449,607,1103,1227,1441,],[-124,304,-334,-333,-338,-343,-342,-331,-329,-337,-332,-340,-335,-328,-330,-336,-341,-339,304,-372,-354,-350,-349,-351,-348,-373,-374,-353,-371,-352,-430,-375,-387,-407,]),'SHIFT_OP_Z':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[206,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,206,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'VAR_SELECTION_CHARACTERISTIC':([579,707,713,891,895,896,1009,1011,],[-106,-107,892,892,-891,-890,-896,-897,]),'INTERN':([1024,1025,1026,1027,1028,1029,1030,],[-424,-427,-426,-422,1100,-423,-425,]),'MONOTONY':([252,358,359,360,362,363,364,1001,1242,1395,1518,1540,1541,1542,1543,1546,1547,1550,1551,1554,1555,1557,1558,1559,1562,1576,1580,1581,1582,1583,1584,1585,1586,1600,1601,1605,],[-927,-464,-463,-465,-582,-580,-581,-482,-462,-474,1553,-497,-502,-500,-499,-506,-505,-504,-498,-495,-496,-507,-501,-503,1553,-522,-517,-516,-515,-514,-518,-513,-512,-519,-520,-521,]),'A_INT64':([311,365,366,370,371,372,373,375,376,377,378,380,381,382,383,384,385,386,387,388,389,390,392,393,394,395,396,397,398,399,400,],[461,461,461,461,461,461,461,461,461,461,461,461,461,461,461,461,461,461,461,461,461,461,461,461,461,461,461,461,461,461,461,]),'RIP_ADDR_X':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[207,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,207,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'ASAP2_VERSION':([0,2,3,7,10,16,17,31,],[6,6,-4,-2,-3,-94,-95,-110,]),'PROJECT_NO':([33,36,40,41,68,70,],[39,-119,39,-118,-125,-124,]),'SIGN_EXTEND':([1235,1307,1308,1309,1310,1312,1375,1378,],[1310,-627,1310,-628,-636,-629,-634,-635,]),'OFFSET_Y':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[208,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,208,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'VIRTUAL':([1175,1390,],[1237,1426,]),'LOC_MEASUREMENT':([481,954,],[628,1045,]),'RAM':([919,920,921,922,923,924,925,926,927,],[-420,1027,-417,-414,-415,-421,-418,-419,-416,]),'CURVE':([316,],[483,]),'DYNAMIC':([502,],[641,]),'ANNOTATION_ORIGIN':([564,682,683,684,685,875,876,1148,],[678,-485,-483,-484,678,-491,-490,-492,]),'STIM':([1533,1575,],[1570,1570,]),'AXIS_PTS_Z':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[211,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,211,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'NUMERIC':([6,9,13,14,142,143,145,147,148,151,159,160,173,174,176,183,184,185,187,188,191,196,197,198,201,202,206,207,208,211,213,217,220,221,223,224,226,228,229,233,234,235,237,238,242,243,244,289,293,301,313,314,319,320,321,322,323,324,325,326,328,330,331,332,333,335,336,337,338,339,340,344,345,346,347,401,454,455,456,457,458,459,460,461,462,464,467,482,483,484,485,486,487,488,489,490,491,494,496,499,500,501,503,506,507,513,514,519,536,549,551,555,556,557,558,559,609,610,611,612,614,615,630,632,635,636,641,642,643,644,649,652,669,671,720,737,740,743,745,752,754,789,790,793,794,796,797,798,799,801,802,803,804,815,816,819,820,822,827,830,833,838,842,843,845,847,848,850,851,852,856,857,859,872,887,907,911,918,934,935,939,956,959,967,968,969,983,984,985,988,992,993,995,1017,1019,1033,1034,1035,1038,1046,1048,1049,1053,1056,1058,1059,1060,1064,1065,1068,1069,1080,1092,1100,1101,1102,1106,1107,1110,1111,1116,1117,1127,1133,1135,1136,1137,1138,1139,1140,1141,1146,1150,1160,1165,1169,1174,1176,1181,1183,1194,1196,1197,1205,1206,1217,1218,1219,1220,1221,1223,1229,1231,1239,1245,1250,1257,1280,1283,1286,1287,1288,1289,1290,1291,1292,1296,1297,1298,1300,1305,1314,1317,1318,1343,1352,1353,1355,1356,1357,1358,1359,1360,1382,1383,1384,1386,1388,1406,1409,1418,1419,1420,1422,1425,1434,1436,1437,1438,1439,1440,1442,1448,1450,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1467,1468,1471,1472,1475,1476,1478,1479,1482,1486,1493,1497,1498,1502,1506,1511,1513,1515,1516,1519,1522,1523,1524,1525,1526,1528,1529,1531,1532,1535,1536,1537,1538,1539,1545,1549,1556,1566,1567,1568,1570,1571,1572,1573,1574,1577,1579,1588,1592,1593,1594,1596,1599,1603,1604,1606,1609,],[13,14,16,17,322,322,350,352,353,354,356,357,365,366,367,369,370,371,372,373,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,444,445,446,466,467,-156,-154,-152,-98,-159,322,-155,-157,-153,-96,-158,-97,322,-299,-305,-300,-301,-318,322,-310,-303,322,-302,555,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,620,-455,-456,-458,-459,629,-460,-457,-678,630,-677,-101,632,636,322,640,644,-304,-319,-689,652,653,657,666,555,670,-700,555,-695,-694,-389,-388,740,-390,742,743,793,322,815,816,-230,842,-229,843,848,855,-679,-702,899,899,918,934,935,939,940,955,-676,793,-669,793,-671,-670,959,-221,-222,322,-227,967,968,970,971,974,976,977,978,980,984,985,987,793,990,992,855,-688,-683,-682,855,-703,793,1017,1019,793,1034,1035,1037,-105,-680,322,1064,-99,1066,1067,1068,-315,1080,-691,-692,1090,1092,1106,1109,1110,1111,1117,-212,-193,1119,-194,-214,322,-215,1125,-160,1140,-316,1147,1150,-428,1160,-429,-382,1106,1196,1197,322,1202,1214,-246,-249,-248,-247,-244,-245,1220,-313,-314,1223,1229,1231,1232,1234,1238,1239,1241,1244,1245,1246,-213,1280,-250,-251,-252,1290,-311,1292,793,1303,1317,1318,1343,1346,1352,1354,-256,-255,-254,-253,1360,-312,1361,322,-403,322,-404,1375,1378,1391,1392,1395,1406,-439,1408,-260,-259,-258,-257,1409,322,-618,1422,-617,322,1434,1440,-622,-621,1422,-620,322,1450,1455,-261,-263,-262,322,322,1486,1488,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1455,-233,-243,322,-293,-433,1502,-434,-432,322,1506,1510,1512,1513,1516,1518,-228,322,-292,1539,-220,-284,-270,-272,-273,-274,1566,1567,1568,322,-271,1574,-275,1575,-453,1577,1579,1585,-281,-282,-280,-277,-279,-276,-278,-283,1594,1596,793,-269,1599,1600,1601,1604,-289,1606,1607,-268,]),'ALTERNATE_CURVES':([454,455,456,457,458,459,460,461,462,464,539,],[-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,660,]),'ECU_ADDRESS':([358,359,360,631,1001,1004,1109,1143,1163,1164,1166,1167,1168,1171,1172,1173,1177,1178,1179,1180,1186,1187,1188,1189,1190,1191,1193,1195,1232,1234,1238,1240,1241,1242,1244,1303,1391,1414,1426,1443,],[-464,-463,-465,-151,-482,-467,1194,-461,-599,-589,-595,-593,-591,-590,-584,-600,-597,-588,-606,-598,-592,-587,-585,1194,-594,-586,-596,-601,-466,-534,-667,-481,-625,-462,-666,-476,-533,-626,-665,-607,]),'BAUDRATE':([640,818,823,824,825,828,829,831,834,835,836,837,970,971,972,973,974,976,977,978,980,981,982,1284,],[820,-164,-162,-168,-166,-163,-161,-165,-167,-169,-170,820,-175,-178,-181,-180,-177,-182,-179,-183,-176,-184,-185,-186,]),'MODULE':([26,72,],[29,92,]),'DERIVED':([465,],[618,]),'SI_EXPONENTS':([616,617,618,747,748,750,753,936,1037,1392,],[745,-937,-938,-931,-932,745,-930,-664,-940,-939,]),'DATA':([741,],[923,]),'PRG_CODE':([451,],[610,]),'REF_MEASUREMENT':([413,883,],[566,1005,]),'IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD':([1133,1135,1136,1137,1138,1139,1216,1217,1218,1219,1286,1287,1288,1289,1356,1357,1358,1359,1436,1437,1438,1439,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1467,1468,1592,1603,1609,],[-246,-249,-248,-247,-244,-245,1287,-250,-251,-252,-256,-255,-254,-253,-260,-259,-258,-257,1287,-261,-263,-262,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1287,-233,-243,-269,-289,-268,]),'RIP_ADDR_Z':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[217,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,217,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'FORMULA_INV':([1093,1155,1156,1224,],[1152,-655,1152,-660,]),'NOT_IN_MCD_SYSTEM':([1248,],[1342,]),'CURLY_CLOSE':([424,425,427,583,584,585,587,589,590,591,593,595,596,597,599,602,603,604,605,714,717,718,724,725,731,734,735,897,899,903,904,1088,1089,],[-941,-941,-941,-65,-64,716,-62,-37,723,-36,-38,-50,730,-52,-51,-73,-30,-33,738,-66,-68,-63,-40,-39,-53,-56,-54,-67,-74,-31,-32,-57,-55,]),'COMPARISON_QUANTITY':([252,358,359,360,1001,1004,1143,1202,1232,1234,1240,1242,1249,1251,1252,1253,1254,1255,1258,1259,1260,1261,1263,1264,1265,1266,1267,1268,1269,1270,1272,1274,1275,1276,1277,1278,1303,1338,1339,1340,1341,1342,1345,1346,1391,1395,1410,1447,1485,1487,1595,],[-927,-464,-463,-465,-482,-467,-461,1256,-466,-534,-481,-462,-541,-551,1256,-539,-550,-545,-542,-537,-535,-554,-549,-560,-538,-547,-928,-543,-552,-553,-546,-536,-540,-548,-544,-555,-476,-529,-528,-530,-532,-531,-493,-473,-533,-474,-396,-475,-477,-478,-494,]),'NUMBER':([252,358,359,360,1001,1004,1143,1202,1232,1234,1240,1242,1249,1251,1252,1253,1254,1255,1258,1259,1260,1261,1263,1264,1265,1266,1267,1268,1269,1270,1272,1274,1275,1276,1277,1278,1303,1338,1339,1340,1341,1342,1345,1346,1391,1395,1410,1447,1485,1487,1595,],[-927,-464,-463,-465,-482,-467,-461,1257,-466,-534,-481,-462,-541,-551,1257,-539,-550,-545,-542,-537,-535,-554,-549,-560,-538,-547,-928,-543,-552,-553,-546,-536,-540,-548,-544,-555,-476,-529,-528,-530,-532,-531,-493,-473,-533,-474,-396,-475,-477,-478,-494,]),'SUB_GROUP':([413,873,],[563,1000,]),'CURLY_OPEN':([115,119,123,132,262,263,264,265,266,267,271,272,275,276,],[-941,-941,-941,-941,-70,-72,-71,424,-72,425,-72,427,-72,428,]),'SUPPLIER':([70,134,279,280,283,287,290,291,292,294,295,296,298,299,303,305,307,308,309,437,438,440,442,443,444,445,446,447,448,449,607,1103,1227,1441,],[-124,284,-334,-333,-338,-343,-342,-331,-329,-337,-332,-340,-335,-328,-330,-336,-341,-339,284,-372,-354,-350,-349,-351,-348,-373,-374,-353,-371,-352,-430,-375,-387,-407,]),'PRG_RESERVED':([451,],[612,]),'PARENTHESE_OPEN':([270,427,594,597,734,735,1088,1089,],[-69,598,726,598,-56,-54,-57,-55,]),'EPK':([70,134,279,280,283,287,290,291,292,294,295,296,298,299,303,305,307,308,309,437,438,440,442,443,444,445,446,447,448,449,607,1103,1227,1441,],[-124,286,-334,-333,-338,-343,-342,-331,-329,-337,-332,-340,-335,-328,-330,-336,-341,-339,286,-372,-354,-350,-349,-351,-348,-373,-374,-353,-371,-352,-430,-375,-387,-407,]),'STATIC':([502,],[643,]),'TAB_NOINTP':([277,317,],[429,489,]),'DIST_OP_Z':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[191,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,191,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'DEFAULT_EVENT_LIST':([811,1120,],[963,1203,]),'SOURCE':([348,1142,],[510,1221,]),'ECU_ADDRESS_EXTENSION':([252,358,359,360,362,363,364,631,1001,1004,1109,1143,1163,1164,1166,1167,1168,1171,1172,1173,1177,1178,1179,1180,1186,1187,1188,1189,1190,1191,1193,1195,1202,1232,1234,1238,1240,1241,1242,1244,1246,1249,1251,1252,1253,1254,1255,1258,1259,1260,1261,1263,1264,1265,1266,1267,1268,1269,1270,1272,1274,1275,1276,1277,1278,1303,1319,1320,1321,1323,1324,1325,1326,1327,1328,1331,1332,1333,1334,1335,1336,1338,1339,1340,1341,1342,1345,1346,1391,1395,1410,1414,1426,1443,1447,1485,1487,1595,],[-927,-464,-463,-465,-582,-580,-581,-151,-482,-467,1174,-461,-599,-589,-595,-593,-591,-590,-584,-600,-597,-588,-606,-598,-592,-587,-585,1174,-594,-586,-596,-601,1174,-466,-534,-667,-481,-625,-462,-666,1174,-541,-551,1174,-539,-550,-545,-542,-537,-535,-554,-549,-560,-538,-547,-928,-543,-552,-553,-546,-536,-540,-548,-544,-555,-476,-571,-570,-572,-565,1174,-567,-569,-579,-573,-563,-564,-562,-566,-568,-574,-529,-528,-530,-532,-531,-493,-473,-533,-474,-396,-626,-665,-607,-475,-477,-478,-494,]),'BYTE_ORDER':([93,149,150,153,154,155,156,157,158,161,164,252,350,352,353,354,356,357,358,359,360,361,362,363,364,631,1001,1004,1109,1143,1163,1164,1166,1167,1168,1171,1172,1173,1177,1178,1179,1180,1186,1187,1188,1189,1190,1191,1193,1195,1202,1232,1234,1238,1240,1241,1242,1244,1246,1249,1251,1252,1253,1254,1255,1258,1259,1260,1261,1263,1264,1265,1266,1267,1268,1269,1270,1272,1274,1275,1276,1277,1278,1303,1319,1320,1321,1323,1324,1325,1326,1327,1328,1331,1332,1333,1334,1335,1336,1338,1339,1340,1341,1342,1345,1346,1391,1395,1410,1414,1426,1443,1447,1485,1487,1518,1540,1541,1542,1543,1546,1547,1550,1551,1554,1555,1557,1558,1559,1562,1576,1580,1581,1582,1583,1584,1585,1586,1595,1600,1601,1605,],[162,-364,-357,-363,162,-359,-361,-362,-356,-358,-360,-927,-862,-370,-864,-865,-863,-861,-464,-463,-465,-369,-582,-580,-581,-151,-482,-467,162,-461,-599,-589,-595,-593,-591,-590,-584,-600,-597,-588,-606,-598,-592,-587,-585,162,-594,-586,-596,-601,162,-466,-534,-667,-481,-625,-462,-666,162,-541,-551,162,-539,-550,-545,-542,-537,-535,-554,-549,-560,-538,-547,-928,-543,-552,-553,-546,-536,-540,-548,-544,-555,-476,-571,-570,-572,-565,162,-567,-569,-579,-573,-563,-564,-562,-566,-568,-574,-529,-528,-530,-532,-531,-493,-473,-533,-474,-396,-626,-665,-607,-475,-477,-478,162,-497,-502,-500,-499,-506,-505,-504,-498,-495,-496,-507,-501,-503,162,-522,-517,-516,-515,-514,-518,-513,-512,-494,-519,-520,-521,]),'FUNCTION_VERSION':([315,468,469,470,471,472,474,475,479,480,623,1001,1006,1041,1042,1043,1044,1045,],[478,-705,-710,478,-706,-711,-712,-709,-707,-708,-754,-482,-724,-717,-736,-748,-730,-742,]),'MEASUREMENT':([66,1233,],[82,1304,]),'ulong':([79,131,268,269,270,273,425,582,593,594,724,726,],[128,128,-9,128,-69,-10,128,128,128,128,-40,128,]),'double':([79,131,268,269,270,273,425,582,593,594,724,726,],[129,129,-9,129,-69,-10,129,129,129,129,-40,129,]),'VAR_CHARACTERISTIC':([109,888,],[259,1008,]),'struct':([79,131,268,269,270,273,425,582,593,594,724,726,],[119,119,-9,119,-69,-10,119,119,119,119,-40,119,]),'SEMICOLON':([110,112,113,114,116,117,118,120,122,124,125,126,127,128,129,130,262,263,266,270,271,275,426,582,586,588,592,594,600,601,715,716,719,721,722,723,727,728,729,730,738,1013,1015,1016,1086,1087,],[-20,-13,-26,-22,-21,-17,-19,268,-23,-16,-15,273,-14,-24,-25,-18,-70,-61,-35,-69,-49,-29,-27,714,717,-941,724,-941,734,735,897,-60,-44,-45,-41,-34,-58,-42,-43,-48,-28,-46,1088,1089,-47,-59,]),'SINGLE':([821,839,],[973,981,]),'ALIGNMENT_FLOAT64_IEEE':([93,94,149,150,153,154,155,156,157,158,161,164,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,352,353,354,356,357,358,359,360,361,362,363,364,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[151,151,-364,-357,-363,151,-359,-361,-362,-356,-358,-360,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,151,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-370,-864,-865,-863,-861,-464,-463,-465,-369,-582,-580,-581,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'ADDRESS_EXTENSION_DAQ':([1133,1134,1135,1136,1137,1138,1139,1217,1218,1219,1286,1287,1288,1289,1356,1357,1358,1359,1436,1437,1438,1439,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1467,1468,1592,1603,1609,],[-246,1219,-249,-248,-247,-244,-245,-250,-251,-252,-256,-255,-254,-253,-260,-259,-258,-257,1219,-261,-263,-262,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1219,-233,-243,-269,-289,-268,]),'MSB_LAST':([162,],[360,]),'PARENTHESE_CLOSE':([110,113,114,116,117,118,122,124,125,127,128,129,130,262,263,266,270,271,275,426,588,594,716,719,721,722,723,727,728,729,730,732,733,738,900,1013,1086,1087,],[-20,-26,-22,-21,-17,-19,-23,-16,-15,-14,-24,-25,-18,-70,-61,-35,-69,-49,-29,-27,-941,-941,-60,-44,-45,-41,-34,-58,-42,-43,-48,901,902,-28,1014,-46,-47,-59,]),'COLUMN_DIR':([454,455,456,457,458,459,460,461,462,464,539,],[-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,662,]),'LEFT_SHIFT':([1235,1307,1308,1309,1310,1312,1375,1378,],[1305,-627,1305,-628,-636,-629,-634,-635,]),'VARIABLES':([741,],[921,]),'EVENT':([963,964,1051,1119,1469,1608,],[1053,1053,1053,-203,1499,1609,]),'XCP':([89,1236,1413,],[142,142,142,]),'VARIANT_CODING':([66,254,],[78,417,]),'CALIBRATION_ACCESS':([252,358,359,360,362,363,364,1001,1004,1143,1202,1232,1234,1240,1242,1246,1249,1251,1252,1253,1254,1255,1258,1259,1260,1261,1263,1264,1265,1266,1267,1268,1269,1270,1272,1274,1275,1276,1277,1278,1303,1319,1320,1321,1323,1324,1325,1326,1327,1328,1331,1332,1333,1334,1335,1336,1338,1339,1340,1341,1342,1345,1346,1391,1395,1410,1447,1485,1487,1595,],[-927,-464,-463,-465,-582,-580,-581,-482,-467,-461,1248,-466,-534,-481,-462,1248,-541,-551,1248,-539,-550,-545,-542,-537,-535,-554,-549,-560,-538,-547,-928,-543,-552,-553,-546,-536,-540,-548,-544,-555,-476,-571,-570,-572,-565,1248,-567,-569,-579,-573,-563,-564,-562,-566,-568,-574,-529,-528,-530,-532,-531,-493,-473,-533,-474,-396,-475,-477,-478,-494,]),'AXIS_PTS_X':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[228,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,228,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'FIX_AXIS_PAR_DIST':([252,358,359,360,362,363,364,1001,1242,1395,1518,1540,1541,1542,1543,1546,1547,1550,1551,1554,1555,1557,1558,1559,1562,1576,1580,1581,1582,1583,1584,1585,1586,1600,1601,1605,],[-927,-464,-463,-465,-582,-580,-581,-482,-462,-474,1549,-497,-502,-500,-499,-506,-505,-504,-498,-495,-496,-507,-501,-503,1549,-522,-517,-516,-515,-514,-518,-513,-512,-519,-520,-521,]),'ARRAY_SIZE':([358,359,360,631,1001,1004,1109,1143,1163,1164,1166,1167,1168,1171,1172,1173,1177,1178,1179,1180,1186,1187,1188,1189,1190,1191,1193,1195,1232,1234,1238,1240,1241,1242,1244,1303,1391,1414,1426,1443,],[-464,-463,-465,-151,-482,-467,1183,-461,-599,-589,-595,-593,-591,-590,-584,-600,-597,-588,-606,-598,-592,-587,-585,1183,-594,-586,-596,-601,-466,-534,-667,-481,-625,-462,-666,-476,-533,-626,-665,-607,]),'BYTE':([379,],[529,]),'ADDRESS_MAPPING':([322,330,332,969,1353,1442,1475,1478,1479,1482,1539,],[-98,-96,-97,-99,-439,1476,-433,-434,-432,1476,-453,]),'NO_OVERLOAD_INDICATION':([1408,],[1437,]),'OPTIMISATION_TYPE_MAX_ENTRY_SIZE':([1067,1133,1135,1136,1137,1138,1139,1217,1218,1219,1286,1287,1288,1289,1356,1357,1358,1359,1436,1437,1438,1439,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1467,1468,1592,1603,1609,],[1135,-246,-249,-248,-247,-244,-245,-250,-251,-252,-256,-255,-254,-253,-260,-259,-258,-257,1135,-261,-263,-262,-236,-237,-232,-241,-235,-231,-239,-238,-240,-242,-234,1135,-233,-243,-269,-289,-268,]),'DAQ_LIST_CAN_ID':([841,1215,],[983,1284,]),'VALUE':([316,],[482,]),'ECU_CALIBRATION_OFFSET':([70,134,279,280,283,287,290,291,292,294,295,296,298,299,303,305,307,308,309,437,438,440,442,443,444,445,446,447,448,449,607,1103,1227,1441,],[-124,301,-334,-333,-338,-343,-342,-331,-329,-337,-332,-340,-335,-328,-330,-336,-341,-339,301,-372,-354,-350,-349,-351,-348,-373,-374,-353,-371,-352,-430,-375,-387,-407,]),'ANNOTATION':([413,481,878,1175,1279,1337,1563,],[564,564,1001,564,564,564,564,]),'SRC_ADDR_X':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[233,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,233,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'COEFFS':([739,905,908,913,914,915,916,936,1020,1090,1293,1361,],[911,-640,-639,911,-641,-642,-638,-664,-663,-662,-654,-661,]),'DAQ_STIM':([1533,1575,],[1573,1573,]),'UWORD':([311,365,366,370,371,372,373,375,376,377,378,380,381,382,383,384,385,386,387,388,389,390,392,393,394,395,396,397,398,399,400,],[454,454,454,454,454,454,454,454,454,454,454,454,454,454,454,454,454,454,454,454,454,454,454,454,454,454,454,454,454,454,454,]),'taggedunion':([79,131,268,269,270,273,425,582,593,594,724,726,],[115,115,-9,115,-69,-10,115,115,115,115,-40,115,]),'FIX_AXIS':([1350,],[1401,]),'USER_RIGHTS':([66,414,],[77,568,]),'TIMESTAMP_FIXED':([1564,],[1591,]),'OFFSET_Z':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[238,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,238,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'MEMORY_LAYOUT':([310,1157,],[451,1227,]),'DEPENDENT_CHARACTERISTIC':([1279,1446,],[1348,1485,]),'NO_CALIBRATION':([1248,],[1340,]),'TAB_INTP':([277,317,],[436,491,]),'AXIS_RESCALE_Y':([94,167,168,169,170,171,172,175,178,179,180,181,182,186,189,190,192,193,194,195,199,200,203,204,205,209,210,212,214,215,216,218,219,222,225,227,230,231,236,239,240,350,353,354,356,357,367,369,391,454,455,456,457,458,459,460,461,462,464,516,517,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,537,538,541,543,544,545,546,547,548,550,861,862,863,864,865,867,868,869,997,998,999,],[242,-802,-800,-790,-788,-780,-798,-795,-816,-814,-804,-791,-806,-811,-785,242,-810,-793,-805,-799,-797,-786,-809,-807,-782,-789,-783,-803,-812,-801,-817,-815,-794,-792,-781,-818,-796,-813,-784,-808,-787,-862,-864,-865,-863,-861,-842,-844,-843,-77,-80,-76,-79,-75,-78,-83,-82,-81,-84,-846,-837,-839,-847,-840,-860,-829,-852,-836,-86,-898,-85,-87,-858,-854,-848,-856,-850,-849,-853,-838,-845,-855,-859,-851,-857,-841,-90,-89,-88,-832,-91,-823,-831,-830,-835,-833,-834,]),'DAQ_LIST_TYPE':([322,330,332,333,494,969,1513,1522,1523,1524,1525,1526,1532,1535,1537,1566,1567,1568,1570,1571,1572,1573,1574,],[-98,-96,-97,-100,-101,-99,1533,-284,-270,-272,-273,-274,1533,-271,-275,-281,-282,-280,-277,-279,-276,-278,-283,]),'RES_AXIS':([1350,],[1404,]),}
+_lr_action_items = {'$end':([0,1,2,3,4,5,6,7,8,12,16,17,33,],[-941,0,-1,-7,-8,-5,-2,-3,-4,-6,-94,-95,-110,]),'ASAP2_VERSION':([0,4,5,6,7,8,12,16,17,33,],[9,9,-5,-2,-3,-4,-6,-94,-95,-110,]),'A2ML_VERSION':([0,4,5,6,7,8,12,16,17,33,],[10,10,-5,-2,-3,-4,-6,-94,-95,-110,]),'begin':([0,4,5,6,7,8,12,16,17,19,23,24,25,26,30,33,42,45,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,86,91,115,117,118,132,133,134,135,136,137,138,142,144,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,219,220,221,222,223,224,225,226,227,228,229,230,231,232,236,237,238,239,240,241,242,243,244,245,246,254,255,337,338,339,344,345,346,347,348,350,360,361,362,363,364,365,366,367,368,369,370,371,376,377,378,379,380,381,392,397,398,406,407,408,445,446,447,448,449,450,451,452,453,454,459,460,461,462,463,464,465,466,467,509,513,545,546,547,552,556,558,559,560,561,568,585,593,594,599,600,640,641,642,649,678,685,686,687,688,689,696,697,698,699,704,705,706,707,708,709,710,711,712,713,714,715,735,736,763,764,765,766,767,800,816,832,835,843,844,845,846,871,872,873,887,888,889,894,898,899,900,901,902,903,904,905,906,907,908,909,914,923,924,925,926,927,928,929,935,942,945,946,947,989,990,991,995,1003,1004,1014,1018,1019,1020,1021,1029,1030,1032,1044,1050,1053,1054,1055,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1076,1078,1079,1091,1095,1096,1097,1103,1104,1105,1106,1107,1108,1111,1112,1126,1129,1130,1133,1135,1137,1140,1146,1152,1156,1157,1158,1160,1164,1165,1166,1167,1168,1169,1172,1174,1179,1180,1181,1182,1183,1184,1185,1186,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1216,1223,1225,1229,1230,1231,1232,1236,1237,1238,1242,1243,1244,1245,1246,1247,1248,1249,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1267,1269,1271,1276,1277,1278,1279,1281,1282,1283,1285,1290,1296,1297,1298,1299,1300,1303,1304,1305,1306,1309,1315,1316,1318,1319,1320,1321,1322,1323,1327,1328,1329,1330,1331,1332,1333,1334,1335,1336,1337,1338,1339,1340,1341,1342,1354,1355,1356,1358,1364,1366,1370,1371,1372,1373,1387,1388,1390,1399,1400,1402,1403,1404,1406,1407,1408,1410,1413,1414,1415,1416,1417,1418,1427,1428,1429,1430,1432,1433,1434,1435,1436,1437,1438,1439,1440,1441,1442,1445,1446,1447,1449,1450,1451,1452,1453,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1468,1472,1473,1474,1478,1479,1480,1481,1482,1485,1490,1498,1499,1503,1505,1506,1509,1515,1516,1520,1521,1522,1523,1524,1525,1526,1527,1533,1536,1537,1538,1539,1541,1542,1543,1544,1545,1546,1547,1548,1549,1555,1556,1557,1558,1559,1560,1561,1562,1563,1564,1565,1566,1567,1568,1569,1576,1583,1584,1585,1586,1587,1588,1589,1590,1593,1597,1601,1603,1604,1606,1609,],[11,11,-5,-2,-3,-4,-6,-94,-95,20,20,-113,-111,-112,-114,-110,47,-124,47,-146,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-117,129,-147,161,216,233,129,-872,-867,-868,-869,-870,-871,341,-126,161,-344,-328,-329,-330,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,216,-208,-152,-153,-154,-155,-156,-157,-158,399,-98,-96,-100,-97,233,-306,-299,-300,-301,-302,-303,399,-305,-318,399,442,456,-873,-876,-877,341,-917,-915,-916,-927,-150,-345,-348,-349,-350,-351,-352,-353,-354,-371,-372,-373,-374,-580,-581,-582,-463,-464,-465,399,-209,-101,-307,-304,399,442,-713,-705,-706,-707,-708,-709,-710,-711,-712,456,-762,-756,-757,-758,-759,-760,-761,-766,-866,-918,-327,-430,-355,399,399,693,693,701,-151,-298,760,-714,-754,-763,-779,-106,834,840,-914,868,399,-223,-221,399,-227,693,-197,-195,-196,701,-171,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,920,-104,760,-486,-483,-484,-485,-704,-755,-884,-107,840,-902,-900,-901,868,-377,-376,-224,1015,-99,-198,-172,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-315,920,-643,-638,-639,-640,-641,-642,-105,-693,-487,-490,-491,-903,-913,-921,-664,-378,1092,-212,1015,-216,-214,399,-193,-194,-160,-316,-644,-663,-668,-681,-482,-717,-724,-730,-736,-742,-748,-767,-467,-773,-879,-899,-929,-375,1092,-392,-391,-244,-245,-246,-247,-248,-249,-217,1161,-461,-313,-314,1176,-637,-662,-878,399,-393,-250,-251,-252,-213,1161,-442,-440,-441,-202,-201,-311,1239,1176,-602,-584,-585,-586,-587,-588,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-606,-492,-381,-387,-253,-254,-255,-256,-443,-186,-312,1239,-556,-535,-536,-537,-538,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-928,-560,1324,-603,-462,-625,-466,-666,-667,-481,-534,-906,399,399,-403,-404,1367,-257,-258,-259,-260,-439,-557,-473,-493,-528,-529,-530,-531,-532,1324,-575,-562,-563,-564,-565,-566,-567,-568,-569,-570,-571,-572,-573,-574,-579,1396,-583,-476,-654,399,399,1367,-410,-408,-409,-454,-474,-576,1396,-613,399,399,-611,-618,-533,-661,-396,-411,399,1448,-261,-262,-263,-561,-626,-665,399,-614,-608,-619,-623,-620,-621,-622,-609,-610,1475,-407,399,-294,399,-241,-234,-235,-236,-237,1448,-264,-231,-232,-233,-238,-239,-240,-242,-243,-475,399,-607,-624,1475,-435,-432,-433,-434,-295,-265,-477,-478,-436,-292,399,-228,-612,-431,399,-285,-270,-271,-272,-273,-274,-275,399,-220,-446,1552,-453,-286,-279,-276,-277,-278,-280,-281,-282,-283,1552,-508,-495,-496,-497,-498,-499,-500,-501,-502,-503,-504,-505,-506,-507,-269,-509,-512,-513,-514,-515,-516,-517,-518,-522,-494,-289,-519,-520,-521,-268,]),'NUMERIC':([9,10,13,14,117,118,182,191,192,210,211,212,213,214,215,219,220,221,222,223,224,225,226,227,228,229,230,231,232,236,237,238,239,240,241,242,243,244,245,246,248,253,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,340,388,390,392,393,395,397,398,406,407,408,409,410,411,412,413,414,415,418,419,420,421,422,423,424,425,426,427,436,437,438,439,440,441,510,539,540,541,542,543,548,549,550,551,552,553,556,557,562,571,573,574,575,578,579,580,581,583,584,606,607,608,659,662,679,681,682,685,686,687,688,689,690,692,716,717,718,719,720,722,723,725,726,727,731,732,733,734,736,739,740,741,742,743,744,745,749,750,751,752,753,754,757,758,759,857,859,874,884,885,887,888,889,890,896,911,912,914,919,930,931,934,935,936,937,939,940,941,985,994,996,1001,1004,1012,1014,1018,1019,1020,1021,1022,1027,1029,1030,1032,1041,1044,1045,1046,1047,1051,1052,1075,1080,1088,1089,1090,1098,1099,1100,1101,1103,1104,1105,1106,1107,1108,1111,1123,1129,1130,1131,1132,1136,1146,1147,1149,1153,1154,1156,1157,1158,1159,1160,1172,1175,1201,1202,1203,1204,1205,1207,1208,1215,1222,1226,1227,1229,1230,1231,1232,1233,1234,1238,1265,1266,1280,1284,1289,1291,1296,1297,1298,1299,1300,1301,1302,1303,1304,1305,1306,1307,1309,1317,1350,1351,1357,1359,1360,1364,1366,1374,1376,1401,1402,1403,1405,1406,1414,1415,1416,1417,1418,1419,1430,1434,1435,1436,1437,1438,1441,1445,1446,1447,1449,1450,1451,1452,1453,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1466,1471,1472,1474,1478,1479,1480,1481,1482,1483,1485,1486,1488,1490,1497,1500,1503,1504,1505,1506,1509,1514,1517,1520,1521,1522,1523,1524,1525,1526,1527,1529,1530,1531,1532,1533,1534,1536,1539,1541,1542,1543,1544,1545,1546,1547,1548,1549,1571,1573,1574,1576,1577,1581,1591,1592,1594,1596,1598,1599,1600,1601,1605,1609,],[13,14,16,17,229,229,361,370,371,382,383,384,385,386,387,229,-208,-152,-153,-154,-155,-156,-157,-158,229,-98,-96,-100,-97,229,-306,-299,-300,-301,-302,-303,229,-305,-318,229,416,441,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,503,510,548,552,229,557,560,-209,-101,-307,-304,229,569,-455,-456,-457,-458,-459,-460,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,573,-677,-678,574,-689,575,642,678,679,-388,-389,-390,681,682,-229,-230,229,690,229,692,725,734,736,746,755,575,-696,-694,-695,575,-701,828,829,830,861,861,874,884,885,229,-223,-221,229,-227,888,890,899,900,901,902,903,906,907,910,911,736,916,917,918,919,-104,736,-672,-669,-670,-671,935,936,746,-684,-682,-683,746,-690,-697,-679,-702,994,996,736,1012,1013,-224,229,-99,1022,1031,1041,935,-315,1047,1051,1052,-673,-105,-680,-692,-685,-691,-703,736,1080,1081,1090,935,1101,-212,229,-216,-214,229,1112,1115,-193,-194,-160,1128,-316,1131,1132,1133,1136,1137,935,1147,1090,-383,-382,1153,-428,-429,1154,-244,-245,-246,-247,-248,-249,-217,1171,-313,-314,1174,1175,1215,229,1222,-384,1226,1227,-250,-251,-252,1233,-213,-311,1271,1278,1279,1280,1281,1282,1284,1285,1289,1291,736,1301,-253,-254,-255,-256,1307,1308,-312,1316,1317,1356,1357,1359,1360,229,229,-403,-404,935,1374,1375,-257,-258,-259,-260,1376,-439,1388,1393,1394,1407,1408,1409,229,229,1414,1419,1436,229,229,-617,-618,229,1449,-261,-262,-263,1466,229,1436,-623,-620,-621,-622,229,229,-294,229,-241,-234,-235,-236,-237,1449,-264,-231,-232,-233,-238,-239,-240,-242,-243,1491,1500,229,-624,229,-435,-432,-433,-434,1504,-295,1506,1508,-265,1513,1514,-436,1517,-292,229,-228,1538,1539,229,-285,-270,-271,-272,-273,-274,-275,1546,1547,1548,1549,229,1550,-220,-453,-286,-279,-276,-277,-278,-280,-281,-282,-283,1585,1591,1592,-269,1594,736,1598,1599,1600,935,1603,1604,1605,-289,1607,-268,]),'PROJECT':([11,29,],[15,33,]),'IDENT':([15,28,41,75,76,77,78,79,80,81,82,83,84,85,87,88,89,111,112,113,114,117,118,140,207,216,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,236,237,238,239,240,241,242,243,244,245,246,333,334,335,358,391,392,397,398,399,400,404,406,407,408,416,417,418,419,420,421,422,423,424,425,426,427,506,507,508,511,552,556,569,570,586,587,588,589,590,591,595,596,597,635,637,638,639,640,641,645,646,647,648,685,686,687,688,689,691,772,773,774,777,778,779,782,783,784,787,788,789,792,793,794,797,798,799,803,804,805,808,809,810,813,814,815,831,833,835,847,849,858,887,888,889,914,917,918,932,949,951,953,955,957,959,961,963,965,983,984,987,990,1014,1015,1018,1019,1020,1021,1029,1030,1032,1039,1040,1044,1103,1104,1105,1106,1107,1108,1111,1129,1130,1146,1150,1156,1157,1158,1160,1172,1206,1229,1230,1231,1232,1238,1268,1273,1274,1296,1297,1298,1299,1303,1304,1305,1306,1308,1309,1310,1353,1364,1366,1377,1378,1379,1380,1381,1382,1383,1384,1385,1386,1396,1401,1402,1403,1405,1406,1411,1414,1415,1416,1417,1418,1420,1422,1425,1426,1430,1434,1435,1436,1437,1438,1441,1445,1446,1447,1449,1450,1451,1452,1453,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1472,1474,1475,1478,1479,1480,1481,1482,1485,1490,1501,1503,1505,1506,1508,1509,1520,1521,1522,1523,1524,1525,1526,1527,1533,1535,1536,1539,1541,1542,1543,1544,1545,1546,1547,1548,1549,1570,1575,1576,1601,1609,],[18,32,46,118,119,120,121,122,123,124,125,126,127,128,141,142,143,154,154,154,154,230,230,339,375,392,230,-208,-152,-153,-154,-155,-156,-157,-158,230,-98,-96,-100,-97,392,230,-306,-299,-300,-301,-302,-303,230,-305,-318,230,504,507,508,544,553,230,-209,-101,392,562,567,-307,-304,230,570,571,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,507,639,640,648,230,230,732,733,648,648,648,648,648,648,648,810,648,640,-888,507,-887,-106,835,648,-923,-922,-723,230,-223,-221,230,-227,889,648,-719,-718,648,-726,-725,648,-732,-731,648,-738,-737,648,-744,-743,648,-750,-749,648,-769,-768,810,-469,-468,648,-775,-774,835,-889,-107,640,-924,995,-224,230,-99,-315,1045,1046,1053,-720,-727,-733,-739,-745,-751,-770,-470,-776,1073,1074,1077,835,-212,392,230,-216,-214,230,-193,-194,-160,1126,1127,-316,-244,-245,-246,-247,-248,-249,-217,-313,-314,230,1224,-250,-251,-252,-213,-311,1283,-253,-254,-255,-256,-312,1318,640,1354,230,230,-403,-404,-257,-258,-259,-260,1377,-439,640,835,230,230,1420,835,640,640,1426,-523,-524,-525,-526,-527,1430,1438,230,230,-617,-618,1441,230,1463,-261,-262,-263,1467,835,835,1471,230,1438,-623,-620,-621,-622,230,230,-294,230,-241,-234,-235,-236,-237,1463,-264,-231,-232,-233,-238,-239,-240,-242,-243,230,-624,392,230,-435,-432,-433,-434,-295,-265,1515,-436,-292,230,1535,-228,230,-285,-270,-271,-272,-273,-274,-275,230,1551,-220,-453,-286,-279,-276,-277,-278,-280,-281,-282,-283,1584,1593,-269,-289,-268,]),'STRING':([18,27,32,40,73,74,97,117,118,119,120,121,122,123,124,125,126,127,139,141,143,183,184,185,186,187,188,189,190,193,219,220,221,222,223,224,225,226,227,228,229,230,231,232,236,237,238,239,240,241,242,243,244,245,246,349,353,354,355,356,372,392,397,398,401,402,403,404,406,407,408,428,429,430,431,432,433,434,435,455,504,527,528,530,535,536,544,552,556,563,564,565,572,582,661,664,665,668,674,675,677,685,686,687,688,689,728,746,755,768,769,867,887,888,889,914,943,1014,1018,1019,1020,1021,1029,1030,1032,1044,1048,1056,1057,1083,1084,1109,1111,1129,1130,1139,1146,1160,1172,1200,1214,1238,1296,1297,1298,1299,1309,1311,1312,1364,1366,1401,1402,1403,1405,1406,1414,1430,1434,1435,1436,1437,1438,1441,1445,1446,1447,1472,1474,1478,1479,1480,1481,1482,1485,1487,1503,1505,1506,1507,1509,1520,1521,1522,1523,1524,1525,1526,1527,1533,1536,1539,1541,1542,1543,1544,1545,1546,1547,1548,1549,],[19,31,42,45,115,116,150,232,232,247,248,249,250,251,252,253,254,255,338,340,349,362,363,364,365,366,367,368,369,372,232,-208,-152,-153,-154,-155,-156,-157,-158,232,-98,-96,-100,-97,232,-306,-299,-300,-301,-302,-303,232,-305,-318,232,514,524,150,150,539,546,232,-209,-101,563,564,565,566,-307,-304,232,572,-647,-648,-649,-650,-651,-652,-653,594,635,150,-52,150,150,-62,680,232,232,726,727,728,735,758,524,-53,-54,-56,-63,-66,-68,232,-223,-221,232,-227,913,937,941,946,947,-67,-224,232,-99,-315,1057,-212,232,-216,-214,232,-193,-194,-160,-316,1134,1139,-108,-55,-57,1159,-217,-313,-314,-109,232,-213,-311,1277,1288,-312,232,232,-403,-404,-439,1379,1380,232,232,1437,232,232,-617,-618,232,232,1437,-623,-620,-621,-622,232,232,-294,232,232,-624,232,-435,-432,-433,-434,-295,1507,-436,-292,232,1534,-228,232,-285,-270,-271,-272,-273,-274,-275,232,-220,-453,-286,-279,-276,-277,-278,-280,-281,-282,-283,]),'end':([19,21,22,23,24,25,26,30,31,34,35,36,37,38,39,42,44,45,46,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,86,91,92,93,115,116,117,118,128,130,131,132,133,134,135,136,137,138,142,144,146,147,148,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,194,195,196,197,198,199,200,201,202,203,204,205,206,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,234,235,236,237,238,239,240,241,242,244,246,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,337,338,339,342,343,344,345,346,347,348,350,360,361,362,363,364,365,366,367,368,369,370,371,374,375,376,377,378,379,380,381,382,383,384,385,386,387,392,397,398,406,407,408,418,419,420,421,422,423,424,425,426,427,441,443,444,445,446,447,448,449,450,451,452,453,454,457,458,459,460,461,462,463,464,465,466,467,469,484,485,486,505,506,509,511,513,545,546,547,552,554,555,556,558,559,560,561,566,568,573,574,576,577,578,579,580,581,583,584,585,586,587,588,589,590,591,593,594,595,596,597,599,600,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,678,683,684,685,686,687,688,689,694,695,696,697,698,699,700,702,703,704,705,706,707,708,709,710,711,712,713,714,715,730,735,736,737,738,739,740,741,742,743,744,747,748,749,750,751,752,753,754,757,758,759,761,762,763,764,765,766,767,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,791,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,831,832,833,835,836,837,838,839,841,842,843,844,845,846,849,850,851,852,853,854,855,856,869,870,871,872,873,887,888,889,891,892,894,898,899,900,901,902,903,904,905,906,907,908,909,910,912,913,914,916,921,922,923,924,925,926,927,928,929,934,935,936,937,939,940,941,942,945,946,947,949,951,953,955,957,959,961,963,965,966,967,968,969,970,971,972,973,977,978,979,980,981,982,989,990,991,993,995,1001,1003,1004,1014,1016,1017,1018,1019,1020,1021,1023,1024,1025,1026,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1038,1044,1050,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1072,1073,1074,1075,1076,1077,1078,1079,1081,1086,1087,1088,1089,1090,1091,1093,1094,1095,1096,1097,1103,1104,1105,1106,1107,1108,1111,1112,1114,1115,1117,1118,1119,1120,1121,1122,1125,1126,1127,1128,1129,1130,1133,1134,1135,1137,1139,1140,1142,1143,1144,1145,1149,1152,1156,1157,1158,1160,1162,1163,1164,1165,1166,1167,1168,1169,1171,1172,1174,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1209,1210,1211,1212,1213,1216,1217,1219,1220,1221,1223,1224,1225,1229,1230,1231,1232,1236,1237,1238,1240,1241,1242,1243,1244,1245,1246,1247,1248,1249,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1267,1269,1271,1272,1276,1277,1278,1279,1281,1282,1283,1285,1287,1288,1290,1292,1293,1294,1295,1300,1303,1304,1305,1306,1309,1315,1316,1318,1319,1320,1321,1322,1323,1325,1326,1327,1328,1329,1330,1331,1332,1333,1334,1335,1336,1337,1338,1339,1340,1341,1342,1343,1344,1345,1346,1347,1348,1349,1352,1353,1354,1355,1356,1358,1362,1363,1364,1365,1366,1368,1369,1370,1371,1372,1373,1378,1380,1387,1388,1390,1392,1393,1394,1397,1398,1399,1400,1404,1407,1408,1409,1410,1413,1414,1415,1416,1417,1418,1422,1423,1424,1425,1427,1428,1429,1432,1433,1434,1435,1436,1437,1438,1439,1440,1441,1442,1443,1444,1445,1446,1447,1449,1450,1451,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1467,1468,1472,1473,1474,1476,1477,1478,1479,1480,1481,1482,1485,1490,1491,1492,1493,1494,1495,1496,1498,1499,1503,1505,1506,1509,1512,1513,1515,1516,1518,1519,1520,1521,1522,1523,1524,1525,1526,1527,1533,1536,1537,1538,1539,1541,1542,1543,1544,1545,1546,1547,1548,1549,1551,1553,1554,1555,1556,1557,1558,1559,1560,1561,1562,1563,1564,1565,1566,1567,1568,1569,1576,1578,1579,1580,1583,1584,1585,1586,1587,1588,1589,1590,1593,1596,1597,1601,1603,1604,1606,1607,1609,],[-941,29,-115,-116,-113,-111,-112,-114,-941,43,-122,-123,-120,-118,-119,-941,-121,-124,-125,90,-148,-149,-146,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-117,-941,-147,145,-11,-941,-941,-941,-941,-941,336,-874,-875,-872,-867,-868,-869,-870,-871,-941,-126,-12,-9,-10,359,-346,-347,-344,-328,-329,-330,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,373,-367,-368,-365,-356,-357,-358,-359,-360,-361,-362,-363,-364,396,-210,-211,-208,-152,-153,-154,-155,-156,-157,-158,-159,-98,-96,-100,-97,405,-308,-309,-306,-299,-300,-301,-302,-303,-305,-310,-941,-941,468,-821,-822,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-873,-876,-877,512,-919,-920,-917,-915,-916,-927,-150,-345,-348,-349,-350,-351,-352,-353,-354,-371,-372,-373,-374,-366,-369,-580,-581,-582,-463,-464,-465,-370,-861,-862,-863,-864,-865,-941,-209,-101,-307,-304,-319,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-941,592,-715,-716,-713,-705,-706,-707,-708,-709,-710,-711,-712,598,-764,-765,-762,-756,-757,-758,-759,-760,-761,-766,-820,-842,-843,-844,636,-885,-866,-941,-918,-327,-430,-355,-941,691,-102,-103,-941,-941,-941,-151,729,-298,-941,-941,756,-698,-699,-696,-694,-695,-700,-701,-941,-941,-941,-941,-941,-941,-941,-714,-754,-941,-941,-941,-763,-779,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-888,-886,-887,-106,-941,-941,848,-925,-926,-923,-922,-723,-914,-941,-937,-938,-941,886,-225,-226,-223,-221,-222,-227,893,-199,-200,-197,-195,-196,895,897,-173,-174,-171,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,915,-941,-104,933,-674,-675,-672,-669,-670,-671,-676,938,-686,-687,-684,-682,-683,-688,-690,-697,-679,-702,944,-488,-489,-486,-483,-484,-485,948,-721,-722,-719,-718,950,-728,-729,-726,-725,952,-734,-735,-732,-731,954,-740,-741,-738,-737,956,-746,-747,-744,-743,958,-752,-753,-750,-749,-704,960,-771,-772,-769,-768,962,-471,-472,-469,-468,964,-777,-778,-775,-774,-755,-941,-884,-889,-107,986,-881,-882,-880,988,-904,-905,-902,-900,-901,-924,992,-935,-936,-933,-930,-931,-932,1002,-379,-380,-377,-376,-224,-941,-99,-941,-941,-198,-172,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-941,1042,1043,-315,-317,1049,-645,-646,-643,-638,-639,-640,-641,-642,-673,-105,-680,-692,-685,-691,-703,-693,-487,-490,-491,-720,-727,-733,-739,-745,-751,-770,-470,-776,-823,-88,-89,-90,-91,-830,-831,-832,1071,-894,-895,-892,-890,-891,-903,-913,-921,-934,-664,-941,-378,-941,-212,1110,-218,-219,-216,-214,-215,1113,-206,-207,-204,1116,-193,-194,-941,-160,1124,-324,-325,-322,-320,-321,-316,-644,-663,-668,-681,1138,-108,-482,-717,-724,-730,-736,-742,-748,-767,-467,-773,-833,-834,-835,-893,-896,-897,1141,-879,-941,-899,-929,-940,1148,-385,-386,-383,-382,-375,1151,-394,-395,-392,-391,-244,-245,-246,-247,-248,-249,-217,-941,-205,-203,1170,-189,-190,-187,-188,-191,-323,-461,-326,1173,-313,-314,-941,-941,-637,-662,-109,-878,1218,-910,-911,-908,-384,-393,-250,-251,-252,-213,1235,-444,-445,-442,-440,-441,-202,-201,-192,-311,-941,1275,-604,-605,-602,-584,-585,-586,-587,-588,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-606,1286,-658,-659,-656,-655,-492,-883,-909,-907,-912,-381,-941,-387,-253,-254,-255,-256,-443,-186,-312,1314,-558,-559,-556,-535,-536,-537,-538,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-928,-560,-941,-941,-603,-462,-625,-466,-666,-667,-481,-534,-657,-660,-906,1361,-401,-402,-399,-941,-257,-258,-259,-260,-439,-557,-473,-493,-528,-529,-530,-531,-532,1389,-577,-578,-575,-562,-563,-564,-565,-566,-567,-568,-569,-570,-571,-572,-573,-574,-579,1391,-632,-633,-630,-627,-628,-629,-636,1395,-941,-583,-476,-654,-400,-397,-405,-398,-406,1412,-412,-413,-410,-408,-409,1421,-941,-454,-474,-576,-631,-634,-635,1431,-615,-616,-613,-611,-533,-661,-939,-396,-411,-941,-941,-261,-262,-263,1469,1470,-479,-480,-561,-626,-665,-614,-608,-619,-623,-620,-621,-622,-609,-610,-941,-407,1484,-296,-297,-294,-293,-241,-234,-235,-236,-237,1489,-266,-267,-264,-231,-232,-233,-238,-239,-240,-242,-243,-941,-475,1501,-607,-624,1502,-437,-438,-435,-432,-433,-434,-295,-265,1510,1511,-450,-451,-448,-447,-477,-478,-436,-292,-941,-228,-449,-452,-612,-431,1540,-287,-288,-285,-270,-271,-272,-273,-274,-275,-284,-220,-446,-941,-453,-286,-279,-276,-277,-278,-280,-281,-282,-283,-941,1582,-510,-511,-508,-495,-496,-497,-498,-499,-500,-501,-502,-503,-504,-505,-506,-507,-269,1595,-290,-291,-509,-512,-513,-514,-515,-516,-517,-518,-522,1602,-494,-289,-519,-520,-521,1608,-268,]),'HEADER':([20,43,],[27,71,]),'MODULE':([20,90,],[28,144,]),'VERSION':([31,36,37,38,39,44,45,46,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,360,361,362,363,364,365,366,367,368,369,370,371,546,1091,1225,1442,],[40,40,-120,-118,-119,-121,-124,-125,40,40,-344,-328,-329,-330,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-345,-348,-349,-350,-351,-352,-353,-354,-371,-372,-373,-374,-430,-375,-387,-407,]),'PROJECT_NO':([31,36,37,38,39,44,45,46,],[41,41,-120,-118,-119,-121,-124,-125,]),'ADDR_EPK':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,360,361,362,363,364,365,366,367,368,369,370,371,546,1091,1225,1442,],[-124,182,182,-344,-328,-329,-330,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-345,-348,-349,-350,-351,-352,-353,-354,-371,-372,-373,-374,-430,-375,-387,-407,]),'EPK':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,360,361,362,363,364,365,366,367,368,369,370,371,546,1091,1225,1442,],[-124,183,183,-344,-328,-329,-330,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-345,-348,-349,-350,-351,-352,-353,-354,-371,-372,-373,-374,-430,-375,-387,-407,]),'SUPPLIER':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,360,361,362,363,364,365,366,367,368,369,370,371,546,1091,1225,1442,],[-124,184,184,-344,-328,-329,-330,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-345,-348,-349,-350,-351,-352,-353,-354,-371,-372,-373,-374,-430,-375,-387,-407,]),'CUSTOMER':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,360,361,362,363,364,365,366,367,368,369,370,371,546,1091,1225,1442,],[-124,185,185,-344,-328,-329,-330,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-345,-348,-349,-350,-351,-352,-353,-354,-371,-372,-373,-374,-430,-375,-387,-407,]),'CUSTOMER_NO':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,360,361,362,363,364,365,366,367,368,369,370,371,546,1091,1225,1442,],[-124,186,186,-344,-328,-329,-330,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-345,-348,-349,-350,-351,-352,-353,-354,-371,-372,-373,-374,-430,-375,-387,-407,]),'USER':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,360,361,362,363,364,365,366,367,368,369,370,371,546,1091,1225,1442,],[-124,187,187,-344,-328,-329,-330,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-345,-348,-349,-350,-351,-352,-353,-354,-371,-372,-373,-374,-430,-375,-387,-407,]),'PHONE_NO':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,360,361,362,363,364,365,366,367,368,369,370,371,546,1091,1225,1442,],[-124,188,188,-344,-328,-329,-330,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-345,-348,-349,-350,-351,-352,-353,-354,-371,-372,-373,-374,-430,-375,-387,-407,]),'ECU':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,360,361,362,363,364,365,366,367,368,369,370,371,546,1091,1225,1442,],[-124,189,189,-344,-328,-329,-330,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-345,-348,-349,-350,-351,-352,-353,-354,-371,-372,-373,-374,-430,-375,-387,-407,]),'CPU_TYPE':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,360,361,362,363,364,365,366,367,368,369,370,371,546,1091,1225,1442,],[-124,190,190,-344,-328,-329,-330,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-345,-348,-349,-350,-351,-352,-353,-354,-371,-372,-373,-374,-430,-375,-387,-407,]),'NO_OF_INTERFACES':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,360,361,362,363,364,365,366,367,368,369,370,371,546,1091,1225,1442,],[-124,191,191,-344,-328,-329,-330,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-345,-348,-349,-350,-351,-352,-353,-354,-371,-372,-373,-374,-430,-375,-387,-407,]),'ECU_CALIBRATION_OFFSET':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,360,361,362,363,364,365,366,367,368,369,370,371,546,1091,1225,1442,],[-124,192,192,-344,-328,-329,-330,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-345,-348,-349,-350,-351,-352,-353,-354,-371,-372,-373,-374,-430,-375,-387,-407,]),'SYSTEM_CONSTANT':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,360,361,362,363,364,365,366,367,368,369,370,371,546,1091,1225,1442,],[-124,193,193,-344,-328,-329,-330,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-345,-348,-349,-350,-351,-352,-353,-354,-371,-372,-373,-374,-430,-375,-387,-407,]),'A2ML':([47,145,],[72,350,]),'MOD_PAR':([47,359,],[73,545,]),'MOD_COMMON':([47,373,],[74,547,]),'IF_DATA':([47,396,405,840,1092,1176,1218,1239,1324,1361,1367,1431,1502,],[75,561,568,987,1150,1274,1290,1150,1150,1410,1411,1473,1516,]),'CHARACTERISTIC':([47,1314,],[76,1387,]),'AXIS_PTS':([47,1389,],[77,1427,]),'MEASUREMENT':([47,1275,],[78,1355,]),'COMPU_METHOD':([47,1049,],[79,1135,]),'COMPU_TAB':([47,933,],[80,1054,]),'COMPU_VTAB':([47,938,],[81,1055,]),'COMPU_VTAB_RANGE':([47,756,],[82,942,]),'FUNCTION':([47,592,],[83,800,]),'GROUP':([47,598,],[84,816,]),'RECORD_LAYOUT':([47,468,],[85,600,]),'VARIANT_CODING':([47,336,],[86,509,]),'FRAME':([47,988,],[87,1078,]),'USER_RIGHTS':([47,512,],[88,649,]),'UNIT':([47,992,],[89,1079,]),'block':([72,92,93,146,147,148,354,355,527,528,530,535,536,664,665,668,674,675,677,867,1083,1084,],[97,97,-11,-12,-9,-10,97,97,97,-52,97,97,-62,-53,-54,-56,-63,-66,-68,-67,-55,-57,]),'char':([72,92,93,146,147,148,149,150,352,517,518,532,537,654,655,670,],[103,103,-11,-12,-9,-10,103,-69,103,103,-38,103,103,-39,-40,103,]),'int':([72,92,93,146,147,148,149,150,352,517,518,532,537,654,655,670,],[104,104,-11,-12,-9,-10,104,-69,104,104,-38,104,104,-39,-40,104,]),'long':([72,92,93,146,147,148,149,150,352,517,518,532,537,654,655,670,],[105,105,-11,-12,-9,-10,105,-69,105,105,-38,105,105,-39,-40,105,]),'uchar':([72,92,93,146,147,148,149,150,352,517,518,532,537,654,655,670,],[106,106,-11,-12,-9,-10,106,-69,106,106,-38,106,106,-39,-40,106,]),'uint':([72,92,93,146,147,148,149,150,352,517,518,532,537,654,655,670,],[107,107,-11,-12,-9,-10,107,-69,107,107,-38,107,107,-39,-40,107,]),'ulong':([72,92,93,146,147,148,149,150,352,517,518,532,537,654,655,670,],[108,108,-11,-12,-9,-10,108,-69,108,108,-38,108,108,-39,-40,108,]),'double':([72,92,93,146,147,148,149,150,352,517,518,532,537,654,655,670,],[109,109,-11,-12,-9,-10,109,-69,109,109,-38,109,109,-39,-40,109,]),'float':([72,92,93,146,147,148,149,150,352,517,518,532,537,654,655,670,],[110,110,-11,-12,-9,-10,110,-69,110,110,-38,110,110,-39,-40,110,]),'struct':([72,92,93,146,147,148,149,150,352,517,518,532,537,654,655,670,],[111,111,-11,-12,-9,-10,111,-69,111,111,-38,111,111,-39,-40,111,]),'enum':([72,92,93,146,147,148,149,150,352,517,518,532,537,654,655,670,],[112,112,-11,-12,-9,-10,112,-69,112,112,-38,112,112,-39,-40,112,]),'taggedstruct':([72,92,93,146,147,148,149,150,352,517,518,532,537,654,655,670,],[113,113,-11,-12,-9,-10,113,-69,113,113,-38,113,113,-39,-40,113,]),'taggedunion':([72,92,93,146,147,148,149,150,352,517,518,532,537,654,655,670,],[114,114,-11,-12,-9,-10,114,-69,114,114,-38,114,114,-39,-40,114,]),'XCP':([75,1274,1411,],[117,117,117,]),'VAR_SEPARATOR':([86,132,133,134,135,136,137,138,337,338,339,832,1076,1140,],[139,139,-872,-867,-868,-869,-870,-871,-873,-876,-877,-884,-879,-878,]),'VAR_NAMING':([86,132,133,134,135,136,137,138,337,338,339,832,1076,1140,],[140,140,-872,-867,-868,-869,-870,-871,-873,-876,-877,-884,-879,-878,]),'SEMICOLON':([94,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,150,152,154,156,158,160,351,519,520,529,531,532,537,538,653,656,657,658,660,663,669,671,672,673,676,997,998,999,1082,1085,],[147,148,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-69,-35,-70,-29,-49,-61,-27,655,-941,665,668,-941,675,677,-34,-41,-44,-45,-28,-48,-58,-43,-42,-60,867,-46,1083,1084,-47,-59,]),'PARENTHESE_CLOSE':([98,99,100,101,102,103,104,105,106,107,108,109,110,150,152,154,156,158,160,351,520,532,653,656,657,658,660,663,666,667,669,671,672,673,866,997,1082,1085,],[-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-69,-35,-70,-29,-49,-61,-27,-941,-941,-34,-41,-44,-45,-28,-48,864,865,-58,-43,-42,-60,1000,-46,-47,-59,]),'BRACE_OPEN':([98,99,100,101,102,103,104,105,106,107,108,109,110,152,154,156,158,160,520,653,660,663,673,997,],[-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-35,-70,-29,-49,-61,659,-34,-28,-48,-60,659,]),'CURLY_OPEN':([111,112,113,114,151,152,153,154,155,156,157,158,159,160,],[-941,-941,-941,-941,352,-72,-71,-70,353,-72,354,-72,355,-72,]),'S_REC_LAYOUT':([116,196,197,198,199,200,201,202,203,204,205,206,374,375,376,377,378,379,380,381,382,383,384,385,386,387,],[207,207,-365,-356,-357,-358,-359,-360,-361,-362,-363,-364,-366,-369,-580,-581,-582,-463,-464,-465,-370,-861,-862,-863,-864,-865,]),'DEPOSIT':([116,196,197,198,199,200,201,202,203,204,205,206,348,374,375,376,377,378,379,380,381,382,383,384,385,386,387,1058,1066,1126,1267,1271,1277,1283,1285,1319,1320,1321,1322,1323,1327,1328,1329,1330,1331,1332,1333,1334,1335,1336,1337,1338,1339,1340,1341,1342,1388,1390,1410,1538,1555,1556,1557,1558,1559,1560,1561,1562,1563,1564,1565,1566,1567,1568,1569,1583,1584,1585,1586,1587,1588,1589,1590,1593,1603,1604,1606,],[208,208,-365,-356,-357,-358,-359,-360,-361,-362,-363,-364,-927,-366,-369,-580,-581,-582,-463,-464,-465,-370,-861,-862,-863,-864,-865,-482,-467,-461,-928,208,-462,-481,-534,-528,-529,-530,-531,-532,208,-575,-562,-563,-564,-565,-566,-567,-568,-569,-570,-571,-572,-573,-574,-579,-474,-576,-396,208,208,-508,-495,-496,-497,-498,-499,-500,-501,-502,-503,-504,-505,-506,-507,-509,-512,-513,-514,-515,-516,-517,-518,-522,-519,-520,-521,]),'BYTE_ORDER':([116,196,197,198,199,200,201,202,203,204,205,206,348,374,375,376,377,378,379,380,381,382,383,384,385,386,387,561,1058,1066,1126,1133,1174,1179,1180,1181,1182,1183,1184,1185,1186,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1242,1243,1244,1245,1246,1247,1248,1249,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1267,1269,1271,1276,1277,1278,1279,1281,1282,1283,1285,1315,1316,1318,1319,1320,1321,1322,1323,1327,1328,1329,1330,1331,1332,1333,1334,1335,1336,1337,1338,1339,1340,1341,1342,1356,1388,1390,1407,1410,1428,1429,1468,1473,1498,1499,1538,1555,1556,1557,1558,1559,1560,1561,1562,1563,1564,1565,1566,1567,1568,1569,1583,1584,1585,1586,1587,1588,1589,1590,1593,1597,1603,1604,1606,],[209,209,-365,-356,-357,-358,-359,-360,-361,-362,-363,-364,-927,-366,-369,-580,-581,-582,-463,-464,-465,-370,-861,-862,-863,-864,-865,-151,-482,-467,-461,209,209,209,-602,-584,-585,-586,-587,-588,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-606,209,-556,-535,-536,-537,-538,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-928,-560,209,-603,-462,-625,-466,-666,-667,-481,-534,-557,-473,-493,-528,-529,-530,-531,-532,209,-575,-562,-563,-564,-565,-566,-567,-568,-569,-570,-571,-572,-573,-574,-579,-476,-474,-576,-533,-396,-626,-665,-475,-607,-477,-478,209,209,-508,-495,-496,-497,-498,-499,-500,-501,-502,-503,-504,-505,-506,-507,-509,-512,-513,-514,-515,-516,-517,-518,-522,-494,-519,-520,-521,]),'DATA_SIZE':([116,196,197,198,199,200,201,202,203,204,205,206,374,375,376,377,378,379,380,381,382,383,384,385,386,387,],[210,210,-365,-356,-357,-358,-359,-360,-361,-362,-363,-364,-366,-369,-580,-581,-582,-463,-464,-465,-370,-861,-862,-863,-864,-865,]),'ALIGNMENT_BYTE':([116,128,196,197,198,199,200,201,202,203,204,205,206,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,374,375,376,377,378,379,380,381,382,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[211,211,211,-365,-356,-357,-358,-359,-360,-361,-362,-363,-364,211,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-366,-369,-580,-581,-582,-463,-464,-465,-370,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'ALIGNMENT_WORD':([116,128,196,197,198,199,200,201,202,203,204,205,206,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,374,375,376,377,378,379,380,381,382,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[212,212,212,-365,-356,-357,-358,-359,-360,-361,-362,-363,-364,212,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-366,-369,-580,-581,-582,-463,-464,-465,-370,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'ALIGNMENT_LONG':([116,128,196,197,198,199,200,201,202,203,204,205,206,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,374,375,376,377,378,379,380,381,382,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[213,213,213,-365,-356,-357,-358,-359,-360,-361,-362,-363,-364,213,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-366,-369,-580,-581,-582,-463,-464,-465,-370,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'ALIGNMENT_FLOAT32_IEEE':([116,128,196,197,198,199,200,201,202,203,204,205,206,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,374,375,376,377,378,379,380,381,382,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[214,214,214,-365,-356,-357,-358,-359,-360,-361,-362,-363,-364,214,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-366,-369,-580,-581,-582,-463,-464,-465,-370,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'ALIGNMENT_FLOAT64_IEEE':([116,128,196,197,198,199,200,201,202,203,204,205,206,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,374,375,376,377,378,379,380,381,382,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[215,215,215,-365,-356,-357,-358,-359,-360,-361,-362,-363,-364,215,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-366,-369,-580,-581,-582,-463,-464,-465,-370,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'TP_BLOB':([118,229,230,231,232,236,237,238,239,240,241,242,244,246,398,406,407,408,889,914,1044,1129,1130,1172,1238,],[245,-98,-96,-100,-97,245,-306,-299,-300,-301,-302,-303,-305,-310,-101,-307,-304,-319,-99,-315,-316,-313,-314,-311,-312,]),'FNC_VALUES':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[299,299,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'IDENTIFICATION':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[300,300,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'AXIS_PTS_X':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[301,301,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'AXIS_PTS_Y':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[302,302,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'AXIS_PTS_Z':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[303,303,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'AXIS_RESCALE_X':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[304,304,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'AXIS_RESCALE_Y':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[305,305,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'AXIS_RESCALE_Z':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[306,306,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'NO_AXIS_PTS_X':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[307,307,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'NO_AXIS_PTS_Y':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[308,308,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'NO_AXIS_PTS_Z':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[309,309,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'NO_RESCALE_X':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[310,310,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'NO_RESCALE_Y':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[311,311,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'NO_RESCALE_Z':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[312,312,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'FIX_NO_AXIS_PTS_X':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[313,313,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'FIX_NO_AXIS_PTS_Y':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[314,314,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'FIX_NO_AXIS_PTS_Z':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[315,315,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'SRC_ADDR_X':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[316,316,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'SRC_ADDR_Y':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[317,317,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'SRC_ADDR_Z':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[318,318,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'RIP_ADDR_X':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[319,319,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'RIP_ADDR_Y':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[320,320,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'RIP_ADDR_Z':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[321,321,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'RIP_ADDR_W':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[322,322,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'SHIFT_OP_X':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[323,323,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'SHIFT_OP_Y':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[324,324,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'SHIFT_OP_Z':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[325,325,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'OFFSET_X':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[326,326,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'OFFSET_Y':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[327,327,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'OFFSET_Z':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[328,328,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'DIST_OP_X':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[329,329,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'DIST_OP_Y':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[330,330,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'DIST_OP_Z':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,966,967,968,969,970,971,972,973,1068,1069,1070,],[331,331,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'RESERVED':([128,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,383,384,385,386,387,418,419,420,421,422,423,424,425,426,427,469,484,485,486,602,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,680,966,967,968,969,970,971,972,973,1068,1069,1070,],[332,332,-819,-780,-781,-782,-783,-784,-785,-786,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-861,-862,-863,-864,-865,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-820,-842,-843,-844,-829,-836,-837,-838,-839,-840,-841,-845,-846,-847,-848,-849,-850,-851,-852,-853,-854,-855,-856,-857,-858,-859,-860,-898,-85,-86,-87,881,-823,-88,-89,-90,-91,-830,-831,-832,-833,-834,-835,]),'VAR_CRITERION':([129,1071,],[333,1140,]),'VAR_FORBIDDEN_COMB':([129,636,],[334,832,]),'VAR_CHARACTERISTIC':([129,986,],[335,1076,]),'READ_ONLY':([142,344,345,346,347,348,376,377,378,379,380,381,513,991,1058,1066,1126,1174,1242,1243,1244,1245,1246,1247,1248,1249,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1267,1269,1271,1277,1279,1283,1285,1315,1316,1318,1319,1320,1321,1322,1323,1327,1328,1329,1330,1331,1332,1333,1334,1335,1336,1337,1338,1339,1340,1341,1342,1356,1388,1390,1407,1410,1468,1498,1499,1538,1555,1556,1557,1558,1559,1560,1561,1562,1563,1564,1565,1566,1567,1568,1569,1583,1584,1585,1586,1587,1588,1589,1590,1593,1597,1603,1604,1606,],[348,348,-917,-915,-916,-927,-580,-581,-582,-463,-464,-465,-918,-921,-482,-467,-461,348,348,-556,-535,-536,-537,-538,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-928,-560,348,-462,-466,-481,-534,-557,-473,-493,-528,-529,-530,-531,-532,348,-575,-562,-563,-564,-565,-566,-567,-568,-569,-570,-571,-572,-573,-574,-579,-476,-474,-576,-533,-396,-475,-477,-478,348,348,-508,-495,-496,-497,-498,-499,-500,-501,-502,-503,-504,-505,-506,-507,-509,-512,-513,-514,-515,-516,-517,-518,-522,-494,-519,-520,-521,]),'PARENTHESE_OPEN':([150,354,527,528,532,664,665,668,1083,1084,],[-69,530,530,-52,670,-53,-54,-56,-55,-57,]),'CALIBRATION_METHOD':([161,1002,],[356,1091,]),'MEMORY_LAYOUT':([161,1151,],[357,1225,]),'MEMORY_SEGMENT':([161,1412,],[358,1442,]),'ABSOLUTE':([208,],[377,]),'DIFFERENCE':([208,],[378,]),'MSB_FIRST':([209,],[380,]),'MSB_LAST':([209,],[381,]),'PROTOCOL_LAYER':([216,1484,],[388,1505,]),'DAQ':([216,1489,1528,1550,],[389,1509,1543,1543,]),'PAG':([216,886,],[390,1014,]),'PGM':([216,1110,],[391,1160,]),'SEGMENT':([216,1235,1475,],[393,1309,393,]),'DAQ_EVENT':([216,893,895,],[394,1029,1030,]),'XCP_ON_CAN':([216,897,],[395,1032,]),'FREEZE_SUPPORTED':([229,230,231,232,398,552,685,686,687,688,689,887,889,],[-98,-96,-100,-97,-101,689,689,-223,-221,-222,-227,-224,-99,]),'QP_BLOB':([229,230,232,889,910,1035,1036,1037,1038,1077,1125,1126,1127,1144,1145,1219,1220,1221,],[-98,-96,-97,-99,1040,1040,-322,-320,-321,1146,-323,-461,-326,1146,-908,-909,-907,-912,]),'DP_BLOB':([229,230,231,232,398,889,1224,1294,1295,1354,1362,1363,1364,1365,1366,1399,1400,1404,1432,1433,1434,1435,1436,1437,1438,1439,1440,1474,1515,],[-98,-96,-100,-97,-101,-99,1298,1298,-399,1298,-400,-397,-405,-398,-406,1298,-613,-611,-614,-608,-619,-623,-620,-621,-622,-609,-610,-624,-612,]),'BA_BLOB':([229,230,231,232,398,889,1224,1294,1295,1362,1363,1364,1365,1366,],[-98,-96,-100,-97,-101,-99,1299,1299,-399,-400,-397,-405,-398,-406,]),'KP_BLOB':([229,230,231,232,398,889,1354,1364,1366,1399,1400,1404,1432,1433,1434,1435,1436,1437,1438,1439,1440,1474,1515,],[-98,-96,-100,-97,-101,-99,1405,-405,-406,1405,-613,-611,-614,-608,-619,-623,-620,-621,-622,-609,-610,-624,-612,]),'PA_BLOB':([229,230,231,232,398,889,1354,1364,1366,1399,1400,1404,1432,1433,1434,1435,1436,1437,1438,1439,1440,1474,1515,],[-98,-96,-100,-97,-101,-99,1406,-405,-406,1406,-613,-611,-614,-608,-619,-623,-620,-621,-622,-609,-610,-624,-612,]),'ADDRESS_MAPPING':([229,230,232,889,1309,1441,1478,1479,1480,1481,1482,1503,1539,],[-98,-96,-97,-99,-439,1483,1483,-435,-432,-433,-434,-436,-453,]),'DAQ_LIST_TYPE':([229,230,231,232,398,889,1506,1520,1521,1522,1523,1524,1525,1526,1527,1533,1541,1542,1543,1544,1545,1546,1547,1548,1549,],[-98,-96,-100,-97,-101,-99,1528,1528,-285,-270,-271,-272,-273,-274,-275,-284,-286,-279,-276,-277,-278,-280,-281,-282,-283,]),'MAX_ODT':([229,230,231,232,398,889,1506,1520,1521,1522,1523,1524,1525,1526,1527,1533,1541,1542,1543,1544,1545,1546,1547,1548,1549,],[-98,-96,-100,-97,-101,-99,1529,1529,-285,-270,-271,-272,-273,-274,-275,-284,-286,-279,-276,-277,-278,-280,-281,-282,-283,]),'MAX_ODT_ENTRIES':([229,230,231,232,398,889,1506,1520,1521,1522,1523,1524,1525,1526,1527,1533,1541,1542,1543,1544,1545,1546,1547,1548,1549,],[-98,-96,-100,-97,-101,-99,1530,1530,-285,-270,-271,-272,-273,-274,-275,-284,-286,-279,-276,-277,-278,-280,-281,-282,-283,]),'FIRST_PID':([229,230,231,232,398,889,1506,1520,1521,1522,1523,1524,1525,1526,1527,1533,1541,1542,1543,1544,1545,1546,1547,1548,1549,],[-98,-96,-100,-97,-101,-99,1531,1531,-285,-270,-271,-272,-273,-274,-275,-284,-286,-279,-276,-277,-278,-280,-281,-282,-283,]),'EVENT_FIXED':([229,230,231,232,398,889,1506,1520,1521,1522,1523,1524,1525,1526,1527,1533,1541,1542,1543,1544,1545,1546,1547,1548,1549,],[-98,-96,-100,-97,-101,-99,1532,1532,-285,-270,-271,-272,-273,-274,-275,-284,-286,-279,-276,-277,-278,-280,-281,-282,-283,]),'SOURCE':([233,1124,],[400,1172,]),'RASTER':([233,1173,],[401,1238,]),'EVENT_GROUP':([233,1042,],[402,1129,]),'SEED_KEY':([233,1043,],[403,1130,]),'CHECKSUM':([233,729,915,1161,],[404,914,1044,404,]),'VALUE':([247,],[410,]),'CURVE':([247,],[411,]),'MAP':([247,],[412,]),'CUBOID':([247,],[413,]),'VAL_BLK':([247,],[414,]),'ASCII':([247,],[415,]),'UBYTE':([249,470,471,472,473,474,475,476,477,478,479,480,481,482,483,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,],[418,418,418,418,418,418,418,418,418,418,418,418,418,418,418,418,418,418,418,418,418,418,418,418,418,418,418,418,418,418,418,]),'SBYTE':([249,470,471,472,473,474,475,476,477,478,479,480,481,482,483,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,],[419,419,419,419,419,419,419,419,419,419,419,419,419,419,419,419,419,419,419,419,419,419,419,419,419,419,419,419,419,419,419,]),'UWORD':([249,470,471,472,473,474,475,476,477,478,479,480,481,482,483,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,],[420,420,420,420,420,420,420,420,420,420,420,420,420,420,420,420,420,420,420,420,420,420,420,420,420,420,420,420,420,420,420,]),'SWORD':([249,470,471,472,473,474,475,476,477,478,479,480,481,482,483,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,],[421,421,421,421,421,421,421,421,421,421,421,421,421,421,421,421,421,421,421,421,421,421,421,421,421,421,421,421,421,421,421,]),'ULONG':([249,470,471,472,473,474,475,476,477,478,479,480,481,482,483,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,],[422,422,422,422,422,422,422,422,422,422,422,422,422,422,422,422,422,422,422,422,422,422,422,422,422,422,422,422,422,422,422,]),'SLONG':([249,470,471,472,473,474,475,476,477,478,479,480,481,482,483,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,],[423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,]),'A_UINT64':([249,470,471,472,473,474,475,476,477,478,479,480,481,482,483,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,],[424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,]),'A_INT64':([249,470,471,472,473,474,475,476,477,478,479,480,481,482,483,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,],[425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,]),'FLOAT32_IEEE':([249,470,471,472,473,474,475,476,477,478,479,480,481,482,483,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,],[426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,]),'FLOAT64_IEEE':([249,470,471,472,473,474,475,476,477,478,479,480,481,482,483,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,],[427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,]),'TAB_INTP':([250,251,],[429,437,]),'TAB_NOINTP':([250,251,],[430,438,]),'TAB_VERB':([250,252,],[431,440,]),'RAT_FUNC':([250,],[432,]),'FORM':([250,],[433,]),'IDENTICAL':([250,],[434,]),'LINEAR':([250,],[435,]),'FUNCTION_VERSION':([254,445,446,447,448,449,450,451,452,453,454,593,594,1058,1059,1060,1061,1062,1063,1064,],[455,455,-713,-705,-706,-707,-708,-709,-710,-711,-712,-714,-754,-482,-717,-724,-730,-736,-742,-748,]),'ROOT':([255,459,460,461,462,463,464,465,466,467,599,1058,1060,1065,1066,1067,],[467,467,-762,-756,-757,-758,-759,-760,-761,-766,-763,-482,-724,-767,-467,-773,]),'REF_GROUP':([341,848,],[511,991,]),'DISPLAY_IDENTIFIER':([348,376,377,378,379,380,381,561,910,1035,1036,1037,1038,1058,1066,1125,1126,1127,1133,1174,1179,1180,1181,1182,1183,1184,1185,1186,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1242,1243,1244,1245,1246,1247,1248,1249,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1267,1269,1271,1276,1277,1278,1279,1281,1282,1283,1285,1315,1316,1318,1319,1320,1321,1322,1323,1327,1328,1329,1330,1331,1332,1333,1334,1335,1336,1337,1338,1339,1340,1341,1342,1356,1388,1390,1407,1410,1428,1429,1468,1473,1498,1499,1597,],[-927,-580,-581,-582,-463,-464,-465,-151,1039,1039,-322,-320,-321,-482,-467,-323,-461,-326,1039,1039,1039,-602,-584,-585,-586,-587,-588,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-606,1039,-556,-535,-536,-537,-538,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-928,-560,1039,-603,-462,-625,-466,-666,-667,-481,-534,-557,-473,-493,-528,-529,-530,-531,-532,1039,-575,-562,-563,-564,-565,-566,-567,-568,-569,-570,-571,-572,-573,-574,-579,-476,-474,-576,-533,-396,-626,-665,-475,-607,-477,-478,-494,]),'FORMAT':([348,376,377,378,379,380,381,561,1058,1066,1126,1133,1174,1179,1180,1181,1182,1183,1184,1185,1186,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1242,1243,1244,1245,1246,1247,1248,1249,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1267,1269,1271,1276,1277,1278,1279,1281,1282,1283,1285,1315,1316,1318,1319,1320,1321,1322,1323,1327,1328,1329,1330,1331,1332,1333,1334,1335,1336,1337,1338,1339,1340,1341,1342,1356,1388,1390,1407,1410,1428,1429,1468,1473,1498,1499,1538,1555,1556,1557,1558,1559,1560,1561,1562,1563,1564,1565,1566,1567,1568,1569,1583,1584,1585,1586,1587,1588,1589,1590,1593,1597,1603,1604,1606,],[-927,-580,-581,-582,-463,-464,-465,-151,-482,-467,-461,1200,1200,1200,-602,-584,-585,-586,-587,-588,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-606,1200,-556,-535,-536,-537,-538,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-928,-560,1200,-603,-462,-625,-466,-666,-667,-481,-534,-557,-473,-493,-528,-529,-530,-531,-532,1200,-575,-562,-563,-564,-565,-566,-567,-568,-569,-570,-571,-572,-573,-574,-579,-476,-474,-576,-533,-396,-626,-665,-475,-607,-477,-478,1200,1200,-508,-495,-496,-497,-498,-499,-500,-501,-502,-503,-504,-505,-506,-507,-509,-512,-513,-514,-515,-516,-517,-518,-522,-494,-519,-520,-521,]),'BIT_MASK':([348,379,380,381,561,1058,1066,1126,1133,1174,1179,1180,1181,1182,1183,1184,1185,1186,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1242,1243,1244,1245,1246,1247,1248,1249,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1267,1269,1276,1277,1278,1279,1281,1282,1283,1285,1315,1316,1318,1319,1320,1321,1322,1323,1356,1388,1407,1410,1428,1429,1468,1473,1498,1499,1597,],[-927,-463,-464,-465,-151,-482,-467,-461,1202,1202,1202,-602,-584,-585,-586,-587,-588,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-606,1202,-556,-535,-536,-537,-538,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-928,-560,-603,-462,-625,-466,-666,-667,-481,-534,-557,-473,-493,-528,-529,-530,-531,-532,-476,-474,-533,-396,-626,-665,-475,-607,-477,-478,-494,]),'NUMBER':([348,379,380,381,1058,1066,1126,1174,1242,1243,1244,1245,1246,1247,1248,1249,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1267,1269,1277,1279,1283,1285,1315,1316,1318,1319,1320,1321,1322,1323,1356,1388,1407,1410,1468,1498,1499,1597,],[-927,-463,-464,-465,-482,-467,-461,1265,1265,-556,-535,-536,-537,-538,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-928,-560,-462,-466,-481,-534,-557,-473,-493,-528,-529,-530,-531,-532,-476,-474,-533,-396,-475,-477,-478,-494,]),'EXTENDED_LIMITS':([348,376,377,378,379,380,381,1058,1066,1126,1174,1242,1243,1244,1245,1246,1247,1248,1249,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1267,1269,1271,1277,1279,1283,1285,1315,1316,1318,1319,1320,1321,1322,1323,1327,1328,1329,1330,1331,1332,1333,1334,1335,1336,1337,1338,1339,1340,1341,1342,1356,1388,1390,1407,1410,1468,1498,1499,1538,1555,1556,1557,1558,1559,1560,1561,1562,1563,1564,1565,1566,1567,1568,1569,1583,1584,1585,1586,1587,1588,1589,1590,1593,1597,1603,1604,1606,],[-927,-580,-581,-582,-463,-464,-465,-482,-467,-461,1266,1266,-556,-535,-536,-537,-538,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-928,-560,1266,-462,-466,-481,-534,-557,-473,-493,-528,-529,-530,-531,-532,1266,-575,-562,-563,-564,-565,-566,-567,-568,-569,-570,-571,-572,-573,-574,-579,-476,-474,-576,-533,-396,-475,-477,-478,1266,1266,-508,-495,-496,-497,-498,-499,-500,-501,-502,-503,-504,-505,-506,-507,-509,-512,-513,-514,-515,-516,-517,-518,-522,-494,-519,-520,-521,]),'GUARD_RAILS':([348,376,377,378,379,380,381,1058,1066,1126,1174,1242,1243,1244,1245,1246,1247,1248,1249,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1267,1269,1271,1277,1279,1283,1285,1315,1316,1318,1319,1320,1321,1322,1323,1327,1328,1329,1330,1331,1332,1333,1334,1335,1336,1337,1338,1339,1340,1341,1342,1356,1388,1390,1407,1410,1468,1498,1499,1597,],[-927,-580,-581,-582,-463,-464,-465,-482,-467,-461,1267,1267,-556,-535,-536,-537,-538,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-928,-560,1267,-462,-466,-481,-534,-557,-473,-493,-528,-529,-530,-531,-532,1267,-575,-562,-563,-564,-565,-566,-567,-568,-569,-570,-571,-572,-573,-574,-579,-476,-474,-576,-533,-396,-475,-477,-478,-494,]),'MAX_REFRESH':([348,379,380,381,561,1058,1066,1126,1133,1174,1179,1180,1181,1182,1183,1184,1185,1186,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1242,1243,1244,1245,1246,1247,1248,1249,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1267,1269,1276,1277,1278,1279,1281,1282,1283,1285,1315,1316,1318,1319,1320,1321,1322,1323,1356,1388,1407,1410,1428,1429,1468,1473,1498,1499,1597,],[-927,-463,-464,-465,-151,-482,-467,-461,1203,1203,1203,-602,-584,-585,-586,-587,-588,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-606,1203,-556,-535,-536,-537,-538,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-928,-560,-603,-462,-625,-466,-666,-667,-481,-534,-557,-473,-493,-528,-529,-530,-531,-532,-476,-474,-533,-396,-626,-665,-475,-607,-477,-478,-494,]),'REF_MEMORY_SEGMENT':([348,376,377,378,379,380,381,561,1058,1066,1126,1133,1174,1179,1180,1181,1182,1183,1184,1185,1186,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1242,1243,1244,1245,1246,1247,1248,1249,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1267,1269,1271,1276,1277,1278,1279,1281,1282,1283,1285,1315,1316,1318,1319,1320,1321,1322,1323,1327,1328,1329,1330,1331,1332,1333,1334,1335,1336,1337,1338,1339,1340,1341,1342,1356,1388,1390,1407,1410,1428,1429,1468,1473,1498,1499,1597,],[-927,-580,-581,-582,-463,-464,-465,-151,-482,-467,-461,1206,1206,1206,-602,-584,-585,-586,-587,-588,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-606,1206,-556,-535,-536,-537,-538,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-928,-560,1206,-603,-462,-625,-466,-666,-667,-481,-534,-557,-473,-493,-528,-529,-530,-531,-532,1206,-575,-562,-563,-564,-565,-566,-567,-568,-569,-570,-571,-572,-573,-574,-579,-476,-474,-576,-533,-396,-626,-665,-475,-607,-477,-478,-494,]),'COMPARISON_QUANTITY':([348,379,380,381,1058,1066,1126,1174,1242,1243,1244,1245,1246,1247,1248,1249,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1267,1269,1277,1279,1283,1285,1315,1316,1318,1319,1320,1321,1322,1323,1356,1388,1407,1410,1468,1498,1499,1597,],[-927,-463,-464,-465,-482,-467,-461,1268,1268,-556,-535,-536,-537,-538,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-928,-560,-462,-466,-481,-534,-557,-473,-493,-528,-529,-530,-531,-532,-476,-474,-533,-396,-475,-477,-478,-494,]),'CALIBRATION_ACCESS':([348,376,377,378,379,380,381,1058,1066,1126,1174,1242,1243,1244,1245,1246,1247,1248,1249,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1267,1269,1271,1277,1279,1283,1285,1315,1316,1318,1319,1320,1321,1322,1323,1327,1328,1329,1330,1331,1332,1333,1334,1335,1336,1337,1338,1339,1340,1341,1342,1356,1388,1390,1407,1410,1468,1498,1499,1597,],[-927,-580,-581,-582,-463,-464,-465,-482,-467,-461,1270,1270,-556,-535,-536,-537,-538,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-928,-560,1270,-462,-466,-481,-534,-557,-473,-493,-528,-529,-530,-531,-532,1270,-575,-562,-563,-564,-565,-566,-567,-568,-569,-570,-571,-572,-573,-574,-579,-476,-474,-576,-533,-396,-475,-477,-478,-494,]),'MATRIX_DIM':([348,379,380,381,561,1058,1066,1126,1133,1174,1179,1180,1181,1182,1183,1184,1185,1186,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1242,1243,1244,1245,1246,1247,1248,1249,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1267,1269,1276,1277,1278,1279,1281,1282,1283,1285,1315,1316,1318,1319,1320,1321,1322,1323,1356,1388,1407,1410,1428,1429,1468,1473,1498,1499,1597,],[-927,-463,-464,-465,-151,-482,-467,-461,1207,1207,1207,-602,-584,-585,-586,-587,-588,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-606,1207,-556,-535,-536,-537,-538,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-928,-560,-603,-462,-625,-466,-666,-667,-481,-534,-557,-473,-493,-528,-529,-530,-531,-532,-476,-474,-533,-396,-626,-665,-475,-607,-477,-478,-494,]),'ECU_ADDRESS_EXTENSION':([348,376,377,378,379,380,381,561,1058,1066,1126,1133,1174,1179,1180,1181,1182,1183,1184,1185,1186,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1242,1243,1244,1245,1246,1247,1248,1249,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1267,1269,1271,1276,1277,1278,1279,1281,1282,1283,1285,1315,1316,1318,1319,1320,1321,1322,1323,1327,1328,1329,1330,1331,1332,1333,1334,1335,1336,1337,1338,1339,1340,1341,1342,1356,1388,1390,1407,1410,1428,1429,1468,1473,1498,1499,1597,],[-927,-580,-581,-582,-463,-464,-465,-151,-482,-467,-461,1208,1208,1208,-602,-584,-585,-586,-587,-588,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-606,1208,-556,-535,-536,-537,-538,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-928,-560,1208,-603,-462,-625,-466,-666,-667,-481,-534,-557,-473,-493,-528,-529,-530,-531,-532,1208,-575,-562,-563,-564,-565,-566,-567,-568,-569,-570,-571,-572,-573,-574,-579,-476,-474,-576,-533,-396,-626,-665,-475,-607,-477,-478,-494,]),'AXIS_PTS_REF':([348,376,377,378,379,380,381,1058,1277,1388,1538,1555,1556,1557,1558,1559,1560,1561,1562,1563,1564,1565,1566,1567,1568,1569,1583,1584,1585,1586,1587,1588,1589,1590,1593,1603,1604,1606,],[-927,-580,-581,-582,-463,-464,-465,-482,-462,-474,1570,1570,-508,-495,-496,-497,-498,-499,-500,-501,-502,-503,-504,-505,-506,-507,-509,-512,-513,-514,-515,-516,-517,-518,-522,-519,-520,-521,]),'MAX_GRAD':([348,376,377,378,379,380,381,1058,1277,1388,1538,1555,1556,1557,1558,1559,1560,1561,1562,1563,1564,1565,1566,1567,1568,1569,1583,1584,1585,1586,1587,1588,1589,1590,1593,1603,1604,1606,],[-927,-580,-581,-582,-463,-464,-465,-482,-462,-474,1571,1571,-508,-495,-496,-497,-498,-499,-500,-501,-502,-503,-504,-505,-506,-507,-509,-512,-513,-514,-515,-516,-517,-518,-522,-519,-520,-521,]),'MONOTONY':([348,376,377,378,379,380,381,1058,1277,1388,1538,1555,1556,1557,1558,1559,1560,1561,1562,1563,1564,1565,1566,1567,1568,1569,1583,1584,1585,1586,1587,1588,1589,1590,1593,1603,1604,1606,],[-927,-580,-581,-582,-463,-464,-465,-482,-462,-474,1572,1572,-508,-495,-496,-497,-498,-499,-500,-501,-502,-503,-504,-505,-506,-507,-509,-512,-513,-514,-515,-516,-517,-518,-522,-519,-520,-521,]),'FIX_AXIS_PAR':([348,376,377,378,379,380,381,1058,1277,1388,1538,1555,1556,1557,1558,1559,1560,1561,1562,1563,1564,1565,1566,1567,1568,1569,1583,1584,1585,1586,1587,1588,1589,1590,1593,1603,1604,1606,],[-927,-580,-581,-582,-463,-464,-465,-482,-462,-474,1573,1573,-508,-495,-496,-497,-498,-499,-500,-501,-502,-503,-504,-505,-506,-507,-509,-512,-513,-514,-515,-516,-517,-518,-522,-519,-520,-521,]),'FIX_AXIS_PAR_DIST':([348,376,377,378,379,380,381,1058,1277,1388,1538,1555,1556,1557,1558,1559,1560,1561,1562,1563,1564,1565,1566,1567,1568,1569,1583,1584,1585,1586,1587,1588,1589,1590,1593,1603,1604,1606,],[-927,-580,-581,-582,-463,-464,-465,-482,-462,-474,1574,1574,-508,-495,-496,-497,-498,-499,-500,-501,-502,-503,-504,-505,-506,-507,-509,-512,-513,-514,-515,-516,-517,-518,-522,-519,-520,-521,]),'CURVE_AXIS_REF':([348,376,377,378,379,380,381,1058,1277,1388,1538,1555,1556,1557,1558,1559,1560,1561,1562,1563,1564,1565,1566,1567,1568,1569,1583,1584,1585,1586,1587,1588,1589,1590,1593,1603,1604,1606,],[-927,-580,-581,-582,-463,-464,-465,-482,-462,-474,1575,1575,-508,-495,-496,-497,-498,-499,-500,-501,-502,-503,-504,-505,-506,-507,-509,-512,-513,-514,-515,-516,-517,-518,-522,-519,-520,-521,]),'CURLY_CLOSE':([352,354,355,515,516,517,518,521,522,523,524,525,526,527,528,533,534,535,536,654,655,664,665,668,674,675,677,861,862,863,867,1083,1084,],[-941,-941,-941,653,-36,-37,-38,660,-30,-33,-73,663,-50,-51,-52,673,-64,-65,-62,-39,-40,-53,-54,-56,-63,-66,-68,-74,-31,-32,-67,-55,-57,]),'PRG_CODE':([357,],[541,]),'PRG_DATA':([357,],[542,]),'PRG_RESERVED':([357,],[543,]),'READ_WRITE':([379,380,381,561,1058,1066,1126,1133,1179,1180,1181,1182,1183,1184,1185,1186,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1276,1277,1278,1279,1281,1282,1283,1285,1356,1407,1428,1429,1473,],[-463,-464,-465,-151,-482,-467,-461,1199,1199,-602,-584,-585,-586,-587,-588,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-606,-603,-462,-625,-466,-666,-667,-481,-534,-476,-533,-626,-665,-607,]),'ARRAY_SIZE':([379,380,381,561,1058,1066,1126,1133,1179,1180,1181,1182,1183,1184,1185,1186,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1276,1277,1278,1279,1281,1282,1283,1285,1356,1407,1428,1429,1473,],[-463,-464,-465,-151,-482,-467,-461,1201,1201,-602,-584,-585,-586,-587,-588,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-606,-603,-462,-625,-466,-666,-667,-481,-534,-476,-533,-626,-665,-607,]),'ECU_ADDRESS':([379,380,381,561,1058,1066,1126,1133,1179,1180,1181,1182,1183,1184,1185,1186,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1276,1277,1278,1279,1281,1282,1283,1285,1356,1407,1428,1429,1473,],[-463,-464,-465,-151,-482,-467,-461,1204,1204,-602,-584,-585,-586,-587,-588,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-606,-603,-462,-625,-466,-666,-667,-481,-534,-476,-533,-626,-665,-607,]),'ERROR_MASK':([379,380,381,561,1058,1066,1126,1133,1179,1180,1181,1182,1183,1184,1185,1186,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1276,1277,1278,1279,1281,1282,1283,1285,1356,1407,1428,1429,1473,],[-463,-464,-465,-151,-482,-467,-461,1205,1205,-602,-584,-585,-586,-587,-588,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-606,-603,-462,-625,-466,-666,-667,-481,-534,-476,-533,-626,-665,-607,]),'STATIC':([389,],[550,]),'DYNAMIC':([389,],[551,]),'FIXED_EVENT_LIST':([394,],[558,]),'VARIABLE':([394,1031,],[559,1122,]),'COLUMN_DIR':([418,419,420,421,422,423,424,425,426,427,601,],[-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,818,]),'ROW_DIR':([418,419,420,421,422,423,424,425,426,427,601,],[-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,819,]),'ALTERNATE_WITH_X':([418,419,420,421,422,423,424,425,426,427,601,],[-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,820,]),'ALTERNATE_WITH_Y':([418,419,420,421,422,423,424,425,426,427,601,],[-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,821,]),'ALTERNATE_CURVES':([418,419,420,421,422,423,424,425,426,427,601,],[-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,822,]),'INDEX_INCR':([418,419,420,421,422,423,424,425,426,427,603,604,605,828,829,830,],[-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,824,824,824,824,824,824,]),'INDEX_DECR':([418,419,420,421,422,423,424,425,426,427,603,604,605,828,829,830,],[-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,825,825,825,825,825,825,]),'DEFAULT_VALUE':([441,573,574,578,579,580,581,583,584,736,739,740,741,742,743,744,749,750,751,752,753,754,757,758,759,934,935,936,937,939,940,941,],[582,582,582,582,-696,-694,-695,-700,-701,-104,582,-672,-669,-670,-671,-676,582,-684,-682,-683,-688,-690,-697,-679,-702,-673,-105,-680,-692,-685,-691,-703,]),'ANNOTATION':([442,456,944,1176,1239,1324,1552,],[585,585,1058,585,585,585,585,]),'DEF_CHARACTERISTIC':([442,948,],[586,1059,]),'REF_CHARACTERISTIC':([442,456,950,],[587,587,1060,]),'IN_MEASUREMENT':([442,952,],[588,1061,]),'OUT_MEASUREMENT':([442,954,],[589,1062,]),'LOC_MEASUREMENT':([442,956,],[590,1063,]),'SUB_FUNCTION':([442,958,],[591,1064,]),'REF_MEASUREMENT':([456,960,],[595,1065,]),'FUNCTION_LIST':([456,962,1176,1239,1324,],[596,1066,596,596,596,]),'SUB_GROUP':([456,964,],[597,1067,]),'BYTE':([503,],[632,]),'WORD':([503,],[633,]),'LONG':([503,],[634,]),'EXTENDED_SI':([514,],[651,]),'DERIVED':([514,],[652,]),'COMMA':([521,522,523,524,861,862,863,],[661,-30,-33,-73,-74,-31,-32,]),'EQUAL':([523,524,],[662,-73,]),'CAN_ID_BROADCAST':([560,704,705,706,707,708,709,710,711,712,713,714,715,898,899,900,901,902,903,904,905,906,907,908,909,1237,],[716,716,-171,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-172,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,]),'CAN_ID_MASTER':([560,704,705,706,707,708,709,710,711,712,713,714,715,898,899,900,901,902,903,904,905,906,907,908,909,1237,],[717,717,-171,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-172,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,]),'CAN_ID_SLAVE':([560,704,705,706,707,708,709,710,711,712,713,714,715,898,899,900,901,902,903,904,905,906,907,908,909,1237,],[718,718,-171,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-172,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,]),'BAUDRATE':([560,704,705,706,707,708,709,710,711,712,713,714,715,898,899,900,901,902,903,904,905,906,907,908,909,1237,],[719,719,-171,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-172,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,]),'SAMPLE_POINT':([560,704,705,706,707,708,709,710,711,712,713,714,715,898,899,900,901,902,903,904,905,906,907,908,909,1237,],[720,720,-171,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-172,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,]),'SAMPLE_RATE':([560,704,705,706,707,708,709,710,711,712,713,714,715,898,899,900,901,902,903,904,905,906,907,908,909,1237,],[721,721,-171,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-172,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,]),'BTL_CYCLES':([560,704,705,706,707,708,709,710,711,712,713,714,715,898,899,900,901,902,903,904,905,906,907,908,909,1237,],[722,722,-171,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-172,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,]),'SJW':([560,704,705,706,707,708,709,710,711,712,713,714,715,898,899,900,901,902,903,904,905,906,907,908,909,1237,],[723,723,-171,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-172,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,]),'SYNC_EDGE':([560,704,705,706,707,708,709,710,711,712,713,714,715,898,899,900,901,902,903,904,905,906,907,908,909,1237,],[724,724,-171,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-172,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,]),'MAX_BLOCK_SIZE':([567,],[731,]),'DEFAULT_VALUE_NUMERIC':([573,736,739,740,741,742,743,744,758,934,935,936,],[745,-104,745,-672,-669,-670,-671,-676,-679,-673,-105,-680,]),'ANNOTATION_LABEL':([585,763,764,765,766,767,945,946,947,1216,],[768,768,-486,-483,-484,-485,-487,-490,-491,-492,]),'ANNOTATION_ORIGIN':([585,763,764,765,766,767,945,946,947,1216,],[769,769,-486,-483,-484,-485,-487,-490,-491,-492,]),'VAR_MEASUREMENT':([640,831,835,979,980,981,982,1072,1073,1074,],[-106,983,-107,983,-892,-890,-891,-893,-896,-897,]),'VAR_SELECTION_CHARACTERISTIC':([640,831,835,979,980,981,982,1072,1073,1074,],[-106,984,-107,984,-892,-890,-891,-893,-896,-897,]),'FRAME_MEASUREMENT':([640,642,835,843,844,845,846,989,990,1290,],[-106,847,-107,847,-902,-900,-901,-903,-913,-906,]),'SI_EXPONENTS':([650,651,652,852,853,854,855,856,993,995,1081,1409,],[857,-937,-938,857,-933,-930,-931,-932,-934,-664,-940,-939,]),'REF_UNIT':([650,651,652,735,852,853,854,855,856,923,924,925,926,927,928,929,993,995,1050,1053,1081,1137,1358,1408,1409,],[858,-937,-938,858,858,-933,-930,-931,-932,858,-643,-638,-639,-640,-641,-642,-934,-664,-644,-663,-940,-662,-654,-661,-939,]),'UNIT_CONVERSION':([650,651,652,852,853,854,855,856,993,995,1081,1409,],[859,-937,-938,859,-933,-930,-931,-932,-934,-664,-940,-939,]),'CODE':([680,],[876,]),'DATA':([680,],[877,]),'OFFLINE_DATA':([680,],[878,]),'VARIABLES':([680,],[879,]),'SERAM':([680,],[880,]),'CALIBRATION_VARIABLES':([680,],[882,]),'EXCLUDE_FROM_FLASH':([680,],[883,]),'AVAILABLE_EVENT_LIST':([693,1113,],[891,1168,]),'DEFAULT_EVENT_LIST':([693,1116,],[892,1169,]),'DAQ_LIST_CAN_ID':([701,1170,],[896,1237,]),'SINGLE':([721,724,],[904,908,]),'TRIPLE':([721,],[905,]),'DUAL':([724,],[909,]),'COEFFS':([735,923,924,925,926,927,928,929,995,1050,1053,1137,1358,1408,],[930,930,-643,-638,-639,-640,-641,-642,-664,-644,-663,-662,-654,-661,]),'COEFFS_LINEAR':([735,923,924,925,926,927,928,929,995,1050,1053,1137,1358,1408,],[931,931,-643,-638,-639,-640,-641,-642,-664,-644,-663,-662,-654,-661,]),'COMPU_TAB_REF':([735,923,924,925,926,927,928,929,995,1050,1053,1137,1358,1408,],[932,932,-643,-638,-639,-640,-641,-642,-664,-644,-663,-662,-654,-661,]),'ANNOTATION_TEXT':([760,1138,],[943,1216,]),'PBYTE':([817,818,819,820,821,822,823,824,825,826,827,974,975,976,],[967,-824,-825,-826,-827,-828,967,-92,-93,967,967,967,967,967,]),'PWORD':([817,818,819,820,821,822,823,824,825,826,827,974,975,976,],[968,-824,-825,-826,-827,-828,968,-92,-93,968,968,968,968,968,]),'PLONG':([817,818,819,820,821,822,823,824,825,826,827,974,975,976,],[969,-824,-825,-826,-827,-828,969,-92,-93,969,969,969,969,969,]),'DIRECT':([817,818,819,820,821,822,823,824,825,826,827,974,975,976,],[970,-824,-825,-826,-827,-828,970,-92,-93,970,970,970,970,970,]),'VAR_ADDRESS':([834,1141,],[985,1217,]),'BRACE_CLOSE':([860,861,],[997,-74,]),'ASTERISK':([864,865,1000,],[998,999,1085,]),'CALIBRATION_HANDLE':([868,1148,],[1001,1223,]),'RAM':([875,876,877,878,879,880,881,882,883,],[1006,-414,-415,-416,-417,-418,-419,-420,-421,]),'EEPROM':([875,876,877,878,879,880,881,882,883,],[1007,-414,-415,-416,-417,-418,-419,-420,-421,]),'EPROM':([875,876,877,878,879,880,881,882,883,],[1008,-414,-415,-416,-417,-418,-419,-420,-421,]),'ROM':([875,876,877,878,879,880,881,882,883,],[1009,-414,-415,-416,-417,-418,-419,-420,-421,]),'REGISTER':([875,876,877,878,879,880,881,882,883,],[1010,-414,-415,-416,-417,-418,-419,-420,-421,]),'FLASH':([875,876,877,878,879,880,881,882,883,],[1011,-414,-415,-416,-417,-418,-419,-420,-421,]),'EVENT':([891,892,1025,1026,1114,1115,1448,1608,],[1027,1027,1027,-204,-205,-203,1487,1609,]),'FORMULA':([920,1286,],[1048,1358,]),'INTERN':([1005,1006,1007,1008,1009,1010,1011,],[1099,-422,-423,-424,-425,-426,-427,]),'EXTERN':([1005,1006,1007,1008,1009,1010,1011,],[1100,-422,-423,-424,-425,-426,-427,]),'OPTIMISATION_TYPE_DEFAULT':([1013,1103,1104,1105,1106,1107,1108,1156,1157,1158,1229,1230,1231,1232,1303,1304,1305,1306,1415,1416,1417,1418,1449,1450,1451,1452,1453,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1490,1576,1601,1609,],[1103,-244,-245,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,1103,-261,-262,-263,-241,-234,-235,-236,-237,1103,-264,-231,-232,-233,-238,-239,-240,-242,-243,-265,-269,-289,-268,]),'OPTIMISATION_TYPE_ODT_TYPE_16':([1013,1103,1104,1105,1106,1107,1108,1156,1157,1158,1229,1230,1231,1232,1303,1304,1305,1306,1415,1416,1417,1418,1449,1450,1451,1452,1453,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1490,1576,1601,1609,],[1104,-244,-245,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,1104,-261,-262,-263,-241,-234,-235,-236,-237,1104,-264,-231,-232,-233,-238,-239,-240,-242,-243,-265,-269,-289,-268,]),'OPTIMISATION_TYPE_ODT_TYPE_32':([1013,1103,1104,1105,1106,1107,1108,1156,1157,1158,1229,1230,1231,1232,1303,1304,1305,1306,1415,1416,1417,1418,1449,1450,1451,1452,1453,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1490,1576,1601,1609,],[1105,-244,-245,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,1105,-261,-262,-263,-241,-234,-235,-236,-237,1105,-264,-231,-232,-233,-238,-239,-240,-242,-243,-265,-269,-289,-268,]),'OPTIMISATION_TYPE_ODT_TYPE_64':([1013,1103,1104,1105,1106,1107,1108,1156,1157,1158,1229,1230,1231,1232,1303,1304,1305,1306,1415,1416,1417,1418,1449,1450,1451,1452,1453,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1490,1576,1601,1609,],[1106,-244,-245,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,1106,-261,-262,-263,-241,-234,-235,-236,-237,1106,-264,-231,-232,-233,-238,-239,-240,-242,-243,-265,-269,-289,-268,]),'OPTIMISATION_TYPE_ODT_TYPE_ALIGNMENT':([1013,1103,1104,1105,1106,1107,1108,1156,1157,1158,1229,1230,1231,1232,1303,1304,1305,1306,1415,1416,1417,1418,1449,1450,1451,1452,1453,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1490,1576,1601,1609,],[1107,-244,-245,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,1107,-261,-262,-263,-241,-234,-235,-236,-237,1107,-264,-231,-232,-233,-238,-239,-240,-242,-243,-265,-269,-289,-268,]),'OPTIMISATION_TYPE_MAX_ENTRY_SIZE':([1013,1103,1104,1105,1106,1107,1108,1156,1157,1158,1229,1230,1231,1232,1303,1304,1305,1306,1415,1416,1417,1418,1449,1450,1451,1452,1453,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1490,1576,1601,1609,],[1108,-244,-245,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,1108,-261,-262,-263,-241,-234,-235,-236,-237,1108,-264,-231,-232,-233,-238,-239,-240,-242,-243,-265,-269,-289,-268,]),'SECTOR':([1015,1510,],[1109,1536,]),'FIXED':([1031,],[1123,]),'ADDRESS_EXTENSION_FREE':([1102,1103,1104,1105,1106,1107,1108,1156,1157,1158,1229,1230,1231,1232,1303,1304,1305,1306,1415,1416,1417,1418,1449,1450,1451,1452,1453,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1490,1576,1601,1609,],[1156,-244,-245,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,1156,-261,-262,-263,-241,-234,-235,-236,-237,1156,-264,-231,-232,-233,-238,-239,-240,-242,-243,-265,-269,-289,-268,]),'ADDRESS_EXTENSION_ODT':([1102,1103,1104,1105,1106,1107,1108,1156,1157,1158,1229,1230,1231,1232,1303,1304,1305,1306,1415,1416,1417,1418,1449,1450,1451,1452,1453,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1490,1576,1601,1609,],[1157,-244,-245,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,1157,-261,-262,-263,-241,-234,-235,-236,-237,1157,-264,-231,-232,-233,-238,-239,-240,-242,-243,-265,-269,-289,-268,]),'ADDRESS_EXTENSION_DAQ':([1102,1103,1104,1105,1106,1107,1108,1156,1157,1158,1229,1230,1231,1232,1303,1304,1305,1306,1415,1416,1417,1418,1449,1450,1451,1452,1453,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1490,1576,1601,1609,],[1158,-244,-245,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,1158,-261,-262,-263,-241,-234,-235,-236,-237,1158,-264,-231,-232,-233,-238,-239,-240,-242,-243,-265,-269,-289,-268,]),'IDENTIFICATION_FIELD_TYPE_ABSOLUTE':([1103,1104,1105,1106,1107,1108,1155,1156,1157,1158,1229,1230,1231,1232,1303,1304,1305,1306,1415,1416,1417,1418,1449,1450,1451,1452,1453,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1490,1576,1601,1609,],[-244,-245,-246,-247,-248,-249,1229,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,1229,-261,-262,-263,-241,-234,-235,-236,-237,1229,-264,-231,-232,-233,-238,-239,-240,-242,-243,-265,-269,-289,-268,]),'IDENTIFICATION_FIELD_TYPE_RELATIVE_BYTE':([1103,1104,1105,1106,1107,1108,1155,1156,1157,1158,1229,1230,1231,1232,1303,1304,1305,1306,1415,1416,1417,1418,1449,1450,1451,1452,1453,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1490,1576,1601,1609,],[-244,-245,-246,-247,-248,-249,1230,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,1230,-261,-262,-263,-241,-234,-235,-236,-237,1230,-264,-231,-232,-233,-238,-239,-240,-242,-243,-265,-269,-289,-268,]),'IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD':([1103,1104,1105,1106,1107,1108,1155,1156,1157,1158,1229,1230,1231,1232,1303,1304,1305,1306,1415,1416,1417,1418,1449,1450,1451,1452,1453,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1490,1576,1601,1609,],[-244,-245,-246,-247,-248,-249,1231,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,1231,-261,-262,-263,-241,-234,-235,-236,-237,1231,-264,-231,-232,-233,-238,-239,-240,-242,-243,-265,-269,-289,-268,]),'IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD_ALIGNED':([1103,1104,1105,1106,1107,1108,1155,1156,1157,1158,1229,1230,1231,1232,1303,1304,1305,1306,1415,1416,1417,1418,1449,1450,1451,1452,1453,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1490,1576,1601,1609,],[-244,-245,-246,-247,-248,-249,1232,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,1232,-261,-262,-263,-241,-234,-235,-236,-237,1232,-264,-231,-232,-233,-238,-239,-240,-242,-243,-265,-269,-289,-268,]),'GRANULARITY_ODT_ENTRY_SIZE_DAQ_BYTE':([1103,1104,1105,1106,1107,1108,1156,1157,1158,1228,1229,1230,1231,1232,1303,1304,1305,1306,1415,1416,1417,1418,1449,1450,1451,1452,1453,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1490,1576,1601,1609,],[-244,-245,-246,-247,-248,-249,-250,-251,-252,1303,-253,-254,-255,-256,-257,-258,-259,-260,1303,-261,-262,-263,-241,-234,-235,-236,-237,1303,-264,-231,-232,-233,-238,-239,-240,-242,-243,-265,-269,-289,-268,]),'GRANULARITY_ODT_ENTRY_SIZE_DAQ_WORD':([1103,1104,1105,1106,1107,1108,1156,1157,1158,1228,1229,1230,1231,1232,1303,1304,1305,1306,1415,1416,1417,1418,1449,1450,1451,1452,1453,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1490,1576,1601,1609,],[-244,-245,-246,-247,-248,-249,-250,-251,-252,1304,-253,-254,-255,-256,-257,-258,-259,-260,1304,-261,-262,-263,-241,-234,-235,-236,-237,1304,-264,-231,-232,-233,-238,-239,-240,-242,-243,-265,-269,-289,-268,]),'GRANULARITY_ODT_ENTRY_SIZE_DAQ_DWORD':([1103,1104,1105,1106,1107,1108,1156,1157,1158,1228,1229,1230,1231,1232,1303,1304,1305,1306,1415,1416,1417,1418,1449,1450,1451,1452,1453,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1490,1576,1601,1609,],[-244,-245,-246,-247,-248,-249,-250,-251,-252,1305,-253,-254,-255,-256,-257,-258,-259,-260,1305,-261,-262,-263,-241,-234,-235,-236,-237,1305,-264,-231,-232,-233,-238,-239,-240,-242,-243,-265,-269,-289,-268,]),'GRANULARITY_ODT_ENTRY_SIZE_DAQ_DLONG':([1103,1104,1105,1106,1107,1108,1156,1157,1158,1228,1229,1230,1231,1232,1303,1304,1305,1306,1415,1416,1417,1418,1449,1450,1451,1452,1453,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1490,1576,1601,1609,],[-244,-245,-246,-247,-248,-249,-250,-251,-252,1306,-253,-254,-255,-256,-257,-258,-259,-260,1306,-261,-262,-263,-241,-234,-235,-236,-237,1306,-264,-231,-232,-233,-238,-239,-240,-242,-243,-265,-269,-289,-268,]),'PRESCALER_SUPPORTED':([1103,1104,1105,1106,1107,1108,1156,1157,1158,1229,1230,1231,1232,1303,1304,1305,1306,1415,1416,1417,1418,1449,1450,1451,1452,1453,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1490,1576,1601,1609,],[-244,-245,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,1464,-261,-262,-263,-241,-234,-235,-236,-237,1464,-264,-231,-232,-233,-238,-239,-240,-242,-243,-265,-269,-289,-268,]),'RESUME_SUPPORTED':([1103,1104,1105,1106,1107,1108,1156,1157,1158,1229,1230,1231,1232,1303,1304,1305,1306,1415,1416,1417,1418,1449,1450,1451,1452,1453,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1490,1576,1601,1609,],[-244,-245,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,1465,-261,-262,-263,-241,-234,-235,-236,-237,1465,-264,-231,-232,-233,-238,-239,-240,-242,-243,-265,-269,-289,-268,]),'FORMULA_INV':([1134,1211,1212,1213,1287,1288,],[1214,1214,-656,-655,-657,-660,]),'PAGE':([1161,1511,],[1234,1537,]),'BIT_OPERATION':([1176,1391,],[1272,1428,]),'VIRTUAL':([1176,1395,],[1273,1429,]),'MAP_LIST':([1239,1421,],[1310,1468,]),'DEPENDENT_CHARACTERISTIC':([1239,1469,],[1311,1498,]),'VIRTUAL_CHARACTERISTIC':([1239,1470,],[1312,1499,]),'AXIS_DESCR':([1239,1582,],[1313,1597,]),'CALIBRATION':([1270,],[1320,]),'NO_CALIBRATION':([1270,],[1321,]),'NOT_IN_MCD_SYSTEM':([1270,],[1322,]),'OFFLINE_CALIBRATION':([1270,],[1323,]),'LEFT_SHIFT':([1272,1345,1346,1347,1348,1349,1352,1392,1393,1394,],[1350,1350,-630,-627,-628,-629,-636,-631,-634,-635,]),'RIGHT_SHIFT':([1272,1345,1346,1347,1348,1349,1352,1392,1393,1394,],[1351,1351,-630,-627,-628,-629,-636,-631,-634,-635,]),'SIGN_EXTEND':([1272,1345,1346,1347,1348,1349,1352,1392,1393,1394,],[1352,1352,-630,-627,-628,-629,-636,-631,-634,-635,]),'STD_AXIS':([1313,],[1382,]),'FIX_AXIS':([1313,],[1383,]),'COM_AXIS':([1313,],[1384,]),'RES_AXIS':([1313,],[1385,]),'CURVE_AXIS':([1313,],[1386,]),'NO_OVERLOAD_INDICATION':([1375,],[1416,]),'OVERLOAD_INDICATION_PID':([1375,],[1417,]),'OVERLOAD_INDICATION_EVENT':([1375,],[1418,]),'DAQ_LIST':([1448,1540,],[1486,1576,]),'TIMESTAMP_SUPPORTED':([1448,1595,],[1488,1601,]),'INIT_SEGMENT':([1467,1494,1495,1496,1512,1513,],[1497,1497,-448,-447,-449,-452,]),'STIM':([1528,1550,],[1544,1544,]),'DAQ_STIM':([1528,1550,],[1545,1545,]),'TIMESTAMP_FIXED':([1551,],[1580,]),'FIX_AXIS_PAR_LIST':([1552,1602,],[1581,1606,]),'MON_INCREASE':([1572,],[1587,]),'MON_DECREASE':([1572,],[1588,]),'STRICT_INCREASE':([1572,],[1589,]),'STRICT_DECREASE':([1572,],[1590,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'compu_method_conversion_type':([277,],[433,]),'if_data_measurement_optional_parameter_list_optional':([1315,],[1380,]),'no_axis_pts_z':([94,190,],[169,169,]),'project_optional':([19,24,],[24,24,]),'number_number_string_value':([401,551,557,],[557,557,557,]),'measurement':([34,49,],[58,58,]),'in_measurement_optional_list':([627,780,],[779,951,]),'deposit':([93,154,1246,1324,1518,1562,],[150,150,1323,1323,1546,1546,]),'function':([34,49,],[47,47,]),'supplier':([134,309,],[291,291,]),'event':([1436,1464,],[1454,1454,]),'unit_type':([465,],[616,]),'header_optional':([33,40,],[40,40,]),'user_rights_optional_list_optional':([97,],[246,]),'group_optional_list_optional':([245,],[408,]),'prescaler_supported':([1436,1464,],[1459,1459,]),'protocol_layer_optional':([1440,1471,],[1471,1471,]),'a2ml_type_definition':([79,131,],[120,120,]),'s_rec_layout':([93,154,],[158,158,]),'user_rights_optional':([97,249,],[249,249,]),'number_string_value':([652,851,859,],[851,851,851,]),'a2ml_taggedunion_member_list_optional':([424,],[585,]),'a2ml_struct_type_name':([79,131,269,425,582,593,594,726,],[125,125,125,125,125,125,125,125,]),'compu_tab_conversion_type':([317,],[490,]),'default_value_numeric':([630,796,],[797,797,]),'byte_order_type':([162,],[359,]),'mod_common_optional_list':([93,154,],[165,355,]),'xcp_on_can_optional_list':([640,837,],[840,979,]),'coeffs_linear':([739,913,],[905,905,]),'pgm_optional_list_optional':([967,],[1057,]),'compu_vtab_range_optional_list_optional':([401,],[552,]),'sector':([967,1059,],[1058,1058,]),'project_no':([33,40,],[36,36,]),'function_list_optional_list':([565,691,],[690,880,]),'available_event_list_optional_list_optional':([963,964,],[1054,1055,]),'shift_op_y':([94,190,],[194,194,]),'page_optional_parameter_list':([1451,1490,],[1489,1508,]),'variant_coding_optional':([78,103,],[103,103,]),'if_data_axis_pts':([1246,1324,],[1321,1321,]),'if_data_memory_layout_optional_list_optional':([1228,],[1299,]),'compu_vtab_optional_list':([652,859,],[858,996,]),'monotony_type':([1553,],[1583,]),'if_data_module_optional_list':([143,340,],[341,504,]),'if_data_memory_layout_optional_list':([1228,1294,],[1301,1362,]),'a2ml_tag':([121,424,427,587,597,598,],[269,582,594,582,594,594,]),'src_addr_y':([94,190,],[172,172,]),'dp_blob':([1228,1294,1315,1385,],[1296,1296,1382,1382,]),'axis_pts_optional_list_optional':([1246,],[1330,]),'def_characteristic_optional':([624,768,],[768,768,]),'compu_vtab_optional_list_optional':([652,],[854,]),'rip_addr_w':([94,190,],[212,212,]),'user_rights_optional_list':([97,249,],[250,415,]),'compu_tab_optional_list_optional':([630,],[795,]),'a2ml':([34,49,],[61,61,]),'if_data_xcp_optional':([142,324,],[324,324,]),'module_optional_list':([34,49,],[63,71,]),'if_data_module':([34,49,],[64,64,]),'no_of_interfaces':([134,309,],[283,283,]),'memory_segment_optional':([1302,1372,],[1372,1372,]),'sub_group':([245,403,],[412,412,]),'frame_optional_list_optional':([620,],[755,]),'sign_extend':([1235,1308,],[1312,1312,]),'source_optional_list_optional':([990,],[1071,]),'axis_pts':([34,49,],[45,45,]),'init_segment':([1451,1490,],[1494,1494,]),'function_optional':([315,470,],[470,470,]),'mod_par':([34,49,],[46,46,]),'dist_op_z':([94,190,],[214,214,]),'compu_vtab_in_val_out_val':([652,859,],[856,856,]),'if_data_module_optional':([143,340,],[340,340,]),'compu_vtab_range_in_val_out_val':([401,551,],[558,558,]),'function_list':([245,403,1109,1189,1202,1246,1252,1324,],[406,406,1167,1167,1253,1325,1253,1325,]),'if_data_frame_optional_list_optional':([1040,],[1114,]),'mod_common':([34,49,],[48,48,]),'a2ml_array_specifier':([588,1013,],[721,1086,]),'daq_event_optional':([633,634,813,],[813,813,813,]),'if_data_memory_layout':([1023,1098,1202,1246,1252,1324,],[1094,1094,1264,1327,1264,1327,]),'ref_measurement':([245,403,],[405,405,]),'unit':([34,49,],[55,55,]),'daq_list_optional':([1513,1532,],[1532,1532,]),'ba_blob':([1228,1294,],[1298,1298,]),'pag_optional_list':([632,803,],[805,960,]),'if_data_measurement_optional_parameter':([1315,1385,],[1385,1385,]),'virtual':([1109,1189,],[1186,1186,]),'formula_inv':([1093,1156,],[1155,1155,]),'tp_blob':([143,340,],[346,346,]),'fix_no_axis_pts_x':([94,190,],[219,219,]),'axis_descr_optional_list':([1518,1562,],[1561,1587,]),'characteristic_optional_list_optional':([1202,],[1262,]),'fix_no_axis_pts_y':([94,190,],[175,175,]),'if_data_memory_layout_optional':([1228,1294,],[1294,1294,]),'monotony':([1518,1562,],[1542,1542,]),'max_grad':([1518,1562,],[1543,1543,]),'if_data_xcp':([34,49,1109,1189,1302,1372,],[54,54,1180,1180,1370,1370,]),'daq_optional_list_optional':([1436,],[1463,]),'identification':([94,190,],[225,225,]),'memory_segment_attributes':([1028,],[1101,]),'if_data_frame_optional':([1040,1113,],[1113,1113,]),'var_selection_characteristic':([713,891,],[895,895,]),'seed_key':([143,340,],[347,347,]),'sub_group_optional_list_optional':([563,],[675,]),'pag_optional_list_optional':([632,],[806,]),'max_odt_entries':([1513,1532,],[1524,1524,]),'sub_function_optional_list':([626,776,],[777,949,]),'axis_pts_ref':([1518,1562,],[1551,1551,]),'identifier':([416,563,566,567,574,624,625,626,627,628,677,693,701,768,773,776,780,786,],[570,673,696,700,570,764,770,774,782,784,673,696,700,764,770,774,782,784,]),'datasize':([379,],[528,]),'daq':([142,324,],[328,328,]),'dependent_characteristic':([1202,1252,],[1272,1272,]),'sync_edge':([640,837,],[835,835,]),'axis_descr_attribute':([1350,],[1400,]),'qp_data':([1116,],[1201,]),'calibration_handle':([742,930,],[932,932,]),'pgm_optional':([967,1059,],[1059,1059,]),'a2ml_enum_type_name':([79,131,269,425,582,593,594,726,],[124,124,124,124,124,124,124,124,]),'memory_segment_memory_type':([920,],[1028,]),'memory_layout':([134,309,],[307,307,]),'sub_group_optional_list':([563,677,],[676,874,]),'a2ml_taggedunion_member':([424,587,],[587,587,]),'memory_segment_optional_parameter_list':([1302,1372,],[1373,1412,]),'ref_memory_segment':([1109,1189,1202,1246,1252,1324,],[1193,1193,1276,1335,1276,1335,]),'identification_field_type':([1216,1436,1464,],[1285,1452,1452,]),'extended_limits':([1202,1246,1252,1324,1518,1562,],[1249,1320,1249,1320,1541,1541,]),'source':([143,340,],[335,335,]),'can_id_slave':([640,837,],[828,828,]),'datatype':([311,365,366,370,371,372,373,375,376,377,378,380,381,382,383,384,385,386,387,388,389,390,392,393,394,395,396,397,398,399,400,],[463,516,517,519,520,521,522,523,524,525,526,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,]),'daq_event_optional_list_optional':([633,634,],[808,814,]),'var_naming':([78,103,],[101,101,]),'sjw':([640,837,],[824,824,]),'annotation_label':([564,685,],[683,683,]),'error_mask':([1109,1189,],[1166,1166,]),'module_optional':([34,49,],[49,49,]),'default_event_list':([633,634,813,],[812,812,812,]),'max_refresh':([1109,1189,1202,1252,],[1168,1168,1255,1255,]),'resume_supported':([1436,1464,],[1458,1458,]),'available_event_list_optional_list':([963,964,1051,],[1050,1050,1118,]),'sample_point':([640,837,],[831,831,]),'group_optional_list':([245,403,],[409,561,]),'alignment_word':([93,94,154,190,],[156,179,156,179,]),'calibration_access':([1202,1246,1252,1324,],[1270,1328,1270,1328,]),'display_identifier':([990,1078,1109,1189,1202,1246,1252,1324,],[1076,1076,1172,1172,1260,1333,1260,1333,]),'function_optional_list':([315,470,],[477,621,]),'fix_no_axis_pts_z':([94,190,],[230,230,]),'daq_event':([142,324,],[326,326,]),'var_criterion_optional_list_optional':([713,],[893,]),'bit_operation_optional_list_optional':([1235,],[1311,]),'unit_optional_list':([616,750,],[751,938,]),'dist_op_y':([94,190,],[186,186,]),'a2ml_taggedstruct_member_list_optional':([427,],[596,]),'dist_op_x':([94,190,],[192,192,]),'var_criterion':([78,103,],[100,100,]),'bit_operation_optional':([1235,1308,],[1308,1308,]),'daq_list_type':([1513,1532,],[1523,1523,]),'unit_optional_list_optional':([616,],[749,]),'variant_coding_optional_list':([78,103,],[102,256,]),'axis_pts_x':([94,190,],[205,205,]),'xcp_on_can_optional_list_optional':([640,],[826,]),'a2l_optional_list_optional':([0,],[5,]),'a2ml_taggedstruct_definition':([427,597,598,],[601,601,733,]),'pa_blob':([1315,1385,],[1388,1388,]),'calibration_handle_optional':([1033,1107,],[1107,1107,]),'src_addr_x':([94,190,],[199,199,]),'if_data_memory_segment':([1302,1372,],[1371,1371,]),'kp_data_parameter_optional_list':([1384,1420,],[1417,1444,]),'characteristic_optional_list':([1202,1252,],[1273,1344,]),'a2ml_struct_member_list':([425,593,],[589,725,]),'overload_indication':([1408,],[1436,]),'deposit_mode':([166,],[363,]),'read_write':([1109,1189,],[1188,1188,]),'pag_optional':([632,803,],[803,803,]),'frame_optional':([620,761,],[761,761,]),'calibration_method_optional_list_optional':([742,],[931,]),'compu_tab_ref':([739,913,],[914,914,]),'ecu_calibration_offset':([134,309,],[308,308,]),'alignment_byte':([93,94,154,190,],[164,231,164,231,]),'var_characteristic_optional':([580,],[710,]),'if_data_xcp_optional_list_optional':([142,],[318,]),'timestamp_supported':([1436,1464,],[1467,1467,]),'compu_vtab_range':([34,49,],[44,44,]),'if_data_measurement':([1109,1189,],[1163,1163,]),'header_optional_list_optional':([33,],[38,]),'calibration_handle_optional_list_optional':([1033,],[1104,]),'characteristic_optional':([1202,1252,],[1252,1252,]),'event_fixed':([1513,1532,],[1526,1526,]),'rip_addr_y':([94,190,],[215,215,]),'optimisation_type':([1067,1436,1464,],[1134,1462,1462,]),'def_characteristic_optional_list':([624,768,],[766,946,]),'var_forbidden_comb_criterion_list':([258,],[419,]),'compu_vtab_range_optional_list':([401,551,],[560,667,]),'comparison_quantity':([1202,1252,],[1254,1254,]),'user_rights':([34,49,],[56,56,]),'available_event_list_optional':([963,964,1051,],[1051,1051,1051,]),'memory_segment_optional_list_optional':([1302,],[1368,]),'def_characteristic_optional_list_optional':([624,],[767,]),'alignment_long':([93,94,154,190,],[157,218,157,218,]),'out_measurement':([315,470,],[475,475,]),'addrtype':([654,658,664,665,860,866,870,],[864,867,868,869,997,998,999,]),'record_layout_optional':([94,190,],[190,190,]),'page_optional_parameter':([1451,1490,],[1490,1490,]),'memory_layout_optional_list':([1023,1098,],[1097,1158,]),'byte_order':([93,154,1109,1189,1202,1246,1252,1324,1518,1562,],[161,161,1171,1171,1259,1334,1259,1334,1558,1558,]),'matrix_dim':([1109,1189,1202,1252,],[1173,1173,1261,1261,]),'virtual_characteristic':([1202,1252,],[1266,1266,]),'asap2_version':([0,2,],[7,7,]),'phone_no':([134,309,],[298,298,]),'axis_pts_optional':([1246,1324,],[1324,1324,]),'number_string_value_list':([652,851,859,],[852,993,852,]),'page_optional_parameter_list_optional':([1451,],[1491,]),'segment':([142,324,1442,1482,],[319,319,1475,1475,]),'if_data_frame':([620,761,],[758,758,]),'customer':([134,309,],[295,295,]),'out_measurement_optional_list_optional':([625,],[772,]),'generic_parameter_list':([142,143,324,333,340,346,500,632,803,967,1059,1296,1298,1382,1388,1425,1440,1471,1513,1532,],[323,344,323,494,344,507,639,802,802,1060,1060,1363,1366,1363,1366,1445,1472,1472,1522,1522,]),'a2ml_type_name':([79,131,269,425,582,593,594,726,],[112,112,426,588,588,588,588,588,]),'number_number_string_value_list':([401,551,557,],[556,556,671,]),'ref_characteristic':([245,315,403,470,],[411,479,411,479,]),'calibration_method_optional':([742,930,],[930,930,]),'ecu_address':([1109,1189,],[1190,1190,]),'in_val_out_val':([630,796,],[794,794,]),'no_rescale_x':([94,190,],[181,181,]),'a2ml_constant':([720,737,],[898,904,]),'if_data_memory_segment_optional':([1442,1482,],[1482,1482,]),'out_measurement_optional':([625,773,],[773,773,]),'in_measurement':([315,470,],[480,480,]),'ref_group_optional_list':([416,574,],[572,704,]),'a2ml_taggedstruct_type_name':([79,131,269,425,582,593,594,726,],[117,117,117,117,117,117,117,117,]),'daq_list_can_id_optional_optional':([1066,],[1128,]),'empty':([0,19,33,34,78,93,94,97,115,119,123,132,134,142,143,245,315,401,416,424,425,427,500,563,564,565,566,567,580,588,594,616,620,624,625,626,627,628,630,632,633,634,640,652,713,739,742,963,964,967,990,1023,1033,1040,1066,1093,1109,1125,1202,1228,1235,1246,1302,1315,1405,1436,1440,1442,1451,1513,1518,1564,],[1,20,35,59,105,152,232,247,264,264,264,264,300,327,343,410,473,553,571,584,591,595,638,674,679,689,694,699,709,719,728,744,756,765,771,775,781,785,791,800,807,807,832,853,889,910,928,1052,1052,1061,1072,1095,1105,1115,1129,1153,1184,1208,1271,1295,1306,1329,1369,1381,1431,1465,1470,1480,1492,1534,1552,1590,]),'first_pid':([1513,1532,],[1525,1525,]),'loc_measurement_optional_list':([628,786,],[787,953,]),'frame_measurement':([620,761,],[757,757,]),'daq_event_optional_list':([633,634,813,],[809,809,965,]),'daq_optional_list':([1436,1464,],[1466,1496,]),'generic_parameter_list_optional':([500,],[637,]),'in_measurement_optional':([627,780,],[780,780,]),'measurement_optional_list':([1109,1189,],[1192,1243,]),'ref_characteristic_optional':([567,701,],[701,701,]),'xcp_on_can':([142,324,],[331,331,]),'sub_function_optional':([626,776,],[776,776,]),'predefined':([1513,1532,],[1537,1537,]),'if_data_measurement_unsupported_element':([1315,1385,],[1379,1379,]),'rip_addr_x':([94,190,],[168,168,]),'protocol_layer':([142,324,],[321,321,]),'a2ml_declaration_list':([79,131,],[111,274,]),'ref_group_optional_list_optional':([416,],[573,]),'no_axis_pts_x':([94,190,],[170,170,]),'formula_optional':([1093,1156,],[1156,1156,]),'qp_blob':([990,1078,],[1075,1075,]),'project_optional_list_optional':([19,],[23,]),'compu_vtab':([34,49,],[43,43,]),'function_list_optional':([565,691,],[691,691,]),'sub_group_optional':([563,677,],[677,677,]),'if_data_module_optional_list_optional':([143,],[342,]),'compu_vtab_range_optional':([401,551,],[551,551,]),'daq_list_can_id_type_fixed':([1066,],[1130,]),'daq_list_optional_list_optional':([1513,],[1527,]),'read_only':([97,249,1202,1246,1252,1324,1518,1562,],[248,248,1258,1331,1258,1331,1554,1554,]),'var_characteristic_optional_optional':([580,],[712,]),'function_list_optional_list_optional':([565,],[692,]),'frame':([34,49,],[52,52,]),'indexorder':([535,540,542,653,657,666,],[654,664,665,860,866,870,]),'a2ml_block_definition':([79,131,424,427,587,597,598,],[126,126,586,600,586,600,732,]),'memory_segment':([134,309,],[290,290,]),'a2ml_enumerator_list':([428,736,],[605,903,]),'addr_epk':([134,309,],[292,292,]),'loc_measurement':([315,470,],[469,469,]),'bit_mask':([1109,1189,1202,1252,],[1178,1178,1265,1265,]),'axis_rescale_x':([94,190,],[189,189,]),'group_optional':([245,403,],[403,403,]),'calibration_method':([134,309,],[296,296,]),'root':([245,403,],[404,404,]),'annotation_optional_list':([564,685,],[681,877,]),'a2ml_member_optional':([594,],[727,]),'src_addr_z':([94,190,],[195,195,]),'alignment_float64_ieee':([93,94,154,190,],[149,216,149,216,]),'record_layout':([34,49,],[62,62,]),'protocol_layer_optional_list_optional':([1440,],[1474,]),'axis_rescale_y':([94,190,],[200,200,]),'var_measurement':([713,891,],[896,896,]),'address_extension':([1134,1436,1464,],[1216,1456,1456,]),'max_odt':([1513,1532,],[1535,1535,]),'offset_x':([94,190,],[204,204,]),'kp_blob':([1315,1385,],[1384,1384,]),'xcp_on_can_optional':([640,837,],[837,837,]),'unit_conversion':([616,750,],[748,748,]),'a2ml_taggedstruct_member_list':([427,597,],[599,731,]),'fix_axis_par':([1518,1562,],[1559,1559,]),'memory_layout_optional':([1023,1098,],[1098,1098,]),'memory_layout_prg_type':([451,],[611,]),'pag':([142,324,],[320,320,]),'in_measurement_optional_list_optional':([627,],[783,]),'compu_method_optional_list_optional':([739,],[909,]),'axis_pts_y':([94,190,],[210,210,]),'baudrate':([640,837,],[818,818,]),'a2ml_taggedunion_member_list':([424,587,],[583,718,]),'granularity_odt_entry':([1285,1436,1464,],[1355,1453,1453,]),'project':([0,2,],[3,3,]),'format':([1109,1189,1202,1246,1252,1324,1518,1562,],[1191,1191,1274,1332,1274,1332,1555,1555,]),'address_mapping':([1442,1482,],[1479,1479,]),'if_data_characteristic':([1202,1252,],[1251,1251,]),'number_list':([630,793,796,847,887,918,1229,1588,],[790,956,790,989,1007,1023,1302,1597,]),'available_event_list':([633,634,813,],[810,810,810,]),'out_measurement_optional_list':([625,773,],[769,948,]),'protocol_layer_optional_list':([1440,1471,],[1473,1500,]),'annotation_optional':([564,685,],[685,685,]),'curve_axis_ref':([1518,1562,],[1557,1557,]),'can_id_broadcast':([640,837,],[829,829,]),'compu_method':([34,49,],[50,50,]),'fix_axis_par_dist':([1518,1562,],[1550,1550,]),'fix_axis_par_list':([1518,1562,],[1547,1547,]),'data_size':([93,154,],[155,155,]),'a2ml_identifier':([115,119,123,132,],[263,266,271,275,]),'ref_measurement_optional':([566,693,],[693,693,]),'checksum':([143,340,1125,1210,],[345,345,1211,1211,]),'right_shift':([1235,1308,],[1309,1309,]),'compu_tab_optional':([630,796,],[796,796,]),'a2l_optional':([0,2,],[2,2,]),'unit_optional':([616,750,],[750,750,]),'if_data_measurement_optional_parameter_list':([1315,1385,],[1387,1423,]),'project_optional_list':([19,24,],[22,28,]),'axis_descr_optional_list_optional':([1518,],[1548,]),'calibration_handle_optional_list':([1033,1107,],[1108,1162,]),'compu_vtab_conversion_type':([349,],[514,]),'variant_coding_optional_list_optional':([78,],[98,]),'a2ml_enumerator':([428,736,],[603,603,]),'daq_list_can_id_optional':([1066,],[1131,]),'daq_list_can_id':([640,837,],[836,836,]),'a2ml_keyword':([428,736,],[604,604,]),'compu_method_optional_list':([739,913,],[906,1021,]),'annotation_text':([564,685,],[682,682,]),'record_layout_optional_list_optional':([94,],[177,]),'sample_rate':([640,837,],[825,825,]),'reserved':([94,190,],[227,227,]),'daq_list_type_enum':([1533,1575,],[1571,1593,]),'pgm':([142,324,],[325,325,]),'alignment_float32_ieee':([93,94,154,190,],[153,178,153,178,]),'annotation_optional_list_optional':([564,],[686,]),'a2ml_identifier_optional':([115,119,123,132,],[265,267,272,276,]),'max_block_size':([646,],[844,]),'btl_cycles':([640,837,],[834,834,]),'measurement_optional':([1109,1189,],[1189,1189,]),'axis_pts_z':([94,190,],[236,236,]),'si_exponents':([616,750,],[753,753,]),'if_data_xcp_optional_list':([142,324,],[329,493,]),'shift_op_z':([94,190,],[182,182,]),'segment_optional_parameter':([1125,1210,],[1210,1210,]),'if_data_memory_segment_optional_list':([1442,1482,],[1481,1504,]),'page':([1125,1210,],[1212,1212,]),'ref_unit':([616,739,750,913,],[747,915,747,915,]),'source_optional':([990,1078,],[1078,1078,]),'a2ml_taggedunion_type_name':([79,131,269,425,582,593,594,726,],[130,130,130,130,130,130,130,130,]),'bit_operation_optional_list':([1235,1308,],[1313,1376,]),'group':([34,49,],[65,65,]),'ident_list':([421,579,581,759,1237,1349,1397,1405,],[580,707,713,942,1316,1398,1428,1432,]),'fnc_values_index_mode':([539,],[658,]),'rip_addr_z':([94,190,],[167,167,]),'user':([134,309,],[279,279,]),'source_optional_list':([990,1078,],[1073,1145,]),'measurement_optional_list_optional':([1109,],[1170,]),'bit_operation':([1109,1189,],[1164,1164,]),'fnc_values':([94,190,],[171,171,]),'compu_tab':([34,49,],[57,57,]),'var_criterion_optional_list':([713,891,],[894,1010,]),'characteristic_type':([316,],[486,]),'system_constant':([134,309,],[287,287,]),'a2ml_struct_member_list_optional':([425,],[590,]),'a2ml_struct_member':([425,593,],[593,593,]),'mod_common_optional':([93,154,],[154,154,]),'variant_coding':([34,49,],[51,51,]),'memory_layout_optional_list_optional':([1023,],[1096,]),'compu_tab_optional_list':([630,796,],[792,958,]),'shift_op_x':([94,190,],[180,180,]),'mod_par_optional_list_optional':([134,],[285,]),'left_shift':([1235,1308,],[1307,1307,]),'a2l':([0,],[8,]),'string_list':([879,1002,],[1003,1082,]),'var_forbidden_comb_criterion_optional':([258,420,578,],[420,578,578,]),'compu_method_optional':([739,913,],[913,913,]),'guard_rails':([1202,1246,1252,1324,],[1268,1326,1268,1326,]),'var_separator':([78,103,],[108,108,]),'axis_pts_optional_list':([1246,1324,],[1322,1393,]),'axis_descr_optional':([1518,1562,],[1562,1562,]),'dp_data':([1296,1382,],[1364,1416,]),'a2ml_version':([0,2,],[10,10,]),'if_data_frame_optional_list':([1040,1113,],[1112,1198,]),'freeze_supported':([632,803,],[801,801,]),'segment_optional_parameter_list_optional':([1125,],[1209,]),'raster':([143,340,],[337,337,]),'no_rescale_z':([94,190,],[193,193,]),'ref_measurement_optional_list':([566,693,],[697,882,]),'can_id_master':([640,837,],[823,823,]),'a2ml_array_specifier_optional':([588,],[722,]),'daq_config_type':([502,],[642,]),'daq_optional':([1436,1464,],[1464,1464,]),'no_rescale_y':([94,190,],[222,222,]),'loc_measurement_optional':([628,786,],[786,786,]),'sub_function':([315,470,],[472,472,]),'ref_group_optional':([416,574,],[574,574,]),'ref_characteristic_optional_list':([567,701,],[698,884,]),'version':([33,40,134,309,],[41,41,299,299,]),'var_forbidden_comb':([78,103,],[104,104,]),'offset_z':([94,190,],[203,203,]),'var_characteristic':([78,103,],[106,106,]),'array_size':([1109,1189,],[1187,1187,]),'epk':([134,309,],[303,303,]),'formula_optional_list_optional':([1093,],[1154,]),'number':([1202,1252,],[1275,1275,]),'function_optional_list_optional':([315,],[476,]),'customer_no':([134,309,],[280,280,]),'kp_data':([1384,],[1421,]),'module':([19,24,],[25,25,]),'no_axis_pts_y':([94,190,],[209,209,]),'var_forbidden_comb_criterion_optional_list':([420,578,],[577,706,]),'var_criterion_optional':([713,891,],[891,891,]),'if_data_memory_segment_optional_list_optional':([1442,],[1477,]),'generic_parameter':([142,143,324,333,340,346,500,632,803,967,1059,1116,1296,1298,1382,1388,1425,1440,1442,1471,1482,1513,1532,],[333,333,333,333,333,333,333,333,333,333,333,1200,333,333,333,333,333,333,1478,333,1478,333,333,]),'calibration_method_optional_list':([742,930,],[929,1031,]),'daq_list':([1436,1464,],[1457,1457,]),'event_group':([143,340,],[338,338,]),'kp_data_parameter_optional':([1384,1420,],[1420,1420,]),'ref_measurement_optional_list_optional':([566,],[695,]),'ref_characteristic_optional_list_optional':([567,],[702,]),'formula_optional_list':([1093,1156,],[1151,1226,]),'segment_optional_parameter_list':([1125,1210,],[1207,1282,]),'coeffs':([739,913,],[908,908,]),'memory_segment_prg_type':([741,],[920,]),'header':([19,24,],[21,21,]),'daq_list_optional_list':([1513,1532,],[1530,1569,]),'daq_list_can_id_type_variable':([1066,],[1132,]),'timestamp_fixed':([1564,],[1589,]),'if_data_module_unsupported_element':([143,340,],[336,336,]),'offset_y':([94,190,],[239,239,]),'virtual_characteristic_optional':([1405,],[1433,]),'a2ml_member':([425,582,593,594,726,],[592,715,592,729,900,]),'annotation':([245,315,403,470,1109,1189,1202,1246,1252,1324,1518,1562,],[402,468,402,468,1177,1177,1263,1319,1263,1319,1540,1540,]),'cpu_type':([134,309,],[294,294,]),'calibration_access_type':([1248,],[1339,]),'header_optional_list':([33,40,],[37,69,]),'characteristic':([34,49,],[53,53,]),'a2ml_taggedstruct_member':([427,597,],[597,597,]),'a2ml_predefined_type_name':([79,131,269,425,582,593,594,726,],[127,127,127,127,127,127,127,127,]),'mod_par_optional_list':([134,309,],[297,450,]),'mod_par_optional':([134,309,],[309,309,]),'a2l_optional_list':([0,2,],[4,12,]),'pa_data':([1298,1388,],[1365,1424,]),'default_value':([401,551,630,652,796,859,],[559,559,798,857,798,857,]),'ecu_address_extension':([1109,1189,1202,1246,1252,1324,],[1195,1195,1278,1336,1278,1336,]),'pgm_optional_list':([967,1059,],[1062,1123,]),'sub_function_optional_list_optional':([626,],[778,]),'axis_descr':([1202,1252,],[1269,1269,]),'a2ml_declaration':([79,131,],[131,131,]),'formula':([739,913,],[916,916,]),'function_version':([315,470,],[474,474,]),'record_layout_optional_list':([94,190,],[241,374,]),'module_optional_list_optional':([34,],[60,]),'ecu':([134,309,],[305,305,]),'ref_group':([97,249,],[251,251,]),'mod_common_optional_list_optional':([93,],[146,]),'var_address':([580,],[708,]),'annotation_origin':([564,685,],[684,684,]),'loc_measurement_optional_list_optional':([628,],[788,]),'axis_rescale_z':([94,190,],[240,240,]),'compu_vtab_optional':([652,859,],[859,859,]),'frame_optional_list':([620,761,],[760,943,]),'map_list':([1202,1252,],[1277,1277,]),'tp_data':([346,],[506,]),'def_characteristic':([315,470,],[471,471,]),}
+_lr_goto_items = {'a2l':([0,],[1,]),'a2l_optional_list_optional':([0,],[2,]),'empty':([0,19,31,42,86,111,112,113,114,115,116,117,118,128,142,254,255,352,354,355,392,441,511,520,532,552,558,559,560,573,574,585,586,587,588,589,590,591,595,596,597,641,642,650,678,735,831,888,891,892,910,1001,1004,1031,1077,1112,1133,1134,1174,1224,1271,1272,1300,1354,1380,1414,1415,1441,1467,1506,1538,1551,],[3,22,35,49,131,153,153,153,153,163,195,218,235,257,343,444,458,516,526,534,555,577,644,657,672,684,695,695,703,738,748,762,771,776,781,786,791,796,802,807,812,837,842,851,870,922,978,1017,1024,1024,1034,1087,1094,1118,1143,1163,1178,1210,1241,1293,1326,1344,1369,1398,1424,1444,1455,1477,1493,1519,1554,1579,]),'a2l_optional_list':([0,],[4,]),'a2l_optional':([0,4,],[5,12,]),'asap2_version':([0,4,],[6,6,]),'a2ml_version':([0,4,],[7,7,]),'project':([0,4,],[8,8,]),'project_optional_list_optional':([19,],[21,]),'project_optional_list':([19,],[23,]),'project_optional':([19,23,],[24,30,]),'header':([19,23,],[25,25,]),'module':([19,23,],[26,26,]),'header_optional_list_optional':([31,],[34,]),'header_optional_list':([31,],[36,]),'header_optional':([31,36,],[37,44,]),'version':([31,36,115,164,],[38,38,166,166,]),'project_no':([31,36,],[39,39,]),'module_optional_list_optional':([42,],[48,]),'module_optional_list':([42,],[50,]),'module_optional':([42,50,],[51,91,]),'a2ml':([42,50,],[52,52,]),'mod_par':([42,50,],[53,53,]),'mod_common':([42,50,],[54,54,]),'if_data_xcp':([42,50,1133,1179,1300,1370,],[55,55,1195,1195,1373,1373,]),'if_data_module':([42,50,],[56,56,]),'characteristic':([42,50,],[57,57,]),'axis_pts':([42,50,],[58,58,]),'measurement':([42,50,],[59,59,]),'compu_method':([42,50,],[60,60,]),'compu_tab':([42,50,],[61,61,]),'compu_vtab':([42,50,],[62,62,]),'compu_vtab_range':([42,50,],[63,63,]),'function':([42,50,],[64,64,]),'group':([42,50,],[65,65,]),'record_layout':([42,50,],[66,66,]),'variant_coding':([42,50,],[67,67,]),'frame':([42,50,],[68,68,]),'user_rights':([42,50,],[69,69,]),'unit':([42,50,],[70,70,]),'a2ml_declaration_list':([72,],[92,]),'a2ml_declaration':([72,92,],[93,146,]),'a2ml_type_definition':([72,92,],[94,94,]),'a2ml_block_definition':([72,92,354,355,527,530,535,],[95,95,531,538,531,667,538,]),'a2ml_type_name':([72,92,149,352,517,532,537,670,],[96,96,351,520,520,520,520,520,]),'a2ml_predefined_type_name':([72,92,149,352,517,532,537,670,],[98,98,98,98,98,98,98,98,]),'a2ml_struct_type_name':([72,92,149,352,517,532,537,670,],[99,99,99,99,99,99,99,99,]),'a2ml_enum_type_name':([72,92,149,352,517,532,537,670,],[100,100,100,100,100,100,100,100,]),'a2ml_taggedstruct_type_name':([72,92,149,352,517,532,537,670,],[101,101,101,101,101,101,101,101,]),'a2ml_taggedunion_type_name':([72,92,149,352,517,532,537,670,],[102,102,102,102,102,102,102,102,]),'variant_coding_optional_list_optional':([86,],[130,]),'variant_coding_optional_list':([86,],[132,]),'variant_coding_optional':([86,132,],[133,337,]),'var_separator':([86,132,],[134,134,]),'var_naming':([86,132,],[135,135,]),'var_criterion':([86,132,],[136,136,]),'var_forbidden_comb':([86,132,],[137,137,]),'var_characteristic':([86,132,],[138,138,]),'a2ml_tag':([97,354,355,527,530,535,],[149,532,537,532,532,537,]),'a2ml_identifier_optional':([111,112,113,114,],[151,155,157,159,]),'a2ml_identifier':([111,112,113,114,],[152,156,158,160,]),'mod_par_optional_list_optional':([115,],[162,]),'mod_par_optional_list':([115,],[164,]),'mod_par_optional':([115,164,],[165,360,]),'addr_epk':([115,164,],[167,167,]),'epk':([115,164,],[168,168,]),'supplier':([115,164,],[169,169,]),'customer':([115,164,],[170,170,]),'customer_no':([115,164,],[171,171,]),'user':([115,164,],[172,172,]),'phone_no':([115,164,],[173,173,]),'ecu':([115,164,],[174,174,]),'cpu_type':([115,164,],[175,175,]),'no_of_interfaces':([115,164,],[176,176,]),'ecu_calibration_offset':([115,164,],[177,177,]),'calibration_method':([115,164,],[178,178,]),'memory_layout':([115,164,],[179,179,]),'memory_segment':([115,164,],[180,180,]),'system_constant':([115,164,],[181,181,]),'mod_common_optional_list_optional':([116,],[194,]),'mod_common_optional_list':([116,],[196,]),'mod_common_optional':([116,196,],[197,374,]),'s_rec_layout':([116,196,],[198,198,]),'deposit':([116,196,1271,1327,1538,1555,],[199,199,1332,1332,1568,1568,]),'byte_order':([116,196,1133,1174,1179,1242,1271,1327,1538,1555,],[200,200,1187,1246,1187,1246,1333,1333,1563,1563,]),'data_size':([116,196,],[201,201,]),'alignment_byte':([116,128,196,258,],[202,293,202,293,]),'alignment_word':([116,128,196,258,],[203,294,203,294,]),'alignment_long':([116,128,196,258,],[204,295,204,295,]),'alignment_float32_ieee':([116,128,196,258,],[205,296,205,296,]),'alignment_float64_ieee':([116,128,196,258,],[206,297,206,297,]),'if_data_xcp_optional_list_optional':([117,],[217,]),'if_data_xcp_optional_list':([117,],[219,]),'if_data_xcp_optional':([117,219,],[220,397,]),'protocol_layer':([117,219,],[221,221,]),'daq':([117,219,],[222,222,]),'pag':([117,219,],[223,223,]),'pgm':([117,219,],[224,224,]),'segment':([117,219,1441,1478,],[225,225,1481,1481,]),'daq_event':([117,219,],[226,226,]),'xcp_on_can':([117,219,],[227,227,]),'generic_parameter_list':([117,118,219,236,243,392,552,685,888,1018,1296,1297,1402,1403,1414,1430,1445,1506,1520,],[228,246,228,246,408,556,688,688,1021,1021,1364,1366,1364,1366,1447,1472,1447,1533,1533,]),'generic_parameter':([117,118,219,228,236,243,246,392,408,552,556,685,688,888,1018,1021,1146,1296,1297,1364,1366,1402,1403,1414,1430,1441,1445,1447,1472,1478,1506,1520,1533,],[231,231,231,398,231,231,398,231,398,231,398,231,398,231,231,398,1221,231,231,398,398,231,231,231,231,1482,231,398,398,1482,231,231,398,]),'if_data_module_optional_list_optional':([118,],[234,]),'if_data_module_optional_list':([118,],[236,]),'if_data_module_optional':([118,236,],[237,406,]),'source':([118,236,],[238,238,]),'raster':([118,236,],[239,239,]),'event_group':([118,236,],[240,240,]),'seed_key':([118,236,],[241,241,]),'checksum':([118,236,1112,1164,],[242,242,1167,1167,]),'tp_blob':([118,236,],[243,243,]),'if_data_module_unsupported_element':([118,236,],[244,244,]),'record_layout_optional_list_optional':([128,],[256,]),'record_layout_optional_list':([128,],[258,]),'record_layout_optional':([128,258,],[259,469,]),'fnc_values':([128,258,],[260,260,]),'identification':([128,258,],[261,261,]),'axis_pts_x':([128,258,],[262,262,]),'axis_pts_y':([128,258,],[263,263,]),'axis_pts_z':([128,258,],[264,264,]),'axis_rescale_x':([128,258,],[265,265,]),'axis_rescale_y':([128,258,],[266,266,]),'axis_rescale_z':([128,258,],[267,267,]),'no_axis_pts_x':([128,258,],[268,268,]),'no_axis_pts_y':([128,258,],[269,269,]),'no_axis_pts_z':([128,258,],[270,270,]),'no_rescale_x':([128,258,],[271,271,]),'no_rescale_y':([128,258,],[272,272,]),'no_rescale_z':([128,258,],[273,273,]),'fix_no_axis_pts_x':([128,258,],[274,274,]),'fix_no_axis_pts_y':([128,258,],[275,275,]),'fix_no_axis_pts_z':([128,258,],[276,276,]),'src_addr_x':([128,258,],[277,277,]),'src_addr_y':([128,258,],[278,278,]),'src_addr_z':([128,258,],[279,279,]),'rip_addr_x':([128,258,],[280,280,]),'rip_addr_y':([128,258,],[281,281,]),'rip_addr_z':([128,258,],[282,282,]),'rip_addr_w':([128,258,],[283,283,]),'shift_op_x':([128,258,],[284,284,]),'shift_op_y':([128,258,],[285,285,]),'shift_op_z':([128,258,],[286,286,]),'offset_x':([128,258,],[287,287,]),'offset_y':([128,258,],[288,288,]),'offset_z':([128,258,],[289,289,]),'dist_op_x':([128,258,],[290,290,]),'dist_op_y':([128,258,],[291,291,]),'dist_op_z':([128,258,],[292,292,]),'reserved':([128,258,],[298,298,]),'user_rights_optional_list_optional':([142,],[342,]),'user_rights_optional_list':([142,],[344,]),'user_rights_optional':([142,344,],[345,513,]),'ref_group':([142,344,],[346,346,]),'read_only':([142,344,1174,1242,1271,1327,1538,1555,],[347,347,1251,1251,1330,1330,1557,1557,]),'deposit_mode':([208,],[376,]),'byte_order_type':([209,],[379,]),'tp_data':([243,],[407,]),'characteristic_type':([247,],[409,]),'datatype':([249,470,471,472,473,474,475,476,477,478,479,480,481,482,483,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,],[417,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,]),'compu_method_conversion_type':([250,],[428,]),'compu_tab_conversion_type':([251,],[436,]),'compu_vtab_conversion_type':([252,],[439,]),'function_optional_list_optional':([254,],[443,]),'function_optional_list':([254,],[445,]),'function_optional':([254,445,],[446,593,]),'annotation':([254,255,445,459,1133,1174,1179,1242,1271,1327,1538,1555,],[447,461,447,461,1194,1258,1194,1258,1338,1338,1559,1559,]),'def_characteristic':([254,445,],[448,448,]),'ref_characteristic':([254,255,445,459,],[449,463,449,463,]),'in_measurement':([254,445,],[450,450,]),'out_measurement':([254,445,],[451,451,]),'loc_measurement':([254,445,],[452,452,]),'sub_function':([254,445,],[453,453,]),'function_version':([254,445,],[454,454,]),'group_optional_list_optional':([255,],[457,]),'group_optional_list':([255,],[459,]),'group_optional':([255,459,],[460,599,]),'root':([255,459,],[462,462,]),'ref_measurement':([255,459,],[464,464,]),'function_list':([255,459,1133,1174,1179,1242,1271,1327,],[465,465,1190,1248,1190,1248,1334,1334,]),'sub_group':([255,459,],[466,466,]),'var_forbidden_comb_criterion_list':([334,],[505,]),'var_forbidden_comb_criterion_optional':([334,506,638,],[506,637,833,]),'a2ml_struct_member_list_optional':([352,],[515,]),'a2ml_struct_member_list':([352,],[517,]),'a2ml_struct_member':([352,517,],[518,654,]),'a2ml_member':([352,517,532,537,670,],[519,519,671,676,866,]),'a2ml_enumerator_list':([353,],[521,]),'a2ml_enumerator':([353,661,],[522,862,]),'a2ml_keyword':([353,661,],[523,523,]),'a2ml_taggedstruct_member_list_optional':([354,],[525,]),'a2ml_taggedstruct_member_list':([354,],[527,]),'a2ml_taggedstruct_member':([354,527,],[528,664,]),'a2ml_taggedstruct_definition':([354,527,530,],[529,529,666,]),'a2ml_taggedunion_member_list_optional':([355,],[533,]),'a2ml_taggedunion_member_list':([355,],[535,]),'a2ml_taggedunion_member':([355,535,],[536,674,]),'memory_layout_prg_type':([357,],[540,]),'daq_config_type':([389,],[549,]),'generic_parameter_list_optional':([392,],[554,]),'compu_vtab_range_optional_list_optional':([441,],[576,]),'compu_vtab_range_optional_list':([441,],[578,]),'compu_vtab_range_optional':([441,578,],[579,757,]),'default_value':([441,573,574,578,739,749,],[580,742,751,580,742,751,]),'compu_vtab_range_in_val_out_val':([441,578,],[581,581,]),'number_number_string_value_list':([441,578,],[583,583,]),'number_number_string_value':([441,578,583,],[584,584,759,]),'datasize':([503,],[631,]),'var_forbidden_comb_criterion_optional_list':([506,],[638,]),'ident_list':([508,635,847,1273,1310,1379,1380,],[641,831,990,1353,1378,1422,1425,]),'ref_group_optional_list_optional':([511,],[643,]),'ref_group_optional_list':([511,],[645,]),'ref_group_optional':([511,645,],[646,849,]),'identifier':([511,586,587,588,589,590,591,595,597,645,772,777,782,787,792,797,803,813,],[647,774,779,784,789,794,799,805,815,647,774,779,784,789,794,799,805,815,]),'unit_type':([514,],[650,]),'a2ml_array_specifier_optional':([520,],[656,]),'a2ml_array_specifier':([520,997,],[658,1082,]),'a2ml_member_optional':([532,],[669,]),'pag_optional_list_optional':([552,],[683,]),'pag_optional_list':([552,],[685,]),'pag_optional':([552,685,],[686,887,]),'freeze_supported':([552,685,],[687,687,]),'daq_event_optional_list_optional':([558,559,],[694,700,]),'daq_event_optional_list':([558,559,],[696,696,]),'daq_event_optional':([558,559,696,],[697,697,894,]),'available_event_list':([558,559,696,],[698,698,698,]),'default_event_list':([558,559,696,],[699,699,699,]),'xcp_on_can_optional_list_optional':([560,],[702,]),'xcp_on_can_optional_list':([560,],[704,]),'xcp_on_can_optional':([560,704,],[705,898,]),'can_id_broadcast':([560,704,],[706,706,]),'can_id_master':([560,704,],[707,707,]),'can_id_slave':([560,704,],[708,708,]),'baudrate':([560,704,],[709,709,]),'sample_point':([560,704,],[710,710,]),'sample_rate':([560,704,],[711,711,]),'btl_cycles':([560,704,],[712,712,]),'sjw':([560,704,],[713,713,]),'sync_edge':([560,704,],[714,714,]),'daq_list_can_id':([560,704,],[715,715,]),'max_block_size':([567,],[730,]),'compu_tab_optional_list_optional':([573,],[737,]),'compu_tab_optional_list':([573,],[739,]),'compu_tab_optional':([573,739,],[740,934,]),'in_val_out_val':([573,739,],[741,741,]),'default_value_numeric':([573,739,],[743,743,]),'number_list':([573,727,739,874,985,1226,1581,],[744,912,744,1004,1075,1300,1596,]),'compu_vtab_optional_list_optional':([574,],[747,]),'compu_vtab_optional_list':([574,],[749,]),'compu_vtab_optional':([574,749,],[750,939,]),'compu_vtab_in_val_out_val':([574,749,],[752,752,]),'number_string_value_list':([574,749,],[753,753,]),'number_string_value':([574,749,753,],[754,754,940,]),'annotation_optional_list_optional':([585,],[761,]),'annotation_optional_list':([585,],[763,]),'annotation_optional':([585,763,],[764,945,]),'annotation_label':([585,763,],[765,765,]),'annotation_origin':([585,763,],[766,766,]),'annotation_text':([585,763,],[767,767,]),'def_characteristic_optional_list_optional':([586,],[770,]),'def_characteristic_optional_list':([586,],[772,]),'def_characteristic_optional':([586,772,],[773,949,]),'ref_characteristic_optional_list_optional':([587,],[775,]),'ref_characteristic_optional_list':([587,],[777,]),'ref_characteristic_optional':([587,777,],[778,951,]),'in_measurement_optional_list_optional':([588,],[780,]),'in_measurement_optional_list':([588,],[782,]),'in_measurement_optional':([588,782,],[783,953,]),'out_measurement_optional_list_optional':([589,],[785,]),'out_measurement_optional_list':([589,],[787,]),'out_measurement_optional':([589,787,],[788,955,]),'loc_measurement_optional_list_optional':([590,],[790,]),'loc_measurement_optional_list':([590,],[792,]),'loc_measurement_optional':([590,792,],[793,957,]),'sub_function_optional_list_optional':([591,],[795,]),'sub_function_optional_list':([591,],[797,]),'sub_function_optional':([591,797,],[798,959,]),'ref_measurement_optional_list_optional':([595,],[801,]),'ref_measurement_optional_list':([595,],[803,]),'ref_measurement_optional':([595,803,],[804,961,]),'function_list_optional_list_optional':([596,],[806,]),'function_list_optional_list':([596,],[808,]),'function_list_optional':([596,808,],[809,963,]),'sub_group_optional_list_optional':([597,],[811,]),'sub_group_optional_list':([597,],[813,]),'sub_group_optional':([597,813,],[814,965,]),'fnc_values_index_mode':([601,],[817,]),'indexorder':([603,604,605,828,829,830,],[823,826,827,974,975,976,]),'var_characteristic_optional_optional':([641,],[836,]),'var_characteristic_optional':([641,],[838,]),'var_address':([641,],[839,]),'frame_optional_list_optional':([642,],[841,]),'frame_optional_list':([642,],[843,]),'frame_optional':([642,843,],[844,989,]),'frame_measurement':([642,843,],[845,845,]),'if_data_frame':([642,843,],[846,846,]),'unit_optional_list_optional':([650,],[850,]),'unit_optional_list':([650,],[852,]),'unit_optional':([650,852,],[853,993,]),'si_exponents':([650,852,],[854,854,]),'ref_unit':([650,735,852,923,],[855,929,855,929,]),'unit_conversion':([650,852,],[856,856,]),'a2ml_constant':([659,662,],[860,863,]),'calibration_method_optional_list_optional':([678,],[869,]),'calibration_method_optional_list':([678,],[871,]),'calibration_method_optional':([678,871,],[872,1003,]),'calibration_handle':([678,871,],[873,873,]),'memory_segment_prg_type':([680,],[875,]),'compu_method_optional_list_optional':([735,],[921,]),'compu_method_optional_list':([735,],[923,]),'compu_method_optional':([735,923,],[924,1050,]),'formula':([735,923,],[925,925,]),'coeffs':([735,923,],[926,926,]),'coeffs_linear':([735,923,],[927,927,]),'compu_tab_ref':([735,923,],[928,928,]),'addrtype':([817,823,826,827,974,975,976,],[966,971,972,973,1068,1069,1070,]),'var_criterion_optional_list_optional':([831,],[977,]),'var_criterion_optional_list':([831,],[979,]),'var_criterion_optional':([831,979,],[980,1072,]),'var_measurement':([831,979,],[981,981,]),'var_selection_characteristic':([831,979,],[982,982,]),'memory_segment_memory_type':([875,],[1005,]),'pgm_optional_list_optional':([888,],[1016,]),'pgm_optional_list':([888,],[1018,]),'pgm_optional':([888,1018,],[1019,1111,]),'sector':([888,1018,],[1020,1020,]),'available_event_list_optional_list_optional':([891,892,],[1023,1028,]),'available_event_list_optional_list':([891,892,],[1025,1025,]),'available_event_list_optional':([891,892,1025,],[1026,1026,1114,]),'source_optional_list_optional':([910,],[1033,]),'source_optional_list':([910,],[1035,]),'source_optional':([910,1035,],[1036,1125,]),'display_identifier':([910,1035,1133,1174,1179,1242,1271,1327,],[1037,1037,1181,1244,1181,1244,1329,1329,]),'qp_blob':([910,1035,],[1038,1038,]),'string_list':([943,],[1056,]),'calibration_handle_optional_list_optional':([1001,],[1086,]),'calibration_handle_optional_list':([1001,],[1088,]),'calibration_handle_optional':([1001,1088,],[1089,1149,]),'memory_layout_optional_list_optional':([1004,],[1093,]),'memory_layout_optional_list':([1004,],[1095,]),'memory_layout_optional':([1004,1095,],[1096,1152,]),'if_data_memory_layout':([1004,1095,1174,1242,1271,1327,],[1097,1097,1269,1269,1342,1342,]),'memory_segment_attributes':([1005,],[1098,]),'optimisation_type':([1013,1415,1456,],[1102,1450,1450,]),'daq_list_can_id_optional_optional':([1031,],[1117,]),'daq_list_can_id_optional':([1031,],[1119,]),'daq_list_can_id_type_variable':([1031,],[1120,]),'daq_list_can_id_type_fixed':([1031,],[1121,]),'if_data_frame_optional_list_optional':([1077,],[1142,]),'if_data_frame_optional_list':([1077,],[1144,]),'if_data_frame_optional':([1077,1144,],[1145,1219,]),'address_extension':([1102,1415,1456,],[1155,1451,1451,]),'segment_optional_parameter_list_optional':([1112,],[1162,]),'segment_optional_parameter_list':([1112,],[1164,]),'segment_optional_parameter':([1112,1164,],[1165,1236,]),'page':([1112,1164,],[1166,1166,]),'measurement_optional_list_optional':([1133,],[1177,]),'measurement_optional_list':([1133,],[1179,]),'measurement_optional':([1133,1179,],[1180,1276,]),'read_write':([1133,1179,],[1182,1182,]),'format':([1133,1174,1179,1242,1271,1327,1538,1555,],[1183,1245,1183,1245,1331,1331,1558,1558,]),'array_size':([1133,1179,],[1184,1184,]),'bit_mask':([1133,1174,1179,1242,],[1185,1247,1185,1247,]),'bit_operation':([1133,1179,],[1186,1186,]),'max_refresh':([1133,1174,1179,1242,],[1188,1254,1188,1254,]),'virtual':([1133,1179,],[1189,1189,]),'ecu_address':([1133,1179,],[1191,1191,]),'error_mask':([1133,1179,],[1192,1192,]),'ref_memory_segment':([1133,1174,1179,1242,1271,1327,],[1193,1257,1193,1257,1335,1335,]),'if_data_measurement':([1133,1179,],[1196,1196,]),'matrix_dim':([1133,1174,1179,1242,],[1197,1263,1197,1263,]),'ecu_address_extension':([1133,1174,1179,1242,1271,1327,],[1198,1264,1198,1264,1341,1341,]),'formula_optional_list_optional':([1134,],[1209,]),'formula_optional_list':([1134,],[1211,]),'formula_optional':([1134,1211,],[1212,1287,]),'formula_inv':([1134,1211,],[1213,1213,]),'qp_data':([1146,],[1220,]),'identification_field_type':([1155,1415,1456,],[1228,1452,1452,]),'characteristic_optional_list_optional':([1174,],[1240,]),'characteristic_optional_list':([1174,],[1242,]),'characteristic_optional':([1174,1242,],[1243,1315,]),'number':([1174,1242,],[1249,1249,]),'extended_limits':([1174,1242,1271,1327,1538,1555,],[1250,1250,1337,1337,1564,1564,]),'guard_rails':([1174,1242,1271,1327,],[1252,1252,1336,1336,]),'map_list':([1174,1242,],[1253,1253,]),'dependent_characteristic':([1174,1242,],[1255,1255,]),'virtual_characteristic':([1174,1242,],[1256,1256,]),'comparison_quantity':([1174,1242,],[1259,1259,]),'if_data_characteristic':([1174,1242,],[1260,1260,]),'axis_descr':([1174,1242,],[1261,1261,]),'calibration_access':([1174,1242,1271,1327,],[1262,1262,1340,1340,]),'if_data_memory_layout_optional_list_optional':([1224,],[1292,]),'if_data_memory_layout_optional_list':([1224,],[1294,]),'if_data_memory_layout_optional':([1224,1294,],[1295,1362,]),'dp_blob':([1224,1294,1354,1399,],[1296,1296,1402,1402,]),'ba_blob':([1224,1294,],[1297,1297,]),'granularity_odt_entry':([1228,1415,1456,],[1302,1453,1453,]),'calibration_access_type':([1270,],[1319,]),'axis_pts_optional_list_optional':([1271,],[1325,]),'axis_pts_optional_list':([1271,],[1327,]),'axis_pts_optional':([1271,1327,],[1328,1390,]),'if_data_axis_pts':([1271,1327,],[1339,1339,]),'bit_operation_optional_list_optional':([1272,],[1343,]),'bit_operation_optional_list':([1272,],[1345,]),'bit_operation_optional':([1272,1345,],[1346,1392,]),'left_shift':([1272,1345,],[1347,1347,]),'right_shift':([1272,1345,],[1348,1348,]),'sign_extend':([1272,1345,],[1349,1349,]),'dp_data':([1296,1402,],[1363,1439,]),'pa_data':([1297,1403,],[1365,1440,]),'memory_segment_optional_list_optional':([1300,],[1368,]),'memory_segment_optional_parameter_list':([1300,],[1370,]),'memory_segment_optional':([1300,1370,],[1371,1413,]),'if_data_memory_segment':([1300,1370,],[1372,1372,]),'axis_descr_attribute':([1313,],[1381,]),'if_data_measurement_optional_parameter_list_optional':([1354,],[1397,]),'if_data_measurement_optional_parameter_list':([1354,],[1399,]),'if_data_measurement_optional_parameter':([1354,1399,],[1400,1432,]),'kp_blob':([1354,1399,],[1401,1401,]),'pa_blob':([1354,1399,],[1403,1403,]),'if_data_measurement_unsupported_element':([1354,1399,],[1404,1404,]),'overload_indication':([1375,],[1415,]),'virtual_characteristic_optional':([1380,],[1423,]),'kp_data':([1401,],[1433,]),'kp_data_parameter_optional_list':([1401,],[1434,]),'kp_data_parameter_optional':([1401,1434,],[1435,1474,]),'protocol_layer_optional_list_optional':([1414,],[1443,]),'protocol_layer_optional_list':([1414,],[1445,]),'protocol_layer_optional':([1414,1445,],[1446,1485,]),'daq_optional_list_optional':([1415,],[1454,]),'daq_optional_list':([1415,],[1456,]),'daq_optional':([1415,1456,],[1457,1490,]),'daq_list':([1415,1456,],[1458,1458,]),'event':([1415,1456,],[1459,1459,]),'timestamp_supported':([1415,1456,],[1460,1460,]),'prescaler_supported':([1415,1456,],[1461,1461,]),'resume_supported':([1415,1456,],[1462,1462,]),'if_data_memory_segment_optional_list_optional':([1441,],[1476,]),'if_data_memory_segment_optional_list':([1441,],[1478,]),'if_data_memory_segment_optional':([1441,1478,],[1479,1503,]),'address_mapping':([1441,1478,],[1480,1480,]),'page_optional_parameter_list_optional':([1467,],[1492,]),'page_optional_parameter_list':([1467,],[1494,]),'page_optional_parameter':([1467,1494,],[1495,1512,]),'init_segment':([1467,1494,],[1496,1496,]),'daq_list_optional_list_optional':([1506,],[1518,]),'daq_list_optional_list':([1506,],[1520,]),'daq_list_optional':([1506,1520,],[1521,1541,]),'daq_list_type':([1506,1520,],[1522,1522,]),'max_odt':([1506,1520,],[1523,1523,]),'max_odt_entries':([1506,1520,],[1524,1524,]),'first_pid':([1506,1520,],[1525,1525,]),'event_fixed':([1506,1520,],[1526,1526,]),'predefined':([1506,1520,],[1527,1527,]),'daq_list_type_enum':([1528,1550,],[1542,1577,]),'axis_descr_optional_list_optional':([1538,],[1553,]),'axis_descr_optional_list':([1538,],[1555,]),'axis_descr_optional':([1538,1555,],[1556,1583,]),'axis_pts_ref':([1538,1555,],[1560,1560,]),'max_grad':([1538,1555,],[1561,1561,]),'monotony':([1538,1555,],[1562,1562,]),'fix_axis_par':([1538,1555,],[1565,1565,]),'fix_axis_par_dist':([1538,1555,],[1566,1566,]),'fix_axis_par_list':([1538,1555,],[1567,1567,]),'curve_axis_ref':([1538,1555,],[1569,1569,]),'timestamp_fixed':([1551,],[1578,]),'monotony_type':([1572,],[1586,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,945 +27,945 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> a2l","S'",1,None,None,None),
-  ('a2l -> a2l_optional_list_optional','a2l',1,'p_a2l','parser.py',179),
-  ('a2l_optional -> asap2_version','a2l_optional',1,'p_a2l_optional','parser.py',184),
-  ('a2l_optional -> a2ml_version','a2l_optional',1,'p_a2l_optional','parser.py',185),
-  ('a2l_optional -> project','a2l_optional',1,'p_a2l_optional','parser.py',186),
-  ('a2l_optional_list -> a2l_optional','a2l_optional_list',1,'p_a2l_optional_list','parser.py',191),
-  ('a2l_optional_list -> a2l_optional a2l_optional_list','a2l_optional_list',2,'p_a2l_optional_list','parser.py',192),
-  ('a2l_optional_list_optional -> empty','a2l_optional_list_optional',1,'p_a2l_optional_list_optional','parser.py',200),
-  ('a2l_optional_list_optional -> a2l_optional_list','a2l_optional_list_optional',1,'p_a2l_optional_list_optional','parser.py',201),
-  ('a2ml_declaration -> a2ml_type_definition SEMICOLON','a2ml_declaration',2,'p_a2ml_declaration','parser.py',206),
-  ('a2ml_declaration -> a2ml_block_definition SEMICOLON','a2ml_declaration',2,'p_a2ml_declaration','parser.py',207),
-  ('a2ml_declaration_list -> a2ml_declaration','a2ml_declaration_list',1,'p_a2ml_declaration_list','parser.py',212),
-  ('a2ml_declaration_list -> a2ml_declaration a2ml_declaration_list','a2ml_declaration_list',2,'p_a2ml_declaration_list','parser.py',213),
-  ('a2ml_type_definition -> a2ml_type_name','a2ml_type_definition',1,'p_a2ml_type_definition','parser.py',221),
-  ('a2ml_type_name -> a2ml_predefined_type_name','a2ml_type_name',1,'p_a2ml_type_name','parser.py',226),
-  ('a2ml_type_name -> a2ml_struct_type_name','a2ml_type_name',1,'p_a2ml_type_name','parser.py',227),
-  ('a2ml_type_name -> a2ml_enum_type_name','a2ml_type_name',1,'p_a2ml_type_name','parser.py',228),
-  ('a2ml_type_name -> a2ml_taggedstruct_type_name','a2ml_type_name',1,'p_a2ml_type_name','parser.py',229),
-  ('a2ml_type_name -> a2ml_taggedunion_type_name','a2ml_type_name',1,'p_a2ml_type_name','parser.py',230),
-  ('a2ml_predefined_type_name -> char','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',235),
-  ('a2ml_predefined_type_name -> int','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',236),
-  ('a2ml_predefined_type_name -> long','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',237),
-  ('a2ml_predefined_type_name -> uchar','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',238),
-  ('a2ml_predefined_type_name -> uint','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',239),
-  ('a2ml_predefined_type_name -> ulong','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',240),
-  ('a2ml_predefined_type_name -> double','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',241),
-  ('a2ml_predefined_type_name -> float','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',242),
-  ('a2ml_block_definition -> block a2ml_tag a2ml_type_name','a2ml_block_definition',3,'p_a2ml_block_definition','parser.py',247),
-  ('a2ml_enum_type_name -> enum a2ml_identifier_optional CURLY_OPEN a2ml_enumerator_list CURLY_CLOSE','a2ml_enum_type_name',5,'p_a2ml_enum_type_name','parser.py',251),
-  ('a2ml_enum_type_name -> enum a2ml_identifier','a2ml_enum_type_name',2,'p_a2ml_enum_type_name','parser.py',252),
-  ('a2ml_enumerator_list -> a2ml_enumerator','a2ml_enumerator_list',1,'p_a2ml_enumerator_list','parser.py',260),
-  ('a2ml_enumerator_list -> a2ml_enumerator COMMA a2ml_enumerator_list','a2ml_enumerator_list',3,'p_a2ml_enumerator_list','parser.py',261),
-  ('a2ml_enumerator -> a2ml_keyword EQUAL a2ml_constant','a2ml_enumerator',3,'p_a2ml_enumerator','parser.py',269),
-  ('a2ml_enumerator -> a2ml_keyword','a2ml_enumerator',1,'p_a2ml_enumerator','parser.py',270),
-  ('a2ml_struct_type_name -> struct a2ml_identifier_optional CURLY_OPEN a2ml_struct_member_list_optional CURLY_CLOSE','a2ml_struct_type_name',5,'p_a2ml_struct_type_name','parser.py',275),
-  ('a2ml_struct_type_name -> struct a2ml_identifier','a2ml_struct_type_name',2,'p_a2ml_struct_type_name','parser.py',276),
-  ('a2ml_struct_member_list_optional -> empty','a2ml_struct_member_list_optional',1,'p_a2ml_struct_member_list_optional','parser.py',281),
-  ('a2ml_struct_member_list_optional -> a2ml_struct_member_list','a2ml_struct_member_list_optional',1,'p_a2ml_struct_member_list_optional','parser.py',282),
-  ('a2ml_struct_member_list -> a2ml_struct_member','a2ml_struct_member_list',1,'p_a2ml_struct_member_list','parser.py',287),
-  ('a2ml_struct_member_list -> a2ml_struct_member a2ml_struct_member_list','a2ml_struct_member_list',2,'p_a2ml_struct_member_list','parser.py',288),
-  ('a2ml_struct_member -> a2ml_member SEMICOLON','a2ml_struct_member',2,'p_a2ml_struct_member','parser.py',296),
-  ('a2ml_member -> a2ml_type_name a2ml_array_specifier_optional','a2ml_member',2,'p_a2ml_member','parser.py',301),
-  ('a2ml_member_optional -> empty','a2ml_member_optional',1,'p_a2ml_member_optional','parser.py',306),
-  ('a2ml_member_optional -> a2ml_member','a2ml_member_optional',1,'p_a2ml_member_optional','parser.py',307),
-  ('a2ml_array_specifier_optional -> empty','a2ml_array_specifier_optional',1,'p_a2ml_array_specifier_optional','parser.py',312),
-  ('a2ml_array_specifier_optional -> a2ml_array_specifier','a2ml_array_specifier_optional',1,'p_a2ml_array_specifier_optional','parser.py',313),
-  ('a2ml_array_specifier -> BRACE_OPEN a2ml_constant BRACE_CLOSE','a2ml_array_specifier',3,'p_a2ml_array_specifier','parser.py',318),
-  ('a2ml_array_specifier -> BRACE_OPEN a2ml_constant BRACE_CLOSE a2ml_array_specifier','a2ml_array_specifier',4,'p_a2ml_array_specifier','parser.py',319),
-  ('a2ml_taggedstruct_type_name -> taggedstruct a2ml_identifier_optional CURLY_OPEN a2ml_taggedstruct_member_list_optional CURLY_CLOSE','a2ml_taggedstruct_type_name',5,'p_a2ml_taggedstruct_type_name','parser.py',324),
-  ('a2ml_taggedstruct_type_name -> taggedstruct a2ml_identifier','a2ml_taggedstruct_type_name',2,'p_a2ml_taggedstruct_type_name','parser.py',325),
-  ('a2ml_taggedstruct_member_list_optional -> empty','a2ml_taggedstruct_member_list_optional',1,'p_a2ml_taggedstruct_member_list_optional','parser.py',330),
-  ('a2ml_taggedstruct_member_list_optional -> a2ml_taggedstruct_member_list','a2ml_taggedstruct_member_list_optional',1,'p_a2ml_taggedstruct_member_list_optional','parser.py',331),
-  ('a2ml_taggedstruct_member_list -> a2ml_taggedstruct_member','a2ml_taggedstruct_member_list',1,'p_a2ml_taggedstruct_member_list','parser.py',336),
-  ('a2ml_taggedstruct_member_list -> a2ml_taggedstruct_member a2ml_taggedstruct_member_list','a2ml_taggedstruct_member_list',2,'p_a2ml_taggedstruct_member_list','parser.py',337),
-  ('a2ml_taggedstruct_member -> a2ml_taggedstruct_definition SEMICOLON','a2ml_taggedstruct_member',2,'p_a2ml_taggedstruct_member','parser.py',345),
-  ('a2ml_taggedstruct_member -> PARENTHESE_OPEN a2ml_taggedstruct_definition PARENTHESE_CLOSE ASTERISK SEMICOLON','a2ml_taggedstruct_member',5,'p_a2ml_taggedstruct_member','parser.py',346),
-  ('a2ml_taggedstruct_member -> a2ml_block_definition SEMICOLON','a2ml_taggedstruct_member',2,'p_a2ml_taggedstruct_member','parser.py',347),
-  ('a2ml_taggedstruct_member -> PARENTHESE_OPEN a2ml_block_definition PARENTHESE_CLOSE ASTERISK SEMICOLON','a2ml_taggedstruct_member',5,'p_a2ml_taggedstruct_member','parser.py',348),
-  ('a2ml_taggedstruct_definition -> a2ml_tag a2ml_member_optional','a2ml_taggedstruct_definition',2,'p_a2ml_taggedstruct_definition','parser.py',352),
-  ('a2ml_taggedstruct_definition -> a2ml_tag PARENTHESE_OPEN a2ml_member PARENTHESE_CLOSE ASTERISK','a2ml_taggedstruct_definition',5,'p_a2ml_taggedstruct_definition','parser.py',353),
-  ('a2ml_taggedunion_type_name -> taggedunion a2ml_identifier_optional CURLY_OPEN a2ml_taggedunion_member_list_optional CURLY_CLOSE','a2ml_taggedunion_type_name',5,'p_a2ml_taggedunion_type_name','parser.py',358),
-  ('a2ml_taggedunion_type_name -> taggedunion a2ml_identifier','a2ml_taggedunion_type_name',2,'p_a2ml_taggedunion_type_name','parser.py',359),
-  ('a2ml_taggedunion_member_list -> a2ml_taggedunion_member','a2ml_taggedunion_member_list',1,'p_a2ml_taggedunion_member_list','parser.py',363),
-  ('a2ml_taggedunion_member_list -> a2ml_taggedunion_member a2ml_taggedunion_member_list','a2ml_taggedunion_member_list',2,'p_a2ml_taggedunion_member_list','parser.py',364),
-  ('a2ml_taggedunion_member_list_optional -> empty','a2ml_taggedunion_member_list_optional',1,'p_a2ml_taggedunion_member_list_optional','parser.py',372),
-  ('a2ml_taggedunion_member_list_optional -> a2ml_taggedunion_member_list','a2ml_taggedunion_member_list_optional',1,'p_a2ml_taggedunion_member_list_optional','parser.py',373),
-  ('a2ml_taggedunion_member -> a2ml_tag SEMICOLON','a2ml_taggedunion_member',2,'p_a2ml_taggedunion_member','parser.py',378),
-  ('a2ml_taggedunion_member -> a2ml_tag a2ml_member SEMICOLON','a2ml_taggedunion_member',3,'p_a2ml_taggedunion_member','parser.py',379),
-  ('a2ml_taggedunion_member -> a2ml_block_definition SEMICOLON','a2ml_taggedunion_member',2,'p_a2ml_taggedunion_member','parser.py',380),
-  ('a2ml_tag -> STRING','a2ml_tag',1,'p_a2ml_tag','parser.py',384),
-  ('a2ml_identifier -> IDENT','a2ml_identifier',1,'p_a2ml_identifier','parser.py',388),
-  ('a2ml_identifier_optional -> empty','a2ml_identifier_optional',1,'p_a2ml_identifier_optional','parser.py',392),
-  ('a2ml_identifier_optional -> a2ml_identifier','a2ml_identifier_optional',1,'p_a2ml_identifier_optional','parser.py',393),
-  ('a2ml_keyword -> STRING','a2ml_keyword',1,'p_a2ml_keyword','parser.py',397),
-  ('a2ml_constant -> NUMERIC','a2ml_constant',1,'p_a2ml_constant','parser.py',401),
-  ('datatype -> UBYTE','datatype',1,'p_datatype','parser.py',405),
-  ('datatype -> SBYTE','datatype',1,'p_datatype','parser.py',406),
-  ('datatype -> UWORD','datatype',1,'p_datatype','parser.py',407),
-  ('datatype -> SWORD','datatype',1,'p_datatype','parser.py',408),
-  ('datatype -> ULONG','datatype',1,'p_datatype','parser.py',409),
-  ('datatype -> SLONG','datatype',1,'p_datatype','parser.py',410),
-  ('datatype -> A_UINT64','datatype',1,'p_datatype','parser.py',411),
-  ('datatype -> A_INT64','datatype',1,'p_datatype','parser.py',412),
-  ('datatype -> FLOAT32_IEEE','datatype',1,'p_datatype','parser.py',413),
-  ('datatype -> FLOAT64_IEEE','datatype',1,'p_datatype','parser.py',414),
-  ('datasize -> BYTE','datasize',1,'p_datasize','parser.py',419),
-  ('datasize -> WORD','datasize',1,'p_datasize','parser.py',420),
-  ('datasize -> LONG','datasize',1,'p_datasize','parser.py',421),
-  ('addrtype -> PBYTE','addrtype',1,'p_addrtype','parser.py',426),
-  ('addrtype -> PWORD','addrtype',1,'p_addrtype','parser.py',427),
-  ('addrtype -> PLONG','addrtype',1,'p_addrtype','parser.py',428),
-  ('addrtype -> DIRECT','addrtype',1,'p_addrtype','parser.py',429),
-  ('indexorder -> INDEX_INCR','indexorder',1,'p_indexorder','parser.py',434),
-  ('indexorder -> INDEX_DECR','indexorder',1,'p_indexorder','parser.py',435),
-  ('asap2_version -> ASAP2_VERSION NUMERIC NUMERIC','asap2_version',3,'p_asap2_version','parser.py',440),
-  ('a2ml_version -> A2ML_VERSION NUMERIC NUMERIC','a2ml_version',3,'p_a2ml_version','parser.py',445),
-  ('generic_parameter -> IDENT','generic_parameter',1,'p_generic_parameter','parser.py',450),
-  ('generic_parameter -> STRING','generic_parameter',1,'p_generic_parameter','parser.py',451),
-  ('generic_parameter -> NUMERIC','generic_parameter',1,'p_generic_parameter','parser.py',452),
-  ('generic_parameter -> begin IDENT generic_parameter_list_optional end IDENT','generic_parameter',5,'p_generic_parameter','parser.py',453),
-  ('generic_parameter_list -> generic_parameter','generic_parameter_list',1,'p_generic_parameter_list','parser.py',457),
-  ('generic_parameter_list -> generic_parameter generic_parameter_list','generic_parameter_list',2,'p_generic_parameter_list','parser.py',458),
-  ('generic_parameter_list_optional -> empty','generic_parameter_list_optional',1,'p_generic_parameter_list_optional','parser.py',466),
-  ('generic_parameter_list_optional -> generic_parameter_list','generic_parameter_list_optional',1,'p_generic_parameter_list_optional','parser.py',467),
-  ('number_list -> NUMERIC','number_list',1,'p_number_list','parser.py',471),
-  ('number_list -> NUMERIC number_list','number_list',2,'p_number_list','parser.py',472),
-  ('ident_list -> IDENT','ident_list',1,'p_ident_list','parser.py',480),
-  ('ident_list -> IDENT ident_list','ident_list',2,'p_ident_list','parser.py',481),
-  ('string_list -> STRING','string_list',1,'p_string_list','parser.py',489),
-  ('string_list -> STRING string_list','string_list',2,'p_string_list','parser.py',490),
-  ('project -> begin PROJECT IDENT STRING project_optional_list_optional end PROJECT','project',7,'p_project','parser.py',498),
-  ('project_optional -> header','project_optional',1,'p_project_optional','parser.py',503),
-  ('project_optional -> module','project_optional',1,'p_project_optional','parser.py',504),
-  ('project_optional_list -> project_optional','project_optional_list',1,'p_project_optional_list','parser.py',509),
-  ('project_optional_list -> project_optional project_optional_list','project_optional_list',2,'p_project_optional_list','parser.py',510),
-  ('project_optional_list_optional -> empty','project_optional_list_optional',1,'p_project_optional_list_optional','parser.py',518),
-  ('project_optional_list_optional -> project_optional_list','project_optional_list_optional',1,'p_project_optional_list_optional','parser.py',519),
-  ('header -> begin HEADER STRING header_optional_list_optional end HEADER','header',6,'p_header','parser.py',524),
-  ('header_optional -> version','header_optional',1,'p_header_optional','parser.py',529),
-  ('header_optional -> project_no','header_optional',1,'p_header_optional','parser.py',530),
-  ('header_optional_list -> header_optional','header_optional_list',1,'p_header_optional_list','parser.py',535),
-  ('header_optional_list -> header_optional header_optional_list','header_optional_list',2,'p_header_optional_list','parser.py',536),
-  ('header_optional_list_optional -> empty','header_optional_list_optional',1,'p_header_optional_list_optional','parser.py',544),
-  ('header_optional_list_optional -> header_optional_list','header_optional_list_optional',1,'p_header_optional_list_optional','parser.py',545),
-  ('version -> VERSION STRING','version',2,'p_version','parser.py',550),
-  ('project_no -> PROJECT_NO IDENT','project_no',2,'p_project_no','parser.py',555),
-  ('module -> begin MODULE IDENT STRING module_optional_list_optional end MODULE','module',7,'p_module','parser.py',560),
-  ('module_optional -> a2ml','module_optional',1,'p_module_optional','parser.py',565),
-  ('module_optional -> mod_par','module_optional',1,'p_module_optional','parser.py',566),
-  ('module_optional -> mod_common','module_optional',1,'p_module_optional','parser.py',567),
-  ('module_optional -> if_data_xcp','module_optional',1,'p_module_optional','parser.py',568),
-  ('module_optional -> if_data_module','module_optional',1,'p_module_optional','parser.py',569),
-  ('module_optional -> characteristic','module_optional',1,'p_module_optional','parser.py',570),
-  ('module_optional -> axis_pts','module_optional',1,'p_module_optional','parser.py',571),
-  ('module_optional -> measurement','module_optional',1,'p_module_optional','parser.py',572),
-  ('module_optional -> compu_method','module_optional',1,'p_module_optional','parser.py',573),
-  ('module_optional -> compu_tab','module_optional',1,'p_module_optional','parser.py',574),
-  ('module_optional -> compu_vtab','module_optional',1,'p_module_optional','parser.py',575),
-  ('module_optional -> compu_vtab_range','module_optional',1,'p_module_optional','parser.py',576),
-  ('module_optional -> function','module_optional',1,'p_module_optional','parser.py',577),
-  ('module_optional -> group','module_optional',1,'p_module_optional','parser.py',578),
-  ('module_optional -> record_layout','module_optional',1,'p_module_optional','parser.py',579),
-  ('module_optional -> variant_coding','module_optional',1,'p_module_optional','parser.py',580),
-  ('module_optional -> frame','module_optional',1,'p_module_optional','parser.py',581),
-  ('module_optional -> user_rights','module_optional',1,'p_module_optional','parser.py',582),
-  ('module_optional -> unit','module_optional',1,'p_module_optional','parser.py',583),
-  ('module_optional_list -> module_optional','module_optional_list',1,'p_module_optional_list','parser.py',588),
-  ('module_optional_list -> module_optional module_optional_list','module_optional_list',2,'p_module_optional_list','parser.py',589),
-  ('module_optional_list_optional -> empty','module_optional_list_optional',1,'p_module_optional_list_optional','parser.py',597),
-  ('module_optional_list_optional -> module_optional_list','module_optional_list_optional',1,'p_module_optional_list_optional','parser.py',598),
-  ('a2ml -> begin A2ML a2ml_declaration_list end A2ML','a2ml',5,'p_a2ml','parser.py',603),
-  ('if_data_xcp -> begin IF_DATA XCP if_data_xcp_optional_list_optional end IF_DATA','if_data_xcp',6,'p_if_data_xcp','parser.py',608),
-  ('if_data_xcp_optional -> protocol_layer','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',613),
-  ('if_data_xcp_optional -> daq','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',614),
-  ('if_data_xcp_optional -> pag','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',615),
-  ('if_data_xcp_optional -> pgm','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',616),
-  ('if_data_xcp_optional -> segment','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',617),
-  ('if_data_xcp_optional -> daq_event','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',618),
-  ('if_data_xcp_optional -> xcp_on_can','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',619),
-  ('if_data_xcp_optional -> generic_parameter_list','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',620),
-  ('xcp_on_can -> begin XCP_ON_CAN NUMERIC xcp_on_can_optional_list_optional end XCP_ON_CAN','xcp_on_can',6,'p_xcp_on_can','parser.py',625),
-  ('xcp_on_can_optional -> can_id_broadcast','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',630),
-  ('xcp_on_can_optional -> can_id_master','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',631),
-  ('xcp_on_can_optional -> can_id_slave','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',632),
-  ('xcp_on_can_optional -> baudrate','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',633),
-  ('xcp_on_can_optional -> sample_point','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',634),
-  ('xcp_on_can_optional -> sample_rate','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',635),
-  ('xcp_on_can_optional -> btl_cycles','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',636),
-  ('xcp_on_can_optional -> sjw','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',637),
-  ('xcp_on_can_optional -> sync_edge','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',638),
-  ('xcp_on_can_optional -> daq_list_can_id','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',639),
-  ('xcp_on_can_optional_list -> xcp_on_can_optional','xcp_on_can_optional_list',1,'p_xcp_on_can_optional_list','parser.py',644),
-  ('xcp_on_can_optional_list -> xcp_on_can_optional xcp_on_can_optional_list','xcp_on_can_optional_list',2,'p_xcp_on_can_optional_list','parser.py',645),
-  ('xcp_on_can_optional_list_optional -> empty','xcp_on_can_optional_list_optional',1,'p_xcp_on_can_optional_list_optional','parser.py',653),
-  ('xcp_on_can_optional_list_optional -> xcp_on_can_optional_list','xcp_on_can_optional_list_optional',1,'p_xcp_on_can_optional_list_optional','parser.py',654),
-  ('can_id_broadcast -> CAN_ID_BROADCAST NUMERIC','can_id_broadcast',2,'p_can_id_broadcast','parser.py',659),
-  ('can_id_master -> CAN_ID_MASTER NUMERIC','can_id_master',2,'p_can_id_master','parser.py',664),
-  ('can_id_slave -> CAN_ID_SLAVE NUMERIC','can_id_slave',2,'p_can_id_slave','parser.py',669),
-  ('baudrate -> BAUDRATE NUMERIC','baudrate',2,'p_baudrate','parser.py',674),
-  ('sample_point -> SAMPLE_POINT NUMERIC','sample_point',2,'p_sample_point','parser.py',679),
-  ('sample_rate -> SAMPLE_RATE SINGLE','sample_rate',2,'p_sample_rate','parser.py',684),
-  ('sample_rate -> SAMPLE_RATE TRIPLE','sample_rate',2,'p_sample_rate','parser.py',685),
-  ('btl_cycles -> BTL_CYCLES NUMERIC','btl_cycles',2,'p_btl_cycles','parser.py',690),
-  ('sjw -> SJW NUMERIC','sjw',2,'p_sjw','parser.py',695),
-  ('sync_edge -> SYNC_EDGE SINGLE','sync_edge',2,'p_sync_edge','parser.py',700),
-  ('sync_edge -> SYNC_EDGE DUAL','sync_edge',2,'p_sync_edge','parser.py',701),
-  ('daq_list_can_id -> begin DAQ_LIST_CAN_ID NUMERIC daq_list_can_id_optional_optional end DAQ_LIST_CAN_ID','daq_list_can_id',6,'p_daq_list_can_id','parser.py',706),
-  ('daq_list_can_id_optional -> daq_list_can_id_type_variable','daq_list_can_id_optional',1,'p_daq_list_can_id_optional','parser.py',711),
-  ('daq_list_can_id_optional -> daq_list_can_id_type_fixed','daq_list_can_id_optional',1,'p_daq_list_can_id_optional','parser.py',712),
-  ('daq_list_can_id_optional_optional -> empty','daq_list_can_id_optional_optional',1,'p_daq_list_can_id_optional_optional','parser.py',717),
-  ('daq_list_can_id_optional_optional -> daq_list_can_id_optional','daq_list_can_id_optional_optional',1,'p_daq_list_can_id_optional_optional','parser.py',718),
-  ('daq_list_can_id_type_variable -> VARIABLE','daq_list_can_id_type_variable',1,'p_daq_list_can_id_type_variable','parser.py',723),
-  ('daq_list_can_id_type_fixed -> FIXED NUMERIC','daq_list_can_id_type_fixed',2,'p_daq_list_can_id_type_fixed','parser.py',728),
-  ('daq_event -> begin DAQ_EVENT FIXED_EVENT_LIST daq_event_optional_list_optional end DAQ_EVENT','daq_event',6,'p_daq_event','parser.py',733),
-  ('daq_event -> begin DAQ_EVENT VARIABLE daq_event_optional_list_optional end DAQ_EVENT','daq_event',6,'p_daq_event','parser.py',734),
-  ('daq_event_optional -> available_event_list','daq_event_optional',1,'p_daq_event_optional','parser.py',739),
-  ('daq_event_optional -> default_event_list','daq_event_optional',1,'p_daq_event_optional','parser.py',740),
-  ('daq_event_optional_list -> daq_event_optional','daq_event_optional_list',1,'p_daq_event_optional_list','parser.py',745),
-  ('daq_event_optional_list -> daq_event_optional daq_event_optional_list','daq_event_optional_list',2,'p_daq_event_optional_list','parser.py',746),
-  ('daq_event_optional_list_optional -> empty','daq_event_optional_list_optional',1,'p_daq_event_optional_list_optional','parser.py',754),
-  ('daq_event_optional_list_optional -> daq_event_optional_list','daq_event_optional_list_optional',1,'p_daq_event_optional_list_optional','parser.py',755),
-  ('default_event_list -> begin DEFAULT_EVENT_LIST available_event_list_optional_list_optional end DEFAULT_EVENT_LIST','default_event_list',5,'p_default_event_list','parser.py',760),
-  ('available_event_list -> begin AVAILABLE_EVENT_LIST available_event_list_optional_list_optional end AVAILABLE_EVENT_LIST','available_event_list',5,'p_available_event_list','parser.py',765),
-  ('available_event_list_optional -> EVENT NUMERIC','available_event_list_optional',2,'p_available_event_list_optional','parser.py',770),
-  ('available_event_list_optional_list -> available_event_list_optional','available_event_list_optional_list',1,'p_available_event_list_optional_list','parser.py',775),
-  ('available_event_list_optional_list -> available_event_list_optional available_event_list_optional_list','available_event_list_optional_list',2,'p_available_event_list_optional_list','parser.py',776),
-  ('available_event_list_optional_list_optional -> empty','available_event_list_optional_list_optional',1,'p_available_event_list_optional_list_optional','parser.py',784),
-  ('available_event_list_optional_list_optional -> available_event_list_optional_list','available_event_list_optional_list_optional',1,'p_available_event_list_optional_list_optional','parser.py',785),
-  ('if_data_xcp_optional_list -> if_data_xcp_optional','if_data_xcp_optional_list',1,'p_if_data_xcp_optional_list','parser.py',790),
-  ('if_data_xcp_optional_list -> if_data_xcp_optional if_data_xcp_optional_list','if_data_xcp_optional_list',2,'p_if_data_xcp_optional_list','parser.py',791),
-  ('if_data_xcp_optional_list_optional -> empty','if_data_xcp_optional_list_optional',1,'p_if_data_xcp_optional_list_optional','parser.py',799),
-  ('if_data_xcp_optional_list_optional -> if_data_xcp_optional_list','if_data_xcp_optional_list_optional',1,'p_if_data_xcp_optional_list_optional','parser.py',800),
-  ('pag -> begin PAG NUMERIC pag_optional_list_optional end PAG','pag',6,'p_pag','parser.py',805),
-  ('pgm -> begin PGM IDENT NUMERIC NUMERIC pgm_optional_list_optional end PGM','pgm',8,'p_pgm','parser.py',810),
-  ('pgm_optional -> sector','pgm_optional',1,'p_pgm_optional','parser.py',815),
-  ('pgm_optional -> generic_parameter_list','pgm_optional',1,'p_pgm_optional','parser.py',816),
-  ('pgm_optional_list -> pgm_optional','pgm_optional_list',1,'p_pgm_optional_list','parser.py',821),
-  ('pgm_optional_list -> pgm_optional pgm_optional_list','pgm_optional_list',2,'p_pgm_optional_list','parser.py',822),
-  ('pgm_optional_list_optional -> empty','pgm_optional_list_optional',1,'p_pgm_optional_list_optional','parser.py',830),
-  ('pgm_optional_list_optional -> pgm_optional_list','pgm_optional_list_optional',1,'p_pgm_optional_list_optional','parser.py',831),
-  ('sector -> begin SECTOR STRING NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC end SECTOR','sector',11,'p_sector','parser.py',836),
-  ('pag_optional -> freeze_supported','pag_optional',1,'p_pag_optional','parser.py',841),
-  ('pag_optional -> generic_parameter_list','pag_optional',1,'p_pag_optional','parser.py',842),
-  ('pag_optional_list -> pag_optional','pag_optional_list',1,'p_pag_optional_list','parser.py',847),
-  ('pag_optional_list -> pag_optional pag_optional_list','pag_optional_list',2,'p_pag_optional_list','parser.py',848),
-  ('pag_optional_list_optional -> empty','pag_optional_list_optional',1,'p_pag_optional_list_optional','parser.py',856),
-  ('pag_optional_list_optional -> pag_optional_list','pag_optional_list_optional',1,'p_pag_optional_list_optional','parser.py',857),
-  ('freeze_supported -> FREEZE_SUPPORTED','freeze_supported',1,'p_freeze_supported','parser.py',862),
-  ('daq -> begin DAQ daq_config_type NUMERIC NUMERIC NUMERIC optimisation_type address_extension identification_field_type granularity_odt_entry NUMERIC overload_indication daq_optional_list_optional end DAQ','daq',15,'p_daq','parser.py',867),
-  ('daq_config_type -> STATIC','daq_config_type',1,'p_daq_config_type','parser.py',872),
-  ('daq_config_type -> DYNAMIC','daq_config_type',1,'p_daq_config_type','parser.py',873),
-  ('daq_optional -> daq_list','daq_optional',1,'p_daq_optional','parser.py',878),
-  ('daq_optional -> event','daq_optional',1,'p_daq_optional','parser.py',879),
-  ('daq_optional -> timestamp_supported','daq_optional',1,'p_daq_optional','parser.py',880),
-  ('daq_optional -> optimisation_type','daq_optional',1,'p_daq_optional','parser.py',881),
-  ('daq_optional -> address_extension','daq_optional',1,'p_daq_optional','parser.py',882),
-  ('daq_optional -> identification_field_type','daq_optional',1,'p_daq_optional','parser.py',883),
-  ('daq_optional -> granularity_odt_entry','daq_optional',1,'p_daq_optional','parser.py',884),
-  ('daq_optional -> prescaler_supported','daq_optional',1,'p_daq_optional','parser.py',885),
-  ('daq_optional -> resume_supported','daq_optional',1,'p_daq_optional','parser.py',886),
-  ('daq_optional -> IDENT','daq_optional',1,'p_daq_optional','parser.py',887),
-  ('daq_optional -> NUMERIC','daq_optional',1,'p_daq_optional','parser.py',888),
-  ('prescaler_supported -> PRESCALER_SUPPORTED','prescaler_supported',1,'p_prescaler_supported','parser.py',893),
-  ('resume_supported -> RESUME_SUPPORTED','resume_supported',1,'p_resume_supported','parser.py',898),
-  ('optimisation_type -> OPTIMISATION_TYPE_DEFAULT','optimisation_type',1,'p_optimisation_type','parser.py',903),
-  ('optimisation_type -> OPTIMISATION_TYPE_ODT_TYPE_16','optimisation_type',1,'p_optimisation_type','parser.py',904),
-  ('optimisation_type -> OPTIMISATION_TYPE_ODT_TYPE_32','optimisation_type',1,'p_optimisation_type','parser.py',905),
-  ('optimisation_type -> OPTIMISATION_TYPE_ODT_TYPE_64','optimisation_type',1,'p_optimisation_type','parser.py',906),
-  ('optimisation_type -> OPTIMISATION_TYPE_ODT_TYPE_ALIGNMENT','optimisation_type',1,'p_optimisation_type','parser.py',907),
-  ('optimisation_type -> OPTIMISATION_TYPE_MAX_ENTRY_SIZE','optimisation_type',1,'p_optimisation_type','parser.py',908),
-  ('address_extension -> ADDRESS_EXTENSION_FREE','address_extension',1,'p_address_extension','parser.py',913),
-  ('address_extension -> ADDRESS_EXTENSION_ODT','address_extension',1,'p_address_extension','parser.py',914),
-  ('address_extension -> ADDRESS_EXTENSION_DAQ','address_extension',1,'p_address_extension','parser.py',915),
-  ('identification_field_type -> IDENTIFICATION_FIELD_TYPE_ABSOLUTE','identification_field_type',1,'p_identification_field_type','parser.py',920),
-  ('identification_field_type -> IDENTIFICATION_FIELD_TYPE_RELATIVE_BYTE','identification_field_type',1,'p_identification_field_type','parser.py',921),
-  ('identification_field_type -> IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD','identification_field_type',1,'p_identification_field_type','parser.py',922),
-  ('identification_field_type -> IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD_ALIGNED','identification_field_type',1,'p_identification_field_type','parser.py',923),
-  ('granularity_odt_entry -> GRANULARITY_ODT_ENTRY_SIZE_DAQ_BYTE','granularity_odt_entry',1,'p_granularity_odt_entry','parser.py',928),
-  ('granularity_odt_entry -> GRANULARITY_ODT_ENTRY_SIZE_DAQ_WORD','granularity_odt_entry',1,'p_granularity_odt_entry','parser.py',929),
-  ('granularity_odt_entry -> GRANULARITY_ODT_ENTRY_SIZE_DAQ_DWORD','granularity_odt_entry',1,'p_granularity_odt_entry','parser.py',930),
-  ('granularity_odt_entry -> GRANULARITY_ODT_ENTRY_SIZE_DAQ_DLONG','granularity_odt_entry',1,'p_granularity_odt_entry','parser.py',931),
-  ('overload_indication -> NO_OVERLOAD_INDICATION','overload_indication',1,'p_overload_indication','parser.py',936),
-  ('overload_indication -> OVERLOAD_INDICATION_PID','overload_indication',1,'p_overload_indication','parser.py',937),
-  ('overload_indication -> OVERLOAD_INDICATION_EVENT','overload_indication',1,'p_overload_indication','parser.py',938),
-  ('daq_optional_list -> daq_optional','daq_optional_list',1,'p_daq_optional_list','parser.py',943),
-  ('daq_optional_list -> daq_optional daq_optional_list','daq_optional_list',2,'p_daq_optional_list','parser.py',944),
-  ('daq_optional_list_optional -> empty','daq_optional_list_optional',1,'p_daq_optional_list_optional','parser.py',952),
-  ('daq_optional_list_optional -> daq_optional_list','daq_optional_list_optional',1,'p_daq_optional_list_optional','parser.py',953),
-  ('event -> begin EVENT STRING STRING NUMERIC daq_list_type_enum NUMERIC NUMERIC NUMERIC NUMERIC end EVENT','event',12,'p_event','parser.py',958),
-  ('daq_list -> begin DAQ_LIST NUMERIC daq_list_optional_list_optional end DAQ_LIST','daq_list',6,'p_daq_list','parser.py',963),
-  ('daq_list_optional -> daq_list_type','daq_list_optional',1,'p_daq_list_optional','parser.py',968),
-  ('daq_list_optional -> max_odt','daq_list_optional',1,'p_daq_list_optional','parser.py',969),
-  ('daq_list_optional -> max_odt_entries','daq_list_optional',1,'p_daq_list_optional','parser.py',970),
-  ('daq_list_optional -> first_pid','daq_list_optional',1,'p_daq_list_optional','parser.py',971),
-  ('daq_list_optional -> event_fixed','daq_list_optional',1,'p_daq_list_optional','parser.py',972),
-  ('daq_list_optional -> predefined','daq_list_optional',1,'p_daq_list_optional','parser.py',973),
-  ('daq_list_type_enum -> DAQ','daq_list_type_enum',1,'p_daq_list_type_enum','parser.py',978),
-  ('daq_list_type_enum -> STIM','daq_list_type_enum',1,'p_daq_list_type_enum','parser.py',979),
-  ('daq_list_type_enum -> DAQ_STIM','daq_list_type_enum',1,'p_daq_list_type_enum','parser.py',980),
-  ('daq_list_type -> DAQ_LIST_TYPE daq_list_type_enum','daq_list_type',2,'p_daq_list_type','parser.py',985),
-  ('max_odt -> MAX_ODT NUMERIC','max_odt',2,'p_max_odt','parser.py',990),
-  ('max_odt_entries -> MAX_ODT_ENTRIES NUMERIC','max_odt_entries',2,'p_max_odt_entries','parser.py',995),
-  ('first_pid -> FIRST_PID NUMERIC','first_pid',2,'p_first_pid','parser.py',1000),
-  ('event_fixed -> EVENT_FIXED NUMERIC','event_fixed',2,'p_event_fixed','parser.py',1005),
-  ('predefined -> generic_parameter_list','predefined',1,'p_predefined','parser.py',1010),
-  ('daq_list_optional_list -> daq_list_optional','daq_list_optional_list',1,'p_daq_list_optional_list','parser.py',1015),
-  ('daq_list_optional_list -> daq_list_optional daq_list_optional_list','daq_list_optional_list',2,'p_daq_list_optional_list','parser.py',1016),
-  ('daq_list_optional_list_optional -> empty','daq_list_optional_list_optional',1,'p_daq_list_optional_list_optional','parser.py',1024),
-  ('daq_list_optional_list_optional -> daq_list_optional_list','daq_list_optional_list_optional',1,'p_daq_list_optional_list_optional','parser.py',1025),
-  ('timestamp_supported -> begin TIMESTAMP_SUPPORTED NUMERIC IDENT IDENT timestamp_fixed end TIMESTAMP_SUPPORTED','timestamp_supported',8,'p_timestamp_supported','parser.py',1030),
-  ('timestamp_fixed -> empty','timestamp_fixed',1,'p_timestamp_fixed','parser.py',1035),
-  ('timestamp_fixed -> TIMESTAMP_FIXED','timestamp_fixed',1,'p_timestamp_fixed','parser.py',1036),
-  ('protocol_layer -> begin PROTOCOL_LAYER NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC protocol_layer_optional_list_optional end PROTOCOL_LAYER','protocol_layer',15,'p_protocol_layer','parser.py',1041),
-  ('protocol_layer_optional -> generic_parameter_list','protocol_layer_optional',1,'p_protocol_layer_optional','parser.py',1046),
-  ('protocol_layer_optional_list -> protocol_layer_optional','protocol_layer_optional_list',1,'p_protocol_layer_optional_list','parser.py',1050),
-  ('protocol_layer_optional_list -> protocol_layer_optional protocol_layer_optional_list','protocol_layer_optional_list',2,'p_protocol_layer_optional_list','parser.py',1051),
-  ('protocol_layer_optional_list_optional -> empty','protocol_layer_optional_list_optional',1,'p_protocol_layer_optional_list_optional','parser.py',1059),
-  ('protocol_layer_optional_list_optional -> protocol_layer_optional_list','protocol_layer_optional_list_optional',1,'p_protocol_layer_optional_list_optional','parser.py',1060),
-  ('if_data_module -> begin IF_DATA IDENT if_data_module_optional_list_optional end IF_DATA','if_data_module',6,'p_if_data_module','parser.py',1065),
-  ('if_data_module_optional -> source','if_data_module_optional',1,'p_if_data_module_optional','parser.py',1070),
-  ('if_data_module_optional -> raster','if_data_module_optional',1,'p_if_data_module_optional','parser.py',1071),
-  ('if_data_module_optional -> event_group','if_data_module_optional',1,'p_if_data_module_optional','parser.py',1072),
-  ('if_data_module_optional -> seed_key','if_data_module_optional',1,'p_if_data_module_optional','parser.py',1073),
-  ('if_data_module_optional -> checksum','if_data_module_optional',1,'p_if_data_module_optional','parser.py',1074),
-  ('if_data_module_optional -> tp_blob tp_data','if_data_module_optional',2,'p_if_data_module_optional','parser.py',1075),
-  ('if_data_module_optional -> if_data_module_unsupported_element','if_data_module_optional',1,'p_if_data_module_optional','parser.py',1076),
-  ('if_data_module_optional_list -> if_data_module_optional','if_data_module_optional_list',1,'p_if_data_module_optional_list','parser.py',1081),
-  ('if_data_module_optional_list -> if_data_module_optional if_data_module_optional_list','if_data_module_optional_list',2,'p_if_data_module_optional_list','parser.py',1082),
-  ('if_data_module_optional_list_optional -> empty','if_data_module_optional_list_optional',1,'p_if_data_module_optional_list_optional','parser.py',1090),
-  ('if_data_module_optional_list_optional -> if_data_module_optional_list','if_data_module_optional_list_optional',1,'p_if_data_module_optional_list_optional','parser.py',1091),
-  ('if_data_module_unsupported_element -> generic_parameter_list','if_data_module_unsupported_element',1,'p_if_data_module_unsupported_element','parser.py',1096),
-  ('source -> begin SOURCE IDENT NUMERIC NUMERIC source_optional_list_optional end SOURCE','source',8,'p_source','parser.py',1100),
-  ('raster -> begin RASTER STRING STRING NUMERIC NUMERIC NUMERIC end RASTER','raster',9,'p_raster','parser.py',1105),
-  ('event_group -> begin EVENT_GROUP STRING STRING number_list end EVENT_GROUP','event_group',7,'p_event_group','parser.py',1110),
-  ('seed_key -> begin SEED_KEY STRING STRING STRING end SEED_KEY','seed_key',7,'p_seed_key','parser.py',1115),
-  ('checksum -> begin CHECKSUM STRING end CHECKSUM','checksum',5,'p_checksum','parser.py',1120),
-  ('checksum -> begin CHECKSUM IDENT max_block_size end CHECKSUM','checksum',6,'p_checksum','parser.py',1121),
-  ('max_block_size -> MAX_BLOCK_SIZE NUMERIC','max_block_size',2,'p_max_block_size','parser.py',1129),
-  ('tp_blob -> TP_BLOB','tp_blob',1,'p_tp_blob','parser.py',1134),
-  ('tp_data -> generic_parameter_list','tp_data',1,'p_tp_data','parser.py',1139),
-  ('source_optional -> display_identifier','source_optional',1,'p_source_optional','parser.py',1144),
-  ('source_optional -> qp_blob','source_optional',1,'p_source_optional','parser.py',1145),
-  ('source_optional_list -> source_optional','source_optional_list',1,'p_source_optional_list','parser.py',1150),
-  ('source_optional_list -> source_optional source_optional_list','source_optional_list',2,'p_source_optional_list','parser.py',1151),
-  ('source_optional_list_optional -> empty','source_optional_list_optional',1,'p_source_optional_list_optional','parser.py',1159),
-  ('source_optional_list_optional -> source_optional_list','source_optional_list_optional',1,'p_source_optional_list_optional','parser.py',1160),
-  ('qp_blob -> QP_BLOB IDENT','qp_blob',2,'p_qp_blob','parser.py',1165),
-  ('mod_par -> begin MOD_PAR STRING mod_par_optional_list_optional end MOD_PAR','mod_par',6,'p_mod_par','parser.py',1169),
-  ('mod_par_optional -> version','mod_par_optional',1,'p_mod_par_optional','parser.py',1174),
-  ('mod_par_optional -> addr_epk','mod_par_optional',1,'p_mod_par_optional','parser.py',1175),
-  ('mod_par_optional -> epk','mod_par_optional',1,'p_mod_par_optional','parser.py',1176),
-  ('mod_par_optional -> supplier','mod_par_optional',1,'p_mod_par_optional','parser.py',1177),
-  ('mod_par_optional -> customer','mod_par_optional',1,'p_mod_par_optional','parser.py',1178),
-  ('mod_par_optional -> customer_no','mod_par_optional',1,'p_mod_par_optional','parser.py',1179),
-  ('mod_par_optional -> user','mod_par_optional',1,'p_mod_par_optional','parser.py',1180),
-  ('mod_par_optional -> phone_no','mod_par_optional',1,'p_mod_par_optional','parser.py',1181),
-  ('mod_par_optional -> ecu','mod_par_optional',1,'p_mod_par_optional','parser.py',1182),
-  ('mod_par_optional -> cpu_type','mod_par_optional',1,'p_mod_par_optional','parser.py',1183),
-  ('mod_par_optional -> no_of_interfaces','mod_par_optional',1,'p_mod_par_optional','parser.py',1184),
-  ('mod_par_optional -> ecu_calibration_offset','mod_par_optional',1,'p_mod_par_optional','parser.py',1185),
-  ('mod_par_optional -> calibration_method','mod_par_optional',1,'p_mod_par_optional','parser.py',1186),
-  ('mod_par_optional -> memory_layout','mod_par_optional',1,'p_mod_par_optional','parser.py',1187),
-  ('mod_par_optional -> memory_segment','mod_par_optional',1,'p_mod_par_optional','parser.py',1188),
-  ('mod_par_optional -> system_constant','mod_par_optional',1,'p_mod_par_optional','parser.py',1189),
-  ('mod_par_optional_list -> mod_par_optional','mod_par_optional_list',1,'p_mod_par_optional_list','parser.py',1194),
-  ('mod_par_optional_list -> mod_par_optional mod_par_optional_list','mod_par_optional_list',2,'p_mod_par_optional_list','parser.py',1195),
-  ('mod_par_optional_list_optional -> empty','mod_par_optional_list_optional',1,'p_mod_par_optional_list_optional','parser.py',1203),
-  ('mod_par_optional_list_optional -> mod_par_optional_list','mod_par_optional_list_optional',1,'p_mod_par_optional_list_optional','parser.py',1204),
-  ('addr_epk -> ADDR_EPK NUMERIC','addr_epk',2,'p_addr_epk','parser.py',1209),
-  ('epk -> EPK STRING','epk',2,'p_epk','parser.py',1214),
-  ('supplier -> SUPPLIER STRING','supplier',2,'p_supplier','parser.py',1219),
-  ('customer -> CUSTOMER STRING','customer',2,'p_customer','parser.py',1224),
-  ('customer_no -> CUSTOMER_NO STRING','customer_no',2,'p_customer_no','parser.py',1229),
-  ('user -> USER STRING','user',2,'p_user','parser.py',1234),
-  ('phone_no -> PHONE_NO STRING','phone_no',2,'p_phone_no','parser.py',1239),
-  ('mod_common -> begin MOD_COMMON STRING mod_common_optional_list_optional end MOD_COMMON','mod_common',6,'p_mod_common','parser.py',1244),
-  ('mod_common_optional -> s_rec_layout','mod_common_optional',1,'p_mod_common_optional','parser.py',1249),
-  ('mod_common_optional -> deposit','mod_common_optional',1,'p_mod_common_optional','parser.py',1250),
-  ('mod_common_optional -> byte_order','mod_common_optional',1,'p_mod_common_optional','parser.py',1251),
-  ('mod_common_optional -> data_size','mod_common_optional',1,'p_mod_common_optional','parser.py',1252),
-  ('mod_common_optional -> alignment_byte','mod_common_optional',1,'p_mod_common_optional','parser.py',1253),
-  ('mod_common_optional -> alignment_word','mod_common_optional',1,'p_mod_common_optional','parser.py',1254),
-  ('mod_common_optional -> alignment_long','mod_common_optional',1,'p_mod_common_optional','parser.py',1255),
-  ('mod_common_optional -> alignment_float32_ieee','mod_common_optional',1,'p_mod_common_optional','parser.py',1256),
-  ('mod_common_optional -> alignment_float64_ieee','mod_common_optional',1,'p_mod_common_optional','parser.py',1257),
-  ('mod_common_optional_list -> mod_common_optional','mod_common_optional_list',1,'p_mod_common_optional_parameter_list','parser.py',1262),
-  ('mod_common_optional_list -> mod_common_optional mod_common_optional_list','mod_common_optional_list',2,'p_mod_common_optional_parameter_list','parser.py',1263),
-  ('mod_common_optional_list_optional -> empty','mod_common_optional_list_optional',1,'p_mod_common_optional_parameter_list_optional','parser.py',1271),
-  ('mod_common_optional_list_optional -> mod_common_optional_list','mod_common_optional_list_optional',1,'p_mod_common_optional_parameter_list_optional','parser.py',1272),
-  ('s_rec_layout -> S_REC_LAYOUT IDENT','s_rec_layout',2,'p_s_rec_layout','parser.py',1277),
-  ('data_size -> DATA_SIZE NUMERIC','data_size',2,'p_data_size','parser.py',1282),
-  ('ecu -> ECU STRING','ecu',2,'p_ecu','parser.py',1287),
-  ('cpu_type -> CPU_TYPE STRING','cpu_type',2,'p_cpu_type','parser.py',1292),
-  ('no_of_interfaces -> NO_OF_INTERFACES NUMERIC','no_of_interfaces',2,'p_no_of_interfaces','parser.py',1297),
-  ('ecu_calibration_offset -> ECU_CALIBRATION_OFFSET NUMERIC','ecu_calibration_offset',2,'p_ecu_calibration_offset','parser.py',1302),
-  ('calibration_method -> begin CALIBRATION_METHOD STRING NUMERIC calibration_method_optional_list_optional end CALIBRATION_METHOD','calibration_method',7,'p_calibration_method','parser.py',1307),
-  ('calibration_method_optional -> calibration_handle','calibration_method_optional',1,'p_calibration_method_optional','parser.py',1312),
-  ('calibration_method_optional_list -> calibration_method_optional','calibration_method_optional_list',1,'p_calibration_method_optional_list','parser.py',1317),
-  ('calibration_method_optional_list -> calibration_method_optional calibration_method_optional_list','calibration_method_optional_list',2,'p_calibration_method_optional_list','parser.py',1318),
-  ('calibration_method_optional_list_optional -> empty','calibration_method_optional_list_optional',1,'p_calibration_method_optional_list_optional','parser.py',1326),
-  ('calibration_method_optional_list_optional -> calibration_method_optional_list','calibration_method_optional_list_optional',1,'p_calibration_method_optional_list_optional','parser.py',1327),
-  ('calibration_handle -> begin CALIBRATION_HANDLE calibration_handle_optional_list_optional end CALIBRATION_HANDLE','calibration_handle',5,'p_calibration_handle','parser.py',1332),
-  ('calibration_handle_optional -> NUMERIC','calibration_handle_optional',1,'p_calibration_handle_optional','parser.py',1337),
-  ('calibration_handle_optional_list -> calibration_handle_optional','calibration_handle_optional_list',1,'p_calibration_handle_optional_list','parser.py',1342),
-  ('calibration_handle_optional_list -> calibration_handle_optional calibration_handle_optional_list','calibration_handle_optional_list',2,'p_calibration_handle_optional_list','parser.py',1343),
-  ('calibration_handle_optional_list_optional -> empty','calibration_handle_optional_list_optional',1,'p_calibration_handle_optional_list_optional','parser.py',1351),
-  ('calibration_handle_optional_list_optional -> calibration_handle_optional_list','calibration_handle_optional_list_optional',1,'p_calibration_handle_optional_list_optional','parser.py',1352),
-  ('memory_layout -> begin MEMORY_LAYOUT memory_layout_prg_type NUMERIC NUMERIC number_list memory_layout_optional_list_optional end MEMORY_LAYOUT','memory_layout',9,'p_memory_layout','parser.py',1357),
-  ('memory_layout_prg_type -> PRG_CODE','memory_layout_prg_type',1,'p_memory_layout_prg_type','parser.py',1362),
-  ('memory_layout_prg_type -> PRG_DATA','memory_layout_prg_type',1,'p_memory_layout_prg_type','parser.py',1363),
-  ('memory_layout_prg_type -> PRG_RESERVED','memory_layout_prg_type',1,'p_memory_layout_prg_type','parser.py',1364),
-  ('memory_layout_optional -> if_data_memory_layout','memory_layout_optional',1,'p_memory_layout_optional','parser.py',1369),
-  ('memory_layout_optional_list -> memory_layout_optional','memory_layout_optional_list',1,'p_memory_layout_optional_list','parser.py',1374),
-  ('memory_layout_optional_list -> memory_layout_optional memory_layout_optional_list','memory_layout_optional_list',2,'p_memory_layout_optional_list','parser.py',1375),
-  ('memory_layout_optional_list_optional -> empty','memory_layout_optional_list_optional',1,'p_memory_layout_optional_list_optional','parser.py',1383),
-  ('memory_layout_optional_list_optional -> memory_layout_optional_list','memory_layout_optional_list_optional',1,'p_memory_layout_optional_list_optional','parser.py',1384),
-  ('if_data_memory_layout -> begin IF_DATA IDENT if_data_memory_layout_optional_list_optional end IF_DATA','if_data_memory_layout',6,'p_if_data_memory_layout','parser.py',1389),
-  ('if_data_memory_layout_optional -> dp_blob dp_data','if_data_memory_layout_optional',2,'p_if_data_memory_layout_optional','parser.py',1393),
-  ('if_data_memory_layout_optional -> ba_blob pa_data','if_data_memory_layout_optional',2,'p_if_data_memory_layout_optional','parser.py',1394),
-  ('if_data_memory_layout_optional_list -> if_data_memory_layout_optional','if_data_memory_layout_optional_list',1,'p_if_data_memory_layout_optional_list','parser.py',1398),
-  ('if_data_memory_layout_optional_list -> if_data_memory_layout_optional if_data_memory_layout_optional_list','if_data_memory_layout_optional_list',2,'p_if_data_memory_layout_optional_list','parser.py',1399),
-  ('if_data_memory_layout_optional_list_optional -> empty','if_data_memory_layout_optional_list_optional',1,'p_if_data_memory_layout_optional_list_optional','parser.py',1407),
-  ('if_data_memory_layout_optional_list_optional -> if_data_memory_layout_optional_list','if_data_memory_layout_optional_list_optional',1,'p_if_data_memory_layout_optional_list_optional','parser.py',1408),
-  ('dp_blob -> DP_BLOB','dp_blob',1,'p_dp_blob','parser.py',1412),
-  ('ba_blob -> BA_BLOB','ba_blob',1,'p_ba_blob','parser.py',1417),
-  ('dp_data -> generic_parameter_list','dp_data',1,'p_dp_data','parser.py',1422),
-  ('pa_data -> generic_parameter_list','pa_data',1,'p_pa_data','parser.py',1427),
-  ('memory_segment -> begin MEMORY_SEGMENT IDENT STRING memory_segment_prg_type memory_segment_memory_type memory_segment_attributes NUMERIC NUMERIC number_list memory_segment_optional_list_optional end MEMORY_SEGMENT','memory_segment',13,'p_memory_segment','parser.py',1432),
-  ('memory_segment_optional -> if_data_memory_segment','memory_segment_optional',1,'p_memory_segment_optional','parser.py',1437),
-  ('memory_segment_optional -> if_data_xcp','memory_segment_optional',1,'p_memory_segment_optional','parser.py',1438),
-  ('memory_segment_optional_parameter_list -> memory_segment_optional','memory_segment_optional_parameter_list',1,'p_memory_segment_optional_parameter_list','parser.py',1443),
-  ('memory_segment_optional_parameter_list -> memory_segment_optional memory_segment_optional_parameter_list','memory_segment_optional_parameter_list',2,'p_memory_segment_optional_parameter_list','parser.py',1444),
-  ('memory_segment_optional_list_optional -> empty','memory_segment_optional_list_optional',1,'p_memory_segment_optional_list_optional','parser.py',1452),
-  ('memory_segment_optional_list_optional -> memory_segment_optional_parameter_list','memory_segment_optional_list_optional',1,'p_memory_segment_optional_list_optional','parser.py',1453),
-  ('memory_segment_prg_type -> CODE','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1458),
-  ('memory_segment_prg_type -> DATA','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1459),
-  ('memory_segment_prg_type -> OFFLINE_DATA','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1460),
-  ('memory_segment_prg_type -> VARIABLES','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1461),
-  ('memory_segment_prg_type -> SERAM','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1462),
-  ('memory_segment_prg_type -> RESERVED','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1463),
-  ('memory_segment_prg_type -> CALIBRATION_VARIABLES','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1464),
-  ('memory_segment_prg_type -> EXCLUDE_FROM_FLASH','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1465),
-  ('memory_segment_memory_type -> RAM','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',1470),
-  ('memory_segment_memory_type -> EEPROM','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',1471),
-  ('memory_segment_memory_type -> EPROM','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',1472),
-  ('memory_segment_memory_type -> ROM','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',1473),
-  ('memory_segment_memory_type -> REGISTER','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',1474),
-  ('memory_segment_memory_type -> FLASH','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',1475),
-  ('memory_segment_attributes -> INTERN','memory_segment_attributes',1,'p_memory_segment_attributes','parser.py',1480),
-  ('memory_segment_attributes -> EXTERN','memory_segment_attributes',1,'p_memory_segment_attributes','parser.py',1481),
-  ('system_constant -> SYSTEM_CONSTANT STRING STRING','system_constant',3,'p_system_constant','parser.py',1486),
-  ('if_data_memory_segment -> begin IF_DATA IDENT if_data_memory_segment_optional_list_optional end IF_DATA','if_data_memory_segment',6,'p_if_data_memory_segment','parser.py',1491),
-  ('if_data_memory_segment_optional -> address_mapping','if_data_memory_segment_optional',1,'p_if_data_memory_segment_optional','parser.py',1496),
-  ('if_data_memory_segment_optional -> segment','if_data_memory_segment_optional',1,'p_if_data_memory_segment_optional','parser.py',1497),
-  ('if_data_memory_segment_optional -> generic_parameter','if_data_memory_segment_optional',1,'p_if_data_memory_segment_optional','parser.py',1498),
-  ('if_data_memory_segment_optional_list -> if_data_memory_segment_optional','if_data_memory_segment_optional_list',1,'p_if_data_memory_segment_optional_list','parser.py',1503),
-  ('if_data_memory_segment_optional_list -> if_data_memory_segment_optional if_data_memory_segment_optional_list','if_data_memory_segment_optional_list',2,'p_if_data_memory_segment_optional_list','parser.py',1504),
-  ('if_data_memory_segment_optional_list_optional -> empty','if_data_memory_segment_optional_list_optional',1,'p_if_data_memory_segment_optional_list_optional','parser.py',1513),
-  ('if_data_memory_segment_optional_list_optional -> if_data_memory_segment_optional_list','if_data_memory_segment_optional_list_optional',1,'p_if_data_memory_segment_optional_list_optional','parser.py',1514),
-  ('segment -> begin SEGMENT NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC segment_optional_parameter_list_optional end SEGMENT','segment',10,'p_segment','parser.py',1519),
-  ('segment_optional_parameter -> page','segment_optional_parameter',1,'p_segment_optional_parameter','parser.py',1524),
-  ('segment_optional_parameter -> checksum','segment_optional_parameter',1,'p_segment_optional_parameter','parser.py',1525),
-  ('segment_optional_parameter_list -> segment_optional_parameter','segment_optional_parameter_list',1,'p_segment_optional_parameter_list','parser.py',1530),
-  ('segment_optional_parameter_list -> segment_optional_parameter segment_optional_parameter_list','segment_optional_parameter_list',2,'p_segment_optional_parameter_list','parser.py',1531),
-  ('segment_optional_parameter_list_optional -> empty','segment_optional_parameter_list_optional',1,'p_segment_optional_parameter_list_optional','parser.py',1539),
-  ('segment_optional_parameter_list_optional -> segment_optional_parameter_list','segment_optional_parameter_list_optional',1,'p_segment_optional_parameter_list_optional','parser.py',1540),
-  ('page -> begin PAGE NUMERIC IDENT IDENT IDENT page_optional_parameter_list_optional end PAGE','page',9,'p_page','parser.py',1545),
-  ('page_optional_parameter -> init_segment','page_optional_parameter',1,'p_page_optional_parameter','parser.py',1549),
-  ('page_optional_parameter_list -> page_optional_parameter','page_optional_parameter_list',1,'p_page_optional_parameter_list','parser.py',1553),
-  ('page_optional_parameter_list -> page_optional_parameter page_optional_parameter_list','page_optional_parameter_list',2,'p_page_optional_parameter_list','parser.py',1554),
-  ('page_optional_parameter_list_optional -> empty','page_optional_parameter_list_optional',1,'p_page_optional_parameter_list_optional','parser.py',1562),
-  ('page_optional_parameter_list_optional -> page_optional_parameter_list','page_optional_parameter_list_optional',1,'p_page_optional_parameter_list_optional','parser.py',1563),
-  ('init_segment -> INIT_SEGMENT NUMERIC','init_segment',2,'p_init_segment','parser.py',1567),
-  ('address_mapping -> ADDRESS_MAPPING NUMERIC NUMERIC NUMERIC','address_mapping',4,'p_address_mapping','parser.py',1571),
-  ('characteristic -> begin CHARACTERISTIC IDENT STRING characteristic_type NUMERIC IDENT NUMERIC IDENT NUMERIC NUMERIC characteristic_optional_list_optional end CHARACTERISTIC','characteristic',14,'p_characteristic','parser.py',1576),
-  ('characteristic_type -> VALUE','characteristic_type',1,'p_characteristic_type','parser.py',1581),
-  ('characteristic_type -> CURVE','characteristic_type',1,'p_characteristic_type','parser.py',1582),
-  ('characteristic_type -> MAP','characteristic_type',1,'p_characteristic_type','parser.py',1583),
-  ('characteristic_type -> CUBOID','characteristic_type',1,'p_characteristic_type','parser.py',1584),
-  ('characteristic_type -> VAL_BLK','characteristic_type',1,'p_characteristic_type','parser.py',1585),
-  ('characteristic_type -> ASCII','characteristic_type',1,'p_characteristic_type','parser.py',1586),
-  ('display_identifier -> DISPLAY_IDENTIFIER IDENT','display_identifier',2,'p_display_identifier','parser.py',1591),
-  ('format -> FORMAT STRING','format',2,'p_format','parser.py',1596),
-  ('byte_order -> BYTE_ORDER byte_order_type','byte_order',2,'p_byte_order','parser.py',1601),
-  ('byte_order_type -> MSB_FIRST','byte_order_type',1,'p_byte_order_type','parser.py',1606),
-  ('byte_order_type -> MSB_LAST','byte_order_type',1,'p_byte_order_type','parser.py',1607),
-  ('bit_mask -> BIT_MASK NUMERIC','bit_mask',2,'p_bit_mask','parser.py',1612),
-  ('function_list -> begin FUNCTION_LIST function_list_optional_list_optional end FUNCTION_LIST','function_list',5,'p_function_list','parser.py',1617),
-  ('function_list_optional -> IDENT','function_list_optional',1,'p_function_list_optional','parser.py',1622),
-  ('function_list_optional_list -> function_list_optional','function_list_optional_list',1,'p_function_list_optional_list','parser.py',1627),
-  ('function_list_optional_list -> function_list_optional function_list_optional_list','function_list_optional_list',2,'p_function_list_optional_list','parser.py',1628),
-  ('function_list_optional_list_optional -> empty','function_list_optional_list_optional',1,'p_function_list_optional_list_optional','parser.py',1636),
-  ('function_list_optional_list_optional -> function_list_optional_list','function_list_optional_list_optional',1,'p_function_list_optional_list_optional','parser.py',1637),
-  ('number -> NUMBER NUMERIC','number',2,'p_number','parser.py',1642),
-  ('extended_limits -> EXTENDED_LIMITS NUMERIC NUMERIC','extended_limits',3,'p_extended_limits','parser.py',1647),
-  ('map_list -> begin MAP_LIST ident_list end MAP_LIST','map_list',5,'p_map_list','parser.py',1652),
-  ('max_refresh -> MAX_REFRESH NUMERIC NUMERIC','max_refresh',3,'p_max_refresh','parser.py',1657),
-  ('dependent_characteristic -> begin DEPENDENT_CHARACTERISTIC STRING ident_list end DEPENDENT_CHARACTERISTIC','dependent_characteristic',6,'p_dependent_characteristic','parser.py',1662),
-  ('virtual_characteristic -> begin VIRTUAL_CHARACTERISTIC STRING virtual_characteristic_optional end VIRTUAL_CHARACTERISTIC','virtual_characteristic',6,'p_virtual_characteristic','parser.py',1667),
-  ('virtual_characteristic_optional -> empty','virtual_characteristic_optional',1,'p_virtual_characteristic_optional','parser.py',1672),
-  ('virtual_characteristic_optional -> ident_list','virtual_characteristic_optional',1,'p_virtual_characteristic_optional','parser.py',1673),
-  ('ref_memory_segment -> REF_MEMORY_SEGMENT IDENT','ref_memory_segment',2,'p_ref_memory_segment','parser.py',1678),
-  ('annotation -> begin ANNOTATION annotation_optional_list_optional end ANNOTATION','annotation',5,'p_annotation','parser.py',1683),
-  ('annotation_optional -> annotation_label','annotation_optional',1,'p_annotation_optional','parser.py',1688),
-  ('annotation_optional -> annotation_origin','annotation_optional',1,'p_annotation_optional','parser.py',1689),
-  ('annotation_optional -> annotation_text','annotation_optional',1,'p_annotation_optional','parser.py',1690),
-  ('annotation_optional_list -> annotation_optional','annotation_optional_list',1,'p_annotation_optional_list','parser.py',1695),
-  ('annotation_optional_list -> annotation_optional annotation_optional_list','annotation_optional_list',2,'p_annotation_optional_list','parser.py',1696),
-  ('annotation_optional_list_optional -> empty','annotation_optional_list_optional',1,'p_annotation_optional_list_optional','parser.py',1704),
-  ('annotation_optional_list_optional -> annotation_optional_list','annotation_optional_list_optional',1,'p_annotation_optional_list_optional','parser.py',1705),
-  ('annotation_label -> ANNOTATION_LABEL STRING','annotation_label',2,'p_annotation_label','parser.py',1710),
-  ('annotation_origin -> ANNOTATION_ORIGIN STRING','annotation_origin',2,'p_annotation_origin','parser.py',1715),
-  ('annotation_text -> begin ANNOTATION_TEXT string_list end ANNOTATION_TEXT','annotation_text',5,'p_annotation_text','parser.py',1720),
-  ('comparison_quantity -> COMPARISON_QUANTITY IDENT','comparison_quantity',2,'p_comparison_quantity','parser.py',1725),
-  ('axis_descr -> begin AXIS_DESCR axis_descr_attribute IDENT IDENT NUMERIC NUMERIC NUMERIC axis_descr_optional_list_optional end AXIS_DESCR','axis_descr',11,'p_axis_descr','parser.py',1730),
-  ('axis_descr_optional -> read_only','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1735),
-  ('axis_descr_optional -> format','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1736),
-  ('axis_descr_optional -> annotation','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1737),
-  ('axis_descr_optional -> axis_pts_ref','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1738),
-  ('axis_descr_optional -> max_grad','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1739),
-  ('axis_descr_optional -> monotony','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1740),
-  ('axis_descr_optional -> byte_order','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1741),
-  ('axis_descr_optional -> extended_limits','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1742),
-  ('axis_descr_optional -> fix_axis_par','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1743),
-  ('axis_descr_optional -> fix_axis_par_dist','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1744),
-  ('axis_descr_optional -> fix_axis_par_list','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1745),
-  ('axis_descr_optional -> deposit','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1746),
-  ('axis_descr_optional -> curve_axis_ref','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1747),
-  ('axis_descr_optional_list -> axis_descr_optional','axis_descr_optional_list',1,'p_axis_descr_optional_list','parser.py',1752),
-  ('axis_descr_optional_list -> axis_descr_optional axis_descr_optional_list','axis_descr_optional_list',2,'p_axis_descr_optional_list','parser.py',1753),
-  ('axis_descr_optional_list_optional -> empty','axis_descr_optional_list_optional',1,'p_axis_descr_optional_list_optional','parser.py',1761),
-  ('axis_descr_optional_list_optional -> axis_descr_optional_list','axis_descr_optional_list_optional',1,'p_axis_descr_optional_list_optional','parser.py',1762),
-  ('axis_pts_ref -> AXIS_PTS_REF IDENT','axis_pts_ref',2,'p_axis_pts_ref','parser.py',1767),
-  ('max_grad -> MAX_GRAD NUMERIC','max_grad',2,'p_max_grad','parser.py',1772),
-  ('monotony -> MONOTONY monotony_type','monotony',2,'p_monotony','parser.py',1777),
-  ('monotony_type -> MON_INCREASE','monotony_type',1,'p_monotony_type','parser.py',1782),
-  ('monotony_type -> MON_DECREASE','monotony_type',1,'p_monotony_type','parser.py',1783),
-  ('monotony_type -> STRICT_INCREASE','monotony_type',1,'p_monotony_type','parser.py',1784),
-  ('monotony_type -> STRICT_DECREASE','monotony_type',1,'p_monotony_type','parser.py',1785),
-  ('fix_axis_par -> FIX_AXIS_PAR NUMERIC NUMERIC NUMERIC','fix_axis_par',4,'p_fix_axis_par','parser.py',1790),
-  ('fix_axis_par_dist -> FIX_AXIS_PAR_DIST NUMERIC NUMERIC NUMERIC','fix_axis_par_dist',4,'p_fix_axis_par_dist','parser.py',1795),
-  ('fix_axis_par_list -> begin FIX_AXIS_PAR_LIST number_list end FIX_AXIS_PAR_LIST','fix_axis_par_list',5,'p_fix_axis_par_list','parser.py',1800),
-  ('curve_axis_ref -> CURVE_AXIS_REF IDENT','curve_axis_ref',2,'p_curve_axis_ref','parser.py',1805),
-  ('axis_descr_attribute -> STD_AXIS','axis_descr_attribute',1,'p_axis_descr_attribute','parser.py',1810),
-  ('axis_descr_attribute -> FIX_AXIS','axis_descr_attribute',1,'p_axis_descr_attribute','parser.py',1811),
-  ('axis_descr_attribute -> COM_AXIS','axis_descr_attribute',1,'p_axis_descr_attribute','parser.py',1812),
-  ('axis_descr_attribute -> RES_AXIS','axis_descr_attribute',1,'p_axis_descr_attribute','parser.py',1813),
-  ('axis_descr_attribute -> CURVE_AXIS','axis_descr_attribute',1,'p_axis_descr_attribute','parser.py',1814),
-  ('calibration_access -> CALIBRATION_ACCESS calibration_access_type','calibration_access',2,'p_calibration_access','parser.py',1819),
-  ('calibration_access_type -> CALIBRATION','calibration_access_type',1,'p_calibration_access_type','parser.py',1824),
-  ('calibration_access_type -> NO_CALIBRATION','calibration_access_type',1,'p_calibration_access_type','parser.py',1825),
-  ('calibration_access_type -> NOT_IN_MCD_SYSTEM','calibration_access_type',1,'p_calibration_access_type','parser.py',1826),
-  ('calibration_access_type -> OFFLINE_CALIBRATION','calibration_access_type',1,'p_calibration_access_type','parser.py',1827),
-  ('matrix_dim -> MATRIX_DIM NUMERIC NUMERIC NUMERIC','matrix_dim',4,'p_matrix_dim','parser.py',1832),
-  ('ecu_address_extension -> ECU_ADDRESS_EXTENSION NUMERIC','ecu_address_extension',2,'p_ecu_address_extension','parser.py',1837),
-  ('characteristic_optional -> display_identifier','characteristic_optional',1,'p_characteristic_optional','parser.py',1842),
-  ('characteristic_optional -> format','characteristic_optional',1,'p_characteristic_optional','parser.py',1843),
-  ('characteristic_optional -> byte_order','characteristic_optional',1,'p_characteristic_optional','parser.py',1844),
-  ('characteristic_optional -> bit_mask','characteristic_optional',1,'p_characteristic_optional','parser.py',1845),
-  ('characteristic_optional -> function_list','characteristic_optional',1,'p_characteristic_optional','parser.py',1846),
-  ('characteristic_optional -> number','characteristic_optional',1,'p_characteristic_optional','parser.py',1847),
-  ('characteristic_optional -> extended_limits','characteristic_optional',1,'p_characteristic_optional','parser.py',1848),
-  ('characteristic_optional -> read_only','characteristic_optional',1,'p_characteristic_optional','parser.py',1849),
-  ('characteristic_optional -> guard_rails','characteristic_optional',1,'p_characteristic_optional','parser.py',1850),
-  ('characteristic_optional -> map_list','characteristic_optional',1,'p_characteristic_optional','parser.py',1851),
-  ('characteristic_optional -> max_refresh','characteristic_optional',1,'p_characteristic_optional','parser.py',1852),
-  ('characteristic_optional -> dependent_characteristic','characteristic_optional',1,'p_characteristic_optional','parser.py',1853),
-  ('characteristic_optional -> virtual_characteristic','characteristic_optional',1,'p_characteristic_optional','parser.py',1854),
-  ('characteristic_optional -> ref_memory_segment','characteristic_optional',1,'p_characteristic_optional','parser.py',1855),
-  ('characteristic_optional -> annotation','characteristic_optional',1,'p_characteristic_optional','parser.py',1856),
-  ('characteristic_optional -> comparison_quantity','characteristic_optional',1,'p_characteristic_optional','parser.py',1857),
-  ('characteristic_optional -> if_data_characteristic','characteristic_optional',1,'p_characteristic_optional','parser.py',1858),
-  ('characteristic_optional -> axis_descr','characteristic_optional',1,'p_characteristic_optional','parser.py',1859),
-  ('characteristic_optional -> calibration_access','characteristic_optional',1,'p_characteristic_optional','parser.py',1860),
-  ('characteristic_optional -> matrix_dim','characteristic_optional',1,'p_characteristic_optional','parser.py',1861),
-  ('characteristic_optional -> ecu_address_extension','characteristic_optional',1,'p_characteristic_optional','parser.py',1862),
-  ('characteristic_optional_list -> characteristic_optional','characteristic_optional_list',1,'p_characteristic_optional_list','parser.py',1867),
-  ('characteristic_optional_list -> characteristic_optional characteristic_optional_list','characteristic_optional_list',2,'p_characteristic_optional_list','parser.py',1868),
-  ('characteristic_optional_list_optional -> empty','characteristic_optional_list_optional',1,'p_characteristic_optional_list_optional','parser.py',1876),
-  ('characteristic_optional_list_optional -> characteristic_optional_list','characteristic_optional_list_optional',1,'p_characteristic_optional_list_optional','parser.py',1877),
-  ('if_data_characteristic -> if_data_memory_layout','if_data_characteristic',1,'p_if_data_characteristic','parser.py',1882),
-  ('axis_pts -> begin AXIS_PTS IDENT STRING NUMERIC IDENT IDENT NUMERIC IDENT NUMERIC NUMERIC NUMERIC axis_pts_optional_list_optional end AXIS_PTS','axis_pts',15,'p_axis_pts','parser.py',1886),
-  ('axis_pts_optional -> display_identifier','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1891),
-  ('axis_pts_optional -> read_only','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1892),
-  ('axis_pts_optional -> format','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1893),
-  ('axis_pts_optional -> deposit','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1894),
-  ('axis_pts_optional -> byte_order','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1895),
-  ('axis_pts_optional -> function_list','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1896),
-  ('axis_pts_optional -> ref_memory_segment','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1897),
-  ('axis_pts_optional -> guard_rails','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1898),
-  ('axis_pts_optional -> extended_limits','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1899),
-  ('axis_pts_optional -> annotation','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1900),
-  ('axis_pts_optional -> if_data_axis_pts','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1901),
-  ('axis_pts_optional -> calibration_access','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1902),
-  ('axis_pts_optional -> ecu_address_extension','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1903),
-  ('axis_pts_optional_list -> axis_pts_optional','axis_pts_optional_list',1,'p_axis_pts_optional_list','parser.py',1908),
-  ('axis_pts_optional_list -> axis_pts_optional axis_pts_optional_list','axis_pts_optional_list',2,'p_axis_pts_optional_list','parser.py',1909),
-  ('axis_pts_optional_list_optional -> empty','axis_pts_optional_list_optional',1,'p_axis_pts_optional_list_optional','parser.py',1917),
-  ('axis_pts_optional_list_optional -> axis_pts_optional_list','axis_pts_optional_list_optional',1,'p_axis_pts_optional_list_optional','parser.py',1918),
-  ('if_data_axis_pts -> if_data_memory_layout','if_data_axis_pts',1,'p_if_data_axis_pts','parser.py',1923),
-  ('deposit -> DEPOSIT deposit_mode','deposit',2,'p_deposit','parser.py',1928),
-  ('deposit_mode -> ABSOLUTE','deposit_mode',1,'p_deposit_mode','parser.py',1933),
-  ('deposit_mode -> DIFFERENCE','deposit_mode',1,'p_deposit_mode','parser.py',1934),
-  ('measurement -> begin MEASUREMENT IDENT STRING datatype IDENT NUMERIC NUMERIC NUMERIC NUMERIC measurement_optional_list_optional end MEASUREMENT','measurement',13,'p_measurement','parser.py',1939),
-  ('measurement_optional -> display_identifier','measurement_optional',1,'p_measurement_optional','parser.py',1944),
-  ('measurement_optional -> read_write','measurement_optional',1,'p_measurement_optional','parser.py',1945),
-  ('measurement_optional -> format','measurement_optional',1,'p_measurement_optional','parser.py',1946),
-  ('measurement_optional -> array_size','measurement_optional',1,'p_measurement_optional','parser.py',1947),
-  ('measurement_optional -> bit_mask','measurement_optional',1,'p_measurement_optional','parser.py',1948),
-  ('measurement_optional -> bit_operation','measurement_optional',1,'p_measurement_optional','parser.py',1949),
-  ('measurement_optional -> byte_order','measurement_optional',1,'p_measurement_optional','parser.py',1950),
-  ('measurement_optional -> max_refresh','measurement_optional',1,'p_measurement_optional','parser.py',1951),
-  ('measurement_optional -> virtual','measurement_optional',1,'p_measurement_optional','parser.py',1952),
-  ('measurement_optional -> function_list','measurement_optional',1,'p_measurement_optional','parser.py',1953),
-  ('measurement_optional -> ecu_address','measurement_optional',1,'p_measurement_optional','parser.py',1954),
-  ('measurement_optional -> error_mask','measurement_optional',1,'p_measurement_optional','parser.py',1955),
-  ('measurement_optional -> ref_memory_segment','measurement_optional',1,'p_measurement_optional','parser.py',1956),
-  ('measurement_optional -> annotation','measurement_optional',1,'p_measurement_optional','parser.py',1957),
-  ('measurement_optional -> if_data_xcp','measurement_optional',1,'p_measurement_optional','parser.py',1958),
-  ('measurement_optional -> if_data_measurement','measurement_optional',1,'p_measurement_optional','parser.py',1959),
-  ('measurement_optional -> matrix_dim','measurement_optional',1,'p_measurement_optional','parser.py',1960),
-  ('measurement_optional -> ecu_address_extension','measurement_optional',1,'p_measurement_optional','parser.py',1961),
-  ('measurement_optional_list -> measurement_optional','measurement_optional_list',1,'p_measurement_optional_list','parser.py',1966),
-  ('measurement_optional_list -> measurement_optional measurement_optional_list','measurement_optional_list',2,'p_measurement_optional_list','parser.py',1967),
-  ('measurement_optional_list_optional -> empty','measurement_optional_list_optional',1,'p_measurement_optional_list_optional','parser.py',1975),
-  ('measurement_optional_list_optional -> measurement_optional_list','measurement_optional_list_optional',1,'p_measurement_optional_list_optional','parser.py',1976),
-  ('read_write -> READ_WRITE','read_write',1,'p_read_write','parser.py',1981),
-  ('if_data_measurement -> begin IF_DATA IDENT if_data_measurement_optional_parameter_list_optional end IF_DATA','if_data_measurement',6,'p_if_data_measurement','parser.py',1986),
-  ('if_data_measurement_optional_parameter -> kp_blob kp_data','if_data_measurement_optional_parameter',2,'p_if_data_measurement_optional_parameter','parser.py',1991),
-  ('if_data_measurement_optional_parameter -> dp_blob dp_data','if_data_measurement_optional_parameter',2,'p_if_data_measurement_optional_parameter','parser.py',1992),
-  ('if_data_measurement_optional_parameter -> pa_blob pa_data','if_data_measurement_optional_parameter',2,'p_if_data_measurement_optional_parameter','parser.py',1993),
-  ('if_data_measurement_optional_parameter -> if_data_measurement_unsupported_element','if_data_measurement_optional_parameter',1,'p_if_data_measurement_optional_parameter','parser.py',1994),
-  ('if_data_measurement_unsupported_element -> begin IDENT generic_parameter_list end IDENT','if_data_measurement_unsupported_element',5,'p_if_data_measurement_unsupported_element','parser.py',1999),
-  ('if_data_measurement_optional_parameter_list -> if_data_measurement_optional_parameter','if_data_measurement_optional_parameter_list',1,'p_if_data_measurement_optional_parameter_list','parser.py',2004),
-  ('if_data_measurement_optional_parameter_list -> if_data_measurement_optional_parameter if_data_measurement_optional_parameter_list','if_data_measurement_optional_parameter_list',2,'p_if_data_measurement_optional_parameter_list','parser.py',2005),
-  ('if_data_measurement_optional_parameter_list_optional -> empty','if_data_measurement_optional_parameter_list_optional',1,'p_if_data_measurement_optional_parameter_list_optional','parser.py',2014),
-  ('if_data_measurement_optional_parameter_list_optional -> if_data_measurement_optional_parameter_list','if_data_measurement_optional_parameter_list_optional',1,'p_if_data_measurement_optional_parameter_list_optional','parser.py',2015),
-  ('kp_blob -> KP_BLOB','kp_blob',1,'p_kp_blob','parser.py',2020),
-  ('pa_blob -> PA_BLOB','pa_blob',1,'p_pa_blob','parser.py',2025),
-  ('kp_data -> kp_data_parameter_optional_list','kp_data',1,'p_kp_data','parser.py',2030),
-  ('kp_data_parameter_optional -> NUMERIC','kp_data_parameter_optional',1,'p_kp_data_parameter_optional','parser.py',2035),
-  ('kp_data_parameter_optional -> STRING','kp_data_parameter_optional',1,'p_kp_data_parameter_optional','parser.py',2036),
-  ('kp_data_parameter_optional -> IDENT','kp_data_parameter_optional',1,'p_kp_data_parameter_optional','parser.py',2037),
-  ('kp_data_parameter_optional_list -> kp_data_parameter_optional','kp_data_parameter_optional_list',1,'p_kp_data_parameter_optional_list','parser.py',2042),
-  ('kp_data_parameter_optional_list -> kp_data_parameter_optional kp_data_parameter_optional_list','kp_data_parameter_optional_list',2,'p_kp_data_parameter_optional_list','parser.py',2043),
-  ('array_size -> ARRAY_SIZE NUMERIC','array_size',2,'p_array_size','parser.py',2052),
-  ('bit_operation -> begin BIT_OPERATION bit_operation_optional_list_optional end BIT_OPERATION','bit_operation',5,'p_bit_operation','parser.py',2057),
-  ('bit_operation_optional -> left_shift','bit_operation_optional',1,'p_bit_operation_optional','parser.py',2062),
-  ('bit_operation_optional -> right_shift','bit_operation_optional',1,'p_bit_operation_optional','parser.py',2063),
-  ('bit_operation_optional -> sign_extend','bit_operation_optional',1,'p_bit_operation_optional','parser.py',2064),
-  ('bit_operation_optional_list -> bit_operation_optional','bit_operation_optional_list',1,'p_bit_operation_optional_list','parser.py',2069),
-  ('bit_operation_optional_list -> bit_operation_optional bit_operation_optional_list','bit_operation_optional_list',2,'p_bit_operation_optional_list','parser.py',2070),
-  ('bit_operation_optional_list_optional -> empty','bit_operation_optional_list_optional',1,'p_bit_operation_optional_list_optional','parser.py',2078),
-  ('bit_operation_optional_list_optional -> bit_operation_optional_list','bit_operation_optional_list_optional',1,'p_bit_operation_optional_list_optional','parser.py',2079),
-  ('left_shift -> LEFT_SHIFT NUMERIC','left_shift',2,'p_left_shift','parser.py',2084),
-  ('right_shift -> RIGHT_SHIFT NUMERIC','right_shift',2,'p_right_shift','parser.py',2089),
-  ('sign_extend -> SIGN_EXTEND','sign_extend',1,'p_sign_extend','parser.py',2094),
-  ('compu_method -> begin COMPU_METHOD IDENT STRING compu_method_conversion_type STRING STRING compu_method_optional_list_optional end COMPU_METHOD','compu_method',10,'p_compu_method','parser.py',2099),
-  ('compu_method_optional -> formula','compu_method_optional',1,'p_compu_method_optional','parser.py',2104),
-  ('compu_method_optional -> coeffs','compu_method_optional',1,'p_compu_method_optional','parser.py',2105),
-  ('compu_method_optional -> coeffs_linear','compu_method_optional',1,'p_compu_method_optional','parser.py',2106),
-  ('compu_method_optional -> compu_tab_ref','compu_method_optional',1,'p_compu_method_optional','parser.py',2107),
-  ('compu_method_optional -> ref_unit','compu_method_optional',1,'p_compu_method_optional','parser.py',2108),
-  ('compu_method_optional_list -> compu_method_optional','compu_method_optional_list',1,'p_compu_method_optional_list','parser.py',2113),
-  ('compu_method_optional_list -> compu_method_optional compu_method_optional_list','compu_method_optional_list',2,'p_compu_method_optional_list','parser.py',2114),
-  ('compu_method_optional_list_optional -> empty','compu_method_optional_list_optional',1,'p_compu_method_optional_list_optional','parser.py',2122),
-  ('compu_method_optional_list_optional -> compu_method_optional_list','compu_method_optional_list_optional',1,'p_compu_method_optional_list_optional','parser.py',2123),
-  ('compu_method_conversion_type -> TAB_INTP','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',2128),
-  ('compu_method_conversion_type -> TAB_NOINTP','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',2129),
-  ('compu_method_conversion_type -> TAB_VERB','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',2130),
-  ('compu_method_conversion_type -> RAT_FUNC','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',2131),
-  ('compu_method_conversion_type -> FORM','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',2132),
-  ('compu_method_conversion_type -> IDENTICAL','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',2133),
-  ('compu_method_conversion_type -> LINEAR','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',2134),
-  ('formula -> begin FORMULA STRING formula_optional_list_optional end FORMULA','formula',6,'p_formula','parser.py',2139),
-  ('formula_optional -> formula_inv','formula_optional',1,'p_formula_optional','parser.py',2144),
-  ('formula_optional_list -> formula_optional','formula_optional_list',1,'p_formula_optional_list','parser.py',2149),
-  ('formula_optional_list -> formula_optional formula_optional_list','formula_optional_list',2,'p_formula_optional_list','parser.py',2150),
-  ('formula_optional_list_optional -> empty','formula_optional_list_optional',1,'p_formula_optional_list_optional','parser.py',2158),
-  ('formula_optional_list_optional -> formula_optional_list','formula_optional_list_optional',1,'p_formula_optional_list_optional','parser.py',2159),
-  ('formula_inv -> FORMULA_INV STRING','formula_inv',2,'p_formula_inv','parser.py',2164),
-  ('coeffs -> COEFFS NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC','coeffs',7,'p_coeffs','parser.py',2169),
-  ('coeffs_linear -> COEFFS_LINEAR NUMERIC NUMERIC','coeffs_linear',3,'p_coeffs_linear','parser.py',2174),
-  ('compu_tab_ref -> COMPU_TAB_REF IDENT','compu_tab_ref',2,'p_compu_tab_ref','parser.py',2179),
-  ('ref_unit -> REF_UNIT IDENT','ref_unit',2,'p_ref_unit','parser.py',2184),
-  ('virtual -> begin VIRTUAL ident_list end VIRTUAL','virtual',5,'p_virtual','parser.py',2189),
-  ('ecu_address -> ECU_ADDRESS NUMERIC','ecu_address',2,'p_ecu_address','parser.py',2194),
-  ('error_mask -> ERROR_MASK NUMERIC','error_mask',2,'p_error_mask','parser.py',2199),
-  ('compu_tab -> begin COMPU_TAB IDENT STRING compu_tab_conversion_type NUMERIC compu_tab_optional_list_optional end COMPU_TAB','compu_tab',9,'p_compu_tab','parser.py',2204),
-  ('compu_tab_optional -> in_val_out_val','compu_tab_optional',1,'p_compu_tab_optional','parser.py',2209),
-  ('compu_tab_optional -> default_value','compu_tab_optional',1,'p_compu_tab_optional','parser.py',2210),
-  ('compu_tab_optional -> default_value_numeric','compu_tab_optional',1,'p_compu_tab_optional','parser.py',2211),
-  ('compu_tab_optional_list -> compu_tab_optional','compu_tab_optional_list',1,'p_compu_tabl_optional_list','parser.py',2216),
-  ('compu_tab_optional_list -> compu_tab_optional compu_tab_optional_list','compu_tab_optional_list',2,'p_compu_tabl_optional_list','parser.py',2217),
-  ('compu_tab_optional_list_optional -> empty','compu_tab_optional_list_optional',1,'p_compu_tab_optional_list_optional','parser.py',2225),
-  ('compu_tab_optional_list_optional -> compu_tab_optional_list','compu_tab_optional_list_optional',1,'p_compu_tab_optional_list_optional','parser.py',2226),
-  ('in_val_out_val -> number_list','in_val_out_val',1,'p_in_val_out_val','parser.py',2231),
-  ('compu_tab_conversion_type -> TAB_INTP','compu_tab_conversion_type',1,'p_compu_tab_conversion_type','parser.py',2236),
-  ('compu_tab_conversion_type -> TAB_NOINTP','compu_tab_conversion_type',1,'p_compu_tab_conversion_type','parser.py',2237),
-  ('default_value -> DEFAULT_VALUE STRING','default_value',2,'p_default_value','parser.py',2242),
-  ('default_value_numeric -> DEFAULT_VALUE_NUMERIC NUMERIC','default_value_numeric',2,'p_default_value_numeric','parser.py',2247),
-  ('compu_vtab -> begin COMPU_VTAB IDENT STRING compu_vtab_conversion_type NUMERIC compu_vtab_optional_list_optional end COMPU_VTAB','compu_vtab',9,'p_compu_vtab','parser.py',2252),
-  ('compu_vtab_optional -> default_value','compu_vtab_optional',1,'p_compu_vtab_optional','parser.py',2257),
-  ('compu_vtab_optional -> compu_vtab_in_val_out_val','compu_vtab_optional',1,'p_compu_vtab_optional','parser.py',2258),
-  ('compu_vtab_optional_list -> compu_vtab_optional','compu_vtab_optional_list',1,'p_compu_vtab_optional_list','parser.py',2263),
-  ('compu_vtab_optional_list -> compu_vtab_optional compu_vtab_optional_list','compu_vtab_optional_list',2,'p_compu_vtab_optional_list','parser.py',2264),
-  ('compu_vtab_optional_list_optional -> empty','compu_vtab_optional_list_optional',1,'p_compu_vtab_optional_list_optional','parser.py',2272),
-  ('compu_vtab_optional_list_optional -> compu_vtab_optional_list','compu_vtab_optional_list_optional',1,'p_compu_vtab_optional_list_optional','parser.py',2273),
-  ('compu_vtab_in_val_out_val -> number_string_value_list','compu_vtab_in_val_out_val',1,'p_compu_vtab_in_val_out_val','parser.py',2278),
-  ('compu_vtab_conversion_type -> TAB_VERB','compu_vtab_conversion_type',1,'p_compu_vtab_conversion_type','parser.py',2283),
-  ('number_string_value_list -> number_string_value','number_string_value_list',1,'p_number_string_value_list','parser.py',2288),
-  ('number_string_value_list -> number_string_value number_string_value_list','number_string_value_list',2,'p_number_string_value_list','parser.py',2289),
-  ('number_string_value -> NUMERIC STRING','number_string_value',2,'p_number_string_value','parser.py',2297),
-  ('compu_vtab_range -> begin COMPU_VTAB_RANGE IDENT STRING NUMERIC compu_vtab_range_optional_list_optional end COMPU_VTAB_RANGE','compu_vtab_range',8,'p_compu_vtab_range','parser.py',2302),
-  ('compu_vtab_range_optional -> default_value','compu_vtab_range_optional',1,'p_compu_vtab_range_optional','parser.py',2307),
-  ('compu_vtab_range_optional -> compu_vtab_range_in_val_out_val','compu_vtab_range_optional',1,'p_compu_vtab_range_optional','parser.py',2308),
-  ('compu_vtab_range_optional_list -> compu_vtab_range_optional','compu_vtab_range_optional_list',1,'p_compu_vtab_range_optional_list','parser.py',2313),
-  ('compu_vtab_range_optional_list -> compu_vtab_range_optional compu_vtab_range_optional_list','compu_vtab_range_optional_list',2,'p_compu_vtab_range_optional_list','parser.py',2314),
-  ('compu_vtab_range_optional_list_optional -> empty','compu_vtab_range_optional_list_optional',1,'p_compu_vtab_range_optional_list_optional','parser.py',2322),
-  ('compu_vtab_range_optional_list_optional -> compu_vtab_range_optional_list','compu_vtab_range_optional_list_optional',1,'p_compu_vtab_range_optional_list_optional','parser.py',2323),
-  ('compu_vtab_range_in_val_out_val -> number_number_string_value_list','compu_vtab_range_in_val_out_val',1,'p_compu_vtab_range_in_val_out_val','parser.py',2328),
-  ('number_number_string_value_list -> number_number_string_value','number_number_string_value_list',1,'p_number_number_string_value_list','parser.py',2333),
-  ('number_number_string_value_list -> number_number_string_value number_number_string_value_list','number_number_string_value_list',2,'p_number_number_string_value_list','parser.py',2334),
-  ('number_number_string_value -> NUMERIC NUMERIC STRING','number_number_string_value',3,'p_number_number_string_value','parser.py',2342),
-  ('function -> begin FUNCTION IDENT STRING function_optional_list_optional end FUNCTION','function',7,'p_function','parser.py',2347),
-  ('function_optional -> annotation','function_optional',1,'p_function_optional','parser.py',2352),
-  ('function_optional -> def_characteristic','function_optional',1,'p_function_optional','parser.py',2353),
-  ('function_optional -> ref_characteristic','function_optional',1,'p_function_optional','parser.py',2354),
-  ('function_optional -> in_measurement','function_optional',1,'p_function_optional','parser.py',2355),
-  ('function_optional -> out_measurement','function_optional',1,'p_function_optional','parser.py',2356),
-  ('function_optional -> loc_measurement','function_optional',1,'p_function_optional','parser.py',2357),
-  ('function_optional -> sub_function','function_optional',1,'p_function_optional','parser.py',2358),
-  ('function_optional -> function_version','function_optional',1,'p_function_optional','parser.py',2359),
-  ('function_optional_list -> function_optional','function_optional_list',1,'p_function_optional_list','parser.py',2364),
-  ('function_optional_list -> function_optional function_optional_list','function_optional_list',2,'p_function_optional_list','parser.py',2365),
-  ('function_optional_list_optional -> empty','function_optional_list_optional',1,'p_function_optional_list_optional','parser.py',2373),
-  ('function_optional_list_optional -> function_optional_list','function_optional_list_optional',1,'p_function_optional_list_optional','parser.py',2374),
-  ('def_characteristic -> begin DEF_CHARACTERISTIC def_characteristic_optional_list_optional end DEF_CHARACTERISTIC','def_characteristic',5,'p_def_characteristic','parser.py',2379),
-  ('def_characteristic_optional -> identifier','def_characteristic_optional',1,'p_def_characteristic_optional','parser.py',2384),
-  ('def_characteristic_optional_list -> def_characteristic_optional','def_characteristic_optional_list',1,'p_def_characteristic_optional_list','parser.py',2389),
-  ('def_characteristic_optional_list -> def_characteristic_optional def_characteristic_optional_list','def_characteristic_optional_list',2,'p_def_characteristic_optional_list','parser.py',2390),
-  ('def_characteristic_optional_list_optional -> empty','def_characteristic_optional_list_optional',1,'p_def_characteristic_optional_list_optional','parser.py',2398),
-  ('def_characteristic_optional_list_optional -> def_characteristic_optional_list','def_characteristic_optional_list_optional',1,'p_def_characteristic_optional_list_optional','parser.py',2399),
-  ('identifier -> IDENT','identifier',1,'p_identifier','parser.py',2404),
-  ('ref_characteristic -> begin REF_CHARACTERISTIC ref_characteristic_optional_list_optional end REF_CHARACTERISTIC','ref_characteristic',5,'p_ref_characteristic','parser.py',2409),
-  ('ref_characteristic_optional -> identifier','ref_characteristic_optional',1,'p_ref_characteristic_optional','parser.py',2414),
-  ('ref_characteristic_optional_list -> ref_characteristic_optional','ref_characteristic_optional_list',1,'p_ref_characteristic_optional_list','parser.py',2419),
-  ('ref_characteristic_optional_list -> ref_characteristic_optional ref_characteristic_optional_list','ref_characteristic_optional_list',2,'p_ref_characteristic_optional_list','parser.py',2420),
-  ('ref_characteristic_optional_list_optional -> empty','ref_characteristic_optional_list_optional',1,'p_ref_characteristic_optional_list_optional','parser.py',2428),
-  ('ref_characteristic_optional_list_optional -> ref_characteristic_optional_list','ref_characteristic_optional_list_optional',1,'p_ref_characteristic_optional_list_optional','parser.py',2429),
-  ('in_measurement -> begin IN_MEASUREMENT in_measurement_optional_list_optional end IN_MEASUREMENT','in_measurement',5,'p_in_measurement','parser.py',2434),
-  ('in_measurement_optional -> identifier','in_measurement_optional',1,'p_in_measurement_optional','parser.py',2439),
-  ('in_measurement_optional_list -> in_measurement_optional','in_measurement_optional_list',1,'p_in_measurement_optional_list','parser.py',2444),
-  ('in_measurement_optional_list -> in_measurement_optional in_measurement_optional_list','in_measurement_optional_list',2,'p_in_measurement_optional_list','parser.py',2445),
-  ('in_measurement_optional_list_optional -> empty','in_measurement_optional_list_optional',1,'p_in_measurment_optional_list_optional','parser.py',2453),
-  ('in_measurement_optional_list_optional -> in_measurement_optional_list','in_measurement_optional_list_optional',1,'p_in_measurment_optional_list_optional','parser.py',2454),
-  ('out_measurement -> begin OUT_MEASUREMENT out_measurement_optional_list_optional end OUT_MEASUREMENT','out_measurement',5,'p_out_measurement','parser.py',2459),
-  ('out_measurement_optional -> identifier','out_measurement_optional',1,'p_out_measurement_optional','parser.py',2464),
-  ('out_measurement_optional_list -> out_measurement_optional','out_measurement_optional_list',1,'p_out_measurement_optional_list','parser.py',2469),
-  ('out_measurement_optional_list -> out_measurement_optional out_measurement_optional_list','out_measurement_optional_list',2,'p_out_measurement_optional_list','parser.py',2470),
-  ('out_measurement_optional_list_optional -> empty','out_measurement_optional_list_optional',1,'p_out_measurment_optional_list_optional','parser.py',2478),
-  ('out_measurement_optional_list_optional -> out_measurement_optional_list','out_measurement_optional_list_optional',1,'p_out_measurment_optional_list_optional','parser.py',2479),
-  ('loc_measurement -> begin LOC_MEASUREMENT loc_measurement_optional_list_optional end LOC_MEASUREMENT','loc_measurement',5,'p_loc_measurement','parser.py',2484),
-  ('loc_measurement_optional -> identifier','loc_measurement_optional',1,'p_loc_measurement_optional','parser.py',2489),
-  ('loc_measurement_optional_list -> loc_measurement_optional','loc_measurement_optional_list',1,'p_loc_measurement_optional_list','parser.py',2494),
-  ('loc_measurement_optional_list -> loc_measurement_optional loc_measurement_optional_list','loc_measurement_optional_list',2,'p_loc_measurement_optional_list','parser.py',2495),
-  ('loc_measurement_optional_list_optional -> empty','loc_measurement_optional_list_optional',1,'p_loc_measurment_optional_list_optional','parser.py',2503),
-  ('loc_measurement_optional_list_optional -> loc_measurement_optional_list','loc_measurement_optional_list_optional',1,'p_loc_measurment_optional_list_optional','parser.py',2504),
-  ('sub_function -> begin SUB_FUNCTION sub_function_optional_list_optional end SUB_FUNCTION','sub_function',5,'p_sub_function','parser.py',2509),
-  ('sub_function_optional -> identifier','sub_function_optional',1,'p_sub_function_optional','parser.py',2514),
-  ('sub_function_optional_list -> sub_function_optional','sub_function_optional_list',1,'p_sub_function_optional_list','parser.py',2519),
-  ('sub_function_optional_list -> sub_function_optional sub_function_optional_list','sub_function_optional_list',2,'p_sub_function_optional_list','parser.py',2520),
-  ('sub_function_optional_list_optional -> empty','sub_function_optional_list_optional',1,'p_sub_function_optional_list_optional','parser.py',2528),
-  ('sub_function_optional_list_optional -> sub_function_optional_list','sub_function_optional_list_optional',1,'p_sub_function_optional_list_optional','parser.py',2529),
-  ('function_version -> FUNCTION_VERSION STRING','function_version',2,'p_function_version','parser.py',2534),
-  ('group -> begin GROUP IDENT STRING group_optional_list_optional end GROUP','group',7,'p_group','parser.py',2539),
-  ('group_optional -> annotation','group_optional',1,'p_group_optional','parser.py',2544),
-  ('group_optional -> root','group_optional',1,'p_group_optional','parser.py',2545),
-  ('group_optional -> ref_characteristic','group_optional',1,'p_group_optional','parser.py',2546),
-  ('group_optional -> ref_measurement','group_optional',1,'p_group_optional','parser.py',2547),
-  ('group_optional -> function_list','group_optional',1,'p_group_optional','parser.py',2548),
-  ('group_optional -> sub_group','group_optional',1,'p_group_optional','parser.py',2549),
-  ('group_optional_list -> group_optional','group_optional_list',1,'p_group_optional_list','parser.py',2554),
-  ('group_optional_list -> group_optional group_optional_list','group_optional_list',2,'p_group_optional_list','parser.py',2555),
-  ('group_optional_list_optional -> empty','group_optional_list_optional',1,'p_group_optional_list_optional','parser.py',2563),
-  ('group_optional_list_optional -> group_optional_list','group_optional_list_optional',1,'p_group_optional_list_optional','parser.py',2564),
-  ('root -> ROOT','root',1,'p_root','parser.py',2569),
-  ('ref_measurement -> begin REF_MEASUREMENT ref_measurement_optional_list_optional end REF_MEASUREMENT','ref_measurement',5,'p_ref_measurement','parser.py',2574),
-  ('ref_measurement_optional -> identifier','ref_measurement_optional',1,'p_ref_measurement_optional','parser.py',2579),
-  ('ref_measurement_optional_list -> ref_measurement_optional','ref_measurement_optional_list',1,'p_ref_measurement_optional_list','parser.py',2584),
-  ('ref_measurement_optional_list -> ref_measurement_optional ref_measurement_optional_list','ref_measurement_optional_list',2,'p_ref_measurement_optional_list','parser.py',2585),
-  ('ref_measurement_optional_list_optional -> empty','ref_measurement_optional_list_optional',1,'p_ref_measurement_optional_list_optional','parser.py',2593),
-  ('ref_measurement_optional_list_optional -> ref_measurement_optional_list','ref_measurement_optional_list_optional',1,'p_ref_measurement_optional_list_optional','parser.py',2594),
-  ('sub_group -> begin SUB_GROUP sub_group_optional_list_optional end SUB_GROUP','sub_group',5,'p_sub_group','parser.py',2599),
-  ('sub_group_optional -> identifier','sub_group_optional',1,'p_sub_group_optional','parser.py',2604),
-  ('sub_group_optional_list -> sub_group_optional','sub_group_optional_list',1,'p_sub_group_optional_list','parser.py',2609),
-  ('sub_group_optional_list -> sub_group_optional sub_group_optional_list','sub_group_optional_list',2,'p_sub_group_optional_list','parser.py',2610),
-  ('sub_group_optional_list_optional -> empty','sub_group_optional_list_optional',1,'p_sub_group_optional_list_optional','parser.py',2618),
-  ('sub_group_optional_list_optional -> sub_group_optional_list','sub_group_optional_list_optional',1,'p_sub_group_optional_list_optional','parser.py',2619),
-  ('record_layout -> begin RECORD_LAYOUT IDENT record_layout_optional_list_optional end RECORD_LAYOUT','record_layout',6,'p_record_layout','parser.py',2624),
-  ('record_layout_optional -> fnc_values','record_layout_optional',1,'p_record_layout_optional','parser.py',2629),
-  ('record_layout_optional -> identification','record_layout_optional',1,'p_record_layout_optional','parser.py',2630),
-  ('record_layout_optional -> axis_pts_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2631),
-  ('record_layout_optional -> axis_pts_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2632),
-  ('record_layout_optional -> axis_pts_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2633),
-  ('record_layout_optional -> axis_rescale_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2634),
-  ('record_layout_optional -> axis_rescale_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2635),
-  ('record_layout_optional -> axis_rescale_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2636),
-  ('record_layout_optional -> no_axis_pts_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2637),
-  ('record_layout_optional -> no_axis_pts_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2638),
-  ('record_layout_optional -> no_axis_pts_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2639),
-  ('record_layout_optional -> no_rescale_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2640),
-  ('record_layout_optional -> no_rescale_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2641),
-  ('record_layout_optional -> no_rescale_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2642),
-  ('record_layout_optional -> fix_no_axis_pts_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2643),
-  ('record_layout_optional -> fix_no_axis_pts_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2644),
-  ('record_layout_optional -> fix_no_axis_pts_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2645),
-  ('record_layout_optional -> src_addr_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2646),
-  ('record_layout_optional -> src_addr_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2647),
-  ('record_layout_optional -> src_addr_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2648),
-  ('record_layout_optional -> rip_addr_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2649),
-  ('record_layout_optional -> rip_addr_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2650),
-  ('record_layout_optional -> rip_addr_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2651),
-  ('record_layout_optional -> rip_addr_w','record_layout_optional',1,'p_record_layout_optional','parser.py',2652),
-  ('record_layout_optional -> shift_op_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2653),
-  ('record_layout_optional -> shift_op_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2654),
-  ('record_layout_optional -> shift_op_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2655),
-  ('record_layout_optional -> offset_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2656),
-  ('record_layout_optional -> offset_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2657),
-  ('record_layout_optional -> offset_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2658),
-  ('record_layout_optional -> dist_op_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2659),
-  ('record_layout_optional -> dist_op_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2660),
-  ('record_layout_optional -> dist_op_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2661),
-  ('record_layout_optional -> alignment_byte','record_layout_optional',1,'p_record_layout_optional','parser.py',2662),
-  ('record_layout_optional -> alignment_word','record_layout_optional',1,'p_record_layout_optional','parser.py',2663),
-  ('record_layout_optional -> alignment_long','record_layout_optional',1,'p_record_layout_optional','parser.py',2664),
-  ('record_layout_optional -> alignment_float32_ieee','record_layout_optional',1,'p_record_layout_optional','parser.py',2665),
-  ('record_layout_optional -> alignment_float64_ieee','record_layout_optional',1,'p_record_layout_optional','parser.py',2666),
-  ('record_layout_optional -> reserved','record_layout_optional',1,'p_record_layout_optional','parser.py',2667),
-  ('record_layout_optional_list -> record_layout_optional','record_layout_optional_list',1,'p_record_layout_optional_list','parser.py',2672),
-  ('record_layout_optional_list -> record_layout_optional record_layout_optional_list','record_layout_optional_list',2,'p_record_layout_optional_list','parser.py',2673),
-  ('record_layout_optional_list_optional -> empty','record_layout_optional_list_optional',1,'p_record_layout_optional_list_optional','parser.py',2681),
-  ('record_layout_optional_list_optional -> record_layout_optional_list','record_layout_optional_list_optional',1,'p_record_layout_optional_list_optional','parser.py',2682),
-  ('fnc_values -> FNC_VALUES NUMERIC datatype fnc_values_index_mode addrtype','fnc_values',5,'p_fnc_values','parser.py',2687),
-  ('fnc_values_index_mode -> COLUMN_DIR','fnc_values_index_mode',1,'p_fnc_values_index_mode','parser.py',2692),
-  ('fnc_values_index_mode -> ROW_DIR','fnc_values_index_mode',1,'p_fnc_values_index_mode','parser.py',2693),
-  ('fnc_values_index_mode -> ALTERNATE_WITH_X','fnc_values_index_mode',1,'p_fnc_values_index_mode','parser.py',2694),
-  ('fnc_values_index_mode -> ALTERNATE_WITH_Y','fnc_values_index_mode',1,'p_fnc_values_index_mode','parser.py',2695),
-  ('fnc_values_index_mode -> ALTERNATE_CURVES','fnc_values_index_mode',1,'p_fnc_values_index_mode','parser.py',2696),
-  ('identification -> IDENTIFICATION NUMERIC datatype','identification',3,'p_identification','parser.py',2701),
-  ('axis_pts_x -> AXIS_PTS_X NUMERIC datatype indexorder addrtype','axis_pts_x',5,'p_axis_pts_x','parser.py',2706),
-  ('axis_pts_y -> AXIS_PTS_Y NUMERIC datatype indexorder addrtype','axis_pts_y',5,'p_axis_pts_y','parser.py',2711),
-  ('axis_pts_z -> AXIS_PTS_Z NUMERIC datatype indexorder addrtype','axis_pts_z',5,'p_axis_pts_z','parser.py',2716),
-  ('axis_rescale_x -> AXIS_RESCALE_X NUMERIC datatype NUMERIC indexorder addrtype','axis_rescale_x',6,'p_axis_rescale_x','parser.py',2721),
-  ('axis_rescale_y -> AXIS_RESCALE_Y NUMERIC datatype NUMERIC indexorder addrtype','axis_rescale_y',6,'p_axis_rescale_y','parser.py',2726),
-  ('axis_rescale_z -> AXIS_RESCALE_Z NUMERIC datatype NUMERIC indexorder addrtype','axis_rescale_z',6,'p_axis_rescale_z','parser.py',2731),
-  ('no_axis_pts_x -> NO_AXIS_PTS_X NUMERIC datatype','no_axis_pts_x',3,'p_no_axis_pts_x','parser.py',2736),
-  ('no_axis_pts_y -> NO_AXIS_PTS_Y NUMERIC datatype','no_axis_pts_y',3,'p_no_axis_pts_y','parser.py',2741),
-  ('no_axis_pts_z -> NO_AXIS_PTS_Z NUMERIC datatype','no_axis_pts_z',3,'p_no_axis_pts_z','parser.py',2746),
-  ('no_rescale_x -> NO_RESCALE_X NUMERIC datatype','no_rescale_x',3,'p_no_rescale_x','parser.py',2751),
-  ('no_rescale_y -> NO_RESCALE_Y NUMERIC datatype','no_rescale_y',3,'p_no_rescale_y','parser.py',2756),
-  ('no_rescale_z -> NO_RESCALE_Z NUMERIC datatype','no_rescale_z',3,'p_no_rescale_z','parser.py',2761),
-  ('fix_no_axis_pts_x -> FIX_NO_AXIS_PTS_X NUMERIC','fix_no_axis_pts_x',2,'p_fix_no_axis_pts_x','parser.py',2766),
-  ('fix_no_axis_pts_y -> FIX_NO_AXIS_PTS_Y NUMERIC','fix_no_axis_pts_y',2,'p_fix_no_axis_pts_y','parser.py',2771),
-  ('fix_no_axis_pts_z -> FIX_NO_AXIS_PTS_Z NUMERIC','fix_no_axis_pts_z',2,'p_fix_no_axis_pts_z','parser.py',2776),
-  ('src_addr_x -> SRC_ADDR_X NUMERIC datatype','src_addr_x',3,'p_src_addr_x','parser.py',2781),
-  ('src_addr_y -> SRC_ADDR_Y NUMERIC datatype','src_addr_y',3,'p_src_addr_y','parser.py',2786),
-  ('src_addr_z -> SRC_ADDR_Z NUMERIC datatype','src_addr_z',3,'p_src_addr_z','parser.py',2791),
-  ('rip_addr_x -> RIP_ADDR_X NUMERIC datatype','rip_addr_x',3,'p_rip_addr_x','parser.py',2796),
-  ('rip_addr_y -> RIP_ADDR_Y NUMERIC datatype','rip_addr_y',3,'p_rip_addr_y','parser.py',2801),
-  ('rip_addr_z -> RIP_ADDR_Z NUMERIC datatype','rip_addr_z',3,'p_rip_addr_z','parser.py',2806),
-  ('rip_addr_w -> RIP_ADDR_W NUMERIC datatype','rip_addr_w',3,'p_rip_addr_w','parser.py',2811),
-  ('shift_op_x -> SHIFT_OP_X NUMERIC datatype','shift_op_x',3,'p_shift_op_x','parser.py',2816),
-  ('shift_op_y -> SHIFT_OP_Y NUMERIC datatype','shift_op_y',3,'p_shift_op_y','parser.py',2821),
-  ('shift_op_z -> SHIFT_OP_Z NUMERIC datatype','shift_op_z',3,'p_shift_op_z','parser.py',2826),
-  ('offset_x -> OFFSET_X NUMERIC datatype','offset_x',3,'p_offset_x','parser.py',2831),
-  ('offset_y -> OFFSET_Y NUMERIC datatype','offset_y',3,'p_offset_y','parser.py',2836),
-  ('offset_z -> OFFSET_Z NUMERIC datatype','offset_z',3,'p_offset_z','parser.py',2841),
-  ('dist_op_x -> DIST_OP_X NUMERIC datatype','dist_op_x',3,'p_dist_op_x','parser.py',2846),
-  ('dist_op_y -> DIST_OP_Y NUMERIC datatype','dist_op_y',3,'p_dist_op_y','parser.py',2851),
-  ('dist_op_z -> DIST_OP_Z NUMERIC datatype','dist_op_z',3,'p_dist_op_z','parser.py',2856),
-  ('alignment_byte -> ALIGNMENT_BYTE NUMERIC','alignment_byte',2,'p_alignment_byte','parser.py',2861),
-  ('alignment_word -> ALIGNMENT_WORD NUMERIC','alignment_word',2,'p_alignment_word','parser.py',2866),
-  ('alignment_long -> ALIGNMENT_LONG NUMERIC','alignment_long',2,'p_alignment_long','parser.py',2871),
-  ('alignment_float32_ieee -> ALIGNMENT_FLOAT32_IEEE NUMERIC','alignment_float32_ieee',2,'p_alignment_float32_ieee','parser.py',2876),
-  ('alignment_float64_ieee -> ALIGNMENT_FLOAT64_IEEE NUMERIC','alignment_float64_ieee',2,'p_alignment_float64_ieee','parser.py',2881),
-  ('variant_coding -> begin VARIANT_CODING variant_coding_optional_list_optional end VARIANT_CODING','variant_coding',5,'p_variant_coding','parser.py',2886),
-  ('variant_coding_optional -> var_separator','variant_coding_optional',1,'p_variant_coding_optional','parser.py',2891),
-  ('variant_coding_optional -> var_naming','variant_coding_optional',1,'p_variant_coding_optional','parser.py',2892),
-  ('variant_coding_optional -> var_criterion','variant_coding_optional',1,'p_variant_coding_optional','parser.py',2893),
-  ('variant_coding_optional -> var_forbidden_comb','variant_coding_optional',1,'p_variant_coding_optional','parser.py',2894),
-  ('variant_coding_optional -> var_characteristic','variant_coding_optional',1,'p_variant_coding_optional','parser.py',2895),
-  ('variant_coding_optional_list -> variant_coding_optional','variant_coding_optional_list',1,'p_variant_coding_optional_list','parser.py',2900),
-  ('variant_coding_optional_list -> variant_coding_optional variant_coding_optional_list','variant_coding_optional_list',2,'p_variant_coding_optional_list','parser.py',2901),
-  ('variant_coding_optional_list_optional -> empty','variant_coding_optional_list_optional',1,'p_variant_coding_optional_list_optional','parser.py',2909),
-  ('variant_coding_optional_list_optional -> variant_coding_optional_list','variant_coding_optional_list_optional',1,'p_variant_coding_optional_list_optional','parser.py',2910),
-  ('var_separator -> VAR_SEPARATOR STRING','var_separator',2,'p_var_separator','parser.py',2915),
-  ('var_naming -> VAR_NAMING IDENT','var_naming',2,'p_var_naming','parser.py',2920),
-  ('var_criterion -> begin VAR_CRITERION IDENT STRING ident_list var_criterion_optional_list_optional end VAR_CRITERION','var_criterion',8,'p_var_criterion','parser.py',2925),
-  ('var_characteristic -> begin VAR_CHARACTERISTIC IDENT ident_list var_characteristic_optional_optional end VAR_CHARACTERISTIC','var_characteristic',7,'p_var_characteristic','parser.py',2930),
-  ('var_characteristic_optional -> var_address','var_characteristic_optional',1,'p_var_characteristic_optional','parser.py',2935),
-  ('var_characteristic_optional_optional -> empty','var_characteristic_optional_optional',1,'p_var_characteristic_optional_optional','parser.py',2940),
-  ('var_characteristic_optional_optional -> var_characteristic_optional','var_characteristic_optional_optional',1,'p_var_characteristic_optional_optional','parser.py',2941),
-  ('var_address -> begin VAR_ADDRESS number_list end VAR_ADDRESS','var_address',5,'p_var_address','parser.py',2946),
-  ('var_forbidden_comb -> begin VAR_FORBIDDEN_COMB var_forbidden_comb_criterion_list end VAR_FORBIDDEN_COMB','var_forbidden_comb',5,'p_var_forbidden_comb','parser.py',2951),
-  ('var_forbidden_comb_criterion_list -> var_forbidden_comb_criterion_optional','var_forbidden_comb_criterion_list',1,'p_var_forbidden_comb_criterion_list','parser.py',2956),
-  ('var_forbidden_comb_criterion_list -> var_forbidden_comb_criterion_optional var_forbidden_comb_criterion_optional_list','var_forbidden_comb_criterion_list',2,'p_var_forbidden_comb_criterion_list','parser.py',2957),
-  ('var_forbidden_comb_criterion_optional -> IDENT IDENT','var_forbidden_comb_criterion_optional',2,'p_var_forbidden_comb_criterion_optional','parser.py',2965),
-  ('var_forbidden_comb_criterion_optional_list -> var_forbidden_comb_criterion_optional','var_forbidden_comb_criterion_optional_list',1,'p_var_forbidden_comb_criterion_optional_list','parser.py',2970),
-  ('var_forbidden_comb_criterion_optional_list -> var_forbidden_comb_criterion_optional var_forbidden_comb_criterion_optional_list','var_forbidden_comb_criterion_optional_list',2,'p_var_forbidden_comb_criterion_optional_list','parser.py',2971),
-  ('var_criterion_optional -> var_measurement','var_criterion_optional',1,'p_var_criterion_optional','parser.py',2979),
-  ('var_criterion_optional -> var_selection_characteristic','var_criterion_optional',1,'p_var_criterion_optional','parser.py',2980),
-  ('var_criterion_optional_list -> var_criterion_optional','var_criterion_optional_list',1,'p_var_criterion_optional_list','parser.py',2985),
-  ('var_criterion_optional_list -> var_criterion_optional var_criterion_optional_list','var_criterion_optional_list',2,'p_var_criterion_optional_list','parser.py',2986),
-  ('var_criterion_optional_list_optional -> empty','var_criterion_optional_list_optional',1,'p_var_criterion_optional_list_optional','parser.py',2994),
-  ('var_criterion_optional_list_optional -> var_criterion_optional_list','var_criterion_optional_list_optional',1,'p_var_criterion_optional_list_optional','parser.py',2995),
-  ('var_measurement -> VAR_MEASUREMENT IDENT','var_measurement',2,'p_var_measurement','parser.py',3000),
-  ('var_selection_characteristic -> VAR_SELECTION_CHARACTERISTIC IDENT','var_selection_characteristic',2,'p_var_selection_characteristic','parser.py',3005),
-  ('reserved -> RESERVED NUMERIC datasize','reserved',3,'p_reserved','parser.py',3010),
-  ('frame -> begin FRAME IDENT STRING NUMERIC NUMERIC frame_optional_list_optional end FRAME','frame',9,'p_frame','parser.py',3015),
-  ('frame_optional -> frame_measurement','frame_optional',1,'p_frame_optional','parser.py',3020),
-  ('frame_optional -> if_data_frame','frame_optional',1,'p_frame_optional','parser.py',3021),
-  ('frame_optional_list -> frame_optional','frame_optional_list',1,'p_frame_optional_list','parser.py',3026),
-  ('frame_optional_list -> frame_optional frame_optional_list','frame_optional_list',2,'p_frame_optional_list','parser.py',3027),
-  ('frame_optional_list_optional -> empty','frame_optional_list_optional',1,'p_frame_optional_list_optional','parser.py',3035),
-  ('frame_optional_list_optional -> frame_optional_list','frame_optional_list_optional',1,'p_frame_optional_list_optional','parser.py',3036),
-  ('if_data_frame -> begin IF_DATA IDENT if_data_frame_optional_list_optional end IF_DATA','if_data_frame',6,'p_if_data_frame','parser.py',3041),
-  ('if_data_frame_optional -> QP_BLOB qp_data','if_data_frame_optional',2,'p_if_data_frame_optional','parser.py',3046),
-  ('if_data_frame_optional_list -> if_data_frame_optional','if_data_frame_optional_list',1,'p_if_data_frame_parameter_optional_list','parser.py',3051),
-  ('if_data_frame_optional_list -> if_data_frame_optional if_data_frame_optional_list','if_data_frame_optional_list',2,'p_if_data_frame_parameter_optional_list','parser.py',3052),
-  ('if_data_frame_optional_list_optional -> empty','if_data_frame_optional_list_optional',1,'p_if_data_frame_optional_list_optional','parser.py',3061),
-  ('if_data_frame_optional_list_optional -> if_data_frame_optional_list','if_data_frame_optional_list_optional',1,'p_if_data_frame_optional_list_optional','parser.py',3062),
-  ('qp_data -> generic_parameter','qp_data',1,'p_qp_data','parser.py',3067),
-  ('frame_measurement -> FRAME_MEASUREMENT ident_list','frame_measurement',2,'p_frame_measurement','parser.py',3072),
-  ('user_rights -> begin USER_RIGHTS IDENT user_rights_optional_list_optional end USER_RIGHTS','user_rights',6,'p_user_rights','parser.py',3077),
-  ('user_rights_optional -> ref_group','user_rights_optional',1,'p_user_rights_optional','parser.py',3082),
-  ('user_rights_optional -> read_only','user_rights_optional',1,'p_user_rights_optional','parser.py',3083),
-  ('user_rights_optional_list -> user_rights_optional','user_rights_optional_list',1,'p_user_rights_optional_list','parser.py',3088),
-  ('user_rights_optional_list -> user_rights_optional user_rights_optional_list','user_rights_optional_list',2,'p_user_rights_optional_list','parser.py',3089),
-  ('user_rights_optional_list_optional -> empty','user_rights_optional_list_optional',1,'p_user_rights_optional_list_optional','parser.py',3097),
-  ('user_rights_optional_list_optional -> user_rights_optional_list','user_rights_optional_list_optional',1,'p_user_rights_optional_list_optional','parser.py',3098),
-  ('ref_group -> begin REF_GROUP ref_group_optional_list_optional end REF_GROUP','ref_group',5,'p_ref_group','parser.py',3103),
-  ('ref_group_optional -> identifier','ref_group_optional',1,'p_ref_group_optional','parser.py',3108),
-  ('ref_group_optional_list -> ref_group_optional','ref_group_optional_list',1,'p_ref_group_optional_list','parser.py',3113),
-  ('ref_group_optional_list -> ref_group_optional ref_group_optional_list','ref_group_optional_list',2,'p_ref_group_optional_list','parser.py',3114),
-  ('ref_group_optional_list_optional -> empty','ref_group_optional_list_optional',1,'p_ref_group_optional_list_optional','parser.py',3122),
-  ('ref_group_optional_list_optional -> ref_group_optional_list','ref_group_optional_list_optional',1,'p_ref_group_optional_list_optional','parser.py',3123),
-  ('read_only -> READ_ONLY','read_only',1,'p_read_only','parser.py',3128),
-  ('guard_rails -> GUARD_RAILS','guard_rails',1,'p_guard_rails','parser.py',3133),
-  ('unit -> begin UNIT IDENT STRING STRING unit_type unit_optional_list_optional end UNIT','unit',9,'p_unit','parser.py',3138),
-  ('unit_optional -> si_exponents','unit_optional',1,'p_unit_optional','parser.py',3143),
-  ('unit_optional -> ref_unit','unit_optional',1,'p_unit_optional','parser.py',3144),
-  ('unit_optional -> unit_conversion','unit_optional',1,'p_unit_optional','parser.py',3145),
-  ('unit_optional_list -> unit_optional','unit_optional_list',1,'p_unit_optional_list','parser.py',3150),
-  ('unit_optional_list -> unit_optional unit_optional_list','unit_optional_list',2,'p_unit_optional_list','parser.py',3151),
-  ('unit_optional_list_optional -> empty','unit_optional_list_optional',1,'p_unit_optional_list_optional','parser.py',3159),
-  ('unit_optional_list_optional -> unit_optional_list','unit_optional_list_optional',1,'p_unit_optional_list_optional','parser.py',3160),
-  ('unit_type -> EXTENDED_SI','unit_type',1,'p_unit_type','parser.py',3165),
-  ('unit_type -> DERIVED','unit_type',1,'p_unit_type','parser.py',3166),
-  ('si_exponents -> SI_EXPONENTS NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC','si_exponents',8,'p_si_exponents','parser.py',3171),
-  ('unit_conversion -> UNIT_CONVERSION NUMERIC NUMERIC','unit_conversion',3,'p_unit_conversion','parser.py',3176),
-  ('empty -> <empty>','empty',0,'p_empty','parser.py',3181),
+  ('a2l -> a2l_optional_list_optional','a2l',1,'p_a2l','parser.py',77),
+  ('a2l_optional -> asap2_version','a2l_optional',1,'p_a2l_optional','parser.py',82),
+  ('a2l_optional -> a2ml_version','a2l_optional',1,'p_a2l_optional','parser.py',83),
+  ('a2l_optional -> project','a2l_optional',1,'p_a2l_optional','parser.py',84),
+  ('a2l_optional_list -> a2l_optional','a2l_optional_list',1,'p_a2l_optional_list','parser.py',89),
+  ('a2l_optional_list -> a2l_optional_list a2l_optional','a2l_optional_list',2,'p_a2l_optional_list','parser.py',90),
+  ('a2l_optional_list_optional -> empty','a2l_optional_list_optional',1,'p_a2l_optional_list_optional','parser.py',99),
+  ('a2l_optional_list_optional -> a2l_optional_list','a2l_optional_list_optional',1,'p_a2l_optional_list_optional','parser.py',100),
+  ('a2ml_declaration -> a2ml_type_definition SEMICOLON','a2ml_declaration',2,'p_a2ml_declaration','parser.py',105),
+  ('a2ml_declaration -> a2ml_block_definition SEMICOLON','a2ml_declaration',2,'p_a2ml_declaration','parser.py',106),
+  ('a2ml_declaration_list -> a2ml_declaration','a2ml_declaration_list',1,'p_a2ml_declaration_list','parser.py',111),
+  ('a2ml_declaration_list -> a2ml_declaration_list a2ml_declaration','a2ml_declaration_list',2,'p_a2ml_declaration_list','parser.py',112),
+  ('a2ml_type_definition -> a2ml_type_name','a2ml_type_definition',1,'p_a2ml_type_definition','parser.py',121),
+  ('a2ml_type_name -> a2ml_predefined_type_name','a2ml_type_name',1,'p_a2ml_type_name','parser.py',126),
+  ('a2ml_type_name -> a2ml_struct_type_name','a2ml_type_name',1,'p_a2ml_type_name','parser.py',127),
+  ('a2ml_type_name -> a2ml_enum_type_name','a2ml_type_name',1,'p_a2ml_type_name','parser.py',128),
+  ('a2ml_type_name -> a2ml_taggedstruct_type_name','a2ml_type_name',1,'p_a2ml_type_name','parser.py',129),
+  ('a2ml_type_name -> a2ml_taggedunion_type_name','a2ml_type_name',1,'p_a2ml_type_name','parser.py',130),
+  ('a2ml_predefined_type_name -> char','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',135),
+  ('a2ml_predefined_type_name -> int','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',136),
+  ('a2ml_predefined_type_name -> long','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',137),
+  ('a2ml_predefined_type_name -> uchar','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',138),
+  ('a2ml_predefined_type_name -> uint','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',139),
+  ('a2ml_predefined_type_name -> ulong','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',140),
+  ('a2ml_predefined_type_name -> double','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',141),
+  ('a2ml_predefined_type_name -> float','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',142),
+  ('a2ml_block_definition -> block a2ml_tag a2ml_type_name','a2ml_block_definition',3,'p_a2ml_block_definition','parser.py',147),
+  ('a2ml_enum_type_name -> enum a2ml_identifier_optional CURLY_OPEN a2ml_enumerator_list CURLY_CLOSE','a2ml_enum_type_name',5,'p_a2ml_enum_type_name','parser.py',151),
+  ('a2ml_enum_type_name -> enum a2ml_identifier','a2ml_enum_type_name',2,'p_a2ml_enum_type_name','parser.py',152),
+  ('a2ml_enumerator_list -> a2ml_enumerator','a2ml_enumerator_list',1,'p_a2ml_enumerator_list','parser.py',160),
+  ('a2ml_enumerator_list -> a2ml_enumerator_list COMMA a2ml_enumerator','a2ml_enumerator_list',3,'p_a2ml_enumerator_list','parser.py',161),
+  ('a2ml_enumerator -> a2ml_keyword EQUAL a2ml_constant','a2ml_enumerator',3,'p_a2ml_enumerator','parser.py',170),
+  ('a2ml_enumerator -> a2ml_keyword','a2ml_enumerator',1,'p_a2ml_enumerator','parser.py',171),
+  ('a2ml_struct_type_name -> struct a2ml_identifier_optional CURLY_OPEN a2ml_struct_member_list_optional CURLY_CLOSE','a2ml_struct_type_name',5,'p_a2ml_struct_type_name','parser.py',176),
+  ('a2ml_struct_type_name -> struct a2ml_identifier','a2ml_struct_type_name',2,'p_a2ml_struct_type_name','parser.py',177),
+  ('a2ml_struct_member_list_optional -> empty','a2ml_struct_member_list_optional',1,'p_a2ml_struct_member_list_optional','parser.py',182),
+  ('a2ml_struct_member_list_optional -> a2ml_struct_member_list','a2ml_struct_member_list_optional',1,'p_a2ml_struct_member_list_optional','parser.py',183),
+  ('a2ml_struct_member_list -> a2ml_struct_member','a2ml_struct_member_list',1,'p_a2ml_struct_member_list','parser.py',188),
+  ('a2ml_struct_member_list -> a2ml_struct_member_list a2ml_struct_member','a2ml_struct_member_list',2,'p_a2ml_struct_member_list','parser.py',189),
+  ('a2ml_struct_member -> a2ml_member SEMICOLON','a2ml_struct_member',2,'p_a2ml_struct_member','parser.py',198),
+  ('a2ml_member -> a2ml_type_name a2ml_array_specifier_optional','a2ml_member',2,'p_a2ml_member','parser.py',203),
+  ('a2ml_member_optional -> empty','a2ml_member_optional',1,'p_a2ml_member_optional','parser.py',208),
+  ('a2ml_member_optional -> a2ml_member','a2ml_member_optional',1,'p_a2ml_member_optional','parser.py',209),
+  ('a2ml_array_specifier_optional -> empty','a2ml_array_specifier_optional',1,'p_a2ml_array_specifier_optional','parser.py',214),
+  ('a2ml_array_specifier_optional -> a2ml_array_specifier','a2ml_array_specifier_optional',1,'p_a2ml_array_specifier_optional','parser.py',215),
+  ('a2ml_array_specifier -> BRACE_OPEN a2ml_constant BRACE_CLOSE','a2ml_array_specifier',3,'p_a2ml_array_specifier','parser.py',220),
+  ('a2ml_array_specifier -> BRACE_OPEN a2ml_constant BRACE_CLOSE a2ml_array_specifier','a2ml_array_specifier',4,'p_a2ml_array_specifier','parser.py',221),
+  ('a2ml_taggedstruct_type_name -> taggedstruct a2ml_identifier_optional CURLY_OPEN a2ml_taggedstruct_member_list_optional CURLY_CLOSE','a2ml_taggedstruct_type_name',5,'p_a2ml_taggedstruct_type_name','parser.py',226),
+  ('a2ml_taggedstruct_type_name -> taggedstruct a2ml_identifier','a2ml_taggedstruct_type_name',2,'p_a2ml_taggedstruct_type_name','parser.py',227),
+  ('a2ml_taggedstruct_member_list_optional -> empty','a2ml_taggedstruct_member_list_optional',1,'p_a2ml_taggedstruct_member_list_optional','parser.py',232),
+  ('a2ml_taggedstruct_member_list_optional -> a2ml_taggedstruct_member_list','a2ml_taggedstruct_member_list_optional',1,'p_a2ml_taggedstruct_member_list_optional','parser.py',233),
+  ('a2ml_taggedstruct_member_list -> a2ml_taggedstruct_member','a2ml_taggedstruct_member_list',1,'p_a2ml_taggedstruct_member_list','parser.py',238),
+  ('a2ml_taggedstruct_member_list -> a2ml_taggedstruct_member_list a2ml_taggedstruct_member','a2ml_taggedstruct_member_list',2,'p_a2ml_taggedstruct_member_list','parser.py',239),
+  ('a2ml_taggedstruct_member -> a2ml_taggedstruct_definition SEMICOLON','a2ml_taggedstruct_member',2,'p_a2ml_taggedstruct_member','parser.py',248),
+  ('a2ml_taggedstruct_member -> PARENTHESE_OPEN a2ml_taggedstruct_definition PARENTHESE_CLOSE ASTERISK SEMICOLON','a2ml_taggedstruct_member',5,'p_a2ml_taggedstruct_member','parser.py',249),
+  ('a2ml_taggedstruct_member -> a2ml_block_definition SEMICOLON','a2ml_taggedstruct_member',2,'p_a2ml_taggedstruct_member','parser.py',250),
+  ('a2ml_taggedstruct_member -> PARENTHESE_OPEN a2ml_block_definition PARENTHESE_CLOSE ASTERISK SEMICOLON','a2ml_taggedstruct_member',5,'p_a2ml_taggedstruct_member','parser.py',251),
+  ('a2ml_taggedstruct_definition -> a2ml_tag a2ml_member_optional','a2ml_taggedstruct_definition',2,'p_a2ml_taggedstruct_definition','parser.py',255),
+  ('a2ml_taggedstruct_definition -> a2ml_tag PARENTHESE_OPEN a2ml_member PARENTHESE_CLOSE ASTERISK','a2ml_taggedstruct_definition',5,'p_a2ml_taggedstruct_definition','parser.py',256),
+  ('a2ml_taggedunion_type_name -> taggedunion a2ml_identifier_optional CURLY_OPEN a2ml_taggedunion_member_list_optional CURLY_CLOSE','a2ml_taggedunion_type_name',5,'p_a2ml_taggedunion_type_name','parser.py',261),
+  ('a2ml_taggedunion_type_name -> taggedunion a2ml_identifier','a2ml_taggedunion_type_name',2,'p_a2ml_taggedunion_type_name','parser.py',262),
+  ('a2ml_taggedunion_member_list -> a2ml_taggedunion_member','a2ml_taggedunion_member_list',1,'p_a2ml_taggedunion_member_list','parser.py',266),
+  ('a2ml_taggedunion_member_list -> a2ml_taggedunion_member_list a2ml_taggedunion_member','a2ml_taggedunion_member_list',2,'p_a2ml_taggedunion_member_list','parser.py',267),
+  ('a2ml_taggedunion_member_list_optional -> empty','a2ml_taggedunion_member_list_optional',1,'p_a2ml_taggedunion_member_list_optional','parser.py',276),
+  ('a2ml_taggedunion_member_list_optional -> a2ml_taggedunion_member_list','a2ml_taggedunion_member_list_optional',1,'p_a2ml_taggedunion_member_list_optional','parser.py',277),
+  ('a2ml_taggedunion_member -> a2ml_tag SEMICOLON','a2ml_taggedunion_member',2,'p_a2ml_taggedunion_member','parser.py',282),
+  ('a2ml_taggedunion_member -> a2ml_tag a2ml_member SEMICOLON','a2ml_taggedunion_member',3,'p_a2ml_taggedunion_member','parser.py',283),
+  ('a2ml_taggedunion_member -> a2ml_block_definition SEMICOLON','a2ml_taggedunion_member',2,'p_a2ml_taggedunion_member','parser.py',284),
+  ('a2ml_tag -> STRING','a2ml_tag',1,'p_a2ml_tag','parser.py',288),
+  ('a2ml_identifier -> IDENT','a2ml_identifier',1,'p_a2ml_identifier','parser.py',292),
+  ('a2ml_identifier_optional -> empty','a2ml_identifier_optional',1,'p_a2ml_identifier_optional','parser.py',296),
+  ('a2ml_identifier_optional -> a2ml_identifier','a2ml_identifier_optional',1,'p_a2ml_identifier_optional','parser.py',297),
+  ('a2ml_keyword -> STRING','a2ml_keyword',1,'p_a2ml_keyword','parser.py',301),
+  ('a2ml_constant -> NUMERIC','a2ml_constant',1,'p_a2ml_constant','parser.py',305),
+  ('datatype -> UBYTE','datatype',1,'p_datatype','parser.py',309),
+  ('datatype -> SBYTE','datatype',1,'p_datatype','parser.py',310),
+  ('datatype -> UWORD','datatype',1,'p_datatype','parser.py',311),
+  ('datatype -> SWORD','datatype',1,'p_datatype','parser.py',312),
+  ('datatype -> ULONG','datatype',1,'p_datatype','parser.py',313),
+  ('datatype -> SLONG','datatype',1,'p_datatype','parser.py',314),
+  ('datatype -> A_UINT64','datatype',1,'p_datatype','parser.py',315),
+  ('datatype -> A_INT64','datatype',1,'p_datatype','parser.py',316),
+  ('datatype -> FLOAT32_IEEE','datatype',1,'p_datatype','parser.py',317),
+  ('datatype -> FLOAT64_IEEE','datatype',1,'p_datatype','parser.py',318),
+  ('datasize -> BYTE','datasize',1,'p_datasize','parser.py',323),
+  ('datasize -> WORD','datasize',1,'p_datasize','parser.py',324),
+  ('datasize -> LONG','datasize',1,'p_datasize','parser.py',325),
+  ('addrtype -> PBYTE','addrtype',1,'p_addrtype','parser.py',330),
+  ('addrtype -> PWORD','addrtype',1,'p_addrtype','parser.py',331),
+  ('addrtype -> PLONG','addrtype',1,'p_addrtype','parser.py',332),
+  ('addrtype -> DIRECT','addrtype',1,'p_addrtype','parser.py',333),
+  ('indexorder -> INDEX_INCR','indexorder',1,'p_indexorder','parser.py',338),
+  ('indexorder -> INDEX_DECR','indexorder',1,'p_indexorder','parser.py',339),
+  ('asap2_version -> ASAP2_VERSION NUMERIC NUMERIC','asap2_version',3,'p_asap2_version','parser.py',344),
+  ('a2ml_version -> A2ML_VERSION NUMERIC NUMERIC','a2ml_version',3,'p_a2ml_version','parser.py',349),
+  ('generic_parameter -> IDENT','generic_parameter',1,'p_generic_parameter','parser.py',354),
+  ('generic_parameter -> STRING','generic_parameter',1,'p_generic_parameter','parser.py',355),
+  ('generic_parameter -> NUMERIC','generic_parameter',1,'p_generic_parameter','parser.py',356),
+  ('generic_parameter -> begin IDENT generic_parameter_list_optional end IDENT','generic_parameter',5,'p_generic_parameter','parser.py',357),
+  ('generic_parameter_list -> generic_parameter','generic_parameter_list',1,'p_generic_parameter_list','parser.py',361),
+  ('generic_parameter_list -> generic_parameter_list generic_parameter','generic_parameter_list',2,'p_generic_parameter_list','parser.py',362),
+  ('generic_parameter_list_optional -> empty','generic_parameter_list_optional',1,'p_generic_parameter_list_optional','parser.py',371),
+  ('generic_parameter_list_optional -> generic_parameter_list','generic_parameter_list_optional',1,'p_generic_parameter_list_optional','parser.py',372),
+  ('number_list -> NUMERIC','number_list',1,'p_number_list','parser.py',376),
+  ('number_list -> number_list NUMERIC','number_list',2,'p_number_list','parser.py',377),
+  ('ident_list -> IDENT','ident_list',1,'p_ident_list','parser.py',386),
+  ('ident_list -> ident_list IDENT','ident_list',2,'p_ident_list','parser.py',387),
+  ('string_list -> STRING','string_list',1,'p_string_list','parser.py',396),
+  ('string_list -> string_list STRING','string_list',2,'p_string_list','parser.py',397),
+  ('project -> begin PROJECT IDENT STRING project_optional_list_optional end PROJECT','project',7,'p_project','parser.py',406),
+  ('project_optional -> header','project_optional',1,'p_project_optional','parser.py',411),
+  ('project_optional -> module','project_optional',1,'p_project_optional','parser.py',412),
+  ('project_optional_list -> project_optional','project_optional_list',1,'p_project_optional_list','parser.py',417),
+  ('project_optional_list -> project_optional_list project_optional','project_optional_list',2,'p_project_optional_list','parser.py',418),
+  ('project_optional_list_optional -> empty','project_optional_list_optional',1,'p_project_optional_list_optional','parser.py',427),
+  ('project_optional_list_optional -> project_optional_list','project_optional_list_optional',1,'p_project_optional_list_optional','parser.py',428),
+  ('header -> begin HEADER STRING header_optional_list_optional end HEADER','header',6,'p_header','parser.py',433),
+  ('header_optional -> version','header_optional',1,'p_header_optional','parser.py',438),
+  ('header_optional -> project_no','header_optional',1,'p_header_optional','parser.py',439),
+  ('header_optional_list -> header_optional','header_optional_list',1,'p_header_optional_list','parser.py',444),
+  ('header_optional_list -> header_optional_list header_optional','header_optional_list',2,'p_header_optional_list','parser.py',445),
+  ('header_optional_list_optional -> empty','header_optional_list_optional',1,'p_header_optional_list_optional','parser.py',454),
+  ('header_optional_list_optional -> header_optional_list','header_optional_list_optional',1,'p_header_optional_list_optional','parser.py',455),
+  ('version -> VERSION STRING','version',2,'p_version','parser.py',460),
+  ('project_no -> PROJECT_NO IDENT','project_no',2,'p_project_no','parser.py',465),
+  ('module -> begin MODULE IDENT STRING module_optional_list_optional end MODULE','module',7,'p_module','parser.py',470),
+  ('module_optional -> a2ml','module_optional',1,'p_module_optional','parser.py',475),
+  ('module_optional -> mod_par','module_optional',1,'p_module_optional','parser.py',476),
+  ('module_optional -> mod_common','module_optional',1,'p_module_optional','parser.py',477),
+  ('module_optional -> if_data_xcp','module_optional',1,'p_module_optional','parser.py',478),
+  ('module_optional -> if_data_module','module_optional',1,'p_module_optional','parser.py',479),
+  ('module_optional -> characteristic','module_optional',1,'p_module_optional','parser.py',480),
+  ('module_optional -> axis_pts','module_optional',1,'p_module_optional','parser.py',481),
+  ('module_optional -> measurement','module_optional',1,'p_module_optional','parser.py',482),
+  ('module_optional -> compu_method','module_optional',1,'p_module_optional','parser.py',483),
+  ('module_optional -> compu_tab','module_optional',1,'p_module_optional','parser.py',484),
+  ('module_optional -> compu_vtab','module_optional',1,'p_module_optional','parser.py',485),
+  ('module_optional -> compu_vtab_range','module_optional',1,'p_module_optional','parser.py',486),
+  ('module_optional -> function','module_optional',1,'p_module_optional','parser.py',487),
+  ('module_optional -> group','module_optional',1,'p_module_optional','parser.py',488),
+  ('module_optional -> record_layout','module_optional',1,'p_module_optional','parser.py',489),
+  ('module_optional -> variant_coding','module_optional',1,'p_module_optional','parser.py',490),
+  ('module_optional -> frame','module_optional',1,'p_module_optional','parser.py',491),
+  ('module_optional -> user_rights','module_optional',1,'p_module_optional','parser.py',492),
+  ('module_optional -> unit','module_optional',1,'p_module_optional','parser.py',493),
+  ('module_optional_list -> module_optional','module_optional_list',1,'p_module_optional_list','parser.py',498),
+  ('module_optional_list -> module_optional_list module_optional','module_optional_list',2,'p_module_optional_list','parser.py',499),
+  ('module_optional_list_optional -> empty','module_optional_list_optional',1,'p_module_optional_list_optional','parser.py',508),
+  ('module_optional_list_optional -> module_optional_list','module_optional_list_optional',1,'p_module_optional_list_optional','parser.py',509),
+  ('a2ml -> begin A2ML a2ml_declaration_list end A2ML','a2ml',5,'p_a2ml','parser.py',514),
+  ('if_data_xcp -> begin IF_DATA XCP if_data_xcp_optional_list_optional end IF_DATA','if_data_xcp',6,'p_if_data_xcp','parser.py',519),
+  ('if_data_xcp_optional -> protocol_layer','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',524),
+  ('if_data_xcp_optional -> daq','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',525),
+  ('if_data_xcp_optional -> pag','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',526),
+  ('if_data_xcp_optional -> pgm','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',527),
+  ('if_data_xcp_optional -> segment','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',528),
+  ('if_data_xcp_optional -> daq_event','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',529),
+  ('if_data_xcp_optional -> xcp_on_can','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',530),
+  ('if_data_xcp_optional -> generic_parameter_list','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',531),
+  ('xcp_on_can -> begin XCP_ON_CAN NUMERIC xcp_on_can_optional_list_optional end XCP_ON_CAN','xcp_on_can',6,'p_xcp_on_can','parser.py',536),
+  ('xcp_on_can_optional -> can_id_broadcast','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',541),
+  ('xcp_on_can_optional -> can_id_master','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',542),
+  ('xcp_on_can_optional -> can_id_slave','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',543),
+  ('xcp_on_can_optional -> baudrate','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',544),
+  ('xcp_on_can_optional -> sample_point','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',545),
+  ('xcp_on_can_optional -> sample_rate','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',546),
+  ('xcp_on_can_optional -> btl_cycles','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',547),
+  ('xcp_on_can_optional -> sjw','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',548),
+  ('xcp_on_can_optional -> sync_edge','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',549),
+  ('xcp_on_can_optional -> daq_list_can_id','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',550),
+  ('xcp_on_can_optional_list -> xcp_on_can_optional','xcp_on_can_optional_list',1,'p_xcp_on_can_optional_list','parser.py',555),
+  ('xcp_on_can_optional_list -> xcp_on_can_optional_list xcp_on_can_optional','xcp_on_can_optional_list',2,'p_xcp_on_can_optional_list','parser.py',556),
+  ('xcp_on_can_optional_list_optional -> empty','xcp_on_can_optional_list_optional',1,'p_xcp_on_can_optional_list_optional','parser.py',565),
+  ('xcp_on_can_optional_list_optional -> xcp_on_can_optional_list','xcp_on_can_optional_list_optional',1,'p_xcp_on_can_optional_list_optional','parser.py',566),
+  ('can_id_broadcast -> CAN_ID_BROADCAST NUMERIC','can_id_broadcast',2,'p_can_id_broadcast','parser.py',571),
+  ('can_id_master -> CAN_ID_MASTER NUMERIC','can_id_master',2,'p_can_id_master','parser.py',576),
+  ('can_id_slave -> CAN_ID_SLAVE NUMERIC','can_id_slave',2,'p_can_id_slave','parser.py',581),
+  ('baudrate -> BAUDRATE NUMERIC','baudrate',2,'p_baudrate','parser.py',586),
+  ('sample_point -> SAMPLE_POINT NUMERIC','sample_point',2,'p_sample_point','parser.py',591),
+  ('sample_rate -> SAMPLE_RATE SINGLE','sample_rate',2,'p_sample_rate','parser.py',596),
+  ('sample_rate -> SAMPLE_RATE TRIPLE','sample_rate',2,'p_sample_rate','parser.py',597),
+  ('btl_cycles -> BTL_CYCLES NUMERIC','btl_cycles',2,'p_btl_cycles','parser.py',602),
+  ('sjw -> SJW NUMERIC','sjw',2,'p_sjw','parser.py',607),
+  ('sync_edge -> SYNC_EDGE SINGLE','sync_edge',2,'p_sync_edge','parser.py',612),
+  ('sync_edge -> SYNC_EDGE DUAL','sync_edge',2,'p_sync_edge','parser.py',613),
+  ('daq_list_can_id -> begin DAQ_LIST_CAN_ID NUMERIC daq_list_can_id_optional_optional end DAQ_LIST_CAN_ID','daq_list_can_id',6,'p_daq_list_can_id','parser.py',618),
+  ('daq_list_can_id_optional -> daq_list_can_id_type_variable','daq_list_can_id_optional',1,'p_daq_list_can_id_optional','parser.py',623),
+  ('daq_list_can_id_optional -> daq_list_can_id_type_fixed','daq_list_can_id_optional',1,'p_daq_list_can_id_optional','parser.py',624),
+  ('daq_list_can_id_optional_optional -> empty','daq_list_can_id_optional_optional',1,'p_daq_list_can_id_optional_optional','parser.py',629),
+  ('daq_list_can_id_optional_optional -> daq_list_can_id_optional','daq_list_can_id_optional_optional',1,'p_daq_list_can_id_optional_optional','parser.py',630),
+  ('daq_list_can_id_type_variable -> VARIABLE','daq_list_can_id_type_variable',1,'p_daq_list_can_id_type_variable','parser.py',635),
+  ('daq_list_can_id_type_fixed -> FIXED NUMERIC','daq_list_can_id_type_fixed',2,'p_daq_list_can_id_type_fixed','parser.py',640),
+  ('daq_event -> begin DAQ_EVENT FIXED_EVENT_LIST daq_event_optional_list_optional end DAQ_EVENT','daq_event',6,'p_daq_event','parser.py',645),
+  ('daq_event -> begin DAQ_EVENT VARIABLE daq_event_optional_list_optional end DAQ_EVENT','daq_event',6,'p_daq_event','parser.py',646),
+  ('daq_event_optional -> available_event_list','daq_event_optional',1,'p_daq_event_optional','parser.py',651),
+  ('daq_event_optional -> default_event_list','daq_event_optional',1,'p_daq_event_optional','parser.py',652),
+  ('daq_event_optional_list -> daq_event_optional','daq_event_optional_list',1,'p_daq_event_optional_list','parser.py',657),
+  ('daq_event_optional_list -> daq_event_optional_list daq_event_optional','daq_event_optional_list',2,'p_daq_event_optional_list','parser.py',658),
+  ('daq_event_optional_list_optional -> empty','daq_event_optional_list_optional',1,'p_daq_event_optional_list_optional','parser.py',667),
+  ('daq_event_optional_list_optional -> daq_event_optional_list','daq_event_optional_list_optional',1,'p_daq_event_optional_list_optional','parser.py',668),
+  ('default_event_list -> begin DEFAULT_EVENT_LIST available_event_list_optional_list_optional end DEFAULT_EVENT_LIST','default_event_list',5,'p_default_event_list','parser.py',673),
+  ('available_event_list -> begin AVAILABLE_EVENT_LIST available_event_list_optional_list_optional end AVAILABLE_EVENT_LIST','available_event_list',5,'p_available_event_list','parser.py',678),
+  ('available_event_list_optional -> EVENT NUMERIC','available_event_list_optional',2,'p_available_event_list_optional','parser.py',683),
+  ('available_event_list_optional_list -> available_event_list_optional','available_event_list_optional_list',1,'p_available_event_list_optional_list','parser.py',688),
+  ('available_event_list_optional_list -> available_event_list_optional_list available_event_list_optional','available_event_list_optional_list',2,'p_available_event_list_optional_list','parser.py',689),
+  ('available_event_list_optional_list_optional -> empty','available_event_list_optional_list_optional',1,'p_available_event_list_optional_list_optional','parser.py',698),
+  ('available_event_list_optional_list_optional -> available_event_list_optional_list','available_event_list_optional_list_optional',1,'p_available_event_list_optional_list_optional','parser.py',699),
+  ('if_data_xcp_optional_list -> if_data_xcp_optional','if_data_xcp_optional_list',1,'p_if_data_xcp_optional_list','parser.py',704),
+  ('if_data_xcp_optional_list -> if_data_xcp_optional_list if_data_xcp_optional','if_data_xcp_optional_list',2,'p_if_data_xcp_optional_list','parser.py',705),
+  ('if_data_xcp_optional_list_optional -> empty','if_data_xcp_optional_list_optional',1,'p_if_data_xcp_optional_list_optional','parser.py',714),
+  ('if_data_xcp_optional_list_optional -> if_data_xcp_optional_list','if_data_xcp_optional_list_optional',1,'p_if_data_xcp_optional_list_optional','parser.py',715),
+  ('pag -> begin PAG NUMERIC pag_optional_list_optional end PAG','pag',6,'p_pag','parser.py',720),
+  ('pgm -> begin PGM IDENT NUMERIC NUMERIC pgm_optional_list_optional end PGM','pgm',8,'p_pgm','parser.py',725),
+  ('pgm_optional -> sector','pgm_optional',1,'p_pgm_optional','parser.py',730),
+  ('pgm_optional -> generic_parameter_list','pgm_optional',1,'p_pgm_optional','parser.py',731),
+  ('pgm_optional_list -> pgm_optional','pgm_optional_list',1,'p_pgm_optional_list','parser.py',736),
+  ('pgm_optional_list -> pgm_optional_list pgm_optional','pgm_optional_list',2,'p_pgm_optional_list','parser.py',737),
+  ('pgm_optional_list_optional -> empty','pgm_optional_list_optional',1,'p_pgm_optional_list_optional','parser.py',746),
+  ('pgm_optional_list_optional -> pgm_optional_list','pgm_optional_list_optional',1,'p_pgm_optional_list_optional','parser.py',747),
+  ('sector -> begin SECTOR STRING NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC end SECTOR','sector',11,'p_sector','parser.py',752),
+  ('pag_optional -> freeze_supported','pag_optional',1,'p_pag_optional','parser.py',757),
+  ('pag_optional -> generic_parameter_list','pag_optional',1,'p_pag_optional','parser.py',758),
+  ('pag_optional_list -> pag_optional','pag_optional_list',1,'p_pag_optional_list','parser.py',763),
+  ('pag_optional_list -> pag_optional_list pag_optional','pag_optional_list',2,'p_pag_optional_list','parser.py',764),
+  ('pag_optional_list_optional -> empty','pag_optional_list_optional',1,'p_pag_optional_list_optional','parser.py',773),
+  ('pag_optional_list_optional -> pag_optional_list','pag_optional_list_optional',1,'p_pag_optional_list_optional','parser.py',774),
+  ('freeze_supported -> FREEZE_SUPPORTED','freeze_supported',1,'p_freeze_supported','parser.py',779),
+  ('daq -> begin DAQ daq_config_type NUMERIC NUMERIC NUMERIC optimisation_type address_extension identification_field_type granularity_odt_entry NUMERIC overload_indication daq_optional_list_optional end DAQ','daq',15,'p_daq','parser.py',784),
+  ('daq_config_type -> STATIC','daq_config_type',1,'p_daq_config_type','parser.py',789),
+  ('daq_config_type -> DYNAMIC','daq_config_type',1,'p_daq_config_type','parser.py',790),
+  ('daq_optional -> daq_list','daq_optional',1,'p_daq_optional','parser.py',795),
+  ('daq_optional -> event','daq_optional',1,'p_daq_optional','parser.py',796),
+  ('daq_optional -> timestamp_supported','daq_optional',1,'p_daq_optional','parser.py',797),
+  ('daq_optional -> optimisation_type','daq_optional',1,'p_daq_optional','parser.py',798),
+  ('daq_optional -> address_extension','daq_optional',1,'p_daq_optional','parser.py',799),
+  ('daq_optional -> identification_field_type','daq_optional',1,'p_daq_optional','parser.py',800),
+  ('daq_optional -> granularity_odt_entry','daq_optional',1,'p_daq_optional','parser.py',801),
+  ('daq_optional -> prescaler_supported','daq_optional',1,'p_daq_optional','parser.py',802),
+  ('daq_optional -> resume_supported','daq_optional',1,'p_daq_optional','parser.py',803),
+  ('daq_optional -> IDENT','daq_optional',1,'p_daq_optional','parser.py',804),
+  ('daq_optional -> NUMERIC','daq_optional',1,'p_daq_optional','parser.py',805),
+  ('prescaler_supported -> PRESCALER_SUPPORTED','prescaler_supported',1,'p_prescaler_supported','parser.py',810),
+  ('resume_supported -> RESUME_SUPPORTED','resume_supported',1,'p_resume_supported','parser.py',815),
+  ('optimisation_type -> OPTIMISATION_TYPE_DEFAULT','optimisation_type',1,'p_optimisation_type','parser.py',820),
+  ('optimisation_type -> OPTIMISATION_TYPE_ODT_TYPE_16','optimisation_type',1,'p_optimisation_type','parser.py',821),
+  ('optimisation_type -> OPTIMISATION_TYPE_ODT_TYPE_32','optimisation_type',1,'p_optimisation_type','parser.py',822),
+  ('optimisation_type -> OPTIMISATION_TYPE_ODT_TYPE_64','optimisation_type',1,'p_optimisation_type','parser.py',823),
+  ('optimisation_type -> OPTIMISATION_TYPE_ODT_TYPE_ALIGNMENT','optimisation_type',1,'p_optimisation_type','parser.py',824),
+  ('optimisation_type -> OPTIMISATION_TYPE_MAX_ENTRY_SIZE','optimisation_type',1,'p_optimisation_type','parser.py',825),
+  ('address_extension -> ADDRESS_EXTENSION_FREE','address_extension',1,'p_address_extension','parser.py',830),
+  ('address_extension -> ADDRESS_EXTENSION_ODT','address_extension',1,'p_address_extension','parser.py',831),
+  ('address_extension -> ADDRESS_EXTENSION_DAQ','address_extension',1,'p_address_extension','parser.py',832),
+  ('identification_field_type -> IDENTIFICATION_FIELD_TYPE_ABSOLUTE','identification_field_type',1,'p_identification_field_type','parser.py',837),
+  ('identification_field_type -> IDENTIFICATION_FIELD_TYPE_RELATIVE_BYTE','identification_field_type',1,'p_identification_field_type','parser.py',838),
+  ('identification_field_type -> IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD','identification_field_type',1,'p_identification_field_type','parser.py',839),
+  ('identification_field_type -> IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD_ALIGNED','identification_field_type',1,'p_identification_field_type','parser.py',840),
+  ('granularity_odt_entry -> GRANULARITY_ODT_ENTRY_SIZE_DAQ_BYTE','granularity_odt_entry',1,'p_granularity_odt_entry','parser.py',845),
+  ('granularity_odt_entry -> GRANULARITY_ODT_ENTRY_SIZE_DAQ_WORD','granularity_odt_entry',1,'p_granularity_odt_entry','parser.py',846),
+  ('granularity_odt_entry -> GRANULARITY_ODT_ENTRY_SIZE_DAQ_DWORD','granularity_odt_entry',1,'p_granularity_odt_entry','parser.py',847),
+  ('granularity_odt_entry -> GRANULARITY_ODT_ENTRY_SIZE_DAQ_DLONG','granularity_odt_entry',1,'p_granularity_odt_entry','parser.py',848),
+  ('overload_indication -> NO_OVERLOAD_INDICATION','overload_indication',1,'p_overload_indication','parser.py',853),
+  ('overload_indication -> OVERLOAD_INDICATION_PID','overload_indication',1,'p_overload_indication','parser.py',854),
+  ('overload_indication -> OVERLOAD_INDICATION_EVENT','overload_indication',1,'p_overload_indication','parser.py',855),
+  ('daq_optional_list -> daq_optional','daq_optional_list',1,'p_daq_optional_list','parser.py',860),
+  ('daq_optional_list -> daq_optional_list daq_optional','daq_optional_list',2,'p_daq_optional_list','parser.py',861),
+  ('daq_optional_list_optional -> empty','daq_optional_list_optional',1,'p_daq_optional_list_optional','parser.py',870),
+  ('daq_optional_list_optional -> daq_optional_list','daq_optional_list_optional',1,'p_daq_optional_list_optional','parser.py',871),
+  ('event -> begin EVENT STRING STRING NUMERIC daq_list_type_enum NUMERIC NUMERIC NUMERIC NUMERIC end EVENT','event',12,'p_event','parser.py',876),
+  ('daq_list -> begin DAQ_LIST NUMERIC daq_list_optional_list_optional end DAQ_LIST','daq_list',6,'p_daq_list','parser.py',881),
+  ('daq_list_optional -> daq_list_type','daq_list_optional',1,'p_daq_list_optional','parser.py',886),
+  ('daq_list_optional -> max_odt','daq_list_optional',1,'p_daq_list_optional','parser.py',887),
+  ('daq_list_optional -> max_odt_entries','daq_list_optional',1,'p_daq_list_optional','parser.py',888),
+  ('daq_list_optional -> first_pid','daq_list_optional',1,'p_daq_list_optional','parser.py',889),
+  ('daq_list_optional -> event_fixed','daq_list_optional',1,'p_daq_list_optional','parser.py',890),
+  ('daq_list_optional -> predefined','daq_list_optional',1,'p_daq_list_optional','parser.py',891),
+  ('daq_list_type_enum -> DAQ','daq_list_type_enum',1,'p_daq_list_type_enum','parser.py',896),
+  ('daq_list_type_enum -> STIM','daq_list_type_enum',1,'p_daq_list_type_enum','parser.py',897),
+  ('daq_list_type_enum -> DAQ_STIM','daq_list_type_enum',1,'p_daq_list_type_enum','parser.py',898),
+  ('daq_list_type -> DAQ_LIST_TYPE daq_list_type_enum','daq_list_type',2,'p_daq_list_type','parser.py',903),
+  ('max_odt -> MAX_ODT NUMERIC','max_odt',2,'p_max_odt','parser.py',908),
+  ('max_odt_entries -> MAX_ODT_ENTRIES NUMERIC','max_odt_entries',2,'p_max_odt_entries','parser.py',913),
+  ('first_pid -> FIRST_PID NUMERIC','first_pid',2,'p_first_pid','parser.py',918),
+  ('event_fixed -> EVENT_FIXED NUMERIC','event_fixed',2,'p_event_fixed','parser.py',923),
+  ('predefined -> generic_parameter_list','predefined',1,'p_predefined','parser.py',928),
+  ('daq_list_optional_list -> daq_list_optional','daq_list_optional_list',1,'p_daq_list_optional_list','parser.py',933),
+  ('daq_list_optional_list -> daq_list_optional_list daq_list_optional','daq_list_optional_list',2,'p_daq_list_optional_list','parser.py',934),
+  ('daq_list_optional_list_optional -> empty','daq_list_optional_list_optional',1,'p_daq_list_optional_list_optional','parser.py',943),
+  ('daq_list_optional_list_optional -> daq_list_optional_list','daq_list_optional_list_optional',1,'p_daq_list_optional_list_optional','parser.py',944),
+  ('timestamp_supported -> begin TIMESTAMP_SUPPORTED NUMERIC IDENT IDENT timestamp_fixed end TIMESTAMP_SUPPORTED','timestamp_supported',8,'p_timestamp_supported','parser.py',949),
+  ('timestamp_fixed -> empty','timestamp_fixed',1,'p_timestamp_fixed','parser.py',954),
+  ('timestamp_fixed -> TIMESTAMP_FIXED','timestamp_fixed',1,'p_timestamp_fixed','parser.py',955),
+  ('protocol_layer -> begin PROTOCOL_LAYER NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC protocol_layer_optional_list_optional end PROTOCOL_LAYER','protocol_layer',15,'p_protocol_layer','parser.py',960),
+  ('protocol_layer_optional -> generic_parameter_list','protocol_layer_optional',1,'p_protocol_layer_optional','parser.py',965),
+  ('protocol_layer_optional_list -> protocol_layer_optional','protocol_layer_optional_list',1,'p_protocol_layer_optional_list','parser.py',969),
+  ('protocol_layer_optional_list -> protocol_layer_optional_list protocol_layer_optional','protocol_layer_optional_list',2,'p_protocol_layer_optional_list','parser.py',970),
+  ('protocol_layer_optional_list_optional -> empty','protocol_layer_optional_list_optional',1,'p_protocol_layer_optional_list_optional','parser.py',979),
+  ('protocol_layer_optional_list_optional -> protocol_layer_optional_list','protocol_layer_optional_list_optional',1,'p_protocol_layer_optional_list_optional','parser.py',980),
+  ('if_data_module -> begin IF_DATA IDENT if_data_module_optional_list_optional end IF_DATA','if_data_module',6,'p_if_data_module','parser.py',985),
+  ('if_data_module_optional -> source','if_data_module_optional',1,'p_if_data_module_optional','parser.py',990),
+  ('if_data_module_optional -> raster','if_data_module_optional',1,'p_if_data_module_optional','parser.py',991),
+  ('if_data_module_optional -> event_group','if_data_module_optional',1,'p_if_data_module_optional','parser.py',992),
+  ('if_data_module_optional -> seed_key','if_data_module_optional',1,'p_if_data_module_optional','parser.py',993),
+  ('if_data_module_optional -> checksum','if_data_module_optional',1,'p_if_data_module_optional','parser.py',994),
+  ('if_data_module_optional -> tp_blob tp_data','if_data_module_optional',2,'p_if_data_module_optional','parser.py',995),
+  ('if_data_module_optional -> if_data_module_unsupported_element','if_data_module_optional',1,'p_if_data_module_optional','parser.py',996),
+  ('if_data_module_optional_list -> if_data_module_optional','if_data_module_optional_list',1,'p_if_data_module_optional_list','parser.py',1001),
+  ('if_data_module_optional_list -> if_data_module_optional_list if_data_module_optional','if_data_module_optional_list',2,'p_if_data_module_optional_list','parser.py',1002),
+  ('if_data_module_optional_list_optional -> empty','if_data_module_optional_list_optional',1,'p_if_data_module_optional_list_optional','parser.py',1011),
+  ('if_data_module_optional_list_optional -> if_data_module_optional_list','if_data_module_optional_list_optional',1,'p_if_data_module_optional_list_optional','parser.py',1012),
+  ('if_data_module_unsupported_element -> generic_parameter_list','if_data_module_unsupported_element',1,'p_if_data_module_unsupported_element','parser.py',1017),
+  ('source -> begin SOURCE IDENT NUMERIC NUMERIC source_optional_list_optional end SOURCE','source',8,'p_source','parser.py',1021),
+  ('raster -> begin RASTER STRING STRING NUMERIC NUMERIC NUMERIC end RASTER','raster',9,'p_raster','parser.py',1026),
+  ('event_group -> begin EVENT_GROUP STRING STRING number_list end EVENT_GROUP','event_group',7,'p_event_group','parser.py',1031),
+  ('seed_key -> begin SEED_KEY STRING STRING STRING end SEED_KEY','seed_key',7,'p_seed_key','parser.py',1036),
+  ('checksum -> begin CHECKSUM STRING end CHECKSUM','checksum',5,'p_checksum','parser.py',1041),
+  ('checksum -> begin CHECKSUM IDENT max_block_size end CHECKSUM','checksum',6,'p_checksum','parser.py',1042),
+  ('max_block_size -> MAX_BLOCK_SIZE NUMERIC','max_block_size',2,'p_max_block_size','parser.py',1050),
+  ('tp_blob -> TP_BLOB','tp_blob',1,'p_tp_blob','parser.py',1055),
+  ('tp_data -> generic_parameter_list','tp_data',1,'p_tp_data','parser.py',1060),
+  ('source_optional -> display_identifier','source_optional',1,'p_source_optional','parser.py',1065),
+  ('source_optional -> qp_blob','source_optional',1,'p_source_optional','parser.py',1066),
+  ('source_optional_list -> source_optional','source_optional_list',1,'p_source_optional_list','parser.py',1071),
+  ('source_optional_list -> source_optional_list source_optional','source_optional_list',2,'p_source_optional_list','parser.py',1072),
+  ('source_optional_list_optional -> empty','source_optional_list_optional',1,'p_source_optional_list_optional','parser.py',1081),
+  ('source_optional_list_optional -> source_optional_list','source_optional_list_optional',1,'p_source_optional_list_optional','parser.py',1082),
+  ('qp_blob -> QP_BLOB IDENT','qp_blob',2,'p_qp_blob','parser.py',1087),
+  ('mod_par -> begin MOD_PAR STRING mod_par_optional_list_optional end MOD_PAR','mod_par',6,'p_mod_par','parser.py',1091),
+  ('mod_par_optional -> version','mod_par_optional',1,'p_mod_par_optional','parser.py',1096),
+  ('mod_par_optional -> addr_epk','mod_par_optional',1,'p_mod_par_optional','parser.py',1097),
+  ('mod_par_optional -> epk','mod_par_optional',1,'p_mod_par_optional','parser.py',1098),
+  ('mod_par_optional -> supplier','mod_par_optional',1,'p_mod_par_optional','parser.py',1099),
+  ('mod_par_optional -> customer','mod_par_optional',1,'p_mod_par_optional','parser.py',1100),
+  ('mod_par_optional -> customer_no','mod_par_optional',1,'p_mod_par_optional','parser.py',1101),
+  ('mod_par_optional -> user','mod_par_optional',1,'p_mod_par_optional','parser.py',1102),
+  ('mod_par_optional -> phone_no','mod_par_optional',1,'p_mod_par_optional','parser.py',1103),
+  ('mod_par_optional -> ecu','mod_par_optional',1,'p_mod_par_optional','parser.py',1104),
+  ('mod_par_optional -> cpu_type','mod_par_optional',1,'p_mod_par_optional','parser.py',1105),
+  ('mod_par_optional -> no_of_interfaces','mod_par_optional',1,'p_mod_par_optional','parser.py',1106),
+  ('mod_par_optional -> ecu_calibration_offset','mod_par_optional',1,'p_mod_par_optional','parser.py',1107),
+  ('mod_par_optional -> calibration_method','mod_par_optional',1,'p_mod_par_optional','parser.py',1108),
+  ('mod_par_optional -> memory_layout','mod_par_optional',1,'p_mod_par_optional','parser.py',1109),
+  ('mod_par_optional -> memory_segment','mod_par_optional',1,'p_mod_par_optional','parser.py',1110),
+  ('mod_par_optional -> system_constant','mod_par_optional',1,'p_mod_par_optional','parser.py',1111),
+  ('mod_par_optional_list -> mod_par_optional','mod_par_optional_list',1,'p_mod_par_optional_list','parser.py',1116),
+  ('mod_par_optional_list -> mod_par_optional_list mod_par_optional','mod_par_optional_list',2,'p_mod_par_optional_list','parser.py',1117),
+  ('mod_par_optional_list_optional -> empty','mod_par_optional_list_optional',1,'p_mod_par_optional_list_optional','parser.py',1126),
+  ('mod_par_optional_list_optional -> mod_par_optional_list','mod_par_optional_list_optional',1,'p_mod_par_optional_list_optional','parser.py',1127),
+  ('addr_epk -> ADDR_EPK NUMERIC','addr_epk',2,'p_addr_epk','parser.py',1132),
+  ('epk -> EPK STRING','epk',2,'p_epk','parser.py',1137),
+  ('supplier -> SUPPLIER STRING','supplier',2,'p_supplier','parser.py',1142),
+  ('customer -> CUSTOMER STRING','customer',2,'p_customer','parser.py',1147),
+  ('customer_no -> CUSTOMER_NO STRING','customer_no',2,'p_customer_no','parser.py',1152),
+  ('user -> USER STRING','user',2,'p_user','parser.py',1157),
+  ('phone_no -> PHONE_NO STRING','phone_no',2,'p_phone_no','parser.py',1162),
+  ('mod_common -> begin MOD_COMMON STRING mod_common_optional_list_optional end MOD_COMMON','mod_common',6,'p_mod_common','parser.py',1167),
+  ('mod_common_optional -> s_rec_layout','mod_common_optional',1,'p_mod_common_optional','parser.py',1172),
+  ('mod_common_optional -> deposit','mod_common_optional',1,'p_mod_common_optional','parser.py',1173),
+  ('mod_common_optional -> byte_order','mod_common_optional',1,'p_mod_common_optional','parser.py',1174),
+  ('mod_common_optional -> data_size','mod_common_optional',1,'p_mod_common_optional','parser.py',1175),
+  ('mod_common_optional -> alignment_byte','mod_common_optional',1,'p_mod_common_optional','parser.py',1176),
+  ('mod_common_optional -> alignment_word','mod_common_optional',1,'p_mod_common_optional','parser.py',1177),
+  ('mod_common_optional -> alignment_long','mod_common_optional',1,'p_mod_common_optional','parser.py',1178),
+  ('mod_common_optional -> alignment_float32_ieee','mod_common_optional',1,'p_mod_common_optional','parser.py',1179),
+  ('mod_common_optional -> alignment_float64_ieee','mod_common_optional',1,'p_mod_common_optional','parser.py',1180),
+  ('mod_common_optional_list -> mod_common_optional','mod_common_optional_list',1,'p_mod_common_optional_parameter_list','parser.py',1185),
+  ('mod_common_optional_list -> mod_common_optional_list mod_common_optional','mod_common_optional_list',2,'p_mod_common_optional_parameter_list','parser.py',1186),
+  ('mod_common_optional_list_optional -> empty','mod_common_optional_list_optional',1,'p_mod_common_optional_parameter_list_optional','parser.py',1195),
+  ('mod_common_optional_list_optional -> mod_common_optional_list','mod_common_optional_list_optional',1,'p_mod_common_optional_parameter_list_optional','parser.py',1196),
+  ('s_rec_layout -> S_REC_LAYOUT IDENT','s_rec_layout',2,'p_s_rec_layout','parser.py',1201),
+  ('data_size -> DATA_SIZE NUMERIC','data_size',2,'p_data_size','parser.py',1206),
+  ('ecu -> ECU STRING','ecu',2,'p_ecu','parser.py',1211),
+  ('cpu_type -> CPU_TYPE STRING','cpu_type',2,'p_cpu_type','parser.py',1216),
+  ('no_of_interfaces -> NO_OF_INTERFACES NUMERIC','no_of_interfaces',2,'p_no_of_interfaces','parser.py',1221),
+  ('ecu_calibration_offset -> ECU_CALIBRATION_OFFSET NUMERIC','ecu_calibration_offset',2,'p_ecu_calibration_offset','parser.py',1226),
+  ('calibration_method -> begin CALIBRATION_METHOD STRING NUMERIC calibration_method_optional_list_optional end CALIBRATION_METHOD','calibration_method',7,'p_calibration_method','parser.py',1231),
+  ('calibration_method_optional -> calibration_handle','calibration_method_optional',1,'p_calibration_method_optional','parser.py',1236),
+  ('calibration_method_optional_list -> calibration_method_optional','calibration_method_optional_list',1,'p_calibration_method_optional_list','parser.py',1241),
+  ('calibration_method_optional_list -> calibration_method_optional_list calibration_method_optional','calibration_method_optional_list',2,'p_calibration_method_optional_list','parser.py',1242),
+  ('calibration_method_optional_list_optional -> empty','calibration_method_optional_list_optional',1,'p_calibration_method_optional_list_optional','parser.py',1251),
+  ('calibration_method_optional_list_optional -> calibration_method_optional_list','calibration_method_optional_list_optional',1,'p_calibration_method_optional_list_optional','parser.py',1252),
+  ('calibration_handle -> begin CALIBRATION_HANDLE calibration_handle_optional_list_optional end CALIBRATION_HANDLE','calibration_handle',5,'p_calibration_handle','parser.py',1257),
+  ('calibration_handle_optional -> NUMERIC','calibration_handle_optional',1,'p_calibration_handle_optional','parser.py',1262),
+  ('calibration_handle_optional_list -> calibration_handle_optional','calibration_handle_optional_list',1,'p_calibration_handle_optional_list','parser.py',1267),
+  ('calibration_handle_optional_list -> calibration_handle_optional_list calibration_handle_optional','calibration_handle_optional_list',2,'p_calibration_handle_optional_list','parser.py',1268),
+  ('calibration_handle_optional_list_optional -> empty','calibration_handle_optional_list_optional',1,'p_calibration_handle_optional_list_optional','parser.py',1277),
+  ('calibration_handle_optional_list_optional -> calibration_handle_optional_list','calibration_handle_optional_list_optional',1,'p_calibration_handle_optional_list_optional','parser.py',1278),
+  ('memory_layout -> begin MEMORY_LAYOUT memory_layout_prg_type NUMERIC NUMERIC number_list memory_layout_optional_list_optional end MEMORY_LAYOUT','memory_layout',9,'p_memory_layout','parser.py',1283),
+  ('memory_layout_prg_type -> PRG_CODE','memory_layout_prg_type',1,'p_memory_layout_prg_type','parser.py',1288),
+  ('memory_layout_prg_type -> PRG_DATA','memory_layout_prg_type',1,'p_memory_layout_prg_type','parser.py',1289),
+  ('memory_layout_prg_type -> PRG_RESERVED','memory_layout_prg_type',1,'p_memory_layout_prg_type','parser.py',1290),
+  ('memory_layout_optional -> if_data_memory_layout','memory_layout_optional',1,'p_memory_layout_optional','parser.py',1295),
+  ('memory_layout_optional_list -> memory_layout_optional','memory_layout_optional_list',1,'p_memory_layout_optional_list','parser.py',1300),
+  ('memory_layout_optional_list -> memory_layout_optional_list memory_layout_optional','memory_layout_optional_list',2,'p_memory_layout_optional_list','parser.py',1301),
+  ('memory_layout_optional_list_optional -> empty','memory_layout_optional_list_optional',1,'p_memory_layout_optional_list_optional','parser.py',1310),
+  ('memory_layout_optional_list_optional -> memory_layout_optional_list','memory_layout_optional_list_optional',1,'p_memory_layout_optional_list_optional','parser.py',1311),
+  ('if_data_memory_layout -> begin IF_DATA IDENT if_data_memory_layout_optional_list_optional end IF_DATA','if_data_memory_layout',6,'p_if_data_memory_layout','parser.py',1316),
+  ('if_data_memory_layout_optional -> dp_blob dp_data','if_data_memory_layout_optional',2,'p_if_data_memory_layout_optional','parser.py',1320),
+  ('if_data_memory_layout_optional -> ba_blob pa_data','if_data_memory_layout_optional',2,'p_if_data_memory_layout_optional','parser.py',1321),
+  ('if_data_memory_layout_optional_list -> if_data_memory_layout_optional','if_data_memory_layout_optional_list',1,'p_if_data_memory_layout_optional_list','parser.py',1325),
+  ('if_data_memory_layout_optional_list -> if_data_memory_layout_optional_list if_data_memory_layout_optional','if_data_memory_layout_optional_list',2,'p_if_data_memory_layout_optional_list','parser.py',1326),
+  ('if_data_memory_layout_optional_list_optional -> empty','if_data_memory_layout_optional_list_optional',1,'p_if_data_memory_layout_optional_list_optional','parser.py',1335),
+  ('if_data_memory_layout_optional_list_optional -> if_data_memory_layout_optional_list','if_data_memory_layout_optional_list_optional',1,'p_if_data_memory_layout_optional_list_optional','parser.py',1336),
+  ('dp_blob -> DP_BLOB','dp_blob',1,'p_dp_blob','parser.py',1340),
+  ('ba_blob -> BA_BLOB','ba_blob',1,'p_ba_blob','parser.py',1345),
+  ('dp_data -> generic_parameter_list','dp_data',1,'p_dp_data','parser.py',1350),
+  ('pa_data -> generic_parameter_list','pa_data',1,'p_pa_data','parser.py',1355),
+  ('memory_segment -> begin MEMORY_SEGMENT IDENT STRING memory_segment_prg_type memory_segment_memory_type memory_segment_attributes NUMERIC NUMERIC number_list memory_segment_optional_list_optional end MEMORY_SEGMENT','memory_segment',13,'p_memory_segment','parser.py',1360),
+  ('memory_segment_optional -> if_data_memory_segment','memory_segment_optional',1,'p_memory_segment_optional','parser.py',1365),
+  ('memory_segment_optional -> if_data_xcp','memory_segment_optional',1,'p_memory_segment_optional','parser.py',1366),
+  ('memory_segment_optional_parameter_list -> memory_segment_optional','memory_segment_optional_parameter_list',1,'p_memory_segment_optional_parameter_list','parser.py',1371),
+  ('memory_segment_optional_parameter_list -> memory_segment_optional_parameter_list memory_segment_optional','memory_segment_optional_parameter_list',2,'p_memory_segment_optional_parameter_list','parser.py',1372),
+  ('memory_segment_optional_list_optional -> empty','memory_segment_optional_list_optional',1,'p_memory_segment_optional_list_optional','parser.py',1381),
+  ('memory_segment_optional_list_optional -> memory_segment_optional_parameter_list','memory_segment_optional_list_optional',1,'p_memory_segment_optional_list_optional','parser.py',1382),
+  ('memory_segment_prg_type -> CODE','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1387),
+  ('memory_segment_prg_type -> DATA','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1388),
+  ('memory_segment_prg_type -> OFFLINE_DATA','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1389),
+  ('memory_segment_prg_type -> VARIABLES','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1390),
+  ('memory_segment_prg_type -> SERAM','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1391),
+  ('memory_segment_prg_type -> RESERVED','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1392),
+  ('memory_segment_prg_type -> CALIBRATION_VARIABLES','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1393),
+  ('memory_segment_prg_type -> EXCLUDE_FROM_FLASH','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1394),
+  ('memory_segment_memory_type -> RAM','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',1399),
+  ('memory_segment_memory_type -> EEPROM','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',1400),
+  ('memory_segment_memory_type -> EPROM','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',1401),
+  ('memory_segment_memory_type -> ROM','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',1402),
+  ('memory_segment_memory_type -> REGISTER','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',1403),
+  ('memory_segment_memory_type -> FLASH','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',1404),
+  ('memory_segment_attributes -> INTERN','memory_segment_attributes',1,'p_memory_segment_attributes','parser.py',1409),
+  ('memory_segment_attributes -> EXTERN','memory_segment_attributes',1,'p_memory_segment_attributes','parser.py',1410),
+  ('system_constant -> SYSTEM_CONSTANT STRING STRING','system_constant',3,'p_system_constant','parser.py',1415),
+  ('if_data_memory_segment -> begin IF_DATA IDENT if_data_memory_segment_optional_list_optional end IF_DATA','if_data_memory_segment',6,'p_if_data_memory_segment','parser.py',1420),
+  ('if_data_memory_segment_optional -> address_mapping','if_data_memory_segment_optional',1,'p_if_data_memory_segment_optional','parser.py',1425),
+  ('if_data_memory_segment_optional -> segment','if_data_memory_segment_optional',1,'p_if_data_memory_segment_optional','parser.py',1426),
+  ('if_data_memory_segment_optional -> generic_parameter','if_data_memory_segment_optional',1,'p_if_data_memory_segment_optional','parser.py',1427),
+  ('if_data_memory_segment_optional_list -> if_data_memory_segment_optional','if_data_memory_segment_optional_list',1,'p_if_data_memory_segment_optional_list','parser.py',1432),
+  ('if_data_memory_segment_optional_list -> if_data_memory_segment_optional_list if_data_memory_segment_optional','if_data_memory_segment_optional_list',2,'p_if_data_memory_segment_optional_list','parser.py',1433),
+  ('if_data_memory_segment_optional_list_optional -> empty','if_data_memory_segment_optional_list_optional',1,'p_if_data_memory_segment_optional_list_optional','parser.py',1443),
+  ('if_data_memory_segment_optional_list_optional -> if_data_memory_segment_optional_list','if_data_memory_segment_optional_list_optional',1,'p_if_data_memory_segment_optional_list_optional','parser.py',1444),
+  ('segment -> begin SEGMENT NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC segment_optional_parameter_list_optional end SEGMENT','segment',10,'p_segment','parser.py',1449),
+  ('segment_optional_parameter -> page','segment_optional_parameter',1,'p_segment_optional_parameter','parser.py',1454),
+  ('segment_optional_parameter -> checksum','segment_optional_parameter',1,'p_segment_optional_parameter','parser.py',1455),
+  ('segment_optional_parameter_list -> segment_optional_parameter','segment_optional_parameter_list',1,'p_segment_optional_parameter_list','parser.py',1460),
+  ('segment_optional_parameter_list -> segment_optional_parameter_list segment_optional_parameter','segment_optional_parameter_list',2,'p_segment_optional_parameter_list','parser.py',1461),
+  ('segment_optional_parameter_list_optional -> empty','segment_optional_parameter_list_optional',1,'p_segment_optional_parameter_list_optional','parser.py',1470),
+  ('segment_optional_parameter_list_optional -> segment_optional_parameter_list','segment_optional_parameter_list_optional',1,'p_segment_optional_parameter_list_optional','parser.py',1471),
+  ('page -> begin PAGE NUMERIC IDENT IDENT IDENT page_optional_parameter_list_optional end PAGE','page',9,'p_page','parser.py',1476),
+  ('page_optional_parameter -> init_segment','page_optional_parameter',1,'p_page_optional_parameter','parser.py',1480),
+  ('page_optional_parameter_list -> page_optional_parameter','page_optional_parameter_list',1,'p_page_optional_parameter_list','parser.py',1484),
+  ('page_optional_parameter_list -> page_optional_parameter_list page_optional_parameter','page_optional_parameter_list',2,'p_page_optional_parameter_list','parser.py',1485),
+  ('page_optional_parameter_list_optional -> empty','page_optional_parameter_list_optional',1,'p_page_optional_parameter_list_optional','parser.py',1494),
+  ('page_optional_parameter_list_optional -> page_optional_parameter_list','page_optional_parameter_list_optional',1,'p_page_optional_parameter_list_optional','parser.py',1495),
+  ('init_segment -> INIT_SEGMENT NUMERIC','init_segment',2,'p_init_segment','parser.py',1499),
+  ('address_mapping -> ADDRESS_MAPPING NUMERIC NUMERIC NUMERIC','address_mapping',4,'p_address_mapping','parser.py',1503),
+  ('characteristic -> begin CHARACTERISTIC IDENT STRING characteristic_type NUMERIC IDENT NUMERIC IDENT NUMERIC NUMERIC characteristic_optional_list_optional end CHARACTERISTIC','characteristic',14,'p_characteristic','parser.py',1508),
+  ('characteristic_type -> VALUE','characteristic_type',1,'p_characteristic_type','parser.py',1513),
+  ('characteristic_type -> CURVE','characteristic_type',1,'p_characteristic_type','parser.py',1514),
+  ('characteristic_type -> MAP','characteristic_type',1,'p_characteristic_type','parser.py',1515),
+  ('characteristic_type -> CUBOID','characteristic_type',1,'p_characteristic_type','parser.py',1516),
+  ('characteristic_type -> VAL_BLK','characteristic_type',1,'p_characteristic_type','parser.py',1517),
+  ('characteristic_type -> ASCII','characteristic_type',1,'p_characteristic_type','parser.py',1518),
+  ('display_identifier -> DISPLAY_IDENTIFIER IDENT','display_identifier',2,'p_display_identifier','parser.py',1523),
+  ('format -> FORMAT STRING','format',2,'p_format','parser.py',1528),
+  ('byte_order -> BYTE_ORDER byte_order_type','byte_order',2,'p_byte_order','parser.py',1533),
+  ('byte_order_type -> MSB_FIRST','byte_order_type',1,'p_byte_order_type','parser.py',1538),
+  ('byte_order_type -> MSB_LAST','byte_order_type',1,'p_byte_order_type','parser.py',1539),
+  ('bit_mask -> BIT_MASK NUMERIC','bit_mask',2,'p_bit_mask','parser.py',1544),
+  ('function_list -> begin FUNCTION_LIST function_list_optional_list_optional end FUNCTION_LIST','function_list',5,'p_function_list','parser.py',1549),
+  ('function_list_optional -> IDENT','function_list_optional',1,'p_function_list_optional','parser.py',1554),
+  ('function_list_optional_list -> function_list_optional','function_list_optional_list',1,'p_function_list_optional_list','parser.py',1559),
+  ('function_list_optional_list -> function_list_optional_list function_list_optional','function_list_optional_list',2,'p_function_list_optional_list','parser.py',1560),
+  ('function_list_optional_list_optional -> empty','function_list_optional_list_optional',1,'p_function_list_optional_list_optional','parser.py',1569),
+  ('function_list_optional_list_optional -> function_list_optional_list','function_list_optional_list_optional',1,'p_function_list_optional_list_optional','parser.py',1570),
+  ('number -> NUMBER NUMERIC','number',2,'p_number','parser.py',1575),
+  ('extended_limits -> EXTENDED_LIMITS NUMERIC NUMERIC','extended_limits',3,'p_extended_limits','parser.py',1580),
+  ('map_list -> begin MAP_LIST ident_list end MAP_LIST','map_list',5,'p_map_list','parser.py',1585),
+  ('max_refresh -> MAX_REFRESH NUMERIC NUMERIC','max_refresh',3,'p_max_refresh','parser.py',1590),
+  ('dependent_characteristic -> begin DEPENDENT_CHARACTERISTIC STRING ident_list end DEPENDENT_CHARACTERISTIC','dependent_characteristic',6,'p_dependent_characteristic','parser.py',1595),
+  ('virtual_characteristic -> begin VIRTUAL_CHARACTERISTIC STRING virtual_characteristic_optional end VIRTUAL_CHARACTERISTIC','virtual_characteristic',6,'p_virtual_characteristic','parser.py',1600),
+  ('virtual_characteristic_optional -> empty','virtual_characteristic_optional',1,'p_virtual_characteristic_optional','parser.py',1605),
+  ('virtual_characteristic_optional -> ident_list','virtual_characteristic_optional',1,'p_virtual_characteristic_optional','parser.py',1606),
+  ('ref_memory_segment -> REF_MEMORY_SEGMENT IDENT','ref_memory_segment',2,'p_ref_memory_segment','parser.py',1611),
+  ('annotation -> begin ANNOTATION annotation_optional_list_optional end ANNOTATION','annotation',5,'p_annotation','parser.py',1616),
+  ('annotation_optional -> annotation_label','annotation_optional',1,'p_annotation_optional','parser.py',1621),
+  ('annotation_optional -> annotation_origin','annotation_optional',1,'p_annotation_optional','parser.py',1622),
+  ('annotation_optional -> annotation_text','annotation_optional',1,'p_annotation_optional','parser.py',1623),
+  ('annotation_optional_list -> annotation_optional','annotation_optional_list',1,'p_annotation_optional_list','parser.py',1628),
+  ('annotation_optional_list -> annotation_optional_list annotation_optional','annotation_optional_list',2,'p_annotation_optional_list','parser.py',1629),
+  ('annotation_optional_list_optional -> empty','annotation_optional_list_optional',1,'p_annotation_optional_list_optional','parser.py',1638),
+  ('annotation_optional_list_optional -> annotation_optional_list','annotation_optional_list_optional',1,'p_annotation_optional_list_optional','parser.py',1639),
+  ('annotation_label -> ANNOTATION_LABEL STRING','annotation_label',2,'p_annotation_label','parser.py',1644),
+  ('annotation_origin -> ANNOTATION_ORIGIN STRING','annotation_origin',2,'p_annotation_origin','parser.py',1649),
+  ('annotation_text -> begin ANNOTATION_TEXT string_list end ANNOTATION_TEXT','annotation_text',5,'p_annotation_text','parser.py',1654),
+  ('comparison_quantity -> COMPARISON_QUANTITY IDENT','comparison_quantity',2,'p_comparison_quantity','parser.py',1659),
+  ('axis_descr -> begin AXIS_DESCR axis_descr_attribute IDENT IDENT NUMERIC NUMERIC NUMERIC axis_descr_optional_list_optional end AXIS_DESCR','axis_descr',11,'p_axis_descr','parser.py',1664),
+  ('axis_descr_optional -> read_only','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1669),
+  ('axis_descr_optional -> format','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1670),
+  ('axis_descr_optional -> annotation','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1671),
+  ('axis_descr_optional -> axis_pts_ref','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1672),
+  ('axis_descr_optional -> max_grad','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1673),
+  ('axis_descr_optional -> monotony','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1674),
+  ('axis_descr_optional -> byte_order','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1675),
+  ('axis_descr_optional -> extended_limits','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1676),
+  ('axis_descr_optional -> fix_axis_par','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1677),
+  ('axis_descr_optional -> fix_axis_par_dist','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1678),
+  ('axis_descr_optional -> fix_axis_par_list','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1679),
+  ('axis_descr_optional -> deposit','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1680),
+  ('axis_descr_optional -> curve_axis_ref','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1681),
+  ('axis_descr_optional_list -> axis_descr_optional','axis_descr_optional_list',1,'p_axis_descr_optional_list','parser.py',1686),
+  ('axis_descr_optional_list -> axis_descr_optional_list axis_descr_optional','axis_descr_optional_list',2,'p_axis_descr_optional_list','parser.py',1687),
+  ('axis_descr_optional_list_optional -> empty','axis_descr_optional_list_optional',1,'p_axis_descr_optional_list_optional','parser.py',1696),
+  ('axis_descr_optional_list_optional -> axis_descr_optional_list','axis_descr_optional_list_optional',1,'p_axis_descr_optional_list_optional','parser.py',1697),
+  ('axis_pts_ref -> AXIS_PTS_REF IDENT','axis_pts_ref',2,'p_axis_pts_ref','parser.py',1702),
+  ('max_grad -> MAX_GRAD NUMERIC','max_grad',2,'p_max_grad','parser.py',1707),
+  ('monotony -> MONOTONY monotony_type','monotony',2,'p_monotony','parser.py',1712),
+  ('monotony_type -> MON_INCREASE','monotony_type',1,'p_monotony_type','parser.py',1717),
+  ('monotony_type -> MON_DECREASE','monotony_type',1,'p_monotony_type','parser.py',1718),
+  ('monotony_type -> STRICT_INCREASE','monotony_type',1,'p_monotony_type','parser.py',1719),
+  ('monotony_type -> STRICT_DECREASE','monotony_type',1,'p_monotony_type','parser.py',1720),
+  ('fix_axis_par -> FIX_AXIS_PAR NUMERIC NUMERIC NUMERIC','fix_axis_par',4,'p_fix_axis_par','parser.py',1725),
+  ('fix_axis_par_dist -> FIX_AXIS_PAR_DIST NUMERIC NUMERIC NUMERIC','fix_axis_par_dist',4,'p_fix_axis_par_dist','parser.py',1730),
+  ('fix_axis_par_list -> begin FIX_AXIS_PAR_LIST number_list end FIX_AXIS_PAR_LIST','fix_axis_par_list',5,'p_fix_axis_par_list','parser.py',1735),
+  ('curve_axis_ref -> CURVE_AXIS_REF IDENT','curve_axis_ref',2,'p_curve_axis_ref','parser.py',1740),
+  ('axis_descr_attribute -> STD_AXIS','axis_descr_attribute',1,'p_axis_descr_attribute','parser.py',1745),
+  ('axis_descr_attribute -> FIX_AXIS','axis_descr_attribute',1,'p_axis_descr_attribute','parser.py',1746),
+  ('axis_descr_attribute -> COM_AXIS','axis_descr_attribute',1,'p_axis_descr_attribute','parser.py',1747),
+  ('axis_descr_attribute -> RES_AXIS','axis_descr_attribute',1,'p_axis_descr_attribute','parser.py',1748),
+  ('axis_descr_attribute -> CURVE_AXIS','axis_descr_attribute',1,'p_axis_descr_attribute','parser.py',1749),
+  ('calibration_access -> CALIBRATION_ACCESS calibration_access_type','calibration_access',2,'p_calibration_access','parser.py',1754),
+  ('calibration_access_type -> CALIBRATION','calibration_access_type',1,'p_calibration_access_type','parser.py',1759),
+  ('calibration_access_type -> NO_CALIBRATION','calibration_access_type',1,'p_calibration_access_type','parser.py',1760),
+  ('calibration_access_type -> NOT_IN_MCD_SYSTEM','calibration_access_type',1,'p_calibration_access_type','parser.py',1761),
+  ('calibration_access_type -> OFFLINE_CALIBRATION','calibration_access_type',1,'p_calibration_access_type','parser.py',1762),
+  ('matrix_dim -> MATRIX_DIM NUMERIC NUMERIC NUMERIC','matrix_dim',4,'p_matrix_dim','parser.py',1767),
+  ('ecu_address_extension -> ECU_ADDRESS_EXTENSION NUMERIC','ecu_address_extension',2,'p_ecu_address_extension','parser.py',1772),
+  ('characteristic_optional -> display_identifier','characteristic_optional',1,'p_characteristic_optional','parser.py',1777),
+  ('characteristic_optional -> format','characteristic_optional',1,'p_characteristic_optional','parser.py',1778),
+  ('characteristic_optional -> byte_order','characteristic_optional',1,'p_characteristic_optional','parser.py',1779),
+  ('characteristic_optional -> bit_mask','characteristic_optional',1,'p_characteristic_optional','parser.py',1780),
+  ('characteristic_optional -> function_list','characteristic_optional',1,'p_characteristic_optional','parser.py',1781),
+  ('characteristic_optional -> number','characteristic_optional',1,'p_characteristic_optional','parser.py',1782),
+  ('characteristic_optional -> extended_limits','characteristic_optional',1,'p_characteristic_optional','parser.py',1783),
+  ('characteristic_optional -> read_only','characteristic_optional',1,'p_characteristic_optional','parser.py',1784),
+  ('characteristic_optional -> guard_rails','characteristic_optional',1,'p_characteristic_optional','parser.py',1785),
+  ('characteristic_optional -> map_list','characteristic_optional',1,'p_characteristic_optional','parser.py',1786),
+  ('characteristic_optional -> max_refresh','characteristic_optional',1,'p_characteristic_optional','parser.py',1787),
+  ('characteristic_optional -> dependent_characteristic','characteristic_optional',1,'p_characteristic_optional','parser.py',1788),
+  ('characteristic_optional -> virtual_characteristic','characteristic_optional',1,'p_characteristic_optional','parser.py',1789),
+  ('characteristic_optional -> ref_memory_segment','characteristic_optional',1,'p_characteristic_optional','parser.py',1790),
+  ('characteristic_optional -> annotation','characteristic_optional',1,'p_characteristic_optional','parser.py',1791),
+  ('characteristic_optional -> comparison_quantity','characteristic_optional',1,'p_characteristic_optional','parser.py',1792),
+  ('characteristic_optional -> if_data_characteristic','characteristic_optional',1,'p_characteristic_optional','parser.py',1793),
+  ('characteristic_optional -> axis_descr','characteristic_optional',1,'p_characteristic_optional','parser.py',1794),
+  ('characteristic_optional -> calibration_access','characteristic_optional',1,'p_characteristic_optional','parser.py',1795),
+  ('characteristic_optional -> matrix_dim','characteristic_optional',1,'p_characteristic_optional','parser.py',1796),
+  ('characteristic_optional -> ecu_address_extension','characteristic_optional',1,'p_characteristic_optional','parser.py',1797),
+  ('characteristic_optional_list -> characteristic_optional','characteristic_optional_list',1,'p_characteristic_optional_list','parser.py',1802),
+  ('characteristic_optional_list -> characteristic_optional_list characteristic_optional','characteristic_optional_list',2,'p_characteristic_optional_list','parser.py',1803),
+  ('characteristic_optional_list_optional -> empty','characteristic_optional_list_optional',1,'p_characteristic_optional_list_optional','parser.py',1812),
+  ('characteristic_optional_list_optional -> characteristic_optional_list','characteristic_optional_list_optional',1,'p_characteristic_optional_list_optional','parser.py',1813),
+  ('if_data_characteristic -> if_data_memory_layout','if_data_characteristic',1,'p_if_data_characteristic','parser.py',1818),
+  ('axis_pts -> begin AXIS_PTS IDENT STRING NUMERIC IDENT IDENT NUMERIC IDENT NUMERIC NUMERIC NUMERIC axis_pts_optional_list_optional end AXIS_PTS','axis_pts',15,'p_axis_pts','parser.py',1822),
+  ('axis_pts_optional -> display_identifier','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1827),
+  ('axis_pts_optional -> read_only','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1828),
+  ('axis_pts_optional -> format','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1829),
+  ('axis_pts_optional -> deposit','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1830),
+  ('axis_pts_optional -> byte_order','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1831),
+  ('axis_pts_optional -> function_list','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1832),
+  ('axis_pts_optional -> ref_memory_segment','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1833),
+  ('axis_pts_optional -> guard_rails','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1834),
+  ('axis_pts_optional -> extended_limits','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1835),
+  ('axis_pts_optional -> annotation','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1836),
+  ('axis_pts_optional -> if_data_axis_pts','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1837),
+  ('axis_pts_optional -> calibration_access','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1838),
+  ('axis_pts_optional -> ecu_address_extension','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1839),
+  ('axis_pts_optional_list -> axis_pts_optional','axis_pts_optional_list',1,'p_axis_pts_optional_list','parser.py',1844),
+  ('axis_pts_optional_list -> axis_pts_optional_list axis_pts_optional','axis_pts_optional_list',2,'p_axis_pts_optional_list','parser.py',1845),
+  ('axis_pts_optional_list_optional -> empty','axis_pts_optional_list_optional',1,'p_axis_pts_optional_list_optional','parser.py',1854),
+  ('axis_pts_optional_list_optional -> axis_pts_optional_list','axis_pts_optional_list_optional',1,'p_axis_pts_optional_list_optional','parser.py',1855),
+  ('if_data_axis_pts -> if_data_memory_layout','if_data_axis_pts',1,'p_if_data_axis_pts','parser.py',1860),
+  ('deposit -> DEPOSIT deposit_mode','deposit',2,'p_deposit','parser.py',1865),
+  ('deposit_mode -> ABSOLUTE','deposit_mode',1,'p_deposit_mode','parser.py',1870),
+  ('deposit_mode -> DIFFERENCE','deposit_mode',1,'p_deposit_mode','parser.py',1871),
+  ('measurement -> begin MEASUREMENT IDENT STRING datatype IDENT NUMERIC NUMERIC NUMERIC NUMERIC measurement_optional_list_optional end MEASUREMENT','measurement',13,'p_measurement','parser.py',1876),
+  ('measurement_optional -> display_identifier','measurement_optional',1,'p_measurement_optional','parser.py',1881),
+  ('measurement_optional -> read_write','measurement_optional',1,'p_measurement_optional','parser.py',1882),
+  ('measurement_optional -> format','measurement_optional',1,'p_measurement_optional','parser.py',1883),
+  ('measurement_optional -> array_size','measurement_optional',1,'p_measurement_optional','parser.py',1884),
+  ('measurement_optional -> bit_mask','measurement_optional',1,'p_measurement_optional','parser.py',1885),
+  ('measurement_optional -> bit_operation','measurement_optional',1,'p_measurement_optional','parser.py',1886),
+  ('measurement_optional -> byte_order','measurement_optional',1,'p_measurement_optional','parser.py',1887),
+  ('measurement_optional -> max_refresh','measurement_optional',1,'p_measurement_optional','parser.py',1888),
+  ('measurement_optional -> virtual','measurement_optional',1,'p_measurement_optional','parser.py',1889),
+  ('measurement_optional -> function_list','measurement_optional',1,'p_measurement_optional','parser.py',1890),
+  ('measurement_optional -> ecu_address','measurement_optional',1,'p_measurement_optional','parser.py',1891),
+  ('measurement_optional -> error_mask','measurement_optional',1,'p_measurement_optional','parser.py',1892),
+  ('measurement_optional -> ref_memory_segment','measurement_optional',1,'p_measurement_optional','parser.py',1893),
+  ('measurement_optional -> annotation','measurement_optional',1,'p_measurement_optional','parser.py',1894),
+  ('measurement_optional -> if_data_xcp','measurement_optional',1,'p_measurement_optional','parser.py',1895),
+  ('measurement_optional -> if_data_measurement','measurement_optional',1,'p_measurement_optional','parser.py',1896),
+  ('measurement_optional -> matrix_dim','measurement_optional',1,'p_measurement_optional','parser.py',1897),
+  ('measurement_optional -> ecu_address_extension','measurement_optional',1,'p_measurement_optional','parser.py',1898),
+  ('measurement_optional_list -> measurement_optional','measurement_optional_list',1,'p_measurement_optional_list','parser.py',1903),
+  ('measurement_optional_list -> measurement_optional_list measurement_optional','measurement_optional_list',2,'p_measurement_optional_list','parser.py',1904),
+  ('measurement_optional_list_optional -> empty','measurement_optional_list_optional',1,'p_measurement_optional_list_optional','parser.py',1913),
+  ('measurement_optional_list_optional -> measurement_optional_list','measurement_optional_list_optional',1,'p_measurement_optional_list_optional','parser.py',1914),
+  ('read_write -> READ_WRITE','read_write',1,'p_read_write','parser.py',1919),
+  ('if_data_measurement -> begin IF_DATA IDENT if_data_measurement_optional_parameter_list_optional end IF_DATA','if_data_measurement',6,'p_if_data_measurement','parser.py',1924),
+  ('if_data_measurement_optional_parameter -> kp_blob kp_data','if_data_measurement_optional_parameter',2,'p_if_data_measurement_optional_parameter','parser.py',1929),
+  ('if_data_measurement_optional_parameter -> dp_blob dp_data','if_data_measurement_optional_parameter',2,'p_if_data_measurement_optional_parameter','parser.py',1930),
+  ('if_data_measurement_optional_parameter -> pa_blob pa_data','if_data_measurement_optional_parameter',2,'p_if_data_measurement_optional_parameter','parser.py',1931),
+  ('if_data_measurement_optional_parameter -> if_data_measurement_unsupported_element','if_data_measurement_optional_parameter',1,'p_if_data_measurement_optional_parameter','parser.py',1932),
+  ('if_data_measurement_unsupported_element -> begin IDENT generic_parameter_list end IDENT','if_data_measurement_unsupported_element',5,'p_if_data_measurement_unsupported_element','parser.py',1937),
+  ('if_data_measurement_optional_parameter_list -> if_data_measurement_optional_parameter','if_data_measurement_optional_parameter_list',1,'p_if_data_measurement_optional_parameter_list','parser.py',1942),
+  ('if_data_measurement_optional_parameter_list -> if_data_measurement_optional_parameter_list if_data_measurement_optional_parameter','if_data_measurement_optional_parameter_list',2,'p_if_data_measurement_optional_parameter_list','parser.py',1943),
+  ('if_data_measurement_optional_parameter_list_optional -> empty','if_data_measurement_optional_parameter_list_optional',1,'p_if_data_measurement_optional_parameter_list_optional','parser.py',1953),
+  ('if_data_measurement_optional_parameter_list_optional -> if_data_measurement_optional_parameter_list','if_data_measurement_optional_parameter_list_optional',1,'p_if_data_measurement_optional_parameter_list_optional','parser.py',1954),
+  ('kp_blob -> KP_BLOB','kp_blob',1,'p_kp_blob','parser.py',1959),
+  ('pa_blob -> PA_BLOB','pa_blob',1,'p_pa_blob','parser.py',1964),
+  ('kp_data -> kp_data_parameter_optional_list','kp_data',1,'p_kp_data','parser.py',1969),
+  ('kp_data_parameter_optional -> NUMERIC','kp_data_parameter_optional',1,'p_kp_data_parameter_optional','parser.py',1974),
+  ('kp_data_parameter_optional -> STRING','kp_data_parameter_optional',1,'p_kp_data_parameter_optional','parser.py',1975),
+  ('kp_data_parameter_optional -> IDENT','kp_data_parameter_optional',1,'p_kp_data_parameter_optional','parser.py',1976),
+  ('kp_data_parameter_optional_list -> kp_data_parameter_optional','kp_data_parameter_optional_list',1,'p_kp_data_parameter_optional_list','parser.py',1981),
+  ('kp_data_parameter_optional_list -> kp_data_parameter_optional_list kp_data_parameter_optional','kp_data_parameter_optional_list',2,'p_kp_data_parameter_optional_list','parser.py',1982),
+  ('array_size -> ARRAY_SIZE NUMERIC','array_size',2,'p_array_size','parser.py',1991),
+  ('bit_operation -> begin BIT_OPERATION bit_operation_optional_list_optional end BIT_OPERATION','bit_operation',5,'p_bit_operation','parser.py',1996),
+  ('bit_operation_optional -> left_shift','bit_operation_optional',1,'p_bit_operation_optional','parser.py',2001),
+  ('bit_operation_optional -> right_shift','bit_operation_optional',1,'p_bit_operation_optional','parser.py',2002),
+  ('bit_operation_optional -> sign_extend','bit_operation_optional',1,'p_bit_operation_optional','parser.py',2003),
+  ('bit_operation_optional_list -> bit_operation_optional','bit_operation_optional_list',1,'p_bit_operation_optional_list','parser.py',2008),
+  ('bit_operation_optional_list -> bit_operation_optional_list bit_operation_optional','bit_operation_optional_list',2,'p_bit_operation_optional_list','parser.py',2009),
+  ('bit_operation_optional_list_optional -> empty','bit_operation_optional_list_optional',1,'p_bit_operation_optional_list_optional','parser.py',2018),
+  ('bit_operation_optional_list_optional -> bit_operation_optional_list','bit_operation_optional_list_optional',1,'p_bit_operation_optional_list_optional','parser.py',2019),
+  ('left_shift -> LEFT_SHIFT NUMERIC','left_shift',2,'p_left_shift','parser.py',2024),
+  ('right_shift -> RIGHT_SHIFT NUMERIC','right_shift',2,'p_right_shift','parser.py',2029),
+  ('sign_extend -> SIGN_EXTEND','sign_extend',1,'p_sign_extend','parser.py',2034),
+  ('compu_method -> begin COMPU_METHOD IDENT STRING compu_method_conversion_type STRING STRING compu_method_optional_list_optional end COMPU_METHOD','compu_method',10,'p_compu_method','parser.py',2039),
+  ('compu_method_optional -> formula','compu_method_optional',1,'p_compu_method_optional','parser.py',2044),
+  ('compu_method_optional -> coeffs','compu_method_optional',1,'p_compu_method_optional','parser.py',2045),
+  ('compu_method_optional -> coeffs_linear','compu_method_optional',1,'p_compu_method_optional','parser.py',2046),
+  ('compu_method_optional -> compu_tab_ref','compu_method_optional',1,'p_compu_method_optional','parser.py',2047),
+  ('compu_method_optional -> ref_unit','compu_method_optional',1,'p_compu_method_optional','parser.py',2048),
+  ('compu_method_optional_list -> compu_method_optional','compu_method_optional_list',1,'p_compu_method_optional_list','parser.py',2053),
+  ('compu_method_optional_list -> compu_method_optional_list compu_method_optional','compu_method_optional_list',2,'p_compu_method_optional_list','parser.py',2054),
+  ('compu_method_optional_list_optional -> empty','compu_method_optional_list_optional',1,'p_compu_method_optional_list_optional','parser.py',2063),
+  ('compu_method_optional_list_optional -> compu_method_optional_list','compu_method_optional_list_optional',1,'p_compu_method_optional_list_optional','parser.py',2064),
+  ('compu_method_conversion_type -> TAB_INTP','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',2069),
+  ('compu_method_conversion_type -> TAB_NOINTP','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',2070),
+  ('compu_method_conversion_type -> TAB_VERB','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',2071),
+  ('compu_method_conversion_type -> RAT_FUNC','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',2072),
+  ('compu_method_conversion_type -> FORM','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',2073),
+  ('compu_method_conversion_type -> IDENTICAL','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',2074),
+  ('compu_method_conversion_type -> LINEAR','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',2075),
+  ('formula -> begin FORMULA STRING formula_optional_list_optional end FORMULA','formula',6,'p_formula','parser.py',2080),
+  ('formula_optional -> formula_inv','formula_optional',1,'p_formula_optional','parser.py',2085),
+  ('formula_optional_list -> formula_optional','formula_optional_list',1,'p_formula_optional_list','parser.py',2090),
+  ('formula_optional_list -> formula_optional_list formula_optional','formula_optional_list',2,'p_formula_optional_list','parser.py',2091),
+  ('formula_optional_list_optional -> empty','formula_optional_list_optional',1,'p_formula_optional_list_optional','parser.py',2100),
+  ('formula_optional_list_optional -> formula_optional_list','formula_optional_list_optional',1,'p_formula_optional_list_optional','parser.py',2101),
+  ('formula_inv -> FORMULA_INV STRING','formula_inv',2,'p_formula_inv','parser.py',2106),
+  ('coeffs -> COEFFS NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC','coeffs',7,'p_coeffs','parser.py',2111),
+  ('coeffs_linear -> COEFFS_LINEAR NUMERIC NUMERIC','coeffs_linear',3,'p_coeffs_linear','parser.py',2116),
+  ('compu_tab_ref -> COMPU_TAB_REF IDENT','compu_tab_ref',2,'p_compu_tab_ref','parser.py',2121),
+  ('ref_unit -> REF_UNIT IDENT','ref_unit',2,'p_ref_unit','parser.py',2126),
+  ('virtual -> begin VIRTUAL ident_list end VIRTUAL','virtual',5,'p_virtual','parser.py',2131),
+  ('ecu_address -> ECU_ADDRESS NUMERIC','ecu_address',2,'p_ecu_address','parser.py',2136),
+  ('error_mask -> ERROR_MASK NUMERIC','error_mask',2,'p_error_mask','parser.py',2141),
+  ('compu_tab -> begin COMPU_TAB IDENT STRING compu_tab_conversion_type NUMERIC compu_tab_optional_list_optional end COMPU_TAB','compu_tab',9,'p_compu_tab','parser.py',2146),
+  ('compu_tab_optional -> in_val_out_val','compu_tab_optional',1,'p_compu_tab_optional','parser.py',2151),
+  ('compu_tab_optional -> default_value','compu_tab_optional',1,'p_compu_tab_optional','parser.py',2152),
+  ('compu_tab_optional -> default_value_numeric','compu_tab_optional',1,'p_compu_tab_optional','parser.py',2153),
+  ('compu_tab_optional_list -> compu_tab_optional','compu_tab_optional_list',1,'p_compu_tabl_optional_list','parser.py',2158),
+  ('compu_tab_optional_list -> compu_tab_optional_list compu_tab_optional','compu_tab_optional_list',2,'p_compu_tabl_optional_list','parser.py',2159),
+  ('compu_tab_optional_list_optional -> empty','compu_tab_optional_list_optional',1,'p_compu_tab_optional_list_optional','parser.py',2168),
+  ('compu_tab_optional_list_optional -> compu_tab_optional_list','compu_tab_optional_list_optional',1,'p_compu_tab_optional_list_optional','parser.py',2169),
+  ('in_val_out_val -> number_list','in_val_out_val',1,'p_in_val_out_val','parser.py',2174),
+  ('compu_tab_conversion_type -> TAB_INTP','compu_tab_conversion_type',1,'p_compu_tab_conversion_type','parser.py',2179),
+  ('compu_tab_conversion_type -> TAB_NOINTP','compu_tab_conversion_type',1,'p_compu_tab_conversion_type','parser.py',2180),
+  ('default_value -> DEFAULT_VALUE STRING','default_value',2,'p_default_value','parser.py',2185),
+  ('default_value_numeric -> DEFAULT_VALUE_NUMERIC NUMERIC','default_value_numeric',2,'p_default_value_numeric','parser.py',2190),
+  ('compu_vtab -> begin COMPU_VTAB IDENT STRING compu_vtab_conversion_type NUMERIC compu_vtab_optional_list_optional end COMPU_VTAB','compu_vtab',9,'p_compu_vtab','parser.py',2195),
+  ('compu_vtab_optional -> default_value','compu_vtab_optional',1,'p_compu_vtab_optional','parser.py',2200),
+  ('compu_vtab_optional -> compu_vtab_in_val_out_val','compu_vtab_optional',1,'p_compu_vtab_optional','parser.py',2201),
+  ('compu_vtab_optional_list -> compu_vtab_optional','compu_vtab_optional_list',1,'p_compu_vtab_optional_list','parser.py',2206),
+  ('compu_vtab_optional_list -> compu_vtab_optional_list compu_vtab_optional','compu_vtab_optional_list',2,'p_compu_vtab_optional_list','parser.py',2207),
+  ('compu_vtab_optional_list_optional -> empty','compu_vtab_optional_list_optional',1,'p_compu_vtab_optional_list_optional','parser.py',2216),
+  ('compu_vtab_optional_list_optional -> compu_vtab_optional_list','compu_vtab_optional_list_optional',1,'p_compu_vtab_optional_list_optional','parser.py',2217),
+  ('compu_vtab_in_val_out_val -> number_string_value_list','compu_vtab_in_val_out_val',1,'p_compu_vtab_in_val_out_val','parser.py',2222),
+  ('compu_vtab_conversion_type -> TAB_VERB','compu_vtab_conversion_type',1,'p_compu_vtab_conversion_type','parser.py',2227),
+  ('number_string_value_list -> number_string_value','number_string_value_list',1,'p_number_string_value_list','parser.py',2232),
+  ('number_string_value_list -> number_string_value_list number_string_value','number_string_value_list',2,'p_number_string_value_list','parser.py',2233),
+  ('number_string_value -> NUMERIC STRING','number_string_value',2,'p_number_string_value','parser.py',2242),
+  ('compu_vtab_range -> begin COMPU_VTAB_RANGE IDENT STRING NUMERIC compu_vtab_range_optional_list_optional end COMPU_VTAB_RANGE','compu_vtab_range',8,'p_compu_vtab_range','parser.py',2247),
+  ('compu_vtab_range_optional -> default_value','compu_vtab_range_optional',1,'p_compu_vtab_range_optional','parser.py',2252),
+  ('compu_vtab_range_optional -> compu_vtab_range_in_val_out_val','compu_vtab_range_optional',1,'p_compu_vtab_range_optional','parser.py',2253),
+  ('compu_vtab_range_optional_list -> compu_vtab_range_optional','compu_vtab_range_optional_list',1,'p_compu_vtab_range_optional_list','parser.py',2258),
+  ('compu_vtab_range_optional_list -> compu_vtab_range_optional_list compu_vtab_range_optional','compu_vtab_range_optional_list',2,'p_compu_vtab_range_optional_list','parser.py',2259),
+  ('compu_vtab_range_optional_list_optional -> empty','compu_vtab_range_optional_list_optional',1,'p_compu_vtab_range_optional_list_optional','parser.py',2268),
+  ('compu_vtab_range_optional_list_optional -> compu_vtab_range_optional_list','compu_vtab_range_optional_list_optional',1,'p_compu_vtab_range_optional_list_optional','parser.py',2269),
+  ('compu_vtab_range_in_val_out_val -> number_number_string_value_list','compu_vtab_range_in_val_out_val',1,'p_compu_vtab_range_in_val_out_val','parser.py',2274),
+  ('number_number_string_value_list -> number_number_string_value','number_number_string_value_list',1,'p_number_number_string_value_list','parser.py',2279),
+  ('number_number_string_value_list -> number_number_string_value_list number_number_string_value','number_number_string_value_list',2,'p_number_number_string_value_list','parser.py',2280),
+  ('number_number_string_value -> NUMERIC NUMERIC STRING','number_number_string_value',3,'p_number_number_string_value','parser.py',2289),
+  ('function -> begin FUNCTION IDENT STRING function_optional_list_optional end FUNCTION','function',7,'p_function','parser.py',2294),
+  ('function_optional -> annotation','function_optional',1,'p_function_optional','parser.py',2299),
+  ('function_optional -> def_characteristic','function_optional',1,'p_function_optional','parser.py',2300),
+  ('function_optional -> ref_characteristic','function_optional',1,'p_function_optional','parser.py',2301),
+  ('function_optional -> in_measurement','function_optional',1,'p_function_optional','parser.py',2302),
+  ('function_optional -> out_measurement','function_optional',1,'p_function_optional','parser.py',2303),
+  ('function_optional -> loc_measurement','function_optional',1,'p_function_optional','parser.py',2304),
+  ('function_optional -> sub_function','function_optional',1,'p_function_optional','parser.py',2305),
+  ('function_optional -> function_version','function_optional',1,'p_function_optional','parser.py',2306),
+  ('function_optional_list -> function_optional','function_optional_list',1,'p_function_optional_list','parser.py',2311),
+  ('function_optional_list -> function_optional_list function_optional','function_optional_list',2,'p_function_optional_list','parser.py',2312),
+  ('function_optional_list_optional -> empty','function_optional_list_optional',1,'p_function_optional_list_optional','parser.py',2321),
+  ('function_optional_list_optional -> function_optional_list','function_optional_list_optional',1,'p_function_optional_list_optional','parser.py',2322),
+  ('def_characteristic -> begin DEF_CHARACTERISTIC def_characteristic_optional_list_optional end DEF_CHARACTERISTIC','def_characteristic',5,'p_def_characteristic','parser.py',2327),
+  ('def_characteristic_optional -> identifier','def_characteristic_optional',1,'p_def_characteristic_optional','parser.py',2332),
+  ('def_characteristic_optional_list -> def_characteristic_optional','def_characteristic_optional_list',1,'p_def_characteristic_optional_list','parser.py',2337),
+  ('def_characteristic_optional_list -> def_characteristic_optional_list def_characteristic_optional','def_characteristic_optional_list',2,'p_def_characteristic_optional_list','parser.py',2338),
+  ('def_characteristic_optional_list_optional -> empty','def_characteristic_optional_list_optional',1,'p_def_characteristic_optional_list_optional','parser.py',2347),
+  ('def_characteristic_optional_list_optional -> def_characteristic_optional_list','def_characteristic_optional_list_optional',1,'p_def_characteristic_optional_list_optional','parser.py',2348),
+  ('identifier -> IDENT','identifier',1,'p_identifier','parser.py',2353),
+  ('ref_characteristic -> begin REF_CHARACTERISTIC ref_characteristic_optional_list_optional end REF_CHARACTERISTIC','ref_characteristic',5,'p_ref_characteristic','parser.py',2358),
+  ('ref_characteristic_optional -> identifier','ref_characteristic_optional',1,'p_ref_characteristic_optional','parser.py',2363),
+  ('ref_characteristic_optional_list -> ref_characteristic_optional','ref_characteristic_optional_list',1,'p_ref_characteristic_optional_list','parser.py',2368),
+  ('ref_characteristic_optional_list -> ref_characteristic_optional_list ref_characteristic_optional','ref_characteristic_optional_list',2,'p_ref_characteristic_optional_list','parser.py',2369),
+  ('ref_characteristic_optional_list_optional -> empty','ref_characteristic_optional_list_optional',1,'p_ref_characteristic_optional_list_optional','parser.py',2378),
+  ('ref_characteristic_optional_list_optional -> ref_characteristic_optional_list','ref_characteristic_optional_list_optional',1,'p_ref_characteristic_optional_list_optional','parser.py',2379),
+  ('in_measurement -> begin IN_MEASUREMENT in_measurement_optional_list_optional end IN_MEASUREMENT','in_measurement',5,'p_in_measurement','parser.py',2384),
+  ('in_measurement_optional -> identifier','in_measurement_optional',1,'p_in_measurement_optional','parser.py',2389),
+  ('in_measurement_optional_list -> in_measurement_optional','in_measurement_optional_list',1,'p_in_measurement_optional_list','parser.py',2394),
+  ('in_measurement_optional_list -> in_measurement_optional_list in_measurement_optional','in_measurement_optional_list',2,'p_in_measurement_optional_list','parser.py',2395),
+  ('in_measurement_optional_list_optional -> empty','in_measurement_optional_list_optional',1,'p_in_measurment_optional_list_optional','parser.py',2404),
+  ('in_measurement_optional_list_optional -> in_measurement_optional_list','in_measurement_optional_list_optional',1,'p_in_measurment_optional_list_optional','parser.py',2405),
+  ('out_measurement -> begin OUT_MEASUREMENT out_measurement_optional_list_optional end OUT_MEASUREMENT','out_measurement',5,'p_out_measurement','parser.py',2410),
+  ('out_measurement_optional -> identifier','out_measurement_optional',1,'p_out_measurement_optional','parser.py',2415),
+  ('out_measurement_optional_list -> out_measurement_optional','out_measurement_optional_list',1,'p_out_measurement_optional_list','parser.py',2420),
+  ('out_measurement_optional_list -> out_measurement_optional_list out_measurement_optional','out_measurement_optional_list',2,'p_out_measurement_optional_list','parser.py',2421),
+  ('out_measurement_optional_list_optional -> empty','out_measurement_optional_list_optional',1,'p_out_measurment_optional_list_optional','parser.py',2430),
+  ('out_measurement_optional_list_optional -> out_measurement_optional_list','out_measurement_optional_list_optional',1,'p_out_measurment_optional_list_optional','parser.py',2431),
+  ('loc_measurement -> begin LOC_MEASUREMENT loc_measurement_optional_list_optional end LOC_MEASUREMENT','loc_measurement',5,'p_loc_measurement','parser.py',2436),
+  ('loc_measurement_optional -> identifier','loc_measurement_optional',1,'p_loc_measurement_optional','parser.py',2441),
+  ('loc_measurement_optional_list -> loc_measurement_optional','loc_measurement_optional_list',1,'p_loc_measurement_optional_list','parser.py',2446),
+  ('loc_measurement_optional_list -> loc_measurement_optional_list loc_measurement_optional','loc_measurement_optional_list',2,'p_loc_measurement_optional_list','parser.py',2447),
+  ('loc_measurement_optional_list_optional -> empty','loc_measurement_optional_list_optional',1,'p_loc_measurment_optional_list_optional','parser.py',2456),
+  ('loc_measurement_optional_list_optional -> loc_measurement_optional_list','loc_measurement_optional_list_optional',1,'p_loc_measurment_optional_list_optional','parser.py',2457),
+  ('sub_function -> begin SUB_FUNCTION sub_function_optional_list_optional end SUB_FUNCTION','sub_function',5,'p_sub_function','parser.py',2462),
+  ('sub_function_optional -> identifier','sub_function_optional',1,'p_sub_function_optional','parser.py',2467),
+  ('sub_function_optional_list -> sub_function_optional','sub_function_optional_list',1,'p_sub_function_optional_list','parser.py',2472),
+  ('sub_function_optional_list -> sub_function_optional_list sub_function_optional','sub_function_optional_list',2,'p_sub_function_optional_list','parser.py',2473),
+  ('sub_function_optional_list_optional -> empty','sub_function_optional_list_optional',1,'p_sub_function_optional_list_optional','parser.py',2482),
+  ('sub_function_optional_list_optional -> sub_function_optional_list','sub_function_optional_list_optional',1,'p_sub_function_optional_list_optional','parser.py',2483),
+  ('function_version -> FUNCTION_VERSION STRING','function_version',2,'p_function_version','parser.py',2488),
+  ('group -> begin GROUP IDENT STRING group_optional_list_optional end GROUP','group',7,'p_group','parser.py',2493),
+  ('group_optional -> annotation','group_optional',1,'p_group_optional','parser.py',2498),
+  ('group_optional -> root','group_optional',1,'p_group_optional','parser.py',2499),
+  ('group_optional -> ref_characteristic','group_optional',1,'p_group_optional','parser.py',2500),
+  ('group_optional -> ref_measurement','group_optional',1,'p_group_optional','parser.py',2501),
+  ('group_optional -> function_list','group_optional',1,'p_group_optional','parser.py',2502),
+  ('group_optional -> sub_group','group_optional',1,'p_group_optional','parser.py',2503),
+  ('group_optional_list -> group_optional','group_optional_list',1,'p_group_optional_list','parser.py',2508),
+  ('group_optional_list -> group_optional_list group_optional','group_optional_list',2,'p_group_optional_list','parser.py',2509),
+  ('group_optional_list_optional -> empty','group_optional_list_optional',1,'p_group_optional_list_optional','parser.py',2518),
+  ('group_optional_list_optional -> group_optional_list','group_optional_list_optional',1,'p_group_optional_list_optional','parser.py',2519),
+  ('root -> ROOT','root',1,'p_root','parser.py',2524),
+  ('ref_measurement -> begin REF_MEASUREMENT ref_measurement_optional_list_optional end REF_MEASUREMENT','ref_measurement',5,'p_ref_measurement','parser.py',2529),
+  ('ref_measurement_optional -> identifier','ref_measurement_optional',1,'p_ref_measurement_optional','parser.py',2534),
+  ('ref_measurement_optional_list -> ref_measurement_optional','ref_measurement_optional_list',1,'p_ref_measurement_optional_list','parser.py',2539),
+  ('ref_measurement_optional_list -> ref_measurement_optional_list ref_measurement_optional','ref_measurement_optional_list',2,'p_ref_measurement_optional_list','parser.py',2540),
+  ('ref_measurement_optional_list_optional -> empty','ref_measurement_optional_list_optional',1,'p_ref_measurement_optional_list_optional','parser.py',2549),
+  ('ref_measurement_optional_list_optional -> ref_measurement_optional_list','ref_measurement_optional_list_optional',1,'p_ref_measurement_optional_list_optional','parser.py',2550),
+  ('sub_group -> begin SUB_GROUP sub_group_optional_list_optional end SUB_GROUP','sub_group',5,'p_sub_group','parser.py',2555),
+  ('sub_group_optional -> identifier','sub_group_optional',1,'p_sub_group_optional','parser.py',2560),
+  ('sub_group_optional_list -> sub_group_optional','sub_group_optional_list',1,'p_sub_group_optional_list','parser.py',2565),
+  ('sub_group_optional_list -> sub_group_optional_list sub_group_optional','sub_group_optional_list',2,'p_sub_group_optional_list','parser.py',2566),
+  ('sub_group_optional_list_optional -> empty','sub_group_optional_list_optional',1,'p_sub_group_optional_list_optional','parser.py',2575),
+  ('sub_group_optional_list_optional -> sub_group_optional_list','sub_group_optional_list_optional',1,'p_sub_group_optional_list_optional','parser.py',2576),
+  ('record_layout -> begin RECORD_LAYOUT IDENT record_layout_optional_list_optional end RECORD_LAYOUT','record_layout',6,'p_record_layout','parser.py',2581),
+  ('record_layout_optional -> fnc_values','record_layout_optional',1,'p_record_layout_optional','parser.py',2586),
+  ('record_layout_optional -> identification','record_layout_optional',1,'p_record_layout_optional','parser.py',2587),
+  ('record_layout_optional -> axis_pts_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2588),
+  ('record_layout_optional -> axis_pts_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2589),
+  ('record_layout_optional -> axis_pts_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2590),
+  ('record_layout_optional -> axis_rescale_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2591),
+  ('record_layout_optional -> axis_rescale_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2592),
+  ('record_layout_optional -> axis_rescale_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2593),
+  ('record_layout_optional -> no_axis_pts_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2594),
+  ('record_layout_optional -> no_axis_pts_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2595),
+  ('record_layout_optional -> no_axis_pts_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2596),
+  ('record_layout_optional -> no_rescale_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2597),
+  ('record_layout_optional -> no_rescale_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2598),
+  ('record_layout_optional -> no_rescale_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2599),
+  ('record_layout_optional -> fix_no_axis_pts_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2600),
+  ('record_layout_optional -> fix_no_axis_pts_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2601),
+  ('record_layout_optional -> fix_no_axis_pts_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2602),
+  ('record_layout_optional -> src_addr_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2603),
+  ('record_layout_optional -> src_addr_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2604),
+  ('record_layout_optional -> src_addr_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2605),
+  ('record_layout_optional -> rip_addr_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2606),
+  ('record_layout_optional -> rip_addr_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2607),
+  ('record_layout_optional -> rip_addr_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2608),
+  ('record_layout_optional -> rip_addr_w','record_layout_optional',1,'p_record_layout_optional','parser.py',2609),
+  ('record_layout_optional -> shift_op_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2610),
+  ('record_layout_optional -> shift_op_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2611),
+  ('record_layout_optional -> shift_op_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2612),
+  ('record_layout_optional -> offset_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2613),
+  ('record_layout_optional -> offset_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2614),
+  ('record_layout_optional -> offset_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2615),
+  ('record_layout_optional -> dist_op_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2616),
+  ('record_layout_optional -> dist_op_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2617),
+  ('record_layout_optional -> dist_op_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2618),
+  ('record_layout_optional -> alignment_byte','record_layout_optional',1,'p_record_layout_optional','parser.py',2619),
+  ('record_layout_optional -> alignment_word','record_layout_optional',1,'p_record_layout_optional','parser.py',2620),
+  ('record_layout_optional -> alignment_long','record_layout_optional',1,'p_record_layout_optional','parser.py',2621),
+  ('record_layout_optional -> alignment_float32_ieee','record_layout_optional',1,'p_record_layout_optional','parser.py',2622),
+  ('record_layout_optional -> alignment_float64_ieee','record_layout_optional',1,'p_record_layout_optional','parser.py',2623),
+  ('record_layout_optional -> reserved','record_layout_optional',1,'p_record_layout_optional','parser.py',2624),
+  ('record_layout_optional_list -> record_layout_optional','record_layout_optional_list',1,'p_record_layout_optional_list','parser.py',2629),
+  ('record_layout_optional_list -> record_layout_optional_list record_layout_optional','record_layout_optional_list',2,'p_record_layout_optional_list','parser.py',2630),
+  ('record_layout_optional_list_optional -> empty','record_layout_optional_list_optional',1,'p_record_layout_optional_list_optional','parser.py',2639),
+  ('record_layout_optional_list_optional -> record_layout_optional_list','record_layout_optional_list_optional',1,'p_record_layout_optional_list_optional','parser.py',2640),
+  ('fnc_values -> FNC_VALUES NUMERIC datatype fnc_values_index_mode addrtype','fnc_values',5,'p_fnc_values','parser.py',2645),
+  ('fnc_values_index_mode -> COLUMN_DIR','fnc_values_index_mode',1,'p_fnc_values_index_mode','parser.py',2650),
+  ('fnc_values_index_mode -> ROW_DIR','fnc_values_index_mode',1,'p_fnc_values_index_mode','parser.py',2651),
+  ('fnc_values_index_mode -> ALTERNATE_WITH_X','fnc_values_index_mode',1,'p_fnc_values_index_mode','parser.py',2652),
+  ('fnc_values_index_mode -> ALTERNATE_WITH_Y','fnc_values_index_mode',1,'p_fnc_values_index_mode','parser.py',2653),
+  ('fnc_values_index_mode -> ALTERNATE_CURVES','fnc_values_index_mode',1,'p_fnc_values_index_mode','parser.py',2654),
+  ('identification -> IDENTIFICATION NUMERIC datatype','identification',3,'p_identification','parser.py',2659),
+  ('axis_pts_x -> AXIS_PTS_X NUMERIC datatype indexorder addrtype','axis_pts_x',5,'p_axis_pts_x','parser.py',2664),
+  ('axis_pts_y -> AXIS_PTS_Y NUMERIC datatype indexorder addrtype','axis_pts_y',5,'p_axis_pts_y','parser.py',2669),
+  ('axis_pts_z -> AXIS_PTS_Z NUMERIC datatype indexorder addrtype','axis_pts_z',5,'p_axis_pts_z','parser.py',2674),
+  ('axis_rescale_x -> AXIS_RESCALE_X NUMERIC datatype NUMERIC indexorder addrtype','axis_rescale_x',6,'p_axis_rescale_x','parser.py',2679),
+  ('axis_rescale_y -> AXIS_RESCALE_Y NUMERIC datatype NUMERIC indexorder addrtype','axis_rescale_y',6,'p_axis_rescale_y','parser.py',2684),
+  ('axis_rescale_z -> AXIS_RESCALE_Z NUMERIC datatype NUMERIC indexorder addrtype','axis_rescale_z',6,'p_axis_rescale_z','parser.py',2689),
+  ('no_axis_pts_x -> NO_AXIS_PTS_X NUMERIC datatype','no_axis_pts_x',3,'p_no_axis_pts_x','parser.py',2694),
+  ('no_axis_pts_y -> NO_AXIS_PTS_Y NUMERIC datatype','no_axis_pts_y',3,'p_no_axis_pts_y','parser.py',2699),
+  ('no_axis_pts_z -> NO_AXIS_PTS_Z NUMERIC datatype','no_axis_pts_z',3,'p_no_axis_pts_z','parser.py',2704),
+  ('no_rescale_x -> NO_RESCALE_X NUMERIC datatype','no_rescale_x',3,'p_no_rescale_x','parser.py',2709),
+  ('no_rescale_y -> NO_RESCALE_Y NUMERIC datatype','no_rescale_y',3,'p_no_rescale_y','parser.py',2714),
+  ('no_rescale_z -> NO_RESCALE_Z NUMERIC datatype','no_rescale_z',3,'p_no_rescale_z','parser.py',2719),
+  ('fix_no_axis_pts_x -> FIX_NO_AXIS_PTS_X NUMERIC','fix_no_axis_pts_x',2,'p_fix_no_axis_pts_x','parser.py',2724),
+  ('fix_no_axis_pts_y -> FIX_NO_AXIS_PTS_Y NUMERIC','fix_no_axis_pts_y',2,'p_fix_no_axis_pts_y','parser.py',2729),
+  ('fix_no_axis_pts_z -> FIX_NO_AXIS_PTS_Z NUMERIC','fix_no_axis_pts_z',2,'p_fix_no_axis_pts_z','parser.py',2734),
+  ('src_addr_x -> SRC_ADDR_X NUMERIC datatype','src_addr_x',3,'p_src_addr_x','parser.py',2739),
+  ('src_addr_y -> SRC_ADDR_Y NUMERIC datatype','src_addr_y',3,'p_src_addr_y','parser.py',2744),
+  ('src_addr_z -> SRC_ADDR_Z NUMERIC datatype','src_addr_z',3,'p_src_addr_z','parser.py',2749),
+  ('rip_addr_x -> RIP_ADDR_X NUMERIC datatype','rip_addr_x',3,'p_rip_addr_x','parser.py',2754),
+  ('rip_addr_y -> RIP_ADDR_Y NUMERIC datatype','rip_addr_y',3,'p_rip_addr_y','parser.py',2759),
+  ('rip_addr_z -> RIP_ADDR_Z NUMERIC datatype','rip_addr_z',3,'p_rip_addr_z','parser.py',2764),
+  ('rip_addr_w -> RIP_ADDR_W NUMERIC datatype','rip_addr_w',3,'p_rip_addr_w','parser.py',2769),
+  ('shift_op_x -> SHIFT_OP_X NUMERIC datatype','shift_op_x',3,'p_shift_op_x','parser.py',2774),
+  ('shift_op_y -> SHIFT_OP_Y NUMERIC datatype','shift_op_y',3,'p_shift_op_y','parser.py',2779),
+  ('shift_op_z -> SHIFT_OP_Z NUMERIC datatype','shift_op_z',3,'p_shift_op_z','parser.py',2784),
+  ('offset_x -> OFFSET_X NUMERIC datatype','offset_x',3,'p_offset_x','parser.py',2789),
+  ('offset_y -> OFFSET_Y NUMERIC datatype','offset_y',3,'p_offset_y','parser.py',2794),
+  ('offset_z -> OFFSET_Z NUMERIC datatype','offset_z',3,'p_offset_z','parser.py',2799),
+  ('dist_op_x -> DIST_OP_X NUMERIC datatype','dist_op_x',3,'p_dist_op_x','parser.py',2804),
+  ('dist_op_y -> DIST_OP_Y NUMERIC datatype','dist_op_y',3,'p_dist_op_y','parser.py',2809),
+  ('dist_op_z -> DIST_OP_Z NUMERIC datatype','dist_op_z',3,'p_dist_op_z','parser.py',2814),
+  ('alignment_byte -> ALIGNMENT_BYTE NUMERIC','alignment_byte',2,'p_alignment_byte','parser.py',2819),
+  ('alignment_word -> ALIGNMENT_WORD NUMERIC','alignment_word',2,'p_alignment_word','parser.py',2824),
+  ('alignment_long -> ALIGNMENT_LONG NUMERIC','alignment_long',2,'p_alignment_long','parser.py',2829),
+  ('alignment_float32_ieee -> ALIGNMENT_FLOAT32_IEEE NUMERIC','alignment_float32_ieee',2,'p_alignment_float32_ieee','parser.py',2834),
+  ('alignment_float64_ieee -> ALIGNMENT_FLOAT64_IEEE NUMERIC','alignment_float64_ieee',2,'p_alignment_float64_ieee','parser.py',2839),
+  ('variant_coding -> begin VARIANT_CODING variant_coding_optional_list_optional end VARIANT_CODING','variant_coding',5,'p_variant_coding','parser.py',2844),
+  ('variant_coding_optional -> var_separator','variant_coding_optional',1,'p_variant_coding_optional','parser.py',2849),
+  ('variant_coding_optional -> var_naming','variant_coding_optional',1,'p_variant_coding_optional','parser.py',2850),
+  ('variant_coding_optional -> var_criterion','variant_coding_optional',1,'p_variant_coding_optional','parser.py',2851),
+  ('variant_coding_optional -> var_forbidden_comb','variant_coding_optional',1,'p_variant_coding_optional','parser.py',2852),
+  ('variant_coding_optional -> var_characteristic','variant_coding_optional',1,'p_variant_coding_optional','parser.py',2853),
+  ('variant_coding_optional_list -> variant_coding_optional','variant_coding_optional_list',1,'p_variant_coding_optional_list','parser.py',2858),
+  ('variant_coding_optional_list -> variant_coding_optional_list variant_coding_optional','variant_coding_optional_list',2,'p_variant_coding_optional_list','parser.py',2859),
+  ('variant_coding_optional_list_optional -> empty','variant_coding_optional_list_optional',1,'p_variant_coding_optional_list_optional','parser.py',2868),
+  ('variant_coding_optional_list_optional -> variant_coding_optional_list','variant_coding_optional_list_optional',1,'p_variant_coding_optional_list_optional','parser.py',2869),
+  ('var_separator -> VAR_SEPARATOR STRING','var_separator',2,'p_var_separator','parser.py',2874),
+  ('var_naming -> VAR_NAMING IDENT','var_naming',2,'p_var_naming','parser.py',2879),
+  ('var_criterion -> begin VAR_CRITERION IDENT STRING ident_list var_criterion_optional_list_optional end VAR_CRITERION','var_criterion',8,'p_var_criterion','parser.py',2884),
+  ('var_characteristic -> begin VAR_CHARACTERISTIC IDENT ident_list var_characteristic_optional_optional end VAR_CHARACTERISTIC','var_characteristic',7,'p_var_characteristic','parser.py',2889),
+  ('var_characteristic_optional -> var_address','var_characteristic_optional',1,'p_var_characteristic_optional','parser.py',2894),
+  ('var_characteristic_optional_optional -> empty','var_characteristic_optional_optional',1,'p_var_characteristic_optional_optional','parser.py',2899),
+  ('var_characteristic_optional_optional -> var_characteristic_optional','var_characteristic_optional_optional',1,'p_var_characteristic_optional_optional','parser.py',2900),
+  ('var_address -> begin VAR_ADDRESS number_list end VAR_ADDRESS','var_address',5,'p_var_address','parser.py',2905),
+  ('var_forbidden_comb -> begin VAR_FORBIDDEN_COMB var_forbidden_comb_criterion_list end VAR_FORBIDDEN_COMB','var_forbidden_comb',5,'p_var_forbidden_comb','parser.py',2910),
+  ('var_forbidden_comb_criterion_list -> var_forbidden_comb_criterion_optional','var_forbidden_comb_criterion_list',1,'p_var_forbidden_comb_criterion_list','parser.py',2915),
+  ('var_forbidden_comb_criterion_list -> var_forbidden_comb_criterion_optional var_forbidden_comb_criterion_optional_list','var_forbidden_comb_criterion_list',2,'p_var_forbidden_comb_criterion_list','parser.py',2916),
+  ('var_forbidden_comb_criterion_optional -> IDENT IDENT','var_forbidden_comb_criterion_optional',2,'p_var_forbidden_comb_criterion_optional','parser.py',2923),
+  ('var_forbidden_comb_criterion_optional_list -> var_forbidden_comb_criterion_optional','var_forbidden_comb_criterion_optional_list',1,'p_var_forbidden_comb_criterion_optional_list','parser.py',2928),
+  ('var_forbidden_comb_criterion_optional_list -> var_forbidden_comb_criterion_optional_list var_forbidden_comb_criterion_optional','var_forbidden_comb_criterion_optional_list',2,'p_var_forbidden_comb_criterion_optional_list','parser.py',2929),
+  ('var_criterion_optional -> var_measurement','var_criterion_optional',1,'p_var_criterion_optional','parser.py',2936),
+  ('var_criterion_optional -> var_selection_characteristic','var_criterion_optional',1,'p_var_criterion_optional','parser.py',2937),
+  ('var_criterion_optional_list -> var_criterion_optional','var_criterion_optional_list',1,'p_var_criterion_optional_list','parser.py',2942),
+  ('var_criterion_optional_list -> var_criterion_optional_list var_criterion_optional','var_criterion_optional_list',2,'p_var_criterion_optional_list','parser.py',2943),
+  ('var_criterion_optional_list_optional -> empty','var_criterion_optional_list_optional',1,'p_var_criterion_optional_list_optional','parser.py',2952),
+  ('var_criterion_optional_list_optional -> var_criterion_optional_list','var_criterion_optional_list_optional',1,'p_var_criterion_optional_list_optional','parser.py',2953),
+  ('var_measurement -> VAR_MEASUREMENT IDENT','var_measurement',2,'p_var_measurement','parser.py',2958),
+  ('var_selection_characteristic -> VAR_SELECTION_CHARACTERISTIC IDENT','var_selection_characteristic',2,'p_var_selection_characteristic','parser.py',2963),
+  ('reserved -> RESERVED NUMERIC datasize','reserved',3,'p_reserved','parser.py',2968),
+  ('frame -> begin FRAME IDENT STRING NUMERIC NUMERIC frame_optional_list_optional end FRAME','frame',9,'p_frame','parser.py',2973),
+  ('frame_optional -> frame_measurement','frame_optional',1,'p_frame_optional','parser.py',2978),
+  ('frame_optional -> if_data_frame','frame_optional',1,'p_frame_optional','parser.py',2979),
+  ('frame_optional_list -> frame_optional','frame_optional_list',1,'p_frame_optional_list','parser.py',2984),
+  ('frame_optional_list -> frame_optional_list frame_optional','frame_optional_list',2,'p_frame_optional_list','parser.py',2985),
+  ('frame_optional_list_optional -> empty','frame_optional_list_optional',1,'p_frame_optional_list_optional','parser.py',2994),
+  ('frame_optional_list_optional -> frame_optional_list','frame_optional_list_optional',1,'p_frame_optional_list_optional','parser.py',2995),
+  ('if_data_frame -> begin IF_DATA IDENT if_data_frame_optional_list_optional end IF_DATA','if_data_frame',6,'p_if_data_frame','parser.py',3000),
+  ('if_data_frame_optional -> QP_BLOB qp_data','if_data_frame_optional',2,'p_if_data_frame_optional','parser.py',3005),
+  ('if_data_frame_optional_list -> if_data_frame_optional','if_data_frame_optional_list',1,'p_if_data_frame_parameter_optional_list','parser.py',3010),
+  ('if_data_frame_optional_list -> if_data_frame_optional_list if_data_frame_optional','if_data_frame_optional_list',2,'p_if_data_frame_parameter_optional_list','parser.py',3011),
+  ('if_data_frame_optional_list_optional -> empty','if_data_frame_optional_list_optional',1,'p_if_data_frame_optional_list_optional','parser.py',3021),
+  ('if_data_frame_optional_list_optional -> if_data_frame_optional_list','if_data_frame_optional_list_optional',1,'p_if_data_frame_optional_list_optional','parser.py',3022),
+  ('qp_data -> generic_parameter','qp_data',1,'p_qp_data','parser.py',3027),
+  ('frame_measurement -> FRAME_MEASUREMENT ident_list','frame_measurement',2,'p_frame_measurement','parser.py',3032),
+  ('user_rights -> begin USER_RIGHTS IDENT user_rights_optional_list_optional end USER_RIGHTS','user_rights',6,'p_user_rights','parser.py',3037),
+  ('user_rights_optional -> ref_group','user_rights_optional',1,'p_user_rights_optional','parser.py',3042),
+  ('user_rights_optional -> read_only','user_rights_optional',1,'p_user_rights_optional','parser.py',3043),
+  ('user_rights_optional_list -> user_rights_optional','user_rights_optional_list',1,'p_user_rights_optional_list','parser.py',3048),
+  ('user_rights_optional_list -> user_rights_optional_list user_rights_optional','user_rights_optional_list',2,'p_user_rights_optional_list','parser.py',3049),
+  ('user_rights_optional_list_optional -> empty','user_rights_optional_list_optional',1,'p_user_rights_optional_list_optional','parser.py',3058),
+  ('user_rights_optional_list_optional -> user_rights_optional_list','user_rights_optional_list_optional',1,'p_user_rights_optional_list_optional','parser.py',3059),
+  ('ref_group -> begin REF_GROUP ref_group_optional_list_optional end REF_GROUP','ref_group',5,'p_ref_group','parser.py',3064),
+  ('ref_group_optional -> identifier','ref_group_optional',1,'p_ref_group_optional','parser.py',3069),
+  ('ref_group_optional_list -> ref_group_optional','ref_group_optional_list',1,'p_ref_group_optional_list','parser.py',3074),
+  ('ref_group_optional_list -> ref_group_optional_list ref_group_optional','ref_group_optional_list',2,'p_ref_group_optional_list','parser.py',3075),
+  ('ref_group_optional_list_optional -> empty','ref_group_optional_list_optional',1,'p_ref_group_optional_list_optional','parser.py',3084),
+  ('ref_group_optional_list_optional -> ref_group_optional_list','ref_group_optional_list_optional',1,'p_ref_group_optional_list_optional','parser.py',3085),
+  ('read_only -> READ_ONLY','read_only',1,'p_read_only','parser.py',3090),
+  ('guard_rails -> GUARD_RAILS','guard_rails',1,'p_guard_rails','parser.py',3095),
+  ('unit -> begin UNIT IDENT STRING STRING unit_type unit_optional_list_optional end UNIT','unit',9,'p_unit','parser.py',3100),
+  ('unit_optional -> si_exponents','unit_optional',1,'p_unit_optional','parser.py',3105),
+  ('unit_optional -> ref_unit','unit_optional',1,'p_unit_optional','parser.py',3106),
+  ('unit_optional -> unit_conversion','unit_optional',1,'p_unit_optional','parser.py',3107),
+  ('unit_optional_list -> unit_optional','unit_optional_list',1,'p_unit_optional_list','parser.py',3112),
+  ('unit_optional_list -> unit_optional_list unit_optional','unit_optional_list',2,'p_unit_optional_list','parser.py',3113),
+  ('unit_optional_list_optional -> empty','unit_optional_list_optional',1,'p_unit_optional_list_optional','parser.py',3122),
+  ('unit_optional_list_optional -> unit_optional_list','unit_optional_list_optional',1,'p_unit_optional_list_optional','parser.py',3123),
+  ('unit_type -> EXTENDED_SI','unit_type',1,'p_unit_type','parser.py',3128),
+  ('unit_type -> DERIVED','unit_type',1,'p_unit_type','parser.py',3129),
+  ('si_exponents -> SI_EXPONENTS NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC','si_exponents',8,'p_si_exponents','parser.py',3134),
+  ('unit_conversion -> UNIT_CONVERSION NUMERIC NUMERIC','unit_conversion',3,'p_unit_conversion','parser.py',3139),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',3144),
 ]
@@ -0,0 +1,188 @@
+"""
+@project: parser
+@file: patch.py
+@author: Guillaume Sottas
+@date: 18.10.2026
+"""
+
+import codecs
+import mmap
+import numbers
+import os
+import re
+import tempfile
+
+from .writer import format_attribute
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# hexadecimal number ending the replaced text, whose notation is kept by the integer replacing it.
+_hex_re = re.compile(r'0([xX])([0-9A-Fa-f]+)$')
+
+
+def _replacement(old, text, value):
+    """
+    returns text, the formatted value replacing old, written in hexadecimal (same case, zero-padded to the same number
+    of digits) if value is a positive integer replacing an hexadecimal number.
+    """
+    if isinstance(value, numbers.Integral) and not isinstance(value, bool) and value >= 0:
+        match = _hex_re.search(old)
+        decimal = str(value)
+        if match is not None and text.endswith(decimal):
+            digits = match.group(2)
+            hexadecimal = '{0:0{1}{2}}'.format(value, len(digits), 'x' if digits != digits.upper() else 'X')
+            return text[:len(text) - len(decimal)] + '0' + match.group(1) + hexadecimal
+    return text
+
+
+class _A2lFileCursor(object):
+    """
+    forward reader of a memory-mapped file, addressed with positions in its decoded text.
+    """
+
+    def __init__(self, data, encoding, chunk_size):
+        self.data = data
+        self.offset = 0
+        self.position = 0
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._chunk_size = chunk_size
+
+    def copy(self, position, fp):
+        """
+        writes the bytes up to the character at position to the file object fp.
+        """
+        for chunk, _ in self._read(position):
+            fp.write(chunk)
+
+    def read(self, position):
+        """
+        returns the text up to the character at position.
+        """
+        return ''.join(text for _, text in self._read(position))
+
+    def _read(self, position):
+        # each character being encoded by one byte at least, the text of n bytes never exceeds n characters.
+        while self.position < position:
+            chunk = self.data[self.offset:self.offset + min(position - self.position, self._chunk_size)]
+            if not chunk:
+                raise ValueError('position {0} is beyond the end of the file'.format(position))
+            text = self._decoder.decode(chunk)
+            self.offset += len(chunk)
+            self.position += len(text)
+            yield chunk, text
+
+
+class _A2lNodeEditor(object):
+    """
+    proxy of a node, recording the assignments of its attributes in a patch.
+    """
+    __slots__ = '_patch', '_node'
+
+    def __init__(self, patch, node):
+        object.__setattr__(self, '_patch', patch)
+        object.__setattr__(self, '_node', node)
+
+    def __getattr__(self, name):
+        return getattr(self._node, name)
+
+    def __setattr__(self, name, value):
+        self._patch.set(self._node, name, value)
+
+
+class A2lPatch(object):
+    """
+    edits of the attributes of the nodes of a tree parsed with spans=True, applied to the parsed text without writing
+    the tree: each edit replaces the span of an attribute (see A2lNode.get_span) by the text of its new value, all the
+    other characters (comments and formatting included) being kept as they are. the edits are applied in a single
+    pass, sorted by position.
+
+    an attribute is edited with set, or by assigning it through the proxy of its node:
+        patch[characteristic].address = 0x80001234
+    the attribute of the node is updated as well, and its digest reset. the integers replacing an hexadecimal number
+    are written in hexadecimal.
+    """
+
+    def __init__(self):
+        self._edits = dict()
+
+    def __len__(self):
+        return len(self._edits)
+
+    def __getitem__(self, node):
+        return _A2lNodeEditor(self, node)
+
+    def set(self, node, attribute, value):
+        """
+        sets the attribute of node to value, and records the replacement of its text. a ValueError is raised if its
+        span is unknown: the node has not been parsed with spans=True, or the attribute is missing from the text or
+        repeated.
+        """
+        span = node.get_span(attribute)
+        if span is None:
+            raise ValueError('the span of the attribute {0} of {1} is unknown'.format(attribute, node.node()))
+        text = format_attribute(node, attribute, value)
+        setattr(node, attribute, value)
+        self._edits[span] = text, value
+
+    def get_edits(self):
+        """
+        returns the (start, end, text, value) edits sorted by position. a ValueError is raised if two of them overlap
+        (e.g. a node and one of its attributes).
+        """
+        edits = sorted((start, end, text, value) for (start, end), (text, value) in self._edits.items())
+        for previous, edit in zip(edits, edits[1:]):
+            if edit[0] < previous[1]:
+                raise ValueError('the edits at {0} and {1} overlap'.format(previous[0], edit[0]))
+        return edits
+
+    def apply(self, text):
+        """
+        returns the parsed text with the edits applied.
+        """
+        parts = list()
+        position = 0
+        for start, end, replacement, value in self.get_edits():
+            parts.append(text[position:start])
+            parts.append(_replacement(text[start:end], replacement, value))
+            position = end
+        parts.append(text[position:])
+        return ''.join(parts)
+
+    def apply_file(self, path, output=None, encoding='utf-8', chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        writes the content of the file located at path with the edits applied to the file located at output, or
+        replaces the file if output is None. the file must have been parsed with A2lParser.from_file (or from_stream)
+        and the same encoding, the spans being positions in its decoded text.
+
+        the file is memory-mapped and read once, the bytes between the edits being copied as they are, by chunks of
+        chunk_size bytes.
+        """
+        edits = self.get_edits()
+        encoder = codecs.getincrementalencoder(encoding)()
+        encoder.encode('')  # drops the byte order mark of the encodings which write one.
+        if output is None:
+            fd, target = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(os.path.abspath(path)))
+            os.close(fd)
+        else:
+            target = output
+        try:
+            with open(path, 'rb') as fp:
+                size = os.fstat(fp.fileno()).st_size
+                data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+                try:
+                    with open(target, 'wb') as out:
+                        cursor = _A2lFileCursor(data, encoding, chunk_size)
+                        for start, end, replacement, value in edits:
+                            cursor.copy(start, out)
+                            out.write(encoder.encode(_replacement(cursor.read(end), replacement, value)))
+                        for offset in range(cursor.offset, size, chunk_size):
+                            out.write(data[offset:offset + chunk_size])
+                finally:
+                    if size:
+                        data.close()
+            if output is None:
+                getattr(os, 'replace', os.rename)(target, path)
+        except:
+            if output is None and os.path.exists(target):
+                os.remove(target)
+            raise
@@ -0,0 +1,171 @@
+"""
+@project: parser
+@file: span.py
+@author: Guillaume Sottas
+@date: 18.10.2026
+"""
+
+import copy
+import functools
+import re
+
+from .lexer import t_NUMERIC
+from .node import A2lNode, A2lNumberArray, _optional_attributes
+
+_numeric_re = re.compile(t_NUMERIC.regex)
+
+# names of the positional parameters of the constructor of the node classes.
+_node_parameters = dict()
+
+
+class A2lSpanToken(object):
+    """
+    token of an A2lSpanLexer, holding the length of its text in the source.
+    """
+    __slots__ = 'type', 'value', 'lineno', 'lexpos', 'lexer', 'length'
+
+    def __init__(self, token, lexer, length):
+        self.type = token.type
+        self.value = token.value
+        self.lineno = token.lineno
+        self.lexpos = token.lexpos
+        self.lexer = lexer
+        self.length = length
+
+    def __str__(self):
+        return 'LexToken(%s,%r,%d,%d)' % (self.type, self.value, self.lineno, self.lexpos)
+
+    def __repr__(self):
+        return str(self)
+
+
+class A2lSpanLexer(object):
+    """
+    wraps a lexer, adding the length of their text to the tokens (the value of the STRING and NUMERIC tokens being
+    converted by the lexer), so that the parser can record the (start, end) span of the attributes of the nodes.
+    """
+
+    def __init__(self, lexer):
+        self._lexer = lexer
+        self.token = lambda: None
+
+    @property
+    def lexdata(self):
+        return self._lexer.lexdata
+
+    @property
+    def lineno(self):
+        return self._lexer.lineno
+
+    def input(self, string):
+        self._lexer.input(string)
+        self.token = functools.partial(next, self._tokens(), None)
+
+    def clone(self):
+        return A2lSpanLexer(self._lexer.clone())
+
+    def _tokens(self):
+        lexer = self._lexer
+        while True:
+            token = lexer.token()
+            if token is None:
+                return
+            if token.type == 'STRING':
+                length = len(token.value) + 2
+            elif token.type == 'NUMERIC':
+                length = _numeric_re.match(lexer.lexdata, token.lexpos).end() - token.lexpos
+            else:
+                length = len(token.value)
+            yield A2lSpanToken(token, self, length)
+
+
+def _symbol_span(symbol):
+    if isinstance(symbol, A2lSpanToken):
+        return symbol.lexpos, symbol.lexpos + symbol.length
+    return symbol.span
+
+
+def _parameters(cls):
+    try:
+        return _node_parameters[cls]
+    except KeyError:
+        from .writer import _init_parameters
+        parameters = _node_parameters[cls] = _init_parameters(cls)[0]
+        return parameters
+
+
+def _record_node_spans(node, children):
+    """
+    stores the span of the attributes of node, built from the symbols of the production which created it: the span of
+    the symbol holding the value of each positional attribute (matched in order, the number lists being converted to
+    arrays), and the span of each optional attribute (its keyword included) which is not repeated.
+    """
+    spans = dict()
+    parameters = _parameters(type(node))
+    position = 0
+    for attribute in parameters:
+        value = getattr(node, attribute)
+        if value is None:
+            continue
+        for i in range(position, len(children)):
+            child = children[i].value
+            if child is value or (type(child) is type(value) or isinstance(value, A2lNumberArray)) and child == value:
+                spans[attribute] = _symbol_span(children[i])
+                position = i + 1
+                break
+    for child in children:
+        items = getattr(child, 'items', None)
+        if items is None:
+            continue
+        for item, span in zip(child.value, items):
+            if isinstance(item, tuple) and len(item) == 2:
+                attribute = _optional_attributes.get((node._node, item[0]), item[0])
+                if not isinstance(getattr(node, attribute, None), list):
+                    spans[attribute] = span
+    node._spans = spans
+
+
+def _spanned_action(action):
+    def spanned_action(p):
+        action(p)
+        children = p.slice[1:]
+        symbol = p.slice[0]
+        symbol.span = None
+        for child in children:
+            first = _symbol_span(child)
+            if first is not None:
+                for last_child in reversed(children):
+                    last = _symbol_span(last_child)
+                    if last is not None:
+                        symbol.span = first[0], last[1]
+                        break
+                break
+        value = symbol.value
+        if isinstance(value, list):
+            items = list()
+            for child in children:
+                if child.value is value:
+                    items.extend(getattr(child, 'items', None) or ())
+                else:
+                    items.append(_symbol_span(child))
+            if len(items) == len(value):
+                symbol.items = items
+        elif isinstance(value, A2lNode) and value.get_spans() is None:
+            _record_node_spans(value, children)
+    return spanned_action
+
+
+def spanned_productions(productions):
+    """
+    returns a copy of the productions of a parser engine whose actions record the span of the attributes of the nodes
+    they create. the span of a symbol is the (start, end) position of its text, derived from the tokens of an
+    A2lSpanLexer. the span of the items of the lists built by the actions is kept along with them, so that the spans of
+    the optional attributes are known when their node is created.
+    """
+    result = list()
+    for production in productions:
+        production = copy.copy(production)
+        if production.callable is not None:
+            production.callable = _spanned_action(production.callable)
+        result.append(production)
+    return result
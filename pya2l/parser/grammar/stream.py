@@ -0,0 +1,229 @@
+"""
+@project: parser
+@file: stream.py
+@author: Guillaume Sottas
+@date: 18.10.2026
+"""
+
+import codecs
+import mmap
+import os
+import re
+
+from .lexer import lexer as a2l_lexer
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# scanning states of A2lStreamLexer: in the text between the strings and comments (where the text can safely be split
+# on a white space without cutting a token in two), after a slash of this text, in a string, after a backslash of a
+# string, in a block comment, after an asterisk of a block comment and in a line comment.
+_TEXT, _SLASH, _STRING, _ESCAPE, _BLOCK_COMMENT, _ASTERISK, _LINE_COMMENT = range(7)
+
+_text_re = re.compile(r'[^"/]*')
+_string_re = re.compile(r'(?:[^"\\]|\\[\s\S])*')
+_white_spaces = ' \t\r\n'
+
+# number of characters kept around the current position, used to display the context of a syntax error.
+_context_length = 256
+
+
+def iter_stream_chunks(fp, chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8'):
+    """
+    yields the content of the file object fp as text chunks of about chunk_size characters. binary file objects are
+    decoded incrementally, using the specified encoding.
+    """
+    decoder = None
+    while True:
+        chunk = fp.read(chunk_size)
+        if not chunk:
+            break
+        if isinstance(chunk, bytes):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(encoding)()
+            chunk = decoder.decode(chunk)
+        yield chunk
+    if decoder is not None:
+        tail = decoder.decode(b'', True)
+        if tail:
+            yield tail
+
+
+def iter_file_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8'):
+    """
+    yields the content of the file located at path as text chunks of about chunk_size characters, decoded from a
+    read-only memory map of the file.
+    """
+    with open(path, 'rb') as fp:
+        size = os.fstat(fp.fileno()).st_size
+        if not size:
+            return
+        buf = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            decoder = codecs.getincrementaldecoder(encoding)()
+            for start in range(0, size, chunk_size):
+                yield decoder.decode(buf[start:start + chunk_size])
+            tail = decoder.decode(b'', True)
+            if tail:
+                yield tail
+        finally:
+            buf.close()
+
+
+class A2lSourceWindow(object):
+    """
+    string-like view on the part of the source currently held by an A2lStreamLexer, addressed with absolute positions.
+    it provides the len() and slicing operations required by A2lFormatException to display the error context.
+    """
+
+    def __init__(self, text, position, length):
+        self._text = text
+        self._position = position
+        self._length = length
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, item):
+        if not isinstance(item, slice):
+            return self._text[item - self._position]
+        start = max((item.start or 0) - self._position, 0)
+        stop = item.stop
+        if stop is not None and stop >= 0:
+            stop = max(stop - self._position, 0)
+        return self._text[start:stop]
+
+
+class A2lStreamLexer(object):
+    """
+    lexer feeding the parser from an iterable of text chunks instead of a single string.
+
+    the chunks are split on white spaces lying outside of strings and comments, and each part is tokenized by the
+    wrapped lexer. the position of the tokens is made relative to the beginning of the stream, so that the error
+    reporting behaves as if the whole text had been passed to the parser. only the part being tokenized and a few
+    hundred characters around it are kept in memory.
+    """
+
+    def __init__(self, chunks, lexer=None, offset=0):
+        self._chunks = iter(chunks)
+        self._lexer = a2l_lexer.clone() if lexer is None else lexer
+        self._carry = list()
+        self._carry_length = 0
+        self._state = _TEXT
+        self._split = 0
+        self._eof = False
+        self._position = offset
+        self._length = offset
+        self._window = ''
+        self._window_position = offset
+        self._tokens = iter(())
+
+    @property
+    def lexdata(self):
+        while not self._eof and self._carry_length < _context_length:
+            self._read()
+        carry = ''.join(self._carry)
+        return A2lSourceWindow(self._window + carry, self._window_position, self._length + len(carry))
+
+    def input(self, string):
+        self._chunks = iter((string,))
+
+    def token(self):
+        while True:
+            for token in self._tokens:
+                token.lexpos += self._position
+                token.lexer = self
+                return token
+            part = self._next_part()
+            if part is None:
+                return None
+            self._lexer.input(part)
+            self._tokens = iter(self._lexer.token, None)
+
+    def _read(self):
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self._eof = True
+            return
+        self._scan(chunk, self._carry_length)
+        self._carry.append(chunk)
+        self._carry_length += len(chunk)
+
+    def _next_part(self):
+        while not self._eof:
+            self._read()
+            if self._split:
+                return self._consume(self._split)
+        if self._carry_length:
+            return self._consume(self._carry_length)
+        return None
+
+    def _consume(self, length):
+        carry = ''.join(self._carry)
+        part = carry[:length]
+        self._carry = [carry[length:]]
+        self._carry_length -= length
+        self._split = 0
+        history = self._window[-_context_length:]
+        self._window = history + part
+        self._window_position = self._length - len(history)
+        self._position = self._length
+        self._length += length
+        return part
+
+    def _scan(self, text, offset):
+        """
+        scans text, read after offset characters of carry, from the state reached at the end of the previous text.
+        the position after the last white space lying outside of the strings and comments is recorded as the split
+        position of carry, so that each character is scanned once whatever the length of the strings and comments
+        spanning several chunks.
+        """
+        state = self._state
+        position = 0
+        length = len(text)
+        while position < length:
+            if state == _TEXT:
+                end = _text_re.match(text, position).end()
+                for i in range(end - 1, position - 1, -1):
+                    if text[i] in _white_spaces:
+                        self._split = offset + i + 1
+                        break
+                if end == length:
+                    break
+                state = _STRING if text[end] == '"' else _SLASH
+                position = end + 1
+            elif state == _SLASH:
+                if text[position] == '*':
+                    state = _BLOCK_COMMENT
+                    position += 1
+                elif text[position] == '/':
+                    state = _LINE_COMMENT
+                    position += 1
+                else:
+                    state = _TEXT
+            elif state == _STRING:
+                end = _string_re.match(text, position).end()
+                if end == length:
+                    break
+                state = _TEXT if text[end] == '"' else _ESCAPE
+                position = end + 1
+            elif state == _ESCAPE:
+                state = _STRING
+                position += 1
+            elif state == _BLOCK_COMMENT:
+                end = text.find('*/', position)
+                if end < 0:
+                    state = _ASTERISK if text[-1] == '*' else _BLOCK_COMMENT
+                    break
+                state = _TEXT
+                position = end + 2
+            elif state == _ASTERISK:
+                state = _TEXT if text[position] == '/' else _BLOCK_COMMENT
+                position += 1 if state == _TEXT else 0
+            else:
+                end = text.find('\n', position)
+                if end < 0:
+                    break
+                state = _TEXT
+                position = end + 1
+        self._state = state
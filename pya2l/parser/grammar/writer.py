@@ -0,0 +1,369 @@
+"""
+@project: parser
+@file: writer.py
+@author: Guillaume Sottas
+@date: 18.10.2026
+"""
+
+import threading
+
+from .lexer import tokens as lex_tokens
+from .node import A2lNode
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+DEFAULT_INDENT = 4
+
+_terminals = frozenset(lex_tokens)
+_value_terminals = frozenset(('STRING', 'NUMERIC', 'IDENT'))
+
+# rules of the node types which are not named after them.
+_node_rules = {'ROOT': 'a2l'}
+
+_grammar = None
+_grammar_lock = threading.Lock()
+_formatters = dict()
+_templates = dict()
+
+
+def _string(value):
+    return '"' + value + '"'
+
+
+def _number(value):
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _sequence(formatter):
+    return lambda values: ' '.join(formatter(v) for v in values)
+
+
+def _record(formatters):
+    return lambda values: ' '.join(f(v) for f, v in zip(formatters, values))
+
+
+def _keyword(keyword, formatter):
+    return lambda value: keyword + ' ' + formatter(value)
+
+
+def _block(keyword, formatter):
+    return lambda value: '/begin ' + keyword + ' ' + formatter(value) + ' /end ' + keyword
+
+
+def _unsupported(symbol):
+    def formatter(value):
+        raise ValueError('cannot write the value {0!r} of {1}'.format(value, symbol))
+    return formatter
+
+
+def _dropped(content):
+    def formatter(value):
+        raise ValueError('cannot write {0}, whose content is not kept by the parser'.format(content))
+    return formatter
+
+
+def _a2ml(declarations):
+    # the declarations are kept as text by the parser, without their trailing semicolon.
+    return '/begin A2ML ' + ' '.join(d + ';' for d in declarations) + ' /end A2ML'
+
+
+# formatters of the rules whose values are not kept by the parser.
+_rule_formatters = {'generic_parameter': _dropped('a generic IF_DATA parameter'),
+                    'if_data_memory_layout': _dropped('an IF_DATA of MEMORY_LAYOUT'),
+                    'if_data_measurement': _dropped('an IF_DATA of MEASUREMENT')}
+
+# formatters of the attributes which are not named after their rule.
+_attribute_formatters = {('ANNOTATION_TEXT', 'annotation_text'): _string,
+                         ('AXIS_PTS', 'deposit_mode'): _keyword('DEPOSIT', str),
+                         ('AVAILABLE_EVENT_LIST', 'event'): _keyword('EVENT', _number),
+                         ('DEFAULT_EVENT_LIST', 'event'): _keyword('EVENT', _number),
+                         ('DEPENDENT_CHARACTERISTIC', 'characteristic'): str,
+                         ('VIRTUAL_CHARACTERISTIC', 'characteristic'): str,
+                         ('FUNCTION_LIST', 'name'): str,
+                         ('VAR_ADDRESS', 'address'): _sequence(_number),
+                         ('MODULE', 'a2ml'): _a2ml,
+                         ('if_data_module', 'tp_blob'): _dropped('a TP_BLOB')}
+
+
+def _checksum_values(node, values):
+    # the first form of CHECKSUM (a STRING alone) is parsed with the /end keyword as max_block_size.
+    if node.max_block_size == '/end':
+        return [_string(node.checksum_dll)]
+    return values
+
+
+# functions fixing the formatted positional values of the nodes which are not stored as they are parsed.
+_node_values = {'CHECKSUM': _checksum_values}
+
+# lines of the body of the nodes whose attributes are written interleaved.
+_node_bodies = {'VAR_FORBIDDEN_COMB': lambda node: [n + ' ' + v for n, v in zip(node.criterion_name,
+                                                                                  node.criterion_value)]}
+
+
+def _load_grammar():
+    """
+    returns the rule name to productions (lists of symbols) dictionary of the grammar of A2lParser.
+    """
+    global _grammar
+    if _grammar is None:
+        with _grammar_lock:
+            if _grammar is None:
+                from .parser import A2lParser
+                grammar = dict()
+                for production in A2lParser.warmup().productions[1:]:
+                    symbols = production.str.split('->', 1)[1].split()
+                    grammar.setdefault(production.name, list()).append([s for s in symbols if s != '<empty>'])
+                _grammar = grammar
+    return _grammar
+
+
+def _productions(rule):
+    return [p for p in _load_grammar().get(rule, ()) if p and p != ['empty']]
+
+
+def _symbol_formatter(symbol):
+    """
+    returns the function formatting the value of symbol (a token or a rule of the grammar) as it is parsed.
+    """
+    try:
+        return _formatters[symbol]
+    except KeyError:
+        pass
+    # recursive rules are formatted by the unsupported formatter, their values being dropped by the parser.
+    _formatters[symbol] = _unsupported(symbol)
+    if symbol in _rule_formatters:
+        formatter = _rule_formatters[symbol]
+    elif symbol == 'STRING':
+        formatter = _string
+    elif symbol == 'NUMERIC':
+        formatter = _number
+    elif symbol in _terminals:
+        formatter = str
+    else:
+        productions = _productions(symbol)
+        if productions and all(len(p) == 1 and p[0] in _terminals and p[0] not in _value_terminals
+                               for p in productions):
+            formatter = str
+        elif len(productions) == 2 and len(productions[0]) == 1 and productions[1][0] == symbol and \
+                productions[1][-1] == productions[0][0]:
+            formatter = _sequence(_symbol_formatter(productions[0][0]))
+        elif productions:
+            formatter = _production_formatter(symbol, productions[0])
+        else:
+            formatter = _unsupported(symbol)
+    _formatters[symbol] = formatter
+    return formatter
+
+
+def _production_formatter(symbol, production):
+    """
+    returns the function formatting the value of a rule parsed by production, which is either a keyword followed by
+    values (e.g. FORMAT STRING), a block holding values (e.g. /begin MAP_LIST ident_list /end MAP_LIST), a keyword
+    alone (e.g. READ_ONLY, whose value is the keyword) or values.
+    """
+    if production[0] == 'begin':
+        wrapper, keyword, symbols = _block, production[1], production[2:-2]
+    elif production[0] in _terminals and production[0] not in _value_terminals:
+        wrapper, keyword, symbols = _keyword, production[0], production[1:]
+    else:
+        wrapper, keyword, symbols = None, None, production
+    if not symbols:
+        return str
+    if len(symbols) == 1:
+        formatter = _symbol_formatter(symbols[0])
+    else:
+        formatter = _record([_symbol_formatter(s) for s in symbols])
+    return formatter if wrapper is None else wrapper(keyword, formatter)
+
+
+def _init_parameters(cls):
+    """
+    returns the names of the positional parameters of the constructor of cls, and the arguments its optional
+    attributes are passed in: an empty tuple for the args parameter, no argument if they are variable arguments, or
+    None if the node has no optional attributes.
+    """
+    code = cls.__init__.__code__
+    names = code.co_varnames[1:code.co_argcount]
+    if 'args' in names:
+        return [n for n in names if n != 'args'], [()]
+    return list(names), [] if code.co_flags & 0x04 else None
+
+
+def _repeated_attributes(cls, parameters, optional, attributes):
+    """
+    returns the attributes of cls which hold the list of the occurrences of an optional attribute, as initialized by
+    its constructor.
+    """
+    try:
+        node = cls(*([None] * len(parameters) + (optional or [])))
+    except Exception:
+        return frozenset()
+    return frozenset(a for a in attributes if isinstance(getattr(node, a, None), list))
+
+
+class _A2lNodeTemplate(object):
+    """
+    text template of a node type, compiled once from the __slots__ of its class and the production of its rule: the
+    keywords opening the node, the formatters of its positional attributes and the ones of its optional attributes.
+    """
+    __slots__ = 'node_type', 'block', 'header', 'end', 'positional', 'values', 'optional', 'repeated', 'body'
+
+    def __init__(self, cls, node_type):
+        self.node_type = node_type
+        attributes = list()
+        for attribute in cls.__slots__:
+            if not attribute.startswith('_') and attribute not in attributes:
+                attributes.append(attribute)
+        parameters, optional = _init_parameters(cls)
+        rule = _node_rules.get(node_type, node_type.lower())
+        count = len(parameters)
+        keywords = 0 if node_type == 'ROOT' else 1
+        extra = 0 if optional is None else 1
+        production = None
+        for p in _productions(rule):
+            symbols = p[1:-2] if p[0] == 'begin' else p
+            if len(symbols) - keywords - extra >= count:
+                production = p
+                break
+        if production is None:
+            raise ValueError('no production of {0} matches {1}'.format(rule, cls.__name__))
+        self.block = production[0] == 'begin'
+        symbols = production[1:-2] if self.block else production
+        # the positional attributes precede the optional ones (the keywords being written as is, e.g. IF_DATA XCP).
+        start = keywords if optional is None else len(symbols) - 1 - count
+        if node_type == 'ROOT':
+            self.header = None
+        else:
+            self.header = ' '.join(symbols[:start])
+        self.end = '/end ' + symbols[0] if self.block else None
+        formatters = [_symbol_formatter(s) for s in symbols[start:start + count]]
+        self.positional = list(zip(attributes[:count], formatters))
+        self.values = _node_values.get(node_type)
+        self.optional = list()
+        for attribute in attributes[count:]:
+            formatter = _attribute_formatters.get((node_type, attribute))
+            self.optional.append((attribute, formatter or _symbol_formatter(attribute)))
+        self.repeated = _repeated_attributes(cls, parameters, optional, attributes[count:])
+        self.body = _node_bodies.get(node_type)
+
+
+def _template(node):
+    cls = type(node)
+    try:
+        return _templates[cls]
+    except KeyError:
+        template = _templates[cls] = _A2lNodeTemplate(cls, node.node())
+        return template
+
+
+def format_attribute(node, attribute, value):
+    """
+    returns the text of value written as the attribute of node: its formatted value for a positional attribute, or the
+    whole item (e.g. ECU_ADDRESS 0x1234) for an optional one, a node being written as a block.
+    """
+    template = _template(node)
+    for name, formatter in template.positional:
+        if name == attribute:
+            return formatter(value)
+    if isinstance(value, A2lNode):
+        return dumps(value).rstrip('\n')
+    for name, formatter in template.optional:
+        if name == attribute:
+            return formatter(value)
+    raise AttributeError('{0} has no attribute {1}'.format(type(node).__name__, attribute))
+
+
+class A2lWriter(object):
+    """
+    writes the A2L text of an A2lNode tree to a file object, parsing to the same tree. the text is canonical: one
+    attribute per line, indented by indent spaces per level, the optional attributes of a node being written in the
+    order of the __slots__ of its class. the text is written by chunks of about chunk_size characters.
+
+    the text of each node type is built from a template compiled on first use from its class and its grammar rule
+    (see _A2lNodeTemplate). a ValueError is raised if the tree holds content which is not kept by the parser (the
+    IF_DATA blocks which are not supported), which cannot be written as it was parsed.
+    """
+
+    def __init__(self, fp, indent=DEFAULT_INDENT, chunk_size=DEFAULT_CHUNK_SIZE):
+        self._fp = fp
+        self._indent = ' ' * indent if isinstance(indent, int) else indent
+        self._indents = ['']
+        self._chunk_size = chunk_size
+        self._buffer = list()
+        self._buffer_size = 0
+
+    def write(self, node):
+        self._node(node, 0)
+        self._flush()
+
+    def _write(self, string):
+        self._buffer.append(string)
+        self._buffer_size += len(string)
+        if self._buffer_size >= self._chunk_size:
+            self._flush()
+
+    def _flush(self):
+        if self._buffer:
+            self._fp.write(''.join(self._buffer))
+            self._buffer = list()
+            self._buffer_size = 0
+
+    def _node(self, node, level):
+        template = _template(node)
+        while len(self._indents) <= level + 1:
+            self._indents.append(self._indents[-1] + self._indent)
+        indent = self._indents[level]
+        line = [template.header] if template.header is not None else []
+        values = [formatter(getattr(node, attribute)) for attribute, formatter in template.positional]
+        if template.values is not None:
+            values = template.values(node, values)
+        line.extend(values)
+        if template.block is False and template.header is not None:
+            for text in self._optional(node, template, level):
+                line.append(text)
+            return self._write(indent + ' '.join(line) + '\n')
+        if line:
+            self._write(indent + '/begin ' + ' '.join(line) + '\n')
+            level += 1
+        for text in self._optional(node, template, level):
+            self._write(self._indents[level] + text + '\n')
+        if template.end is not None:
+            self._write(indent + template.end + '\n')
+
+    def _optional(self, node, template, level):
+        """
+        yields the text of the optional attributes of node which are not nodes, the nodes being written at level.
+        """
+        if template.body is not None:
+            for text in template.body(node):
+                yield text
+            return
+        repeated = template.repeated
+        for attribute, formatter in template.optional:
+            value = getattr(node, attribute)
+            if value is None:
+                continue
+            for item in (value if attribute in repeated else (value,)):
+                if isinstance(item, A2lNode):
+                    self._node(item, level)
+                else:
+                    yield formatter(item)
+
+
+class _Parts(list):
+    write = list.append
+
+
+def dump(node, fp, indent=DEFAULT_INDENT, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    writes the A2L text of node to the file object fp, see A2lWriter.
+    """
+    A2lWriter(fp, indent, chunk_size).write(node)
+
+
+def dumps(node, indent=DEFAULT_INDENT):
+    """
+    returns the A2L text of node, see A2lWriter.
+    """
+    parts = _Parts()
+    A2lWriter(parts, indent).write(node)
+    return ''.join(parts)